@@ -1,23 +1,8 @@
 import timeit
-import types
 
 from pest import DEFAULT_OPTIMIZER
-from pest import Pairs
 from pest import Parser
 
-
-class GeneratedParser:
-    def __init__(self, code: str, *, module_name: str = "generated_parser"):
-        # Create an in-memory module for the generated code
-        module = types.ModuleType(module_name)
-        exec(compile(code, filename=f"{module_name}.py", mode="exec"), module.__dict__)  # noqa: S102
-        # Keep a reference to the generated entry point
-        self._parse = module.parse
-
-    def parse(self, start_rule: str, input_: str, *, start_pos: int = 0) -> Pairs:  # noqa: D102
-        return self._parse(start_rule, input_, start_pos=start_pos)
-
-
 with open("tests/grammars/http.pest", encoding="utf-8") as fd:
     grammar = fd.read()
 
@@ -38,8 +23,8 @@ else:
     print("Zero optimizations applied!")
 
 
-generated_http_parser = GeneratedParser(unoptimized_http_parser.generate())
-optimized_generated_http_parser = GeneratedParser(optimized_http_parser.generate())
+generated_http_parser = unoptimized_http_parser.compile()
+optimized_generated_http_parser = optimized_http_parser.compile()
 
 
 def run_optimized() -> None:
@@ -0,0 +1,120 @@
+import json
+import timeit
+from collections.abc import Callable
+
+from pest import Document
+from pest import Parser
+
+with open("tests/grammars/toml.pest", encoding="utf-8") as fd:
+    toml_grammar = fd.read()
+
+with open("tests/grammars/sql.pest", encoding="utf-8") as fd:
+    sql_grammar = fd.read()
+
+with open("examples/json/json.pest", encoding="utf-8") as fd:
+    json_grammar = fd.read()
+
+with open("tests/examples/example.toml", encoding="utf-8") as fd:
+    toml_example = fd.read()
+
+toml_parser = Parser.from_grammar(toml_grammar)
+sql_parser = Parser.from_grammar(sql_grammar)
+json_parser = Parser.from_grammar(json_grammar)
+
+
+def toml_data(n: int) -> tuple[str, int]:
+    """Return `n` copies of the example TOML and a position near the middle."""
+    data = toml_example * n
+    return data, data.index("\n", len(data) // 2) + 1
+
+
+def sql_data(n: int) -> tuple[str, int]:
+    """Return an insert statement with `n` rows and a position near the middle."""
+    rows = ", ".join(f"({i}, 'name {i}', {i}.5)" for i in range(n))
+    data = f'insert into "t" ("a", "b", "c") values {rows}'  # noqa: S608
+    return data, data.index(f"name {n // 2}")
+
+
+def json_data(depth: int) -> tuple[str, int]:
+    """Return nested JSON arrays `depth` levels deep and a position near the middle."""
+
+    def tree(depth: int) -> object:
+        if depth == 0:
+            return {"id": 1, "name": "leaf"}
+        return [tree(depth - 1) for _ in range(6)]
+
+    data = json.dumps(tree(depth))
+    return data, data.index('"leaf"', len(data) // 2) + 1
+
+
+def reparse_func(
+    parser: Parser, document: Document, pos: int, text: str
+) -> Callable[[], None]:
+    """Return a function that alternates between inserting and deleting `text`.
+
+    The document is the same after every second run.
+    """
+    edits = [[(pos, pos, text)], [(pos, pos + len(text), "")]]
+    count = 0
+
+    def run() -> None:
+        nonlocal count
+        parser.reparse(document, edits[count % 2])
+        count += 1
+
+    return run
+
+
+n_runs = 10
+n_repeat = 3
+
+
+def bench(
+    name: str,
+    parser: Parser,
+    start_rule: str,
+    make_data: Callable[[int], tuple[str, int]],
+    sizes: tuple[int, ...],
+    *,
+    text: str,
+) -> None:
+    """Print full parse and one character edit times for inputs of each size.
+
+    Edits to nested documents should take about the same time at every size.
+    Documents that are one long repetition, like a TOML file or a long SQL
+    insert, replay every item of the repetition after an edit, which is much
+    less work than parsing it again, but still grows with the input.
+    """
+    print(name)
+    for size in sizes:
+        data, pos = make_data(size)
+        document = parser.parse_document(start_rule, data)
+
+        t_parse = min(
+            timeit.repeat(
+                lambda data=data: parser.parse(start_rule, data),
+                number=1,
+                repeat=n_repeat,
+            )
+        )
+
+        t_reparse = (
+            min(
+                timeit.repeat(
+                    reparse_func(parser, document, pos, text),
+                    number=n_runs,
+                    repeat=n_repeat,
+                )
+            )
+            / n_runs
+        )
+
+        print(
+            f"  {len(data):>10,} characters  "
+            f"full parse: {t_parse:.4f}s  one char edit: {t_reparse:.4f}s"
+        )
+
+
+bench("JSON (nested arrays)", json_parser, "json", json_data, (3, 4, 5), text="x")
+bench("TOML", toml_parser, "toml", toml_data, (5, 20, 80), text=" ")
+bench("SQL", sql_parser, "Command", sql_data, (500, 2000, 8000), text="x")
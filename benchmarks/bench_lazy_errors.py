@@ -0,0 +1,51 @@
+import timeit
+
+from pest import Parser
+
+with open("tests/grammars/toml.pest", encoding="utf-8") as fd:
+    grammar = fd.read()
+
+with open("tests/examples/example.toml", encoding="utf-8") as fd:
+    data = fd.read()
+
+eager_parser = Parser.from_grammar(grammar)
+lazy_parser = Parser.from_grammar(grammar, lazy_errors=True)
+
+eager_generated_parser = eager_parser.compile()
+lazy_generated_parser = lazy_parser.compile()
+
+
+def run_eager() -> None:
+    eager_parser.parse("toml", data)
+
+
+def run_lazy() -> None:
+    lazy_parser.parse("toml", data)
+
+
+def run_eager_generated() -> None:
+    eager_generated_parser.parse("toml", data)
+
+
+def run_lazy_generated() -> None:
+    lazy_generated_parser.parse("toml", data)
+
+
+n_runs = 100
+n_repeat = 3
+
+t_eager = min(timeit.repeat(run_eager, number=n_runs, repeat=n_repeat))
+print("Eager errors:           ", t_eager)
+
+t_lazy = min(timeit.repeat(run_lazy, number=n_runs, repeat=n_repeat))
+print("Lazy errors:            ", t_lazy)
+
+t_eager_generated = min(
+    timeit.repeat(run_eager_generated, number=n_runs, repeat=n_repeat)
+)
+print("Generated eager errors: ", t_eager_generated)
+
+t_lazy_generated = min(
+    timeit.repeat(run_lazy_generated, number=n_runs, repeat=n_repeat)
+)
+print("Generated lazy errors:  ", t_lazy_generated)
@@ -0,0 +1,48 @@
+import os
+import timeit
+
+from pest import Parser
+
+with open("tests/grammars/http.pest", encoding="utf-8") as fd:
+    grammar = fd.read()
+
+with open("tests/examples/example.http", encoding="utf-8") as fd:
+    request = fd.read()
+
+parser = Parser.from_grammar(grammar)
+texts = [request] * 5000
+workers = os.cpu_count() or 1
+
+
+def run_loop() -> None:
+    for text in texts:
+        parser.parse("http", text)
+
+
+def run_parse_many() -> None:
+    for _ in parser.parse_many("http", texts, workers=workers, chunk_size=256):
+        pass
+
+
+def run_parse_many_unordered() -> None:
+    for _ in parser.parse_many(
+        "http", texts, workers=workers, chunk_size=256, ordered=False
+    ):
+        pass
+
+
+n_runs = 1
+n_repeat = 3
+
+print(f"{len(texts):,} inputs, {workers} workers")
+
+t_loop = min(timeit.repeat(run_loop, number=n_runs, repeat=n_repeat))
+print("parse() loop:          ", t_loop)
+
+t_many = min(timeit.repeat(run_parse_many, number=n_runs, repeat=n_repeat))
+print("parse_many():          ", t_many)
+
+t_unordered = min(
+    timeit.repeat(run_parse_many_unordered, number=n_runs, repeat=n_repeat)
+)
+print("parse_many(unordered): ", t_unordered)
@@ -0,0 +1,85 @@
+import os
+import sys
+import timeit
+
+from pest import Pair
+from pest import Stream
+
+sys.path.append(os.getcwd())
+
+from examples.calculator._ast import Expression
+from examples.calculator.parser import Rule
+from examples.calculator.parser import parse
+from examples.calculator.pratt import CalculatorParser
+
+
+class RecursiveCalculatorParser(CalculatorParser):
+    """The calculator parser using the previous, recursive `parse_expr()`."""
+
+    def parse_expr(self, stream: Stream, min_prec: int = 0) -> Expression:  # noqa: D102
+        token: Pair | None = stream.next()
+        if token is None:
+            raise SyntaxError("Unexpected end of expression")
+
+        if token.name in self.PREFIX_OPS:
+            prec = self.PREFIX_OPS[token.name]
+            rhs = self.parse_expr(stream, prec)
+            left: Expression = self.parse_prefix(token, rhs)
+        else:
+            left = self.parse_primary(token)
+
+        while True:
+            next_token: Pair | None = stream.peek()
+            if next_token is None:
+                break
+
+            if next_token.name in self.POSTFIX_OPS:
+                stream.next()
+                left = self.parse_postfix(left, next_token)
+                continue
+
+            if next_token.name in self.INFIX_OPS:
+                prec, right_assoc = self.INFIX_OPS[next_token.name]
+                if prec < min_prec:
+                    break
+                stream.next()
+                rhs = self.parse_expr(stream, prec + (0 if right_assoc else 1))
+                left = self.parse_infix(left, next_token, rhs)
+                continue
+
+            break
+
+        return left
+
+
+# A long, flat expression with prefix, postfix and infix operators.
+operators = ["+", "*", "-", "/", "^"]
+program = (
+    " ".join(f"-{i}! {operators[i % len(operators)]}" for i in range(1, 5000)) + " 1"
+)
+
+pairs = parse(Rule.PROGRAM, program)
+expr = pairs.first().inner().first()
+
+recursive_parser = RecursiveCalculatorParser()
+iterative_parser = CalculatorParser()
+
+
+def run_recursive() -> None:
+    recursive_parser.parse_expr(expr.stream())
+
+
+def run_iterative() -> None:
+    iterative_parser.parse_expr(expr.stream())
+
+
+n_runs = 100
+n_repeat = 3
+
+print(f"{len(expr.children):,} tokens")
+
+t_recursive = min(timeit.repeat(run_recursive, number=n_runs, repeat=n_repeat))
+print("Recursive: ", t_recursive)
+
+t_iterative = min(timeit.repeat(run_iterative, number=n_runs, repeat=n_repeat))
+print("Iterative: ", t_iterative)
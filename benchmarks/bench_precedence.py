@@ -0,0 +1,57 @@
+import os
+import sys
+import timeit
+from pathlib import Path
+
+from pest import Operators
+from pest import Parser
+
+sys.path.append(os.getcwd())
+
+from examples.calculator.pratt import CalculatorParser
+
+# Operator precedence encoded with one rule per level.
+layered = Parser.from_grammar(
+    Path("examples/calculator/grammar_encoded_prec.pest").read_text()
+)
+
+# A flat list of operands and operators, folded by operator precedence while
+# parsing.
+flat_grammar = Path("examples/calculator/calculator.pest").read_text()
+operators = Operators(
+    prefix=CalculatorParser.PREFIX_OPS,
+    postfix=CalculatorParser.POSTFIX_OPS,
+    infix=CalculatorParser.INFIX_OPS,
+)
+folded = Parser.from_grammar(flat_grammar, operators={"expr": operators})
+
+ops = ["+", "*", "-", "/", "^"]
+program = (
+    " ".join(
+        f"-{i}! {ops[i % len(ops)]} ({i} * x - {i})! {ops[(i + 2) % len(ops)]}"
+        for i in range(1, 500)
+    )
+    + " 1"
+)
+
+parsers = {
+    "layered, interpreted": layered.parse,
+    "folded, interpreted": folded.parse,
+    "layered, generated": layered.compile().parse,
+    "folded, generated": folded.compile().parse,
+}
+
+n_runs = 20
+n_repeat = 3
+
+print(f"{len(program):,} characters")
+
+for name, parse in parsers.items():
+    t = min(
+        timeit.repeat(
+            lambda parse=parse: parse("program", program),  # type: ignore[misc]
+            number=n_runs,
+            repeat=n_repeat,
+        )
+    )
+    print(f"{name + ':':<22}", t)
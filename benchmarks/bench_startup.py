@@ -0,0 +1,29 @@
+import os
+import tempfile
+import timeit
+
+from pest import Parser
+
+with open("tests/grammars/sql.pest", encoding="utf-8") as fd:
+    grammar = fd.read()
+
+path = os.path.join(tempfile.mkdtemp(), "sql.pest.pickle")  # noqa: PTH118
+Parser.from_grammar(grammar).save(path)
+
+
+def run_from_grammar() -> None:
+    Parser.from_grammar(grammar)
+
+
+def run_load() -> None:
+    Parser.load(path)
+
+
+n_runs = 100
+n_repeat = 3
+
+t_from_grammar = min(timeit.repeat(run_from_grammar, number=n_runs, repeat=n_repeat))
+print("Parser.from_grammar(): ", t_from_grammar)
+
+t_load = min(timeit.repeat(run_load, number=n_runs, repeat=n_repeat))
+print("Parser.load():         ", t_load)
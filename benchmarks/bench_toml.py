@@ -1,23 +1,8 @@
 import timeit
-import types
 
 from pest import DEFAULT_OPTIMIZER
-from pest import Pairs
 from pest import Parser
 
-
-class GeneratedParser:
-    def __init__(self, code: str, *, module_name: str = "generated_parser"):
-        # Create an in-memory module for the generated code
-        module = types.ModuleType(module_name)
-        exec(compile(code, filename=f"{module_name}.py", mode="exec"), module.__dict__)  # noqa: S102
-        # Keep a reference to the generated entry point
-        self._parse = module.parse
-
-    def parse(self, start_rule: str, input_: str, *, start_pos: int = 0) -> Pairs:  # noqa: D102
-        return self._parse(start_rule, input_, start_pos=start_pos)
-
-
 with open("tests/grammars/toml.pest", encoding="utf-8") as fd:
     grammar = fd.read()
 
@@ -38,8 +23,10 @@ if DEFAULT_OPTIMIZER.log:
 else:
     print("Zero optimizations applied!")
 
-generated_toml_parser = GeneratedParser(unoptimized_toml_parser.generate())
-optimized_generated_toml_parser = GeneratedParser(optimized_toml_parser.generate())
+closures_toml_parser = Parser.from_grammar(grammar, closures=True)
+
+generated_toml_parser = unoptimized_toml_parser.compile()
+optimized_generated_toml_parser = optimized_toml_parser.compile()
 
 
 def run_optimized() -> None:
@@ -50,6 +37,10 @@ def run_unoptimized() -> None:
     unoptimized_toml_parser.parse("toml", data)
 
 
+def run_closures() -> None:
+    closures_toml_parser.parse("toml", data)
+
+
 def run_generated_unoptimized() -> None:
     generated_toml_parser.parse("toml", data)
 
@@ -67,6 +58,9 @@ print("\nOptimized:             ", t_optimized)
 t_unoptimized = min(timeit.repeat(run_unoptimized, number=n_runs, repeat=n_repeat))
 print("Unoptimized:           ", t_unoptimized)
 
+t_closures = min(timeit.repeat(run_closures, number=n_runs, repeat=n_repeat))
+print("Closures optimized:    ", t_closures)
+
 t_generated_optimized = min(
     timeit.repeat(run_generated_optimized, number=n_runs, repeat=n_repeat)
 )
@@ -0,0 +1,15 @@
+"""A benchmark suite covering every bundled grammar with every parser backend.
+
+Run from the root of the repository:
+
+    python -m benchmarks.suite
+    python -m benchmarks.suite --output results.json
+    python -m benchmarks.suite --baseline results.json --threshold 0.1
+    python -m benchmarks.suite --case http --case toml --backend generated
+
+Each grammar and input is defined in `cases.py`, and each backend in
+`backends.py`. Results are reported as per-parse latency percentiles and
+throughput in MB/s. With `--baseline`, results are compared against a JSON file
+written by `--output`, and the command exits with status 1 if any median
+latency is slower than the baseline by more than the threshold.
+"""
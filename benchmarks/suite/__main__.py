@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+from pathlib import Path
+
+from pest import __version__
+
+from .backends import BACKENDS
+from .cases import cases
+from .compare import compare
+from .runner import measure
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.suite",
+        description="Benchmark every bundled grammar with every parser backend.",
+    )
+    parser.add_argument(
+        "--case",
+        action="append",
+        dest="cases",
+        metavar="NAME",
+        help="Only run this case. Can be given more than once.",
+    )
+    parser.add_argument(
+        "--backend",
+        action="append",
+        dest="backends",
+        choices=list(BACKENDS),
+        help="Only run this backend. Can be given more than once.",
+    )
+    parser.add_argument(
+        "--min-seconds",
+        type=float,
+        default=1.0,
+        help="Minimum time to spend parsing each case with each backend.",
+    )
+    parser.add_argument(
+        "--min-parses",
+        type=int,
+        default=20,
+        help="Minimum number of timed parses for each case and backend.",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        metavar="FILE",
+        help="Write results to FILE as JSON.",
+    )
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        metavar="FILE",
+        help="Compare results against a JSON file written by --output.",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="Flag median latencies that differ from the baseline by more "
+        "than this fraction (default: 0.1).",
+    )
+    args = parser.parse_args()
+
+    selected = [case for case in cases() if not args.cases or case.name in args.cases]
+    backends = {
+        name: factory
+        for name, factory in BACKENDS.items()
+        if not args.backends or name in args.backends
+    }
+
+    if not selected:
+        parser.error(f"no such case, expected one of {[c.name for c in cases()]}")
+
+    results: dict[str, dict[str, float]] = {}
+
+    print(
+        f"{'case':<12} {'backend':<22} {'KB':>8} {'MB/s':>8} "
+        f"{'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9} {'parses':>7}"
+    )
+
+    for case in selected:
+        for name, factory in backends.items():
+            result = measure(
+                case,
+                factory(case.grammar),
+                min_parses=args.min_parses,
+                min_seconds=args.min_seconds,
+            )
+            results[f"{case.name}/{name}"] = result
+            print(
+                f"{case.name:<12} {name:<22} {result['bytes'] / 1e3:>8.1f} "
+                f"{result['mb_per_s']:>8.3f} {result['p50_ms']:>9.3f} "
+                f"{result['p90_ms']:>9.3f} {result['p99_ms']:>9.3f} "
+                f"{result['parses']:>7}"
+            )
+
+    report = {
+        "pest": __version__,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"\nWrote results to {args.output}")
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        regressions, improvements = compare(baseline, report, threshold=args.threshold)
+
+        print(f"\nCompared with {args.baseline} (threshold {args.threshold:.0%}):")
+        for change in improvements:
+            print(f"  faster  {change.key:<36} {change.ratio:>6.2f}x")
+        for change in regressions:
+            print(f"  SLOWER  {change.key:<36} {change.ratio:>6.2f}x")
+        if not regressions and not improvements:
+            print("  no significant changes")
+
+        return 1 if regressions else 0
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
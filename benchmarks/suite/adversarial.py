@@ -0,0 +1,170 @@
+"""Search for inputs that make a grammar's parser do the most work per byte.
+
+Run from the root of the repository:
+
+    python -m benchmarks.suite.adversarial
+    python -m benchmarks.suite.adversarial --case http --case jsonpath
+    python -m benchmarks.suite.adversarial --iterations 5000 --output found.json
+
+Each case's benchmark input is split into seed inputs, along with JSONPath
+compliance test suite selectors when the `tests/cts` submodule is checked out,
+and a few random inputs generated from the case's grammar. Seeds are mutated
+with `pest.adversarial.AdversarialSearch`, keeping the inputs that cause the
+most rule attempts and backtracking per byte. The best inputs are pumped to
+estimate how work grows with input size. The command exits with status 1 if
+work grows faster than size^(1 + threshold) for any input, or if any input
+exceeds Python's recursion limit.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from contextlib import suppress
+from pathlib import Path
+
+from pest import Parser
+from pest.adversarial import AdversarialSearch
+from pest.synth import InputGenerator
+
+from .cases import Case
+from .cases import cases
+
+CTS = Path("tests/cts/cts.json")
+
+
+def seeds(case: Case, seed: int, max_length: int) -> list[str]:
+    """Return seed inputs for `case`, each at most `max_length` characters."""
+    texts: list[str] = []
+
+    if case.name == "http":
+        # One request per seed.
+        texts.extend(request + "\n\n" for request in case.text.split("\n\n") if request)
+    elif case.name == "jsonpath" and CTS.exists():
+        tests = json.loads(CTS.read_text(encoding="utf-8"))["tests"]
+        texts.extend(
+            test["selector"] for test in tests if not test.get("invalid_selector")
+        )
+    else:
+        texts.append(case.text)
+
+    generator = InputGenerator(
+        Parser.from_grammar(case.grammar, optimizer=None), seed=seed
+    )
+    for size in (16, 64, 256):
+        with suppress(ValueError):
+            texts.append(generator.generate(case.start_rule, size))
+
+    return [text[:max_length] for text in texts if text]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.suite.adversarial",
+        description="Search for inputs that make a parser do the most work per byte.",
+    )
+    parser.add_argument(
+        "--case",
+        action="append",
+        dest="cases",
+        metavar="NAME",
+        help="Only search this case. Can be given more than once.",
+    )
+    parser.add_argument(
+        "--iterations",
+        type=int,
+        default=2000,
+        help="Number of mutated inputs to try for each case (default: 2000).",
+    )
+    parser.add_argument(
+        "--max-seconds",
+        type=float,
+        metavar="SECONDS",
+        help="Stop searching each case after this many seconds.",
+    )
+    parser.add_argument(
+        "--max-length",
+        type=int,
+        default=512,
+        help="Maximum length of mutated inputs, in characters (default: 512).",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Seed for generating and mutating inputs (default: 0).",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Flag work growing faster than size^(1 + threshold) (default: 0.2).",
+    )
+    parser.add_argument(
+        "--optimized",
+        action="store_true",
+        help="Search optimized parsers. Work done by inlined rules is not counted.",
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=5,
+        help="Number of findings to report for each case (default: 5).",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        metavar="FILE",
+        help="Write findings to FILE as JSON.",
+    )
+    args = parser.parse_args()
+
+    selected = [case for case in cases() if not args.cases or case.name in args.cases]
+    if not selected:
+        parser.error(f"no such case, expected one of {[c.name for c in cases()]}")
+
+    results: dict[str, list[dict[str, object]]] = {}
+    flagged: list[str] = []
+
+    for case in selected:
+        search = AdversarialSearch(
+            Parser.from_grammar(case.grammar)
+            if args.optimized
+            else Parser.from_grammar(case.grammar, optimizer=None),
+            case.start_rule,
+            seed=args.seed,
+            max_length=args.max_length,
+            threshold=args.threshold,
+        )
+
+        findings = search.search(
+            seeds(case, args.seed, args.max_length),
+            iterations=args.iterations,
+            max_seconds=args.max_seconds,
+            pump=args.top,
+        )
+
+        print(f"{case.name}\n{search.report(findings, args.top)}\n")
+
+        if search.super_linear(findings) or search.recursion_errors:
+            flagged.append(case.name)
+
+        results[case.name] = [finding._asdict() for finding in findings[: args.top]]
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2), encoding="utf-8")
+        print(f"Wrote findings to {args.output}")
+
+    if flagged:
+        print(
+            f"Work grows faster than size^{1 + args.threshold:.2f}, or input "
+            f"exceeds the recursion limit, for: {', '.join(flagged)}"
+        )
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,93 @@
+"""Parser backends to benchmark.
+
+Each backend builds a parse function from a grammar. Add new backends to
+`BACKENDS`.
+"""
+
+from __future__ import annotations
+
+from functools import cache
+from typing import TYPE_CHECKING
+
+from pest import Parser
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from pest import Pairs
+
+    ParseFunc = Callable[[str, str], Pairs]
+
+
+def unoptimized(grammar: str) -> ParseFunc:
+    return Parser.from_grammar(grammar, optimizer=None).parse
+
+
+def optimized(grammar: str) -> ParseFunc:
+    return Parser.from_grammar(grammar).parse
+
+
+def closures(grammar: str) -> ParseFunc:
+    return Parser.from_grammar(grammar, closures=True).parse
+
+
+def generated_unoptimized(grammar: str) -> ParseFunc:
+    return Parser.from_grammar(grammar, optimizer=None).compile().parse
+
+
+def generated(grammar: str) -> ParseFunc:
+    return Parser.from_grammar(grammar).compile().parse
+
+
+def memoized(grammar: str) -> ParseFunc:
+    return Parser.from_grammar(grammar, memoize=True).parse
+
+
+def generated_memoized(grammar: str) -> ParseFunc:
+    return Parser.from_grammar(grammar, memoize=True).compile().parse
+
+
+def lazy_errors(grammar: str) -> ParseFunc:
+    return Parser.from_grammar(grammar, lazy_errors=True).parse
+
+
+def closures_lazy_errors(grammar: str) -> ParseFunc:
+    return Parser.from_grammar(grammar, closures=True, lazy_errors=True).parse
+
+
+def generated_lazy_errors(grammar: str) -> ParseFunc:
+    return Parser.from_grammar(grammar, lazy_errors=True).compile().parse
+
+
+def bytes_input(grammar: str) -> ParseFunc:
+    return _parse_encoded(Parser.from_grammar(grammar).parse)
+
+
+def generated_bytes_input(grammar: str) -> ParseFunc:
+    return _parse_encoded(Parser.from_grammar(grammar).compile(bytes_input=True).parse)
+
+
+def _parse_encoded(parse: Callable[[str, bytes], Pairs]) -> ParseFunc:
+    """Wrap `parse` to parse UTF-8 encoded input, encoding each text once."""
+    encode = cache(str.encode)
+
+    def parse_encoded(start_rule: str, text: str) -> Pairs:
+        return parse(start_rule, encode(text))
+
+    return parse_encoded
+
+
+BACKENDS: dict[str, Callable[[str], ParseFunc]] = {
+    "unoptimized": unoptimized,
+    "optimized": optimized,
+    "closures": closures,
+    "generated-unoptimized": generated_unoptimized,
+    "generated": generated,
+    "memoized": memoized,
+    "generated-memoized": generated_memoized,
+    "lazy-errors": lazy_errors,
+    "closures-lazy-errors": closures_lazy_errors,
+    "generated-lazy-errors": generated_lazy_errors,
+    "bytes": bytes_input,
+    "generated-bytes": generated_bytes_input,
+}
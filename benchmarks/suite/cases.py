@@ -0,0 +1,93 @@
+"""Grammars and inputs to benchmark.
+
+Small example inputs are repeated, where the grammar allows it, so that each
+parse takes long enough to time reliably.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import NamedTuple
+
+
+class Case(NamedTuple):
+    name: str
+    grammar: str
+    start_rule: str
+    text: str
+
+
+def read(path: str) -> str:
+    return Path(path).read_text(encoding="utf-8")
+
+
+def calculator_program(n: int) -> str:
+    ops = ["+", "*", "-", "/", "^"]
+    return (
+        " ".join(
+            f"-{i}! {ops[i % len(ops)]} ({i} * x - {i})! {ops[(i + 2) % len(ops)]}"
+            for i in range(1, n)
+        )
+        + " 1"
+    )
+
+
+SQL = (
+    "select a, b, sum(c) from t1 inner join t2 on t1.id = t2.id "
+    "where a > 1 and (b < 2 or b = 3) and c is not null "
+    "group by a, b having sum(c) > 100"
+)
+
+JSONPATH = (
+    "$.store.book[?@.price < 10 && match(@.category, 'fic.*')]"
+    "['title', 'author'][0:5:2]..isbn[-1]"
+)
+
+
+def cases() -> list[Case]:
+    """Return every benchmark case, reading grammars and inputs from disk."""
+    return [
+        Case(
+            "http",
+            read("tests/grammars/http.pest"),
+            "http",
+            read("benchmarks/requests.http"),
+        ),
+        Case(
+            "toml",
+            read("tests/grammars/toml.pest"),
+            "toml",
+            read("tests/examples/example.toml"),
+        ),
+        Case(
+            "json",
+            read("tests/grammars/json.pest"),
+            "json",
+            read("tests/examples/example.json"),
+        ),
+        Case("sql", read("tests/grammars/sql.pest"), "Command", SQL),
+        Case(
+            "jsonpath",
+            read("examples/jsonpath/jsonpath.pest"),
+            "jsonpath",
+            JSONPATH,
+        ),
+        Case(
+            "calculator",
+            read("examples/calculator/calculator.pest"),
+            "program",
+            calculator_program(200),
+        ),
+        Case(
+            "csv",
+            read("examples/csv/csv.pest"),
+            "file",
+            read("examples/csv/example.csv") * 50,
+        ),
+        Case(
+            "ini",
+            read("examples/ini/ini.pest"),
+            "file",
+            read("examples/ini/example.ini") * 20,
+        ),
+    ]
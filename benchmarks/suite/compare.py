@@ -0,0 +1,47 @@
+"""Compare benchmark results against a saved baseline."""
+
+from __future__ import annotations
+
+from typing import Any
+from typing import NamedTuple
+
+
+class Change(NamedTuple):
+    key: str
+    baseline_ms: float
+    current_ms: float
+
+    @property
+    def ratio(self) -> float:
+        """The current result as a multiple of the baseline."""
+        return self.current_ms / self.baseline_ms
+
+
+def compare(
+    baseline: dict[str, Any],
+    current: dict[str, Any],
+    *,
+    threshold: float = 0.1,
+    metric: str = "p50_ms",
+) -> tuple[list[Change], list[Change]]:
+    """Return (regressions, improvements) beyond `threshold`.
+
+    `threshold` is a fraction of the baseline's `metric`, so `0.1` flags
+    results that are more than 10% slower or faster. Results missing from
+    either side are ignored.
+    """
+    regressions: list[Change] = []
+    improvements: list[Change] = []
+
+    for key, result in current["results"].items():
+        base = baseline["results"].get(key)
+        if base is None:
+            continue
+
+        change = Change(key, base[metric], result[metric])
+        if change.ratio > 1 + threshold:
+            regressions.append(change)
+        elif change.ratio < 1 - threshold:
+            improvements.append(change)
+
+    return regressions, improvements
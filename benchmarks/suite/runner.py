@@ -0,0 +1,69 @@
+"""Time parses and summarize latencies."""
+
+from __future__ import annotations
+
+import gc
+from time import perf_counter_ns
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .backends import ParseFunc
+    from .cases import Case
+
+
+def percentile(sorted_ns: list[int], p: float) -> int:
+    """Return the `p`th percentile of sorted timings, by nearest rank."""
+    index = max(round(p / 100 * len(sorted_ns)) - 1, 0)
+    return sorted_ns[min(index, len(sorted_ns) - 1)]
+
+
+def measure(
+    case: Case,
+    parse: ParseFunc,
+    *,
+    min_parses: int = 20,
+    min_seconds: float = 1.0,
+    warmup: int = 3,
+) -> dict[str, float]:
+    """Parse `case.text` repeatedly, returning latency and throughput stats.
+
+    Parses are timed one at a time, at least `min_parses` times and for at
+    least `min_seconds`, after `warmup` untimed parses. Latencies are in
+    milliseconds. Throughput is in megabytes of UTF-8 input per second, at the
+    median latency.
+    """
+    for _ in range(warmup):
+        parse(case.start_rule, case.text)
+
+    timings: list[int] = []
+    budget = min_seconds * 1e9
+    total = 0
+
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        while len(timings) < min_parses or total < budget:
+            t0 = perf_counter_ns()
+            parse(case.start_rule, case.text)
+            elapsed = perf_counter_ns() - t0
+            timings.append(elapsed)
+            total += elapsed
+            gc.collect(0)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    timings.sort()
+    size = len(case.text.encode())
+    median = percentile(timings, 50)
+
+    return {
+        "parses": len(timings),
+        "bytes": size,
+        "min_ms": timings[0] / 1e6,
+        "p50_ms": median / 1e6,
+        "p90_ms": percentile(timings, 90) / 1e6,
+        "p99_ms": percentile(timings, 99) / 1e6,
+        "mean_ms": total / len(timings) / 1e6,
+        "mb_per_s": size / 1e6 / (median / 1e9),
+    }
@@ -0,0 +1,173 @@
+"""Check that parse time grows linearly with input size.
+
+Run from the root of the repository:
+
+    python -m benchmarks.suite.scaling
+    python -m benchmarks.suite.scaling --case json --sizes 1000,10000,100000
+    python -m benchmarks.suite.scaling --backend closures --output scaling.json
+
+For each case, random inputs of increasing size are generated from the case's
+grammar with `pest.synth.InputGenerator`, and timed with each backend. A
+straight line is fitted to log(time) against log(size). Its slope is the
+exponent of the time growth curve, about 1 for linear parsing and 2 for
+quadratic parsing. The command exits with status 1 if any exponent is greater
+than 1 plus the threshold.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+from pathlib import Path
+
+from pest import Parser
+from pest import __version__
+from pest.synth import InputGenerator
+from pest.synth import fit_exponent
+
+from .backends import BACKENDS
+from .cases import Case
+from .cases import cases
+from .runner import measure
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.suite.scaling",
+        description="Check that parse time grows linearly with input size.",
+    )
+    parser.add_argument(
+        "--case",
+        action="append",
+        dest="cases",
+        metavar="NAME",
+        help="Only run this case. Can be given more than once.",
+    )
+    parser.add_argument(
+        "--backend",
+        action="append",
+        dest="backends",
+        choices=list(BACKENDS),
+        help="Only run this backend. Can be given more than once "
+        "(default: optimized and generated).",
+    )
+    parser.add_argument(
+        "--sizes",
+        default="1000,10000,100000,1000000",
+        help="Comma separated input sizes, in characters "
+        "(default: 1000,10000,100000,1000000).",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Seed for generating inputs (default: 0).",
+    )
+    parser.add_argument(
+        "--min-parses",
+        type=int,
+        default=3,
+        help="Minimum number of timed parses for each size (default: 3).",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Flag exponents greater than 1 plus this amount (default: 0.2).",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        metavar="FILE",
+        help="Write timings and exponents to FILE as JSON.",
+    )
+    args = parser.parse_args()
+
+    sizes = sorted(int(size) for size in args.sizes.split(","))
+    if len(sizes) < 2:  # noqa: PLR2004
+        parser.error("need at least two sizes to fit a curve")
+
+    selected = [case for case in cases() if not args.cases or case.name in args.cases]
+    if not selected:
+        parser.error(f"no such case, expected one of {[c.name for c in cases()]}")
+
+    backends = {
+        name: factory
+        for name, factory in BACKENDS.items()
+        if name in (args.backends or ("optimized", "generated"))
+    }
+
+    results: dict[str, dict[str, object]] = {}
+    flagged: list[str] = []
+
+    print(
+        f"{'case':<12} {'backend':<22} "
+        + " ".join(f"{size:>10}" for size in sizes)
+        + f" {'exponent':>9}"
+    )
+
+    for case in selected:
+        generator = InputGenerator(
+            Parser.from_grammar(case.grammar, optimizer=None), seed=args.seed
+        )
+        texts = [generator.generate(case.start_rule, size) for size in sizes]
+
+        for name, factory in backends.items():
+            parse = factory(case.grammar)
+            timings = [
+                measure(
+                    Case(case.name, case.grammar, case.start_rule, text),
+                    parse,
+                    min_parses=args.min_parses,
+                    min_seconds=0,
+                    warmup=1,
+                )
+                for text in texts
+            ]
+
+            # The fastest parse is the least noisy estimate of parse time.
+            seconds = [timing["min_ms"] / 1e3 for timing in timings]
+            exponent = fit_exponent([len(text) for text in texts], seconds)
+            key = f"{case.name}/{name}"
+            results[key] = {
+                "sizes": [len(text) for text in texts],
+                "min_ms": [timing["min_ms"] for timing in timings],
+                "exponent": exponent,
+            }
+
+            if exponent > 1 + args.threshold:
+                flagged.append(key)
+
+            print(
+                f"{case.name:<12} {name:<22} "
+                + " ".join(f"{s * 1e3:>8.2f}ms" for s in seconds)
+                + f" {exponent:>9.2f}"
+                + ("  SUPER-LINEAR" if key in flagged else "")
+            )
+
+    if args.output:
+        report = {
+            "pest": __version__,
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "seed": args.seed,
+            "results": results,
+        }
+        args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"\nWrote results to {args.output}")
+
+    if flagged:
+        print(
+            f"\nParse time grows faster than size^{1 + args.threshold:.2f} "
+            f"for: {', '.join(flagged)}"
+        )
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -20,11 +20,15 @@ from typing import TYPE_CHECKING
 
 import regex as re
 
+from pest.arena import Arena
 from pest.exceptions import PestParsingError
+from pest.grammar.expressions.choice import dispatch_alternatives
+from pest.grammar.expressions.choice import record_failures
 from pest.pairs import Pair
 from pest.pairs import Pairs
 from pest.state import ParserState
 from pest.state import RuleFrame
+from pest.state import StacklessParserState
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -56,6 +60,7 @@ class Rule(StrEnum):
     PRIMARY = 'primary'
     INT = 'int'
     IDENT = 'ident'
+    SKIP = 'SKIP'
 
 def _parse_EOI() -> Callable[[ParserState, list[Pair]], bool]:
     rule_frame = RuleFrame('EOI', 0)
@@ -75,7 +80,10 @@ def _parse_EOI() -> Callable[[ParserState, list[Pair]], bool]:
         else:
             tag3 = None
         if matched:
-            pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag3,))
+            if state.arena is None:
+                pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag3, state.line_index))
+            else:
+                pairs.append(state.arena.add(rule_frame, pos1, state.pos, children2, tag3))
         return matched
     
     return inner
@@ -153,7 +161,10 @@ def _parse_program() -> Callable[[ParserState, list[Pair]], bool]:
         else:
             tag5 = None
         if matched:
-            pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag5,))
+            if state.arena is None:
+                pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag5, state.line_index))
+            else:
+                pairs.append(state.arena.add(rule_frame, pos1, state.pos, children2, tag5))
         return matched
     
     return inner
@@ -177,7 +188,10 @@ def _parse_expr() -> Callable[[ParserState, list[Pair]], bool]:
         else:
             tag3 = None
         if matched:
-            pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag3,))
+            if state.arena is None:
+                pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag3, state.line_index))
+            else:
+                pairs.append(state.arena.add(rule_frame, pos1, state.pos, children2, tag3))
         return matched
     
     return inner
@@ -185,6 +199,12 @@ def _parse_expr() -> Callable[[ParserState, list[Pair]], bool]:
 parse_expr = _parse_expr()
 
 def _parse_add_sub() -> Callable[[ParserState, list[Pair]], bool]:
+    DISPATCH9 = {'+': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), '-': (frozenset([1]), frozenset([1]), frozenset([0]), frozenset([0, 1]))}
+    DISPATCH10 = (frozenset([]), frozenset([]), frozenset([0, 1]), frozenset([0, 1]))
+    FRAMES11 = {'add': RuleFrame('add', 0), 'sub': RuleFrame('sub', 0)}
+    LABELS15 = ((('add',), '"+"'),)
+    LABELS16 = ((('sub',), '"-"'),)
+    
     rule_frame = RuleFrame('add_sub', 0)
     
     def inner(state: ParserState, pairs: list[Pair]) -> bool:
@@ -215,32 +235,42 @@ def _parse_add_sub() -> Callable[[ParserState, list[Pair]], bool]:
                 all_ok8 = True
                 if all_ok8:
                     matched7 = False
-                    # <Choice>
-                    children9: list[Pair] = []
+                    # <DispatchChoice>
+                    children12: list[Pair] = []
                     matched7 = False
+                    if state.pos < len(state.input):
+                        attempt13, replay14 = dispatch_alternatives(state, DISPATCH9.get(state.input[state.pos], DISPATCH10))
+                    else:
+                        attempt13, replay14 = dispatch_alternatives(state, DISPATCH10)
                     if not matched7:
-                        state.checkpoint()
-                        # <Identifier>
-                        matched7 = parse_add(state, children9)
-                        # </Identifier>
-                        if matched7:
-                            state.ok()
-                            children5.extend(children9)
-                        else:
-                            state.restore()
-                            children9.clear()
+                        if 0 in attempt13:
+                            state.checkpoint()
+                            # <Identifier>
+                            matched7 = parse_add(state, children12)
+                            # </Identifier>
+                            if matched7:
+                                state.ok()
+                                children5.extend(children12)
+                            else:
+                                state.restore()
+                                children12.clear()
+                        elif 0 in replay14:
+                            record_failures(state, LABELS15, FRAMES11)
                     if not matched7:
-                        state.checkpoint()
-                        # <Identifier>
-                        matched7 = parse_sub(state, children9)
-                        # </Identifier>
-                        if matched7:
-                            state.ok()
-                            children5.extend(children9)
-                        else:
-                            state.restore()
-                            children9.clear()
-                    # </Choice>
+                        if 1 in attempt13:
+                            state.checkpoint()
+                            # <Identifier>
+                            matched7 = parse_sub(state, children12)
+                            # </Identifier>
+                            if matched7:
+                                state.ok()
+                                children5.extend(children12)
+                            else:
+                                state.restore()
+                                children12.clear()
+                        elif 1 in replay14:
+                            record_failures(state, LABELS16, FRAMES11)
+                    # </DispatchChoice>
                     if not matched7:
                         all_ok8 = False
                     if all_ok8:
@@ -273,11 +303,14 @@ def _parse_add_sub() -> Callable[[ParserState, list[Pair]], bool]:
         # </Sequence>
         state.rule_stack.pop()
         if state.tag_stack:
-            tag10: str | None = state.tag_stack.pop()
+            tag17: str | None = state.tag_stack.pop()
         else:
-            tag10 = None
+            tag17 = None
         if matched:
-            pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag10,))
+            if state.arena is None:
+                pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag17, state.line_index))
+            else:
+                pairs.append(state.arena.add(rule_frame, pos1, state.pos, children2, tag17))
         return matched
     
     return inner
@@ -285,38 +318,54 @@ def _parse_add_sub() -> Callable[[ParserState, list[Pair]], bool]:
 parse_add_sub = _parse_add_sub()
 
 def _parse_add_op() -> Callable[[ParserState, list[Pair]], bool]:
+    DISPATCH3 = {'+': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), '-': (frozenset([1]), frozenset([1]), frozenset([0]), frozenset([0, 1]))}
+    DISPATCH4 = (frozenset([]), frozenset([]), frozenset([0, 1]), frozenset([0, 1]))
+    FRAMES5 = {'add': RuleFrame('add', 0), 'sub': RuleFrame('sub', 0)}
+    LABELS9 = ((('add',), '"+"'),)
+    LABELS10 = ((('sub',), '"-"'),)
+    
     rule_frame = RuleFrame('add_op', 2)
     
     def inner(state: ParserState, pairs: list[Pair]) -> bool:
         """Parse add_op."""
         state.rule_stack.push(rule_frame)
         children2: list[Pair] = []
-        # <Choice>
-        children3: list[Pair] = []
+        # <DispatchChoice>
+        children6: list[Pair] = []
         matched = False
+        if state.pos < len(state.input):
+            attempt7, replay8 = dispatch_alternatives(state, DISPATCH3.get(state.input[state.pos], DISPATCH4))
+        else:
+            attempt7, replay8 = dispatch_alternatives(state, DISPATCH4)
         if not matched:
-            state.checkpoint()
-            # <Identifier>
-            matched = parse_add(state, children3)
-            # </Identifier>
-            if matched:
-                state.ok()
-                children2.extend(children3)
-            else:
-                state.restore()
-                children3.clear()
+            if 0 in attempt7:
+                state.checkpoint()
+                # <Identifier>
+                matched = parse_add(state, children6)
+                # </Identifier>
+                if matched:
+                    state.ok()
+                    children2.extend(children6)
+                else:
+                    state.restore()
+                    children6.clear()
+            elif 0 in replay8:
+                record_failures(state, LABELS9, FRAMES5)
         if not matched:
-            state.checkpoint()
-            # <Identifier>
-            matched = parse_sub(state, children3)
-            # </Identifier>
-            if matched:
-                state.ok()
-                children2.extend(children3)
-            else:
-                state.restore()
-                children3.clear()
-        # </Choice>
+            if 1 in attempt7:
+                state.checkpoint()
+                # <Identifier>
+                matched = parse_sub(state, children6)
+                # </Identifier>
+                if matched:
+                    state.ok()
+                    children2.extend(children6)
+                else:
+                    state.restore()
+                    children6.clear()
+            elif 1 in replay8:
+                record_failures(state, LABELS10, FRAMES5)
+        # </DispatchChoice>
         state.rule_stack.pop()
         # Silent rule 'add_op'
         pairs.extend(children2)
@@ -348,7 +397,10 @@ def _parse_add() -> Callable[[ParserState, list[Pair]], bool]:
         else:
             tag3 = None
         if matched:
-            pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag3,))
+            if state.arena is None:
+                pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag3, state.line_index))
+            else:
+                pairs.append(state.arena.add(rule_frame, pos1, state.pos, children2, tag3))
         return matched
     
     return inner
@@ -377,7 +429,10 @@ def _parse_sub() -> Callable[[ParserState, list[Pair]], bool]:
         else:
             tag3 = None
         if matched:
-            pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag3,))
+            if state.arena is None:
+                pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag3, state.line_index))
+            else:
+                pairs.append(state.arena.add(rule_frame, pos1, state.pos, children2, tag3))
         return matched
     
     return inner
@@ -385,6 +440,12 @@ def _parse_sub() -> Callable[[ParserState, list[Pair]], bool]:
 parse_sub = _parse_sub()
 
 def _parse_mul_div() -> Callable[[ParserState, list[Pair]], bool]:
+    DISPATCH9 = {'*': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), '/': (frozenset([1]), frozenset([1]), frozenset([0]), frozenset([0, 1]))}
+    DISPATCH10 = (frozenset([]), frozenset([]), frozenset([0, 1]), frozenset([0, 1]))
+    FRAMES11 = {'div': RuleFrame('div', 0), 'mul': RuleFrame('mul', 0)}
+    LABELS15 = ((('mul',), '"*"'),)
+    LABELS16 = ((('div',), '"/"'),)
+    
     rule_frame = RuleFrame('mul_div', 0)
     
     def inner(state: ParserState, pairs: list[Pair]) -> bool:
@@ -415,32 +476,42 @@ def _parse_mul_div() -> Callable[[ParserState, list[Pair]], bool]:
                 all_ok8 = True
                 if all_ok8:
                     matched7 = False
-                    # <Choice>
-                    children9: list[Pair] = []
+                    # <DispatchChoice>
+                    children12: list[Pair] = []
                     matched7 = False
+                    if state.pos < len(state.input):
+                        attempt13, replay14 = dispatch_alternatives(state, DISPATCH9.get(state.input[state.pos], DISPATCH10))
+                    else:
+                        attempt13, replay14 = dispatch_alternatives(state, DISPATCH10)
                     if not matched7:
-                        state.checkpoint()
-                        # <Identifier>
-                        matched7 = parse_mul(state, children9)
-                        # </Identifier>
-                        if matched7:
-                            state.ok()
-                            children5.extend(children9)
-                        else:
-                            state.restore()
-                            children9.clear()
+                        if 0 in attempt13:
+                            state.checkpoint()
+                            # <Identifier>
+                            matched7 = parse_mul(state, children12)
+                            # </Identifier>
+                            if matched7:
+                                state.ok()
+                                children5.extend(children12)
+                            else:
+                                state.restore()
+                                children12.clear()
+                        elif 0 in replay14:
+                            record_failures(state, LABELS15, FRAMES11)
                     if not matched7:
-                        state.checkpoint()
-                        # <Identifier>
-                        matched7 = parse_div(state, children9)
-                        # </Identifier>
-                        if matched7:
-                            state.ok()
-                            children5.extend(children9)
-                        else:
-                            state.restore()
-                            children9.clear()
-                    # </Choice>
+                        if 1 in attempt13:
+                            state.checkpoint()
+                            # <Identifier>
+                            matched7 = parse_div(state, children12)
+                            # </Identifier>
+                            if matched7:
+                                state.ok()
+                                children5.extend(children12)
+                            else:
+                                state.restore()
+                                children12.clear()
+                        elif 1 in replay14:
+                            record_failures(state, LABELS16, FRAMES11)
+                    # </DispatchChoice>
                     if not matched7:
                         all_ok8 = False
                     if all_ok8:
@@ -473,11 +544,14 @@ def _parse_mul_div() -> Callable[[ParserState, list[Pair]], bool]:
         # </Sequence>
         state.rule_stack.pop()
         if state.tag_stack:
-            tag10: str | None = state.tag_stack.pop()
+            tag17: str | None = state.tag_stack.pop()
         else:
-            tag10 = None
+            tag17 = None
         if matched:
-            pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag10,))
+            if state.arena is None:
+                pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag17, state.line_index))
+            else:
+                pairs.append(state.arena.add(rule_frame, pos1, state.pos, children2, tag17))
         return matched
     
     return inner
@@ -485,38 +559,54 @@ def _parse_mul_div() -> Callable[[ParserState, list[Pair]], bool]:
 parse_mul_div = _parse_mul_div()
 
 def _parse_mul_op() -> Callable[[ParserState, list[Pair]], bool]:
+    DISPATCH3 = {'*': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), '/': (frozenset([1]), frozenset([1]), frozenset([0]), frozenset([0, 1]))}
+    DISPATCH4 = (frozenset([]), frozenset([]), frozenset([0, 1]), frozenset([0, 1]))
+    FRAMES5 = {'div': RuleFrame('div', 0), 'mul': RuleFrame('mul', 0)}
+    LABELS9 = ((('mul',), '"*"'),)
+    LABELS10 = ((('div',), '"/"'),)
+    
     rule_frame = RuleFrame('mul_op', 2)
     
     def inner(state: ParserState, pairs: list[Pair]) -> bool:
         """Parse mul_op."""
         state.rule_stack.push(rule_frame)
         children2: list[Pair] = []
-        # <Choice>
-        children3: list[Pair] = []
+        # <DispatchChoice>
+        children6: list[Pair] = []
         matched = False
+        if state.pos < len(state.input):
+            attempt7, replay8 = dispatch_alternatives(state, DISPATCH3.get(state.input[state.pos], DISPATCH4))
+        else:
+            attempt7, replay8 = dispatch_alternatives(state, DISPATCH4)
         if not matched:
-            state.checkpoint()
-            # <Identifier>
-            matched = parse_mul(state, children3)
-            # </Identifier>
-            if matched:
-                state.ok()
-                children2.extend(children3)
-            else:
-                state.restore()
-                children3.clear()
+            if 0 in attempt7:
+                state.checkpoint()
+                # <Identifier>
+                matched = parse_mul(state, children6)
+                # </Identifier>
+                if matched:
+                    state.ok()
+                    children2.extend(children6)
+                else:
+                    state.restore()
+                    children6.clear()
+            elif 0 in replay8:
+                record_failures(state, LABELS9, FRAMES5)
         if not matched:
-            state.checkpoint()
-            # <Identifier>
-            matched = parse_div(state, children3)
-            # </Identifier>
-            if matched:
-                state.ok()
-                children2.extend(children3)
-            else:
-                state.restore()
-                children3.clear()
-        # </Choice>
+            if 1 in attempt7:
+                state.checkpoint()
+                # <Identifier>
+                matched = parse_div(state, children6)
+                # </Identifier>
+                if matched:
+                    state.ok()
+                    children2.extend(children6)
+                else:
+                    state.restore()
+                    children6.clear()
+            elif 1 in replay8:
+                record_failures(state, LABELS10, FRAMES5)
+        # </DispatchChoice>
         state.rule_stack.pop()
         # Silent rule 'mul_op'
         pairs.extend(children2)
@@ -548,7 +638,10 @@ def _parse_mul() -> Callable[[ParserState, list[Pair]], bool]:
         else:
             tag3 = None
         if matched:
-            pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag3,))
+            if state.arena is None:
+                pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag3, state.line_index))
+            else:
+                pairs.append(state.arena.add(rule_frame, pos1, state.pos, children2, tag3))
         return matched
     
     return inner
@@ -577,7 +670,10 @@ def _parse_div() -> Callable[[ParserState, list[Pair]], bool]:
         else:
             tag3 = None
         if matched:
-            pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag3,))
+            if state.arena is None:
+                pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag3, state.line_index))
+            else:
+                pairs.append(state.arena.add(rule_frame, pos1, state.pos, children2, tag3))
         return matched
     
     return inner
@@ -648,7 +744,10 @@ def _parse_pow_expr() -> Callable[[ParserState, list[Pair]], bool]:
         else:
             tag8 = None
         if matched:
-            pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag8,))
+            if state.arena is None:
+                pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag8, state.line_index))
+            else:
+                pairs.append(state.arena.add(rule_frame, pos1, state.pos, children2, tag8))
         return matched
     
     return inner
@@ -696,7 +795,10 @@ def _parse_pow() -> Callable[[ParserState, list[Pair]], bool]:
         else:
             tag3 = None
         if matched:
-            pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag3,))
+            if state.arena is None:
+                pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag3, state.line_index))
+            else:
+                pairs.append(state.arena.add(rule_frame, pos1, state.pos, children2, tag3))
         return matched
     
     return inner
@@ -756,7 +858,10 @@ def _parse_prefix() -> Callable[[ParserState, list[Pair]], bool]:
         else:
             tag7 = None
         if matched:
-            pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag7,))
+            if state.arena is None:
+                pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag7, state.line_index))
+            else:
+                pairs.append(state.arena.add(rule_frame, pos1, state.pos, children2, tag7))
         return matched
     
     return inner
@@ -785,7 +890,10 @@ def _parse_neg() -> Callable[[ParserState, list[Pair]], bool]:
         else:
             tag3 = None
         if matched:
-            pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag3,))
+            if state.arena is None:
+                pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag3, state.line_index))
+            else:
+                pairs.append(state.arena.add(rule_frame, pos1, state.pos, children2, tag3))
         return matched
     
     return inner
@@ -793,6 +901,12 @@ def _parse_neg() -> Callable[[ParserState, list[Pair]], bool]:
 parse_neg = _parse_neg()
 
 def _parse_postfix() -> Callable[[ParserState, list[Pair]], bool]:
+    DISPATCH5 = {'(': (frozenset([2]), frozenset([2]), frozenset([0]), frozenset([0, 1, 2])), '0': (frozenset([0]), frozenset([0]), frozenset([2]), frozenset([0, 1, 2])), '1': (frozenset([0]), frozenset([0]), frozenset([2]), frozenset([0, 1, 2])), '2': (frozenset([0]), frozenset([0]), frozenset([2]), frozenset([0, 1, 2])), '3': (frozenset([0]), frozenset([0]), frozenset([2]), frozenset([0, 1, 2])), '4': (frozenset([0]), frozenset([0]), frozenset([2]), frozenset([0, 1, 2])), '5': (frozenset([0]), frozenset([0]), frozenset([2]), frozenset([0, 1, 2])), '6': (frozenset([0]), frozenset([0]), frozenset([2]), frozenset([0, 1, 2])), '7': (frozenset([0]), frozenset([0]), frozenset([2]), frozenset([0, 1, 2])), '8': (frozenset([0]), frozenset([0]), frozenset([2]), frozenset([0, 1, 2])), '9': (frozenset([0]), frozenset([0]), frozenset([2]), frozenset([0, 1, 2])), 'A': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'B': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'C': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'D': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'E': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'F': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'G': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'H': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'I': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'J': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'K': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'L': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'M': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'N': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'O': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'P': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'Q': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'R': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'S': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'T': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'U': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'V': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'W': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'X': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'Y': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'Z': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'a': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'b': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'c': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'd': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'e': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'f': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'g': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'h': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'i': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'j': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'k': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'l': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'm': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'n': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'o': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'p': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'q': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'r': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 's': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 't': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'u': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'v': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'w': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'x': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'y': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'z': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2]))}
+    DISPATCH6 = (frozenset([]), frozenset([]), frozenset([0, 2]), frozenset([0, 1, 2]))
+    FRAMES7 = {'int': RuleFrame('int', 4)}
+    LABELS11 = ((('int',), "''1''..''9''"), (('int',), '"0"'))
+    LABELS14 = (((), '"("'),)
+    
     rule_frame = RuleFrame('postfix', 0)
     
     def inner(state: ParserState, pairs: list[Pair]) -> bool:
@@ -804,79 +918,90 @@ def _parse_postfix() -> Callable[[ParserState, list[Pair]], bool]:
         all_ok4 = True
         if all_ok4:
             matched3 = False
-            # <Choice>
-            children5: list[Pair] = []
+            # <DispatchChoice>
+            children8: list[Pair] = []
             matched3 = False
+            if state.pos < len(state.input):
+                attempt9, replay10 = dispatch_alternatives(state, DISPATCH5.get(state.input[state.pos], DISPATCH6))
+            else:
+                attempt9, replay10 = dispatch_alternatives(state, DISPATCH6)
             if not matched3:
-                state.checkpoint()
-                # <Identifier>
-                matched3 = parse_int(state, children5)
-                # </Identifier>
-                if matched3:
-                    state.ok()
-                    children2.extend(children5)
-                else:
-                    state.restore()
-                    children5.clear()
-            if not matched3:
-                state.checkpoint()
-                # <Identifier>
-                matched3 = parse_ident(state, children5)
-                # </Identifier>
-                if matched3:
-                    state.ok()
-                    children2.extend(children5)
-                else:
-                    state.restore()
-                    children5.clear()
-            if not matched3:
-                state.checkpoint()
-                # <Sequence n=3>
-                all_ok7 = True
-                if all_ok7:
-                    matched6 = False
-                    # <String>
-                    if state.input.startswith('(', state.pos):
-                        state.pos += 1
-                        matched6 = True
+                if 0 in attempt9:
+                    state.checkpoint()
+                    # <Identifier>
+                    matched3 = parse_int(state, children8)
+                    # </Identifier>
+                    if matched3:
+                        state.ok()
+                        children2.extend(children8)
                     else:
-                        matched6 = False
-                        state.fail('"("')
-                    # </String>
-                    if not matched6:
-                        all_ok7 = False
-                    if all_ok7:
-                        parse_trivia(state, children5)
-                if all_ok7:
-                    matched6 = False
+                        state.restore()
+                        children8.clear()
+                elif 0 in replay10:
+                    record_failures(state, LABELS11, FRAMES7)
+            if not matched3:
+                if 1 in attempt9:
+                    state.checkpoint()
                     # <Identifier>
-                    matched6 = parse_expr(state, children5)
+                    matched3 = parse_ident(state, children8)
                     # </Identifier>
-                    if not matched6:
-                        all_ok7 = False
-                    if all_ok7:
-                        parse_trivia(state, children5)
-                if all_ok7:
-                    matched6 = False
-                    # <String>
-                    if state.input.startswith(')', state.pos):
-                        state.pos += 1
-                        matched6 = True
+                    if matched3:
+                        state.ok()
+                        children2.extend(children8)
                     else:
-                        matched6 = False
-                        state.fail('")"')
-                    # </String>
-                    if not matched6:
-                        all_ok7 = False
-                matched3 = all_ok7
-                # </Sequence>
-                if matched3:
-                    state.ok()
-                    children2.extend(children5)
-                else:
-                    state.restore()
-                    children5.clear()
-            # </Choice>
+                        state.restore()
+                        children8.clear()
+            if not matched3:
+                if 2 in attempt9:
+                    state.checkpoint()
+                    # <Sequence n=3>
+                    all_ok13 = True
+                    if all_ok13:
+                        matched12 = False
+                        # <String>
+                        if state.input.startswith('(', state.pos):
+                            state.pos += 1
+                            matched12 = True
+                        else:
+                            matched12 = False
+                            state.fail('"("')
+                        # </String>
+                        if not matched12:
+                            all_ok13 = False
+                        if all_ok13:
+                            parse_trivia(state, children8)
+                    if all_ok13:
+                        matched12 = False
+                        # <Identifier>
+                        matched12 = parse_expr(state, children8)
+                        # </Identifier>
+                        if not matched12:
+                            all_ok13 = False
+                        if all_ok13:
+                            parse_trivia(state, children8)
+                    if all_ok13:
+                        matched12 = False
+                        # <String>
+                        if state.input.startswith(')', state.pos):
+                            state.pos += 1
+                            matched12 = True
+                        else:
+                            matched12 = False
+                            state.fail('")"')
+                        # </String>
+                        if not matched12:
+                            all_ok13 = False
+                    matched3 = all_ok13
+                    # </Sequence>
+                    if matched3:
+                        state.ok()
+                        children2.extend(children8)
+                    else:
+                        state.restore()
+                        children8.clear()
+                elif 2 in replay10:
+                    record_failures(state, LABELS14, FRAMES7)
+            # </DispatchChoice>
             if not matched3:
                 all_ok4 = False
             if all_ok4:
@@ -884,24 +1009,24 @@ def _parse_postfix() -> Callable[[ParserState, list[Pair]], bool]:
         if all_ok4:
             matched3 = False
             # <Repeat>
-            trivia_pos9 = state.pos
-            children8: list[Pair] = []
+            trivia_pos16 = state.pos
+            children15: list[Pair] = []
             while True:
                 state.checkpoint()
                 # <Group>
                 # <Identifier>
-                matched3 = parse_fac(state, children8)
+                matched3 = parse_fac(state, children15)
                 # </Identifier>
                 # </Group>
                 if matched3:
                     state.ok()
-                    children2.extend(children8)
-                    children8.clear()
-                    trivia_pos9 = state.pos
-                    parse_trivia(state, children8)
+                    children2.extend(children15)
+                    children15.clear()
+                    trivia_pos16 = state.pos
+                    parse_trivia(state, children15)
                 else:
                     state.restore()
-                    state.pos = trivia_pos9
+                    state.pos = trivia_pos16
                     matched3 = True
                     break
             # </Repeat>
@@ -911,11 +1036,14 @@ def _parse_postfix() -> Callable[[ParserState, list[Pair]], bool]:
         # </Sequence>
         state.rule_stack.pop()
         if state.tag_stack:
-            tag10: str | None = state.tag_stack.pop()
+            tag17: str | None = state.tag_stack.pop()
         else:
-            tag10 = None
+            tag17 = None
         if matched:
-            pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag10,))
+            if state.arena is None:
+                pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag17, state.line_index))
+            else:
+                pairs.append(state.arena.add(rule_frame, pos1, state.pos, children2, tag17))
         return matched
     
     return inner
@@ -944,7 +1072,10 @@ def _parse_fac() -> Callable[[ParserState, list[Pair]], bool]:
         else:
             tag3 = None
         if matched:
-            pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag3,))
+            if state.arena is None:
+                pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag3, state.line_index))
+            else:
+                pairs.append(state.arena.add(rule_frame, pos1, state.pos, children2, tag3))
         return matched
     
     return inner
@@ -952,85 +1083,102 @@ def _parse_fac() -> Callable[[ParserState, list[Pair]], bool]:
 parse_fac = _parse_fac()
 
 def _parse_primary() -> Callable[[ParserState, list[Pair]], bool]:
+    DISPATCH3 = {'(': (frozenset([2]), frozenset([2]), frozenset([0]), frozenset([0, 1, 2])), '0': (frozenset([0]), frozenset([0]), frozenset([2]), frozenset([0, 1, 2])), '1': (frozenset([0]), frozenset([0]), frozenset([2]), frozenset([0, 1, 2])), '2': (frozenset([0]), frozenset([0]), frozenset([2]), frozenset([0, 1, 2])), '3': (frozenset([0]), frozenset([0]), frozenset([2]), frozenset([0, 1, 2])), '4': (frozenset([0]), frozenset([0]), frozenset([2]), frozenset([0, 1, 2])), '5': (frozenset([0]), frozenset([0]), frozenset([2]), frozenset([0, 1, 2])), '6': (frozenset([0]), frozenset([0]), frozenset([2]), frozenset([0, 1, 2])), '7': (frozenset([0]), frozenset([0]), frozenset([2]), frozenset([0, 1, 2])), '8': (frozenset([0]), frozenset([0]), frozenset([2]), frozenset([0, 1, 2])), '9': (frozenset([0]), frozenset([0]), frozenset([2]), frozenset([0, 1, 2])), 'A': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'B': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'C': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'D': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'E': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'F': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'G': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'H': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'I': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'J': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'K': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'L': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'M': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'N': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'O': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'P': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'Q': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'R': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'S': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'T': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'U': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'V': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'W': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'X': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'Y': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'Z': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'a': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'b': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'c': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'd': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'e': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'f': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'g': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'h': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'i': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'j': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'k': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'l': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'm': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'n': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'o': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'p': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'q': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'r': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 's': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 't': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'u': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'v': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'w': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'x': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'y': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'z': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2]))}
+    DISPATCH4 = (frozenset([]), frozenset([]), frozenset([0, 2]), frozenset([0, 1, 2]))
+    FRAMES5 = {'int': RuleFrame('int', 4)}
+    LABELS9 = ((('int',), "''1''..''9''"), (('int',), '"0"'))
+    LABELS12 = (((), '"("'),)
+    
     rule_frame = RuleFrame('primary', 2)
     
     def inner(state: ParserState, pairs: list[Pair]) -> bool:
         """Parse primary."""
         state.rule_stack.push(rule_frame)
         children2: list[Pair] = []
-        # <Choice>
-        children3: list[Pair] = []
+        # <DispatchChoice>
+        children6: list[Pair] = []
         matched = False
+        if state.pos < len(state.input):
+            attempt7, replay8 = dispatch_alternatives(state, DISPATCH3.get(state.input[state.pos], DISPATCH4))
+        else:
+            attempt7, replay8 = dispatch_alternatives(state, DISPATCH4)
         if not matched:
-            state.checkpoint()
-            # <Identifier>
-            matched = parse_int(state, children3)
-            # </Identifier>
-            if matched:
-                state.ok()
-                children2.extend(children3)
-            else:
-                state.restore()
-                children3.clear()
-        if not matched:
-            state.checkpoint()
-            # <Identifier>
-            matched = parse_ident(state, children3)
-            # </Identifier>
-            if matched:
-                state.ok()
-                children2.extend(children3)
-            else:
-                state.restore()
-                children3.clear()
-        if not matched:
-            state.checkpoint()
-            # <Sequence n=3>
-            all_ok5 = True
-            if all_ok5:
-                matched4 = False
-                # <String>
-                if state.input.startswith('(', state.pos):
-                    state.pos += 1
-                    matched4 = True
+            if 0 in attempt7:
+                state.checkpoint()
+                # <Identifier>
+                matched = parse_int(state, children6)
+                # </Identifier>
+                if matched:
+                    state.ok()
+                    children2.extend(children6)
                 else:
-                    matched4 = False
-                    state.fail('"("')
-                # </String>
-                if not matched4:
-                    all_ok5 = False
-                if all_ok5:
-                    parse_trivia(state, children3)
-            if all_ok5:
-                matched4 = False
+                    state.restore()
+                    children6.clear()
+            elif 0 in replay8:
+                record_failures(state, LABELS9, FRAMES5)
+        if not matched:
+            if 1 in attempt7:
+                state.checkpoint()
                 # <Identifier>
-                matched4 = parse_expr(state, children3)
+                matched = parse_ident(state, children6)
                 # </Identifier>
-                if not matched4:
-                    all_ok5 = False
-                if all_ok5:
-                    parse_trivia(state, children3)
-            if all_ok5:
-                matched4 = False
-                # <String>
-                if state.input.startswith(')', state.pos):
-                    state.pos += 1
-                    matched4 = True
+                if matched:
+                    state.ok()
+                    children2.extend(children6)
                 else:
-                    matched4 = False
-                    state.fail('")"')
-                # </String>
-                if not matched4:
-                    all_ok5 = False
-            matched = all_ok5
-            # </Sequence>
-            if matched:
-                state.ok()
-                children2.extend(children3)
-            else:
-                state.restore()
-                children3.clear()
-        # </Choice>
+                    state.restore()
+                    children6.clear()
+        if not matched:
+            if 2 in attempt7:
+                state.checkpoint()
+                # <Sequence n=3>
+                all_ok11 = True
+                if all_ok11:
+                    matched10 = False
+                    # <String>
+                    if state.input.startswith('(', state.pos):
+                        state.pos += 1
+                        matched10 = True
+                    else:
+                        matched10 = False
+                        state.fail('"("')
+                    # </String>
+                    if not matched10:
+                        all_ok11 = False
+                    if all_ok11:
+                        parse_trivia(state, children6)
+                if all_ok11:
+                    matched10 = False
+                    # <Identifier>
+                    matched10 = parse_expr(state, children6)
+                    # </Identifier>
+                    if not matched10:
+                        all_ok11 = False
+                    if all_ok11:
+                        parse_trivia(state, children6)
+                if all_ok11:
+                    matched10 = False
+                    # <String>
+                    if state.input.startswith(')', state.pos):
+                        state.pos += 1
+                        matched10 = True
+                    else:
+                        matched10 = False
+                        state.fail('")"')
+                    # </String>
+                    if not matched10:
+                        all_ok11 = False
+                matched = all_ok11
+                # </Sequence>
+                if matched:
+                    state.ok()
+                    children2.extend(children6)
+                else:
+                    state.restore()
+                    children6.clear()
+            elif 2 in replay8:
+                record_failures(state, LABELS12, FRAMES5)
+        # </DispatchChoice>
         state.rule_stack.pop()
         # Silent rule 'primary'
         pairs.extend(children2)
@@ -1041,8 +1189,13 @@ def _parse_primary() -> Callable[[ParserState, list[Pair]], bool]:
 parse_primary = _parse_primary()
 
 def _parse_int() -> Callable[[ParserState, list[Pair]], bool]:
-    RE6 = re.compile('[1-9]', re.I)
-    RE9 = re.compile('[0-9]', re.I)
+    RE3 = re.compile('(?>[1-9](?:[0-9])*+|0)', re.VERSION1)
+    DISPATCH4 = {'0': (frozenset([1]), frozenset([1]), frozenset([0]), frozenset([0, 1])), '1': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), '2': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), '3': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), '4': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), '5': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), '6': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), '7': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), '8': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), '9': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1]))}
+    DISPATCH5 = (frozenset([]), frozenset([]), frozenset([0, 1]), frozenset([0, 1]))
+    RE11 = re.compile('[1-9]')
+    RE14 = re.compile('[0-9]')
+    LABELS15 = (((), "''1''..''9''"),)
+    LABELS16 = (((), '"0"'),)
     
     rule_frame = RuleFrame('int', 4)
     
@@ -1054,27 +1207,151 @@ def _parse_int() -> Callable[[ParserState, list[Pair]], bool]:
         with state.atomic_checkpoint():
             state.atomic_depth += 1
             # <Group>
-            # <Choice>
-            children3: list[Pair] = []
-            matched = False
-            if not matched:
-                state.checkpoint()
+            # <AtomicRegex>
+            if match := RE3.match(state.input, state.pos):
+                state.pos = match.end()
+                matched = True
+            elif state.track_failures:
+                # <DispatchChoice>
+                children6: list[Pair] = []
+                matched = False
+                if state.pos < len(state.input):
+                    attempt7, replay8 = dispatch_alternatives(state, DISPATCH4.get(state.input[state.pos], DISPATCH5))
+                else:
+                    attempt7, replay8 = dispatch_alternatives(state, DISPATCH5)
+                if not matched:
+                    if 0 in attempt7:
+                        state.checkpoint()
+                        # <Sequence n=2>
+                        all_ok10 = True
+                        if all_ok10:
+                            matched9 = False
+                            # <Range>
+                            if match := RE11.match(state.input, state.pos):
+                                state.pos = match.end()
+                                matched9 = True
+                            else:
+                                matched9 = False
+                                state.fail("''1''..''9''")
+                            # </Range>
+                            if not matched9:
+                                all_ok10 = False
+                            if all_ok10:
+                                parse_trivia(state, children6)
+                        if all_ok10:
+                            matched9 = False
+                            # <Repeat>
+                            trivia_pos13 = state.pos
+                            children12: list[Pair] = []
+                            while True:
+                                state.checkpoint()
+                                # <Range>
+                                if match := RE14.match(state.input, state.pos):
+                                    state.pos = match.end()
+                                    matched9 = True
+                                else:
+                                    matched9 = False
+                                    state.fail("''0''..''9''")
+                                # </Range>
+                                if matched9:
+                                    state.ok()
+                                    children6.extend(children12)
+                                    children12.clear()
+                                    trivia_pos13 = state.pos
+                                    parse_trivia(state, children12)
+                                else:
+                                    state.restore()
+                                    state.pos = trivia_pos13
+                                    matched9 = True
+                                    break
+                            # </Repeat>
+                            if not matched9:
+                                all_ok10 = False
+                        matched = all_ok10
+                        # </Sequence>
+                        if matched:
+                            state.ok()
+                            children2.extend(children6)
+                        else:
+                            state.restore()
+                            children6.clear()
+                    elif 0 in replay8:
+                        record_failures(state, LABELS15)
+                if not matched:
+                    if 1 in attempt7:
+                        state.checkpoint()
+                        # <String>
+                        if state.input.startswith('0', state.pos):
+                            state.pos += 1
+                            matched = True
+                        else:
+                            matched = False
+                            state.fail('"0"')
+                        # </String>
+                        if matched:
+                            state.ok()
+                            children2.extend(children6)
+                        else:
+                            state.restore()
+                            children6.clear()
+                    elif 1 in replay8:
+                        record_failures(state, LABELS16)
+                # </DispatchChoice>
+            else:
+                matched = False
+            # </AtomicRegex>
+            # </Group>
+        state.rule_stack.pop()
+        if state.tag_stack:
+            tag17: str | None = state.tag_stack.pop()
+        else:
+            tag17 = None
+        # Atomic rule: 'int'
+        if matched:
+            if state.arena is None:
+                pairs.append(Pair(state.input, pos1, state.pos, rule_frame, [], tag17, state.line_index))
+            else:
+                pairs.append(state.arena.add(rule_frame, pos1, state.pos, [], tag17))
+        return matched
+    
+    return inner
+    
+parse_int = _parse_int()
+
+def _parse_ident() -> Callable[[ParserState, list[Pair]], bool]:
+    RE3 = re.compile('(?>[A-Za-z])(?:(?>[A-Za-z]))*+', re.VERSION1)
+    RE6 = re.compile('[A-Za-z]', re.VERSION1)
+    RE9 = re.compile('[A-Za-z]', re.VERSION1)
+    
+    rule_frame = RuleFrame('ident', 4)
+    
+    def inner(state: ParserState, pairs: list[Pair]) -> bool:
+        """Parse ident."""
+        pos1 = state.pos
+        state.rule_stack.push(rule_frame)
+        children2: list[Pair] = []
+        with state.atomic_checkpoint():
+            state.atomic_depth += 1
+            # <AtomicRegex>
+            if match := RE3.match(state.input, state.pos):
+                state.pos = match.end()
+                matched = True
+            elif state.track_failures:
                 # <Sequence n=2>
                 all_ok5 = True
                 if all_ok5:
                     matched4 = False
-                    # <Range>
+                    # <ChoiceRegex>
                     if match := RE6.match(state.input, state.pos):
                         state.pos = match.end()
                         matched4 = True
                     else:
                         matched4 = False
-                        state.fail("''1''..''9''")
-                    # </Range>
+                    # </ChoiceRegex>
                     if not matched4:
                         all_ok5 = False
                     if all_ok5:
-                        parse_trivia(state, children3)
+                        parse_trivia(state, children2)
                 if all_ok5:
                     matched4 = False
                     # <Repeat>
@@ -1082,17 +1359,16 @@ def _parse_int() -> Callable[[ParserState, list[Pair]], bool]:
                     children7: list[Pair] = []
                     while True:
                         state.checkpoint()
-                        # <Range>
+                        # <ChoiceRegex>
                         if match := RE9.match(state.input, state.pos):
                             state.pos = match.end()
                             matched4 = True
                         else:
                             matched4 = False
-                            state.fail("''0''..''9''")
-                        # </Range>
+                        # </ChoiceRegex>
                         if matched4:
                             state.ok()
-                            children3.extend(children7)
+                            children2.extend(children7)
                             children7.clear()
                             trivia_pos8 = state.pos
                             parse_trivia(state, children7)
@@ -1106,131 +1382,57 @@ def _parse_int() -> Callable[[ParserState, list[Pair]], bool]:
                         all_ok5 = False
                 matched = all_ok5
                 # </Sequence>
-                if matched:
-                    state.ok()
-                    children2.extend(children3)
-                else:
-                    state.restore()
-                    children3.clear()
-            if not matched:
-                state.checkpoint()
-                # <String>
-                if state.input.startswith('0', state.pos):
-                    state.pos += 1
-                    matched = True
-                else:
-                    matched = False
-                    state.fail('"0"')
-                # </String>
-                if matched:
-                    state.ok()
-                    children2.extend(children3)
-                else:
-                    state.restore()
-                    children3.clear()
-            # </Choice>
-            # </Group>
+            else:
+                matched = False
+            # </AtomicRegex>
         state.rule_stack.pop()
         if state.tag_stack:
             tag10: str | None = state.tag_stack.pop()
         else:
             tag10 = None
-        # Atomic rule: 'int'
+        # Atomic rule: 'ident'
         if matched:
-            pairs.append(Pair(state.input, pos1, state.pos, rule_frame, [], tag10,))
+            if state.arena is None:
+                pairs.append(Pair(state.input, pos1, state.pos, rule_frame, [], tag10, state.line_index))
+            else:
+                pairs.append(state.arena.add(rule_frame, pos1, state.pos, [], tag10))
         return matched
     
     return inner
     
-parse_int = _parse_int()
+parse_ident = _parse_ident()
 
-def _parse_ident() -> Callable[[ParserState, list[Pair]], bool]:
-    RE5 = re.compile('[A-Za-z]', re.VERSION1)
-    RE8 = re.compile('[A-Za-z]', re.VERSION1)
+def _parse_SKIP() -> Callable[[ParserState, list[Pair]], bool]:
+    RE3 = re.compile('(?:\\\r\\\n|[\\\t\\\n\\\r\\ ])*', re.VERSION1)
     
-    rule_frame = RuleFrame('ident', 4)
+    rule_frame = RuleFrame('SKIP', 6)
     
     def inner(state: ParserState, pairs: list[Pair]) -> bool:
-        """Parse ident."""
-        pos1 = state.pos
+        """Parse SKIP."""
         state.rule_stack.push(rule_frame)
         children2: list[Pair] = []
         with state.atomic_checkpoint():
             state.atomic_depth += 1
-            # <Sequence n=2>
-            all_ok4 = True
-            if all_ok4:
-                matched3 = False
-                # <ChoiceRegex>
-                if match := RE5.match(state.input, state.pos):
-                    state.pos = match.end()
-                    matched3 = True
-                else:
-                    matched3 = False
-                # </ChoiceRegex>
-                if not matched3:
-                    all_ok4 = False
-                if all_ok4:
-                    parse_trivia(state, children2)
-            if all_ok4:
-                matched3 = False
-                # <Repeat>
-                trivia_pos7 = state.pos
-                children6: list[Pair] = []
-                while True:
-                    state.checkpoint()
-                    # <ChoiceRegex>
-                    if match := RE8.match(state.input, state.pos):
-                        state.pos = match.end()
-                        matched3 = True
-                    else:
-                        matched3 = False
-                    # </ChoiceRegex>
-                    if matched3:
-                        state.ok()
-                        children2.extend(children6)
-                        children6.clear()
-                        trivia_pos7 = state.pos
-                        parse_trivia(state, children6)
-                    else:
-                        state.restore()
-                        state.pos = trivia_pos7
-                        matched3 = True
-                        break
-                # </Repeat>
-                if not matched3:
-                    all_ok4 = False
-            matched = all_ok4
-            # </Sequence>
+            # <ChoiceRegex>
+            if match := RE3.match(state.input, state.pos):
+                state.pos = match.end()
+                matched = True
+            else:
+                matched = False
+            # </ChoiceRegex>
         state.rule_stack.pop()
-        if state.tag_stack:
-            tag9: str | None = state.tag_stack.pop()
-        else:
-            tag9 = None
-        # Atomic rule: 'ident'
-        if matched:
-            pairs.append(Pair(state.input, pos1, state.pos, rule_frame, [], tag9,))
+        # Silent rule 'SKIP'
+        pairs.extend(children2)
         return matched
     
     return inner
     
-parse_ident = _parse_ident()
+parse_SKIP = _parse_SKIP()
 
 def parse_trivia(state: ParserState, pairs: list[Pair]) -> bool:
     if state.atomic_depth > 0:
         return True
-    with state.suppress_failures():
-        while True:
-            state.checkpoint()
-            matched = False
-            matched = parse_WHITESPACE(state, pairs)
-            if matched:
-                state.ok()
-                continue
-            state.restore()
-            if not matched:
-                break
-    return True
+    return parse_SKIP(state, pairs)
 
 _RULE_MAP: dict[str, Callable[[ParserState, list[Pair]], bool]] = {
     'EOI': parse_EOI,
@@ -1255,15 +1457,17 @@ _RULE_MAP: dict[str, Callable[[ParserState, list[Pair]], bool]] = {
     'primary': parse_primary,
     'int': parse_int,
     'ident': parse_ident,
+    'SKIP': parse_SKIP,
 }
 
-def parse(start_rule: str, text: str, *, start_pos: int = 0) -> Pairs:
+def parse(start_rule: str, text: str, *, start_pos: int = 0, arena: bool = False) -> Pairs:
     """Parse the given `text` starting from the specified `start_rule`.
 
     Args:
         start_rule: The name of the rule to start parsing from.
         text: The input string to parse.
         start_pos: The position in the input string to start parsing from (default: 0).
+        arena: If True, record the parse tree in compact parallel arrays.
 
     Returns:
         Pairs: The parse tree as a `Pairs` object.
@@ -1272,18 +1476,22 @@ def parse(start_rule: str, text: str, *, start_pos: int = 0) -> Pairs:
         KeyError: If `start_rule` is not a valid rule name.
         PestParsingError: If the input `text` cannot be parsed according to the grammar.
     """
-    state = ParserState(text, start_pos)
+    state = StacklessParserState(text, start_pos)
+    if arena:
+        state.arena = Arena(text)
     pairs: list[Pair] = []
     matched = _RULE_MAP[start_rule](state, pairs)
     if matched:
+        if state.arena is not None:
+            return state.arena.pairs(pairs)
         return Pairs(pairs)
     raise PestParsingError(state)
 
 class Parser:
     """A class wrapping `parse()` in `Parser.parse()`."""
-    def parse(self, start_rule: str, text: str, *, start_pos: int = 0) -> Pairs:
+    def parse(self, start_rule: str, text: str, *, start_pos: int = 0, arena: bool = False) -> Pairs:
         """Parse the given `text` starting from the specified `start_rule`."""
-        return parse(start_rule, text, start_pos=start_pos)
+        return parse(start_rule, text, start_pos=start_pos, arena=arena)
 
 def main() -> None:
     parser = argparse.ArgumentParser(
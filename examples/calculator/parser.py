@@ -20,11 +20,15 @@ from typing import TYPE_CHECKING
 
 import regex as re
 
+from pest.arena import Arena
 from pest.exceptions import PestParsingError
+from pest.grammar.expressions.choice import dispatch_alternatives
+from pest.grammar.expressions.choice import record_failures
 from pest.pairs import Pair
 from pest.pairs import Pairs
 from pest.state import ParserState
 from pest.state import RuleFrame
+from pest.state import StacklessParserState
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -71,7 +75,10 @@ def _parse_EOI() -> Callable[[ParserState, list[Pair]], bool]:
         else:
             tag3 = None
         if matched:
-            pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag3,))
+            if state.arena is None:
+                pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag3, state.line_index))
+            else:
+                pairs.append(state.arena.add(rule_frame, pos1, state.pos, children2, tag3))
         return matched
     
     return inner
@@ -149,7 +156,10 @@ def _parse_program() -> Callable[[ParserState, list[Pair]], bool]:
         else:
             tag5 = None
         if matched:
-            pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag5,))
+            if state.arena is None:
+                pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag5, state.line_index))
+            else:
+                pairs.append(state.arena.add(rule_frame, pos1, state.pos, children2, tag5))
         return matched
     
     return inner
@@ -157,6 +167,25 @@ def _parse_program() -> Callable[[ParserState, list[Pair]], bool]:
 parse_program = _parse_program()
 
 def _parse_expr() -> Callable[[ParserState, list[Pair]], bool]:
+    DISPATCH7 = {'(': (frozenset([1]), frozenset([1]), frozenset([0]), frozenset([0, 1, 2])), '0': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1, 2])), '1': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1, 2])), '2': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1, 2])), '3': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1, 2])), '4': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1, 2])), '5': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1, 2])), '6': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1, 2])), '7': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1, 2])), '8': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1, 2])), '9': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1, 2])), 'A': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'B': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'C': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'D': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'E': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'F': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'G': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'H': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'I': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'J': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'K': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'L': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'M': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'N': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'O': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'P': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'Q': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'R': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'S': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'T': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'U': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'V': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'W': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'X': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'Y': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'Z': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'a': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'b': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'c': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'd': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'e': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'f': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'g': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'h': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'i': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'j': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'k': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'l': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'm': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'n': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'o': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'p': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'q': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'r': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 's': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 't': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'u': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'v': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'w': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'x': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'y': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'z': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2]))}
+    DISPATCH8 = (frozenset([]), frozenset([]), frozenset([0, 1]), frozenset([0, 1, 2]))
+    FRAMES9 = {'int': RuleFrame('int', 4)}
+    LABELS13 = ((('int',), "''1''..''9''"), (('int',), "''0''..''9''"))
+    LABELS16 = (((), '"("'),)
+    DISPATCH23 = {'*': (frozenset([2]), frozenset([2]), frozenset([0, 1, 3, 4]), frozenset([0, 1, 2, 3, 4])), '+': (frozenset([0]), frozenset([0]), frozenset([1, 2, 3, 4]), frozenset([0, 1, 2, 3, 4])), '-': (frozenset([1]), frozenset([1]), frozenset([0, 2, 3, 4]), frozenset([0, 1, 2, 3, 4])), '/': (frozenset([3]), frozenset([3]), frozenset([0, 1, 2, 4]), frozenset([0, 1, 2, 3, 4])), '^': (frozenset([4]), frozenset([4]), frozenset([0, 1, 2, 3]), frozenset([0, 1, 2, 3, 4]))}
+    DISPATCH24 = (frozenset([]), frozenset([]), frozenset([0, 1, 2, 3, 4]), frozenset([0, 1, 2, 3, 4]))
+    FRAMES25 = {'add': RuleFrame('add', 0), 'div': RuleFrame('div', 0), 'mul': RuleFrame('mul', 0), 'pow': RuleFrame('pow', 0), 'sub': RuleFrame('sub', 0)}
+    LABELS29 = ((('add',), '"+"'),)
+    LABELS30 = ((('sub',), '"-"'),)
+    LABELS31 = ((('mul',), '"*"'),)
+    LABELS32 = ((('div',), '"/"'),)
+    LABELS33 = ((('pow',), '"^"'),)
+    DISPATCH36 = {'(': (frozenset([1]), frozenset([1]), frozenset([0]), frozenset([0, 1, 2])), '0': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1, 2])), '1': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1, 2])), '2': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1, 2])), '3': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1, 2])), '4': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1, 2])), '5': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1, 2])), '6': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1, 2])), '7': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1, 2])), '8': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1, 2])), '9': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1, 2])), 'A': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'B': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'C': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'D': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'E': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'F': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'G': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'H': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'I': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'J': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'K': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'L': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'M': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'N': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'O': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'P': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'Q': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'R': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'S': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'T': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'U': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'V': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'W': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'X': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'Y': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'Z': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'a': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'b': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'c': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'd': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'e': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'f': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'g': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'h': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'i': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'j': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'k': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'l': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'm': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'n': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'o': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'p': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'q': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'r': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 's': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 't': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'u': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'v': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'w': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'x': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'y': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'z': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2]))}
+    DISPATCH37 = (frozenset([]), frozenset([]), frozenset([0, 1]), frozenset([0, 1, 2]))
+    FRAMES38 = {'int': RuleFrame('int', 4)}
+    LABELS42 = ((('int',), "''1''..''9''"), (('int',), "''0''..''9''"))
+    LABELS45 = (((), '"("'),)
+    
     rule_frame = RuleFrame('expr', 0)
     
     def inner(state: ParserState, pairs: list[Pair]) -> bool:
@@ -194,79 +223,90 @@ def _parse_expr() -> Callable[[ParserState, list[Pair]], bool]:
                 parse_trivia(state, children2)
         if all_ok4:
             matched3 = False
-            # <Choice>
-            children7: list[Pair] = []
+            # <DispatchChoice>
+            children10: list[Pair] = []
             matched3 = False
+            if state.pos < len(state.input):
+                attempt11, replay12 = dispatch_alternatives(state, DISPATCH7.get(state.input[state.pos], DISPATCH8))
+            else:
+                attempt11, replay12 = dispatch_alternatives(state, DISPATCH8)
             if not matched3:
-                state.checkpoint()
-                # <Identifier>
-                matched3 = parse_int(state, children7)
-                # </Identifier>
-                if matched3:
-                    state.ok()
-                    children2.extend(children7)
-                else:
-                    state.restore()
-                    children7.clear()
+                if 0 in attempt11:
+                    state.checkpoint()
+                    # <Identifier>
+                    matched3 = parse_int(state, children10)
+                    # </Identifier>
+                    if matched3:
+                        state.ok()
+                        children2.extend(children10)
+                    else:
+                        state.restore()
+                        children10.clear()
+                elif 0 in replay12:
+                    record_failures(state, LABELS13, FRAMES9)
             if not matched3:
-                state.checkpoint()
-                # <Sequence n=3>
-                all_ok9 = True
-                if all_ok9:
-                    matched8 = False
-                    # <String>
-                    if state.input.startswith('(', state.pos):
-                        state.pos += 1
-                        matched8 = True
+                if 1 in attempt11:
+                    state.checkpoint()
+                    # <Sequence n=3>
+                    all_ok15 = True
+                    if all_ok15:
+                        matched14 = False
+                        # <String>
+                        if state.input.startswith('(', state.pos):
+                            state.pos += 1
+                            matched14 = True
+                        else:
+                            matched14 = False
+                            state.fail('"("')
+                        # </String>
+                        if not matched14:
+                            all_ok15 = False
+                        if all_ok15:
+                            parse_trivia(state, children10)
+                    if all_ok15:
+                        matched14 = False
+                        # <Identifier>
+                        matched14 = parse_expr(state, children10)
+                        # </Identifier>
+                        if not matched14:
+                            all_ok15 = False
+                        if all_ok15:
+                            parse_trivia(state, children10)
+                    if all_ok15:
+                        matched14 = False
+                        # <String>
+                        if state.input.startswith(')', state.pos):
+                            state.pos += 1
+                            matched14 = True
+                        else:
+                            matched14 = False
+                            state.fail('")"')
+                        # </String>
+                        if not matched14:
+                            all_ok15 = False
+                    matched3 = all_ok15
+                    # </Sequence>
+                    if matched3:
+                        state.ok()
+                        children2.extend(children10)
                     else:
-                        matched8 = False
-                        state.fail('"("')
-                    # </String>
-                    if not matched8:
-                        all_ok9 = False
-                    if all_ok9:
-                        parse_trivia(state, children7)
-                if all_ok9:
-                    matched8 = False
+                        state.restore()
+                        children10.clear()
+                elif 1 in replay12:
+                    record_failures(state, LABELS16, FRAMES9)
+            if not matched3:
+                if 2 in attempt11:
+                    state.checkpoint()
                     # <Identifier>
-                    matched8 = parse_expr(state, children7)
+                    matched3 = parse_ident(state, children10)
                     # </Identifier>
-                    if not matched8:
-                        all_ok9 = False
-                    if all_ok9:
-                        parse_trivia(state, children7)
-                if all_ok9:
-                    matched8 = False
-                    # <String>
-                    if state.input.startswith(')', state.pos):
-                        state.pos += 1
-                        matched8 = True
+                    if matched3:
+                        state.ok()
+                        children2.extend(children10)
                     else:
-                        matched8 = False
-                        state.fail('")"')
-                    # </String>
-                    if not matched8:
-                        all_ok9 = False
-                matched3 = all_ok9
-                # </Sequence>
-                if matched3:
-                    state.ok()
-                    children2.extend(children7)
-                else:
-                    state.restore()
-                    children7.clear()
-            if not matched3:
-                state.checkpoint()
-                # <Identifier>
-                matched3 = parse_ident(state, children7)
-                # </Identifier>
-                if matched3:
-                    state.ok()
-                    children2.extend(children7)
-                else:
-                    state.restore()
-                    children7.clear()
-            # </Choice>
+                        state.restore()
+                        children10.clear()
+            # </DispatchChoice>
             if not matched3:
                 all_ok4 = False
             if all_ok4:
@@ -274,22 +314,22 @@ def _parse_expr() -> Callable[[ParserState, list[Pair]], bool]:
         if all_ok4:
             matched3 = False
             # <Repeat>
-            trivia_pos11 = state.pos
-            children10: list[Pair] = []
+            trivia_pos18 = state.pos
+            children17: list[Pair] = []
             while True:
                 state.checkpoint()
                 # <Identifier>
-                matched3 = parse_fac(state, children10)
+                matched3 = parse_fac(state, children17)
                 # </Identifier>
                 if matched3:
                     state.ok()
-                    children2.extend(children10)
-                    children10.clear()
-                    trivia_pos11 = state.pos
-                    parse_trivia(state, children10)
+                    children2.extend(children17)
+                    children17.clear()
+                    trivia_pos18 = state.pos
+                    parse_trivia(state, children17)
                 else:
                     state.restore()
-                    state.pos = trivia_pos11
+                    state.pos = trivia_pos18
                     matched3 = True
                     break
             # </Repeat>
@@ -300,219 +340,249 @@ def _parse_expr() -> Callable[[ParserState, list[Pair]], bool]:
         if all_ok4:
             matched3 = False
             # <Repeat>
-            trivia_pos13 = state.pos
-            children12: list[Pair] = []
+            trivia_pos20 = state.pos
+            children19: list[Pair] = []
             while True:
                 state.checkpoint()
                 # <Group>
                 # <Sequence n=4>
-                all_ok15 = True
-                if all_ok15:
-                    matched14 = False
-                    # <Choice>
-                    children16: list[Pair] = []
-                    matched14 = False
-                    if not matched14:
-                        state.checkpoint()
-                        # <Identifier>
-                        matched14 = parse_add(state, children16)
-                        # </Identifier>
-                        if matched14:
-                            state.ok()
-                            children12.extend(children16)
-                        else:
-                            state.restore()
-                            children16.clear()
-                    if not matched14:
-                        state.checkpoint()
-                        # <Identifier>
-                        matched14 = parse_sub(state, children16)
-                        # </Identifier>
-                        if matched14:
-                            state.ok()
-                            children12.extend(children16)
-                        else:
-                            state.restore()
-                            children16.clear()
-                    if not matched14:
-                        state.checkpoint()
-                        # <Identifier>
-                        matched14 = parse_mul(state, children16)
-                        # </Identifier>
-                        if matched14:
-                            state.ok()
-                            children12.extend(children16)
-                        else:
-                            state.restore()
-                            children16.clear()
-                    if not matched14:
-                        state.checkpoint()
-                        # <Identifier>
-                        matched14 = parse_div(state, children16)
-                        # </Identifier>
-                        if matched14:
-                            state.ok()
-                            children12.extend(children16)
-                        else:
-                            state.restore()
-                            children16.clear()
-                    if not matched14:
-                        state.checkpoint()
-                        # <Identifier>
-                        matched14 = parse_pow(state, children16)
-                        # </Identifier>
-                        if matched14:
-                            state.ok()
-                            children12.extend(children16)
-                        else:
-                            state.restore()
-                            children16.clear()
-                    # </Choice>
-                    if not matched14:
-                        all_ok15 = False
-                    if all_ok15:
-                        parse_trivia(state, children12)
-                if all_ok15:
-                    matched14 = False
+                all_ok22 = True
+                if all_ok22:
+                    matched21 = False
+                    # <DispatchChoice>
+                    children26: list[Pair] = []
+                    matched21 = False
+                    if state.pos < len(state.input):
+                        attempt27, replay28 = dispatch_alternatives(state, DISPATCH23.get(state.input[state.pos], DISPATCH24))
+                    else:
+                        attempt27, replay28 = dispatch_alternatives(state, DISPATCH24)
+                    if not matched21:
+                        if 0 in attempt27:
+                            state.checkpoint()
+                            # <Identifier>
+                            matched21 = parse_add(state, children26)
+                            # </Identifier>
+                            if matched21:
+                                state.ok()
+                                children19.extend(children26)
+                            else:
+                                state.restore()
+                                children26.clear()
+                        elif 0 in replay28:
+                            record_failures(state, LABELS29, FRAMES25)
+                    if not matched21:
+                        if 1 in attempt27:
+                            state.checkpoint()
+                            # <Identifier>
+                            matched21 = parse_sub(state, children26)
+                            # </Identifier>
+                            if matched21:
+                                state.ok()
+                                children19.extend(children26)
+                            else:
+                                state.restore()
+                                children26.clear()
+                        elif 1 in replay28:
+                            record_failures(state, LABELS30, FRAMES25)
+                    if not matched21:
+                        if 2 in attempt27:
+                            state.checkpoint()
+                            # <Identifier>
+                            matched21 = parse_mul(state, children26)
+                            # </Identifier>
+                            if matched21:
+                                state.ok()
+                                children19.extend(children26)
+                            else:
+                                state.restore()
+                                children26.clear()
+                        elif 2 in replay28:
+                            record_failures(state, LABELS31, FRAMES25)
+                    if not matched21:
+                        if 3 in attempt27:
+                            state.checkpoint()
+                            # <Identifier>
+                            matched21 = parse_div(state, children26)
+                            # </Identifier>
+                            if matched21:
+                                state.ok()
+                                children19.extend(children26)
+                            else:
+                                state.restore()
+                                children26.clear()
+                        elif 3 in replay28:
+                            record_failures(state, LABELS32, FRAMES25)
+                    if not matched21:
+                        if 4 in attempt27:
+                            state.checkpoint()
+                            # <Identifier>
+                            matched21 = parse_pow(state, children26)
+                            # </Identifier>
+                            if matched21:
+                                state.ok()
+                                children19.extend(children26)
+                            else:
+                                state.restore()
+                                children26.clear()
+                        elif 4 in replay28:
+                            record_failures(state, LABELS33, FRAMES25)
+                    # </DispatchChoice>
+                    if not matched21:
+                        all_ok22 = False
+                    if all_ok22:
+                        parse_trivia(state, children19)
+                if all_ok22:
+                    matched21 = False
                     # <Repeat>
-                    trivia_pos18 = state.pos
-                    children17: list[Pair] = []
+                    trivia_pos35 = state.pos
+                    children34: list[Pair] = []
                     while True:
                         state.checkpoint()
                         # <Identifier>
-                        matched14 = parse_neg(state, children17)
+                        matched21 = parse_neg(state, children34)
                         # </Identifier>
-                        if matched14:
+                        if matched21:
                             state.ok()
-                            children12.extend(children17)
-                            children17.clear()
-                            trivia_pos18 = state.pos
-                            parse_trivia(state, children17)
+                            children19.extend(children34)
+                            children34.clear()
+                            trivia_pos35 = state.pos
+                            parse_trivia(state, children34)
                         else:
                             state.restore()
-                            state.pos = trivia_pos18
-                            matched14 = True
+                            state.pos = trivia_pos35
+                            matched21 = True
                             break
                     # </Repeat>
-                    if not matched14:
-                        all_ok15 = False
-                    if all_ok15:
-                        parse_trivia(state, children12)
-                if all_ok15:
-                    matched14 = False
-                    # <Choice>
-                    children19: list[Pair] = []
-                    matched14 = False
-                    if not matched14:
-                        state.checkpoint()
-                        # <Identifier>
-                        matched14 = parse_int(state, children19)
-                        # </Identifier>
-                        if matched14:
-                            state.ok()
-                            children12.extend(children19)
-                        else:
-                            state.restore()
-                            children19.clear()
-                    if not matched14:
-                        state.checkpoint()
-                        # <Sequence n=3>
-                        all_ok21 = True
-                        if all_ok21:
-                            matched20 = False
-                            # <String>
-                            if state.input.startswith('(', state.pos):
-                                state.pos += 1
-                                matched20 = True
+                    if not matched21:
+                        all_ok22 = False
+                    if all_ok22:
+                        parse_trivia(state, children19)
+                if all_ok22:
+                    matched21 = False
+                    # <DispatchChoice>
+                    children39: list[Pair] = []
+                    matched21 = False
+                    if state.pos < len(state.input):
+                        attempt40, replay41 = dispatch_alternatives(state, DISPATCH36.get(state.input[state.pos], DISPATCH37))
+                    else:
+                        attempt40, replay41 = dispatch_alternatives(state, DISPATCH37)
+                    if not matched21:
+                        if 0 in attempt40:
+                            state.checkpoint()
+                            # <Identifier>
+                            matched21 = parse_int(state, children39)
+                            # </Identifier>
+                            if matched21:
+                                state.ok()
+                                children19.extend(children39)
                             else:
-                                matched20 = False
-                                state.fail('"("')
-                            # </String>
-                            if not matched20:
-                                all_ok21 = False
-                            if all_ok21:
-                                parse_trivia(state, children19)
-                        if all_ok21:
-                            matched20 = False
+                                state.restore()
+                                children39.clear()
+                        elif 0 in replay41:
+                            record_failures(state, LABELS42, FRAMES38)
+                    if not matched21:
+                        if 1 in attempt40:
+                            state.checkpoint()
+                            # <Sequence n=3>
+                            all_ok44 = True
+                            if all_ok44:
+                                matched43 = False
+                                # <String>
+                                if state.input.startswith('(', state.pos):
+                                    state.pos += 1
+                                    matched43 = True
+                                else:
+                                    matched43 = False
+                                    state.fail('"("')
+                                # </String>
+                                if not matched43:
+                                    all_ok44 = False
+                                if all_ok44:
+                                    parse_trivia(state, children39)
+                            if all_ok44:
+                                matched43 = False
+                                # <Identifier>
+                                matched43 = parse_expr(state, children39)
+                                # </Identifier>
+                                if not matched43:
+                                    all_ok44 = False
+                                if all_ok44:
+                                    parse_trivia(state, children39)
+                            if all_ok44:
+                                matched43 = False
+                                # <String>
+                                if state.input.startswith(')', state.pos):
+                                    state.pos += 1
+                                    matched43 = True
+                                else:
+                                    matched43 = False
+                                    state.fail('")"')
+                                # </String>
+                                if not matched43:
+                                    all_ok44 = False
+                            matched21 = all_ok44
+                            # </Sequence>
+                            if matched21:
+                                state.ok()
+                                children19.extend(children39)
+                            else:
+                                state.restore()
+                                children39.clear()
+                        elif 1 in replay41:
+                            record_failures(state, LABELS45, FRAMES38)
+                    if not matched21:
+                        if 2 in attempt40:
+                            state.checkpoint()
                             # <Identifier>
-                            matched20 = parse_expr(state, children19)
+                            matched21 = parse_ident(state, children39)
                             # </Identifier>
-                            if not matched20:
-                                all_ok21 = False
-                            if all_ok21:
-                                parse_trivia(state, children19)
-                        if all_ok21:
-                            matched20 = False
-                            # <String>
-                            if state.input.startswith(')', state.pos):
-                                state.pos += 1
-                                matched20 = True
+                            if matched21:
+                                state.ok()
+                                children19.extend(children39)
                             else:
-                                matched20 = False
-                                state.fail('")"')
-                            # </String>
-                            if not matched20:
-                                all_ok21 = False
-                        matched14 = all_ok21
-                        # </Sequence>
-                        if matched14:
-                            state.ok()
-                            children12.extend(children19)
-                        else:
-                            state.restore()
-                            children19.clear()
-                    if not matched14:
-                        state.checkpoint()
-                        # <Identifier>
-                        matched14 = parse_ident(state, children19)
-                        # </Identifier>
-                        if matched14:
-                            state.ok()
-                            children12.extend(children19)
-                        else:
-                            state.restore()
-                            children19.clear()
-                    # </Choice>
-                    if not matched14:
-                        all_ok15 = False
-                    if all_ok15:
-                        parse_trivia(state, children12)
-                if all_ok15:
-                    matched14 = False
+                                state.restore()
+                                children39.clear()
+                    # </DispatchChoice>
+                    if not matched21:
+                        all_ok22 = False
+                    if all_ok22:
+                        parse_trivia(state, children19)
+                if all_ok22:
+                    matched21 = False
                     # <Repeat>
-                    trivia_pos23 = state.pos
-                    children22: list[Pair] = []
+                    trivia_pos47 = state.pos
+                    children46: list[Pair] = []
                     while True:
                         state.checkpoint()
                         # <Identifier>
-                        matched14 = parse_fac(state, children22)
+                        matched21 = parse_fac(state, children46)
                         # </Identifier>
-                        if matched14:
+                        if matched21:
                             state.ok()
-                            children12.extend(children22)
-                            children22.clear()
-                            trivia_pos23 = state.pos
-                            parse_trivia(state, children22)
+                            children19.extend(children46)
+                            children46.clear()
+                            trivia_pos47 = state.pos
+                            parse_trivia(state, children46)
                         else:
                             state.restore()
-                            state.pos = trivia_pos23
-                            matched14 = True
+                            state.pos = trivia_pos47
+                            matched21 = True
                             break
                     # </Repeat>
-                    if not matched14:
-                        all_ok15 = False
-                matched3 = all_ok15
+                    if not matched21:
+                        all_ok22 = False
+                matched3 = all_ok22
                 # </Sequence>
                 # </Group>
                 if matched3:
                     state.ok()
-                    children2.extend(children12)
-                    children12.clear()
-                    trivia_pos13 = state.pos
-                    parse_trivia(state, children12)
+                    children2.extend(children19)
+                    children19.clear()
+                    trivia_pos20 = state.pos
+                    parse_trivia(state, children19)
                 else:
                     state.restore()
-                    state.pos = trivia_pos13
+                    state.pos = trivia_pos20
                     matched3 = True
                     break
             # </Repeat>
@@ -522,11 +592,14 @@ def _parse_expr() -> Callable[[ParserState, list[Pair]], bool]:
         # </Sequence>
         state.rule_stack.pop()
         if state.tag_stack:
-            tag24: str | None = state.tag_stack.pop()
+            tag48: str | None = state.tag_stack.pop()
         else:
-            tag24 = None
+            tag48 = None
         if matched:
-            pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag24,))
+            if state.arena is None:
+                pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag48, state.line_index))
+            else:
+                pairs.append(state.arena.add(rule_frame, pos1, state.pos, children2, tag48))
         return matched
     
     return inner
@@ -534,71 +607,99 @@ def _parse_expr() -> Callable[[ParserState, list[Pair]], bool]:
 parse_expr = _parse_expr()
 
 def _parse_infix() -> Callable[[ParserState, list[Pair]], bool]:
+    DISPATCH3 = {'*': (frozenset([2]), frozenset([2]), frozenset([0, 1, 3, 4]), frozenset([0, 1, 2, 3, 4])), '+': (frozenset([0]), frozenset([0]), frozenset([1, 2, 3, 4]), frozenset([0, 1, 2, 3, 4])), '-': (frozenset([1]), frozenset([1]), frozenset([0, 2, 3, 4]), frozenset([0, 1, 2, 3, 4])), '/': (frozenset([3]), frozenset([3]), frozenset([0, 1, 2, 4]), frozenset([0, 1, 2, 3, 4])), '^': (frozenset([4]), frozenset([4]), frozenset([0, 1, 2, 3]), frozenset([0, 1, 2, 3, 4]))}
+    DISPATCH4 = (frozenset([]), frozenset([]), frozenset([0, 1, 2, 3, 4]), frozenset([0, 1, 2, 3, 4]))
+    FRAMES5 = {'add': RuleFrame('add', 0), 'div': RuleFrame('div', 0), 'mul': RuleFrame('mul', 0), 'pow': RuleFrame('pow', 0), 'sub': RuleFrame('sub', 0)}
+    LABELS9 = ((('add',), '"+"'),)
+    LABELS10 = ((('sub',), '"-"'),)
+    LABELS11 = ((('mul',), '"*"'),)
+    LABELS12 = ((('div',), '"/"'),)
+    LABELS13 = ((('pow',), '"^"'),)
+    
     rule_frame = RuleFrame('infix', 2)
     
     def inner(state: ParserState, pairs: list[Pair]) -> bool:
         """Parse infix."""
         state.rule_stack.push(rule_frame)
         children2: list[Pair] = []
-        # <Choice>
-        children3: list[Pair] = []
+        # <DispatchChoice>
+        children6: list[Pair] = []
         matched = False
+        if state.pos < len(state.input):
+            attempt7, replay8 = dispatch_alternatives(state, DISPATCH3.get(state.input[state.pos], DISPATCH4))
+        else:
+            attempt7, replay8 = dispatch_alternatives(state, DISPATCH4)
         if not matched:
-            state.checkpoint()
-            # <Identifier>
-            matched = parse_add(state, children3)
-            # </Identifier>
-            if matched:
-                state.ok()
-                children2.extend(children3)
-            else:
-                state.restore()
-                children3.clear()
+            if 0 in attempt7:
+                state.checkpoint()
+                # <Identifier>
+                matched = parse_add(state, children6)
+                # </Identifier>
+                if matched:
+                    state.ok()
+                    children2.extend(children6)
+                else:
+                    state.restore()
+                    children6.clear()
+            elif 0 in replay8:
+                record_failures(state, LABELS9, FRAMES5)
         if not matched:
-            state.checkpoint()
-            # <Identifier>
-            matched = parse_sub(state, children3)
-            # </Identifier>
-            if matched:
-                state.ok()
-                children2.extend(children3)
-            else:
-                state.restore()
-                children3.clear()
+            if 1 in attempt7:
+                state.checkpoint()
+                # <Identifier>
+                matched = parse_sub(state, children6)
+                # </Identifier>
+                if matched:
+                    state.ok()
+                    children2.extend(children6)
+                else:
+                    state.restore()
+                    children6.clear()
+            elif 1 in replay8:
+                record_failures(state, LABELS10, FRAMES5)
         if not matched:
-            state.checkpoint()
-            # <Identifier>
-            matched = parse_mul(state, children3)
-            # </Identifier>
-            if matched:
-                state.ok()
-                children2.extend(children3)
-            else:
-                state.restore()
-                children3.clear()
+            if 2 in attempt7:
+                state.checkpoint()
+                # <Identifier>
+                matched = parse_mul(state, children6)
+                # </Identifier>
+                if matched:
+                    state.ok()
+                    children2.extend(children6)
+                else:
+                    state.restore()
+                    children6.clear()
+            elif 2 in replay8:
+                record_failures(state, LABELS11, FRAMES5)
         if not matched:
-            state.checkpoint()
-            # <Identifier>
-            matched = parse_div(state, children3)
-            # </Identifier>
-            if matched:
-                state.ok()
-                children2.extend(children3)
-            else:
-                state.restore()
-                children3.clear()
+            if 3 in attempt7:
+                state.checkpoint()
+                # <Identifier>
+                matched = parse_div(state, children6)
+                # </Identifier>
+                if matched:
+                    state.ok()
+                    children2.extend(children6)
+                else:
+                    state.restore()
+                    children6.clear()
+            elif 3 in replay8:
+                record_failures(state, LABELS12, FRAMES5)
         if not matched:
-            state.checkpoint()
-            # <Identifier>
-            matched = parse_pow(state, children3)
-            # </Identifier>
-            if matched:
-                state.ok()
-                children2.extend(children3)
-            else:
-                state.restore()
-                children3.clear()
-        # </Choice>
+            if 4 in attempt7:
+                state.checkpoint()
+                # <Identifier>
+                matched = parse_pow(state, children6)
+                # </Identifier>
+                if matched:
+                    state.ok()
+                    children2.extend(children6)
+                else:
+                    state.restore()
+                    children6.clear()
+            elif 4 in replay8:
+                record_failures(state, LABELS13, FRAMES5)
+        # </DispatchChoice>
         state.rule_stack.pop()
         # Silent rule 'infix'
         pairs.extend(children2)
@@ -630,7 +731,10 @@ def _parse_add() -> Callable[[ParserState, list[Pair]], bool]:
         else:
             tag3 = None
         if matched:
-            pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag3,))
+            if state.arena is None:
+                pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag3, state.line_index))
+            else:
+                pairs.append(state.arena.add(rule_frame, pos1, state.pos, children2, tag3))
         return matched
     
     return inner
@@ -659,7 +763,10 @@ def _parse_sub() -> Callable[[ParserState, list[Pair]], bool]:
         else:
             tag3 = None
         if matched:
-            pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag3,))
+            if state.arena is None:
+                pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag3, state.line_index))
+            else:
+                pairs.append(state.arena.add(rule_frame, pos1, state.pos, children2, tag3))
         return matched
     
     return inner
@@ -688,7 +795,10 @@ def _parse_mul() -> Callable[[ParserState, list[Pair]], bool]:
         else:
             tag3 = None
         if matched:
-            pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag3,))
+            if state.arena is None:
+                pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag3, state.line_index))
+            else:
+                pairs.append(state.arena.add(rule_frame, pos1, state.pos, children2, tag3))
         return matched
     
     return inner
@@ -717,7 +827,10 @@ def _parse_div() -> Callable[[ParserState, list[Pair]], bool]:
         else:
             tag3 = None
         if matched:
-            pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag3,))
+            if state.arena is None:
+                pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag3, state.line_index))
+            else:
+                pairs.append(state.arena.add(rule_frame, pos1, state.pos, children2, tag3))
         return matched
     
     return inner
@@ -746,7 +859,10 @@ def _parse_pow() -> Callable[[ParserState, list[Pair]], bool]:
         else:
             tag3 = None
         if matched:
-            pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag3,))
+            if state.arena is None:
+                pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag3, state.line_index))
+            else:
+                pairs.append(state.arena.add(rule_frame, pos1, state.pos, children2, tag3))
         return matched
     
     return inner
@@ -794,7 +910,10 @@ def _parse_neg() -> Callable[[ParserState, list[Pair]], bool]:
         else:
             tag3 = None
         if matched:
-            pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag3,))
+            if state.arena is None:
+                pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag3, state.line_index))
+            else:
+                pairs.append(state.arena.add(rule_frame, pos1, state.pos, children2, tag3))
         return matched
     
     return inner
@@ -842,7 +961,10 @@ def _parse_fac() -> Callable[[ParserState, list[Pair]], bool]:
         else:
             tag3 = None
         if matched:
-            pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag3,))
+            if state.arena is None:
+                pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag3, state.line_index))
+            else:
+                pairs.append(state.arena.add(rule_frame, pos1, state.pos, children2, tag3))
         return matched
     
     return inner
@@ -850,85 +972,102 @@ def _parse_fac() -> Callable[[ParserState, list[Pair]], bool]:
 parse_fac = _parse_fac()
 
 def _parse_primary() -> Callable[[ParserState, list[Pair]], bool]:
+    DISPATCH3 = {'(': (frozenset([1]), frozenset([1]), frozenset([0]), frozenset([0, 1, 2])), '0': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1, 2])), '1': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1, 2])), '2': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1, 2])), '3': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1, 2])), '4': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1, 2])), '5': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1, 2])), '6': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1, 2])), '7': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1, 2])), '8': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1, 2])), '9': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1, 2])), 'A': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'B': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'C': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'D': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'E': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'F': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'G': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'H': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'I': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'J': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'K': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'L': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'M': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'N': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'O': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'P': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'Q': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'R': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'S': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'T': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'U': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'V': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'W': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'X': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'Y': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'Z': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'a': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'b': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'c': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'd': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'e': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'f': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'g': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'h': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'i': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'j': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'k': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'l': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'm': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'n': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'o': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'p': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'q': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'r': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 's': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 't': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'u': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'v': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'w': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'x': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'y': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'z': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2]))}
+    DISPATCH4 = (frozenset([]), frozenset([]), frozenset([0, 1]), frozenset([0, 1, 2]))
+    FRAMES5 = {'int': RuleFrame('int', 4)}
+    LABELS9 = ((('int',), "''1''..''9''"), (('int',), "''0''..''9''"))
+    LABELS12 = (((), '"("'),)
+    
     rule_frame = RuleFrame('primary', 2)
     
     def inner(state: ParserState, pairs: list[Pair]) -> bool:
         """Parse primary."""
         state.rule_stack.push(rule_frame)
         children2: list[Pair] = []
-        # <Choice>
-        children3: list[Pair] = []
+        # <DispatchChoice>
+        children6: list[Pair] = []
         matched = False
+        if state.pos < len(state.input):
+            attempt7, replay8 = dispatch_alternatives(state, DISPATCH3.get(state.input[state.pos], DISPATCH4))
+        else:
+            attempt7, replay8 = dispatch_alternatives(state, DISPATCH4)
         if not matched:
-            state.checkpoint()
-            # <Identifier>
-            matched = parse_int(state, children3)
-            # </Identifier>
-            if matched:
-                state.ok()
-                children2.extend(children3)
-            else:
-                state.restore()
-                children3.clear()
+            if 0 in attempt7:
+                state.checkpoint()
+                # <Identifier>
+                matched = parse_int(state, children6)
+                # </Identifier>
+                if matched:
+                    state.ok()
+                    children2.extend(children6)
+                else:
+                    state.restore()
+                    children6.clear()
+            elif 0 in replay8:
+                record_failures(state, LABELS9, FRAMES5)
         if not matched:
-            state.checkpoint()
-            # <Sequence n=3>
-            all_ok5 = True
-            if all_ok5:
-                matched4 = False
-                # <String>
-                if state.input.startswith('(', state.pos):
-                    state.pos += 1
-                    matched4 = True
+            if 1 in attempt7:
+                state.checkpoint()
+                # <Sequence n=3>
+                all_ok11 = True
+                if all_ok11:
+                    matched10 = False
+                    # <String>
+                    if state.input.startswith('(', state.pos):
+                        state.pos += 1
+                        matched10 = True
+                    else:
+                        matched10 = False
+                        state.fail('"("')
+                    # </String>
+                    if not matched10:
+                        all_ok11 = False
+                    if all_ok11:
+                        parse_trivia(state, children6)
+                if all_ok11:
+                    matched10 = False
+                    # <Identifier>
+                    matched10 = parse_expr(state, children6)
+                    # </Identifier>
+                    if not matched10:
+                        all_ok11 = False
+                    if all_ok11:
+                        parse_trivia(state, children6)
+                if all_ok11:
+                    matched10 = False
+                    # <String>
+                    if state.input.startswith(')', state.pos):
+                        state.pos += 1
+                        matched10 = True
+                    else:
+                        matched10 = False
+                        state.fail('")"')
+                    # </String>
+                    if not matched10:
+                        all_ok11 = False
+                matched = all_ok11
+                # </Sequence>
+                if matched:
+                    state.ok()
+                    children2.extend(children6)
                 else:
-                    matched4 = False
-                    state.fail('"("')
-                # </String>
-                if not matched4:
-                    all_ok5 = False
-                if all_ok5:
-                    parse_trivia(state, children3)
-            if all_ok5:
-                matched4 = False
+                    state.restore()
+                    children6.clear()
+            elif 1 in replay8:
+                record_failures(state, LABELS12, FRAMES5)
+        if not matched:
+            if 2 in attempt7:
+                state.checkpoint()
                 # <Identifier>
-                matched4 = parse_expr(state, children3)
+                matched = parse_ident(state, children6)
                 # </Identifier>
-                if not matched4:
-                    all_ok5 = False
-                if all_ok5:
-                    parse_trivia(state, children3)
-            if all_ok5:
-                matched4 = False
-                # <String>
-                if state.input.startswith(')', state.pos):
-                    state.pos += 1
-                    matched4 = True
+                if matched:
+                    state.ok()
+                    children2.extend(children6)
                 else:
-                    matched4 = False
-                    state.fail('")"')
-                # </String>
-                if not matched4:
-                    all_ok5 = False
-            matched = all_ok5
-            # </Sequence>
-            if matched:
-                state.ok()
-                children2.extend(children3)
-            else:
-                state.restore()
-                children3.clear()
-        if not matched:
-            state.checkpoint()
-            # <Identifier>
-            matched = parse_ident(state, children3)
-            # </Identifier>
-            if matched:
-                state.ok()
-                children2.extend(children3)
-            else:
-                state.restore()
-                children3.clear()
-        # </Choice>
+                    state.restore()
+                    children6.clear()
+        # </DispatchChoice>
         state.rule_stack.pop()
         # Silent rule 'primary'
         pairs.extend(children2)
@@ -939,10 +1078,15 @@ def _parse_primary() -> Callable[[ParserState, list[Pair]], bool]:
 parse_primary = _parse_primary()
 
 def _parse_int() -> Callable[[ParserState, list[Pair]], bool]:
-    RE6 = re.compile('[1-9]', re.I)
-    RE9 = re.compile('[0-9]', re.I)
-    RE12 = re.compile('[0-9]', re.I)
-    RE13 = re.compile('[0-9]', re.I)
+    RE3 = re.compile('(?>[1-9][0-9](?:[0-9])*+|[0-9])', re.VERSION1)
+    DISPATCH4 = {'0': (frozenset([1]), frozenset([1]), frozenset([0]), frozenset([0, 1])), '1': (frozenset([0, 1]), frozenset([0, 1]), frozenset([]), frozenset([0, 1])), '2': (frozenset([0, 1]), frozenset([0, 1]), frozenset([]), frozenset([0, 1])), '3': (frozenset([0, 1]), frozenset([0, 1]), frozenset([]), frozenset([0, 1])), '4': (frozenset([0, 1]), frozenset([0, 1]), frozenset([]), frozenset([0, 1])), '5': (frozenset([0, 1]), frozenset([0, 1]), frozenset([]), frozenset([0, 1])), '6': (frozenset([0, 1]), frozenset([0, 1]), frozenset([]), frozenset([0, 1])), '7': (frozenset([0, 1]), frozenset([0, 1]), frozenset([]), frozenset([0, 1])), '8': (frozenset([0, 1]), frozenset([0, 1]), frozenset([]), frozenset([0, 1])), '9': (frozenset([0, 1]), frozenset([0, 1]), frozenset([]), frozenset([0, 1]))}
+    DISPATCH5 = (frozenset([]), frozenset([]), frozenset([0, 1]), frozenset([0, 1]))
+    RE11 = re.compile('[1-9]')
+    RE14 = re.compile('[0-9]')
+    RE17 = re.compile('[0-9]')
+    LABELS18 = (((), "''1''..''9''"),)
+    RE19 = re.compile('[0-9]')
+    LABELS20 = (((), "''0''..''9''"),)
     
     rule_frame = RuleFrame('int', 4)
     
@@ -954,112 +1098,133 @@ def _parse_int() -> Callable[[ParserState, list[Pair]], bool]:
         with state.atomic_checkpoint():
             state.atomic_depth += 1
             # <Group>
-            # <Choice>
-            children3: list[Pair] = []
-            matched = False
-            if not matched:
-                state.checkpoint()
-                # <Sequence n=2>
-                all_ok5 = True
-                if all_ok5:
-                    matched4 = False
-                    # <Range>
-                    if match := RE6.match(state.input, state.pos):
-                        state.pos = match.end()
-                        matched4 = True
-                    else:
-                        matched4 = False
-                        state.fail("''1''..''9''")
-                    # </Range>
-                    if not matched4:
-                        all_ok5 = False
-                    if all_ok5:
-                        parse_trivia(state, children3)
-                if all_ok5:
-                    matched4 = False
-                    # <Sequence n=2>
-                    all_ok8 = True
-                    if all_ok8:
-                        matched7 = False
+            # <AtomicRegex>
+            if match := RE3.match(state.input, state.pos):
+                state.pos = match.end()
+                matched = True
+            elif state.track_failures:
+                # <DispatchChoice>
+                children6: list[Pair] = []
+                matched = False
+                if state.pos < len(state.input):
+                    attempt7, replay8 = dispatch_alternatives(state, DISPATCH4.get(state.input[state.pos], DISPATCH5))
+                else:
+                    attempt7, replay8 = dispatch_alternatives(state, DISPATCH5)
+                if not matched:
+                    if 0 in attempt7:
+                        state.checkpoint()
+                        # <Sequence n=2>
+                        all_ok10 = True
+                        if all_ok10:
+                            matched9 = False
+                            # <Range>
+                            if match := RE11.match(state.input, state.pos):
+                                state.pos = match.end()
+                                matched9 = True
+                            else:
+                                matched9 = False
+                                state.fail("''1''..''9''")
+                            # </Range>
+                            if not matched9:
+                                all_ok10 = False
+                            if all_ok10:
+                                parse_trivia(state, children6)
+                        if all_ok10:
+                            matched9 = False
+                            # <Sequence n=2>
+                            all_ok13 = True
+                            if all_ok13:
+                                matched12 = False
+                                # <Range>
+                                if match := RE14.match(state.input, state.pos):
+                                    state.pos = match.end()
+                                    matched12 = True
+                                else:
+                                    matched12 = False
+                                    state.fail("''0''..''9''")
+                                # </Range>
+                                if not matched12:
+                                    all_ok13 = False
+                                if all_ok13:
+                                    parse_trivia(state, children6)
+                            if all_ok13:
+                                matched12 = False
+                                # <Repeat>
+                                trivia_pos16 = state.pos
+                                children15: list[Pair] = []
+                                while True:
+                                    state.checkpoint()
+                                    # <Range>
+                                    if match := RE17.match(state.input, state.pos):
+                                        state.pos = match.end()
+                                        matched12 = True
+                                    else:
+                                        matched12 = False
+                                        state.fail("''0''..''9''")
+                                    # </Range>
+                                    if matched12:
+                                        state.ok()
+                                        children6.extend(children15)
+                                        children15.clear()
+                                        trivia_pos16 = state.pos
+                                        parse_trivia(state, children15)
+                                    else:
+                                        state.restore()
+                                        state.pos = trivia_pos16
+                                        matched12 = True
+                                        break
+                                # </Repeat>
+                                if not matched12:
+                                    all_ok13 = False
+                            matched9 = all_ok13
+                            # </Sequence>
+                            if not matched9:
+                                all_ok10 = False
+                        matched = all_ok10
+                        # </Sequence>
+                        if matched:
+                            state.ok()
+                            children2.extend(children6)
+                        else:
+                            state.restore()
+                            children6.clear()
+                    elif 0 in replay8:
+                        record_failures(state, LABELS18)
+                if not matched:
+                    if 1 in attempt7:
+                        state.checkpoint()
                         # <Range>
-                        if match := RE9.match(state.input, state.pos):
+                        if match := RE19.match(state.input, state.pos):
                             state.pos = match.end()
-                            matched7 = True
+                            matched = True
                         else:
-                            matched7 = False
+                            matched = False
                             state.fail("''0''..''9''")
                         # </Range>
-                        if not matched7:
-                            all_ok8 = False
-                        if all_ok8:
-                            parse_trivia(state, children3)
-                    if all_ok8:
-                        matched7 = False
-                        # <Repeat>
-                        trivia_pos11 = state.pos
-                        children10: list[Pair] = []
-                        while True:
-                            state.checkpoint()
-                            # <Range>
-                            if match := RE12.match(state.input, state.pos):
-                                state.pos = match.end()
-                                matched7 = True
-                            else:
-                                matched7 = False
-                                state.fail("''0''..''9''")
-                            # </Range>
-                            if matched7:
-                                state.ok()
-                                children3.extend(children10)
-                                children10.clear()
-                                trivia_pos11 = state.pos
-                                parse_trivia(state, children10)
-                            else:
-                                state.restore()
-                                state.pos = trivia_pos11
-                                matched7 = True
-                                break
-                        # </Repeat>
-                        if not matched7:
-                            all_ok8 = False
-                    matched4 = all_ok8
-                    # </Sequence>
-                    if not matched4:
-                        all_ok5 = False
-                matched = all_ok5
-                # </Sequence>
-                if matched:
-                    state.ok()
-                    children2.extend(children3)
-                else:
-                    state.restore()
-                    children3.clear()
-            if not matched:
-                state.checkpoint()
-                # <Range>
-                if match := RE13.match(state.input, state.pos):
-                    state.pos = match.end()
-                    matched = True
-                else:
-                    matched = False
-                    state.fail("''0''..''9''")
-                # </Range>
-                if matched:
-                    state.ok()
-                    children2.extend(children3)
-                else:
-                    state.restore()
-                    children3.clear()
-            # </Choice>
+                        if matched:
+                            state.ok()
+                            children2.extend(children6)
+                        else:
+                            state.restore()
+                            children6.clear()
+                    elif 1 in replay8:
+                        record_failures(state, LABELS20)
+                # </DispatchChoice>
+            else:
+                matched = False
+            # </AtomicRegex>
             # </Group>
         state.rule_stack.pop()
         if state.tag_stack:
-            tag14: str | None = state.tag_stack.pop()
+            tag21: str | None = state.tag_stack.pop()
         else:
-            tag14 = None
+            tag21 = None
         # Atomic rule: 'int'
         if matched:
-            pairs.append(Pair(state.input, pos1, state.pos, rule_frame, [], tag14,))
+            if state.arena is None:
+                pairs.append(Pair(state.input, pos1, state.pos, rule_frame, [], tag21, state.line_index))
+            else:
+                pairs.append(state.arena.add(rule_frame, pos1, state.pos, [], tag21))
         return matched
     
     return inner
@@ -1067,8 +1232,9 @@ def _parse_int() -> Callable[[ParserState, list[Pair]], bool]:
 parse_int = _parse_int()
 
 def _parse_ident() -> Callable[[ParserState, list[Pair]], bool]:
-    RE5 = re.compile('[A-Za-z]', re.VERSION1)
-    RE8 = re.compile('[A-Za-z]', re.VERSION1)
+    RE3 = re.compile('(?>[A-Za-z])(?:(?>[A-Za-z]))*+', re.VERSION1)
+    RE6 = re.compile('[A-Za-z]', re.VERSION1)
+    RE9 = re.compile('[A-Za-z]', re.VERSION1)
     
     rule_frame = RuleFrame('ident', 4)
     
@@ -1079,59 +1245,70 @@ def _parse_ident() -> Callable[[ParserState, list[Pair]], bool]:
         children2: list[Pair] = []
         with state.atomic_checkpoint():
             state.atomic_depth += 1
-            # <Sequence n=2>
-            all_ok4 = True
-            if all_ok4:
-                matched3 = False
-                # <ChoiceRegex>
-                if match := RE5.match(state.input, state.pos):
-                    state.pos = match.end()
-                    matched3 = True
-                else:
-                    matched3 = False
-                # </ChoiceRegex>
-                if not matched3:
-                    all_ok4 = False
-                if all_ok4:
-                    parse_trivia(state, children2)
-            if all_ok4:
-                matched3 = False
-                # <Repeat>
-                trivia_pos7 = state.pos
-                children6: list[Pair] = []
-                while True:
-                    state.checkpoint()
+            # <AtomicRegex>
+            if match := RE3.match(state.input, state.pos):
+                state.pos = match.end()
+                matched = True
+            elif state.track_failures:
+                # <Sequence n=2>
+                all_ok5 = True
+                if all_ok5:
+                    matched4 = False
                     # <ChoiceRegex>
-                    if match := RE8.match(state.input, state.pos):
+                    if match := RE6.match(state.input, state.pos):
                         state.pos = match.end()
-                        matched3 = True
+                        matched4 = True
                     else:
-                        matched3 = False
+                        matched4 = False
                     # </ChoiceRegex>
-                    if matched3:
-                        state.ok()
-                        children2.extend(children6)
-                        children6.clear()
-                        trivia_pos7 = state.pos
-                        parse_trivia(state, children6)
-                    else:
-                        state.restore()
-                        state.pos = trivia_pos7
-                        matched3 = True
-                        break
-                # </Repeat>
-                if not matched3:
-                    all_ok4 = False
-            matched = all_ok4
-            # </Sequence>
+                    if not matched4:
+                        all_ok5 = False
+                    if all_ok5:
+                        parse_trivia(state, children2)
+                if all_ok5:
+                    matched4 = False
+                    # <Repeat>
+                    trivia_pos8 = state.pos
+                    children7: list[Pair] = []
+                    while True:
+                        state.checkpoint()
+                        # <ChoiceRegex>
+                        if match := RE9.match(state.input, state.pos):
+                            state.pos = match.end()
+                            matched4 = True
+                        else:
+                            matched4 = False
+                        # </ChoiceRegex>
+                        if matched4:
+                            state.ok()
+                            children2.extend(children7)
+                            children7.clear()
+                            trivia_pos8 = state.pos
+                            parse_trivia(state, children7)
+                        else:
+                            state.restore()
+                            state.pos = trivia_pos8
+                            matched4 = True
+                            break
+                    # </Repeat>
+                    if not matched4:
+                        all_ok5 = False
+                matched = all_ok5
+                # </Sequence>
+            else:
+                matched = False
+            # </AtomicRegex>
         state.rule_stack.pop()
         if state.tag_stack:
-            tag9: str | None = state.tag_stack.pop()
+            tag10: str | None = state.tag_stack.pop()
         else:
-            tag9 = None
+            tag10 = None
         # Atomic rule: 'ident'
         if matched:
-            pairs.append(Pair(state.input, pos1, state.pos, rule_frame, [], tag9,))
+            if state.arena is None:
+                pairs.append(Pair(state.input, pos1, state.pos, rule_frame, [], tag10, state.line_index))
+            else:
+                pairs.append(state.arena.add(rule_frame, pos1, state.pos, [], tag10))
         return matched
     
     return inner
@@ -1191,13 +1368,14 @@ _RULE_MAP: dict[str, Callable[[ParserState, list[Pair]], bool]] = {
     'SKIP': parse_SKIP,
 }
 
-def parse(start_rule: str, text: str, *, start_pos: int = 0) -> Pairs:
+def parse(start_rule: str, text: str, *, start_pos: int = 0, arena: bool = False) -> Pairs:
     """Parse the given `text` starting from the specified `start_rule`.
 
     Args:
         start_rule: The name of the rule to start parsing from.
         text: The input string to parse.
         start_pos: The position in the input string to start parsing from (default: 0).
+        arena: If True, record the parse tree in compact parallel arrays.
 
     Returns:
         Pairs: The parse tree as a `Pairs` object.
@@ -1206,18 +1384,22 @@ def parse(start_rule: str, text: str, *, start_pos: int = 0) -> Pairs:
         KeyError: If `start_rule` is not a valid rule name.
         PestParsingError: If the input `text` cannot be parsed according to the grammar.
     """
-    state = ParserState(text, start_pos)
+    state = StacklessParserState(text, start_pos)
+    if arena:
+        state.arena = Arena(text)
     pairs: list[Pair] = []
     matched = _RULE_MAP[start_rule](state, pairs)
     if matched:
+        if state.arena is not None:
+            return state.arena.pairs(pairs)
         return Pairs(pairs)
     raise PestParsingError(state)
 
 class Parser:
     """A class wrapping `parse()` in `Parser.parse()`."""
-    def parse(self, start_rule: str, text: str, *, start_pos: int = 0) -> Pairs:
+    def parse(self, start_rule: str, text: str, *, start_pos: int = 0, arena: bool = False) -> Pairs:
         """Parse the given `text` starting from the specified `start_rule`."""
-        return parse(start_rule, text, start_pos=start_pos)
+        return parse(start_rule, text, start_pos=start_pos, arena=arena)
 
 def main() -> None:
     parser = argparse.ArgumentParser(
@@ -20,11 +20,15 @@ from typing import TYPE_CHECKING
 
 import regex as re
 
+from pest.arena import Arena
 from pest.exceptions import PestParsingError
+from pest.grammar.expressions.choice import dispatch_alternatives
+from pest.grammar.expressions.choice import record_failures
 from pest.pairs import Pair
 from pest.pairs import Pairs
 from pest.state import ParserState
 from pest.state import RuleFrame
+from pest.state import StacklessParserState
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -121,7 +125,10 @@ def _parse_EOI() -> Callable[[ParserState, list[Pair]], bool]:
         else:
             tag3 = None
         if matched:
-            pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag3,))
+            if state.arena is None:
+                pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag3, state.line_index))
+            else:
+                pairs.append(state.arena.add(rule_frame, pos1, state.pos, children2, tag3))
         return matched
     
     return inner
@@ -269,6 +276,12 @@ def _parse_jsonpath_query() -> Callable[[ParserState, list[Pair]], bool]:
 parse_jsonpath_query = _parse_jsonpath_query()
 
 def _parse_segments() -> Callable[[ParserState, list[Pair]], bool]:
+    DISPATCH9 = {'.': (frozenset([0, 1]), frozenset([0, 1]), frozenset([]), frozenset([0, 1])), '[': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1]))}
+    DISPATCH10 = (frozenset([]), frozenset([]), frozenset([0, 1]), frozenset([0, 1]))
+    FRAMES11 = {'bracketed_selection': RuleFrame('bracketed_selection', 0), 'child_segment': RuleFrame('child_segment', 0), 'descendant_segment': RuleFrame('descendant_segment', 0)}
+    LABELS15 = ((('child_segment', 'bracketed_selection'), '"["'), (('child_segment',), '"."'))
+    LABELS16 = ((('descendant_segment',), '".."'),)
+    
     rule_frame = RuleFrame('segments', 2)
     
     def inner(state: ParserState, pairs: list[Pair]) -> bool:
@@ -311,32 +324,42 @@ def _parse_segments() -> Callable[[ParserState, list[Pair]], bool]:
                     parse_trivia(state, children3)
             if all_ok6:
                 matched5 = False
-                # <Choice>
-                children9: list[Pair] = []
+                # <DispatchChoice>
+                children12: list[Pair] = []
                 matched5 = False
+                if state.pos < len(state.input):
+                    attempt13, replay14 = dispatch_alternatives(state, DISPATCH9.get(state.input[state.pos], DISPATCH10))
+                else:
+                    attempt13, replay14 = dispatch_alternatives(state, DISPATCH10)
                 if not matched5:
-                    state.checkpoint()
-                    # <Identifier>
-                    matched5 = parse_child_segment(state, children9)
-                    # </Identifier>
-                    if matched5:
-                        state.ok()
-                        children3.extend(children9)
-                    else:
-                        state.restore()
-                        children9.clear()
+                    if 0 in attempt13:
+                        state.checkpoint()
+                        # <Identifier>
+                        matched5 = parse_child_segment(state, children12)
+                        # </Identifier>
+                        if matched5:
+                            state.ok()
+                            children3.extend(children12)
+                        else:
+                            state.restore()
+                            children12.clear()
+                    elif 0 in replay14:
+                        record_failures(state, LABELS15, FRAMES11)
                 if not matched5:
-                    state.checkpoint()
-                    # <Identifier>
-                    matched5 = parse_descendant_segment(state, children9)
-                    # </Identifier>
-                    if matched5:
-                        state.ok()
-                        children3.extend(children9)
-                    else:
-                        state.restore()
-                        children9.clear()
-                # </Choice>
+                    if 1 in attempt13:
+                        state.checkpoint()
+                        # <Identifier>
+                        matched5 = parse_descendant_segment(state, children12)
+                        # </Identifier>
+                        if matched5:
+                            state.ok()
+                            children3.extend(children12)
+                        else:
+                            state.restore()
+                            children12.clear()
+                    elif 1 in replay14:
+                        record_failures(state, LABELS16, FRAMES11)
+                # </DispatchChoice>
                 if not matched5:
                     all_ok6 = False
             matched = all_ok6
@@ -455,71 +478,99 @@ def _parse_root_identifier() -> Callable[[ParserState, list[Pair]], bool]:
 parse_root_identifier = _parse_root_identifier()
 
 def _parse_selector() -> Callable[[ParserState, list[Pair]], bool]:
+    DISPATCH3 = {'"': (frozenset([0]), frozenset([0]), frozenset([1, 2, 3, 4]), frozenset([0, 1, 2, 3, 4])), "'": (frozenset([0]), frozenset([0]), frozenset([1, 2, 3, 4]), frozenset([0, 1, 2, 3, 4])), '*': (frozenset([1]), frozenset([1]), frozenset([0, 2, 3, 4]), frozenset([0, 1, 2, 3, 4])), '-': (frozenset([2, 3]), frozenset([2, 3]), frozenset([0, 1, 4]), frozenset([0, 1, 2, 3, 4])), '0': (frozenset([2, 3]), frozenset([2, 3]), frozenset([0, 1, 4]), frozenset([0, 1, 2, 3, 4])), '1': (frozenset([2, 3]), frozenset([2, 3]), frozenset([0, 1, 4]), frozenset([0, 1, 2, 3, 4])), '2': (frozenset([2, 3]), frozenset([2, 3]), frozenset([0, 1, 4]), frozenset([0, 1, 2, 3, 4])), '3': (frozenset([2, 3]), frozenset([2, 3]), frozenset([0, 1, 4]), frozenset([0, 1, 2, 3, 4])), '4': (frozenset([2, 3]), frozenset([2, 3]), frozenset([0, 1, 4]), frozenset([0, 1, 2, 3, 4])), '5': (frozenset([2, 3]), frozenset([2, 3]), frozenset([0, 1, 4]), frozenset([0, 1, 2, 3, 4])), '6': (frozenset([2, 3]), frozenset([2, 3]), frozenset([0, 1, 4]), frozenset([0, 1, 2, 3, 4])), '7': (frozenset([2, 3]), frozenset([2, 3]), frozenset([0, 1, 4]), frozenset([0, 1, 2, 3, 4])), '8': (frozenset([2, 3]), frozenset([2, 3]), frozenset([0, 1, 4]), frozenset([0, 1, 2, 3, 4])), '9': (frozenset([2, 3]), frozenset([2, 3]), frozenset([0, 1, 4]), frozenset([0, 1, 2, 3, 4])), ':': (frozenset([2]), frozenset([2]), frozenset([0, 1, 3, 4]), frozenset([0, 1, 2, 3, 4])), '?': (frozenset([4]), frozenset([4]), frozenset([0, 1, 2, 3]), frozenset([0, 1, 2, 3, 4]))}
+    DISPATCH4 = (frozenset([]), frozenset([]), frozenset([0, 1, 2, 3, 4]), frozenset([0, 1, 2, 3, 4]))
+    FRAMES5 = {'filter_selector': RuleFrame('filter_selector', 0), 'index_selector': RuleFrame('index_selector', 4), 'int': RuleFrame('int', 0), 'slice_selector': RuleFrame('slice_selector', 0), 'start': RuleFrame('start', 4), 'string_literal': RuleFrame('string_literal', 2), 'wildcard_selector': RuleFrame('wildcard_selector', 0)}
+    LABELS9 = ((('string_literal',), '"""'), (('string_literal',), '"\'"'))
+    LABELS10 = ((('wildcard_selector',), '"*"'),)
+    LABELS11 = ((('slice_selector', 'start', 'int'), '"0"'), (('slice_selector', 'start', 'int'), '"-"'), (('slice_selector', 'start', 'int'), "''1''..''9''"), (('slice_selector',), '":"'))
+    LABELS12 = ((('index_selector', 'int'), '"0"'), (('index_selector', 'int'), '"-"'), (('index_selector', 'int'), "''1''..''9''"))
+    LABELS13 = ((('filter_selector',), '"?"'),)
+    
     rule_frame = RuleFrame('selector', 2)
     
     def inner(state: ParserState, pairs: list[Pair]) -> bool:
         """Parse selector."""
         state.rule_stack.push(rule_frame)
         children2: list[Pair] = []
-        # <Choice>
-        children3: list[Pair] = []
+        # <DispatchChoice>
+        children6: list[Pair] = []
         matched = False
+        if state.pos < len(state.input):
+            attempt7, replay8 = dispatch_alternatives(state, DISPATCH3.get(state.input[state.pos], DISPATCH4))
+        else:
+            attempt7, replay8 = dispatch_alternatives(state, DISPATCH4)
         if not matched:
-            state.checkpoint()
-            # <Identifier>
-            matched = parse_string_literal(state, children3)
-            # </Identifier>
-            if matched:
-                state.ok()
-                children2.extend(children3)
-            else:
-                state.restore()
-                children3.clear()
+            if 0 in attempt7:
+                state.checkpoint()
+                # <Identifier>
+                matched = parse_string_literal(state, children6)
+                # </Identifier>
+                if matched:
+                    state.ok()
+                    children2.extend(children6)
+                else:
+                    state.restore()
+                    children6.clear()
+            elif 0 in replay8:
+                record_failures(state, LABELS9, FRAMES5)
         if not matched:
-            state.checkpoint()
-            # <Identifier>
-            matched = parse_wildcard_selector(state, children3)
-            # </Identifier>
-            if matched:
-                state.ok()
-                children2.extend(children3)
-            else:
-                state.restore()
-                children3.clear()
+            if 1 in attempt7:
+                state.checkpoint()
+                # <Identifier>
+                matched = parse_wildcard_selector(state, children6)
+                # </Identifier>
+                if matched:
+                    state.ok()
+                    children2.extend(children6)
+                else:
+                    state.restore()
+                    children6.clear()
+            elif 1 in replay8:
+                record_failures(state, LABELS10, FRAMES5)
         if not matched:
-            state.checkpoint()
-            # <Identifier>
-            matched = parse_slice_selector(state, children3)
-            # </Identifier>
-            if matched:
-                state.ok()
-                children2.extend(children3)
-            else:
-                state.restore()
-                children3.clear()
+            if 2 in attempt7:
+                state.checkpoint()
+                # <Identifier>
+                matched = parse_slice_selector(state, children6)
+                # </Identifier>
+                if matched:
+                    state.ok()
+                    children2.extend(children6)
+                else:
+                    state.restore()
+                    children6.clear()
+            elif 2 in replay8:
+                record_failures(state, LABELS11, FRAMES5)
         if not matched:
-            state.checkpoint()
-            # <Identifier>
-            matched = parse_index_selector(state, children3)
-            # </Identifier>
-            if matched:
-                state.ok()
-                children2.extend(children3)
-            else:
-                state.restore()
-                children3.clear()
+            if 3 in attempt7:
+                state.checkpoint()
+                # <Identifier>
+                matched = parse_index_selector(state, children6)
+                # </Identifier>
+                if matched:
+                    state.ok()
+                    children2.extend(children6)
+                else:
+                    state.restore()
+                    children6.clear()
+            elif 3 in replay8:
+                record_failures(state, LABELS12, FRAMES5)
         if not matched:
-            state.checkpoint()
-            # <Identifier>
-            matched = parse_filter_selector(state, children3)
-            # </Identifier>
-            if matched:
-                state.ok()
-                children2.extend(children3)
-            else:
-                state.restore()
-                children3.clear()
-        # </Choice>
+            if 4 in attempt7:
+                state.checkpoint()
+                # <Identifier>
+                matched = parse_filter_selector(state, children6)
+                # </Identifier>
+                if matched:
+                    state.ok()
+                    children2.extend(children6)
+                else:
+                    state.restore()
+                    children6.clear()
+            elif 4 in replay8:
+                record_failures(state, LABELS13, FRAMES5)
+        # </DispatchChoice>
         state.rule_stack.pop()
         # Silent rule 'selector'
         pairs.extend(children2)
@@ -530,114 +581,129 @@ def _parse_selector() -> Callable[[ParserState, list[Pair]], bool]:
 parse_selector = _parse_selector()
 
 def _parse_name_selector() -> Callable[[ParserState, list[Pair]], bool]:
+    DISPATCH3 = {'"': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), "'": (frozenset([1]), frozenset([1]), frozenset([0]), frozenset([0, 1]))}
+    DISPATCH4 = (frozenset([]), frozenset([]), frozenset([0, 1]), frozenset([0, 1]))
+    LABELS10 = (((), '"""'),)
+    LABELS13 = (((), '"\'"'),)
+    
     rule_frame = RuleFrame('name_selector', 2)
     
     def inner(state: ParserState, pairs: list[Pair]) -> bool:
         """Parse name_selector."""
         state.rule_stack.push(rule_frame)
         children2: list[Pair] = []
-        # <Choice>
-        children3: list[Pair] = []
+        # <DispatchChoice>
+        children5: list[Pair] = []
         matched = False
+        if state.pos < len(state.input):
+            attempt6, replay7 = dispatch_alternatives(state, DISPATCH3.get(state.input[state.pos], DISPATCH4))
+        else:
+            attempt6, replay7 = dispatch_alternatives(state, DISPATCH4)
         if not matched:
-            state.checkpoint()
-            # <Group>
-            # <Sequence n=3>
-            all_ok5 = True
-            if all_ok5:
-                matched4 = False
-                # <String>
-                if state.input.startswith('"', state.pos):
-                    state.pos += 1
-                    matched4 = True
-                else:
-                    matched4 = False
-                    state.fail('"""')
-                # </String>
-                if not matched4:
-                    all_ok5 = False
-                if all_ok5:
-                    parse_trivia(state, children3)
-            if all_ok5:
-                matched4 = False
-                # <Identifier>
-                matched4 = parse_double_quoted(state, children3)
-                # </Identifier>
-                if not matched4:
-                    all_ok5 = False
-                if all_ok5:
-                    parse_trivia(state, children3)
-            if all_ok5:
-                matched4 = False
-                # <String>
-                if state.input.startswith('"', state.pos):
-                    state.pos += 1
-                    matched4 = True
+            if 0 in attempt6:
+                state.checkpoint()
+                # <Group>
+                # <Sequence n=3>
+                all_ok9 = True
+                if all_ok9:
+                    matched8 = False
+                    # <String>
+                    if state.input.startswith('"', state.pos):
+                        state.pos += 1
+                        matched8 = True
+                    else:
+                        matched8 = False
+                        state.fail('"""')
+                    # </String>
+                    if not matched8:
+                        all_ok9 = False
+                    if all_ok9:
+                        parse_trivia(state, children5)
+                if all_ok9:
+                    matched8 = False
+                    # <Identifier>
+                    matched8 = parse_double_quoted(state, children5)
+                    # </Identifier>
+                    if not matched8:
+                        all_ok9 = False
+                    if all_ok9:
+                        parse_trivia(state, children5)
+                if all_ok9:
+                    matched8 = False
+                    # <String>
+                    if state.input.startswith('"', state.pos):
+                        state.pos += 1
+                        matched8 = True
+                    else:
+                        matched8 = False
+                        state.fail('"""')
+                    # </String>
+                    if not matched8:
+                        all_ok9 = False
+                matched = all_ok9
+                # </Sequence>
+                # </Group>
+                if matched:
+                    state.ok()
+                    children2.extend(children5)
                 else:
-                    matched4 = False
-                    state.fail('"""')
-                # </String>
-                if not matched4:
-                    all_ok5 = False
-            matched = all_ok5
-            # </Sequence>
-            # </Group>
-            if matched:
-                state.ok()
-                children2.extend(children3)
-            else:
-                state.restore()
-                children3.clear()
+                    state.restore()
+                    children5.clear()
+            elif 0 in replay7:
+                record_failures(state, LABELS10)
         if not matched:
-            state.checkpoint()
-            # <Group>
-            # <Sequence n=3>
-            all_ok7 = True
-            if all_ok7:
-                matched6 = False
-                # <String>
-                if state.input.startswith("'", state.pos):
-                    state.pos += 1
-                    matched6 = True
+            if 1 in attempt6:
+                state.checkpoint()
+                # <Group>
+                # <Sequence n=3>
+                all_ok12 = True
+                if all_ok12:
+                    matched11 = False
+                    # <String>
+                    if state.input.startswith("'", state.pos):
+                        state.pos += 1
+                        matched11 = True
+                    else:
+                        matched11 = False
+                        state.fail('"\'"')
+                    # </String>
+                    if not matched11:
+                        all_ok12 = False
+                    if all_ok12:
+                        parse_trivia(state, children5)
+                if all_ok12:
+                    matched11 = False
+                    # <Identifier>
+                    matched11 = parse_single_quoted(state, children5)
+                    # </Identifier>
+                    if not matched11:
+                        all_ok12 = False
+                    if all_ok12:
+                        parse_trivia(state, children5)
+                if all_ok12:
+                    matched11 = False
+                    # <String>
+                    if state.input.startswith("'", state.pos):
+                        state.pos += 1
+                        matched11 = True
+                    else:
+                        matched11 = False
+                        state.fail('"\'"')
+                    # </String>
+                    if not matched11:
+                        all_ok12 = False
+                matched = all_ok12
+                # </Sequence>
+                # </Group>
+                if matched:
+                    state.ok()
+                    children2.extend(children5)
                 else:
-                    matched6 = False
-                    state.fail('"\'"')
-                # </String>
-                if not matched6:
-                    all_ok7 = False
-                if all_ok7:
-                    parse_trivia(state, children3)
-            if all_ok7:
-                matched6 = False
-                # <Identifier>
-                matched6 = parse_single_quoted(state, children3)
-                # </Identifier>
-                if not matched6:
-                    all_ok7 = False
-                if all_ok7:
-                    parse_trivia(state, children3)
-            if all_ok7:
-                matched6 = False
-                # <String>
-                if state.input.startswith("'", state.pos):
-                    state.pos += 1
-                    matched6 = True
-                else:
-                    matched6 = False
-                    state.fail('"\'"')
-                # </String>
-                if not matched6:
-                    all_ok7 = False
-            matched = all_ok7
-            # </Sequence>
-            # </Group>
-            if matched:
-                state.ok()
-                children2.extend(children3)
-            else:
-                state.restore()
-                children3.clear()
-        # </Choice>
+                    state.restore()
+                    children5.clear()
+            elif 1 in replay7:
+                record_failures(state, LABELS13)
+        # </DispatchChoice>
         state.rule_stack.pop()
         # Silent rule 'name_selector'
         pairs.extend(children2)
@@ -648,114 +714,129 @@ def _parse_name_selector() -> Callable[[ParserState, list[Pair]], bool]:
 parse_name_selector = _parse_name_selector()
 
 def _parse_string_literal() -> Callable[[ParserState, list[Pair]], bool]:
+    DISPATCH3 = {'"': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), "'": (frozenset([1]), frozenset([1]), frozenset([0]), frozenset([0, 1]))}
+    DISPATCH4 = (frozenset([]), frozenset([]), frozenset([0, 1]), frozenset([0, 1]))
+    LABELS10 = (((), '"""'),)
+    LABELS13 = (((), '"\'"'),)
+    
     rule_frame = RuleFrame('string_literal', 2)
     
     def inner(state: ParserState, pairs: list[Pair]) -> bool:
         """Parse string_literal."""
         state.rule_stack.push(rule_frame)
         children2: list[Pair] = []
-        # <Choice>
-        children3: list[Pair] = []
+        # <DispatchChoice>
+        children5: list[Pair] = []
         matched = False
+        if state.pos < len(state.input):
+            attempt6, replay7 = dispatch_alternatives(state, DISPATCH3.get(state.input[state.pos], DISPATCH4))
+        else:
+            attempt6, replay7 = dispatch_alternatives(state, DISPATCH4)
         if not matched:
-            state.checkpoint()
-            # <Group>
-            # <Sequence n=3>
-            all_ok5 = True
-            if all_ok5:
-                matched4 = False
-                # <String>
-                if state.input.startswith('"', state.pos):
-                    state.pos += 1
-                    matched4 = True
-                else:
-                    matched4 = False
-                    state.fail('"""')
-                # </String>
-                if not matched4:
-                    all_ok5 = False
-                if all_ok5:
-                    parse_trivia(state, children3)
-            if all_ok5:
-                matched4 = False
-                # <Identifier>
-                matched4 = parse_double_quoted(state, children3)
-                # </Identifier>
-                if not matched4:
-                    all_ok5 = False
-                if all_ok5:
-                    parse_trivia(state, children3)
-            if all_ok5:
-                matched4 = False
-                # <String>
-                if state.input.startswith('"', state.pos):
-                    state.pos += 1
-                    matched4 = True
+            if 0 in attempt6:
+                state.checkpoint()
+                # <Group>
+                # <Sequence n=3>
+                all_ok9 = True
+                if all_ok9:
+                    matched8 = False
+                    # <String>
+                    if state.input.startswith('"', state.pos):
+                        state.pos += 1
+                        matched8 = True
+                    else:
+                        matched8 = False
+                        state.fail('"""')
+                    # </String>
+                    if not matched8:
+                        all_ok9 = False
+                    if all_ok9:
+                        parse_trivia(state, children5)
+                if all_ok9:
+                    matched8 = False
+                    # <Identifier>
+                    matched8 = parse_double_quoted(state, children5)
+                    # </Identifier>
+                    if not matched8:
+                        all_ok9 = False
+                    if all_ok9:
+                        parse_trivia(state, children5)
+                if all_ok9:
+                    matched8 = False
+                    # <String>
+                    if state.input.startswith('"', state.pos):
+                        state.pos += 1
+                        matched8 = True
+                    else:
+                        matched8 = False
+                        state.fail('"""')
+                    # </String>
+                    if not matched8:
+                        all_ok9 = False
+                matched = all_ok9
+                # </Sequence>
+                # </Group>
+                if matched:
+                    state.ok()
+                    children2.extend(children5)
                 else:
-                    matched4 = False
-                    state.fail('"""')
-                # </String>
-                if not matched4:
-                    all_ok5 = False
-            matched = all_ok5
-            # </Sequence>
-            # </Group>
-            if matched:
-                state.ok()
-                children2.extend(children3)
-            else:
-                state.restore()
-                children3.clear()
+                    state.restore()
+                    children5.clear()
+            elif 0 in replay7:
+                record_failures(state, LABELS10)
         if not matched:
-            state.checkpoint()
-            # <Group>
-            # <Sequence n=3>
-            all_ok7 = True
-            if all_ok7:
-                matched6 = False
-                # <String>
-                if state.input.startswith("'", state.pos):
-                    state.pos += 1
-                    matched6 = True
-                else:
-                    matched6 = False
-                    state.fail('"\'"')
-                # </String>
-                if not matched6:
-                    all_ok7 = False
-                if all_ok7:
-                    parse_trivia(state, children3)
-            if all_ok7:
-                matched6 = False
-                # <Identifier>
-                matched6 = parse_single_quoted(state, children3)
-                # </Identifier>
-                if not matched6:
-                    all_ok7 = False
-                if all_ok7:
-                    parse_trivia(state, children3)
-            if all_ok7:
-                matched6 = False
-                # <String>
-                if state.input.startswith("'", state.pos):
-                    state.pos += 1
-                    matched6 = True
+            if 1 in attempt6:
+                state.checkpoint()
+                # <Group>
+                # <Sequence n=3>
+                all_ok12 = True
+                if all_ok12:
+                    matched11 = False
+                    # <String>
+                    if state.input.startswith("'", state.pos):
+                        state.pos += 1
+                        matched11 = True
+                    else:
+                        matched11 = False
+                        state.fail('"\'"')
+                    # </String>
+                    if not matched11:
+                        all_ok12 = False
+                    if all_ok12:
+                        parse_trivia(state, children5)
+                if all_ok12:
+                    matched11 = False
+                    # <Identifier>
+                    matched11 = parse_single_quoted(state, children5)
+                    # </Identifier>
+                    if not matched11:
+                        all_ok12 = False
+                    if all_ok12:
+                        parse_trivia(state, children5)
+                if all_ok12:
+                    matched11 = False
+                    # <String>
+                    if state.input.startswith("'", state.pos):
+                        state.pos += 1
+                        matched11 = True
+                    else:
+                        matched11 = False
+                        state.fail('"\'"')
+                    # </String>
+                    if not matched11:
+                        all_ok12 = False
+                matched = all_ok12
+                # </Sequence>
+                # </Group>
+                if matched:
+                    state.ok()
+                    children2.extend(children5)
                 else:
-                    matched6 = False
-                    state.fail('"\'"')
-                # </String>
-                if not matched6:
-                    all_ok7 = False
-            matched = all_ok7
-            # </Sequence>
-            # </Group>
-            if matched:
-                state.ok()
-                children2.extend(children3)
-            else:
-                state.restore()
-                children3.clear()
-        # </Choice>
+                    state.restore()
+                    children5.clear()
+            elif 1 in replay7:
+                record_failures(state, LABELS13)
+        # </DispatchChoice>
         state.rule_stack.pop()
         # Silent rule 'string_literal'
         pairs.extend(children2)
@@ -766,6 +847,13 @@ def _parse_string_literal() -> Callable[[ParserState, list[Pair]], bool]:
 parse_string_literal = _parse_string_literal()
 
 def _parse_double_quoted() -> Callable[[ParserState, list[Pair]], bool]:
+    DISPATCH5 = {"'": (frozenset([0, 1]), frozenset([0, 1]), frozenset([2, 3]), frozenset([0, 1, 2, 3])), '\\': (frozenset([0, 2, 3]), frozenset([0, 2, 3]), frozenset([1]), frozenset([0, 1, 2, 3]))}
+    DISPATCH6 = (frozenset([0]), frozenset([0]), frozenset([1, 2, 3]), frozenset([0, 1, 2, 3]))
+    FRAMES7 = {'ESC': RuleFrame('ESC', 2)}
+    LABELS11 = (((), '"\'"'),)
+    LABELS14 = ((('ESC',), '"\\"'),)
+    LABELS17 = ((('ESC',), '"\\"'),)
+    
     rule_frame = RuleFrame('double_quoted', 0)
     
     def inner(state: ParserState, pairs: list[Pair]) -> bool:
@@ -778,102 +866,115 @@ def _parse_double_quoted() -> Callable[[ParserState, list[Pair]], bool]:
         children3: list[Pair] = []
         while True:
             state.checkpoint()
-            # <Choice>
-            children5: list[Pair] = []
+            # <DispatchChoice>
+            children8: list[Pair] = []
             matched = False
+            if state.pos < len(state.input):
+                attempt9, replay10 = dispatch_alternatives(state, DISPATCH5.get(state.input[state.pos], DISPATCH6))
+            else:
+                attempt9, replay10 = dispatch_alternatives(state, DISPATCH6)
             if not matched:
                 state.checkpoint()
                 # <Identifier>
-                matched = parse_unescaped(state, children5)
+                matched = parse_unescaped(state, children8)
                 # </Identifier>
                 if matched:
                     state.ok()
-                    children3.extend(children5)
-                else:
-                    state.restore()
-                    children5.clear()
-            if not matched:
-                state.checkpoint()
-                # <String>
-                if state.input.startswith("'", state.pos):
-                    state.pos += 1
-                    matched = True
-                else:
-                    matched = False
-                    state.fail('"\'"')
-                # </String>
-                if matched:
-                    state.ok()
-                    children3.extend(children5)
+                    children3.extend(children8)
                 else:
                     state.restore()
-                    children5.clear()
+                    children8.clear()
             if not matched:
-                state.checkpoint()
-                # <Group>
-                # <Sequence n=2>
-                all_ok7 = True
-                if all_ok7:
-                    matched6 = False
-                    # <Identifier>
-                    matched6 = parse_ESC(state, children5)
-                    # </Identifier>
-                    if not matched6:
-                        all_ok7 = False
-                    if all_ok7:
-                        parse_trivia(state, children5)
-                if all_ok7:
-                    matched6 = False
+                if 1 in attempt9:
+                    state.checkpoint()
                     # <String>
-                    if state.input.startswith('"', state.pos):
+                    if state.input.startswith("'", state.pos):
                         state.pos += 1
-                        matched6 = True
+                        matched = True
                     else:
-                        matched6 = False
-                        state.fail('"""')
+                        matched = False
+                        state.fail('"\'"')
                     # </String>
-                    if not matched6:
-                        all_ok7 = False
-                matched = all_ok7
-                # </Sequence>
-                # </Group>
-                if matched:
-                    state.ok()
-                    children3.extend(children5)
-                else:
-                    state.restore()
-                    children5.clear()
+                    if matched:
+                        state.ok()
+                        children3.extend(children8)
+                    else:
+                        state.restore()
+                        children8.clear()
+                elif 1 in replay10:
+                    record_failures(state, LABELS11, FRAMES7)
             if not matched:
-                state.checkpoint()
-                # <Group>
-                # <Sequence n=2>
-                all_ok9 = True
-                if all_ok9:
-                    matched8 = False
-                    # <Identifier>
-                    matched8 = parse_ESC(state, children5)
-                    # </Identifier>
-                    if not matched8:
-                        all_ok9 = False
-                    if all_ok9:
-                        parse_trivia(state, children5)
-                if all_ok9:
-                    matched8 = False
-                    # <Identifier>
-                    matched8 = parse_escapable(state, children5)
-                    # </Identifier>
-                    if not matched8:
-                        all_ok9 = False
-                matched = all_ok9
-                # </Sequence>
-                # </Group>
-                if matched:
-                    state.ok()
-                    children3.extend(children5)
-                else:
-                    state.restore()
-                    children5.clear()
-            # </Choice>
+                if 2 in attempt9:
+                    state.checkpoint()
+                    # <Group>
+                    # <Sequence n=2>
+                    all_ok13 = True
+                    if all_ok13:
+                        matched12 = False
+                        # <Identifier>
+                        matched12 = parse_ESC(state, children8)
+                        # </Identifier>
+                        if not matched12:
+                            all_ok13 = False
+                        if all_ok13:
+                            parse_trivia(state, children8)
+                    if all_ok13:
+                        matched12 = False
+                        # <String>
+                        if state.input.startswith('"', state.pos):
+                            state.pos += 1
+                            matched12 = True
+                        else:
+                            matched12 = False
+                            state.fail('"""')
+                        # </String>
+                        if not matched12:
+                            all_ok13 = False
+                    matched = all_ok13
+                    # </Sequence>
+                    # </Group>
+                    if matched:
+                        state.ok()
+                        children3.extend(children8)
+                    else:
+                        state.restore()
+                        children8.clear()
+                elif 2 in replay10:
+                    record_failures(state, LABELS14, FRAMES7)
+            if not matched:
+                if 3 in attempt9:
+                    state.checkpoint()
+                    # <Group>
+                    # <Sequence n=2>
+                    all_ok16 = True
+                    if all_ok16:
+                        matched15 = False
+                        # <Identifier>
+                        matched15 = parse_ESC(state, children8)
+                        # </Identifier>
+                        if not matched15:
+                            all_ok16 = False
+                        if all_ok16:
+                            parse_trivia(state, children8)
+                    if all_ok16:
+                        matched15 = False
+                        # <Identifier>
+                        matched15 = parse_escapable(state, children8)
+                        # </Identifier>
+                        if not matched15:
+                            all_ok16 = False
+                    matched = all_ok16
+                    # </Sequence>
+                    # </Group>
+                    if matched:
+                        state.ok()
+                        children3.extend(children8)
+                    else:
+                        state.restore()
+                        children8.clear()
+                elif 3 in replay10:
+                    record_failures(state, LABELS17, FRAMES7)
+            # </DispatchChoice>
             if matched:
                 state.ok()
                 children2.extend(children3)
@@ -888,11 +989,14 @@ def _parse_double_quoted() -> Callable[[ParserState, list[Pair]], bool]:
         # </Repeat>
         state.rule_stack.pop()
         if state.tag_stack:
-            tag10: str | None = state.tag_stack.pop()
+            tag18: str | None = state.tag_stack.pop()
         else:
-            tag10 = None
+            tag18 = None
         if matched:
-            pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag10,))
+            if state.arena is None:
+                pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag18, state.line_index))
+            else:
+                pairs.append(state.arena.add(rule_frame, pos1, state.pos, children2, tag18))
         return matched
     
     return inner
@@ -900,6 +1004,13 @@ def _parse_double_quoted() -> Callable[[ParserState, list[Pair]], bool]:
 parse_double_quoted = _parse_double_quoted()
 
 def _parse_single_quoted() -> Callable[[ParserState, list[Pair]], bool]:
+    DISPATCH5 = {'"': (frozenset([0, 1]), frozenset([0, 1]), frozenset([2, 3]), frozenset([0, 1, 2, 3])), '\\': (frozenset([0, 2, 3]), frozenset([0, 2, 3]), frozenset([1]), frozenset([0, 1, 2, 3]))}
+    DISPATCH6 = (frozenset([0]), frozenset([0]), frozenset([1, 2, 3]), frozenset([0, 1, 2, 3]))
+    FRAMES7 = {'ESC': RuleFrame('ESC', 2)}
+    LABELS11 = (((), '"""'),)
+    LABELS14 = ((('ESC',), '"\\"'),)
+    LABELS17 = ((('ESC',), '"\\"'),)
+    
     rule_frame = RuleFrame('single_quoted', 0)
     
     def inner(state: ParserState, pairs: list[Pair]) -> bool:
@@ -912,102 +1023,115 @@ def _parse_single_quoted() -> Callable[[ParserState, list[Pair]], bool]:
         children3: list[Pair] = []
         while True:
             state.checkpoint()
-            # <Choice>
-            children5: list[Pair] = []
+            # <DispatchChoice>
+            children8: list[Pair] = []
             matched = False
+            if state.pos < len(state.input):
+                attempt9, replay10 = dispatch_alternatives(state, DISPATCH5.get(state.input[state.pos], DISPATCH6))
+            else:
+                attempt9, replay10 = dispatch_alternatives(state, DISPATCH6)
             if not matched:
                 state.checkpoint()
                 # <Identifier>
-                matched = parse_unescaped(state, children5)
+                matched = parse_unescaped(state, children8)
                 # </Identifier>
                 if matched:
                     state.ok()
-                    children3.extend(children5)
+                    children3.extend(children8)
                 else:
                     state.restore()
-                    children5.clear()
-            if not matched:
-                state.checkpoint()
-                # <String>
-                if state.input.startswith('"', state.pos):
-                    state.pos += 1
-                    matched = True
-                else:
-                    matched = False
-                    state.fail('"""')
-                # </String>
-                if matched:
-                    state.ok()
-                    children3.extend(children5)
-                else:
-                    state.restore()
-                    children5.clear()
+                    children8.clear()
             if not matched:
-                state.checkpoint()
-                # <Group>
-                # <Sequence n=2>
-                all_ok7 = True
-                if all_ok7:
-                    matched6 = False
-                    # <Identifier>
-                    matched6 = parse_ESC(state, children5)
-                    # </Identifier>
-                    if not matched6:
-                        all_ok7 = False
-                    if all_ok7:
-                        parse_trivia(state, children5)
-                if all_ok7:
-                    matched6 = False
+                if 1 in attempt9:
+                    state.checkpoint()
                     # <String>
-                    if state.input.startswith("'", state.pos):
+                    if state.input.startswith('"', state.pos):
                         state.pos += 1
-                        matched6 = True
+                        matched = True
                     else:
-                        matched6 = False
-                        state.fail('"\'"')
+                        matched = False
+                        state.fail('"""')
                     # </String>
-                    if not matched6:
-                        all_ok7 = False
-                matched = all_ok7
-                # </Sequence>
-                # </Group>
-                if matched:
-                    state.ok()
-                    children3.extend(children5)
-                else:
-                    state.restore()
-                    children5.clear()
+                    if matched:
+                        state.ok()
+                        children3.extend(children8)
+                    else:
+                        state.restore()
+                        children8.clear()
+                elif 1 in replay10:
+                    record_failures(state, LABELS11, FRAMES7)
             if not matched:
-                state.checkpoint()
-                # <Group>
-                # <Sequence n=2>
-                all_ok9 = True
-                if all_ok9:
-                    matched8 = False
-                    # <Identifier>
-                    matched8 = parse_ESC(state, children5)
-                    # </Identifier>
-                    if not matched8:
-                        all_ok9 = False
-                    if all_ok9:
-                        parse_trivia(state, children5)
-                if all_ok9:
-                    matched8 = False
-                    # <Identifier>
-                    matched8 = parse_escapable(state, children5)
-                    # </Identifier>
-                    if not matched8:
-                        all_ok9 = False
-                matched = all_ok9
-                # </Sequence>
-                # </Group>
-                if matched:
-                    state.ok()
-                    children3.extend(children5)
-                else:
-                    state.restore()
-                    children5.clear()
-            # </Choice>
+                if 2 in attempt9:
+                    state.checkpoint()
+                    # <Group>
+                    # <Sequence n=2>
+                    all_ok13 = True
+                    if all_ok13:
+                        matched12 = False
+                        # <Identifier>
+                        matched12 = parse_ESC(state, children8)
+                        # </Identifier>
+                        if not matched12:
+                            all_ok13 = False
+                        if all_ok13:
+                            parse_trivia(state, children8)
+                    if all_ok13:
+                        matched12 = False
+                        # <String>
+                        if state.input.startswith("'", state.pos):
+                            state.pos += 1
+                            matched12 = True
+                        else:
+                            matched12 = False
+                            state.fail('"\'"')
+                        # </String>
+                        if not matched12:
+                            all_ok13 = False
+                    matched = all_ok13
+                    # </Sequence>
+                    # </Group>
+                    if matched:
+                        state.ok()
+                        children3.extend(children8)
+                    else:
+                        state.restore()
+                        children8.clear()
+                elif 2 in replay10:
+                    record_failures(state, LABELS14, FRAMES7)
+            if not matched:
+                if 3 in attempt9:
+                    state.checkpoint()
+                    # <Group>
+                    # <Sequence n=2>
+                    all_ok16 = True
+                    if all_ok16:
+                        matched15 = False
+                        # <Identifier>
+                        matched15 = parse_ESC(state, children8)
+                        # </Identifier>
+                        if not matched15:
+                            all_ok16 = False
+                        if all_ok16:
+                            parse_trivia(state, children8)
+                    if all_ok16:
+                        matched15 = False
+                        # <Identifier>
+                        matched15 = parse_escapable(state, children8)
+                        # </Identifier>
+                        if not matched15:
+                            all_ok16 = False
+                    matched = all_ok16
+                    # </Sequence>
+                    # </Group>
+                    if matched:
+                        state.ok()
+                        children3.extend(children8)
+                    else:
+                        state.restore()
+                        children8.clear()
+                elif 3 in replay10:
+                    record_failures(state, LABELS17, FRAMES7)
+            # </DispatchChoice>
             if matched:
                 state.ok()
                 children2.extend(children3)
@@ -1022,11 +1146,14 @@ def _parse_single_quoted() -> Callable[[ParserState, list[Pair]], bool]:
         # </Repeat>
         state.rule_stack.pop()
         if state.tag_stack:
-            tag10: str | None = state.tag_stack.pop()
+            tag18: str | None = state.tag_stack.pop()
         else:
-            tag10 = None
+            tag18 = None
         if matched:
-            pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag10,))
+            if state.arena is None:
+                pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag18, state.line_index))
+            else:
+                pairs.append(state.arena.add(rule_frame, pos1, state.pos, children2, tag18))
         return matched
     
     return inner
@@ -1034,7 +1161,22 @@ def _parse_single_quoted() -> Callable[[ParserState, list[Pair]], bool]:
 parse_single_quoted = _parse_single_quoted()
 
 def _parse_double_quoted_char() -> Callable[[ParserState, list[Pair]], bool]:
-    RE4 = re.compile('[\\ -!\\#-\\&\\(-\\[\\]-\ud7ff\ue000-\U0010ffff]', re.VERSION1)
+    DISPATCH3 = {"'": (frozenset([0, 1]), frozenset([0, 1]), frozenset([2, 3]), frozenset([0, 1, 2, 3])), '\\': (frozenset([0, 2, 3]), frozenset([0, 2, 3]), frozenset([1]), frozenset([0, 1, 2, 3]))}
+    DISPATCH4 = (frozenset([0]), frozenset([0]), frozenset([1, 2, 3]), frozenset([0, 1, 2, 3]))
+    RE8 = re.compile('[\\ -!\\#-\\&\\(-\\[\\]-\ud7ff\ue000-\U0010ffff]', re.VERSION1)
+    LABELS9 = (((), '"\'"'),)
+    LABELS12 = (((), '"\\"'),)
+    DISPATCH15 = {'/': (frozenset([5]), frozenset([5]), frozenset([0, 1, 2, 3, 4, 6, 7]), frozenset([0, 1, 2, 3, 4, 5, 6, 7])), '\\': (frozenset([6]), frozenset([6]), frozenset([0, 1, 2, 3, 4, 5, 7]), frozenset([0, 1, 2, 3, 4, 5, 6, 7])), 'b': (frozenset([0]), frozenset([0]), frozenset([1, 2, 3, 4, 5, 6, 7]), frozenset([0, 1, 2, 3, 4, 5, 6, 7])), 'f': (frozenset([1]), frozenset([1]), frozenset([0, 2, 3, 4, 5, 6, 7]), frozenset([0, 1, 2, 3, 4, 5, 6, 7])), 'n': (frozenset([2]), frozenset([2]), frozenset([0, 1, 3, 4, 5, 6, 7]), frozenset([0, 1, 2, 3, 4, 5, 6, 7])), 'r': (frozenset([3]), frozenset([3]), frozenset([0, 1, 2, 4, 5, 6, 7]), frozenset([0, 1, 2, 3, 4, 5, 6, 7])), 't': (frozenset([4]), frozenset([4]), frozenset([0, 1, 2, 3, 5, 6, 7]), frozenset([0, 1, 2, 3, 4, 5, 6, 7])), 'u': (frozenset([7]), frozenset([7]), frozenset([0, 1, 2, 3, 4, 5, 6]), frozenset([0, 1, 2, 3, 4, 5, 6, 7]))}
+    DISPATCH16 = (frozenset([]), frozenset([]), frozenset([0, 1, 2, 3, 4, 5, 6, 7]), frozenset([0, 1, 2, 3, 4, 5, 6, 7]))
+    LABELS20 = (((), '"b"'),)
+    LABELS21 = (((), '"f"'),)
+    LABELS22 = (((), '"n"'),)
+    LABELS23 = (((), '"r"'),)
+    LABELS24 = (((), '"t"'),)
+    LABELS25 = (((), '"/"'),)
+    LABELS26 = (((), '"\\"'),)
+    LABELS29 = (((), '"u"'),)
+    LABELS30 = (((), '"\\"'),)
     
     rule_frame = RuleFrame('double_quoted_char', 2)
     
@@ -1042,13 +1184,17 @@ def _parse_double_quoted_char() -> Callable[[ParserState, list[Pair]], bool]:
         """Parse double_quoted_char."""
         state.rule_stack.push(rule_frame)
         children2: list[Pair] = []
-        # <Choice>
-        children3: list[Pair] = []
+        # <DispatchChoice>
+        children5: list[Pair] = []
         matched = False
+        if state.pos < len(state.input):
+            attempt6, replay7 = dispatch_alternatives(state, DISPATCH3.get(state.input[state.pos], DISPATCH4))
+        else:
+            attempt6, replay7 = dispatch_alternatives(state, DISPATCH4)
         if not matched:
             state.checkpoint()
             # <ChoiceRegex>
-            if match := RE4.match(state.input, state.pos):
+            if match := RE8.match(state.input, state.pos):
                 state.pos = match.end()
                 matched = True
             else:
@@ -1056,250 +1202,287 @@ def _parse_double_quoted_char() -> Callable[[ParserState, list[Pair]], bool]:
             # </ChoiceRegex>
             if matched:
                 state.ok()
-                children2.extend(children3)
-            else:
-                state.restore()
-                children3.clear()
-        if not matched:
-            state.checkpoint()
-            # <String>
-            if state.input.startswith("'", state.pos):
-                state.pos += 1
-                matched = True
-            else:
-                matched = False
-                state.fail('"\'"')
-            # </String>
-            if matched:
-                state.ok()
-                children2.extend(children3)
+                children2.extend(children5)
             else:
                 state.restore()
-                children3.clear()
+                children5.clear()
         if not matched:
-            state.checkpoint()
-            # <Group>
-            # <Sequence n=2>
-            all_ok6 = True
-            if all_ok6:
-                matched5 = False
+            if 1 in attempt6:
+                state.checkpoint()
                 # <String>
-                if state.input.startswith('\\', state.pos):
+                if state.input.startswith("'", state.pos):
                     state.pos += 1
-                    matched5 = True
+                    matched = True
                 else:
-                    matched5 = False
-                    state.fail('"\\"')
+                    matched = False
+                    state.fail('"\'"')
                 # </String>
-                if not matched5:
-                    all_ok6 = False
-                if all_ok6:
-                    parse_trivia(state, children3)
-            if all_ok6:
-                matched5 = False
-                # <String>
-                if state.input.startswith('"', state.pos):
-                    state.pos += 1
-                    matched5 = True
+                if matched:
+                    state.ok()
+                    children2.extend(children5)
                 else:
-                    matched5 = False
-                    state.fail('"""')
-                # </String>
-                if not matched5:
-                    all_ok6 = False
-            matched = all_ok6
-            # </Sequence>
-            # </Group>
-            if matched:
-                state.ok()
-                children2.extend(children3)
-            else:
-                state.restore()
-                children3.clear()
+                    state.restore()
+                    children5.clear()
+            elif 1 in replay7:
+                record_failures(state, LABELS9)
         if not matched:
-            state.checkpoint()
-            # <Group>
-            # <Sequence n=2>
-            all_ok8 = True
-            if all_ok8:
-                matched7 = False
-                # <String>
-                if state.input.startswith('\\', state.pos):
-                    state.pos += 1
-                    matched7 = True
-                else:
-                    matched7 = False
-                    state.fail('"\\"')
-                # </String>
-                if not matched7:
-                    all_ok8 = False
-                if all_ok8:
-                    parse_trivia(state, children3)
-            if all_ok8:
-                matched7 = False
-                # <Choice>
-                children9: list[Pair] = []
-                matched7 = False
-                if not matched7:
-                    state.checkpoint()
+            if 2 in attempt6:
+                state.checkpoint()
+                # <Group>
+                # <Sequence n=2>
+                all_ok11 = True
+                if all_ok11:
+                    matched10 = False
                     # <String>
-                    if state.input.startswith('b', state.pos):
+                    if state.input.startswith('\\', state.pos):
                         state.pos += 1
-                        matched7 = True
+                        matched10 = True
                     else:
-                        matched7 = False
-                        state.fail('"b"')
+                        matched10 = False
+                        state.fail('"\\"')
                     # </String>
-                    if matched7:
-                        state.ok()
-                        children3.extend(children9)
-                    else:
-                        state.restore()
-                        children9.clear()
-                if not matched7:
-                    state.checkpoint()
-                    # <String>
-                    if state.input.startswith('f', state.pos):
-                        state.pos += 1
-                        matched7 = True
-                    else:
-                        matched7 = False
-                        state.fail('"f"')
-                    # </String>
-                    if matched7:
-                        state.ok()
-                        children3.extend(children9)
-                    else:
-                        state.restore()
-                        children9.clear()
-                if not matched7:
-                    state.checkpoint()
-                    # <String>
-                    if state.input.startswith('n', state.pos):
-                        state.pos += 1
-                        matched7 = True
-                    else:
-                        matched7 = False
-                        state.fail('"n"')
-                    # </String>
-                    if matched7:
-                        state.ok()
-                        children3.extend(children9)
-                    else:
-                        state.restore()
-                        children9.clear()
-                if not matched7:
-                    state.checkpoint()
-                    # <String>
-                    if state.input.startswith('r', state.pos):
-                        state.pos += 1
-                        matched7 = True
-                    else:
-                        matched7 = False
-                        state.fail('"r"')
-                    # </String>
-                    if matched7:
-                        state.ok()
-                        children3.extend(children9)
-                    else:
-                        state.restore()
-                        children9.clear()
-                if not matched7:
-                    state.checkpoint()
-                    # <String>
-                    if state.input.startswith('t', state.pos):
-                        state.pos += 1
-                        matched7 = True
-                    else:
-                        matched7 = False
-                        state.fail('"t"')
-                    # </String>
-                    if matched7:
-                        state.ok()
-                        children3.extend(children9)
-                    else:
-                        state.restore()
-                        children9.clear()
-                if not matched7:
-                    state.checkpoint()
+                    if not matched10:
+                        all_ok11 = False
+                    if all_ok11:
+                        parse_trivia(state, children5)
+                if all_ok11:
+                    matched10 = False
                     # <String>
-                    if state.input.startswith('/', state.pos):
+                    if state.input.startswith('"', state.pos):
                         state.pos += 1
-                        matched7 = True
+                        matched10 = True
                     else:
-                        matched7 = False
-                        state.fail('"/"')
+                        matched10 = False
+                        state.fail('"""')
                     # </String>
-                    if matched7:
-                        state.ok()
-                        children3.extend(children9)
-                    else:
-                        state.restore()
-                        children9.clear()
-                if not matched7:
-                    state.checkpoint()
+                    if not matched10:
+                        all_ok11 = False
+                matched = all_ok11
+                # </Sequence>
+                # </Group>
+                if matched:
+                    state.ok()
+                    children2.extend(children5)
+                else:
+                    state.restore()
+                    children5.clear()
+            elif 2 in replay7:
+                record_failures(state, LABELS12)
+        if not matched:
+            if 3 in attempt6:
+                state.checkpoint()
+                # <Group>
+                # <Sequence n=2>
+                all_ok14 = True
+                if all_ok14:
+                    matched13 = False
                     # <String>
                     if state.input.startswith('\\', state.pos):
                         state.pos += 1
-                        matched7 = True
+                        matched13 = True
                     else:
-                        matched7 = False
+                        matched13 = False
                         state.fail('"\\"')
                     # </String>
-                    if matched7:
-                        state.ok()
-                        children3.extend(children9)
-                    else:
-                        state.restore()
-                        children9.clear()
-                if not matched7:
-                    state.checkpoint()
-                    # <Group>
-                    # <Sequence n=2>
-                    all_ok11 = True
-                    if all_ok11:
-                        matched10 = False
-                        # <String>
-                        if state.input.startswith('u', state.pos):
-                            state.pos += 1
-                            matched10 = True
-                        else:
-                            matched10 = False
-                            state.fail('"u"')
-                        # </String>
-                        if not matched10:
-                            all_ok11 = False
-                        if all_ok11:
-                            parse_trivia(state, children9)
-                    if all_ok11:
-                        matched10 = False
-                        # <Identifier>
-                        matched10 = parse_hexchar(state, children9)
-                        # </Identifier>
-                        if not matched10:
-                            all_ok11 = False
-                    matched7 = all_ok11
-                    # </Sequence>
-                    # </Group>
-                    if matched7:
-                        state.ok()
-                        children3.extend(children9)
+                    if not matched13:
+                        all_ok14 = False
+                    if all_ok14:
+                        parse_trivia(state, children5)
+                if all_ok14:
+                    matched13 = False
+                    # <DispatchChoice>
+                    children17: list[Pair] = []
+                    matched13 = False
+                    if state.pos < len(state.input):
+                        attempt18, replay19 = dispatch_alternatives(state, DISPATCH15.get(state.input[state.pos], DISPATCH16))
                     else:
-                        state.restore()
-                        children9.clear()
-                # </Choice>
-                if not matched7:
-                    all_ok8 = False
-            matched = all_ok8
-            # </Sequence>
-            # </Group>
-            if matched:
-                state.ok()
-                children2.extend(children3)
-            else:
-                state.restore()
-                children3.clear()
-        # </Choice>
+                        attempt18, replay19 = dispatch_alternatives(state, DISPATCH16)
+                    if not matched13:
+                        if 0 in attempt18:
+                            state.checkpoint()
+                            # <String>
+                            if state.input.startswith('b', state.pos):
+                                state.pos += 1
+                                matched13 = True
+                            else:
+                                matched13 = False
+                                state.fail('"b"')
+                            # </String>
+                            if matched13:
+                                state.ok()
+                                children5.extend(children17)
+                            else:
+                                state.restore()
+                                children17.clear()
+                        elif 0 in replay19:
+                            record_failures(state, LABELS20)
+                    if not matched13:
+                        if 1 in attempt18:
+                            state.checkpoint()
+                            # <String>
+                            if state.input.startswith('f', state.pos):
+                                state.pos += 1
+                                matched13 = True
+                            else:
+                                matched13 = False
+                                state.fail('"f"')
+                            # </String>
+                            if matched13:
+                                state.ok()
+                                children5.extend(children17)
+                            else:
+                                state.restore()
+                                children17.clear()
+                        elif 1 in replay19:
+                            record_failures(state, LABELS21)
+                    if not matched13:
+                        if 2 in attempt18:
+                            state.checkpoint()
+                            # <String>
+                            if state.input.startswith('n', state.pos):
+                                state.pos += 1
+                                matched13 = True
+                            else:
+                                matched13 = False
+                                state.fail('"n"')
+                            # </String>
+                            if matched13:
+                                state.ok()
+                                children5.extend(children17)
+                            else:
+                                state.restore()
+                                children17.clear()
+                        elif 2 in replay19:
+                            record_failures(state, LABELS22)
+                    if not matched13:
+                        if 3 in attempt18:
+                            state.checkpoint()
+                            # <String>
+                            if state.input.startswith('r', state.pos):
+                                state.pos += 1
+                                matched13 = True
+                            else:
+                                matched13 = False
+                                state.fail('"r"')
+                            # </String>
+                            if matched13:
+                                state.ok()
+                                children5.extend(children17)
+                            else:
+                                state.restore()
+                                children17.clear()
+                        elif 3 in replay19:
+                            record_failures(state, LABELS23)
+                    if not matched13:
+                        if 4 in attempt18:
+                            state.checkpoint()
+                            # <String>
+                            if state.input.startswith('t', state.pos):
+                                state.pos += 1
+                                matched13 = True
+                            else:
+                                matched13 = False
+                                state.fail('"t"')
+                            # </String>
+                            if matched13:
+                                state.ok()
+                                children5.extend(children17)
+                            else:
+                                state.restore()
+                                children17.clear()
+                        elif 4 in replay19:
+                            record_failures(state, LABELS24)
+                    if not matched13:
+                        if 5 in attempt18:
+                            state.checkpoint()
+                            # <String>
+                            if state.input.startswith('/', state.pos):
+                                state.pos += 1
+                                matched13 = True
+                            else:
+                                matched13 = False
+                                state.fail('"/"')
+                            # </String>
+                            if matched13:
+                                state.ok()
+                                children5.extend(children17)
+                            else:
+                                state.restore()
+                                children17.clear()
+                        elif 5 in replay19:
+                            record_failures(state, LABELS25)
+                    if not matched13:
+                        if 6 in attempt18:
+                            state.checkpoint()
+                            # <String>
+                            if state.input.startswith('\\', state.pos):
+                                state.pos += 1
+                                matched13 = True
+                            else:
+                                matched13 = False
+                                state.fail('"\\"')
+                            # </String>
+                            if matched13:
+                                state.ok()
+                                children5.extend(children17)
+                            else:
+                                state.restore()
+                                children17.clear()
+                        elif 6 in replay19:
+                            record_failures(state, LABELS26)
+                    if not matched13:
+                        if 7 in attempt18:
+                            state.checkpoint()
+                            # <Group>
+                            # <Sequence n=2>
+                            all_ok28 = True
+                            if all_ok28:
+                                matched27 = False
+                                # <String>
+                                if state.input.startswith('u', state.pos):
+                                    state.pos += 1
+                                    matched27 = True
+                                else:
+                                    matched27 = False
+                                    state.fail('"u"')
+                                # </String>
+                                if not matched27:
+                                    all_ok28 = False
+                                if all_ok28:
+                                    parse_trivia(state, children17)
+                            if all_ok28:
+                                matched27 = False
+                                # <Identifier>
+                                matched27 = parse_hexchar(state, children17)
+                                # </Identifier>
+                                if not matched27:
+                                    all_ok28 = False
+                            matched13 = all_ok28
+                            # </Sequence>
+                            # </Group>
+                            if matched13:
+                                state.ok()
+                                children5.extend(children17)
+                            else:
+                                state.restore()
+                                children17.clear()
+                        elif 7 in replay19:
+                            record_failures(state, LABELS29)
+                    # </DispatchChoice>
+                    if not matched13:
+                        all_ok14 = False
+                matched = all_ok14
+                # </Sequence>
+                # </Group>
+                if matched:
+                    state.ok()
+                    children2.extend(children5)
+                else:
+                    state.restore()
+                    children5.clear()
+            elif 3 in replay7:
+                record_failures(state, LABELS30)
+        # </DispatchChoice>
         state.rule_stack.pop()
         # Silent rule 'double_quoted_char'
         pairs.extend(children2)
@@ -1310,7 +1493,22 @@ def _parse_double_quoted_char() -> Callable[[ParserState, list[Pair]], bool]:
 parse_double_quoted_char = _parse_double_quoted_char()
 
 def _parse_single_quoted_char() -> Callable[[ParserState, list[Pair]], bool]:
-    RE4 = re.compile('[\\ -!\\#-\\&\\(-\\[\\]-\ud7ff\ue000-\U0010ffff]', re.VERSION1)
+    DISPATCH3 = {'"': (frozenset([0, 1]), frozenset([0, 1]), frozenset([2, 3]), frozenset([0, 1, 2, 3])), '\\': (frozenset([0, 2, 3]), frozenset([0, 2, 3]), frozenset([1]), frozenset([0, 1, 2, 3]))}
+    DISPATCH4 = (frozenset([0]), frozenset([0]), frozenset([1, 2, 3]), frozenset([0, 1, 2, 3]))
+    RE8 = re.compile('[\\ -!\\#-\\&\\(-\\[\\]-\ud7ff\ue000-\U0010ffff]', re.VERSION1)
+    LABELS9 = (((), '"""'),)
+    LABELS12 = (((), '"\\"'),)
+    DISPATCH15 = {'/': (frozenset([5]), frozenset([5]), frozenset([0, 1, 2, 3, 4, 6, 7]), frozenset([0, 1, 2, 3, 4, 5, 6, 7])), '\\': (frozenset([6]), frozenset([6]), frozenset([0, 1, 2, 3, 4, 5, 7]), frozenset([0, 1, 2, 3, 4, 5, 6, 7])), 'b': (frozenset([0]), frozenset([0]), frozenset([1, 2, 3, 4, 5, 6, 7]), frozenset([0, 1, 2, 3, 4, 5, 6, 7])), 'f': (frozenset([1]), frozenset([1]), frozenset([0, 2, 3, 4, 5, 6, 7]), frozenset([0, 1, 2, 3, 4, 5, 6, 7])), 'n': (frozenset([2]), frozenset([2]), frozenset([0, 1, 3, 4, 5, 6, 7]), frozenset([0, 1, 2, 3, 4, 5, 6, 7])), 'r': (frozenset([3]), frozenset([3]), frozenset([0, 1, 2, 4, 5, 6, 7]), frozenset([0, 1, 2, 3, 4, 5, 6, 7])), 't': (frozenset([4]), frozenset([4]), frozenset([0, 1, 2, 3, 5, 6, 7]), frozenset([0, 1, 2, 3, 4, 5, 6, 7])), 'u': (frozenset([7]), frozenset([7]), frozenset([0, 1, 2, 3, 4, 5, 6]), frozenset([0, 1, 2, 3, 4, 5, 6, 7]))}
+    DISPATCH16 = (frozenset([]), frozenset([]), frozenset([0, 1, 2, 3, 4, 5, 6, 7]), frozenset([0, 1, 2, 3, 4, 5, 6, 7]))
+    LABELS20 = (((), '"b"'),)
+    LABELS21 = (((), '"f"'),)
+    LABELS22 = (((), '"n"'),)
+    LABELS23 = (((), '"r"'),)
+    LABELS24 = (((), '"t"'),)
+    LABELS25 = (((), '"/"'),)
+    LABELS26 = (((), '"\\"'),)
+    LABELS29 = (((), '"u"'),)
+    LABELS30 = (((), '"\\"'),)
     
     rule_frame = RuleFrame('single_quoted_char', 2)
     
@@ -1318,13 +1516,17 @@ def _parse_single_quoted_char() -> Callable[[ParserState, list[Pair]], bool]:
         """Parse single_quoted_char."""
         state.rule_stack.push(rule_frame)
         children2: list[Pair] = []
-        # <Choice>
-        children3: list[Pair] = []
+        # <DispatchChoice>
+        children5: list[Pair] = []
         matched = False
+        if state.pos < len(state.input):
+            attempt6, replay7 = dispatch_alternatives(state, DISPATCH3.get(state.input[state.pos], DISPATCH4))
+        else:
+            attempt6, replay7 = dispatch_alternatives(state, DISPATCH4)
         if not matched:
             state.checkpoint()
             # <ChoiceRegex>
-            if match := RE4.match(state.input, state.pos):
+            if match := RE8.match(state.input, state.pos):
                 state.pos = match.end()
                 matched = True
             else:
@@ -1332,250 +1534,287 @@ def _parse_single_quoted_char() -> Callable[[ParserState, list[Pair]], bool]:
             # </ChoiceRegex>
             if matched:
                 state.ok()
-                children2.extend(children3)
-            else:
-                state.restore()
-                children3.clear()
-        if not matched:
-            state.checkpoint()
-            # <String>
-            if state.input.startswith('"', state.pos):
-                state.pos += 1
-                matched = True
-            else:
-                matched = False
-                state.fail('"""')
-            # </String>
-            if matched:
-                state.ok()
-                children2.extend(children3)
+                children2.extend(children5)
             else:
                 state.restore()
-                children3.clear()
+                children5.clear()
         if not matched:
-            state.checkpoint()
-            # <Group>
-            # <Sequence n=2>
-            all_ok6 = True
-            if all_ok6:
-                matched5 = False
+            if 1 in attempt6:
+                state.checkpoint()
                 # <String>
-                if state.input.startswith('\\', state.pos):
+                if state.input.startswith('"', state.pos):
                     state.pos += 1
-                    matched5 = True
+                    matched = True
                 else:
-                    matched5 = False
-                    state.fail('"\\"')
+                    matched = False
+                    state.fail('"""')
                 # </String>
-                if not matched5:
-                    all_ok6 = False
-                if all_ok6:
-                    parse_trivia(state, children3)
-            if all_ok6:
-                matched5 = False
-                # <String>
-                if state.input.startswith("'", state.pos):
-                    state.pos += 1
-                    matched5 = True
+                if matched:
+                    state.ok()
+                    children2.extend(children5)
                 else:
-                    matched5 = False
-                    state.fail('"\'"')
-                # </String>
-                if not matched5:
-                    all_ok6 = False
-            matched = all_ok6
-            # </Sequence>
-            # </Group>
-            if matched:
-                state.ok()
-                children2.extend(children3)
-            else:
-                state.restore()
-                children3.clear()
+                    state.restore()
+                    children5.clear()
+            elif 1 in replay7:
+                record_failures(state, LABELS9)
         if not matched:
-            state.checkpoint()
-            # <Group>
-            # <Sequence n=2>
-            all_ok8 = True
-            if all_ok8:
-                matched7 = False
-                # <String>
-                if state.input.startswith('\\', state.pos):
-                    state.pos += 1
-                    matched7 = True
-                else:
-                    matched7 = False
-                    state.fail('"\\"')
-                # </String>
-                if not matched7:
-                    all_ok8 = False
-                if all_ok8:
-                    parse_trivia(state, children3)
-            if all_ok8:
-                matched7 = False
-                # <Choice>
-                children9: list[Pair] = []
-                matched7 = False
-                if not matched7:
-                    state.checkpoint()
-                    # <String>
-                    if state.input.startswith('b', state.pos):
-                        state.pos += 1
-                        matched7 = True
-                    else:
-                        matched7 = False
-                        state.fail('"b"')
-                    # </String>
-                    if matched7:
-                        state.ok()
-                        children3.extend(children9)
-                    else:
-                        state.restore()
-                        children9.clear()
-                if not matched7:
-                    state.checkpoint()
-                    # <String>
-                    if state.input.startswith('f', state.pos):
-                        state.pos += 1
-                        matched7 = True
-                    else:
-                        matched7 = False
-                        state.fail('"f"')
-                    # </String>
-                    if matched7:
-                        state.ok()
-                        children3.extend(children9)
-                    else:
-                        state.restore()
-                        children9.clear()
-                if not matched7:
-                    state.checkpoint()
-                    # <String>
-                    if state.input.startswith('n', state.pos):
-                        state.pos += 1
-                        matched7 = True
-                    else:
-                        matched7 = False
-                        state.fail('"n"')
-                    # </String>
-                    if matched7:
-                        state.ok()
-                        children3.extend(children9)
-                    else:
-                        state.restore()
-                        children9.clear()
-                if not matched7:
-                    state.checkpoint()
-                    # <String>
-                    if state.input.startswith('r', state.pos):
-                        state.pos += 1
-                        matched7 = True
-                    else:
-                        matched7 = False
-                        state.fail('"r"')
-                    # </String>
-                    if matched7:
-                        state.ok()
-                        children3.extend(children9)
-                    else:
-                        state.restore()
-                        children9.clear()
-                if not matched7:
-                    state.checkpoint()
+            if 2 in attempt6:
+                state.checkpoint()
+                # <Group>
+                # <Sequence n=2>
+                all_ok11 = True
+                if all_ok11:
+                    matched10 = False
                     # <String>
-                    if state.input.startswith('t', state.pos):
+                    if state.input.startswith('\\', state.pos):
                         state.pos += 1
-                        matched7 = True
+                        matched10 = True
                     else:
-                        matched7 = False
-                        state.fail('"t"')
+                        matched10 = False
+                        state.fail('"\\"')
                     # </String>
-                    if matched7:
-                        state.ok()
-                        children3.extend(children9)
-                    else:
-                        state.restore()
-                        children9.clear()
-                if not matched7:
-                    state.checkpoint()
+                    if not matched10:
+                        all_ok11 = False
+                    if all_ok11:
+                        parse_trivia(state, children5)
+                if all_ok11:
+                    matched10 = False
                     # <String>
-                    if state.input.startswith('/', state.pos):
+                    if state.input.startswith("'", state.pos):
                         state.pos += 1
-                        matched7 = True
+                        matched10 = True
                     else:
-                        matched7 = False
-                        state.fail('"/"')
+                        matched10 = False
+                        state.fail('"\'"')
                     # </String>
-                    if matched7:
-                        state.ok()
-                        children3.extend(children9)
-                    else:
-                        state.restore()
-                        children9.clear()
-                if not matched7:
-                    state.checkpoint()
+                    if not matched10:
+                        all_ok11 = False
+                matched = all_ok11
+                # </Sequence>
+                # </Group>
+                if matched:
+                    state.ok()
+                    children2.extend(children5)
+                else:
+                    state.restore()
+                    children5.clear()
+            elif 2 in replay7:
+                record_failures(state, LABELS12)
+        if not matched:
+            if 3 in attempt6:
+                state.checkpoint()
+                # <Group>
+                # <Sequence n=2>
+                all_ok14 = True
+                if all_ok14:
+                    matched13 = False
                     # <String>
                     if state.input.startswith('\\', state.pos):
                         state.pos += 1
-                        matched7 = True
+                        matched13 = True
                     else:
-                        matched7 = False
+                        matched13 = False
                         state.fail('"\\"')
                     # </String>
-                    if matched7:
-                        state.ok()
-                        children3.extend(children9)
-                    else:
-                        state.restore()
-                        children9.clear()
-                if not matched7:
-                    state.checkpoint()
-                    # <Group>
-                    # <Sequence n=2>
-                    all_ok11 = True
-                    if all_ok11:
-                        matched10 = False
-                        # <String>
-                        if state.input.startswith('u', state.pos):
-                            state.pos += 1
-                            matched10 = True
-                        else:
-                            matched10 = False
-                            state.fail('"u"')
-                        # </String>
-                        if not matched10:
-                            all_ok11 = False
-                        if all_ok11:
-                            parse_trivia(state, children9)
-                    if all_ok11:
-                        matched10 = False
-                        # <Identifier>
-                        matched10 = parse_hexchar(state, children9)
-                        # </Identifier>
-                        if not matched10:
-                            all_ok11 = False
-                    matched7 = all_ok11
-                    # </Sequence>
-                    # </Group>
-                    if matched7:
-                        state.ok()
-                        children3.extend(children9)
+                    if not matched13:
+                        all_ok14 = False
+                    if all_ok14:
+                        parse_trivia(state, children5)
+                if all_ok14:
+                    matched13 = False
+                    # <DispatchChoice>
+                    children17: list[Pair] = []
+                    matched13 = False
+                    if state.pos < len(state.input):
+                        attempt18, replay19 = dispatch_alternatives(state, DISPATCH15.get(state.input[state.pos], DISPATCH16))
                     else:
-                        state.restore()
-                        children9.clear()
-                # </Choice>
-                if not matched7:
-                    all_ok8 = False
-            matched = all_ok8
-            # </Sequence>
-            # </Group>
-            if matched:
-                state.ok()
-                children2.extend(children3)
-            else:
-                state.restore()
-                children3.clear()
-        # </Choice>
+                        attempt18, replay19 = dispatch_alternatives(state, DISPATCH16)
+                    if not matched13:
+                        if 0 in attempt18:
+                            state.checkpoint()
+                            # <String>
+                            if state.input.startswith('b', state.pos):
+                                state.pos += 1
+                                matched13 = True
+                            else:
+                                matched13 = False
+                                state.fail('"b"')
+                            # </String>
+                            if matched13:
+                                state.ok()
+                                children5.extend(children17)
+                            else:
+                                state.restore()
+                                children17.clear()
+                        elif 0 in replay19:
+                            record_failures(state, LABELS20)
+                    if not matched13:
+                        if 1 in attempt18:
+                            state.checkpoint()
+                            # <String>
+                            if state.input.startswith('f', state.pos):
+                                state.pos += 1
+                                matched13 = True
+                            else:
+                                matched13 = False
+                                state.fail('"f"')
+                            # </String>
+                            if matched13:
+                                state.ok()
+                                children5.extend(children17)
+                            else:
+                                state.restore()
+                                children17.clear()
+                        elif 1 in replay19:
+                            record_failures(state, LABELS21)
+                    if not matched13:
+                        if 2 in attempt18:
+                            state.checkpoint()
+                            # <String>
+                            if state.input.startswith('n', state.pos):
+                                state.pos += 1
+                                matched13 = True
+                            else:
+                                matched13 = False
+                                state.fail('"n"')
+                            # </String>
+                            if matched13:
+                                state.ok()
+                                children5.extend(children17)
+                            else:
+                                state.restore()
+                                children17.clear()
+                        elif 2 in replay19:
+                            record_failures(state, LABELS22)
+                    if not matched13:
+                        if 3 in attempt18:
+                            state.checkpoint()
+                            # <String>
+                            if state.input.startswith('r', state.pos):
+                                state.pos += 1
+                                matched13 = True
+                            else:
+                                matched13 = False
+                                state.fail('"r"')
+                            # </String>
+                            if matched13:
+                                state.ok()
+                                children5.extend(children17)
+                            else:
+                                state.restore()
+                                children17.clear()
+                        elif 3 in replay19:
+                            record_failures(state, LABELS23)
+                    if not matched13:
+                        if 4 in attempt18:
+                            state.checkpoint()
+                            # <String>
+                            if state.input.startswith('t', state.pos):
+                                state.pos += 1
+                                matched13 = True
+                            else:
+                                matched13 = False
+                                state.fail('"t"')
+                            # </String>
+                            if matched13:
+                                state.ok()
+                                children5.extend(children17)
+                            else:
+                                state.restore()
+                                children17.clear()
+                        elif 4 in replay19:
+                            record_failures(state, LABELS24)
+                    if not matched13:
+                        if 5 in attempt18:
+                            state.checkpoint()
+                            # <String>
+                            if state.input.startswith('/', state.pos):
+                                state.pos += 1
+                                matched13 = True
+                            else:
+                                matched13 = False
+                                state.fail('"/"')
+                            # </String>
+                            if matched13:
+                                state.ok()
+                                children5.extend(children17)
+                            else:
+                                state.restore()
+                                children17.clear()
+                        elif 5 in replay19:
+                            record_failures(state, LABELS25)
+                    if not matched13:
+                        if 6 in attempt18:
+                            state.checkpoint()
+                            # <String>
+                            if state.input.startswith('\\', state.pos):
+                                state.pos += 1
+                                matched13 = True
+                            else:
+                                matched13 = False
+                                state.fail('"\\"')
+                            # </String>
+                            if matched13:
+                                state.ok()
+                                children5.extend(children17)
+                            else:
+                                state.restore()
+                                children17.clear()
+                        elif 6 in replay19:
+                            record_failures(state, LABELS26)
+                    if not matched13:
+                        if 7 in attempt18:
+                            state.checkpoint()
+                            # <Group>
+                            # <Sequence n=2>
+                            all_ok28 = True
+                            if all_ok28:
+                                matched27 = False
+                                # <String>
+                                if state.input.startswith('u', state.pos):
+                                    state.pos += 1
+                                    matched27 = True
+                                else:
+                                    matched27 = False
+                                    state.fail('"u"')
+                                # </String>
+                                if not matched27:
+                                    all_ok28 = False
+                                if all_ok28:
+                                    parse_trivia(state, children17)
+                            if all_ok28:
+                                matched27 = False
+                                # <Identifier>
+                                matched27 = parse_hexchar(state, children17)
+                                # </Identifier>
+                                if not matched27:
+                                    all_ok28 = False
+                            matched13 = all_ok28
+                            # </Sequence>
+                            # </Group>
+                            if matched13:
+                                state.ok()
+                                children5.extend(children17)
+                            else:
+                                state.restore()
+                                children17.clear()
+                        elif 7 in replay19:
+                            record_failures(state, LABELS29)
+                    # </DispatchChoice>
+                    if not matched13:
+                        all_ok14 = False
+                matched = all_ok14
+                # </Sequence>
+                # </Group>
+                if matched:
+                    state.ok()
+                    children2.extend(children5)
+                else:
+                    state.restore()
+                    children5.clear()
+            elif 3 in replay7:
+                record_failures(state, LABELS30)
+        # </DispatchChoice>
         state.rule_stack.pop()
         # Silent rule 'single_quoted_char'
         pairs.extend(children2)
@@ -1635,219 +1874,273 @@ def _parse_unescaped() -> Callable[[ParserState, list[Pair]], bool]:
 parse_unescaped = _parse_unescaped()
 
 def _parse_escapable() -> Callable[[ParserState, list[Pair]], bool]:
+    DISPATCH3 = {'/': (frozenset([5]), frozenset([5]), frozenset([0, 1, 2, 3, 4, 6, 7]), frozenset([0, 1, 2, 3, 4, 5, 6, 7])), '\\': (frozenset([6]), frozenset([6]), frozenset([0, 1, 2, 3, 4, 5, 7]), frozenset([0, 1, 2, 3, 4, 5, 6, 7])), 'b': (frozenset([0]), frozenset([0]), frozenset([1, 2, 3, 4, 5, 6, 7]), frozenset([0, 1, 2, 3, 4, 5, 6, 7])), 'f': (frozenset([1]), frozenset([1]), frozenset([0, 2, 3, 4, 5, 6, 7]), frozenset([0, 1, 2, 3, 4, 5, 6, 7])), 'n': (frozenset([2]), frozenset([2]), frozenset([0, 1, 3, 4, 5, 6, 7]), frozenset([0, 1, 2, 3, 4, 5, 6, 7])), 'r': (frozenset([3]), frozenset([3]), frozenset([0, 1, 2, 4, 5, 6, 7]), frozenset([0, 1, 2, 3, 4, 5, 6, 7])), 't': (frozenset([4]), frozenset([4]), frozenset([0, 1, 2, 3, 5, 6, 7]), frozenset([0, 1, 2, 3, 4, 5, 6, 7])), 'u': (frozenset([7]), frozenset([7]), frozenset([0, 1, 2, 3, 4, 5, 6]), frozenset([0, 1, 2, 3, 4, 5, 6, 7]))}
+    DISPATCH4 = (frozenset([]), frozenset([]), frozenset([0, 1, 2, 3, 4, 5, 6, 7]), frozenset([0, 1, 2, 3, 4, 5, 6, 7]))
+    LABELS8 = (((), '"b"'),)
+    LABELS9 = (((), '"f"'),)
+    LABELS10 = (((), '"n"'),)
+    LABELS11 = (((), '"r"'),)
+    LABELS12 = (((), '"t"'),)
+    LABELS13 = (((), '"/"'),)
+    LABELS14 = (((), '"\\"'),)
+    DISPATCH17 = {'0': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), '1': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), '2': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), '3': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), '4': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), '5': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), '6': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), '7': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), '8': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), '9': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), 'A': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), 'B': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), 'C': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), 'D': (frozenset([0, 1]), frozenset([0, 1]), frozenset([]), frozenset([0, 1])), 'E': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), 'F': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), 'a': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), 'b': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), 'c': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), 'd': (frozenset([0, 1]), frozenset([0, 1]), frozenset([]), frozenset([0, 1])), 'e': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), 'f': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1]))}
+    DISPATCH18 = (frozenset([]), frozenset([]), frozenset([0, 1]), frozenset([0, 1]))
+    FRAMES19 = {'high_surrogate': RuleFrame('high_surrogate', 2), 'non_surrogate': RuleFrame('non_surrogate', 2)}
+    LABELS23 = ((('non_surrogate',), '^"D"'),)
+    LABELS26 = ((('high_surrogate',), '^"D"'),)
+    LABELS27 = (((), '"u"'),)
+    
     rule_frame = RuleFrame('escapable', 2)
     
     def inner(state: ParserState, pairs: list[Pair]) -> bool:
         """Parse escapable."""
         state.rule_stack.push(rule_frame)
         children2: list[Pair] = []
-        # <Choice>
-        children3: list[Pair] = []
+        # <DispatchChoice>
+        children5: list[Pair] = []
         matched = False
+        if state.pos < len(state.input):
+            attempt6, replay7 = dispatch_alternatives(state, DISPATCH3.get(state.input[state.pos], DISPATCH4))
+        else:
+            attempt6, replay7 = dispatch_alternatives(state, DISPATCH4)
         if not matched:
-            state.checkpoint()
-            # <String>
-            if state.input.startswith('b', state.pos):
-                state.pos += 1
-                matched = True
-            else:
-                matched = False
-                state.fail('"b"')
-            # </String>
-            if matched:
-                state.ok()
-                children2.extend(children3)
-            else:
-                state.restore()
-                children3.clear()
+            if 0 in attempt6:
+                state.checkpoint()
+                # <String>
+                if state.input.startswith('b', state.pos):
+                    state.pos += 1
+                    matched = True
+                else:
+                    matched = False
+                    state.fail('"b"')
+                # </String>
+                if matched:
+                    state.ok()
+                    children2.extend(children5)
+                else:
+                    state.restore()
+                    children5.clear()
+            elif 0 in replay7:
+                record_failures(state, LABELS8)
         if not matched:
-            state.checkpoint()
-            # <String>
-            if state.input.startswith('f', state.pos):
-                state.pos += 1
-                matched = True
-            else:
-                matched = False
-                state.fail('"f"')
-            # </String>
-            if matched:
-                state.ok()
-                children2.extend(children3)
-            else:
-                state.restore()
-                children3.clear()
+            if 1 in attempt6:
+                state.checkpoint()
+                # <String>
+                if state.input.startswith('f', state.pos):
+                    state.pos += 1
+                    matched = True
+                else:
+                    matched = False
+                    state.fail('"f"')
+                # </String>
+                if matched:
+                    state.ok()
+                    children2.extend(children5)
+                else:
+                    state.restore()
+                    children5.clear()
+            elif 1 in replay7:
+                record_failures(state, LABELS9)
         if not matched:
-            state.checkpoint()
-            # <String>
-            if state.input.startswith('n', state.pos):
-                state.pos += 1
-                matched = True
-            else:
-                matched = False
-                state.fail('"n"')
-            # </String>
-            if matched:
-                state.ok()
-                children2.extend(children3)
-            else:
-                state.restore()
-                children3.clear()
-        if not matched:
-            state.checkpoint()
-            # <String>
-            if state.input.startswith('r', state.pos):
-                state.pos += 1
-                matched = True
-            else:
-                matched = False
-                state.fail('"r"')
-            # </String>
-            if matched:
-                state.ok()
-                children2.extend(children3)
-            else:
-                state.restore()
-                children3.clear()
+            if 2 in attempt6:
+                state.checkpoint()
+                # <String>
+                if state.input.startswith('n', state.pos):
+                    state.pos += 1
+                    matched = True
+                else:
+                    matched = False
+                    state.fail('"n"')
+                # </String>
+                if matched:
+                    state.ok()
+                    children2.extend(children5)
+                else:
+                    state.restore()
+                    children5.clear()
+            elif 2 in replay7:
+                record_failures(state, LABELS10)
         if not matched:
-            state.checkpoint()
-            # <String>
-            if state.input.startswith('t', state.pos):
-                state.pos += 1
-                matched = True
-            else:
-                matched = False
-                state.fail('"t"')
-            # </String>
-            if matched:
-                state.ok()
-                children2.extend(children3)
-            else:
-                state.restore()
-                children3.clear()
+            if 3 in attempt6:
+                state.checkpoint()
+                # <String>
+                if state.input.startswith('r', state.pos):
+                    state.pos += 1
+                    matched = True
+                else:
+                    matched = False
+                    state.fail('"r"')
+                # </String>
+                if matched:
+                    state.ok()
+                    children2.extend(children5)
+                else:
+                    state.restore()
+                    children5.clear()
+            elif 3 in replay7:
+                record_failures(state, LABELS11)
         if not matched:
-            state.checkpoint()
-            # <String>
-            if state.input.startswith('/', state.pos):
-                state.pos += 1
-                matched = True
-            else:
-                matched = False
-                state.fail('"/"')
-            # </String>
-            if matched:
-                state.ok()
-                children2.extend(children3)
-            else:
-                state.restore()
-                children3.clear()
+            if 4 in attempt6:
+                state.checkpoint()
+                # <String>
+                if state.input.startswith('t', state.pos):
+                    state.pos += 1
+                    matched = True
+                else:
+                    matched = False
+                    state.fail('"t"')
+                # </String>
+                if matched:
+                    state.ok()
+                    children2.extend(children5)
+                else:
+                    state.restore()
+                    children5.clear()
+            elif 4 in replay7:
+                record_failures(state, LABELS12)
         if not matched:
-            state.checkpoint()
-            # <String>
-            if state.input.startswith('\\', state.pos):
-                state.pos += 1
-                matched = True
-            else:
-                matched = False
-                state.fail('"\\"')
-            # </String>
-            if matched:
-                state.ok()
-                children2.extend(children3)
-            else:
-                state.restore()
-                children3.clear()
+            if 5 in attempt6:
+                state.checkpoint()
+                # <String>
+                if state.input.startswith('/', state.pos):
+                    state.pos += 1
+                    matched = True
+                else:
+                    matched = False
+                    state.fail('"/"')
+                # </String>
+                if matched:
+                    state.ok()
+                    children2.extend(children5)
+                else:
+                    state.restore()
+                    children5.clear()
+            elif 5 in replay7:
+                record_failures(state, LABELS13)
         if not matched:
-            state.checkpoint()
-            # <Group>
-            # <Sequence n=2>
-            all_ok5 = True
-            if all_ok5:
-                matched4 = False
+            if 6 in attempt6:
+                state.checkpoint()
                 # <String>
-                if state.input.startswith('u', state.pos):
+                if state.input.startswith('\\', state.pos):
                     state.pos += 1
-                    matched4 = True
+                    matched = True
                 else:
-                    matched4 = False
-                    state.fail('"u"')
+                    matched = False
+                    state.fail('"\\"')
                 # </String>
-                if not matched4:
-                    all_ok5 = False
-                if all_ok5:
-                    parse_trivia(state, children3)
-            if all_ok5:
-                matched4 = False
-                # <Choice>
-                children6: list[Pair] = []
-                matched4 = False
-                if not matched4:
-                    state.checkpoint()
-                    # <Identifier>
-                    matched4 = parse_non_surrogate(state, children6)
-                    # </Identifier>
-                    if matched4:
-                        state.ok()
-                        children3.extend(children6)
+                if matched:
+                    state.ok()
+                    children2.extend(children5)
+                else:
+                    state.restore()
+                    children5.clear()
+            elif 6 in replay7:
+                record_failures(state, LABELS14)
+        if not matched:
+            if 7 in attempt6:
+                state.checkpoint()
+                # <Group>
+                # <Sequence n=2>
+                all_ok16 = True
+                if all_ok16:
+                    matched15 = False
+                    # <String>
+                    if state.input.startswith('u', state.pos):
+                        state.pos += 1
+                        matched15 = True
                     else:
-                        state.restore()
-                        children6.clear()
-                if not matched4:
-                    state.checkpoint()
-                    # <Group>
-                    # <Sequence n=3>
-                    all_ok8 = True
-                    if all_ok8:
-                        matched7 = False
-                        # <Identifier>
-                        matched7 = parse_high_surrogate(state, children6)
-                        # </Identifier>
-                        if not matched7:
-                            all_ok8 = False
-                        if all_ok8:
-                            parse_trivia(state, children6)
-                    if all_ok8:
-                        matched7 = False
-                        # <String>
-                        if state.input.startswith('\\u', state.pos):
-                            state.pos += 2
-                            matched7 = True
-                        else:
-                            matched7 = False
-                            state.fail('"\\u"')
-                        # </String>
-                        if not matched7:
-                            all_ok8 = False
-                        if all_ok8:
-                            parse_trivia(state, children6)
-                    if all_ok8:
-                        matched7 = False
-                        # <Identifier>
-                        matched7 = parse_low_surrogate(state, children6)
-                        # </Identifier>
-                        if not matched7:
-                            all_ok8 = False
-                    matched4 = all_ok8
-                    # </Sequence>
-                    # </Group>
-                    if matched4:
-                        state.ok()
-                        children3.extend(children6)
+                        matched15 = False
+                        state.fail('"u"')
+                    # </String>
+                    if not matched15:
+                        all_ok16 = False
+                    if all_ok16:
+                        parse_trivia(state, children5)
+                if all_ok16:
+                    matched15 = False
+                    # <DispatchChoice>
+                    children20: list[Pair] = []
+                    matched15 = False
+                    if state.pos < len(state.input):
+                        attempt21, replay22 = dispatch_alternatives(state, DISPATCH17.get(state.input[state.pos], DISPATCH18))
                     else:
-                        state.restore()
-                        children6.clear()
-                # </Choice>
-                if not matched4:
-                    all_ok5 = False
-            matched = all_ok5
-            # </Sequence>
-            # </Group>
-            if matched:
-                state.ok()
-                children2.extend(children3)
-            else:
-                state.restore()
-                children3.clear()
-        # </Choice>
+                        attempt21, replay22 = dispatch_alternatives(state, DISPATCH18)
+                    if not matched15:
+                        if 0 in attempt21:
+                            state.checkpoint()
+                            # <Identifier>
+                            matched15 = parse_non_surrogate(state, children20)
+                            # </Identifier>
+                            if matched15:
+                                state.ok()
+                                children5.extend(children20)
+                            else:
+                                state.restore()
+                                children20.clear()
+                        elif 0 in replay22:
+                            record_failures(state, LABELS23, FRAMES19)
+                    if not matched15:
+                        if 1 in attempt21:
+                            state.checkpoint()
+                            # <Group>
+                            # <Sequence n=3>
+                            all_ok25 = True
+                            if all_ok25:
+                                matched24 = False
+                                # <Identifier>
+                                matched24 = parse_high_surrogate(state, children20)
+                                # </Identifier>
+                                if not matched24:
+                                    all_ok25 = False
+                                if all_ok25:
+                                    parse_trivia(state, children20)
+                            if all_ok25:
+                                matched24 = False
+                                # <String>
+                                if state.input.startswith('\\u', state.pos):
+                                    state.pos += 2
+                                    matched24 = True
+                                else:
+                                    matched24 = False
+                                    state.fail('"\\u"')
+                                # </String>
+                                if not matched24:
+                                    all_ok25 = False
+                                if all_ok25:
+                                    parse_trivia(state, children20)
+                            if all_ok25:
+                                matched24 = False
+                                # <Identifier>
+                                matched24 = parse_low_surrogate(state, children20)
+                                # </Identifier>
+                                if not matched24:
+                                    all_ok25 = False
+                            matched15 = all_ok25
+                            # </Sequence>
+                            # </Group>
+                            if matched15:
+                                state.ok()
+                                children5.extend(children20)
+                            else:
+                                state.restore()
+                                children20.clear()
+                        elif 1 in replay22:
+                            record_failures(state, LABELS26, FRAMES19)
+                    # </DispatchChoice>
+                    if not matched15:
+                        all_ok16 = False
+                matched = all_ok16
+                # </Sequence>
+                # </Group>
+                if matched:
+                    state.ok()
+                    children2.extend(children5)
+                else:
+                    state.restore()
+                    children5.clear()
+            elif 7 in replay7:
+                record_failures(state, LABELS27)
+        # </DispatchChoice>
         state.rule_stack.pop()
         # Silent rule 'escapable'
         pairs.extend(children2)
@@ -1858,22 +2151,29 @@ def _parse_escapable() -> Callable[[ParserState, list[Pair]], bool]:
 parse_escapable = _parse_escapable()
 
 def _parse_hexchar() -> Callable[[ParserState, list[Pair]], bool]:
-    RE7 = re.compile('[ABCEFabcef0-9]', re.VERSION1)
-    RE10 = re.compile('[0-9A-Fa-f]', re.VERSION1)
-    RE11 = re.compile('[0-9A-Fa-f]', re.VERSION1)
-    RE12 = re.compile('[0-9A-Fa-f]', re.VERSION1)
-    RE15 = re.compile('D', re.I)
-    RE16 = re.compile('[0-7]', re.I)
+    DISPATCH3 = {'0': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), '1': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), '2': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), '3': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), '4': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), '5': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), '6': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), '7': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), '8': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), '9': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), 'A': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), 'B': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), 'C': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), 'D': (frozenset([0, 1]), frozenset([0, 1]), frozenset([]), frozenset([0, 1])), 'E': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), 'F': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), 'a': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), 'b': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), 'c': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), 'd': (frozenset([0, 1]), frozenset([0, 1]), frozenset([]), frozenset([0, 1])), 'e': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), 'f': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1]))}
+    DISPATCH4 = (frozenset([]), frozenset([]), frozenset([0, 1]), frozenset([0, 1]))
+    DISPATCH8 = {'0': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), '1': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), '2': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), '3': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), '4': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), '5': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), '6': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), '7': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), '8': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), '9': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), 'A': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), 'B': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), 'C': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), 'D': (frozenset([1]), frozenset([1]), frozenset([]), frozenset([0, 1])), 'E': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), 'F': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), 'a': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), 'b': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), 'c': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), 'd': (frozenset([1]), frozenset([1]), frozenset([]), frozenset([0, 1])), 'e': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), 'f': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1]))}
+    DISPATCH9 = (frozenset([]), frozenset([]), frozenset([1]), frozenset([0, 1]))
+    RE15 = re.compile('[ABCEFabcef0-9]', re.VERSION1)
+    RE18 = re.compile('[0-9A-Fa-f]', re.VERSION1)
     RE19 = re.compile('[0-9A-Fa-f]', re.VERSION1)
     RE20 = re.compile('[0-9A-Fa-f]', re.VERSION1)
-    RE25 = re.compile('D', re.I)
-    RE26 = re.compile('[89ABab]', re.VERSION1)
-    RE29 = re.compile('[0-9A-Fa-f]', re.VERSION1)
-    RE30 = re.compile('[0-9A-Fa-f]', re.VERSION1)
-    RE33 = re.compile('D', re.I)
-    RE34 = re.compile('[CDEFcdef]', re.VERSION1)
-    RE37 = re.compile('[0-9A-Fa-f]', re.VERSION1)
-    RE38 = re.compile('[0-9A-Fa-f]', re.VERSION1)
+    RE23 = re.compile('D', re.I)
+    RE24 = re.compile('[0-7]')
+    RE27 = re.compile('[0-9A-Fa-f]', re.VERSION1)
+    RE28 = re.compile('[0-9A-Fa-f]', re.VERSION1)
+    LABELS29 = (((), '^"D"'),)
+    LABELS30 = (((), '^"D"'),)
+    RE35 = re.compile('D', re.I)
+    RE36 = re.compile('[89ABab]', re.VERSION1)
+    RE39 = re.compile('[0-9A-Fa-f]', re.VERSION1)
+    RE40 = re.compile('[0-9A-Fa-f]', re.VERSION1)
+    RE43 = re.compile('D', re.I)
+    RE44 = re.compile('[CDEFcdef]', re.VERSION1)
+    RE47 = re.compile('[0-9A-Fa-f]', re.VERSION1)
+    RE48 = re.compile('[0-9A-Fa-f]', re.VERSION1)
+    LABELS49 = (((), '^"D"'),)
     
     rule_frame = RuleFrame('hexchar', 2)
     
@@ -1881,338 +2181,356 @@ def _parse_hexchar() -> Callable[[ParserState, list[Pair]], bool]:
         """Parse hexchar."""
         state.rule_stack.push(rule_frame)
         children2: list[Pair] = []
-        # <Choice>
-        children3: list[Pair] = []
+        # <DispatchChoice>
+        children5: list[Pair] = []
         matched = False
+        if state.pos < len(state.input):
+            attempt6, replay7 = dispatch_alternatives(state, DISPATCH3.get(state.input[state.pos], DISPATCH4))
+        else:
+            attempt6, replay7 = dispatch_alternatives(state, DISPATCH4)
         if not matched:
-            state.checkpoint()
-            # <Choice>
-            children4: list[Pair] = []
-            matched = False
-            if not matched:
+            if 0 in attempt6:
                 state.checkpoint()
-                # <Group>
-                # <Sequence n=2>
-                all_ok6 = True
-                if all_ok6:
-                    matched5 = False
-                    # <Group>
-                    # <ChoiceRegex>
-                    if match := RE7.match(state.input, state.pos):
-                        state.pos = match.end()
-                        matched5 = True
-                    else:
-                        matched5 = False
-                    # </ChoiceRegex>
-                    # </Group>
-                    if not matched5:
-                        all_ok6 = False
-                    if all_ok6:
-                        parse_trivia(state, children4)
-                if all_ok6:
-                    matched5 = False
-                    # <Sequence n=3>
-                    all_ok9 = True
-                    if all_ok9:
-                        matched8 = False
-                        # <ChoiceRegex>
-                        if match := RE10.match(state.input, state.pos):
-                            state.pos = match.end()
-                            matched8 = True
-                        else:
-                            matched8 = False
-                        # </ChoiceRegex>
-                        if not matched8:
-                            all_ok9 = False
-                        if all_ok9:
-                            parse_trivia(state, children4)
-                    if all_ok9:
-                        matched8 = False
-                        # <ChoiceRegex>
-                        if match := RE11.match(state.input, state.pos):
-                            state.pos = match.end()
-                            matched8 = True
-                        else:
-                            matched8 = False
-                        # </ChoiceRegex>
-                        if not matched8:
-                            all_ok9 = False
-                        if all_ok9:
-                            parse_trivia(state, children4)
-                    if all_ok9:
-                        matched8 = False
-                        # <ChoiceRegex>
-                        if match := RE12.match(state.input, state.pos):
-                            state.pos = match.end()
-                            matched8 = True
-                        else:
-                            matched8 = False
-                        # </ChoiceRegex>
-                        if not matched8:
-                            all_ok9 = False
-                    matched5 = all_ok9
-                    # </Sequence>
-                    if not matched5:
-                        all_ok6 = False
-                matched = all_ok6
-                # </Sequence>
-                # </Group>
-                if matched:
-                    state.ok()
-                    children3.extend(children4)
+                # <DispatchChoice>
+                children10: list[Pair] = []
+                matched = False
+                if state.pos < len(state.input):
+                    attempt11, replay12 = dispatch_alternatives(state, DISPATCH8.get(state.input[state.pos], DISPATCH9))
                 else:
-                    state.restore()
-                    children4.clear()
-            if not matched:
-                state.checkpoint()
-                # <Group>
-                # <Sequence n=3>
-                all_ok14 = True
-                if all_ok14:
-                    matched13 = False
-                    # <CIString>
-                    if match := RE15.match(state.input, state.pos):
-                        state.pos = match.end()
-                        matched13 = True
-                    else:
-                        matched13 = False
-                        state.fail('^"D"')
-                    # </CIString>
-                    if not matched13:
-                        all_ok14 = False
-                    if all_ok14:
-                        parse_trivia(state, children4)
-                if all_ok14:
-                    matched13 = False
-                    # <Range>
-                    if match := RE16.match(state.input, state.pos):
-                        state.pos = match.end()
-                        matched13 = True
-                    else:
-                        matched13 = False
-                        state.fail("''0''..''7''")
-                    # </Range>
-                    if not matched13:
-                        all_ok14 = False
-                    if all_ok14:
-                        parse_trivia(state, children4)
-                if all_ok14:
-                    matched13 = False
-                    # <Sequence n=2>
-                    all_ok18 = True
-                    if all_ok18:
-                        matched17 = False
-                        # <ChoiceRegex>
-                        if match := RE19.match(state.input, state.pos):
-                            state.pos = match.end()
-                            matched17 = True
+                    attempt11, replay12 = dispatch_alternatives(state, DISPATCH9)
+                if not matched:
+                    if 0 in attempt11:
+                        state.checkpoint()
+                        # <Group>
+                        # <Sequence n=2>
+                        all_ok14 = True
+                        if all_ok14:
+                            matched13 = False
+                            # <Group>
+                            # <ChoiceRegex>
+                            if match := RE15.match(state.input, state.pos):
+                                state.pos = match.end()
+                                matched13 = True
+                            else:
+                                matched13 = False
+                            # </ChoiceRegex>
+                            # </Group>
+                            if not matched13:
+                                all_ok14 = False
+                            if all_ok14:
+                                parse_trivia(state, children10)
+                        if all_ok14:
+                            matched13 = False
+                            # <Sequence n=3>
+                            all_ok17 = True
+                            if all_ok17:
+                                matched16 = False
+                                # <ChoiceRegex>
+                                if match := RE18.match(state.input, state.pos):
+                                    state.pos = match.end()
+                                    matched16 = True
+                                else:
+                                    matched16 = False
+                                # </ChoiceRegex>
+                                if not matched16:
+                                    all_ok17 = False
+                                if all_ok17:
+                                    parse_trivia(state, children10)
+                            if all_ok17:
+                                matched16 = False
+                                # <ChoiceRegex>
+                                if match := RE19.match(state.input, state.pos):
+                                    state.pos = match.end()
+                                    matched16 = True
+                                else:
+                                    matched16 = False
+                                # </ChoiceRegex>
+                                if not matched16:
+                                    all_ok17 = False
+                                if all_ok17:
+                                    parse_trivia(state, children10)
+                            if all_ok17:
+                                matched16 = False
+                                # <ChoiceRegex>
+                                if match := RE20.match(state.input, state.pos):
+                                    state.pos = match.end()
+                                    matched16 = True
+                                else:
+                                    matched16 = False
+                                # </ChoiceRegex>
+                                if not matched16:
+                                    all_ok17 = False
+                            matched13 = all_ok17
+                            # </Sequence>
+                            if not matched13:
+                                all_ok14 = False
+                        matched = all_ok14
+                        # </Sequence>
+                        # </Group>
+                        if matched:
+                            state.ok()
+                            children5.extend(children10)
                         else:
-                            matched17 = False
-                        # </ChoiceRegex>
-                        if not matched17:
-                            all_ok18 = False
-                        if all_ok18:
-                            parse_trivia(state, children4)
-                    if all_ok18:
-                        matched17 = False
-                        # <ChoiceRegex>
-                        if match := RE20.match(state.input, state.pos):
-                            state.pos = match.end()
-                            matched17 = True
+                            state.restore()
+                            children10.clear()
+                if not matched:
+                    if 1 in attempt11:
+                        state.checkpoint()
+                        # <Group>
+                        # <Sequence n=3>
+                        all_ok22 = True
+                        if all_ok22:
+                            matched21 = False
+                            # <CIString>
+                            if match := RE23.match(state.input, state.pos):
+                                state.pos = match.end()
+                                matched21 = True
+                            else:
+                                matched21 = False
+                                state.fail('^"D"')
+                            # </CIString>
+                            if not matched21:
+                                all_ok22 = False
+                            if all_ok22:
+                                parse_trivia(state, children10)
+                        if all_ok22:
+                            matched21 = False
+                            # <Range>
+                            if match := RE24.match(state.input, state.pos):
+                                state.pos = match.end()
+                                matched21 = True
+                            else:
+                                matched21 = False
+                                state.fail("''0''..''7''")
+                            # </Range>
+                            if not matched21:
+                                all_ok22 = False
+                            if all_ok22:
+                                parse_trivia(state, children10)
+                        if all_ok22:
+                            matched21 = False
+                            # <Sequence n=2>
+                            all_ok26 = True
+                            if all_ok26:
+                                matched25 = False
+                                # <ChoiceRegex>
+                                if match := RE27.match(state.input, state.pos):
+                                    state.pos = match.end()
+                                    matched25 = True
+                                else:
+                                    matched25 = False
+                                # </ChoiceRegex>
+                                if not matched25:
+                                    all_ok26 = False
+                                if all_ok26:
+                                    parse_trivia(state, children10)
+                            if all_ok26:
+                                matched25 = False
+                                # <ChoiceRegex>
+                                if match := RE28.match(state.input, state.pos):
+                                    state.pos = match.end()
+                                    matched25 = True
+                                else:
+                                    matched25 = False
+                                # </ChoiceRegex>
+                                if not matched25:
+                                    all_ok26 = False
+                            matched21 = all_ok26
+                            # </Sequence>
+                            if not matched21:
+                                all_ok22 = False
+                        matched = all_ok22
+                        # </Sequence>
+                        # </Group>
+                        if matched:
+                            state.ok()
+                            children5.extend(children10)
                         else:
-                            matched17 = False
-                        # </ChoiceRegex>
-                        if not matched17:
-                            all_ok18 = False
-                    matched13 = all_ok18
-                    # </Sequence>
-                    if not matched13:
-                        all_ok14 = False
-                matched = all_ok14
-                # </Sequence>
-                # </Group>
+                            state.restore()
+                            children10.clear()
+                    elif 1 in replay12:
+                        record_failures(state, LABELS29)
+                # </DispatchChoice>
                 if matched:
                     state.ok()
-                    children3.extend(children4)
+                    children2.extend(children5)
                 else:
                     state.restore()
-                    children4.clear()
-            # </Choice>
-            if matched:
-                state.ok()
-                children2.extend(children3)
-            else:
-                state.restore()
-                children3.clear()
+                    children5.clear()
+            elif 0 in replay7:
+                record_failures(state, LABELS30)
         if not matched:
-            state.checkpoint()
-            # <Group>
-            # <Sequence n=3>
-            all_ok22 = True
-            if all_ok22:
-                matched21 = False
+            if 1 in attempt6:
+                state.checkpoint()
+                # <Group>
                 # <Sequence n=3>
-                all_ok24 = True
-                if all_ok24:
-                    matched23 = False
-                    # <CIString>
-                    if match := RE25.match(state.input, state.pos):
-                        state.pos = match.end()
-                        matched23 = True
-                    else:
-                        matched23 = False
-                        state.fail('^"D"')
-                    # </CIString>
-                    if not matched23:
-                        all_ok24 = False
-                    if all_ok24:
-                        parse_trivia(state, children3)
-                if all_ok24:
-                    matched23 = False
-                    # <Group>
-                    # <ChoiceRegex>
-                    if match := RE26.match(state.input, state.pos):
-                        state.pos = match.end()
-                        matched23 = True
-                    else:
-                        matched23 = False
-                    # </ChoiceRegex>
-                    # </Group>
-                    if not matched23:
-                        all_ok24 = False
-                    if all_ok24:
-                        parse_trivia(state, children3)
-                if all_ok24:
-                    matched23 = False
-                    # <Sequence n=2>
-                    all_ok28 = True
-                    if all_ok28:
-                        matched27 = False
-                        # <ChoiceRegex>
-                        if match := RE29.match(state.input, state.pos):
+                all_ok32 = True
+                if all_ok32:
+                    matched31 = False
+                    # <Sequence n=3>
+                    all_ok34 = True
+                    if all_ok34:
+                        matched33 = False
+                        # <CIString>
+                        if match := RE35.match(state.input, state.pos):
                             state.pos = match.end()
-                            matched27 = True
+                            matched33 = True
                         else:
-                            matched27 = False
-                        # </ChoiceRegex>
-                        if not matched27:
-                            all_ok28 = False
-                        if all_ok28:
-                            parse_trivia(state, children3)
-                    if all_ok28:
-                        matched27 = False
+                            matched33 = False
+                            state.fail('^"D"')
+                        # </CIString>
+                        if not matched33:
+                            all_ok34 = False
+                        if all_ok34:
+                            parse_trivia(state, children5)
+                    if all_ok34:
+                        matched33 = False
+                        # <Group>
                         # <ChoiceRegex>
-                        if match := RE30.match(state.input, state.pos):
+                        if match := RE36.match(state.input, state.pos):
                             state.pos = match.end()
-                            matched27 = True
+                            matched33 = True
                         else:
-                            matched27 = False
+                            matched33 = False
                         # </ChoiceRegex>
-                        if not matched27:
-                            all_ok28 = False
-                    matched23 = all_ok28
+                        # </Group>
+                        if not matched33:
+                            all_ok34 = False
+                        if all_ok34:
+                            parse_trivia(state, children5)
+                    if all_ok34:
+                        matched33 = False
+                        # <Sequence n=2>
+                        all_ok38 = True
+                        if all_ok38:
+                            matched37 = False
+                            # <ChoiceRegex>
+                            if match := RE39.match(state.input, state.pos):
+                                state.pos = match.end()
+                                matched37 = True
+                            else:
+                                matched37 = False
+                            # </ChoiceRegex>
+                            if not matched37:
+                                all_ok38 = False
+                            if all_ok38:
+                                parse_trivia(state, children5)
+                        if all_ok38:
+                            matched37 = False
+                            # <ChoiceRegex>
+                            if match := RE40.match(state.input, state.pos):
+                                state.pos = match.end()
+                                matched37 = True
+                            else:
+                                matched37 = False
+                            # </ChoiceRegex>
+                            if not matched37:
+                                all_ok38 = False
+                        matched33 = all_ok38
+                        # </Sequence>
+                        if not matched33:
+                            all_ok34 = False
+                    matched31 = all_ok34
                     # </Sequence>
-                    if not matched23:
-                        all_ok24 = False
-                matched21 = all_ok24
-                # </Sequence>
-                if not matched21:
-                    all_ok22 = False
-                if all_ok22:
-                    parse_trivia(state, children3)
-            if all_ok22:
-                matched21 = False
-                # <String>
-                if state.input.startswith('\\u', state.pos):
-                    state.pos += 2
-                    matched21 = True
-                else:
-                    matched21 = False
-                    state.fail('"\\u"')
-                # </String>
-                if not matched21:
-                    all_ok22 = False
-                if all_ok22:
-                    parse_trivia(state, children3)
-            if all_ok22:
-                matched21 = False
-                # <Sequence n=3>
-                all_ok32 = True
-                if all_ok32:
-                    matched31 = False
-                    # <CIString>
-                    if match := RE33.match(state.input, state.pos):
-                        state.pos = match.end()
-                        matched31 = True
-                    else:
-                        matched31 = False
-                        state.fail('^"D"')
-                    # </CIString>
                     if not matched31:
                         all_ok32 = False
                     if all_ok32:
-                        parse_trivia(state, children3)
+                        parse_trivia(state, children5)
                 if all_ok32:
                     matched31 = False
-                    # <Group>
-                    # <ChoiceRegex>
-                    if match := RE34.match(state.input, state.pos):
-                        state.pos = match.end()
+                    # <String>
+                    if state.input.startswith('\\u', state.pos):
+                        state.pos += 2
                         matched31 = True
                     else:
                         matched31 = False
-                    # </ChoiceRegex>
-                    # </Group>
+                        state.fail('"\\u"')
+                    # </String>
                     if not matched31:
                         all_ok32 = False
                     if all_ok32:
-                        parse_trivia(state, children3)
+                        parse_trivia(state, children5)
                 if all_ok32:
                     matched31 = False
-                    # <Sequence n=2>
-                    all_ok36 = True
-                    if all_ok36:
-                        matched35 = False
-                        # <ChoiceRegex>
-                        if match := RE37.match(state.input, state.pos):
+                    # <Sequence n=3>
+                    all_ok42 = True
+                    if all_ok42:
+                        matched41 = False
+                        # <CIString>
+                        if match := RE43.match(state.input, state.pos):
                             state.pos = match.end()
-                            matched35 = True
+                            matched41 = True
                         else:
-                            matched35 = False
-                        # </ChoiceRegex>
-                        if not matched35:
-                            all_ok36 = False
-                        if all_ok36:
-                            parse_trivia(state, children3)
-                    if all_ok36:
-                        matched35 = False
+                            matched41 = False
+                            state.fail('^"D"')
+                        # </CIString>
+                        if not matched41:
+                            all_ok42 = False
+                        if all_ok42:
+                            parse_trivia(state, children5)
+                    if all_ok42:
+                        matched41 = False
+                        # <Group>
                         # <ChoiceRegex>
-                        if match := RE38.match(state.input, state.pos):
+                        if match := RE44.match(state.input, state.pos):
                             state.pos = match.end()
-                            matched35 = True
+                            matched41 = True
                         else:
-                            matched35 = False
+                            matched41 = False
                         # </ChoiceRegex>
-                        if not matched35:
-                            all_ok36 = False
-                    matched31 = all_ok36
+                        # </Group>
+                        if not matched41:
+                            all_ok42 = False
+                        if all_ok42:
+                            parse_trivia(state, children5)
+                    if all_ok42:
+                        matched41 = False
+                        # <Sequence n=2>
+                        all_ok46 = True
+                        if all_ok46:
+                            matched45 = False
+                            # <ChoiceRegex>
+                            if match := RE47.match(state.input, state.pos):
+                                state.pos = match.end()
+                                matched45 = True
+                            else:
+                                matched45 = False
+                            # </ChoiceRegex>
+                            if not matched45:
+                                all_ok46 = False
+                            if all_ok46:
+                                parse_trivia(state, children5)
+                        if all_ok46:
+                            matched45 = False
+                            # <ChoiceRegex>
+                            if match := RE48.match(state.input, state.pos):
+                                state.pos = match.end()
+                                matched45 = True
+                            else:
+                                matched45 = False
+                            # </ChoiceRegex>
+                            if not matched45:
+                                all_ok46 = False
+                        matched41 = all_ok46
+                        # </Sequence>
+                        if not matched41:
+                            all_ok42 = False
+                    matched31 = all_ok42
                     # </Sequence>
                     if not matched31:
                         all_ok32 = False
-                matched21 = all_ok32
+                matched = all_ok32
                 # </Sequence>
-                if not matched21:
-                    all_ok22 = False
-            matched = all_ok22
-            # </Sequence>
-            # </Group>
-            if matched:
-                state.ok()
-                children2.extend(children3)
-            else:
-                state.restore()
-                children3.clear()
-        # </Choice>
+                # </Group>
+                if matched:
+                    state.ok()
+                    children2.extend(children5)
+                else:
+                    state.restore()
+                    children5.clear()
+            elif 1 in replay7:
+                record_failures(state, LABELS49)
+        # </DispatchChoice>
         state.rule_stack.pop()
         # Silent rule 'hexchar'
         pairs.extend(children2)
@@ -2223,14 +2541,17 @@ def _parse_hexchar() -> Callable[[ParserState, list[Pair]], bool]:
 parse_hexchar = _parse_hexchar()
 
 def _parse_non_surrogate() -> Callable[[ParserState, list[Pair]], bool]:
-    RE6 = re.compile('[ABCEFabcef0-9]', re.VERSION1)
-    RE9 = re.compile('[0-9A-Fa-f]', re.VERSION1)
-    RE10 = re.compile('[0-9A-Fa-f]', re.VERSION1)
-    RE11 = re.compile('[0-9A-Fa-f]', re.VERSION1)
-    RE14 = re.compile('D', re.I)
-    RE15 = re.compile('[0-7]', re.I)
-    RE18 = re.compile('[0-9A-Fa-f]', re.VERSION1)
-    RE19 = re.compile('[0-9A-Fa-f]', re.VERSION1)
+    DISPATCH3 = {'0': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), '1': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), '2': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), '3': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), '4': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), '5': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), '6': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), '7': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), '8': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), '9': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), 'A': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), 'B': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), 'C': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), 'D': (frozenset([1]), frozenset([1]), frozenset([]), frozenset([0, 1])), 'E': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), 'F': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), 'a': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), 'b': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), 'c': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), 'd': (frozenset([1]), frozenset([1]), frozenset([]), frozenset([0, 1])), 'e': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), 'f': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1]))}
+    DISPATCH4 = (frozenset([]), frozenset([]), frozenset([1]), frozenset([0, 1]))
+    RE10 = re.compile('[ABCEFabcef0-9]', re.VERSION1)
+    RE13 = re.compile('[0-9A-Fa-f]', re.VERSION1)
+    RE14 = re.compile('[0-9A-Fa-f]', re.VERSION1)
+    RE15 = re.compile('[0-9A-Fa-f]', re.VERSION1)
+    RE18 = re.compile('D', re.I)
+    RE19 = re.compile('[0-7]')
+    RE22 = re.compile('[0-9A-Fa-f]', re.VERSION1)
+    RE23 = re.compile('[0-9A-Fa-f]', re.VERSION1)
+    LABELS24 = (((), '^"D"'),)
     
     rule_frame = RuleFrame('non_surrogate', 2)
     
@@ -2238,158 +2559,166 @@ def _parse_non_surrogate() -> Callable[[ParserState, list[Pair]], bool]:
         """Parse non_surrogate."""
         state.rule_stack.push(rule_frame)
         children2: list[Pair] = []
-        # <Choice>
-        children3: list[Pair] = []
+        # <DispatchChoice>
+        children5: list[Pair] = []
         matched = False
+        if state.pos < len(state.input):
+            attempt6, replay7 = dispatch_alternatives(state, DISPATCH3.get(state.input[state.pos], DISPATCH4))
+        else:
+            attempt6, replay7 = dispatch_alternatives(state, DISPATCH4)
         if not matched:
-            state.checkpoint()
-            # <Group>
-            # <Sequence n=2>
-            all_ok5 = True
-            if all_ok5:
-                matched4 = False
+            if 0 in attempt6:
+                state.checkpoint()
                 # <Group>
-                # <ChoiceRegex>
-                if match := RE6.match(state.input, state.pos):
-                    state.pos = match.end()
-                    matched4 = True
-                else:
-                    matched4 = False
-                # </ChoiceRegex>
-                # </Group>
-                if not matched4:
-                    all_ok5 = False
-                if all_ok5:
-                    parse_trivia(state, children3)
-            if all_ok5:
-                matched4 = False
-                # <Sequence n=3>
-                all_ok8 = True
-                if all_ok8:
-                    matched7 = False
-                    # <ChoiceRegex>
-                    if match := RE9.match(state.input, state.pos):
-                        state.pos = match.end()
-                        matched7 = True
-                    else:
-                        matched7 = False
-                    # </ChoiceRegex>
-                    if not matched7:
-                        all_ok8 = False
-                    if all_ok8:
-                        parse_trivia(state, children3)
-                if all_ok8:
-                    matched7 = False
+                # <Sequence n=2>
+                all_ok9 = True
+                if all_ok9:
+                    matched8 = False
+                    # <Group>
                     # <ChoiceRegex>
                     if match := RE10.match(state.input, state.pos):
                         state.pos = match.end()
-                        matched7 = True
-                    else:
-                        matched7 = False
-                    # </ChoiceRegex>
-                    if not matched7:
-                        all_ok8 = False
-                    if all_ok8:
-                        parse_trivia(state, children3)
-                if all_ok8:
-                    matched7 = False
-                    # <ChoiceRegex>
-                    if match := RE11.match(state.input, state.pos):
-                        state.pos = match.end()
-                        matched7 = True
+                        matched8 = True
                     else:
-                        matched7 = False
+                        matched8 = False
                     # </ChoiceRegex>
-                    if not matched7:
-                        all_ok8 = False
-                matched4 = all_ok8
+                    # </Group>
+                    if not matched8:
+                        all_ok9 = False
+                    if all_ok9:
+                        parse_trivia(state, children5)
+                if all_ok9:
+                    matched8 = False
+                    # <Sequence n=3>
+                    all_ok12 = True
+                    if all_ok12:
+                        matched11 = False
+                        # <ChoiceRegex>
+                        if match := RE13.match(state.input, state.pos):
+                            state.pos = match.end()
+                            matched11 = True
+                        else:
+                            matched11 = False
+                        # </ChoiceRegex>
+                        if not matched11:
+                            all_ok12 = False
+                        if all_ok12:
+                            parse_trivia(state, children5)
+                    if all_ok12:
+                        matched11 = False
+                        # <ChoiceRegex>
+                        if match := RE14.match(state.input, state.pos):
+                            state.pos = match.end()
+                            matched11 = True
+                        else:
+                            matched11 = False
+                        # </ChoiceRegex>
+                        if not matched11:
+                            all_ok12 = False
+                        if all_ok12:
+                            parse_trivia(state, children5)
+                    if all_ok12:
+                        matched11 = False
+                        # <ChoiceRegex>
+                        if match := RE15.match(state.input, state.pos):
+                            state.pos = match.end()
+                            matched11 = True
+                        else:
+                            matched11 = False
+                        # </ChoiceRegex>
+                        if not matched11:
+                            all_ok12 = False
+                    matched8 = all_ok12
+                    # </Sequence>
+                    if not matched8:
+                        all_ok9 = False
+                matched = all_ok9
                 # </Sequence>
-                if not matched4:
-                    all_ok5 = False
-            matched = all_ok5
-            # </Sequence>
-            # </Group>
-            if matched:
-                state.ok()
-                children2.extend(children3)
-            else:
-                state.restore()
-                children3.clear()
-        if not matched:
-            state.checkpoint()
-            # <Group>
-            # <Sequence n=3>
-            all_ok13 = True
-            if all_ok13:
-                matched12 = False
-                # <CIString>
-                if match := RE14.match(state.input, state.pos):
-                    state.pos = match.end()
-                    matched12 = True
-                else:
-                    matched12 = False
-                    state.fail('^"D"')
-                # </CIString>
-                if not matched12:
-                    all_ok13 = False
-                if all_ok13:
-                    parse_trivia(state, children3)
-            if all_ok13:
-                matched12 = False
-                # <Range>
-                if match := RE15.match(state.input, state.pos):
-                    state.pos = match.end()
-                    matched12 = True
+                # </Group>
+                if matched:
+                    state.ok()
+                    children2.extend(children5)
                 else:
-                    matched12 = False
-                    state.fail("''0''..''7''")
-                # </Range>
-                if not matched12:
-                    all_ok13 = False
-                if all_ok13:
-                    parse_trivia(state, children3)
-            if all_ok13:
-                matched12 = False
-                # <Sequence n=2>
+                    state.restore()
+                    children5.clear()
+        if not matched:
+            if 1 in attempt6:
+                state.checkpoint()
+                # <Group>
+                # <Sequence n=3>
                 all_ok17 = True
                 if all_ok17:
                     matched16 = False
-                    # <ChoiceRegex>
+                    # <CIString>
                     if match := RE18.match(state.input, state.pos):
                         state.pos = match.end()
                         matched16 = True
                     else:
                         matched16 = False
-                    # </ChoiceRegex>
+                        state.fail('^"D"')
+                    # </CIString>
                     if not matched16:
                         all_ok17 = False
                     if all_ok17:
-                        parse_trivia(state, children3)
+                        parse_trivia(state, children5)
                 if all_ok17:
                     matched16 = False
-                    # <ChoiceRegex>
+                    # <Range>
                     if match := RE19.match(state.input, state.pos):
                         state.pos = match.end()
                         matched16 = True
                     else:
                         matched16 = False
-                    # </ChoiceRegex>
+                        state.fail("''0''..''7''")
+                    # </Range>
+                    if not matched16:
+                        all_ok17 = False
+                    if all_ok17:
+                        parse_trivia(state, children5)
+                if all_ok17:
+                    matched16 = False
+                    # <Sequence n=2>
+                    all_ok21 = True
+                    if all_ok21:
+                        matched20 = False
+                        # <ChoiceRegex>
+                        if match := RE22.match(state.input, state.pos):
+                            state.pos = match.end()
+                            matched20 = True
+                        else:
+                            matched20 = False
+                        # </ChoiceRegex>
+                        if not matched20:
+                            all_ok21 = False
+                        if all_ok21:
+                            parse_trivia(state, children5)
+                    if all_ok21:
+                        matched20 = False
+                        # <ChoiceRegex>
+                        if match := RE23.match(state.input, state.pos):
+                            state.pos = match.end()
+                            matched20 = True
+                        else:
+                            matched20 = False
+                        # </ChoiceRegex>
+                        if not matched20:
+                            all_ok21 = False
+                    matched16 = all_ok21
+                    # </Sequence>
                     if not matched16:
                         all_ok17 = False
-                matched12 = all_ok17
+                matched = all_ok17
                 # </Sequence>
-                if not matched12:
-                    all_ok13 = False
-            matched = all_ok13
-            # </Sequence>
-            # </Group>
-            if matched:
-                state.ok()
-                children2.extend(children3)
-            else:
-                state.restore()
-                children3.clear()
-        # </Choice>
+                # </Group>
+                if matched:
+                    state.ok()
+                    children2.extend(children5)
+                else:
+                    state.restore()
+                    children5.clear()
+            elif 1 in replay7:
+                record_failures(state, LABELS24)
+        # </DispatchChoice>
         state.rule_stack.pop()
         # Silent rule 'non_surrogate'
         pairs.extend(children2)
@@ -2593,7 +2922,10 @@ def _parse_wildcard_selector() -> Callable[[ParserState, list[Pair]], bool]:
         else:
             tag3 = None
         if matched:
-            pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag3,))
+            if state.arena is None:
+                pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag3, state.line_index))
+            else:
+                pairs.append(state.arena.add(rule_frame, pos1, state.pos, children2, tag3))
         return matched
     
     return inner
@@ -2620,7 +2952,10 @@ def _parse_index_selector() -> Callable[[ParserState, list[Pair]], bool]:
             tag3 = None
         # Atomic rule: 'index_selector'
         if matched:
-            pairs.append(Pair(state.input, pos1, state.pos, rule_frame, [], tag3,))
+            if state.arena is None:
+                pairs.append(Pair(state.input, pos1, state.pos, rule_frame, [], tag3, state.line_index))
+            else:
+                pairs.append(state.arena.add(rule_frame, pos1, state.pos, [], tag3))
         return matched
     
     return inner
@@ -2628,8 +2963,12 @@ def _parse_index_selector() -> Callable[[ParserState, list[Pair]], bool]:
 parse_index_selector = _parse_index_selector()
 
 def _parse_int() -> Callable[[ParserState, list[Pair]], bool]:
-    RE7 = re.compile('[1-9]', re.I)
-    RE10 = re.compile('[0-9]', re.I)
+    DISPATCH3 = {'-': (frozenset([1]), frozenset([1]), frozenset([0]), frozenset([0, 1])), '0': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), '1': (frozenset([1]), frozenset([1]), frozenset([0]), frozenset([0, 1])), '2': (frozenset([1]), frozenset([1]), frozenset([0]), frozenset([0, 1])), '3': (frozenset([1]), frozenset([1]), frozenset([0]), frozenset([0, 1])), '4': (frozenset([1]), frozenset([1]), frozenset([0]), frozenset([0, 1])), '5': (frozenset([1]), frozenset([1]), frozenset([0]), frozenset([0, 1])), '6': (frozenset([1]), frozenset([1]), frozenset([0]), frozenset([0, 1])), '7': (frozenset([1]), frozenset([1]), frozenset([0]), frozenset([0, 1])), '8': (frozenset([1]), frozenset([1]), frozenset([0]), frozenset([0, 1])), '9': (frozenset([1]), frozenset([1]), frozenset([0]), frozenset([0, 1]))}
+    DISPATCH4 = (frozenset([]), frozenset([]), frozenset([0, 1]), frozenset([0, 1]))
+    LABELS8 = (((), '"0"'),)
+    RE12 = re.compile('[1-9]')
+    RE15 = re.compile('[0-9]')
+    LABELS16 = (((), '"-"'), ((), "''1''..''9''"))
     
     rule_frame = RuleFrame('int', 0)
     
@@ -2638,115 +2977,128 @@ def _parse_int() -> Callable[[ParserState, list[Pair]], bool]:
         pos1 = state.pos
         state.rule_stack.push(rule_frame)
         children2: list[Pair] = []
-        # <Choice>
-        children3: list[Pair] = []
+        # <DispatchChoice>
+        children5: list[Pair] = []
         matched = False
+        if state.pos < len(state.input):
+            attempt6, replay7 = dispatch_alternatives(state, DISPATCH3.get(state.input[state.pos], DISPATCH4))
+        else:
+            attempt6, replay7 = dispatch_alternatives(state, DISPATCH4)
         if not matched:
-            state.checkpoint()
-            # <String>
-            if state.input.startswith('0', state.pos):
-                state.pos += 1
-                matched = True
-            else:
-                matched = False
-                state.fail('"0"')
-            # </String>
-            if matched:
-                state.ok()
-                children2.extend(children3)
-            else:
-                state.restore()
-                children3.clear()
-        if not matched:
-            state.checkpoint()
-            # <Group>
-            # <Sequence n=3>
-            all_ok5 = True
-            if all_ok5:
-                matched4 = False
-                # <Optional>
-                children6: list[Pair] = []
+            if 0 in attempt6:
                 state.checkpoint()
                 # <String>
-                if state.input.startswith('-', state.pos):
+                if state.input.startswith('0', state.pos):
                     state.pos += 1
-                    matched4 = True
+                    matched = True
                 else:
-                    matched4 = False
-                    state.fail('"-"')
+                    matched = False
+                    state.fail('"0"')
                 # </String>
-                if matched4:
+                if matched:
                     state.ok()
-                    children3.extend(children6)
+                    children2.extend(children5)
                 else:
                     state.restore()
-                    children6.clear()
-                matched4 = True
-                # </Optional>
-                if not matched4:
-                    all_ok5 = False
-                if all_ok5:
-                    parse_trivia(state, children3)
-            if all_ok5:
-                matched4 = False
-                # <Range>
-                if match := RE7.match(state.input, state.pos):
-                    state.pos = match.end()
-                    matched4 = True
-                else:
-                    matched4 = False
-                    state.fail("''1''..''9''")
-                # </Range>
-                if not matched4:
-                    all_ok5 = False
-                if all_ok5:
-                    parse_trivia(state, children3)
-            if all_ok5:
-                matched4 = False
-                # <Repeat>
-                trivia_pos9 = state.pos
-                children8: list[Pair] = []
-                while True:
+                    children5.clear()
+            elif 0 in replay7:
+                record_failures(state, LABELS8)
+        if not matched:
+            if 1 in attempt6:
+                state.checkpoint()
+                # <Group>
+                # <Sequence n=3>
+                all_ok10 = True
+                if all_ok10:
+                    matched9 = False
+                    # <Optional>
+                    children11: list[Pair] = []
                     state.checkpoint()
-                    # <Range>
-                    if match := RE10.match(state.input, state.pos):
-                        state.pos = match.end()
-                        matched4 = True
+                    # <String>
+                    if state.input.startswith('-', state.pos):
+                        state.pos += 1
+                        matched9 = True
                     else:
-                        matched4 = False
-                        state.fail("''0''..''9''")
-                    # </Range>
-                    if matched4:
+                        matched9 = False
+                        state.fail('"-"')
+                    # </String>
+                    if matched9:
                         state.ok()
-                        children3.extend(children8)
-                        children8.clear()
-                        trivia_pos9 = state.pos
-                        parse_trivia(state, children8)
+                        children5.extend(children11)
                     else:
                         state.restore()
-                        state.pos = trivia_pos9
-                        matched4 = True
-                        break
-                # </Repeat>
-                if not matched4:
-                    all_ok5 = False
-            matched = all_ok5
-            # </Sequence>
-            # </Group>
-            if matched:
-                state.ok()
-                children2.extend(children3)
-            else:
-                state.restore()
-                children3.clear()
-        # </Choice>
+                        children11.clear()
+                    matched9 = True
+                    # </Optional>
+                    if not matched9:
+                        all_ok10 = False
+                    if all_ok10:
+                        parse_trivia(state, children5)
+                if all_ok10:
+                    matched9 = False
+                    # <Range>
+                    if match := RE12.match(state.input, state.pos):
+                        state.pos = match.end()
+                        matched9 = True
+                    else:
+                        matched9 = False
+                        state.fail("''1''..''9''")
+                    # </Range>
+                    if not matched9:
+                        all_ok10 = False
+                    if all_ok10:
+                        parse_trivia(state, children5)
+                if all_ok10:
+                    matched9 = False
+                    # <Repeat>
+                    trivia_pos14 = state.pos
+                    children13: list[Pair] = []
+                    while True:
+                        state.checkpoint()
+                        # <Range>
+                        if match := RE15.match(state.input, state.pos):
+                            state.pos = match.end()
+                            matched9 = True
+                        else:
+                            matched9 = False
+                            state.fail("''0''..''9''")
+                        # </Range>
+                        if matched9:
+                            state.ok()
+                            children5.extend(children13)
+                            children13.clear()
+                            trivia_pos14 = state.pos
+                            parse_trivia(state, children13)
+                        else:
+                            state.restore()
+                            state.pos = trivia_pos14
+                            matched9 = True
+                            break
+                    # </Repeat>
+                    if not matched9:
+                        all_ok10 = False
+                matched = all_ok10
+                # </Sequence>
+                # </Group>
+                if matched:
+                    state.ok()
+                    children2.extend(children5)
+                else:
+                    state.restore()
+                    children5.clear()
+            elif 1 in replay7:
+                record_failures(state, LABELS16)
+        # </DispatchChoice>
         state.rule_stack.pop()
         if state.tag_stack:
-            tag11: str | None = state.tag_stack.pop()
+            tag17: str | None = state.tag_stack.pop()
         else:
-            tag11 = None
+            tag17 = None
         if matched:
-            pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag11,))
+            if state.arena is None:
+                pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag17, state.line_index))
+            else:
+                pairs.append(state.arena.add(rule_frame, pos1, state.pos, children2, tag17))
         return matched
     
     return inner
@@ -3033,7 +3385,10 @@ def _parse_slice_selector() -> Callable[[ParserState, list[Pair]], bool]:
         else:
             tag29 = None
         if matched:
-            pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag29,))
+            if state.arena is None:
+                pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag29, state.line_index))
+            else:
+                pairs.append(state.arena.add(rule_frame, pos1, state.pos, children2, tag29))
         return matched
     
     return inner
@@ -3060,7 +3415,10 @@ def _parse_start() -> Callable[[ParserState, list[Pair]], bool]:
             tag3 = None
         # Atomic rule: 'start'
         if matched:
-            pairs.append(Pair(state.input, pos1, state.pos, rule_frame, [], tag3,))
+            if state.arena is None:
+                pairs.append(Pair(state.input, pos1, state.pos, rule_frame, [], tag3, state.line_index))
+            else:
+                pairs.append(state.arena.add(rule_frame, pos1, state.pos, [], tag3))
         return matched
     
     return inner
@@ -3087,7 +3445,10 @@ def _parse_stop() -> Callable[[ParserState, list[Pair]], bool]:
             tag3 = None
         # Atomic rule: 'stop'
         if matched:
-            pairs.append(Pair(state.input, pos1, state.pos, rule_frame, [], tag3,))
+            if state.arena is None:
+                pairs.append(Pair(state.input, pos1, state.pos, rule_frame, [], tag3, state.line_index))
+            else:
+                pairs.append(state.arena.add(rule_frame, pos1, state.pos, [], tag3))
         return matched
     
     return inner
@@ -3114,7 +3475,10 @@ def _parse_step() -> Callable[[ParserState, list[Pair]], bool]:
             tag3 = None
         # Atomic rule: 'step'
         if matched:
-            pairs.append(Pair(state.input, pos1, state.pos, rule_frame, [], tag3,))
+            if state.arena is None:
+                pairs.append(Pair(state.input, pos1, state.pos, rule_frame, [], tag3, state.line_index))
+            else:
+                pairs.append(state.arena.add(rule_frame, pos1, state.pos, [], tag3))
         return matched
     
     return inner
@@ -3192,7 +3556,10 @@ def _parse_filter_selector() -> Callable[[ParserState, list[Pair]], bool]:
         else:
             tag8 = None
         if matched:
-            pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag8,))
+            if state.arena is None:
+                pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag8, state.line_index))
+            else:
+                pairs.append(state.arena.add(rule_frame, pos1, state.pos, children2, tag8))
         return matched
     
     return inner
@@ -3356,7 +3723,10 @@ def _parse_logical_or_expr() -> Callable[[ParserState, list[Pair]], bool]:
         else:
             tag15 = None
         if matched:
-            pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag15,))
+            if state.arena is None:
+                pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag15, state.line_index))
+            else:
+                pairs.append(state.arena.add(rule_frame, pos1, state.pos, children2, tag15))
         return matched
     
     return inner
@@ -3364,8 +3734,20 @@ def _parse_logical_or_expr() -> Callable[[ParserState, list[Pair]], bool]:
 parse_logical_or_expr = _parse_logical_or_expr()
 
 def _parse_logical_and_expr() -> Callable[[ParserState, list[Pair]], bool]:
-    RE12 = re.compile('[\\\t\\\n\\\r\\ ]', re.VERSION1)
-    RE15 = re.compile('[\\\t\\\n\\\r\\ ]', re.VERSION1)
+    DISPATCH5 = {'!': (frozenset([0, 2]), frozenset([0, 2]), frozenset([1]), frozenset([0, 1, 2])), '"': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), '$': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), "'": (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), '(': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), '-': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), '0': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), '1': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), '2': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), '3': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), '4': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), '5': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), '6': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), '7': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), '8': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), '9': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), '@': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 'a': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 'b': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 'c': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 'd': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 'e': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 'f': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 'g': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 'h': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 'i': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 'j': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 'k': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 'l': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 'm': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 'n': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 'o': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 'p': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 'q': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 'r': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 's': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 't': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 'u': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 'v': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 'w': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 'x': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 'y': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 'z': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2]))}
+    DISPATCH6 = (frozenset([]), frozenset([]), frozenset([0, 1, 2]), frozenset([0, 1, 2]))
+    FRAMES7 = {'abs_singular_query': RuleFrame('abs_singular_query', 0), 'comparison_expr': RuleFrame('comparison_expr', 0), 'false_literal': RuleFrame('false_literal', 0), 'function_expr': RuleFrame('function_expr', 0), 'function_name': RuleFrame('function_name', 0), 'int': RuleFrame('int', 0), 'literal': RuleFrame('literal', 2), 'logical_not_op': RuleFrame('logical_not_op', 0), 'null': RuleFrame('null', 0), 'number': RuleFrame('number', 0), 'paren_expr': RuleFrame('paren_expr', 0), 'rel_query': RuleFrame('rel_query', 0), 'rel_singular_query': RuleFrame('rel_singular_query', 0), 'root_query': RuleFrame('root_query', 0), 'singular_query': RuleFrame('singular_query', 2), 'test_expr': RuleFrame('test_expr', 0), 'true_literal': RuleFrame('true_literal', 0)}
+    LABELS11 = ((('paren_expr', 'logical_not_op'), '"!"'), (('paren_expr',), '"("'))
+    LABELS12 = ((('comparison_expr', 'literal', 'number', 'int'), '"0"'), (('comparison_expr', 'literal', 'number', 'int'), '"-"'), (('comparison_expr', 'literal', 'number', 'int'), "''1''..''9''"), (('comparison_expr', 'literal', 'number'), '"-0"'), (('comparison_expr', 'literal'), '"""'), (('comparison_expr', 'literal'), '"\'"'), (('comparison_expr', 'literal', 'true_literal'), '"true"'), (('comparison_expr', 'literal', 'false_literal'), '"false"'), (('comparison_expr', 'literal', 'null'), '"null"'), (('comparison_expr', 'singular_query', 'rel_singular_query'), '"@"'), (('comparison_expr', 'singular_query', 'abs_singular_query'), '"$"'), (('comparison_expr', 'function_expr', 'function_name'), "''a''..''z''"))
+    LABELS13 = ((('test_expr', 'logical_not_op'), '"!"'), (('test_expr', 'rel_query'), '"@"'), (('test_expr', 'root_query'), '"$"'), (('test_expr', 'function_expr', 'function_name'), "''a''..''z''"))
+    RE20 = re.compile('[\\\t\\\n\\\r\\ ]', re.VERSION1)
+    RE23 = re.compile('[\\\t\\\n\\\r\\ ]', re.VERSION1)
+    DISPATCH24 = {'!': (frozenset([0, 2]), frozenset([0, 2]), frozenset([1]), frozenset([0, 1, 2])), '"': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), '$': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), "'": (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), '(': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), '-': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), '0': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), '1': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), '2': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), '3': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), '4': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), '5': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), '6': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), '7': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), '8': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), '9': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), '@': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 'a': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 'b': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 'c': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 'd': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 'e': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 'f': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 'g': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 'h': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 'i': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 'j': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 'k': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 'l': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 'm': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 'n': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 'o': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 'p': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 'q': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 'r': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 's': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 't': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 'u': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 'v': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 'w': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 'x': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 'y': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 'z': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2]))}
+    DISPATCH25 = (frozenset([]), frozenset([]), frozenset([0, 1, 2]), frozenset([0, 1, 2]))
+    FRAMES26 = {'abs_singular_query': RuleFrame('abs_singular_query', 0), 'comparison_expr': RuleFrame('comparison_expr', 0), 'false_literal': RuleFrame('false_literal', 0), 'function_expr': RuleFrame('function_expr', 0), 'function_name': RuleFrame('function_name', 0), 'int': RuleFrame('int', 0), 'literal': RuleFrame('literal', 2), 'logical_not_op': RuleFrame('logical_not_op', 0), 'null': RuleFrame('null', 0), 'number': RuleFrame('number', 0), 'paren_expr': RuleFrame('paren_expr', 0), 'rel_query': RuleFrame('rel_query', 0), 'rel_singular_query': RuleFrame('rel_singular_query', 0), 'root_query': RuleFrame('root_query', 0), 'singular_query': RuleFrame('singular_query', 2), 'test_expr': RuleFrame('test_expr', 0), 'true_literal': RuleFrame('true_literal', 0)}
+    LABELS30 = ((('paren_expr', 'logical_not_op'), '"!"'), (('paren_expr',), '"("'))
+    LABELS31 = ((('comparison_expr', 'literal', 'number', 'int'), '"0"'), (('comparison_expr', 'literal', 'number', 'int'), '"-"'), (('comparison_expr', 'literal', 'number', 'int'), "''1''..''9''"), (('comparison_expr', 'literal', 'number'), '"-0"'), (('comparison_expr', 'literal'), '"""'), (('comparison_expr', 'literal'), '"\'"'), (('comparison_expr', 'literal', 'true_literal'), '"true"'), (('comparison_expr', 'literal', 'false_literal'), '"false"'), (('comparison_expr', 'literal', 'null'), '"null"'), (('comparison_expr', 'singular_query', 'rel_singular_query'), '"@"'), (('comparison_expr', 'singular_query', 'abs_singular_query'), '"$"'), (('comparison_expr', 'function_expr', 'function_name'), "''a''..''z''"))
+    LABELS32 = ((('test_expr', 'logical_not_op'), '"!"'), (('test_expr', 'rel_query'), '"@"'), (('test_expr', 'root_query'), '"$"'), (('test_expr', 'function_expr', 'function_name'), "''a''..''z''"))
     
     rule_frame = RuleFrame('logical_and_expr', 0)
     
@@ -3378,43 +3760,56 @@ def _parse_logical_and_expr() -> Callable[[ParserState, list[Pair]], bool]:
         all_ok4 = True
         if all_ok4:
             matched3 = False
-            # <Choice>
-            children5: list[Pair] = []
+            # <DispatchChoice>
+            children8: list[Pair] = []
             matched3 = False
+            if state.pos < len(state.input):
+                attempt9, replay10 = dispatch_alternatives(state, DISPATCH5.get(state.input[state.pos], DISPATCH6))
+            else:
+                attempt9, replay10 = dispatch_alternatives(state, DISPATCH6)
             if not matched3:
-                state.checkpoint()
-                # <Identifier>
-                matched3 = parse_paren_expr(state, children5)
-                # </Identifier>
-                if matched3:
-                    state.ok()
-                    children2.extend(children5)
-                else:
-                    state.restore()
-                    children5.clear()
+                if 0 in attempt9:
+                    state.checkpoint()
+                    # <Identifier>
+                    matched3 = parse_paren_expr(state, children8)
+                    # </Identifier>
+                    if matched3:
+                        state.ok()
+                        children2.extend(children8)
+                    else:
+                        state.restore()
+                        children8.clear()
+                elif 0 in replay10:
+                    record_failures(state, LABELS11, FRAMES7)
             if not matched3:
-                state.checkpoint()
-                # <Identifier>
-                matched3 = parse_comparison_expr(state, children5)
-                # </Identifier>
-                if matched3:
-                    state.ok()
-                    children2.extend(children5)
-                else:
-                    state.restore()
-                    children5.clear()
+                if 1 in attempt9:
+                    state.checkpoint()
+                    # <Identifier>
+                    matched3 = parse_comparison_expr(state, children8)
+                    # </Identifier>
+                    if matched3:
+                        state.ok()
+                        children2.extend(children8)
+                    else:
+                        state.restore()
+                        children8.clear()
+                elif 1 in replay10:
+                    record_failures(state, LABELS12, FRAMES7)
             if not matched3:
-                state.checkpoint()
-                # <Identifier>
-                matched3 = parse_test_expr(state, children5)
-                # </Identifier>
-                if matched3:
-                    state.ok()
-                    children2.extend(children5)
-                else:
-                    state.restore()
-                    children5.clear()
-            # </Choice>
+                if 2 in attempt9:
+                    state.checkpoint()
+                    # <Identifier>
+                    matched3 = parse_test_expr(state, children8)
+                    # </Identifier>
+                    if matched3:
+                        state.ok()
+                        children2.extend(children8)
+                    else:
+                        state.restore()
+                        children8.clear()
+                elif 2 in replay10:
+                    record_failures(state, LABELS13, FRAMES7)
+            # </DispatchChoice>
             if not matched3:
                 all_ok4 = False
             if all_ok4:
@@ -3422,140 +3817,153 @@ def _parse_logical_and_expr() -> Callable[[ParserState, list[Pair]], bool]:
         if all_ok4:
             matched3 = False
             # <Repeat>
-            trivia_pos7 = state.pos
-            children6: list[Pair] = []
+            trivia_pos15 = state.pos
+            children14: list[Pair] = []
             while True:
                 state.checkpoint()
                 # <Group>
                 # <Sequence n=4>
-                all_ok9 = True
-                if all_ok9:
-                    matched8 = False
+                all_ok17 = True
+                if all_ok17:
+                    matched16 = False
                     # <Repeat>
-                    trivia_pos11 = state.pos
-                    children10: list[Pair] = []
+                    trivia_pos19 = state.pos
+                    children18: list[Pair] = []
                     while True:
                         state.checkpoint()
                         # <ChoiceRegex>
-                        if match := RE12.match(state.input, state.pos):
+                        if match := RE20.match(state.input, state.pos):
                             state.pos = match.end()
-                            matched8 = True
+                            matched16 = True
                         else:
-                            matched8 = False
+                            matched16 = False
                         # </ChoiceRegex>
-                        if matched8:
+                        if matched16:
                             state.ok()
-                            children6.extend(children10)
-                            children10.clear()
-                            trivia_pos11 = state.pos
-                            parse_trivia(state, children10)
+                            children14.extend(children18)
+                            children18.clear()
+                            trivia_pos19 = state.pos
+                            parse_trivia(state, children18)
                         else:
                             state.restore()
-                            state.pos = trivia_pos11
-                            matched8 = True
+                            state.pos = trivia_pos19
+                            matched16 = True
                             break
                     # </Repeat>
-                    if not matched8:
-                        all_ok9 = False
-                    if all_ok9:
-                        parse_trivia(state, children6)
-                if all_ok9:
-                    matched8 = False
+                    if not matched16:
+                        all_ok17 = False
+                    if all_ok17:
+                        parse_trivia(state, children14)
+                if all_ok17:
+                    matched16 = False
                     # <String>
                     if state.input.startswith('&&', state.pos):
                         state.pos += 2
-                        matched8 = True
+                        matched16 = True
                     else:
-                        matched8 = False
+                        matched16 = False
                         state.fail('"&&"')
                     # </String>
-                    if not matched8:
-                        all_ok9 = False
-                    if all_ok9:
-                        parse_trivia(state, children6)
-                if all_ok9:
-                    matched8 = False
+                    if not matched16:
+                        all_ok17 = False
+                    if all_ok17:
+                        parse_trivia(state, children14)
+                if all_ok17:
+                    matched16 = False
                     # <Repeat>
-                    trivia_pos14 = state.pos
-                    children13: list[Pair] = []
+                    trivia_pos22 = state.pos
+                    children21: list[Pair] = []
                     while True:
                         state.checkpoint()
                         # <ChoiceRegex>
-                        if match := RE15.match(state.input, state.pos):
+                        if match := RE23.match(state.input, state.pos):
                             state.pos = match.end()
-                            matched8 = True
+                            matched16 = True
                         else:
-                            matched8 = False
+                            matched16 = False
                         # </ChoiceRegex>
-                        if matched8:
+                        if matched16:
                             state.ok()
-                            children6.extend(children13)
-                            children13.clear()
-                            trivia_pos14 = state.pos
-                            parse_trivia(state, children13)
+                            children14.extend(children21)
+                            children21.clear()
+                            trivia_pos22 = state.pos
+                            parse_trivia(state, children21)
                         else:
                             state.restore()
-                            state.pos = trivia_pos14
-                            matched8 = True
+                            state.pos = trivia_pos22
+                            matched16 = True
                             break
                     # </Repeat>
-                    if not matched8:
-                        all_ok9 = False
-                    if all_ok9:
-                        parse_trivia(state, children6)
-                if all_ok9:
-                    matched8 = False
-                    # <Choice>
-                    children16: list[Pair] = []
-                    matched8 = False
-                    if not matched8:
-                        state.checkpoint()
-                        # <Identifier>
-                        matched8 = parse_paren_expr(state, children16)
-                        # </Identifier>
-                        if matched8:
-                            state.ok()
-                            children6.extend(children16)
-                        else:
-                            state.restore()
-                            children16.clear()
-                    if not matched8:
-                        state.checkpoint()
-                        # <Identifier>
-                        matched8 = parse_comparison_expr(state, children16)
-                        # </Identifier>
-                        if matched8:
-                            state.ok()
-                            children6.extend(children16)
-                        else:
-                            state.restore()
-                            children16.clear()
-                    if not matched8:
-                        state.checkpoint()
-                        # <Identifier>
-                        matched8 = parse_test_expr(state, children16)
-                        # </Identifier>
-                        if matched8:
-                            state.ok()
-                            children6.extend(children16)
-                        else:
-                            state.restore()
-                            children16.clear()
-                    # </Choice>
-                    if not matched8:
-                        all_ok9 = False
-                matched3 = all_ok9
+                    if not matched16:
+                        all_ok17 = False
+                    if all_ok17:
+                        parse_trivia(state, children14)
+                if all_ok17:
+                    matched16 = False
+                    # <DispatchChoice>
+                    children27: list[Pair] = []
+                    matched16 = False
+                    if state.pos < len(state.input):
+                        attempt28, replay29 = dispatch_alternatives(state, DISPATCH24.get(state.input[state.pos], DISPATCH25))
+                    else:
+                        attempt28, replay29 = dispatch_alternatives(state, DISPATCH25)
+                    if not matched16:
+                        if 0 in attempt28:
+                            state.checkpoint()
+                            # <Identifier>
+                            matched16 = parse_paren_expr(state, children27)
+                            # </Identifier>
+                            if matched16:
+                                state.ok()
+                                children14.extend(children27)
+                            else:
+                                state.restore()
+                                children27.clear()
+                        elif 0 in replay29:
+                            record_failures(state, LABELS30, FRAMES26)
+                    if not matched16:
+                        if 1 in attempt28:
+                            state.checkpoint()
+                            # <Identifier>
+                            matched16 = parse_comparison_expr(state, children27)
+                            # </Identifier>
+                            if matched16:
+                                state.ok()
+                                children14.extend(children27)
+                            else:
+                                state.restore()
+                                children27.clear()
+                        elif 1 in replay29:
+                            record_failures(state, LABELS31, FRAMES26)
+                    if not matched16:
+                        if 2 in attempt28:
+                            state.checkpoint()
+                            # <Identifier>
+                            matched16 = parse_test_expr(state, children27)
+                            # </Identifier>
+                            if matched16:
+                                state.ok()
+                                children14.extend(children27)
+                            else:
+                                state.restore()
+                                children27.clear()
+                        elif 2 in replay29:
+                            record_failures(state, LABELS32, FRAMES26)
+                    # </DispatchChoice>
+                    if not matched16:
+                        all_ok17 = False
+                matched3 = all_ok17
                 # </Sequence>
                 # </Group>
                 if matched3:
                     state.ok()
-                    children2.extend(children6)
-                    children6.clear()
-                    trivia_pos7 = state.pos
-                    parse_trivia(state, children6)
+                    children2.extend(children14)
+                    children14.clear()
+                    trivia_pos15 = state.pos
+                    parse_trivia(state, children14)
                 else:
                     state.restore()
-                    state.pos = trivia_pos7
+                    state.pos = trivia_pos15
                     matched3 = True
                     break
             # </Repeat>
@@ -3565,11 +3973,14 @@ def _parse_logical_and_expr() -> Callable[[ParserState, list[Pair]], bool]:
         # </Sequence>
         state.rule_stack.pop()
         if state.tag_stack:
-            tag17: str | None = state.tag_stack.pop()
+            tag33: str | None = state.tag_stack.pop()
         else:
-            tag17 = None
+            tag33 = None
         if matched:
-            pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag17,))
+            if state.arena is None:
+                pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag33, state.line_index))
+            else:
+                pairs.append(state.arena.add(rule_frame, pos1, state.pos, children2, tag33))
         return matched
     
     return inner
@@ -3577,49 +3988,69 @@ def _parse_logical_and_expr() -> Callable[[ParserState, list[Pair]], bool]:
 parse_logical_and_expr = _parse_logical_and_expr()
 
 def _parse_basic_expr() -> Callable[[ParserState, list[Pair]], bool]:
+    DISPATCH3 = {'!': (frozenset([0, 2]), frozenset([0, 2]), frozenset([1]), frozenset([0, 1, 2])), '"': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), '$': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), "'": (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), '(': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), '-': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), '0': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), '1': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), '2': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), '3': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), '4': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), '5': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), '6': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), '7': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), '8': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), '9': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), '@': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 'a': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 'b': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 'c': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 'd': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 'e': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 'f': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 'g': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 'h': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 'i': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 'j': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 'k': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 'l': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 'm': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 'n': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 'o': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 'p': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 'q': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 'r': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 's': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 't': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 'u': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 'v': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 'w': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 'x': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 'y': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), 'z': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2]))}
+    DISPATCH4 = (frozenset([]), frozenset([]), frozenset([0, 1, 2]), frozenset([0, 1, 2]))
+    FRAMES5 = {'abs_singular_query': RuleFrame('abs_singular_query', 0), 'comparison_expr': RuleFrame('comparison_expr', 0), 'false_literal': RuleFrame('false_literal', 0), 'function_expr': RuleFrame('function_expr', 0), 'function_name': RuleFrame('function_name', 0), 'int': RuleFrame('int', 0), 'literal': RuleFrame('literal', 2), 'logical_not_op': RuleFrame('logical_not_op', 0), 'null': RuleFrame('null', 0), 'number': RuleFrame('number', 0), 'paren_expr': RuleFrame('paren_expr', 0), 'rel_query': RuleFrame('rel_query', 0), 'rel_singular_query': RuleFrame('rel_singular_query', 0), 'root_query': RuleFrame('root_query', 0), 'singular_query': RuleFrame('singular_query', 2), 'test_expr': RuleFrame('test_expr', 0), 'true_literal': RuleFrame('true_literal', 0)}
+    LABELS9 = ((('paren_expr', 'logical_not_op'), '"!"'), (('paren_expr',), '"("'))
+    LABELS10 = ((('comparison_expr', 'literal', 'number', 'int'), '"0"'), (('comparison_expr', 'literal', 'number', 'int'), '"-"'), (('comparison_expr', 'literal', 'number', 'int'), "''1''..''9''"), (('comparison_expr', 'literal', 'number'), '"-0"'), (('comparison_expr', 'literal'), '"""'), (('comparison_expr', 'literal'), '"\'"'), (('comparison_expr', 'literal', 'true_literal'), '"true"'), (('comparison_expr', 'literal', 'false_literal'), '"false"'), (('comparison_expr', 'literal', 'null'), '"null"'), (('comparison_expr', 'singular_query', 'rel_singular_query'), '"@"'), (('comparison_expr', 'singular_query', 'abs_singular_query'), '"$"'), (('comparison_expr', 'function_expr', 'function_name'), "''a''..''z''"))
+    LABELS11 = ((('test_expr', 'logical_not_op'), '"!"'), (('test_expr', 'rel_query'), '"@"'), (('test_expr', 'root_query'), '"$"'), (('test_expr', 'function_expr', 'function_name'), "''a''..''z''"))
+    
     rule_frame = RuleFrame('basic_expr', 2)
     
     def inner(state: ParserState, pairs: list[Pair]) -> bool:
         """Parse basic_expr."""
         state.rule_stack.push(rule_frame)
         children2: list[Pair] = []
-        # <Choice>
-        children3: list[Pair] = []
+        # <DispatchChoice>
+        children6: list[Pair] = []
         matched = False
+        if state.pos < len(state.input):
+            attempt7, replay8 = dispatch_alternatives(state, DISPATCH3.get(state.input[state.pos], DISPATCH4))
+        else:
+            attempt7, replay8 = dispatch_alternatives(state, DISPATCH4)
         if not matched:
-            state.checkpoint()
-            # <Identifier>
-            matched = parse_paren_expr(state, children3)
-            # </Identifier>
-            if matched:
-                state.ok()
-                children2.extend(children3)
-            else:
-                state.restore()
-                children3.clear()
+            if 0 in attempt7:
+                state.checkpoint()
+                # <Identifier>
+                matched = parse_paren_expr(state, children6)
+                # </Identifier>
+                if matched:
+                    state.ok()
+                    children2.extend(children6)
+                else:
+                    state.restore()
+                    children6.clear()
+            elif 0 in replay8:
+                record_failures(state, LABELS9, FRAMES5)
         if not matched:
-            state.checkpoint()
-            # <Identifier>
-            matched = parse_comparison_expr(state, children3)
-            # </Identifier>
-            if matched:
-                state.ok()
-                children2.extend(children3)
-            else:
-                state.restore()
-                children3.clear()
+            if 1 in attempt7:
+                state.checkpoint()
+                # <Identifier>
+                matched = parse_comparison_expr(state, children6)
+                # </Identifier>
+                if matched:
+                    state.ok()
+                    children2.extend(children6)
+                else:
+                    state.restore()
+                    children6.clear()
+            elif 1 in replay8:
+                record_failures(state, LABELS10, FRAMES5)
         if not matched:
-            state.checkpoint()
-            # <Identifier>
-            matched = parse_test_expr(state, children3)
-            # </Identifier>
-            if matched:
-                state.ok()
-                children2.extend(children3)
-            else:
-                state.restore()
-                children3.clear()
-        # </Choice>
+            if 2 in attempt7:
+                state.checkpoint()
+                # <Identifier>
+                matched = parse_test_expr(state, children6)
+                # </Identifier>
+                if matched:
+                    state.ok()
+                    children2.extend(children6)
+                else:
+                    state.restore()
+                    children6.clear()
+            elif 2 in replay8:
+                record_failures(state, LABELS11, FRAMES5)
+        # </DispatchChoice>
         state.rule_stack.pop()
         # Silent rule 'basic_expr'
         pairs.extend(children2)
@@ -3806,7 +4237,10 @@ def _parse_paren_expr() -> Callable[[ParserState, list[Pair]], bool]:
         else:
             tag17 = None
         if matched:
-            pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag17,))
+            if state.arena is None:
+                pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag17, state.line_index))
+            else:
+                pairs.append(state.arena.add(rule_frame, pos1, state.pos, children2, tag17))
         return matched
     
     return inner
@@ -3835,7 +4269,10 @@ def _parse_logical_not_op() -> Callable[[ParserState, list[Pair]], bool]:
         else:
             tag3 = None
         if matched:
-            pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag3,))
+            if state.arena is None:
+                pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag3, state.line_index))
+            else:
+                pairs.append(state.arena.add(rule_frame, pos1, state.pos, children2, tag3))
         return matched
     
     return inner
@@ -3844,6 +4281,16 @@ parse_logical_not_op = _parse_logical_not_op()
 
 def _parse_test_expr() -> Callable[[ParserState, list[Pair]], bool]:
     RE10 = re.compile('[\\\t\\\n\\\r\\ ]', re.VERSION1)
+    DISPATCH11 = {'$': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), '@': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), 'a': (frozenset([1]), frozenset([1]), frozenset([0]), frozenset([0, 1])), 'b': (frozenset([1]), frozenset([1]), frozenset([0]), frozenset([0, 1])), 'c': (frozenset([1]), frozenset([1]), frozenset([0]), frozenset([0, 1])), 'd': (frozenset([1]), frozenset([1]), frozenset([0]), frozenset([0, 1])), 'e': (frozenset([1]), frozenset([1]), frozenset([0]), frozenset([0, 1])), 'f': (frozenset([1]), frozenset([1]), frozenset([0]), frozenset([0, 1])), 'g': (frozenset([1]), frozenset([1]), frozenset([0]), frozenset([0, 1])), 'h': (frozenset([1]), frozenset([1]), frozenset([0]), frozenset([0, 1])), 'i': (frozenset([1]), frozenset([1]), frozenset([0]), frozenset([0, 1])), 'j': (frozenset([1]), frozenset([1]), frozenset([0]), frozenset([0, 1])), 'k': (frozenset([1]), frozenset([1]), frozenset([0]), frozenset([0, 1])), 'l': (frozenset([1]), frozenset([1]), frozenset([0]), frozenset([0, 1])), 'm': (frozenset([1]), frozenset([1]), frozenset([0]), frozenset([0, 1])), 'n': (frozenset([1]), frozenset([1]), frozenset([0]), frozenset([0, 1])), 'o': (frozenset([1]), frozenset([1]), frozenset([0]), frozenset([0, 1])), 'p': (frozenset([1]), frozenset([1]), frozenset([0]), frozenset([0, 1])), 'q': (frozenset([1]), frozenset([1]), frozenset([0]), frozenset([0, 1])), 'r': (frozenset([1]), frozenset([1]), frozenset([0]), frozenset([0, 1])), 's': (frozenset([1]), frozenset([1]), frozenset([0]), frozenset([0, 1])), 't': (frozenset([1]), frozenset([1]), frozenset([0]), frozenset([0, 1])), 'u': (frozenset([1]), frozenset([1]), frozenset([0]), frozenset([0, 1])), 'v': (frozenset([1]), frozenset([1]), frozenset([0]), frozenset([0, 1])), 'w': (frozenset([1]), frozenset([1]), frozenset([0]), frozenset([0, 1])), 'x': (frozenset([1]), frozenset([1]), frozenset([0]), frozenset([0, 1])), 'y': (frozenset([1]), frozenset([1]), frozenset([0]), frozenset([0, 1])), 'z': (frozenset([1]), frozenset([1]), frozenset([0]), frozenset([0, 1]))}
+    DISPATCH12 = (frozenset([]), frozenset([]), frozenset([0, 1]), frozenset([0, 1]))
+    FRAMES13 = {'function_expr': RuleFrame('function_expr', 0), 'function_name': RuleFrame('function_name', 0), 'rel_query': RuleFrame('rel_query', 0), 'root_query': RuleFrame('root_query', 0)}
+    DISPATCH17 = {'$': (frozenset([1]), frozenset([1]), frozenset([0]), frozenset([0, 1])), '@': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1]))}
+    DISPATCH18 = (frozenset([]), frozenset([]), frozenset([0, 1]), frozenset([0, 1]))
+    FRAMES19 = {'rel_query': RuleFrame('rel_query', 0), 'root_query': RuleFrame('root_query', 0)}
+    LABELS23 = ((('rel_query',), '"@"'),)
+    LABELS24 = ((('root_query',), '"$"'),)
+    LABELS25 = ((('rel_query',), '"@"'), (('root_query',), '"$"'))
+    LABELS26 = ((('function_expr', 'function_name'), "''a''..''z''"),)
     
     rule_frame = RuleFrame('test_expr', 0)
     
@@ -3917,55 +4364,75 @@ def _parse_test_expr() -> Callable[[ParserState, list[Pair]], bool]:
         if all_ok4:
             matched3 = False
             # <Group>
-            # <Choice>
-            children11: list[Pair] = []
+            # <DispatchChoice>
+            children14: list[Pair] = []
             matched3 = False
+            if state.pos < len(state.input):
+                attempt15, replay16 = dispatch_alternatives(state, DISPATCH11.get(state.input[state.pos], DISPATCH12))
+            else:
+                attempt15, replay16 = dispatch_alternatives(state, DISPATCH12)
             if not matched3:
-                state.checkpoint()
-                # <Choice>
-                children12: list[Pair] = []
-                matched3 = False
-                if not matched3:
+                if 0 in attempt15:
                     state.checkpoint()
-                    # <Identifier>
-                    matched3 = parse_rel_query(state, children12)
-                    # </Identifier>
+                    # <DispatchChoice>
+                    children20: list[Pair] = []
+                    matched3 = False
+                    if state.pos < len(state.input):
+                        attempt21, replay22 = dispatch_alternatives(state, DISPATCH17.get(state.input[state.pos], DISPATCH18))
+                    else:
+                        attempt21, replay22 = dispatch_alternatives(state, DISPATCH18)
+                    if not matched3:
+                        if 0 in attempt21:
+                            state.checkpoint()
+                            # <Identifier>
+                            matched3 = parse_rel_query(state, children20)
+                            # </Identifier>
+                            if matched3:
+                                state.ok()
+                                children14.extend(children20)
+                            else:
+                                state.restore()
+                                children20.clear()
+                        elif 0 in replay22:
+                            record_failures(state, LABELS23, FRAMES19)
+                    if not matched3:
+                        if 1 in attempt21:
+                            state.checkpoint()
+                            # <Identifier>
+                            matched3 = parse_root_query(state, children20)
+                            # </Identifier>
+                            if matched3:
+                                state.ok()
+                                children14.extend(children20)
+                            else:
+                                state.restore()
+                                children20.clear()
+                        elif 1 in replay22:
+                            record_failures(state, LABELS24, FRAMES19)
+                    # </DispatchChoice>
                     if matched3:
                         state.ok()
-                        children11.extend(children12)
+                        children2.extend(children14)
                     else:
                         state.restore()
-                        children12.clear()
-                if not matched3:
+                        children14.clear()
+                elif 0 in replay16:
+                    record_failures(state, LABELS25, FRAMES13)
+            if not matched3:
+                if 1 in attempt15:
                     state.checkpoint()
                     # <Identifier>
-                    matched3 = parse_root_query(state, children12)
+                    matched3 = parse_function_expr(state, children14)
                     # </Identifier>
                     if matched3:
                         state.ok()
-                        children11.extend(children12)
+                        children2.extend(children14)
                     else:
                         state.restore()
-                        children12.clear()
-                # </Choice>
-                if matched3:
-                    state.ok()
-                    children2.extend(children11)
-                else:
-                    state.restore()
-                    children11.clear()
-            if not matched3:
-                state.checkpoint()
-                # <Identifier>
-                matched3 = parse_function_expr(state, children11)
-                # </Identifier>
-                if matched3:
-                    state.ok()
-                    children2.extend(children11)
-                else:
-                    state.restore()
-                    children11.clear()
-            # </Choice>
+                        children14.clear()
+                elif 1 in replay16:
+                    record_failures(state, LABELS26, FRAMES13)
+            # </DispatchChoice>
             # </Group>
             if not matched3:
                 all_ok4 = False
@@ -3973,11 +4440,14 @@ def _parse_test_expr() -> Callable[[ParserState, list[Pair]], bool]:
         # </Sequence>
         state.rule_stack.pop()
         if state.tag_stack:
-            tag13: str | None = state.tag_stack.pop()
+            tag27: str | None = state.tag_stack.pop()
         else:
-            tag13 = None
+            tag27 = None
         if matched:
-            pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag13,))
+            if state.arena is None:
+                pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag27, state.line_index))
+            else:
+                pairs.append(state.arena.add(rule_frame, pos1, state.pos, children2, tag27))
         return matched
     
     return inner
@@ -3985,38 +4455,54 @@ def _parse_test_expr() -> Callable[[ParserState, list[Pair]], bool]:
 parse_test_expr = _parse_test_expr()
 
 def _parse_filter_query() -> Callable[[ParserState, list[Pair]], bool]:
+    DISPATCH3 = {'$': (frozenset([1]), frozenset([1]), frozenset([0]), frozenset([0, 1])), '@': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1]))}
+    DISPATCH4 = (frozenset([]), frozenset([]), frozenset([0, 1]), frozenset([0, 1]))
+    FRAMES5 = {'rel_query': RuleFrame('rel_query', 0), 'root_query': RuleFrame('root_query', 0)}
+    LABELS9 = ((('rel_query',), '"@"'),)
+    LABELS10 = ((('root_query',), '"$"'),)
+    
     rule_frame = RuleFrame('filter_query', 2)
     
     def inner(state: ParserState, pairs: list[Pair]) -> bool:
         """Parse filter_query."""
         state.rule_stack.push(rule_frame)
         children2: list[Pair] = []
-        # <Choice>
-        children3: list[Pair] = []
+        # <DispatchChoice>
+        children6: list[Pair] = []
         matched = False
+        if state.pos < len(state.input):
+            attempt7, replay8 = dispatch_alternatives(state, DISPATCH3.get(state.input[state.pos], DISPATCH4))
+        else:
+            attempt7, replay8 = dispatch_alternatives(state, DISPATCH4)
         if not matched:
-            state.checkpoint()
-            # <Identifier>
-            matched = parse_rel_query(state, children3)
-            # </Identifier>
-            if matched:
-                state.ok()
-                children2.extend(children3)
-            else:
-                state.restore()
-                children3.clear()
+            if 0 in attempt7:
+                state.checkpoint()
+                # <Identifier>
+                matched = parse_rel_query(state, children6)
+                # </Identifier>
+                if matched:
+                    state.ok()
+                    children2.extend(children6)
+                else:
+                    state.restore()
+                    children6.clear()
+            elif 0 in replay8:
+                record_failures(state, LABELS9, FRAMES5)
         if not matched:
-            state.checkpoint()
-            # <Identifier>
-            matched = parse_root_query(state, children3)
-            # </Identifier>
-            if matched:
-                state.ok()
-                children2.extend(children3)
-            else:
-                state.restore()
-                children3.clear()
-        # </Choice>
+            if 1 in attempt7:
+                state.checkpoint()
+                # <Identifier>
+                matched = parse_root_query(state, children6)
+                # </Identifier>
+                if matched:
+                    state.ok()
+                    children2.extend(children6)
+                else:
+                    state.restore()
+                    children6.clear()
+            elif 1 in replay8:
+                record_failures(state, LABELS10, FRAMES5)
+        # </DispatchChoice>
         state.rule_stack.pop()
         # Silent rule 'filter_query'
         pairs.extend(children2)
@@ -4101,7 +4587,10 @@ def _parse_root_query() -> Callable[[ParserState, list[Pair]], bool]:
         else:
             tag9 = None
         if matched:
-            pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag9,))
+            if state.arena is None:
+                pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag9, state.line_index))
+            else:
+                pairs.append(state.arena.add(rule_frame, pos1, state.pos, children2, tag9))
         return matched
     
     return inner
@@ -4109,6 +4598,12 @@ def _parse_root_query() -> Callable[[ParserState, list[Pair]], bool]:
 parse_root_query = _parse_root_query()
 
 def _parse_rel_query() -> Callable[[ParserState, list[Pair]], bool]:
+    DISPATCH11 = {'.': (frozenset([0, 1]), frozenset([0, 1]), frozenset([]), frozenset([0, 1])), '[': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1]))}
+    DISPATCH12 = (frozenset([]), frozenset([]), frozenset([0, 1]), frozenset([0, 1]))
+    FRAMES13 = {'bracketed_selection': RuleFrame('bracketed_selection', 0), 'child_segment': RuleFrame('child_segment', 0), 'descendant_segment': RuleFrame('descendant_segment', 0)}
+    LABELS17 = ((('child_segment', 'bracketed_selection'), '"["'), (('child_segment',), '"."'))
+    LABELS18 = ((('descendant_segment',), '".."'),)
+    
     rule_frame = RuleFrame('rel_query', 0)
     
     def inner(state: ParserState, pairs: list[Pair]) -> bool:
@@ -4170,32 +4665,42 @@ def _parse_rel_query() -> Callable[[ParserState, list[Pair]], bool]:
                         parse_trivia(state, children5)
                 if all_ok8:
                     matched7 = False
-                    # <Choice>
-                    children11: list[Pair] = []
+                    # <DispatchChoice>
+                    children14: list[Pair] = []
                     matched7 = False
+                    if state.pos < len(state.input):
+                        attempt15, replay16 = dispatch_alternatives(state, DISPATCH11.get(state.input[state.pos], DISPATCH12))
+                    else:
+                        attempt15, replay16 = dispatch_alternatives(state, DISPATCH12)
                     if not matched7:
-                        state.checkpoint()
-                        # <Identifier>
-                        matched7 = parse_child_segment(state, children11)
-                        # </Identifier>
-                        if matched7:
-                            state.ok()
-                            children5.extend(children11)
-                        else:
-                            state.restore()
-                            children11.clear()
+                        if 0 in attempt15:
+                            state.checkpoint()
+                            # <Identifier>
+                            matched7 = parse_child_segment(state, children14)
+                            # </Identifier>
+                            if matched7:
+                                state.ok()
+                                children5.extend(children14)
+                            else:
+                                state.restore()
+                                children14.clear()
+                        elif 0 in replay16:
+                            record_failures(state, LABELS17, FRAMES13)
                     if not matched7:
-                        state.checkpoint()
-                        # <Identifier>
-                        matched7 = parse_descendant_segment(state, children11)
-                        # </Identifier>
-                        if matched7:
-                            state.ok()
-                            children5.extend(children11)
-                        else:
-                            state.restore()
-                            children11.clear()
-                    # </Choice>
+                        if 1 in attempt15:
+                            state.checkpoint()
+                            # <Identifier>
+                            matched7 = parse_descendant_segment(state, children14)
+                            # </Identifier>
+                            if matched7:
+                                state.ok()
+                                children5.extend(children14)
+                            else:
+                                state.restore()
+                                children14.clear()
+                        elif 1 in replay16:
+                            record_failures(state, LABELS18, FRAMES13)
+                    # </DispatchChoice>
                     if not matched7:
                         all_ok8 = False
                 matched3 = all_ok8
@@ -4219,11 +4724,14 @@ def _parse_rel_query() -> Callable[[ParserState, list[Pair]], bool]:
         # </Sequence>
         state.rule_stack.pop()
         if state.tag_stack:
-            tag12: str | None = state.tag_stack.pop()
+            tag19: str | None = state.tag_stack.pop()
         else:
-            tag12 = None
+            tag19 = None
         if matched:
-            pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag12,))
+            if state.arena is None:
+                pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag19, state.line_index))
+            else:
+                pairs.append(state.arena.add(rule_frame, pos1, state.pos, children2, tag19))
         return matched
     
     return inner
@@ -4255,8 +4763,20 @@ def _parse_current_node_identifier() -> Callable[[ParserState, list[Pair]], bool
 parse_current_node_identifier = _parse_current_node_identifier()
 
 def _parse_comparison_expr() -> Callable[[ParserState, list[Pair]], bool]:
-    RE8 = re.compile('[\\\t\\\n\\\r\\ ]', re.VERSION1)
-    RE11 = re.compile('[\\\t\\\n\\\r\\ ]', re.VERSION1)
+    DISPATCH5 = {'"': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), '$': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), "'": (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), '-': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), '0': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), '1': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), '2': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), '3': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), '4': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), '5': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), '6': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), '7': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), '8': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), '9': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), '@': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'a': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'b': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'c': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'd': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'e': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'f': (frozenset([0, 2]), frozenset([0, 2]), frozenset([1]), frozenset([0, 1, 2])), 'g': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'h': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'i': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'j': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'k': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'l': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'm': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'n': (frozenset([0, 2]), frozenset([0, 2]), frozenset([1]), frozenset([0, 1, 2])), 'o': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'p': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'q': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'r': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 's': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 't': (frozenset([0, 2]), frozenset([0, 2]), frozenset([1]), frozenset([0, 1, 2])), 'u': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'v': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'w': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'x': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'y': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'z': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2]))}
+    DISPATCH6 = (frozenset([]), frozenset([]), frozenset([0, 1, 2]), frozenset([0, 1, 2]))
+    FRAMES7 = {'abs_singular_query': RuleFrame('abs_singular_query', 0), 'false_literal': RuleFrame('false_literal', 0), 'function_expr': RuleFrame('function_expr', 0), 'function_name': RuleFrame('function_name', 0), 'int': RuleFrame('int', 0), 'literal': RuleFrame('literal', 2), 'null': RuleFrame('null', 0), 'number': RuleFrame('number', 0), 'rel_singular_query': RuleFrame('rel_singular_query', 0), 'singular_query': RuleFrame('singular_query', 2), 'true_literal': RuleFrame('true_literal', 0)}
+    LABELS11 = ((('literal', 'number', 'int'), '"0"'), (('literal', 'number', 'int'), '"-"'), (('literal', 'number', 'int'), "''1''..''9''"), (('literal', 'number'), '"-0"'), (('literal',), '"""'), (('literal',), '"\'"'), (('literal', 'true_literal'), '"true"'), (('literal', 'false_literal'), '"false"'), (('literal', 'null'), '"null"'))
+    LABELS12 = ((('singular_query', 'rel_singular_query'), '"@"'), (('singular_query', 'abs_singular_query'), '"$"'))
+    LABELS13 = ((('function_expr', 'function_name'), "''a''..''z''"),)
+    RE16 = re.compile('[\\\t\\\n\\\r\\ ]', re.VERSION1)
+    RE19 = re.compile('[\\\t\\\n\\\r\\ ]', re.VERSION1)
+    DISPATCH20 = {'"': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), '$': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), "'": (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), '-': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), '0': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), '1': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), '2': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), '3': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), '4': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), '5': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), '6': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), '7': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), '8': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), '9': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), '@': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'a': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'b': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'c': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'd': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'e': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'f': (frozenset([0, 2]), frozenset([0, 2]), frozenset([1]), frozenset([0, 1, 2])), 'g': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'h': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'i': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'j': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'k': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'l': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'm': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'n': (frozenset([0, 2]), frozenset([0, 2]), frozenset([1]), frozenset([0, 1, 2])), 'o': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'p': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'q': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'r': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 's': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 't': (frozenset([0, 2]), frozenset([0, 2]), frozenset([1]), frozenset([0, 1, 2])), 'u': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'v': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'w': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'x': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'y': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'z': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2]))}
+    DISPATCH21 = (frozenset([]), frozenset([]), frozenset([0, 1, 2]), frozenset([0, 1, 2]))
+    FRAMES22 = {'abs_singular_query': RuleFrame('abs_singular_query', 0), 'false_literal': RuleFrame('false_literal', 0), 'function_expr': RuleFrame('function_expr', 0), 'function_name': RuleFrame('function_name', 0), 'int': RuleFrame('int', 0), 'literal': RuleFrame('literal', 2), 'null': RuleFrame('null', 0), 'number': RuleFrame('number', 0), 'rel_singular_query': RuleFrame('rel_singular_query', 0), 'singular_query': RuleFrame('singular_query', 2), 'true_literal': RuleFrame('true_literal', 0)}
+    LABELS26 = ((('literal', 'number', 'int'), '"0"'), (('literal', 'number', 'int'), '"-"'), (('literal', 'number', 'int'), "''1''..''9''"), (('literal', 'number'), '"-0"'), (('literal',), '"""'), (('literal',), '"\'"'), (('literal', 'true_literal'), '"true"'), (('literal', 'false_literal'), '"false"'), (('literal', 'null'), '"null"'))
+    LABELS27 = ((('singular_query', 'rel_singular_query'), '"@"'), (('singular_query', 'abs_singular_query'), '"$"'))
+    LABELS28 = ((('function_expr', 'function_name'), "''a''..''z''"),)
     
     rule_frame = RuleFrame('comparison_expr', 0)
     
@@ -4269,43 +4789,56 @@ def _parse_comparison_expr() -> Callable[[ParserState, list[Pair]], bool]:
         all_ok4 = True
         if all_ok4:
             matched3 = False
-            # <Choice>
-            children5: list[Pair] = []
+            # <DispatchChoice>
+            children8: list[Pair] = []
             matched3 = False
+            if state.pos < len(state.input):
+                attempt9, replay10 = dispatch_alternatives(state, DISPATCH5.get(state.input[state.pos], DISPATCH6))
+            else:
+                attempt9, replay10 = dispatch_alternatives(state, DISPATCH6)
             if not matched3:
-                state.checkpoint()
-                # <Identifier>
-                matched3 = parse_literal(state, children5)
-                # </Identifier>
-                if matched3:
-                    state.ok()
-                    children2.extend(children5)
-                else:
-                    state.restore()
-                    children5.clear()
+                if 0 in attempt9:
+                    state.checkpoint()
+                    # <Identifier>
+                    matched3 = parse_literal(state, children8)
+                    # </Identifier>
+                    if matched3:
+                        state.ok()
+                        children2.extend(children8)
+                    else:
+                        state.restore()
+                        children8.clear()
+                elif 0 in replay10:
+                    record_failures(state, LABELS11, FRAMES7)
             if not matched3:
-                state.checkpoint()
-                # <Identifier>
-                matched3 = parse_singular_query(state, children5)
-                # </Identifier>
-                if matched3:
-                    state.ok()
-                    children2.extend(children5)
-                else:
-                    state.restore()
-                    children5.clear()
+                if 1 in attempt9:
+                    state.checkpoint()
+                    # <Identifier>
+                    matched3 = parse_singular_query(state, children8)
+                    # </Identifier>
+                    if matched3:
+                        state.ok()
+                        children2.extend(children8)
+                    else:
+                        state.restore()
+                        children8.clear()
+                elif 1 in replay10:
+                    record_failures(state, LABELS12, FRAMES7)
             if not matched3:
-                state.checkpoint()
-                # <Identifier>
-                matched3 = parse_function_expr(state, children5)
-                # </Identifier>
-                if matched3:
-                    state.ok()
-                    children2.extend(children5)
-                else:
-                    state.restore()
-                    children5.clear()
-            # </Choice>
+                if 2 in attempt9:
+                    state.checkpoint()
+                    # <Identifier>
+                    matched3 = parse_function_expr(state, children8)
+                    # </Identifier>
+                    if matched3:
+                        state.ok()
+                        children2.extend(children8)
+                    else:
+                        state.restore()
+                        children8.clear()
+                elif 2 in replay10:
+                    record_failures(state, LABELS13, FRAMES7)
+            # </DispatchChoice>
             if not matched3:
                 all_ok4 = False
             if all_ok4:
@@ -4313,12 +4846,12 @@ def _parse_comparison_expr() -> Callable[[ParserState, list[Pair]], bool]:
         if all_ok4:
             matched3 = False
             # <Repeat>
-            trivia_pos7 = state.pos
-            children6: list[Pair] = []
+            trivia_pos15 = state.pos
+            children14: list[Pair] = []
             while True:
                 state.checkpoint()
                 # <ChoiceRegex>
-                if match := RE8.match(state.input, state.pos):
+                if match := RE16.match(state.input, state.pos):
                     state.pos = match.end()
                     matched3 = True
                 else:
@@ -4326,13 +4859,13 @@ def _parse_comparison_expr() -> Callable[[ParserState, list[Pair]], bool]:
                 # </ChoiceRegex>
                 if matched3:
                     state.ok()
-                    children2.extend(children6)
-                    children6.clear()
-                    trivia_pos7 = state.pos
-                    parse_trivia(state, children6)
+                    children2.extend(children14)
+                    children14.clear()
+                    trivia_pos15 = state.pos
+                    parse_trivia(state, children14)
                 else:
                     state.restore()
-                    state.pos = trivia_pos7
+                    state.pos = trivia_pos15
                     matched3 = True
                     break
             # </Repeat>
@@ -4352,12 +4885,12 @@ def _parse_comparison_expr() -> Callable[[ParserState, list[Pair]], bool]:
         if all_ok4:
             matched3 = False
             # <Repeat>
-            trivia_pos10 = state.pos
-            children9: list[Pair] = []
+            trivia_pos18 = state.pos
+            children17: list[Pair] = []
             while True:
                 state.checkpoint()
                 # <ChoiceRegex>
-                if match := RE11.match(state.input, state.pos):
+                if match := RE19.match(state.input, state.pos):
                     state.pos = match.end()
                     matched3 = True
                 else:
@@ -4365,13 +4898,13 @@ def _parse_comparison_expr() -> Callable[[ParserState, list[Pair]], bool]:
                 # </ChoiceRegex>
                 if matched3:
                     state.ok()
-                    children2.extend(children9)
-                    children9.clear()
-                    trivia_pos10 = state.pos
-                    parse_trivia(state, children9)
+                    children2.extend(children17)
+                    children17.clear()
+                    trivia_pos18 = state.pos
+                    parse_trivia(state, children17)
                 else:
                     state.restore()
-                    state.pos = trivia_pos10
+                    state.pos = trivia_pos18
                     matched3 = True
                     break
             # </Repeat>
@@ -4381,456 +4914,590 @@ def _parse_comparison_expr() -> Callable[[ParserState, list[Pair]], bool]:
                 parse_trivia(state, children2)
         if all_ok4:
             matched3 = False
-            # <Choice>
-            children12: list[Pair] = []
+            # <DispatchChoice>
+            children23: list[Pair] = []
             matched3 = False
-            if not matched3:
-                state.checkpoint()
-                # <Identifier>
-                matched3 = parse_literal(state, children12)
-                # </Identifier>
-                if matched3:
-                    state.ok()
-                    children2.extend(children12)
-                else:
-                    state.restore()
-                    children12.clear()
-            if not matched3:
-                state.checkpoint()
-                # <Identifier>
-                matched3 = parse_singular_query(state, children12)
-                # </Identifier>
-                if matched3:
-                    state.ok()
-                    children2.extend(children12)
-                else:
-                    state.restore()
-                    children12.clear()
-            if not matched3:
-                state.checkpoint()
-                # <Identifier>
-                matched3 = parse_function_expr(state, children12)
-                # </Identifier>
-                if matched3:
-                    state.ok()
-                    children2.extend(children12)
-                else:
-                    state.restore()
-                    children12.clear()
-            # </Choice>
-            if not matched3:
-                all_ok4 = False
-        matched = all_ok4
-        # </Sequence>
-        state.rule_stack.pop()
-        if state.tag_stack:
-            tag13: str | None = state.tag_stack.pop()
-        else:
-            tag13 = None
-        if matched:
-            pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag13,))
-        return matched
-    
-    return inner
-    
-parse_comparison_expr = _parse_comparison_expr()
-
-def _parse_literal() -> Callable[[ParserState, list[Pair]], bool]:
-    rule_frame = RuleFrame('literal', 2)
-    
-    def inner(state: ParserState, pairs: list[Pair]) -> bool:
-        """Parse literal."""
-        state.rule_stack.push(rule_frame)
-        children2: list[Pair] = []
-        # <Choice>
-        children3: list[Pair] = []
-        matched = False
-        if not matched:
-            state.checkpoint()
-            # <Identifier>
-            matched = parse_number(state, children3)
-            # </Identifier>
-            if matched:
-                state.ok()
-                children2.extend(children3)
-            else:
-                state.restore()
-                children3.clear()
-        if not matched:
-            state.checkpoint()
-            # <Choice>
-            children4: list[Pair] = []
-            matched = False
-            if not matched:
-                state.checkpoint()
-                # <Group>
-                # <Sequence n=3>
-                all_ok6 = True
-                if all_ok6:
-                    matched5 = False
-                    # <String>
-                    if state.input.startswith('"', state.pos):
-                        state.pos += 1
-                        matched5 = True
-                    else:
-                        matched5 = False
-                        state.fail('"""')
-                    # </String>
-                    if not matched5:
-                        all_ok6 = False
-                    if all_ok6:
-                        parse_trivia(state, children4)
-                if all_ok6:
-                    matched5 = False
-                    # <Identifier>
-                    matched5 = parse_double_quoted(state, children4)
-                    # </Identifier>
-                    if not matched5:
-                        all_ok6 = False
-                    if all_ok6:
-                        parse_trivia(state, children4)
-                if all_ok6:
-                    matched5 = False
-                    # <String>
-                    if state.input.startswith('"', state.pos):
-                        state.pos += 1
-                        matched5 = True
-                    else:
-                        matched5 = False
-                        state.fail('"""')
-                    # </String>
-                    if not matched5:
-                        all_ok6 = False
-                matched = all_ok6
-                # </Sequence>
-                # </Group>
-                if matched:
-                    state.ok()
-                    children3.extend(children4)
-                else:
-                    state.restore()
-                    children4.clear()
-            if not matched:
-                state.checkpoint()
-                # <Group>
-                # <Sequence n=3>
-                all_ok8 = True
-                if all_ok8:
-                    matched7 = False
-                    # <String>
-                    if state.input.startswith("'", state.pos):
-                        state.pos += 1
-                        matched7 = True
-                    else:
-                        matched7 = False
-                        state.fail('"\'"')
-                    # </String>
-                    if not matched7:
-                        all_ok8 = False
-                    if all_ok8:
-                        parse_trivia(state, children4)
-                if all_ok8:
-                    matched7 = False
-                    # <Identifier>
-                    matched7 = parse_single_quoted(state, children4)
-                    # </Identifier>
-                    if not matched7:
-                        all_ok8 = False
-                    if all_ok8:
-                        parse_trivia(state, children4)
-                if all_ok8:
-                    matched7 = False
-                    # <String>
-                    if state.input.startswith("'", state.pos):
-                        state.pos += 1
-                        matched7 = True
-                    else:
-                        matched7 = False
-                        state.fail('"\'"')
-                    # </String>
-                    if not matched7:
-                        all_ok8 = False
-                matched = all_ok8
-                # </Sequence>
-                # </Group>
-                if matched:
-                    state.ok()
-                    children3.extend(children4)
-                else:
-                    state.restore()
-                    children4.clear()
-            # </Choice>
-            if matched:
-                state.ok()
-                children2.extend(children3)
-            else:
-                state.restore()
-                children3.clear()
-        if not matched:
-            state.checkpoint()
-            # <Identifier>
-            matched = parse_true_literal(state, children3)
-            # </Identifier>
-            if matched:
-                state.ok()
-                children2.extend(children3)
-            else:
-                state.restore()
-                children3.clear()
-        if not matched:
-            state.checkpoint()
-            # <Identifier>
-            matched = parse_false_literal(state, children3)
-            # </Identifier>
-            if matched:
-                state.ok()
-                children2.extend(children3)
-            else:
-                state.restore()
-                children3.clear()
-        if not matched:
-            state.checkpoint()
-            # <Identifier>
-            matched = parse_null(state, children3)
-            # </Identifier>
-            if matched:
-                state.ok()
-                children2.extend(children3)
+            if state.pos < len(state.input):
+                attempt24, replay25 = dispatch_alternatives(state, DISPATCH20.get(state.input[state.pos], DISPATCH21))
             else:
-                state.restore()
-                children3.clear()
-        # </Choice>
+                attempt24, replay25 = dispatch_alternatives(state, DISPATCH21)
+            if not matched3:
+                if 0 in attempt24:
+                    state.checkpoint()
+                    # <Identifier>
+                    matched3 = parse_literal(state, children23)
+                    # </Identifier>
+                    if matched3:
+                        state.ok()
+                        children2.extend(children23)
+                    else:
+                        state.restore()
+                        children23.clear()
+                elif 0 in replay25:
+                    record_failures(state, LABELS26, FRAMES22)
+            if not matched3:
+                if 1 in attempt24:
+                    state.checkpoint()
+                    # <Identifier>
+                    matched3 = parse_singular_query(state, children23)
+                    # </Identifier>
+                    if matched3:
+                        state.ok()
+                        children2.extend(children23)
+                    else:
+                        state.restore()
+                        children23.clear()
+                elif 1 in replay25:
+                    record_failures(state, LABELS27, FRAMES22)
+            if not matched3:
+                if 2 in attempt24:
+                    state.checkpoint()
+                    # <Identifier>
+                    matched3 = parse_function_expr(state, children23)
+                    # </Identifier>
+                    if matched3:
+                        state.ok()
+                        children2.extend(children23)
+                    else:
+                        state.restore()
+                        children23.clear()
+                elif 2 in replay25:
+                    record_failures(state, LABELS28, FRAMES22)
+            # </DispatchChoice>
+            if not matched3:
+                all_ok4 = False
+        matched = all_ok4
+        # </Sequence>
         state.rule_stack.pop()
-        # Silent rule 'literal'
-        pairs.extend(children2)
+        if state.tag_stack:
+            tag29: str | None = state.tag_stack.pop()
+        else:
+            tag29 = None
+        if matched:
+            if state.arena is None:
+                pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag29, state.line_index))
+            else:
+                pairs.append(state.arena.add(rule_frame, pos1, state.pos, children2, tag29))
         return matched
     
     return inner
     
-parse_literal = _parse_literal()
+parse_comparison_expr = _parse_comparison_expr()
 
-def _parse_comparable() -> Callable[[ParserState, list[Pair]], bool]:
-    rule_frame = RuleFrame('comparable', 2)
+def _parse_literal() -> Callable[[ParserState, list[Pair]], bool]:
+    DISPATCH3 = {'"': (frozenset([1]), frozenset([1]), frozenset([0, 2, 3, 4]), frozenset([0, 1, 2, 3, 4])), "'": (frozenset([1]), frozenset([1]), frozenset([0, 2, 3, 4]), frozenset([0, 1, 2, 3, 4])), '-': (frozenset([0]), frozenset([0]), frozenset([1, 2, 3, 4]), frozenset([0, 1, 2, 3, 4])), '0': (frozenset([0]), frozenset([0]), frozenset([1, 2, 3, 4]), frozenset([0, 1, 2, 3, 4])), '1': (frozenset([0]), frozenset([0]), frozenset([1, 2, 3, 4]), frozenset([0, 1, 2, 3, 4])), '2': (frozenset([0]), frozenset([0]), frozenset([1, 2, 3, 4]), frozenset([0, 1, 2, 3, 4])), '3': (frozenset([0]), frozenset([0]), frozenset([1, 2, 3, 4]), frozenset([0, 1, 2, 3, 4])), '4': (frozenset([0]), frozenset([0]), frozenset([1, 2, 3, 4]), frozenset([0, 1, 2, 3, 4])), '5': (frozenset([0]), frozenset([0]), frozenset([1, 2, 3, 4]), frozenset([0, 1, 2, 3, 4])), '6': (frozenset([0]), frozenset([0]), frozenset([1, 2, 3, 4]), frozenset([0, 1, 2, 3, 4])), '7': (frozenset([0]), frozenset([0]), frozenset([1, 2, 3, 4]), frozenset([0, 1, 2, 3, 4])), '8': (frozenset([0]), frozenset([0]), frozenset([1, 2, 3, 4]), frozenset([0, 1, 2, 3, 4])), '9': (frozenset([0]), frozenset([0]), frozenset([1, 2, 3, 4]), frozenset([0, 1, 2, 3, 4])), 'f': (frozenset([3]), frozenset([3]), frozenset([0, 1, 2, 4]), frozenset([0, 1, 2, 3, 4])), 'n': (frozenset([4]), frozenset([4]), frozenset([0, 1, 2, 3]), frozenset([0, 1, 2, 3, 4])), 't': (frozenset([2]), frozenset([2]), frozenset([0, 1, 3, 4]), frozenset([0, 1, 2, 3, 4]))}
+    DISPATCH4 = (frozenset([]), frozenset([]), frozenset([0, 1, 2, 3, 4]), frozenset([0, 1, 2, 3, 4]))
+    FRAMES5 = {'false_literal': RuleFrame('false_literal', 0), 'int': RuleFrame('int', 0), 'null': RuleFrame('null', 0), 'number': RuleFrame('number', 0), 'true_literal': RuleFrame('true_literal', 0)}
+    LABELS9 = ((('number', 'int'), '"0"'), (('number', 'int'), '"-"'), (('number', 'int'), "''1''..''9''"), (('number',), '"-0"'))
+    DISPATCH10 = {'"': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), "'": (frozenset([1]), frozenset([1]), frozenset([0]), frozenset([0, 1]))}
+    DISPATCH11 = (frozenset([]), frozenset([]), frozenset([0, 1]), frozenset([0, 1]))
+    LABELS17 = (((), '"""'),)
+    LABELS20 = (((), '"\'"'),)
+    LABELS21 = (((), '"""'), ((), '"\'"'))
+    LABELS22 = ((('true_literal',), '"true"'),)
+    LABELS23 = ((('false_literal',), '"false"'),)
+    LABELS24 = ((('null',), '"null"'),)
+    
+    rule_frame = RuleFrame('literal', 2)
     
     def inner(state: ParserState, pairs: list[Pair]) -> bool:
-        """Parse comparable."""
+        """Parse literal."""
         state.rule_stack.push(rule_frame)
         children2: list[Pair] = []
-        # <Choice>
-        children3: list[Pair] = []
+        # <DispatchChoice>
+        children6: list[Pair] = []
         matched = False
+        if state.pos < len(state.input):
+            attempt7, replay8 = dispatch_alternatives(state, DISPATCH3.get(state.input[state.pos], DISPATCH4))
+        else:
+            attempt7, replay8 = dispatch_alternatives(state, DISPATCH4)
         if not matched:
-            state.checkpoint()
-            # <Choice>
-            children4: list[Pair] = []
-            matched = False
-            if not matched:
+            if 0 in attempt7:
                 state.checkpoint()
                 # <Identifier>
-                matched = parse_number(state, children4)
+                matched = parse_number(state, children6)
                 # </Identifier>
                 if matched:
                     state.ok()
-                    children3.extend(children4)
+                    children2.extend(children6)
                 else:
                     state.restore()
-                    children4.clear()
-            if not matched:
+                    children6.clear()
+            elif 0 in replay8:
+                record_failures(state, LABELS9, FRAMES5)
+        if not matched:
+            if 1 in attempt7:
                 state.checkpoint()
-                # <Choice>
-                children5: list[Pair] = []
+                # <DispatchChoice>
+                children12: list[Pair] = []
                 matched = False
+                if state.pos < len(state.input):
+                    attempt13, replay14 = dispatch_alternatives(state, DISPATCH10.get(state.input[state.pos], DISPATCH11))
+                else:
+                    attempt13, replay14 = dispatch_alternatives(state, DISPATCH11)
                 if not matched:
-                    state.checkpoint()
-                    # <Group>
-                    # <Sequence n=3>
-                    all_ok7 = True
-                    if all_ok7:
-                        matched6 = False
-                        # <String>
-                        if state.input.startswith('"', state.pos):
-                            state.pos += 1
-                            matched6 = True
-                        else:
-                            matched6 = False
-                            state.fail('"""')
-                        # </String>
-                        if not matched6:
-                            all_ok7 = False
-                        if all_ok7:
-                            parse_trivia(state, children5)
-                    if all_ok7:
-                        matched6 = False
-                        # <Identifier>
-                        matched6 = parse_double_quoted(state, children5)
-                        # </Identifier>
-                        if not matched6:
-                            all_ok7 = False
-                        if all_ok7:
-                            parse_trivia(state, children5)
-                    if all_ok7:
-                        matched6 = False
-                        # <String>
-                        if state.input.startswith('"', state.pos):
-                            state.pos += 1
-                            matched6 = True
+                    if 0 in attempt13:
+                        state.checkpoint()
+                        # <Group>
+                        # <Sequence n=3>
+                        all_ok16 = True
+                        if all_ok16:
+                            matched15 = False
+                            # <String>
+                            if state.input.startswith('"', state.pos):
+                                state.pos += 1
+                                matched15 = True
+                            else:
+                                matched15 = False
+                                state.fail('"""')
+                            # </String>
+                            if not matched15:
+                                all_ok16 = False
+                            if all_ok16:
+                                parse_trivia(state, children12)
+                        if all_ok16:
+                            matched15 = False
+                            # <Identifier>
+                            matched15 = parse_double_quoted(state, children12)
+                            # </Identifier>
+                            if not matched15:
+                                all_ok16 = False
+                            if all_ok16:
+                                parse_trivia(state, children12)
+                        if all_ok16:
+                            matched15 = False
+                            # <String>
+                            if state.input.startswith('"', state.pos):
+                                state.pos += 1
+                                matched15 = True
+                            else:
+                                matched15 = False
+                                state.fail('"""')
+                            # </String>
+                            if not matched15:
+                                all_ok16 = False
+                        matched = all_ok16
+                        # </Sequence>
+                        # </Group>
+                        if matched:
+                            state.ok()
+                            children6.extend(children12)
                         else:
-                            matched6 = False
-                            state.fail('"""')
-                        # </String>
-                        if not matched6:
-                            all_ok7 = False
-                    matched = all_ok7
-                    # </Sequence>
-                    # </Group>
-                    if matched:
-                        state.ok()
-                        children4.extend(children5)
-                    else:
-                        state.restore()
-                        children5.clear()
+                            state.restore()
+                            children12.clear()
+                    elif 0 in replay14:
+                        record_failures(state, LABELS17)
                 if not matched:
-                    state.checkpoint()
-                    # <Group>
-                    # <Sequence n=3>
-                    all_ok9 = True
-                    if all_ok9:
-                        matched8 = False
-                        # <String>
-                        if state.input.startswith("'", state.pos):
-                            state.pos += 1
-                            matched8 = True
-                        else:
-                            matched8 = False
-                            state.fail('"\'"')
-                        # </String>
-                        if not matched8:
-                            all_ok9 = False
-                        if all_ok9:
-                            parse_trivia(state, children5)
-                    if all_ok9:
-                        matched8 = False
-                        # <Identifier>
-                        matched8 = parse_single_quoted(state, children5)
-                        # </Identifier>
-                        if not matched8:
-                            all_ok9 = False
-                        if all_ok9:
-                            parse_trivia(state, children5)
-                    if all_ok9:
-                        matched8 = False
-                        # <String>
-                        if state.input.startswith("'", state.pos):
-                            state.pos += 1
-                            matched8 = True
+                    if 1 in attempt13:
+                        state.checkpoint()
+                        # <Group>
+                        # <Sequence n=3>
+                        all_ok19 = True
+                        if all_ok19:
+                            matched18 = False
+                            # <String>
+                            if state.input.startswith("'", state.pos):
+                                state.pos += 1
+                                matched18 = True
+                            else:
+                                matched18 = False
+                                state.fail('"\'"')
+                            # </String>
+                            if not matched18:
+                                all_ok19 = False
+                            if all_ok19:
+                                parse_trivia(state, children12)
+                        if all_ok19:
+                            matched18 = False
+                            # <Identifier>
+                            matched18 = parse_single_quoted(state, children12)
+                            # </Identifier>
+                            if not matched18:
+                                all_ok19 = False
+                            if all_ok19:
+                                parse_trivia(state, children12)
+                        if all_ok19:
+                            matched18 = False
+                            # <String>
+                            if state.input.startswith("'", state.pos):
+                                state.pos += 1
+                                matched18 = True
+                            else:
+                                matched18 = False
+                                state.fail('"\'"')
+                            # </String>
+                            if not matched18:
+                                all_ok19 = False
+                        matched = all_ok19
+                        # </Sequence>
+                        # </Group>
+                        if matched:
+                            state.ok()
+                            children6.extend(children12)
                         else:
-                            matched8 = False
-                            state.fail('"\'"')
-                        # </String>
-                        if not matched8:
-                            all_ok9 = False
-                    matched = all_ok9
-                    # </Sequence>
-                    # </Group>
-                    if matched:
-                        state.ok()
-                        children4.extend(children5)
-                    else:
-                        state.restore()
-                        children5.clear()
-                # </Choice>
+                            state.restore()
+                            children12.clear()
+                    elif 1 in replay14:
+                        record_failures(state, LABELS20)
+                # </DispatchChoice>
                 if matched:
                     state.ok()
-                    children3.extend(children4)
+                    children2.extend(children6)
                 else:
                     state.restore()
-                    children4.clear()
-            if not matched:
+                    children6.clear()
+            elif 1 in replay8:
+                record_failures(state, LABELS21, FRAMES5)
+        if not matched:
+            if 2 in attempt7:
                 state.checkpoint()
                 # <Identifier>
-                matched = parse_true_literal(state, children4)
+                matched = parse_true_literal(state, children6)
                 # </Identifier>
                 if matched:
                     state.ok()
-                    children3.extend(children4)
+                    children2.extend(children6)
                 else:
                     state.restore()
-                    children4.clear()
-            if not matched:
+                    children6.clear()
+            elif 2 in replay8:
+                record_failures(state, LABELS22, FRAMES5)
+        if not matched:
+            if 3 in attempt7:
                 state.checkpoint()
                 # <Identifier>
-                matched = parse_false_literal(state, children4)
+                matched = parse_false_literal(state, children6)
                 # </Identifier>
                 if matched:
                     state.ok()
-                    children3.extend(children4)
+                    children2.extend(children6)
                 else:
                     state.restore()
-                    children4.clear()
-            if not matched:
+                    children6.clear()
+            elif 3 in replay8:
+                record_failures(state, LABELS23, FRAMES5)
+        if not matched:
+            if 4 in attempt7:
                 state.checkpoint()
                 # <Identifier>
-                matched = parse_null(state, children4)
+                matched = parse_null(state, children6)
                 # </Identifier>
                 if matched:
                     state.ok()
-                    children3.extend(children4)
+                    children2.extend(children6)
                 else:
                     state.restore()
-                    children4.clear()
-            # </Choice>
-            if matched:
-                state.ok()
-                children2.extend(children3)
-            else:
-                state.restore()
-                children3.clear()
+                    children6.clear()
+            elif 4 in replay8:
+                record_failures(state, LABELS24, FRAMES5)
+        # </DispatchChoice>
+        state.rule_stack.pop()
+        # Silent rule 'literal'
+        pairs.extend(children2)
+        return matched
+    
+    return inner
+    
+parse_literal = _parse_literal()
+
+def _parse_comparable() -> Callable[[ParserState, list[Pair]], bool]:
+    DISPATCH3 = {'"': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), '$': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), "'": (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), '-': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), '0': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), '1': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), '2': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), '3': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), '4': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), '5': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), '6': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), '7': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), '8': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), '9': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), '@': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'a': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'b': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'c': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'd': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'e': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'f': (frozenset([0, 2]), frozenset([0, 2]), frozenset([1]), frozenset([0, 1, 2])), 'g': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'h': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'i': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'j': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'k': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'l': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'm': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'n': (frozenset([0, 2]), frozenset([0, 2]), frozenset([1]), frozenset([0, 1, 2])), 'o': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'p': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'q': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'r': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 's': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 't': (frozenset([0, 2]), frozenset([0, 2]), frozenset([1]), frozenset([0, 1, 2])), 'u': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'v': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'w': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'x': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'y': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), 'z': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2]))}
+    DISPATCH4 = (frozenset([]), frozenset([]), frozenset([0, 1, 2]), frozenset([0, 1, 2]))
+    FRAMES5 = {'abs_singular_query': RuleFrame('abs_singular_query', 0), 'false_literal': RuleFrame('false_literal', 0), 'function_expr': RuleFrame('function_expr', 0), 'function_name': RuleFrame('function_name', 0), 'int': RuleFrame('int', 0), 'null': RuleFrame('null', 0), 'number': RuleFrame('number', 0), 'rel_singular_query': RuleFrame('rel_singular_query', 0), 'true_literal': RuleFrame('true_literal', 0)}
+    DISPATCH9 = {'"': (frozenset([1]), frozenset([1]), frozenset([0, 2, 3, 4]), frozenset([0, 1, 2, 3, 4])), "'": (frozenset([1]), frozenset([1]), frozenset([0, 2, 3, 4]), frozenset([0, 1, 2, 3, 4])), '-': (frozenset([0]), frozenset([0]), frozenset([1, 2, 3, 4]), frozenset([0, 1, 2, 3, 4])), '0': (frozenset([0]), frozenset([0]), frozenset([1, 2, 3, 4]), frozenset([0, 1, 2, 3, 4])), '1': (frozenset([0]), frozenset([0]), frozenset([1, 2, 3, 4]), frozenset([0, 1, 2, 3, 4])), '2': (frozenset([0]), frozenset([0]), frozenset([1, 2, 3, 4]), frozenset([0, 1, 2, 3, 4])), '3': (frozenset([0]), frozenset([0]), frozenset([1, 2, 3, 4]), frozenset([0, 1, 2, 3, 4])), '4': (frozenset([0]), frozenset([0]), frozenset([1, 2, 3, 4]), frozenset([0, 1, 2, 3, 4])), '5': (frozenset([0]), frozenset([0]), frozenset([1, 2, 3, 4]), frozenset([0, 1, 2, 3, 4])), '6': (frozenset([0]), frozenset([0]), frozenset([1, 2, 3, 4]), frozenset([0, 1, 2, 3, 4])), '7': (frozenset([0]), frozenset([0]), frozenset([1, 2, 3, 4]), frozenset([0, 1, 2, 3, 4])), '8': (frozenset([0]), frozenset([0]), frozenset([1, 2, 3, 4]), frozenset([0, 1, 2, 3, 4])), '9': (frozenset([0]), frozenset([0]), frozenset([1, 2, 3, 4]), frozenset([0, 1, 2, 3, 4])), 'f': (frozenset([3]), frozenset([3]), frozenset([0, 1, 2, 4]), frozenset([0, 1, 2, 3, 4])), 'n': (frozenset([4]), frozenset([4]), frozenset([0, 1, 2, 3]), frozenset([0, 1, 2, 3, 4])), 't': (frozenset([2]), frozenset([2]), frozenset([0, 1, 3, 4]), frozenset([0, 1, 2, 3, 4]))}
+    DISPATCH10 = (frozenset([]), frozenset([]), frozenset([0, 1, 2, 3, 4]), frozenset([0, 1, 2, 3, 4]))
+    FRAMES11 = {'false_literal': RuleFrame('false_literal', 0), 'int': RuleFrame('int', 0), 'null': RuleFrame('null', 0), 'number': RuleFrame('number', 0), 'true_literal': RuleFrame('true_literal', 0)}
+    LABELS15 = ((('number', 'int'), '"0"'), (('number', 'int'), '"-"'), (('number', 'int'), "''1''..''9''"), (('number',), '"-0"'))
+    DISPATCH16 = {'"': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), "'": (frozenset([1]), frozenset([1]), frozenset([0]), frozenset([0, 1]))}
+    DISPATCH17 = (frozenset([]), frozenset([]), frozenset([0, 1]), frozenset([0, 1]))
+    LABELS23 = (((), '"""'),)
+    LABELS26 = (((), '"\'"'),)
+    LABELS27 = (((), '"""'), ((), '"\'"'))
+    LABELS28 = ((('true_literal',), '"true"'),)
+    LABELS29 = ((('false_literal',), '"false"'),)
+    LABELS30 = ((('null',), '"null"'),)
+    LABELS31 = ((('number', 'int'), '"0"'), (('number', 'int'), '"-"'), (('number', 'int'), "''1''..''9''"), (('number',), '"-0"'), ((), '"""'), ((), '"\'"'), (('true_literal',), '"true"'), (('false_literal',), '"false"'), (('null',), '"null"'))
+    DISPATCH32 = {'$': (frozenset([1]), frozenset([1]), frozenset([0]), frozenset([0, 1])), '@': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1]))}
+    DISPATCH33 = (frozenset([]), frozenset([]), frozenset([0, 1]), frozenset([0, 1]))
+    FRAMES34 = {'abs_singular_query': RuleFrame('abs_singular_query', 0), 'rel_singular_query': RuleFrame('rel_singular_query', 0)}
+    LABELS38 = ((('rel_singular_query',), '"@"'),)
+    LABELS39 = ((('abs_singular_query',), '"$"'),)
+    LABELS40 = ((('rel_singular_query',), '"@"'), (('abs_singular_query',), '"$"'))
+    LABELS41 = ((('function_expr', 'function_name'), "''a''..''z''"),)
+    
+    rule_frame = RuleFrame('comparable', 2)
+    
+    def inner(state: ParserState, pairs: list[Pair]) -> bool:
+        """Parse comparable."""
+        state.rule_stack.push(rule_frame)
+        children2: list[Pair] = []
+        # <DispatchChoice>
+        children6: list[Pair] = []
+        matched = False
+        if state.pos < len(state.input):
+            attempt7, replay8 = dispatch_alternatives(state, DISPATCH3.get(state.input[state.pos], DISPATCH4))
+        else:
+            attempt7, replay8 = dispatch_alternatives(state, DISPATCH4)
         if not matched:
-            state.checkpoint()
-            # <Choice>
-            children10: list[Pair] = []
-            matched = False
-            if not matched:
+            if 0 in attempt7:
                 state.checkpoint()
-                # <Identifier>
-                matched = parse_rel_singular_query(state, children10)
-                # </Identifier>
+                # <DispatchChoice>
+                children12: list[Pair] = []
+                matched = False
+                if state.pos < len(state.input):
+                    attempt13, replay14 = dispatch_alternatives(state, DISPATCH9.get(state.input[state.pos], DISPATCH10))
+                else:
+                    attempt13, replay14 = dispatch_alternatives(state, DISPATCH10)
+                if not matched:
+                    if 0 in attempt13:
+                        state.checkpoint()
+                        # <Identifier>
+                        matched = parse_number(state, children12)
+                        # </Identifier>
+                        if matched:
+                            state.ok()
+                            children6.extend(children12)
+                        else:
+                            state.restore()
+                            children12.clear()
+                    elif 0 in replay14:
+                        record_failures(state, LABELS15, FRAMES11)
+                if not matched:
+                    if 1 in attempt13:
+                        state.checkpoint()
+                        # <DispatchChoice>
+                        children18: list[Pair] = []
+                        matched = False
+                        if state.pos < len(state.input):
+                            attempt19, replay20 = dispatch_alternatives(state, DISPATCH16.get(state.input[state.pos], DISPATCH17))
+                        else:
+                            attempt19, replay20 = dispatch_alternatives(state, DISPATCH17)
+                        if not matched:
+                            if 0 in attempt19:
+                                state.checkpoint()
+                                # <Group>
+                                # <Sequence n=3>
+                                all_ok22 = True
+                                if all_ok22:
+                                    matched21 = False
+                                    # <String>
+                                    if state.input.startswith('"', state.pos):
+                                        state.pos += 1
+                                        matched21 = True
+                                    else:
+                                        matched21 = False
+                                        state.fail('"""')
+                                    # </String>
+                                    if not matched21:
+                                        all_ok22 = False
+                                    if all_ok22:
+                                        parse_trivia(state, children18)
+                                if all_ok22:
+                                    matched21 = False
+                                    # <Identifier>
+                                    matched21 = parse_double_quoted(state, children18)
+                                    # </Identifier>
+                                    if not matched21:
+                                        all_ok22 = False
+                                    if all_ok22:
+                                        parse_trivia(state, children18)
+                                if all_ok22:
+                                    matched21 = False
+                                    # <String>
+                                    if state.input.startswith('"', state.pos):
+                                        state.pos += 1
+                                        matched21 = True
+                                    else:
+                                        matched21 = False
+                                        state.fail('"""')
+                                    # </String>
+                                    if not matched21:
+                                        all_ok22 = False
+                                matched = all_ok22
+                                # </Sequence>
+                                # </Group>
+                                if matched:
+                                    state.ok()
+                                    children12.extend(children18)
+                                else:
+                                    state.restore()
+                                    children18.clear()
+                            elif 0 in replay20:
+                                record_failures(state, LABELS23)
+                        if not matched:
+                            if 1 in attempt19:
+                                state.checkpoint()
+                                # <Group>
+                                # <Sequence n=3>
+                                all_ok25 = True
+                                if all_ok25:
+                                    matched24 = False
+                                    # <String>
+                                    if state.input.startswith("'", state.pos):
+                                        state.pos += 1
+                                        matched24 = True
+                                    else:
+                                        matched24 = False
+                                        state.fail('"\'"')
+                                    # </String>
+                                    if not matched24:
+                                        all_ok25 = False
+                                    if all_ok25:
+                                        parse_trivia(state, children18)
+                                if all_ok25:
+                                    matched24 = False
+                                    # <Identifier>
+                                    matched24 = parse_single_quoted(state, children18)
+                                    # </Identifier>
+                                    if not matched24:
+                                        all_ok25 = False
+                                    if all_ok25:
+                                        parse_trivia(state, children18)
+                                if all_ok25:
+                                    matched24 = False
+                                    # <String>
+                                    if state.input.startswith("'", state.pos):
+                                        state.pos += 1
+                                        matched24 = True
+                                    else:
+                                        matched24 = False
+                                        state.fail('"\'"')
+                                    # </String>
+                                    if not matched24:
+                                        all_ok25 = False
+                                matched = all_ok25
+                                # </Sequence>
+                                # </Group>
+                                if matched:
+                                    state.ok()
+                                    children12.extend(children18)
+                                else:
+                                    state.restore()
+                                    children18.clear()
+                            elif 1 in replay20:
+                                record_failures(state, LABELS26)
+                        # </DispatchChoice>
+                        if matched:
+                            state.ok()
+                            children6.extend(children12)
+                        else:
+                            state.restore()
+                            children12.clear()
+                    elif 1 in replay14:
+                        record_failures(state, LABELS27, FRAMES11)
+                if not matched:
+                    if 2 in attempt13:
+                        state.checkpoint()
+                        # <Identifier>
+                        matched = parse_true_literal(state, children12)
+                        # </Identifier>
+                        if matched:
+                            state.ok()
+                            children6.extend(children12)
+                        else:
+                            state.restore()
+                            children12.clear()
+                    elif 2 in replay14:
+                        record_failures(state, LABELS28, FRAMES11)
+                if not matched:
+                    if 3 in attempt13:
+                        state.checkpoint()
+                        # <Identifier>
+                        matched = parse_false_literal(state, children12)
+                        # </Identifier>
+                        if matched:
+                            state.ok()
+                            children6.extend(children12)
+                        else:
+                            state.restore()
+                            children12.clear()
+                    elif 3 in replay14:
+                        record_failures(state, LABELS29, FRAMES11)
+                if not matched:
+                    if 4 in attempt13:
+                        state.checkpoint()
+                        # <Identifier>
+                        matched = parse_null(state, children12)
+                        # </Identifier>
+                        if matched:
+                            state.ok()
+                            children6.extend(children12)
+                        else:
+                            state.restore()
+                            children12.clear()
+                    elif 4 in replay14:
+                        record_failures(state, LABELS30, FRAMES11)
+                # </DispatchChoice>
                 if matched:
                     state.ok()
-                    children3.extend(children10)
+                    children2.extend(children6)
                 else:
                     state.restore()
-                    children10.clear()
-            if not matched:
+                    children6.clear()
+            elif 0 in replay8:
+                record_failures(state, LABELS31, FRAMES5)
+        if not matched:
+            if 1 in attempt7:
                 state.checkpoint()
-                # <Identifier>
-                matched = parse_abs_singular_query(state, children10)
-                # </Identifier>
+                # <DispatchChoice>
+                children35: list[Pair] = []
+                matched = False
+                if state.pos < len(state.input):
+                    attempt36, replay37 = dispatch_alternatives(state, DISPATCH32.get(state.input[state.pos], DISPATCH33))
+                else:
+                    attempt36, replay37 = dispatch_alternatives(state, DISPATCH33)
+                if not matched:
+                    if 0 in attempt36:
+                        state.checkpoint()
+                        # <Identifier>
+                        matched = parse_rel_singular_query(state, children35)
+                        # </Identifier>
+                        if matched:
+                            state.ok()
+                            children6.extend(children35)
+                        else:
+                            state.restore()
+                            children35.clear()
+                    elif 0 in replay37:
+                        record_failures(state, LABELS38, FRAMES34)
+                if not matched:
+                    if 1 in attempt36:
+                        state.checkpoint()
+                        # <Identifier>
+                        matched = parse_abs_singular_query(state, children35)
+                        # </Identifier>
+                        if matched:
+                            state.ok()
+                            children6.extend(children35)
+                        else:
+                            state.restore()
+                            children35.clear()
+                    elif 1 in replay37:
+                        record_failures(state, LABELS39, FRAMES34)
+                # </DispatchChoice>
                 if matched:
                     state.ok()
-                    children3.extend(children10)
+                    children2.extend(children6)
                 else:
                     state.restore()
-                    children10.clear()
-            # </Choice>
-            if matched:
-                state.ok()
-                children2.extend(children3)
-            else:
-                state.restore()
-                children3.clear()
+                    children6.clear()
+            elif 1 in replay8:
+                record_failures(state, LABELS40, FRAMES5)
         if not matched:
-            state.checkpoint()
-            # <Identifier>
-            matched = parse_function_expr(state, children3)
-            # </Identifier>
-            if matched:
-                state.ok()
-                children2.extend(children3)
-            else:
-                state.restore()
-                children3.clear()
-        # </Choice>
+            if 2 in attempt7:
+                state.checkpoint()
+                # <Identifier>
+                matched = parse_function_expr(state, children6)
+                # </Identifier>
+                if matched:
+                    state.ok()
+                    children2.extend(children6)
+                else:
+                    state.restore()
+                    children6.clear()
+            elif 2 in replay8:
+                record_failures(state, LABELS41, FRAMES5)
+        # </DispatchChoice>
         state.rule_stack.pop()
         # Silent rule 'comparable'
         pairs.extend(children2)
@@ -4863,7 +5530,10 @@ def _parse_comparison_op() -> Callable[[ParserState, list[Pair]], bool]:
         else:
             tag4 = None
         if matched:
-            pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag4,))
+            if state.arena is None:
+                pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag4, state.line_index))
+            else:
+                pairs.append(state.arena.add(rule_frame, pos1, state.pos, children2, tag4))
         return matched
     
     return inner
@@ -4871,38 +5541,54 @@ def _parse_comparison_op() -> Callable[[ParserState, list[Pair]], bool]:
 parse_comparison_op = _parse_comparison_op()
 
 def _parse_singular_query() -> Callable[[ParserState, list[Pair]], bool]:
+    DISPATCH3 = {'$': (frozenset([1]), frozenset([1]), frozenset([0]), frozenset([0, 1])), '@': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1]))}
+    DISPATCH4 = (frozenset([]), frozenset([]), frozenset([0, 1]), frozenset([0, 1]))
+    FRAMES5 = {'abs_singular_query': RuleFrame('abs_singular_query', 0), 'rel_singular_query': RuleFrame('rel_singular_query', 0)}
+    LABELS9 = ((('rel_singular_query',), '"@"'),)
+    LABELS10 = ((('abs_singular_query',), '"$"'),)
+    
     rule_frame = RuleFrame('singular_query', 2)
     
     def inner(state: ParserState, pairs: list[Pair]) -> bool:
         """Parse singular_query."""
         state.rule_stack.push(rule_frame)
         children2: list[Pair] = []
-        # <Choice>
-        children3: list[Pair] = []
+        # <DispatchChoice>
+        children6: list[Pair] = []
         matched = False
+        if state.pos < len(state.input):
+            attempt7, replay8 = dispatch_alternatives(state, DISPATCH3.get(state.input[state.pos], DISPATCH4))
+        else:
+            attempt7, replay8 = dispatch_alternatives(state, DISPATCH4)
         if not matched:
-            state.checkpoint()
-            # <Identifier>
-            matched = parse_rel_singular_query(state, children3)
-            # </Identifier>
-            if matched:
-                state.ok()
-                children2.extend(children3)
-            else:
-                state.restore()
-                children3.clear()
+            if 0 in attempt7:
+                state.checkpoint()
+                # <Identifier>
+                matched = parse_rel_singular_query(state, children6)
+                # </Identifier>
+                if matched:
+                    state.ok()
+                    children2.extend(children6)
+                else:
+                    state.restore()
+                    children6.clear()
+            elif 0 in replay8:
+                record_failures(state, LABELS9, FRAMES5)
         if not matched:
-            state.checkpoint()
-            # <Identifier>
-            matched = parse_abs_singular_query(state, children3)
-            # </Identifier>
-            if matched:
-                state.ok()
-                children2.extend(children3)
-            else:
-                state.restore()
-                children3.clear()
-        # </Choice>
+            if 1 in attempt7:
+                state.checkpoint()
+                # <Identifier>
+                matched = parse_abs_singular_query(state, children6)
+                # </Identifier>
+                if matched:
+                    state.ok()
+                    children2.extend(children6)
+                else:
+                    state.restore()
+                    children6.clear()
+            elif 1 in replay8:
+                record_failures(state, LABELS10, FRAMES5)
+        # </DispatchChoice>
         state.rule_stack.pop()
         # Silent rule 'singular_query'
         pairs.extend(children2)
@@ -4913,6 +5599,12 @@ def _parse_singular_query() -> Callable[[ParserState, list[Pair]], bool]:
 parse_singular_query = _parse_singular_query()
 
 def _parse_rel_singular_query() -> Callable[[ParserState, list[Pair]], bool]:
+    DISPATCH9 = {'.': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), '[': (frozenset([0, 1]), frozenset([0, 1]), frozenset([]), frozenset([0, 1]))}
+    DISPATCH10 = (frozenset([]), frozenset([]), frozenset([0, 1]), frozenset([0, 1]))
+    FRAMES11 = {'index_segment': RuleFrame('index_segment', 0), 'name_segment': RuleFrame('name_segment', 0)}
+    LABELS15 = ((('name_segment',), '"["'), (('name_segment',), '"."'))
+    LABELS16 = ((('index_segment',), '"["'),)
+    
     rule_frame = RuleFrame('rel_singular_query', 0)
     
     def inner(state: ParserState, pairs: list[Pair]) -> bool:
@@ -4958,32 +5650,42 @@ def _parse_rel_singular_query() -> Callable[[ParserState, list[Pair]], bool]:
                 if all_ok8:
                     matched7 = False
                     # <Group>
-                    # <Choice>
-                    children9: list[Pair] = []
+                    # <DispatchChoice>
+                    children12: list[Pair] = []
                     matched7 = False
+                    if state.pos < len(state.input):
+                        attempt13, replay14 = dispatch_alternatives(state, DISPATCH9.get(state.input[state.pos], DISPATCH10))
+                    else:
+                        attempt13, replay14 = dispatch_alternatives(state, DISPATCH10)
                     if not matched7:
-                        state.checkpoint()
-                        # <Identifier>
-                        matched7 = parse_name_segment(state, children9)
-                        # </Identifier>
-                        if matched7:
-                            state.ok()
-                            children5.extend(children9)
-                        else:
-                            state.restore()
-                            children9.clear()
+                        if 0 in attempt13:
+                            state.checkpoint()
+                            # <Identifier>
+                            matched7 = parse_name_segment(state, children12)
+                            # </Identifier>
+                            if matched7:
+                                state.ok()
+                                children5.extend(children12)
+                            else:
+                                state.restore()
+                                children12.clear()
+                        elif 0 in replay14:
+                            record_failures(state, LABELS15, FRAMES11)
                     if not matched7:
-                        state.checkpoint()
-                        # <Identifier>
-                        matched7 = parse_index_segment(state, children9)
-                        # </Identifier>
-                        if matched7:
-                            state.ok()
-                            children5.extend(children9)
-                        else:
-                            state.restore()
-                            children9.clear()
-                    # </Choice>
+                        if 1 in attempt13:
+                            state.checkpoint()
+                            # <Identifier>
+                            matched7 = parse_index_segment(state, children12)
+                            # </Identifier>
+                            if matched7:
+                                state.ok()
+                                children5.extend(children12)
+                            else:
+                                state.restore()
+                                children12.clear()
+                        elif 1 in replay14:
+                            record_failures(state, LABELS16, FRAMES11)
+                    # </DispatchChoice>
                     # </Group>
                     if not matched7:
                         all_ok8 = False
@@ -5008,11 +5710,14 @@ def _parse_rel_singular_query() -> Callable[[ParserState, list[Pair]], bool]:
         # </Sequence>
         state.rule_stack.pop()
         if state.tag_stack:
-            tag10: str | None = state.tag_stack.pop()
+            tag17: str | None = state.tag_stack.pop()
         else:
-            tag10 = None
+            tag17 = None
         if matched:
-            pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag10,))
+            if state.arena is None:
+                pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag17, state.line_index))
+            else:
+                pairs.append(state.arena.add(rule_frame, pos1, state.pos, children2, tag17))
         return matched
     
     return inner
@@ -5020,6 +5725,12 @@ def _parse_rel_singular_query() -> Callable[[ParserState, list[Pair]], bool]:
 parse_rel_singular_query = _parse_rel_singular_query()
 
 def _parse_abs_singular_query() -> Callable[[ParserState, list[Pair]], bool]:
+    DISPATCH9 = {'.': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), '[': (frozenset([0, 1]), frozenset([0, 1]), frozenset([]), frozenset([0, 1]))}
+    DISPATCH10 = (frozenset([]), frozenset([]), frozenset([0, 1]), frozenset([0, 1]))
+    FRAMES11 = {'index_segment': RuleFrame('index_segment', 0), 'name_segment': RuleFrame('name_segment', 0)}
+    LABELS15 = ((('name_segment',), '"["'), (('name_segment',), '"."'))
+    LABELS16 = ((('index_segment',), '"["'),)
+    
     rule_frame = RuleFrame('abs_singular_query', 0)
     
     def inner(state: ParserState, pairs: list[Pair]) -> bool:
@@ -5065,32 +5776,42 @@ def _parse_abs_singular_query() -> Callable[[ParserState, list[Pair]], bool]:
                 if all_ok8:
                     matched7 = False
                     # <Group>
-                    # <Choice>
-                    children9: list[Pair] = []
+                    # <DispatchChoice>
+                    children12: list[Pair] = []
                     matched7 = False
+                    if state.pos < len(state.input):
+                        attempt13, replay14 = dispatch_alternatives(state, DISPATCH9.get(state.input[state.pos], DISPATCH10))
+                    else:
+                        attempt13, replay14 = dispatch_alternatives(state, DISPATCH10)
                     if not matched7:
-                        state.checkpoint()
-                        # <Identifier>
-                        matched7 = parse_name_segment(state, children9)
-                        # </Identifier>
-                        if matched7:
-                            state.ok()
-                            children5.extend(children9)
-                        else:
-                            state.restore()
-                            children9.clear()
+                        if 0 in attempt13:
+                            state.checkpoint()
+                            # <Identifier>
+                            matched7 = parse_name_segment(state, children12)
+                            # </Identifier>
+                            if matched7:
+                                state.ok()
+                                children5.extend(children12)
+                            else:
+                                state.restore()
+                                children12.clear()
+                        elif 0 in replay14:
+                            record_failures(state, LABELS15, FRAMES11)
                     if not matched7:
-                        state.checkpoint()
-                        # <Identifier>
-                        matched7 = parse_index_segment(state, children9)
-                        # </Identifier>
-                        if matched7:
-                            state.ok()
-                            children5.extend(children9)
-                        else:
-                            state.restore()
-                            children9.clear()
-                    # </Choice>
+                        if 1 in attempt13:
+                            state.checkpoint()
+                            # <Identifier>
+                            matched7 = parse_index_segment(state, children12)
+                            # </Identifier>
+                            if matched7:
+                                state.ok()
+                                children5.extend(children12)
+                            else:
+                                state.restore()
+                                children12.clear()
+                        elif 1 in replay14:
+                            record_failures(state, LABELS16, FRAMES11)
+                    # </DispatchChoice>
                     # </Group>
                     if not matched7:
                         all_ok8 = False
@@ -5115,11 +5836,14 @@ def _parse_abs_singular_query() -> Callable[[ParserState, list[Pair]], bool]:
         # </Sequence>
         state.rule_stack.pop()
         if state.tag_stack:
-            tag10: str | None = state.tag_stack.pop()
+            tag17: str | None = state.tag_stack.pop()
         else:
-            tag10 = None
+            tag17 = None
         if matched:
-            pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag10,))
+            if state.arena is None:
+                pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag17, state.line_index))
+            else:
+                pairs.append(state.arena.add(rule_frame, pos1, state.pos, children2, tag17))
         return matched
     
     return inner
@@ -5128,6 +5852,11 @@ parse_abs_singular_query = _parse_abs_singular_query()
 
 def _parse_singular_query_segments() -> Callable[[ParserState, list[Pair]], bool]:
     RE9 = re.compile('[\\\t\\\n\\\r\\ ]', re.VERSION1)
+    DISPATCH10 = {'.': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), '[': (frozenset([0, 1]), frozenset([0, 1]), frozenset([]), frozenset([0, 1]))}
+    DISPATCH11 = (frozenset([]), frozenset([]), frozenset([0, 1]), frozenset([0, 1]))
+    FRAMES12 = {'index_segment': RuleFrame('index_segment', 0), 'name_segment': RuleFrame('name_segment', 0)}
+    LABELS16 = ((('name_segment',), '"["'), (('name_segment',), '"."'))
+    LABELS17 = ((('index_segment',), '"["'),)
     
     rule_frame = RuleFrame('singular_query_segments', 2)
     
@@ -5176,32 +5905,42 @@ def _parse_singular_query_segments() -> Callable[[ParserState, list[Pair]], bool
             if all_ok6:
                 matched5 = False
                 # <Group>
-                # <Choice>
-                children10: list[Pair] = []
+                # <DispatchChoice>
+                children13: list[Pair] = []
                 matched5 = False
+                if state.pos < len(state.input):
+                    attempt14, replay15 = dispatch_alternatives(state, DISPATCH10.get(state.input[state.pos], DISPATCH11))
+                else:
+                    attempt14, replay15 = dispatch_alternatives(state, DISPATCH11)
                 if not matched5:
-                    state.checkpoint()
-                    # <Identifier>
-                    matched5 = parse_name_segment(state, children10)
-                    # </Identifier>
-                    if matched5:
-                        state.ok()
-                        children3.extend(children10)
-                    else:
-                        state.restore()
-                        children10.clear()
+                    if 0 in attempt14:
+                        state.checkpoint()
+                        # <Identifier>
+                        matched5 = parse_name_segment(state, children13)
+                        # </Identifier>
+                        if matched5:
+                            state.ok()
+                            children3.extend(children13)
+                        else:
+                            state.restore()
+                            children13.clear()
+                    elif 0 in replay15:
+                        record_failures(state, LABELS16, FRAMES12)
                 if not matched5:
-                    state.checkpoint()
-                    # <Identifier>
-                    matched5 = parse_index_segment(state, children10)
-                    # </Identifier>
-                    if matched5:
-                        state.ok()
-                        children3.extend(children10)
-                    else:
-                        state.restore()
-                        children10.clear()
-                # </Choice>
+                    if 1 in attempt14:
+                        state.checkpoint()
+                        # <Identifier>
+                        matched5 = parse_index_segment(state, children13)
+                        # </Identifier>
+                        if matched5:
+                            state.ok()
+                            children3.extend(children13)
+                        else:
+                            state.restore()
+                            children13.clear()
+                    elif 1 in replay15:
+                        record_failures(state, LABELS17, FRAMES12)
+                # </DispatchChoice>
                 # </Group>
                 if not matched5:
                     all_ok6 = False
@@ -5230,6 +5969,15 @@ def _parse_singular_query_segments() -> Callable[[ParserState, list[Pair]], bool
 parse_singular_query_segments = _parse_singular_query_segments()
 
 def _parse_name_segment() -> Callable[[ParserState, list[Pair]], bool]:
+    DISPATCH3 = {'.': (frozenset([1]), frozenset([1]), frozenset([0]), frozenset([0, 1])), '[': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1]))}
+    DISPATCH4 = (frozenset([]), frozenset([]), frozenset([0, 1]), frozenset([0, 1]))
+    DISPATCH10 = {'"': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), "'": (frozenset([1]), frozenset([1]), frozenset([0]), frozenset([0, 1]))}
+    DISPATCH11 = (frozenset([]), frozenset([]), frozenset([0, 1]), frozenset([0, 1]))
+    LABELS17 = (((), '"""'),)
+    LABELS20 = (((), '"\'"'),)
+    LABELS21 = (((), '"["'),)
+    LABELS24 = (((), '"."'),)
+    
     rule_frame = RuleFrame('name_segment', 0)
     
     def inner(state: ParserState, pairs: list[Pair]) -> bool:
@@ -5237,200 +5985,223 @@ def _parse_name_segment() -> Callable[[ParserState, list[Pair]], bool]:
         pos1 = state.pos
         state.rule_stack.push(rule_frame)
         children2: list[Pair] = []
-        # <Choice>
-        children3: list[Pair] = []
+        # <DispatchChoice>
+        children5: list[Pair] = []
         matched = False
+        if state.pos < len(state.input):
+            attempt6, replay7 = dispatch_alternatives(state, DISPATCH3.get(state.input[state.pos], DISPATCH4))
+        else:
+            attempt6, replay7 = dispatch_alternatives(state, DISPATCH4)
         if not matched:
-            state.checkpoint()
-            # <Group>
-            # <Sequence n=3>
-            all_ok5 = True
-            if all_ok5:
-                matched4 = False
-                # <String>
-                if state.input.startswith('[', state.pos):
-                    state.pos += 1
-                    matched4 = True
-                else:
-                    matched4 = False
-                    state.fail('"["')
-                # </String>
-                if not matched4:
-                    all_ok5 = False
-                if all_ok5:
-                    parse_trivia(state, children3)
-            if all_ok5:
-                matched4 = False
-                # <Choice>
-                children6: list[Pair] = []
-                matched4 = False
-                if not matched4:
-                    state.checkpoint()
-                    # <Group>
-                    # <Sequence n=3>
-                    all_ok8 = True
-                    if all_ok8:
-                        matched7 = False
-                        # <String>
-                        if state.input.startswith('"', state.pos):
-                            state.pos += 1
-                            matched7 = True
-                        else:
-                            matched7 = False
-                            state.fail('"""')
-                        # </String>
-                        if not matched7:
-                            all_ok8 = False
-                        if all_ok8:
-                            parse_trivia(state, children6)
-                    if all_ok8:
-                        matched7 = False
-                        # <Identifier>
-                        matched7 = parse_double_quoted(state, children6)
-                        # </Identifier>
-                        if not matched7:
-                            all_ok8 = False
-                        if all_ok8:
-                            parse_trivia(state, children6)
-                    if all_ok8:
-                        matched7 = False
-                        # <String>
-                        if state.input.startswith('"', state.pos):
-                            state.pos += 1
-                            matched7 = True
-                        else:
-                            matched7 = False
-                            state.fail('"""')
-                        # </String>
-                        if not matched7:
-                            all_ok8 = False
-                    matched4 = all_ok8
-                    # </Sequence>
-                    # </Group>
-                    if matched4:
-                        state.ok()
-                        children3.extend(children6)
+            if 0 in attempt6:
+                state.checkpoint()
+                # <Group>
+                # <Sequence n=3>
+                all_ok9 = True
+                if all_ok9:
+                    matched8 = False
+                    # <String>
+                    if state.input.startswith('[', state.pos):
+                        state.pos += 1
+                        matched8 = True
                     else:
-                        state.restore()
-                        children6.clear()
-                if not matched4:
-                    state.checkpoint()
-                    # <Group>
-                    # <Sequence n=3>
-                    all_ok10 = True
-                    if all_ok10:
-                        matched9 = False
-                        # <String>
-                        if state.input.startswith("'", state.pos):
-                            state.pos += 1
-                            matched9 = True
-                        else:
-                            matched9 = False
-                            state.fail('"\'"')
-                        # </String>
-                        if not matched9:
-                            all_ok10 = False
-                        if all_ok10:
-                            parse_trivia(state, children6)
-                    if all_ok10:
-                        matched9 = False
-                        # <Identifier>
-                        matched9 = parse_single_quoted(state, children6)
-                        # </Identifier>
-                        if not matched9:
-                            all_ok10 = False
-                        if all_ok10:
-                            parse_trivia(state, children6)
-                    if all_ok10:
-                        matched9 = False
-                        # <String>
-                        if state.input.startswith("'", state.pos):
-                            state.pos += 1
-                            matched9 = True
-                        else:
-                            matched9 = False
-                            state.fail('"\'"')
-                        # </String>
-                        if not matched9:
-                            all_ok10 = False
-                    matched4 = all_ok10
-                    # </Sequence>
-                    # </Group>
-                    if matched4:
-                        state.ok()
-                        children3.extend(children6)
+                        matched8 = False
+                        state.fail('"["')
+                    # </String>
+                    if not matched8:
+                        all_ok9 = False
+                    if all_ok9:
+                        parse_trivia(state, children5)
+                if all_ok9:
+                    matched8 = False
+                    # <DispatchChoice>
+                    children12: list[Pair] = []
+                    matched8 = False
+                    if state.pos < len(state.input):
+                        attempt13, replay14 = dispatch_alternatives(state, DISPATCH10.get(state.input[state.pos], DISPATCH11))
+                    else:
+                        attempt13, replay14 = dispatch_alternatives(state, DISPATCH11)
+                    if not matched8:
+                        if 0 in attempt13:
+                            state.checkpoint()
+                            # <Group>
+                            # <Sequence n=3>
+                            all_ok16 = True
+                            if all_ok16:
+                                matched15 = False
+                                # <String>
+                                if state.input.startswith('"', state.pos):
+                                    state.pos += 1
+                                    matched15 = True
+                                else:
+                                    matched15 = False
+                                    state.fail('"""')
+                                # </String>
+                                if not matched15:
+                                    all_ok16 = False
+                                if all_ok16:
+                                    parse_trivia(state, children12)
+                            if all_ok16:
+                                matched15 = False
+                                # <Identifier>
+                                matched15 = parse_double_quoted(state, children12)
+                                # </Identifier>
+                                if not matched15:
+                                    all_ok16 = False
+                                if all_ok16:
+                                    parse_trivia(state, children12)
+                            if all_ok16:
+                                matched15 = False
+                                # <String>
+                                if state.input.startswith('"', state.pos):
+                                    state.pos += 1
+                                    matched15 = True
+                                else:
+                                    matched15 = False
+                                    state.fail('"""')
+                                # </String>
+                                if not matched15:
+                                    all_ok16 = False
+                            matched8 = all_ok16
+                            # </Sequence>
+                            # </Group>
+                            if matched8:
+                                state.ok()
+                                children5.extend(children12)
+                            else:
+                                state.restore()
+                                children12.clear()
+                        elif 0 in replay14:
+                            record_failures(state, LABELS17)
+                    if not matched8:
+                        if 1 in attempt13:
+                            state.checkpoint()
+                            # <Group>
+                            # <Sequence n=3>
+                            all_ok19 = True
+                            if all_ok19:
+                                matched18 = False
+                                # <String>
+                                if state.input.startswith("'", state.pos):
+                                    state.pos += 1
+                                    matched18 = True
+                                else:
+                                    matched18 = False
+                                    state.fail('"\'"')
+                                # </String>
+                                if not matched18:
+                                    all_ok19 = False
+                                if all_ok19:
+                                    parse_trivia(state, children12)
+                            if all_ok19:
+                                matched18 = False
+                                # <Identifier>
+                                matched18 = parse_single_quoted(state, children12)
+                                # </Identifier>
+                                if not matched18:
+                                    all_ok19 = False
+                                if all_ok19:
+                                    parse_trivia(state, children12)
+                            if all_ok19:
+                                matched18 = False
+                                # <String>
+                                if state.input.startswith("'", state.pos):
+                                    state.pos += 1
+                                    matched18 = True
+                                else:
+                                    matched18 = False
+                                    state.fail('"\'"')
+                                # </String>
+                                if not matched18:
+                                    all_ok19 = False
+                            matched8 = all_ok19
+                            # </Sequence>
+                            # </Group>
+                            if matched8:
+                                state.ok()
+                                children5.extend(children12)
+                            else:
+                                state.restore()
+                                children12.clear()
+                        elif 1 in replay14:
+                            record_failures(state, LABELS20)
+                    # </DispatchChoice>
+                    if not matched8:
+                        all_ok9 = False
+                    if all_ok9:
+                        parse_trivia(state, children5)
+                if all_ok9:
+                    matched8 = False
+                    # <String>
+                    if state.input.startswith(']', state.pos):
+                        state.pos += 1
+                        matched8 = True
                     else:
-                        state.restore()
-                        children6.clear()
-                # </Choice>
-                if not matched4:
-                    all_ok5 = False
-                if all_ok5:
-                    parse_trivia(state, children3)
-            if all_ok5:
-                matched4 = False
-                # <String>
-                if state.input.startswith(']', state.pos):
-                    state.pos += 1
-                    matched4 = True
+                        matched8 = False
+                        state.fail('"]"')
+                    # </String>
+                    if not matched8:
+                        all_ok9 = False
+                matched = all_ok9
+                # </Sequence>
+                # </Group>
+                if matched:
+                    state.ok()
+                    children2.extend(children5)
                 else:
-                    matched4 = False
-                    state.fail('"]"')
-                # </String>
-                if not matched4:
-                    all_ok5 = False
-            matched = all_ok5
-            # </Sequence>
-            # </Group>
-            if matched:
-                state.ok()
-                children2.extend(children3)
-            else:
-                state.restore()
-                children3.clear()
+                    state.restore()
+                    children5.clear()
+            elif 0 in replay7:
+                record_failures(state, LABELS21)
         if not matched:
-            state.checkpoint()
-            # <Group>
-            # <Sequence n=2>
-            all_ok12 = True
-            if all_ok12:
-                matched11 = False
-                # <String>
-                if state.input.startswith('.', state.pos):
-                    state.pos += 1
-                    matched11 = True
+            if 1 in attempt6:
+                state.checkpoint()
+                # <Group>
+                # <Sequence n=2>
+                all_ok23 = True
+                if all_ok23:
+                    matched22 = False
+                    # <String>
+                    if state.input.startswith('.', state.pos):
+                        state.pos += 1
+                        matched22 = True
+                    else:
+                        matched22 = False
+                        state.fail('"."')
+                    # </String>
+                    if not matched22:
+                        all_ok23 = False
+                    if all_ok23:
+                        parse_trivia(state, children5)
+                if all_ok23:
+                    matched22 = False
+                    # <Identifier>
+                    matched22 = parse_member_name_shorthand(state, children5)
+                    # </Identifier>
+                    if not matched22:
+                        all_ok23 = False
+                matched = all_ok23
+                # </Sequence>
+                # </Group>
+                if matched:
+                    state.ok()
+                    children2.extend(children5)
                 else:
-                    matched11 = False
-                    state.fail('"."')
-                # </String>
-                if not matched11:
-                    all_ok12 = False
-                if all_ok12:
-                    parse_trivia(state, children3)
-            if all_ok12:
-                matched11 = False
-                # <Identifier>
-                matched11 = parse_member_name_shorthand(state, children3)
-                # </Identifier>
-                if not matched11:
-                    all_ok12 = False
-            matched = all_ok12
-            # </Sequence>
-            # </Group>
-            if matched:
-                state.ok()
-                children2.extend(children3)
-            else:
-                state.restore()
-                children3.clear()
-        # </Choice>
+                    state.restore()
+                    children5.clear()
+            elif 1 in replay7:
+                record_failures(state, LABELS24)
+        # </DispatchChoice>
         state.rule_stack.pop()
         if state.tag_stack:
-            tag13: str | None = state.tag_stack.pop()
+            tag25: str | None = state.tag_stack.pop()
         else:
-            tag13 = None
+            tag25 = None
         if matched:
-            pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag13,))
+            if state.arena is None:
+                pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag25, state.line_index))
+            else:
+                pairs.append(state.arena.add(rule_frame, pos1, state.pos, children2, tag25))
         return matched
     
     return inner
@@ -5490,7 +6261,10 @@ def _parse_index_segment() -> Callable[[ParserState, list[Pair]], bool]:
         else:
             tag5 = None
         if matched:
-            pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag5,))
+            if state.arena is None:
+                pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag5, state.line_index))
+            else:
+                pairs.append(state.arena.add(rule_frame, pos1, state.pos, children2, tag5))
         return matched
     
     return inner
@@ -5498,6 +6272,12 @@ def _parse_index_segment() -> Callable[[ParserState, list[Pair]], bool]:
 parse_index_segment = _parse_index_segment()
 
 def _parse_number() -> Callable[[ParserState, list[Pair]], bool]:
+    DISPATCH5 = {'-': (frozenset([0, 1]), frozenset([0, 1]), frozenset([]), frozenset([0, 1])), '0': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), '1': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), '2': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), '3': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), '4': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), '5': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), '6': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), '7': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), '8': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), '9': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1]))}
+    DISPATCH6 = (frozenset([]), frozenset([]), frozenset([0, 1]), frozenset([0, 1]))
+    FRAMES7 = {'int': RuleFrame('int', 0)}
+    LABELS11 = ((('int',), '"0"'), (('int',), '"-"'), (('int',), "''1''..''9''"))
+    LABELS12 = (((), '"-0"'),)
+    
     rule_frame = RuleFrame('number', 0)
     
     def inner(state: ParserState, pairs: list[Pair]) -> bool:
@@ -5510,37 +6290,47 @@ def _parse_number() -> Callable[[ParserState, list[Pair]], bool]:
         if all_ok4:
             matched3 = False
             # <Group>
-            # <Choice>
-            children5: list[Pair] = []
+            # <DispatchChoice>
+            children8: list[Pair] = []
             matched3 = False
+            if state.pos < len(state.input):
+                attempt9, replay10 = dispatch_alternatives(state, DISPATCH5.get(state.input[state.pos], DISPATCH6))
+            else:
+                attempt9, replay10 = dispatch_alternatives(state, DISPATCH6)
             if not matched3:
-                state.checkpoint()
-                # <Identifier>
-                matched3 = parse_int(state, children5)
-                # </Identifier>
-                if matched3:
-                    state.ok()
-                    children2.extend(children5)
-                else:
-                    state.restore()
-                    children5.clear()
+                if 0 in attempt9:
+                    state.checkpoint()
+                    # <Identifier>
+                    matched3 = parse_int(state, children8)
+                    # </Identifier>
+                    if matched3:
+                        state.ok()
+                        children2.extend(children8)
+                    else:
+                        state.restore()
+                        children8.clear()
+                elif 0 in replay10:
+                    record_failures(state, LABELS11, FRAMES7)
             if not matched3:
-                state.checkpoint()
-                # <String>
-                if state.input.startswith('-0', state.pos):
-                    state.pos += 2
-                    matched3 = True
-                else:
-                    matched3 = False
-                    state.fail('"-0"')
-                # </String>
-                if matched3:
-                    state.ok()
-                    children2.extend(children5)
-                else:
-                    state.restore()
-                    children5.clear()
-            # </Choice>
+                if 1 in attempt9:
+                    state.checkpoint()
+                    # <String>
+                    if state.input.startswith('-0', state.pos):
+                        state.pos += 2
+                        matched3 = True
+                    else:
+                        matched3 = False
+                        state.fail('"-0"')
+                    # </String>
+                    if matched3:
+                        state.ok()
+                        children2.extend(children8)
+                    else:
+                        state.restore()
+                        children8.clear()
+                elif 1 in replay10:
+                    record_failures(state, LABELS12, FRAMES7)
+            # </DispatchChoice>
             # </Group>
             if not matched3:
                 all_ok4 = False
@@ -5549,17 +6339,17 @@ def _parse_number() -> Callable[[ParserState, list[Pair]], bool]:
         if all_ok4:
             matched3 = False
             # <Optional>
-            children6: list[Pair] = []
+            children13: list[Pair] = []
             state.checkpoint()
             # <Identifier>
-            matched3 = parse_frac(state, children6)
+            matched3 = parse_frac(state, children13)
             # </Identifier>
             if matched3:
                 state.ok()
-                children2.extend(children6)
+                children2.extend(children13)
             else:
                 state.restore()
-                children6.clear()
+                children13.clear()
             matched3 = True
             # </Optional>
             if not matched3:
@@ -5569,17 +6359,17 @@ def _parse_number() -> Callable[[ParserState, list[Pair]], bool]:
         if all_ok4:
             matched3 = False
             # <Optional>
-            children7: list[Pair] = []
+            children14: list[Pair] = []
             state.checkpoint()
             # <Identifier>
-            matched3 = parse_exp(state, children7)
+            matched3 = parse_exp(state, children14)
             # </Identifier>
             if matched3:
                 state.ok()
-                children2.extend(children7)
+                children2.extend(children14)
             else:
                 state.restore()
-                children7.clear()
+                children14.clear()
             matched3 = True
             # </Optional>
             if not matched3:
@@ -5588,11 +6378,14 @@ def _parse_number() -> Callable[[ParserState, list[Pair]], bool]:
         # </Sequence>
         state.rule_stack.pop()
         if state.tag_stack:
-            tag8: str | None = state.tag_stack.pop()
+            tag15: str | None = state.tag_stack.pop()
         else:
-            tag8 = None
+            tag15 = None
         if matched:
-            pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag8,))
+            if state.arena is None:
+                pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag15, state.line_index))
+            else:
+                pairs.append(state.arena.add(rule_frame, pos1, state.pos, children2, tag15))
         return matched
     
     return inner
@@ -5600,8 +6393,8 @@ def _parse_number() -> Callable[[ParserState, list[Pair]], bool]:
 parse_number = _parse_number()
 
 def _parse_frac() -> Callable[[ParserState, list[Pair]], bool]:
-    RE7 = re.compile('[0-9]', re.I)
-    RE10 = re.compile('[0-9]', re.I)
+    RE7 = re.compile('[0-9]')
+    RE10 = re.compile('[0-9]')
     
     rule_frame = RuleFrame('frac', 0)
     
@@ -5685,7 +6478,10 @@ def _parse_frac() -> Callable[[ParserState, list[Pair]], bool]:
         else:
             tag11 = None
         if matched:
-            pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag11,))
+            if state.arena is None:
+                pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag11, state.line_index))
+            else:
+                pairs.append(state.arena.add(rule_frame, pos1, state.pos, children2, tag11))
         return matched
     
     return inner
@@ -5695,8 +6491,8 @@ parse_frac = _parse_frac()
 def _parse_exp() -> Callable[[ParserState, list[Pair]], bool]:
     RE5 = re.compile('e', re.I)
     RE7 = re.compile('[\\+\\-]', re.VERSION1)
-    RE10 = re.compile('[0-9]', re.I)
-    RE13 = re.compile('[0-9]', re.I)
+    RE10 = re.compile('[0-9]')
+    RE13 = re.compile('[0-9]')
     
     rule_frame = RuleFrame('exp', 0)
     
@@ -5806,7 +6602,10 @@ def _parse_exp() -> Callable[[ParserState, list[Pair]], bool]:
         else:
             tag14 = None
         if matched:
-            pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag14,))
+            if state.arena is None:
+                pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag14, state.line_index))
+            else:
+                pairs.append(state.arena.add(rule_frame, pos1, state.pos, children2, tag14))
         return matched
     
     return inner
@@ -5835,7 +6634,10 @@ def _parse_true_literal() -> Callable[[ParserState, list[Pair]], bool]:
         else:
             tag3 = None
         if matched:
-            pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag3,))
+            if state.arena is None:
+                pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag3, state.line_index))
+            else:
+                pairs.append(state.arena.add(rule_frame, pos1, state.pos, children2, tag3))
         return matched
     
     return inner
@@ -5864,7 +6666,10 @@ def _parse_false_literal() -> Callable[[ParserState, list[Pair]], bool]:
         else:
             tag3 = None
         if matched:
-            pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag3,))
+            if state.arena is None:
+                pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag3, state.line_index))
+            else:
+                pairs.append(state.arena.add(rule_frame, pos1, state.pos, children2, tag3))
         return matched
     
     return inner
@@ -5893,7 +6698,10 @@ def _parse_null() -> Callable[[ParserState, list[Pair]], bool]:
         else:
             tag3 = None
         if matched:
-            pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag3,))
+            if state.arena is None:
+                pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag3, state.line_index))
+            else:
+                pairs.append(state.arena.add(rule_frame, pos1, state.pos, children2, tag3))
         return matched
     
     return inner
@@ -5901,8 +6709,14 @@ def _parse_null() -> Callable[[ParserState, list[Pair]], bool]:
 parse_null = _parse_null()
 
 def _parse_function_name() -> Callable[[ParserState, list[Pair]], bool]:
-    RE5 = re.compile('[a-z]', re.I)
-    RE9 = re.compile('[0-9]', re.I)
+    RE5 = re.compile('[a-z]')
+    DISPATCH8 = {'0': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), '1': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), '2': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), '3': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), '4': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), '5': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), '6': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), '7': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), '8': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), '9': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), '_': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'a': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), 'b': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), 'c': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), 'd': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), 'e': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), 'f': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), 'g': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), 'h': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), 'i': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), 'j': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), 'k': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), 'l': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), 'm': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), 'n': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), 'o': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), 'p': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), 'q': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), 'r': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), 's': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), 't': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), 'u': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), 'v': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), 'w': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), 'x': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), 'y': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), 'z': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2]))}
+    DISPATCH9 = (frozenset([]), frozenset([]), frozenset([0, 1, 2]), frozenset([0, 1, 2]))
+    FRAMES10 = {'function_name_first': RuleFrame('function_name_first', 2)}
+    LABELS14 = ((('function_name_first',), "''a''..''z''"),)
+    LABELS15 = (((), '"_"'),)
+    RE16 = re.compile('[0-9]')
+    LABELS17 = (((), "''0''..''9''"),)
     
     rule_frame = RuleFrame('function_name', 0)
     
@@ -5934,53 +6748,66 @@ def _parse_function_name() -> Callable[[ParserState, list[Pair]], bool]:
             children6: list[Pair] = []
             while True:
                 state.checkpoint()
-                # <Choice>
-                children8: list[Pair] = []
+                # <DispatchChoice>
+                children11: list[Pair] = []
                 matched3 = False
+                if state.pos < len(state.input):
+                    attempt12, replay13 = dispatch_alternatives(state, DISPATCH8.get(state.input[state.pos], DISPATCH9))
+                else:
+                    attempt12, replay13 = dispatch_alternatives(state, DISPATCH9)
                 if not matched3:
-                    state.checkpoint()
-                    # <Identifier>
-                    matched3 = parse_function_name_first(state, children8)
-                    # </Identifier>
-                    if matched3:
-                        state.ok()
-                        children6.extend(children8)
-                    else:
-                        state.restore()
-                        children8.clear()
+                    if 0 in attempt12:
+                        state.checkpoint()
+                        # <Identifier>
+                        matched3 = parse_function_name_first(state, children11)
+                        # </Identifier>
+                        if matched3:
+                            state.ok()
+                            children6.extend(children11)
+                        else:
+                            state.restore()
+                            children11.clear()
+                    elif 0 in replay13:
+                        record_failures(state, LABELS14, FRAMES10)
                 if not matched3:
-                    state.checkpoint()
-                    # <String>
-                    if state.input.startswith('_', state.pos):
-                        state.pos += 1
-                        matched3 = True
-                    else:
-                        matched3 = False
-                        state.fail('"_"')
-                    # </String>
-                    if matched3:
-                        state.ok()
-                        children6.extend(children8)
-                    else:
-                        state.restore()
-                        children8.clear()
+                    if 1 in attempt12:
+                        state.checkpoint()
+                        # <String>
+                        if state.input.startswith('_', state.pos):
+                            state.pos += 1
+                            matched3 = True
+                        else:
+                            matched3 = False
+                            state.fail('"_"')
+                        # </String>
+                        if matched3:
+                            state.ok()
+                            children6.extend(children11)
+                        else:
+                            state.restore()
+                            children11.clear()
+                    elif 1 in replay13:
+                        record_failures(state, LABELS15, FRAMES10)
                 if not matched3:
-                    state.checkpoint()
-                    # <Range>
-                    if match := RE9.match(state.input, state.pos):
-                        state.pos = match.end()
-                        matched3 = True
-                    else:
-                        matched3 = False
-                        state.fail("''0''..''9''")
-                    # </Range>
-                    if matched3:
-                        state.ok()
-                        children6.extend(children8)
-                    else:
-                        state.restore()
-                        children8.clear()
-                # </Choice>
+                    if 2 in attempt12:
+                        state.checkpoint()
+                        # <Range>
+                        if match := RE16.match(state.input, state.pos):
+                            state.pos = match.end()
+                            matched3 = True
+                        else:
+                            matched3 = False
+                            state.fail("''0''..''9''")
+                        # </Range>
+                        if matched3:
+                            state.ok()
+                            children6.extend(children11)
+                        else:
+                            state.restore()
+                            children11.clear()
+                    elif 2 in replay13:
+                        record_failures(state, LABELS17, FRAMES10)
+                # </DispatchChoice>
                 if matched3:
                     state.ok()
                     children2.extend(children6)
@@ -5999,11 +6826,14 @@ def _parse_function_name() -> Callable[[ParserState, list[Pair]], bool]:
         # </Sequence>
         state.rule_stack.pop()
         if state.tag_stack:
-            tag10: str | None = state.tag_stack.pop()
+            tag18: str | None = state.tag_stack.pop()
         else:
-            tag10 = None
+            tag18 = None
         if matched:
-            pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag10,))
+            if state.arena is None:
+                pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag18, state.line_index))
+            else:
+                pairs.append(state.arena.add(rule_frame, pos1, state.pos, children2, tag18))
         return matched
     
     return inner
@@ -6011,7 +6841,7 @@ def _parse_function_name() -> Callable[[ParserState, list[Pair]], bool]:
 parse_function_name = _parse_function_name()
 
 def _parse_function_name_first() -> Callable[[ParserState, list[Pair]], bool]:
-    RE3 = re.compile('[a-z]', re.I)
+    RE3 = re.compile('[a-z]')
     
     rule_frame = RuleFrame('function_name_first', 2)
     
@@ -6037,8 +6867,13 @@ def _parse_function_name_first() -> Callable[[ParserState, list[Pair]], bool]:
 parse_function_name_first = _parse_function_name_first()
 
 def _parse_function_name_char() -> Callable[[ParserState, list[Pair]], bool]:
-    RE4 = re.compile('[a-z]', re.I)
-    RE5 = re.compile('[0-9]', re.I)
+    DISPATCH3 = {'0': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), '1': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), '2': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), '3': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), '4': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), '5': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), '6': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), '7': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), '8': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), '9': (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2])), '_': (frozenset([1]), frozenset([1]), frozenset([0, 2]), frozenset([0, 1, 2])), 'a': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), 'b': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), 'c': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), 'd': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), 'e': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), 'f': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), 'g': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), 'h': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), 'i': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), 'j': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), 'k': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), 'l': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), 'm': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), 'n': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), 'o': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), 'p': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), 'q': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), 'r': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), 's': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), 't': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), 'u': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), 'v': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), 'w': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), 'x': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), 'y': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2])), 'z': (frozenset([0]), frozenset([0]), frozenset([1, 2]), frozenset([0, 1, 2]))}
+    DISPATCH4 = (frozenset([]), frozenset([]), frozenset([0, 1, 2]), frozenset([0, 1, 2]))
+    RE8 = re.compile('[a-z]')
+    LABELS9 = (((), "''a''..''z''"),)
+    LABELS10 = (((), '"_"'),)
+    RE11 = re.compile('[0-9]')
+    LABELS12 = (((), "''0''..''9''"),)
     
     rule_frame = RuleFrame('function_name_char', 2)
     
@@ -6046,58 +6881,71 @@ def _parse_function_name_char() -> Callable[[ParserState, list[Pair]], bool]:
         """Parse function_name_char."""
         state.rule_stack.push(rule_frame)
         children2: list[Pair] = []
-        # <Choice>
-        children3: list[Pair] = []
+        # <DispatchChoice>
+        children5: list[Pair] = []
         matched = False
+        if state.pos < len(state.input):
+            attempt6, replay7 = dispatch_alternatives(state, DISPATCH3.get(state.input[state.pos], DISPATCH4))
+        else:
+            attempt6, replay7 = dispatch_alternatives(state, DISPATCH4)
         if not matched:
-            state.checkpoint()
-            # <Range>
-            if match := RE4.match(state.input, state.pos):
-                state.pos = match.end()
-                matched = True
-            else:
-                matched = False
-                state.fail("''a''..''z''")
-            # </Range>
-            if matched:
-                state.ok()
-                children2.extend(children3)
-            else:
-                state.restore()
-                children3.clear()
-        if not matched:
-            state.checkpoint()
-            # <String>
-            if state.input.startswith('_', state.pos):
-                state.pos += 1
-                matched = True
-            else:
-                matched = False
-                state.fail('"_"')
-            # </String>
-            if matched:
-                state.ok()
-                children2.extend(children3)
-            else:
-                state.restore()
-                children3.clear()
+            if 0 in attempt6:
+                state.checkpoint()
+                # <Range>
+                if match := RE8.match(state.input, state.pos):
+                    state.pos = match.end()
+                    matched = True
+                else:
+                    matched = False
+                    state.fail("''a''..''z''")
+                # </Range>
+                if matched:
+                    state.ok()
+                    children2.extend(children5)
+                else:
+                    state.restore()
+                    children5.clear()
+            elif 0 in replay7:
+                record_failures(state, LABELS9)
         if not matched:
-            state.checkpoint()
-            # <Range>
-            if match := RE5.match(state.input, state.pos):
-                state.pos = match.end()
-                matched = True
-            else:
-                matched = False
-                state.fail("''0''..''9''")
-            # </Range>
-            if matched:
-                state.ok()
-                children2.extend(children3)
-            else:
-                state.restore()
-                children3.clear()
-        # </Choice>
+            if 1 in attempt6:
+                state.checkpoint()
+                # <String>
+                if state.input.startswith('_', state.pos):
+                    state.pos += 1
+                    matched = True
+                else:
+                    matched = False
+                    state.fail('"_"')
+                # </String>
+                if matched:
+                    state.ok()
+                    children2.extend(children5)
+                else:
+                    state.restore()
+                    children5.clear()
+            elif 1 in replay7:
+                record_failures(state, LABELS10)
+        if not matched:
+            if 2 in attempt6:
+                state.checkpoint()
+                # <Range>
+                if match := RE11.match(state.input, state.pos):
+                    state.pos = match.end()
+                    matched = True
+                else:
+                    matched = False
+                    state.fail("''0''..''9''")
+                # </Range>
+                if matched:
+                    state.ok()
+                    children2.extend(children5)
+                else:
+                    state.restore()
+                    children5.clear()
+            elif 2 in replay7:
+                record_failures(state, LABELS12)
+        # </DispatchChoice>
         state.rule_stack.pop()
         # Silent rule 'function_name_char'
         pairs.extend(children2)
@@ -6109,9 +6957,23 @@ parse_function_name_char = _parse_function_name_char()
 
 def _parse_function_expr() -> Callable[[ParserState, list[Pair]], bool]:
     RE7 = re.compile('[\\\t\\\n\\\r\\ ]', re.VERSION1)
-    RE18 = re.compile('[\\\t\\\n\\\r\\ ]', re.VERSION1)
-    RE21 = re.compile('[\\\t\\\n\\\r\\ ]', re.VERSION1)
-    RE25 = re.compile('[\\\t\\\n\\\r\\ ]', re.VERSION1)
+    DISPATCH11 = {'!': (frozenset([1]), frozenset([1]), frozenset([0, 2, 3]), frozenset([0, 1, 2, 3])), '"': (frozenset([1, 3]), frozenset([1, 3]), frozenset([0, 2]), frozenset([0, 1, 2, 3])), '$': (frozenset([0, 1]), frozenset([0, 1]), frozenset([2, 3]), frozenset([0, 1, 2, 3])), "'": (frozenset([1, 3]), frozenset([1, 3]), frozenset([0, 2]), frozenset([0, 1, 2, 3])), '(': (frozenset([1]), frozenset([1]), frozenset([0, 2, 3]), frozenset([0, 1, 2, 3])), '-': (frozenset([1, 3]), frozenset([1, 3]), frozenset([0, 2]), frozenset([0, 1, 2, 3])), '0': (frozenset([1, 3]), frozenset([1, 3]), frozenset([0, 2]), frozenset([0, 1, 2, 3])), '1': (frozenset([1, 3]), frozenset([1, 3]), frozenset([0, 2]), frozenset([0, 1, 2, 3])), '2': (frozenset([1, 3]), frozenset([1, 3]), frozenset([0, 2]), frozenset([0, 1, 2, 3])), '3': (frozenset([1, 3]), frozenset([1, 3]), frozenset([0, 2]), frozenset([0, 1, 2, 3])), '4': (frozenset([1, 3]), frozenset([1, 3]), frozenset([0, 2]), frozenset([0, 1, 2, 3])), '5': (frozenset([1, 3]), frozenset([1, 3]), frozenset([0, 2]), frozenset([0, 1, 2, 3])), '6': (frozenset([1, 3]), frozenset([1, 3]), frozenset([0, 2]), frozenset([0, 1, 2, 3])), '7': (frozenset([1, 3]), frozenset([1, 3]), frozenset([0, 2]), frozenset([0, 1, 2, 3])), '8': (frozenset([1, 3]), frozenset([1, 3]), frozenset([0, 2]), frozenset([0, 1, 2, 3])), '9': (frozenset([1, 3]), frozenset([1, 3]), frozenset([0, 2]), frozenset([0, 1, 2, 3])), '@': (frozenset([0, 1]), frozenset([0, 1]), frozenset([2, 3]), frozenset([0, 1, 2, 3])), 'a': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0, 3]), frozenset([0, 1, 2, 3])), 'b': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0, 3]), frozenset([0, 1, 2, 3])), 'c': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0, 3]), frozenset([0, 1, 2, 3])), 'd': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0, 3]), frozenset([0, 1, 2, 3])), 'e': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0, 3]), frozenset([0, 1, 2, 3])), 'f': (frozenset([1, 2, 3]), frozenset([1, 2, 3]), frozenset([0]), frozenset([0, 1, 2, 3])), 'g': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0, 3]), frozenset([0, 1, 2, 3])), 'h': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0, 3]), frozenset([0, 1, 2, 3])), 'i': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0, 3]), frozenset([0, 1, 2, 3])), 'j': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0, 3]), frozenset([0, 1, 2, 3])), 'k': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0, 3]), frozenset([0, 1, 2, 3])), 'l': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0, 3]), frozenset([0, 1, 2, 3])), 'm': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0, 3]), frozenset([0, 1, 2, 3])), 'n': (frozenset([1, 2, 3]), frozenset([1, 2, 3]), frozenset([0]), frozenset([0, 1, 2, 3])), 'o': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0, 3]), frozenset([0, 1, 2, 3])), 'p': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0, 3]), frozenset([0, 1, 2, 3])), 'q': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0, 3]), frozenset([0, 1, 2, 3])), 'r': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0, 3]), frozenset([0, 1, 2, 3])), 's': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0, 3]), frozenset([0, 1, 2, 3])), 't': (frozenset([1, 2, 3]), frozenset([1, 2, 3]), frozenset([0]), frozenset([0, 1, 2, 3])), 'u': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0, 3]), frozenset([0, 1, 2, 3])), 'v': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0, 3]), frozenset([0, 1, 2, 3])), 'w': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0, 3]), frozenset([0, 1, 2, 3])), 'x': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0, 3]), frozenset([0, 1, 2, 3])), 'y': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0, 3]), frozenset([0, 1, 2, 3])), 'z': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0, 3]), frozenset([0, 1, 2, 3]))}
+    DISPATCH12 = (frozenset([]), frozenset([]), frozenset([0, 1, 2, 3]), frozenset([0, 1, 2, 3]))
+    FRAMES13 = {'abs_singular_query': RuleFrame('abs_singular_query', 0), 'comparison_expr': RuleFrame('comparison_expr', 0), 'false_literal': RuleFrame('false_literal', 0), 'filter_query': RuleFrame('filter_query', 2), 'function_expr': RuleFrame('function_expr', 0), 'function_name': RuleFrame('function_name', 0), 'int': RuleFrame('int', 0), 'literal': RuleFrame('literal', 2), 'logical_and_expr': RuleFrame('logical_and_expr', 0), 'logical_expr': RuleFrame('logical_expr', 2), 'logical_not_op': RuleFrame('logical_not_op', 0), 'logical_or_expr': RuleFrame('logical_or_expr', 0), 'null': RuleFrame('null', 0), 'number': RuleFrame('number', 0), 'paren_expr': RuleFrame('paren_expr', 0), 'rel_query': RuleFrame('rel_query', 0), 'rel_singular_query': RuleFrame('rel_singular_query', 0), 'root_query': RuleFrame('root_query', 0), 'singular_query': RuleFrame('singular_query', 2), 'test_expr': RuleFrame('test_expr', 0), 'true_literal': RuleFrame('true_literal', 0)}
+    LABELS17 = ((('filter_query', 'rel_query'), '"@"'), (('filter_query', 'root_query'), '"$"'))
+    LABELS18 = ((('logical_expr', 'logical_or_expr', 'logical_and_expr', 'paren_expr', 'logical_not_op'), '"!"'), (('logical_expr', 'logical_or_expr', 'logical_and_expr', 'paren_expr'), '"("'), (('logical_expr', 'logical_or_expr', 'logical_and_expr', 'comparison_expr', 'literal', 'number', 'int'), '"0"'), (('logical_expr', 'logical_or_expr', 'logical_and_expr', 'comparison_expr', 'literal', 'number', 'int'), '"-"'), (('logical_expr', 'logical_or_expr', 'logical_and_expr', 'comparison_expr', 'literal', 'number', 'int'), "''1''..''9''"), (('logical_expr', 'logical_or_expr', 'logical_and_expr', 'comparison_expr', 'literal', 'number'), '"-0"'), (('logical_expr', 'logical_or_expr', 'logical_and_expr', 'comparison_expr', 'literal'), '"""'), (('logical_expr', 'logical_or_expr', 'logical_and_expr', 'comparison_expr', 'literal'), '"\'"'), (('logical_expr', 'logical_or_expr', 'logical_and_expr', 'comparison_expr', 'literal', 'true_literal'), '"true"'), (('logical_expr', 'logical_or_expr', 'logical_and_expr', 'comparison_expr', 'literal', 'false_literal'), '"false"'), (('logical_expr', 'logical_or_expr', 'logical_and_expr', 'comparison_expr', 'literal', 'null'), '"null"'), (('logical_expr', 'logical_or_expr', 'logical_and_expr', 'comparison_expr', 'singular_query', 'rel_singular_query'), '"@"'), (('logical_expr', 'logical_or_expr', 'logical_and_expr', 'comparison_expr', 'singular_query', 'abs_singular_query'), '"$"'), (('logical_expr', 'logical_or_expr', 'logical_and_expr', 'comparison_expr', 'function_expr', 'function_name'), "''a''..''z''"), (('logical_expr', 'logical_or_expr', 'logical_and_expr', 'test_expr', 'logical_not_op'), '"!"'), (('logical_expr', 'logical_or_expr', 'logical_and_expr', 'test_expr', 'rel_query'), '"@"'), (('logical_expr', 'logical_or_expr', 'logical_and_expr', 'test_expr', 'root_query'), '"$"'), (('logical_expr', 'logical_or_expr', 'logical_and_expr', 'test_expr', 'function_expr', 'function_name'), "''a''..''z''"))
+    LABELS19 = ((('function_expr', 'function_name'), "''a''..''z''"),)
+    LABELS20 = ((('literal', 'number', 'int'), '"0"'), (('literal', 'number', 'int'), '"-"'), (('literal', 'number', 'int'), "''1''..''9''"), (('literal', 'number'), '"-0"'), (('literal',), '"""'), (('literal',), '"\'"'), (('literal', 'true_literal'), '"true"'), (('literal', 'false_literal'), '"false"'), (('literal', 'null'), '"null"'))
+    RE27 = re.compile('[\\\t\\\n\\\r\\ ]', re.VERSION1)
+    RE30 = re.compile('[\\\t\\\n\\\r\\ ]', re.VERSION1)
+    DISPATCH31 = {'!': (frozenset([1]), frozenset([1]), frozenset([0, 2, 3]), frozenset([0, 1, 2, 3])), '"': (frozenset([1, 3]), frozenset([1, 3]), frozenset([0, 2]), frozenset([0, 1, 2, 3])), '$': (frozenset([0, 1]), frozenset([0, 1]), frozenset([2, 3]), frozenset([0, 1, 2, 3])), "'": (frozenset([1, 3]), frozenset([1, 3]), frozenset([0, 2]), frozenset([0, 1, 2, 3])), '(': (frozenset([1]), frozenset([1]), frozenset([0, 2, 3]), frozenset([0, 1, 2, 3])), '-': (frozenset([1, 3]), frozenset([1, 3]), frozenset([0, 2]), frozenset([0, 1, 2, 3])), '0': (frozenset([1, 3]), frozenset([1, 3]), frozenset([0, 2]), frozenset([0, 1, 2, 3])), '1': (frozenset([1, 3]), frozenset([1, 3]), frozenset([0, 2]), frozenset([0, 1, 2, 3])), '2': (frozenset([1, 3]), frozenset([1, 3]), frozenset([0, 2]), frozenset([0, 1, 2, 3])), '3': (frozenset([1, 3]), frozenset([1, 3]), frozenset([0, 2]), frozenset([0, 1, 2, 3])), '4': (frozenset([1, 3]), frozenset([1, 3]), frozenset([0, 2]), frozenset([0, 1, 2, 3])), '5': (frozenset([1, 3]), frozenset([1, 3]), frozenset([0, 2]), frozenset([0, 1, 2, 3])), '6': (frozenset([1, 3]), frozenset([1, 3]), frozenset([0, 2]), frozenset([0, 1, 2, 3])), '7': (frozenset([1, 3]), frozenset([1, 3]), frozenset([0, 2]), frozenset([0, 1, 2, 3])), '8': (frozenset([1, 3]), frozenset([1, 3]), frozenset([0, 2]), frozenset([0, 1, 2, 3])), '9': (frozenset([1, 3]), frozenset([1, 3]), frozenset([0, 2]), frozenset([0, 1, 2, 3])), '@': (frozenset([0, 1]), frozenset([0, 1]), frozenset([2, 3]), frozenset([0, 1, 2, 3])), 'a': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0, 3]), frozenset([0, 1, 2, 3])), 'b': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0, 3]), frozenset([0, 1, 2, 3])), 'c': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0, 3]), frozenset([0, 1, 2, 3])), 'd': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0, 3]), frozenset([0, 1, 2, 3])), 'e': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0, 3]), frozenset([0, 1, 2, 3])), 'f': (frozenset([1, 2, 3]), frozenset([1, 2, 3]), frozenset([0]), frozenset([0, 1, 2, 3])), 'g': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0, 3]), frozenset([0, 1, 2, 3])), 'h': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0, 3]), frozenset([0, 1, 2, 3])), 'i': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0, 3]), frozenset([0, 1, 2, 3])), 'j': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0, 3]), frozenset([0, 1, 2, 3])), 'k': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0, 3]), frozenset([0, 1, 2, 3])), 'l': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0, 3]), frozenset([0, 1, 2, 3])), 'm': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0, 3]), frozenset([0, 1, 2, 3])), 'n': (frozenset([1, 2, 3]), frozenset([1, 2, 3]), frozenset([0]), frozenset([0, 1, 2, 3])), 'o': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0, 3]), frozenset([0, 1, 2, 3])), 'p': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0, 3]), frozenset([0, 1, 2, 3])), 'q': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0, 3]), frozenset([0, 1, 2, 3])), 'r': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0, 3]), frozenset([0, 1, 2, 3])), 's': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0, 3]), frozenset([0, 1, 2, 3])), 't': (frozenset([1, 2, 3]), frozenset([1, 2, 3]), frozenset([0]), frozenset([0, 1, 2, 3])), 'u': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0, 3]), frozenset([0, 1, 2, 3])), 'v': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0, 3]), frozenset([0, 1, 2, 3])), 'w': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0, 3]), frozenset([0, 1, 2, 3])), 'x': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0, 3]), frozenset([0, 1, 2, 3])), 'y': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0, 3]), frozenset([0, 1, 2, 3])), 'z': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0, 3]), frozenset([0, 1, 2, 3]))}
+    DISPATCH32 = (frozenset([]), frozenset([]), frozenset([0, 1, 2, 3]), frozenset([0, 1, 2, 3]))
+    FRAMES33 = {'abs_singular_query': RuleFrame('abs_singular_query', 0), 'comparison_expr': RuleFrame('comparison_expr', 0), 'false_literal': RuleFrame('false_literal', 0), 'filter_query': RuleFrame('filter_query', 2), 'function_expr': RuleFrame('function_expr', 0), 'function_name': RuleFrame('function_name', 0), 'int': RuleFrame('int', 0), 'literal': RuleFrame('literal', 2), 'logical_and_expr': RuleFrame('logical_and_expr', 0), 'logical_expr': RuleFrame('logical_expr', 2), 'logical_not_op': RuleFrame('logical_not_op', 0), 'logical_or_expr': RuleFrame('logical_or_expr', 0), 'null': RuleFrame('null', 0), 'number': RuleFrame('number', 0), 'paren_expr': RuleFrame('paren_expr', 0), 'rel_query': RuleFrame('rel_query', 0), 'rel_singular_query': RuleFrame('rel_singular_query', 0), 'root_query': RuleFrame('root_query', 0), 'singular_query': RuleFrame('singular_query', 2), 'test_expr': RuleFrame('test_expr', 0), 'true_literal': RuleFrame('true_literal', 0)}
+    LABELS37 = ((('filter_query', 'rel_query'), '"@"'), (('filter_query', 'root_query'), '"$"'))
+    LABELS38 = ((('logical_expr', 'logical_or_expr', 'logical_and_expr', 'paren_expr', 'logical_not_op'), '"!"'), (('logical_expr', 'logical_or_expr', 'logical_and_expr', 'paren_expr'), '"("'), (('logical_expr', 'logical_or_expr', 'logical_and_expr', 'comparison_expr', 'literal', 'number', 'int'), '"0"'), (('logical_expr', 'logical_or_expr', 'logical_and_expr', 'comparison_expr', 'literal', 'number', 'int'), '"-"'), (('logical_expr', 'logical_or_expr', 'logical_and_expr', 'comparison_expr', 'literal', 'number', 'int'), "''1''..''9''"), (('logical_expr', 'logical_or_expr', 'logical_and_expr', 'comparison_expr', 'literal', 'number'), '"-0"'), (('logical_expr', 'logical_or_expr', 'logical_and_expr', 'comparison_expr', 'literal'), '"""'), (('logical_expr', 'logical_or_expr', 'logical_and_expr', 'comparison_expr', 'literal'), '"\'"'), (('logical_expr', 'logical_or_expr', 'logical_and_expr', 'comparison_expr', 'literal', 'true_literal'), '"true"'), (('logical_expr', 'logical_or_expr', 'logical_and_expr', 'comparison_expr', 'literal', 'false_literal'), '"false"'), (('logical_expr', 'logical_or_expr', 'logical_and_expr', 'comparison_expr', 'literal', 'null'), '"null"'), (('logical_expr', 'logical_or_expr', 'logical_and_expr', 'comparison_expr', 'singular_query', 'rel_singular_query'), '"@"'), (('logical_expr', 'logical_or_expr', 'logical_and_expr', 'comparison_expr', 'singular_query', 'abs_singular_query'), '"$"'), (('logical_expr', 'logical_or_expr', 'logical_and_expr', 'comparison_expr', 'function_expr', 'function_name'), "''a''..''z''"), (('logical_expr', 'logical_or_expr', 'logical_and_expr', 'test_expr', 'logical_not_op'), '"!"'), (('logical_expr', 'logical_or_expr', 'logical_and_expr', 'test_expr', 'rel_query'), '"@"'), (('logical_expr', 'logical_or_expr', 'logical_and_expr', 'test_expr', 'root_query'), '"$"'), (('logical_expr', 'logical_or_expr', 'logical_and_expr', 'test_expr', 'function_expr', 'function_name'), "''a''..''z''"))
+    LABELS39 = ((('function_expr', 'function_name'), "''a''..''z''"),)
+    LABELS40 = ((('literal', 'number', 'int'), '"0"'), (('literal', 'number', 'int'), '"-"'), (('literal', 'number', 'int'), "''1''..''9''"), (('literal', 'number'), '"-0"'), (('literal',), '"""'), (('literal',), '"\'"'), (('literal', 'true_literal'), '"true"'), (('literal', 'false_literal'), '"false"'), (('literal', 'null'), '"null"'))
+    RE43 = re.compile('[\\\t\\\n\\\r\\ ]', re.VERSION1)
     
     rule_frame = RuleFrame('function_expr', 0)
     
@@ -6185,54 +7047,70 @@ def _parse_function_expr() -> Callable[[ParserState, list[Pair]], bool]:
             all_ok10 = True
             if all_ok10:
                 matched9 = False
-                # <Choice>
-                children11: list[Pair] = []
+                # <DispatchChoice>
+                children14: list[Pair] = []
                 matched9 = False
+                if state.pos < len(state.input):
+                    attempt15, replay16 = dispatch_alternatives(state, DISPATCH11.get(state.input[state.pos], DISPATCH12))
+                else:
+                    attempt15, replay16 = dispatch_alternatives(state, DISPATCH12)
                 if not matched9:
-                    state.checkpoint()
-                    # <Identifier>
-                    matched9 = parse_filter_query(state, children11)
-                    # </Identifier>
-                    if matched9:
-                        state.ok()
-                        children8.extend(children11)
-                    else:
-                        state.restore()
-                        children11.clear()
+                    if 0 in attempt15:
+                        state.checkpoint()
+                        # <Identifier>
+                        matched9 = parse_filter_query(state, children14)
+                        # </Identifier>
+                        if matched9:
+                            state.ok()
+                            children8.extend(children14)
+                        else:
+                            state.restore()
+                            children14.clear()
+                    elif 0 in replay16:
+                        record_failures(state, LABELS17, FRAMES13)
                 if not matched9:
-                    state.checkpoint()
-                    # <Identifier>
-                    matched9 = parse_logical_expr(state, children11)
-                    # </Identifier>
-                    if matched9:
-                        state.ok()
-                        children8.extend(children11)
-                    else:
-                        state.restore()
-                        children11.clear()
+                    if 1 in attempt15:
+                        state.checkpoint()
+                        # <Identifier>
+                        matched9 = parse_logical_expr(state, children14)
+                        # </Identifier>
+                        if matched9:
+                            state.ok()
+                            children8.extend(children14)
+                        else:
+                            state.restore()
+                            children14.clear()
+                    elif 1 in replay16:
+                        record_failures(state, LABELS18, FRAMES13)
                 if not matched9:
-                    state.checkpoint()
-                    # <Identifier>
-                    matched9 = parse_function_expr(state, children11)
-                    # </Identifier>
-                    if matched9:
-                        state.ok()
-                        children8.extend(children11)
-                    else:
-                        state.restore()
-                        children11.clear()
+                    if 2 in attempt15:
+                        state.checkpoint()
+                        # <Identifier>
+                        matched9 = parse_function_expr(state, children14)
+                        # </Identifier>
+                        if matched9:
+                            state.ok()
+                            children8.extend(children14)
+                        else:
+                            state.restore()
+                            children14.clear()
+                    elif 2 in replay16:
+                        record_failures(state, LABELS19, FRAMES13)
                 if not matched9:
-                    state.checkpoint()
-                    # <Identifier>
-                    matched9 = parse_literal(state, children11)
-                    # </Identifier>
-                    if matched9:
-                        state.ok()
-                        children8.extend(children11)
-                    else:
-                        state.restore()
-                        children11.clear()
-                # </Choice>
+                    if 3 in attempt15:
+                        state.checkpoint()
+                        # <Identifier>
+                        matched9 = parse_literal(state, children14)
+                        # </Identifier>
+                        if matched9:
+                            state.ok()
+                            children8.extend(children14)
+                        else:
+                            state.restore()
+                            children14.clear()
+                    elif 3 in replay16:
+                        record_failures(state, LABELS20, FRAMES13)
+                # </DispatchChoice>
                 if not matched9:
                     all_ok10 = False
                 if all_ok10:
@@ -6240,151 +7118,167 @@ def _parse_function_expr() -> Callable[[ParserState, list[Pair]], bool]:
             if all_ok10:
                 matched9 = False
                 # <Repeat>
-                trivia_pos13 = state.pos
-                children12: list[Pair] = []
+                trivia_pos22 = state.pos
+                children21: list[Pair] = []
                 while True:
                     state.checkpoint()
                     # <Group>
                     # <Sequence n=4>
-                    all_ok15 = True
-                    if all_ok15:
-                        matched14 = False
+                    all_ok24 = True
+                    if all_ok24:
+                        matched23 = False
                         # <Repeat>
-                        trivia_pos17 = state.pos
-                        children16: list[Pair] = []
+                        trivia_pos26 = state.pos
+                        children25: list[Pair] = []
                         while True:
                             state.checkpoint()
                             # <ChoiceRegex>
-                            if match := RE18.match(state.input, state.pos):
+                            if match := RE27.match(state.input, state.pos):
                                 state.pos = match.end()
-                                matched14 = True
+                                matched23 = True
                             else:
-                                matched14 = False
+                                matched23 = False
                             # </ChoiceRegex>
-                            if matched14:
+                            if matched23:
                                 state.ok()
-                                children12.extend(children16)
-                                children16.clear()
-                                trivia_pos17 = state.pos
-                                parse_trivia(state, children16)
+                                children21.extend(children25)
+                                children25.clear()
+                                trivia_pos26 = state.pos
+                                parse_trivia(state, children25)
                             else:
                                 state.restore()
-                                state.pos = trivia_pos17
-                                matched14 = True
+                                state.pos = trivia_pos26
+                                matched23 = True
                                 break
                         # </Repeat>
-                        if not matched14:
-                            all_ok15 = False
-                        if all_ok15:
-                            parse_trivia(state, children12)
-                    if all_ok15:
-                        matched14 = False
+                        if not matched23:
+                            all_ok24 = False
+                        if all_ok24:
+                            parse_trivia(state, children21)
+                    if all_ok24:
+                        matched23 = False
                         # <String>
                         if state.input.startswith(',', state.pos):
                             state.pos += 1
-                            matched14 = True
+                            matched23 = True
                         else:
-                            matched14 = False
+                            matched23 = False
                             state.fail('","')
                         # </String>
-                        if not matched14:
-                            all_ok15 = False
-                        if all_ok15:
-                            parse_trivia(state, children12)
-                    if all_ok15:
-                        matched14 = False
+                        if not matched23:
+                            all_ok24 = False
+                        if all_ok24:
+                            parse_trivia(state, children21)
+                    if all_ok24:
+                        matched23 = False
                         # <Repeat>
-                        trivia_pos20 = state.pos
-                        children19: list[Pair] = []
+                        trivia_pos29 = state.pos
+                        children28: list[Pair] = []
                         while True:
                             state.checkpoint()
                             # <ChoiceRegex>
-                            if match := RE21.match(state.input, state.pos):
+                            if match := RE30.match(state.input, state.pos):
                                 state.pos = match.end()
-                                matched14 = True
+                                matched23 = True
                             else:
-                                matched14 = False
+                                matched23 = False
                             # </ChoiceRegex>
-                            if matched14:
+                            if matched23:
                                 state.ok()
-                                children12.extend(children19)
-                                children19.clear()
-                                trivia_pos20 = state.pos
-                                parse_trivia(state, children19)
+                                children21.extend(children28)
+                                children28.clear()
+                                trivia_pos29 = state.pos
+                                parse_trivia(state, children28)
                             else:
                                 state.restore()
-                                state.pos = trivia_pos20
-                                matched14 = True
+                                state.pos = trivia_pos29
+                                matched23 = True
                                 break
                         # </Repeat>
-                        if not matched14:
-                            all_ok15 = False
-                        if all_ok15:
-                            parse_trivia(state, children12)
-                    if all_ok15:
-                        matched14 = False
-                        # <Choice>
-                        children22: list[Pair] = []
-                        matched14 = False
-                        if not matched14:
-                            state.checkpoint()
-                            # <Identifier>
-                            matched14 = parse_filter_query(state, children22)
-                            # </Identifier>
-                            if matched14:
-                                state.ok()
-                                children12.extend(children22)
-                            else:
-                                state.restore()
-                                children22.clear()
-                        if not matched14:
-                            state.checkpoint()
-                            # <Identifier>
-                            matched14 = parse_logical_expr(state, children22)
-                            # </Identifier>
-                            if matched14:
-                                state.ok()
-                                children12.extend(children22)
-                            else:
-                                state.restore()
-                                children22.clear()
-                        if not matched14:
-                            state.checkpoint()
-                            # <Identifier>
-                            matched14 = parse_function_expr(state, children22)
-                            # </Identifier>
-                            if matched14:
-                                state.ok()
-                                children12.extend(children22)
-                            else:
-                                state.restore()
-                                children22.clear()
-                        if not matched14:
-                            state.checkpoint()
-                            # <Identifier>
-                            matched14 = parse_literal(state, children22)
-                            # </Identifier>
-                            if matched14:
-                                state.ok()
-                                children12.extend(children22)
-                            else:
-                                state.restore()
-                                children22.clear()
-                        # </Choice>
-                        if not matched14:
-                            all_ok15 = False
-                    matched9 = all_ok15
+                        if not matched23:
+                            all_ok24 = False
+                        if all_ok24:
+                            parse_trivia(state, children21)
+                    if all_ok24:
+                        matched23 = False
+                        # <DispatchChoice>
+                        children34: list[Pair] = []
+                        matched23 = False
+                        if state.pos < len(state.input):
+                            attempt35, replay36 = dispatch_alternatives(state, DISPATCH31.get(state.input[state.pos], DISPATCH32))
+                        else:
+                            attempt35, replay36 = dispatch_alternatives(state, DISPATCH32)
+                        if not matched23:
+                            if 0 in attempt35:
+                                state.checkpoint()
+                                # <Identifier>
+                                matched23 = parse_filter_query(state, children34)
+                                # </Identifier>
+                                if matched23:
+                                    state.ok()
+                                    children21.extend(children34)
+                                else:
+                                    state.restore()
+                                    children34.clear()
+                            elif 0 in replay36:
+                                record_failures(state, LABELS37, FRAMES33)
+                        if not matched23:
+                            if 1 in attempt35:
+                                state.checkpoint()
+                                # <Identifier>
+                                matched23 = parse_logical_expr(state, children34)
+                                # </Identifier>
+                                if matched23:
+                                    state.ok()
+                                    children21.extend(children34)
+                                else:
+                                    state.restore()
+                                    children34.clear()
+                            elif 1 in replay36:
+                                record_failures(state, LABELS38, FRAMES33)
+                        if not matched23:
+                            if 2 in attempt35:
+                                state.checkpoint()
+                                # <Identifier>
+                                matched23 = parse_function_expr(state, children34)
+                                # </Identifier>
+                                if matched23:
+                                    state.ok()
+                                    children21.extend(children34)
+                                else:
+                                    state.restore()
+                                    children34.clear()
+                            elif 2 in replay36:
+                                record_failures(state, LABELS39, FRAMES33)
+                        if not matched23:
+                            if 3 in attempt35:
+                                state.checkpoint()
+                                # <Identifier>
+                                matched23 = parse_literal(state, children34)
+                                # </Identifier>
+                                if matched23:
+                                    state.ok()
+                                    children21.extend(children34)
+                                else:
+                                    state.restore()
+                                    children34.clear()
+                            elif 3 in replay36:
+                                record_failures(state, LABELS40, FRAMES33)
+                        # </DispatchChoice>
+                        if not matched23:
+                            all_ok24 = False
+                    matched9 = all_ok24
                     # </Sequence>
                     # </Group>
                     if matched9:
                         state.ok()
-                        children8.extend(children12)
-                        children12.clear()
-                        trivia_pos13 = state.pos
-                        parse_trivia(state, children12)
+                        children8.extend(children21)
+                        children21.clear()
+                        trivia_pos22 = state.pos
+                        parse_trivia(state, children21)
                     else:
                         state.restore()
-                        state.pos = trivia_pos13
+                        state.pos = trivia_pos22
                         matched9 = True
                         break
                 # </Repeat>
@@ -6408,12 +7302,12 @@ def _parse_function_expr() -> Callable[[ParserState, list[Pair]], bool]:
         if all_ok4:
             matched3 = False
             # <Repeat>
-            trivia_pos24 = state.pos
-            children23: list[Pair] = []
+            trivia_pos42 = state.pos
+            children41: list[Pair] = []
             while True:
                 state.checkpoint()
                 # <ChoiceRegex>
-                if match := RE25.match(state.input, state.pos):
+                if match := RE43.match(state.input, state.pos):
                     state.pos = match.end()
                     matched3 = True
                 else:
@@ -6421,13 +7315,13 @@ def _parse_function_expr() -> Callable[[ParserState, list[Pair]], bool]:
                 # </ChoiceRegex>
                 if matched3:
                     state.ok()
-                    children2.extend(children23)
-                    children23.clear()
-                    trivia_pos24 = state.pos
-                    parse_trivia(state, children23)
+                    children2.extend(children41)
+                    children41.clear()
+                    trivia_pos42 = state.pos
+                    parse_trivia(state, children41)
                 else:
                     state.restore()
-                    state.pos = trivia_pos24
+                    state.pos = trivia_pos42
                     matched3 = True
                     break
             # </Repeat>
@@ -6451,11 +7345,14 @@ def _parse_function_expr() -> Callable[[ParserState, list[Pair]], bool]:
         # </Sequence>
         state.rule_stack.pop()
         if state.tag_stack:
-            tag26: str | None = state.tag_stack.pop()
+            tag44: str | None = state.tag_stack.pop()
         else:
-            tag26 = None
+            tag44 = None
         if matched:
-            pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag26,))
+            if state.arena is None:
+                pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag44, state.line_index))
+            else:
+                pairs.append(state.arena.add(rule_frame, pos1, state.pos, children2, tag44))
         return matched
     
     return inner
@@ -6463,238 +7360,318 @@ def _parse_function_expr() -> Callable[[ParserState, list[Pair]], bool]:
 parse_function_expr = _parse_function_expr()
 
 def _parse_function_argument() -> Callable[[ParserState, list[Pair]], bool]:
+    DISPATCH3 = {'!': (frozenset([1]), frozenset([1]), frozenset([0, 2, 3]), frozenset([0, 1, 2, 3])), '"': (frozenset([1, 3]), frozenset([1, 3]), frozenset([0, 2]), frozenset([0, 1, 2, 3])), '$': (frozenset([0, 1]), frozenset([0, 1]), frozenset([2, 3]), frozenset([0, 1, 2, 3])), "'": (frozenset([1, 3]), frozenset([1, 3]), frozenset([0, 2]), frozenset([0, 1, 2, 3])), '(': (frozenset([1]), frozenset([1]), frozenset([0, 2, 3]), frozenset([0, 1, 2, 3])), '-': (frozenset([1, 3]), frozenset([1, 3]), frozenset([0, 2]), frozenset([0, 1, 2, 3])), '0': (frozenset([1, 3]), frozenset([1, 3]), frozenset([0, 2]), frozenset([0, 1, 2, 3])), '1': (frozenset([1, 3]), frozenset([1, 3]), frozenset([0, 2]), frozenset([0, 1, 2, 3])), '2': (frozenset([1, 3]), frozenset([1, 3]), frozenset([0, 2]), frozenset([0, 1, 2, 3])), '3': (frozenset([1, 3]), frozenset([1, 3]), frozenset([0, 2]), frozenset([0, 1, 2, 3])), '4': (frozenset([1, 3]), frozenset([1, 3]), frozenset([0, 2]), frozenset([0, 1, 2, 3])), '5': (frozenset([1, 3]), frozenset([1, 3]), frozenset([0, 2]), frozenset([0, 1, 2, 3])), '6': (frozenset([1, 3]), frozenset([1, 3]), frozenset([0, 2]), frozenset([0, 1, 2, 3])), '7': (frozenset([1, 3]), frozenset([1, 3]), frozenset([0, 2]), frozenset([0, 1, 2, 3])), '8': (frozenset([1, 3]), frozenset([1, 3]), frozenset([0, 2]), frozenset([0, 1, 2, 3])), '9': (frozenset([1, 3]), frozenset([1, 3]), frozenset([0, 2]), frozenset([0, 1, 2, 3])), '@': (frozenset([0, 1]), frozenset([0, 1]), frozenset([2, 3]), frozenset([0, 1, 2, 3])), 'a': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0, 3]), frozenset([0, 1, 2, 3])), 'b': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0, 3]), frozenset([0, 1, 2, 3])), 'c': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0, 3]), frozenset([0, 1, 2, 3])), 'd': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0, 3]), frozenset([0, 1, 2, 3])), 'e': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0, 3]), frozenset([0, 1, 2, 3])), 'f': (frozenset([1, 2, 3]), frozenset([1, 2, 3]), frozenset([0]), frozenset([0, 1, 2, 3])), 'g': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0, 3]), frozenset([0, 1, 2, 3])), 'h': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0, 3]), frozenset([0, 1, 2, 3])), 'i': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0, 3]), frozenset([0, 1, 2, 3])), 'j': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0, 3]), frozenset([0, 1, 2, 3])), 'k': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0, 3]), frozenset([0, 1, 2, 3])), 'l': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0, 3]), frozenset([0, 1, 2, 3])), 'm': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0, 3]), frozenset([0, 1, 2, 3])), 'n': (frozenset([1, 2, 3]), frozenset([1, 2, 3]), frozenset([0]), frozenset([0, 1, 2, 3])), 'o': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0, 3]), frozenset([0, 1, 2, 3])), 'p': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0, 3]), frozenset([0, 1, 2, 3])), 'q': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0, 3]), frozenset([0, 1, 2, 3])), 'r': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0, 3]), frozenset([0, 1, 2, 3])), 's': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0, 3]), frozenset([0, 1, 2, 3])), 't': (frozenset([1, 2, 3]), frozenset([1, 2, 3]), frozenset([0]), frozenset([0, 1, 2, 3])), 'u': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0, 3]), frozenset([0, 1, 2, 3])), 'v': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0, 3]), frozenset([0, 1, 2, 3])), 'w': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0, 3]), frozenset([0, 1, 2, 3])), 'x': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0, 3]), frozenset([0, 1, 2, 3])), 'y': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0, 3]), frozenset([0, 1, 2, 3])), 'z': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0, 3]), frozenset([0, 1, 2, 3]))}
+    DISPATCH4 = (frozenset([]), frozenset([]), frozenset([0, 1, 2, 3]), frozenset([0, 1, 2, 3]))
+    FRAMES5 = {'abs_singular_query': RuleFrame('abs_singular_query', 0), 'comparison_expr': RuleFrame('comparison_expr', 0), 'false_literal': RuleFrame('false_literal', 0), 'function_expr': RuleFrame('function_expr', 0), 'function_name': RuleFrame('function_name', 0), 'int': RuleFrame('int', 0), 'literal': RuleFrame('literal', 2), 'logical_and_expr': RuleFrame('logical_and_expr', 0), 'logical_not_op': RuleFrame('logical_not_op', 0), 'logical_or_expr': RuleFrame('logical_or_expr', 0), 'null': RuleFrame('null', 0), 'number': RuleFrame('number', 0), 'paren_expr': RuleFrame('paren_expr', 0), 'rel_query': RuleFrame('rel_query', 0), 'rel_singular_query': RuleFrame('rel_singular_query', 0), 'root_query': RuleFrame('root_query', 0), 'singular_query': RuleFrame('singular_query', 2), 'test_expr': RuleFrame('test_expr', 0), 'true_literal': RuleFrame('true_literal', 0)}
+    DISPATCH9 = {'$': (frozenset([1]), frozenset([1]), frozenset([0]), frozenset([0, 1])), '@': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1]))}
+    DISPATCH10 = (frozenset([]), frozenset([]), frozenset([0, 1]), frozenset([0, 1]))
+    FRAMES11 = {'rel_query': RuleFrame('rel_query', 0), 'root_query': RuleFrame('root_query', 0)}
+    LABELS15 = ((('rel_query',), '"@"'),)
+    LABELS16 = ((('root_query',), '"$"'),)
+    LABELS17 = ((('rel_query',), '"@"'), (('root_query',), '"$"'))
+    LABELS18 = ((('logical_or_expr', 'logical_and_expr', 'paren_expr', 'logical_not_op'), '"!"'), (('logical_or_expr', 'logical_and_expr', 'paren_expr'), '"("'), (('logical_or_expr', 'logical_and_expr', 'comparison_expr', 'literal', 'number', 'int'), '"0"'), (('logical_or_expr', 'logical_and_expr', 'comparison_expr', 'literal', 'number', 'int'), '"-"'), (('logical_or_expr', 'logical_and_expr', 'comparison_expr', 'literal', 'number', 'int'), "''1''..''9''"), (('logical_or_expr', 'logical_and_expr', 'comparison_expr', 'literal', 'number'), '"-0"'), (('logical_or_expr', 'logical_and_expr', 'comparison_expr', 'literal'), '"""'), (('logical_or_expr', 'logical_and_expr', 'comparison_expr', 'literal'), '"\'"'), (('logical_or_expr', 'logical_and_expr', 'comparison_expr', 'literal', 'true_literal'), '"true"'), (('logical_or_expr', 'logical_and_expr', 'comparison_expr', 'literal', 'false_literal'), '"false"'), (('logical_or_expr', 'logical_and_expr', 'comparison_expr', 'literal', 'null'), '"null"'), (('logical_or_expr', 'logical_and_expr', 'comparison_expr', 'singular_query', 'rel_singular_query'), '"@"'), (('logical_or_expr', 'logical_and_expr', 'comparison_expr', 'singular_query', 'abs_singular_query'), '"$"'), (('logical_or_expr', 'logical_and_expr', 'comparison_expr', 'function_expr', 'function_name'), "''a''..''z''"), (('logical_or_expr', 'logical_and_expr', 'test_expr', 'logical_not_op'), '"!"'), (('logical_or_expr', 'logical_and_expr', 'test_expr', 'rel_query'), '"@"'), (('logical_or_expr', 'logical_and_expr', 'test_expr', 'root_query'), '"$"'), (('logical_or_expr', 'logical_and_expr', 'test_expr', 'function_expr', 'function_name'), "''a''..''z''"))
+    LABELS19 = ((('function_expr', 'function_name'), "''a''..''z''"),)
+    DISPATCH20 = {'"': (frozenset([1]), frozenset([1]), frozenset([0, 2, 3, 4]), frozenset([0, 1, 2, 3, 4])), "'": (frozenset([1]), frozenset([1]), frozenset([0, 2, 3, 4]), frozenset([0, 1, 2, 3, 4])), '-': (frozenset([0]), frozenset([0]), frozenset([1, 2, 3, 4]), frozenset([0, 1, 2, 3, 4])), '0': (frozenset([0]), frozenset([0]), frozenset([1, 2, 3, 4]), frozenset([0, 1, 2, 3, 4])), '1': (frozenset([0]), frozenset([0]), frozenset([1, 2, 3, 4]), frozenset([0, 1, 2, 3, 4])), '2': (frozenset([0]), frozenset([0]), frozenset([1, 2, 3, 4]), frozenset([0, 1, 2, 3, 4])), '3': (frozenset([0]), frozenset([0]), frozenset([1, 2, 3, 4]), frozenset([0, 1, 2, 3, 4])), '4': (frozenset([0]), frozenset([0]), frozenset([1, 2, 3, 4]), frozenset([0, 1, 2, 3, 4])), '5': (frozenset([0]), frozenset([0]), frozenset([1, 2, 3, 4]), frozenset([0, 1, 2, 3, 4])), '6': (frozenset([0]), frozenset([0]), frozenset([1, 2, 3, 4]), frozenset([0, 1, 2, 3, 4])), '7': (frozenset([0]), frozenset([0]), frozenset([1, 2, 3, 4]), frozenset([0, 1, 2, 3, 4])), '8': (frozenset([0]), frozenset([0]), frozenset([1, 2, 3, 4]), frozenset([0, 1, 2, 3, 4])), '9': (frozenset([0]), frozenset([0]), frozenset([1, 2, 3, 4]), frozenset([0, 1, 2, 3, 4])), 'f': (frozenset([3]), frozenset([3]), frozenset([0, 1, 2, 4]), frozenset([0, 1, 2, 3, 4])), 'n': (frozenset([4]), frozenset([4]), frozenset([0, 1, 2, 3]), frozenset([0, 1, 2, 3, 4])), 't': (frozenset([2]), frozenset([2]), frozenset([0, 1, 3, 4]), frozenset([0, 1, 2, 3, 4]))}
+    DISPATCH21 = (frozenset([]), frozenset([]), frozenset([0, 1, 2, 3, 4]), frozenset([0, 1, 2, 3, 4]))
+    FRAMES22 = {'false_literal': RuleFrame('false_literal', 0), 'int': RuleFrame('int', 0), 'null': RuleFrame('null', 0), 'number': RuleFrame('number', 0), 'true_literal': RuleFrame('true_literal', 0)}
+    LABELS26 = ((('number', 'int'), '"0"'), (('number', 'int'), '"-"'), (('number', 'int'), "''1''..''9''"), (('number',), '"-0"'))
+    DISPATCH27 = {'"': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1])), "'": (frozenset([1]), frozenset([1]), frozenset([0]), frozenset([0, 1]))}
+    DISPATCH28 = (frozenset([]), frozenset([]), frozenset([0, 1]), frozenset([0, 1]))
+    LABELS34 = (((), '"""'),)
+    LABELS37 = (((), '"\'"'),)
+    LABELS38 = (((), '"""'), ((), '"\'"'))
+    LABELS39 = ((('true_literal',), '"true"'),)
+    LABELS40 = ((('false_literal',), '"false"'),)
+    LABELS41 = ((('null',), '"null"'),)
+    LABELS42 = ((('number', 'int'), '"0"'), (('number', 'int'), '"-"'), (('number', 'int'), "''1''..''9''"), (('number',), '"-0"'), ((), '"""'), ((), '"\'"'), (('true_literal',), '"true"'), (('false_literal',), '"false"'), (('null',), '"null"'))
+    
     rule_frame = RuleFrame('function_argument', 2)
     
     def inner(state: ParserState, pairs: list[Pair]) -> bool:
         """Parse function_argument."""
         state.rule_stack.push(rule_frame)
         children2: list[Pair] = []
-        # <Choice>
-        children3: list[Pair] = []
+        # <DispatchChoice>
+        children6: list[Pair] = []
         matched = False
+        if state.pos < len(state.input):
+            attempt7, replay8 = dispatch_alternatives(state, DISPATCH3.get(state.input[state.pos], DISPATCH4))
+        else:
+            attempt7, replay8 = dispatch_alternatives(state, DISPATCH4)
         if not matched:
-            state.checkpoint()
-            # <Choice>
-            children4: list[Pair] = []
-            matched = False
-            if not matched:
-                state.checkpoint()
-                # <Identifier>
-                matched = parse_rel_query(state, children4)
-                # </Identifier>
-                if matched:
-                    state.ok()
-                    children3.extend(children4)
-                else:
-                    state.restore()
-                    children4.clear()
-            if not matched:
-                state.checkpoint()
-                # <Identifier>
-                matched = parse_root_query(state, children4)
-                # </Identifier>
-                if matched:
-                    state.ok()
-                    children3.extend(children4)
-                else:
-                    state.restore()
-                    children4.clear()
-            # </Choice>
-            if matched:
-                state.ok()
-                children2.extend(children3)
-            else:
-                state.restore()
-                children3.clear()
-        if not matched:
-            state.checkpoint()
-            # <Identifier>
-            matched = parse_logical_or_expr(state, children3)
-            # </Identifier>
-            if matched:
-                state.ok()
-                children2.extend(children3)
-            else:
-                state.restore()
-                children3.clear()
-        if not matched:
-            state.checkpoint()
-            # <Identifier>
-            matched = parse_function_expr(state, children3)
-            # </Identifier>
-            if matched:
-                state.ok()
-                children2.extend(children3)
-            else:
-                state.restore()
-                children3.clear()
-        if not matched:
-            state.checkpoint()
-            # <Choice>
-            children5: list[Pair] = []
-            matched = False
-            if not matched:
-                state.checkpoint()
-                # <Identifier>
-                matched = parse_number(state, children5)
-                # </Identifier>
-                if matched:
-                    state.ok()
-                    children3.extend(children5)
-                else:
-                    state.restore()
-                    children5.clear()
-            if not matched:
+            if 0 in attempt7:
                 state.checkpoint()
-                # <Choice>
-                children6: list[Pair] = []
+                # <DispatchChoice>
+                children12: list[Pair] = []
                 matched = False
+                if state.pos < len(state.input):
+                    attempt13, replay14 = dispatch_alternatives(state, DISPATCH9.get(state.input[state.pos], DISPATCH10))
+                else:
+                    attempt13, replay14 = dispatch_alternatives(state, DISPATCH10)
                 if not matched:
-                    state.checkpoint()
-                    # <Group>
-                    # <Sequence n=3>
-                    all_ok8 = True
-                    if all_ok8:
-                        matched7 = False
-                        # <String>
-                        if state.input.startswith('"', state.pos):
-                            state.pos += 1
-                            matched7 = True
-                        else:
-                            matched7 = False
-                            state.fail('"""')
-                        # </String>
-                        if not matched7:
-                            all_ok8 = False
-                        if all_ok8:
-                            parse_trivia(state, children6)
-                    if all_ok8:
-                        matched7 = False
+                    if 0 in attempt13:
+                        state.checkpoint()
                         # <Identifier>
-                        matched7 = parse_double_quoted(state, children6)
+                        matched = parse_rel_query(state, children12)
                         # </Identifier>
-                        if not matched7:
-                            all_ok8 = False
-                        if all_ok8:
-                            parse_trivia(state, children6)
-                    if all_ok8:
-                        matched7 = False
-                        # <String>
-                        if state.input.startswith('"', state.pos):
-                            state.pos += 1
-                            matched7 = True
+                        if matched:
+                            state.ok()
+                            children6.extend(children12)
                         else:
-                            matched7 = False
-                            state.fail('"""')
-                        # </String>
-                        if not matched7:
-                            all_ok8 = False
-                    matched = all_ok8
-                    # </Sequence>
-                    # </Group>
-                    if matched:
-                        state.ok()
-                        children5.extend(children6)
-                    else:
-                        state.restore()
-                        children6.clear()
+                            state.restore()
+                            children12.clear()
+                    elif 0 in replay14:
+                        record_failures(state, LABELS15, FRAMES11)
                 if not matched:
-                    state.checkpoint()
-                    # <Group>
-                    # <Sequence n=3>
-                    all_ok10 = True
-                    if all_ok10:
-                        matched9 = False
-                        # <String>
-                        if state.input.startswith("'", state.pos):
-                            state.pos += 1
-                            matched9 = True
-                        else:
-                            matched9 = False
-                            state.fail('"\'"')
-                        # </String>
-                        if not matched9:
-                            all_ok10 = False
-                        if all_ok10:
-                            parse_trivia(state, children6)
-                    if all_ok10:
-                        matched9 = False
+                    if 1 in attempt13:
+                        state.checkpoint()
                         # <Identifier>
-                        matched9 = parse_single_quoted(state, children6)
+                        matched = parse_root_query(state, children12)
                         # </Identifier>
-                        if not matched9:
-                            all_ok10 = False
-                        if all_ok10:
-                            parse_trivia(state, children6)
-                    if all_ok10:
-                        matched9 = False
-                        # <String>
-                        if state.input.startswith("'", state.pos):
-                            state.pos += 1
-                            matched9 = True
-                        else:
-                            matched9 = False
-                            state.fail('"\'"')
-                        # </String>
-                        if not matched9:
-                            all_ok10 = False
-                    matched = all_ok10
-                    # </Sequence>
-                    # </Group>
-                    if matched:
-                        state.ok()
-                        children5.extend(children6)
-                    else:
-                        state.restore()
-                        children6.clear()
-                # </Choice>
+                        if matched:
+                            state.ok()
+                            children6.extend(children12)
+                        else:
+                            state.restore()
+                            children12.clear()
+                    elif 1 in replay14:
+                        record_failures(state, LABELS16, FRAMES11)
+                # </DispatchChoice>
                 if matched:
                     state.ok()
-                    children3.extend(children5)
+                    children2.extend(children6)
                 else:
                     state.restore()
-                    children5.clear()
-            if not matched:
+                    children6.clear()
+            elif 0 in replay8:
+                record_failures(state, LABELS17, FRAMES5)
+        if not matched:
+            if 1 in attempt7:
                 state.checkpoint()
                 # <Identifier>
-                matched = parse_true_literal(state, children5)
+                matched = parse_logical_or_expr(state, children6)
                 # </Identifier>
                 if matched:
                     state.ok()
-                    children3.extend(children5)
+                    children2.extend(children6)
                 else:
                     state.restore()
-                    children5.clear()
-            if not matched:
+                    children6.clear()
+            elif 1 in replay8:
+                record_failures(state, LABELS18, FRAMES5)
+        if not matched:
+            if 2 in attempt7:
                 state.checkpoint()
                 # <Identifier>
-                matched = parse_false_literal(state, children5)
+                matched = parse_function_expr(state, children6)
                 # </Identifier>
                 if matched:
                     state.ok()
-                    children3.extend(children5)
+                    children2.extend(children6)
                 else:
                     state.restore()
-                    children5.clear()
-            if not matched:
+                    children6.clear()
+            elif 2 in replay8:
+                record_failures(state, LABELS19, FRAMES5)
+        if not matched:
+            if 3 in attempt7:
                 state.checkpoint()
-                # <Identifier>
-                matched = parse_null(state, children5)
-                # </Identifier>
+                # <DispatchChoice>
+                children23: list[Pair] = []
+                matched = False
+                if state.pos < len(state.input):
+                    attempt24, replay25 = dispatch_alternatives(state, DISPATCH20.get(state.input[state.pos], DISPATCH21))
+                else:
+                    attempt24, replay25 = dispatch_alternatives(state, DISPATCH21)
+                if not matched:
+                    if 0 in attempt24:
+                        state.checkpoint()
+                        # <Identifier>
+                        matched = parse_number(state, children23)
+                        # </Identifier>
+                        if matched:
+                            state.ok()
+                            children6.extend(children23)
+                        else:
+                            state.restore()
+                            children23.clear()
+                    elif 0 in replay25:
+                        record_failures(state, LABELS26, FRAMES22)
+                if not matched:
+                    if 1 in attempt24:
+                        state.checkpoint()
+                        # <DispatchChoice>
+                        children29: list[Pair] = []
+                        matched = False
+                        if state.pos < len(state.input):
+                            attempt30, replay31 = dispatch_alternatives(state, DISPATCH27.get(state.input[state.pos], DISPATCH28))
+                        else:
+                            attempt30, replay31 = dispatch_alternatives(state, DISPATCH28)
+                        if not matched:
+                            if 0 in attempt30:
+                                state.checkpoint()
+                                # <Group>
+                                # <Sequence n=3>
+                                all_ok33 = True
+                                if all_ok33:
+                                    matched32 = False
+                                    # <String>
+                                    if state.input.startswith('"', state.pos):
+                                        state.pos += 1
+                                        matched32 = True
+                                    else:
+                                        matched32 = False
+                                        state.fail('"""')
+                                    # </String>
+                                    if not matched32:
+                                        all_ok33 = False
+                                    if all_ok33:
+                                        parse_trivia(state, children29)
+                                if all_ok33:
+                                    matched32 = False
+                                    # <Identifier>
+                                    matched32 = parse_double_quoted(state, children29)
+                                    # </Identifier>
+                                    if not matched32:
+                                        all_ok33 = False
+                                    if all_ok33:
+                                        parse_trivia(state, children29)
+                                if all_ok33:
+                                    matched32 = False
+                                    # <String>
+                                    if state.input.startswith('"', state.pos):
+                                        state.pos += 1
+                                        matched32 = True
+                                    else:
+                                        matched32 = False
+                                        state.fail('"""')
+                                    # </String>
+                                    if not matched32:
+                                        all_ok33 = False
+                                matched = all_ok33
+                                # </Sequence>
+                                # </Group>
+                                if matched:
+                                    state.ok()
+                                    children23.extend(children29)
+                                else:
+                                    state.restore()
+                                    children29.clear()
+                            elif 0 in replay31:
+                                record_failures(state, LABELS34)
+                        if not matched:
+                            if 1 in attempt30:
+                                state.checkpoint()
+                                # <Group>
+                                # <Sequence n=3>
+                                all_ok36 = True
+                                if all_ok36:
+                                    matched35 = False
+                                    # <String>
+                                    if state.input.startswith("'", state.pos):
+                                        state.pos += 1
+                                        matched35 = True
+                                    else:
+                                        matched35 = False
+                                        state.fail('"\'"')
+                                    # </String>
+                                    if not matched35:
+                                        all_ok36 = False
+                                    if all_ok36:
+                                        parse_trivia(state, children29)
+                                if all_ok36:
+                                    matched35 = False
+                                    # <Identifier>
+                                    matched35 = parse_single_quoted(state, children29)
+                                    # </Identifier>
+                                    if not matched35:
+                                        all_ok36 = False
+                                    if all_ok36:
+                                        parse_trivia(state, children29)
+                                if all_ok36:
+                                    matched35 = False
+                                    # <String>
+                                    if state.input.startswith("'", state.pos):
+                                        state.pos += 1
+                                        matched35 = True
+                                    else:
+                                        matched35 = False
+                                        state.fail('"\'"')
+                                    # </String>
+                                    if not matched35:
+                                        all_ok36 = False
+                                matched = all_ok36
+                                # </Sequence>
+                                # </Group>
+                                if matched:
+                                    state.ok()
+                                    children23.extend(children29)
+                                else:
+                                    state.restore()
+                                    children29.clear()
+                            elif 1 in replay31:
+                                record_failures(state, LABELS37)
+                        # </DispatchChoice>
+                        if matched:
+                            state.ok()
+                            children6.extend(children23)
+                        else:
+                            state.restore()
+                            children23.clear()
+                    elif 1 in replay25:
+                        record_failures(state, LABELS38, FRAMES22)
+                if not matched:
+                    if 2 in attempt24:
+                        state.checkpoint()
+                        # <Identifier>
+                        matched = parse_true_literal(state, children23)
+                        # </Identifier>
+                        if matched:
+                            state.ok()
+                            children6.extend(children23)
+                        else:
+                            state.restore()
+                            children23.clear()
+                    elif 2 in replay25:
+                        record_failures(state, LABELS39, FRAMES22)
+                if not matched:
+                    if 3 in attempt24:
+                        state.checkpoint()
+                        # <Identifier>
+                        matched = parse_false_literal(state, children23)
+                        # </Identifier>
+                        if matched:
+                            state.ok()
+                            children6.extend(children23)
+                        else:
+                            state.restore()
+                            children23.clear()
+                    elif 3 in replay25:
+                        record_failures(state, LABELS40, FRAMES22)
+                if not matched:
+                    if 4 in attempt24:
+                        state.checkpoint()
+                        # <Identifier>
+                        matched = parse_null(state, children23)
+                        # </Identifier>
+                        if matched:
+                            state.ok()
+                            children6.extend(children23)
+                        else:
+                            state.restore()
+                            children23.clear()
+                    elif 4 in replay25:
+                        record_failures(state, LABELS41, FRAMES22)
+                # </DispatchChoice>
                 if matched:
                     state.ok()
-                    children3.extend(children5)
+                    children2.extend(children6)
                 else:
                     state.restore()
-                    children5.clear()
-            # </Choice>
-            if matched:
-                state.ok()
-                children2.extend(children3)
-            else:
-                state.restore()
-                children3.clear()
-        # </Choice>
+                    children6.clear()
+            elif 3 in replay8:
+                record_failures(state, LABELS42, FRAMES5)
+        # </DispatchChoice>
         state.rule_stack.pop()
         # Silent rule 'function_argument'
         pairs.extend(children2)
@@ -6705,38 +7682,54 @@ def _parse_function_argument() -> Callable[[ParserState, list[Pair]], bool]:
 parse_function_argument = _parse_function_argument()
 
 def _parse_segment() -> Callable[[ParserState, list[Pair]], bool]:
+    DISPATCH3 = {'.': (frozenset([0, 1]), frozenset([0, 1]), frozenset([]), frozenset([0, 1])), '[': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1]))}
+    DISPATCH4 = (frozenset([]), frozenset([]), frozenset([0, 1]), frozenset([0, 1]))
+    FRAMES5 = {'bracketed_selection': RuleFrame('bracketed_selection', 0), 'child_segment': RuleFrame('child_segment', 0), 'descendant_segment': RuleFrame('descendant_segment', 0)}
+    LABELS9 = ((('child_segment', 'bracketed_selection'), '"["'), (('child_segment',), '"."'))
+    LABELS10 = ((('descendant_segment',), '".."'),)
+    
     rule_frame = RuleFrame('segment', 2)
     
     def inner(state: ParserState, pairs: list[Pair]) -> bool:
         """Parse segment."""
         state.rule_stack.push(rule_frame)
         children2: list[Pair] = []
-        # <Choice>
-        children3: list[Pair] = []
+        # <DispatchChoice>
+        children6: list[Pair] = []
         matched = False
+        if state.pos < len(state.input):
+            attempt7, replay8 = dispatch_alternatives(state, DISPATCH3.get(state.input[state.pos], DISPATCH4))
+        else:
+            attempt7, replay8 = dispatch_alternatives(state, DISPATCH4)
         if not matched:
-            state.checkpoint()
-            # <Identifier>
-            matched = parse_child_segment(state, children3)
-            # </Identifier>
-            if matched:
-                state.ok()
-                children2.extend(children3)
-            else:
-                state.restore()
-                children3.clear()
+            if 0 in attempt7:
+                state.checkpoint()
+                # <Identifier>
+                matched = parse_child_segment(state, children6)
+                # </Identifier>
+                if matched:
+                    state.ok()
+                    children2.extend(children6)
+                else:
+                    state.restore()
+                    children6.clear()
+            elif 0 in replay8:
+                record_failures(state, LABELS9, FRAMES5)
         if not matched:
-            state.checkpoint()
-            # <Identifier>
-            matched = parse_descendant_segment(state, children3)
-            # </Identifier>
-            if matched:
-                state.ok()
-                children2.extend(children3)
-            else:
-                state.restore()
-                children3.clear()
-        # </Choice>
+            if 1 in attempt7:
+                state.checkpoint()
+                # <Identifier>
+                matched = parse_descendant_segment(state, children6)
+                # </Identifier>
+                if matched:
+                    state.ok()
+                    children2.extend(children6)
+                else:
+                    state.restore()
+                    children6.clear()
+            elif 1 in replay8:
+                record_failures(state, LABELS10, FRAMES5)
+        # </DispatchChoice>
         state.rule_stack.pop()
         # Silent rule 'segment'
         pairs.extend(children2)
@@ -6747,6 +7740,16 @@ def _parse_segment() -> Callable[[ParserState, list[Pair]], bool]:
 parse_segment = _parse_segment()
 
 def _parse_child_segment() -> Callable[[ParserState, list[Pair]], bool]:
+    DISPATCH3 = {'.': (frozenset([1]), frozenset([1]), frozenset([0]), frozenset([0, 1])), '[': (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1]))}
+    DISPATCH4 = (frozenset([]), frozenset([]), frozenset([0, 1]), frozenset([0, 1]))
+    FRAMES5 = {'bracketed_selection': RuleFrame('bracketed_selection', 0)}
+    LABELS9 = ((('bracketed_selection',), '"["'),)
+    DISPATCH12 = {'*': (frozenset([0, 1]), frozenset([0, 1]), frozenset([]), frozenset([0, 1]))}
+    DISPATCH13 = (frozenset([1]), frozenset([1]), frozenset([0]), frozenset([0, 1]))
+    FRAMES14 = {'wildcard_selector': RuleFrame('wildcard_selector', 0)}
+    LABELS18 = ((('wildcard_selector',), '"*"'),)
+    LABELS19 = (((), '"."'),)
+    
     rule_frame = RuleFrame('child_segment', 0)
     
     def inner(state: ParserState, pairs: list[Pair]) -> bool:
@@ -6754,88 +7757,108 @@ def _parse_child_segment() -> Callable[[ParserState, list[Pair]], bool]:
         pos1 = state.pos
         state.rule_stack.push(rule_frame)
         children2: list[Pair] = []
-        # <Choice>
-        children3: list[Pair] = []
+        # <DispatchChoice>
+        children6: list[Pair] = []
         matched = False
+        if state.pos < len(state.input):
+            attempt7, replay8 = dispatch_alternatives(state, DISPATCH3.get(state.input[state.pos], DISPATCH4))
+        else:
+            attempt7, replay8 = dispatch_alternatives(state, DISPATCH4)
         if not matched:
-            state.checkpoint()
-            # <Identifier>
-            matched = parse_bracketed_selection(state, children3)
-            # </Identifier>
-            if matched:
-                state.ok()
-                children2.extend(children3)
-            else:
-                state.restore()
-                children3.clear()
-        if not matched:
-            state.checkpoint()
-            # <Group>
-            # <Sequence n=2>
-            all_ok5 = True
-            if all_ok5:
-                matched4 = False
-                # <String>
-                if state.input.startswith('.', state.pos):
-                    state.pos += 1
-                    matched4 = True
+            if 0 in attempt7:
+                state.checkpoint()
+                # <Identifier>
+                matched = parse_bracketed_selection(state, children6)
+                # </Identifier>
+                if matched:
+                    state.ok()
+                    children2.extend(children6)
                 else:
-                    matched4 = False
-                    state.fail('"."')
-                # </String>
-                if not matched4:
-                    all_ok5 = False
-                if all_ok5:
-                    parse_trivia(state, children3)
-            if all_ok5:
-                matched4 = False
+                    state.restore()
+                    children6.clear()
+            elif 0 in replay8:
+                record_failures(state, LABELS9, FRAMES5)
+        if not matched:
+            if 1 in attempt7:
+                state.checkpoint()
                 # <Group>
-                # <Choice>
-                children6: list[Pair] = []
-                matched4 = False
-                if not matched4:
-                    state.checkpoint()
-                    # <Identifier>
-                    matched4 = parse_wildcard_selector(state, children6)
-                    # </Identifier>
-                    if matched4:
-                        state.ok()
-                        children3.extend(children6)
+                # <Sequence n=2>
+                all_ok11 = True
+                if all_ok11:
+                    matched10 = False
+                    # <String>
+                    if state.input.startswith('.', state.pos):
+                        state.pos += 1
+                        matched10 = True
                     else:
-                        state.restore()
-                        children6.clear()
-                if not matched4:
-                    state.checkpoint()
-                    # <Identifier>
-                    matched4 = parse_member_name_shorthand(state, children6)
-                    # </Identifier>
-                    if matched4:
-                        state.ok()
-                        children3.extend(children6)
+                        matched10 = False
+                        state.fail('"."')
+                    # </String>
+                    if not matched10:
+                        all_ok11 = False
+                    if all_ok11:
+                        parse_trivia(state, children6)
+                if all_ok11:
+                    matched10 = False
+                    # <Group>
+                    # <DispatchChoice>
+                    children15: list[Pair] = []
+                    matched10 = False
+                    if state.pos < len(state.input):
+                        attempt16, replay17 = dispatch_alternatives(state, DISPATCH12.get(state.input[state.pos], DISPATCH13))
                     else:
-                        state.restore()
-                        children6.clear()
-                # </Choice>
+                        attempt16, replay17 = dispatch_alternatives(state, DISPATCH13)
+                    if not matched10:
+                        if 0 in attempt16:
+                            state.checkpoint()
+                            # <Identifier>
+                            matched10 = parse_wildcard_selector(state, children15)
+                            # </Identifier>
+                            if matched10:
+                                state.ok()
+                                children6.extend(children15)
+                            else:
+                                state.restore()
+                                children15.clear()
+                        elif 0 in replay17:
+                            record_failures(state, LABELS18, FRAMES14)
+                    if not matched10:
+                        state.checkpoint()
+                        # <Identifier>
+                        matched10 = parse_member_name_shorthand(state, children15)
+                        # </Identifier>
+                        if matched10:
+                            state.ok()
+                            children6.extend(children15)
+                        else:
+                            state.restore()
+                            children15.clear()
+                    # </DispatchChoice>
+                    # </Group>
+                    if not matched10:
+                        all_ok11 = False
+                matched = all_ok11
+                # </Sequence>
                 # </Group>
-                if not matched4:
-                    all_ok5 = False
-            matched = all_ok5
-            # </Sequence>
-            # </Group>
-            if matched:
-                state.ok()
-                children2.extend(children3)
-            else:
-                state.restore()
-                children3.clear()
-        # </Choice>
+                if matched:
+                    state.ok()
+                    children2.extend(children6)
+                else:
+                    state.restore()
+                    children6.clear()
+            elif 1 in replay8:
+                record_failures(state, LABELS19, FRAMES5)
+        # </DispatchChoice>
         state.rule_stack.pop()
         if state.tag_stack:
-            tag7: str | None = state.tag_stack.pop()
+            tag20: str | None = state.tag_stack.pop()
         else:
-            tag7 = None
+            tag20 = None
         if matched:
-            pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag7,))
+            if state.arena is None:
+                pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag20, state.line_index))
+            else:
+                pairs.append(state.arena.add(rule_frame, pos1, state.pos, children2, tag20))
         return matched
     
     return inner
@@ -6844,9 +7867,25 @@ parse_child_segment = _parse_child_segment()
 
 def _parse_bracketed_selection() -> Callable[[ParserState, list[Pair]], bool]:
     RE7 = re.compile('[\\\t\\\n\\\r\\ ]', re.VERSION1)
-    RE15 = re.compile('[\\\t\\\n\\\r\\ ]', re.VERSION1)
-    RE18 = re.compile('[\\\t\\\n\\\r\\ ]', re.VERSION1)
-    RE22 = re.compile('[\\\t\\\n\\\r\\ ]', re.VERSION1)
+    DISPATCH8 = {'"': (frozenset([0]), frozenset([0]), frozenset([1, 2, 3, 4]), frozenset([0, 1, 2, 3, 4])), "'": (frozenset([0]), frozenset([0]), frozenset([1, 2, 3, 4]), frozenset([0, 1, 2, 3, 4])), '*': (frozenset([1]), frozenset([1]), frozenset([0, 2, 3, 4]), frozenset([0, 1, 2, 3, 4])), '-': (frozenset([2, 3]), frozenset([2, 3]), frozenset([0, 1, 4]), frozenset([0, 1, 2, 3, 4])), '0': (frozenset([2, 3]), frozenset([2, 3]), frozenset([0, 1, 4]), frozenset([0, 1, 2, 3, 4])), '1': (frozenset([2, 3]), frozenset([2, 3]), frozenset([0, 1, 4]), frozenset([0, 1, 2, 3, 4])), '2': (frozenset([2, 3]), frozenset([2, 3]), frozenset([0, 1, 4]), frozenset([0, 1, 2, 3, 4])), '3': (frozenset([2, 3]), frozenset([2, 3]), frozenset([0, 1, 4]), frozenset([0, 1, 2, 3, 4])), '4': (frozenset([2, 3]), frozenset([2, 3]), frozenset([0, 1, 4]), frozenset([0, 1, 2, 3, 4])), '5': (frozenset([2, 3]), frozenset([2, 3]), frozenset([0, 1, 4]), frozenset([0, 1, 2, 3, 4])), '6': (frozenset([2, 3]), frozenset([2, 3]), frozenset([0, 1, 4]), frozenset([0, 1, 2, 3, 4])), '7': (frozenset([2, 3]), frozenset([2, 3]), frozenset([0, 1, 4]), frozenset([0, 1, 2, 3, 4])), '8': (frozenset([2, 3]), frozenset([2, 3]), frozenset([0, 1, 4]), frozenset([0, 1, 2, 3, 4])), '9': (frozenset([2, 3]), frozenset([2, 3]), frozenset([0, 1, 4]), frozenset([0, 1, 2, 3, 4])), ':': (frozenset([2]), frozenset([2]), frozenset([0, 1, 3, 4]), frozenset([0, 1, 2, 3, 4])), '?': (frozenset([4]), frozenset([4]), frozenset([0, 1, 2, 3]), frozenset([0, 1, 2, 3, 4]))}
+    DISPATCH9 = (frozenset([]), frozenset([]), frozenset([0, 1, 2, 3, 4]), frozenset([0, 1, 2, 3, 4]))
+    FRAMES10 = {'filter_selector': RuleFrame('filter_selector', 0), 'index_selector': RuleFrame('index_selector', 4), 'int': RuleFrame('int', 0), 'slice_selector': RuleFrame('slice_selector', 0), 'start': RuleFrame('start', 4), 'string_literal': RuleFrame('string_literal', 2), 'wildcard_selector': RuleFrame('wildcard_selector', 0)}
+    LABELS14 = ((('string_literal',), '"""'), (('string_literal',), '"\'"'))
+    LABELS15 = ((('wildcard_selector',), '"*"'),)
+    LABELS16 = ((('slice_selector', 'start', 'int'), '"0"'), (('slice_selector', 'start', 'int'), '"-"'), (('slice_selector', 'start', 'int'), "''1''..''9''"), (('slice_selector',), '":"'))
+    LABELS17 = ((('index_selector', 'int'), '"0"'), (('index_selector', 'int'), '"-"'), (('index_selector', 'int'), "''1''..''9''"))
+    LABELS18 = ((('filter_selector',), '"?"'),)
+    RE25 = re.compile('[\\\t\\\n\\\r\\ ]', re.VERSION1)
+    RE28 = re.compile('[\\\t\\\n\\\r\\ ]', re.VERSION1)
+    DISPATCH29 = {'"': (frozenset([0]), frozenset([0]), frozenset([1, 2, 3, 4]), frozenset([0, 1, 2, 3, 4])), "'": (frozenset([0]), frozenset([0]), frozenset([1, 2, 3, 4]), frozenset([0, 1, 2, 3, 4])), '*': (frozenset([1]), frozenset([1]), frozenset([0, 2, 3, 4]), frozenset([0, 1, 2, 3, 4])), '-': (frozenset([2, 3]), frozenset([2, 3]), frozenset([0, 1, 4]), frozenset([0, 1, 2, 3, 4])), '0': (frozenset([2, 3]), frozenset([2, 3]), frozenset([0, 1, 4]), frozenset([0, 1, 2, 3, 4])), '1': (frozenset([2, 3]), frozenset([2, 3]), frozenset([0, 1, 4]), frozenset([0, 1, 2, 3, 4])), '2': (frozenset([2, 3]), frozenset([2, 3]), frozenset([0, 1, 4]), frozenset([0, 1, 2, 3, 4])), '3': (frozenset([2, 3]), frozenset([2, 3]), frozenset([0, 1, 4]), frozenset([0, 1, 2, 3, 4])), '4': (frozenset([2, 3]), frozenset([2, 3]), frozenset([0, 1, 4]), frozenset([0, 1, 2, 3, 4])), '5': (frozenset([2, 3]), frozenset([2, 3]), frozenset([0, 1, 4]), frozenset([0, 1, 2, 3, 4])), '6': (frozenset([2, 3]), frozenset([2, 3]), frozenset([0, 1, 4]), frozenset([0, 1, 2, 3, 4])), '7': (frozenset([2, 3]), frozenset([2, 3]), frozenset([0, 1, 4]), frozenset([0, 1, 2, 3, 4])), '8': (frozenset([2, 3]), frozenset([2, 3]), frozenset([0, 1, 4]), frozenset([0, 1, 2, 3, 4])), '9': (frozenset([2, 3]), frozenset([2, 3]), frozenset([0, 1, 4]), frozenset([0, 1, 2, 3, 4])), ':': (frozenset([2]), frozenset([2]), frozenset([0, 1, 3, 4]), frozenset([0, 1, 2, 3, 4])), '?': (frozenset([4]), frozenset([4]), frozenset([0, 1, 2, 3]), frozenset([0, 1, 2, 3, 4]))}
+    DISPATCH30 = (frozenset([]), frozenset([]), frozenset([0, 1, 2, 3, 4]), frozenset([0, 1, 2, 3, 4]))
+    FRAMES31 = {'filter_selector': RuleFrame('filter_selector', 0), 'index_selector': RuleFrame('index_selector', 4), 'int': RuleFrame('int', 0), 'slice_selector': RuleFrame('slice_selector', 0), 'start': RuleFrame('start', 4), 'string_literal': RuleFrame('string_literal', 2), 'wildcard_selector': RuleFrame('wildcard_selector', 0)}
+    LABELS35 = ((('string_literal',), '"""'), (('string_literal',), '"\'"'))
+    LABELS36 = ((('wildcard_selector',), '"*"'),)
+    LABELS37 = ((('slice_selector', 'start', 'int'), '"0"'), (('slice_selector', 'start', 'int'), '"-"'), (('slice_selector', 'start', 'int'), "''1''..''9''"), (('slice_selector',), '":"'))
+    LABELS38 = ((('index_selector', 'int'), '"0"'), (('index_selector', 'int'), '"-"'), (('index_selector', 'int'), "''1''..''9''"))
+    LABELS39 = ((('filter_selector',), '"?"'),)
+    RE42 = re.compile('[\\\t\\\n\\\r\\ ]', re.VERSION1)
     
     rule_frame = RuleFrame('bracketed_selection', 0)
     
@@ -6903,65 +7942,84 @@ def _parse_bracketed_selection() -> Callable[[ParserState, list[Pair]], bool]:
                 parse_trivia(state, children2)
         if all_ok4:
             matched3 = False
-            # <Choice>
-            children8: list[Pair] = []
+            # <DispatchChoice>
+            children11: list[Pair] = []
             matched3 = False
+            if state.pos < len(state.input):
+                attempt12, replay13 = dispatch_alternatives(state, DISPATCH8.get(state.input[state.pos], DISPATCH9))
+            else:
+                attempt12, replay13 = dispatch_alternatives(state, DISPATCH9)
             if not matched3:
-                state.checkpoint()
-                # <Identifier>
-                matched3 = parse_string_literal(state, children8)
-                # </Identifier>
-                if matched3:
-                    state.ok()
-                    children2.extend(children8)
-                else:
-                    state.restore()
-                    children8.clear()
+                if 0 in attempt12:
+                    state.checkpoint()
+                    # <Identifier>
+                    matched3 = parse_string_literal(state, children11)
+                    # </Identifier>
+                    if matched3:
+                        state.ok()
+                        children2.extend(children11)
+                    else:
+                        state.restore()
+                        children11.clear()
+                elif 0 in replay13:
+                    record_failures(state, LABELS14, FRAMES10)
             if not matched3:
-                state.checkpoint()
-                # <Identifier>
-                matched3 = parse_wildcard_selector(state, children8)
-                # </Identifier>
-                if matched3:
-                    state.ok()
-                    children2.extend(children8)
-                else:
-                    state.restore()
-                    children8.clear()
+                if 1 in attempt12:
+                    state.checkpoint()
+                    # <Identifier>
+                    matched3 = parse_wildcard_selector(state, children11)
+                    # </Identifier>
+                    if matched3:
+                        state.ok()
+                        children2.extend(children11)
+                    else:
+                        state.restore()
+                        children11.clear()
+                elif 1 in replay13:
+                    record_failures(state, LABELS15, FRAMES10)
             if not matched3:
-                state.checkpoint()
-                # <Identifier>
-                matched3 = parse_slice_selector(state, children8)
-                # </Identifier>
-                if matched3:
-                    state.ok()
-                    children2.extend(children8)
-                else:
-                    state.restore()
-                    children8.clear()
+                if 2 in attempt12:
+                    state.checkpoint()
+                    # <Identifier>
+                    matched3 = parse_slice_selector(state, children11)
+                    # </Identifier>
+                    if matched3:
+                        state.ok()
+                        children2.extend(children11)
+                    else:
+                        state.restore()
+                        children11.clear()
+                elif 2 in replay13:
+                    record_failures(state, LABELS16, FRAMES10)
             if not matched3:
-                state.checkpoint()
-                # <Identifier>
-                matched3 = parse_index_selector(state, children8)
-                # </Identifier>
-                if matched3:
-                    state.ok()
-                    children2.extend(children8)
-                else:
-                    state.restore()
-                    children8.clear()
+                if 3 in attempt12:
+                    state.checkpoint()
+                    # <Identifier>
+                    matched3 = parse_index_selector(state, children11)
+                    # </Identifier>
+                    if matched3:
+                        state.ok()
+                        children2.extend(children11)
+                    else:
+                        state.restore()
+                        children11.clear()
+                elif 3 in replay13:
+                    record_failures(state, LABELS17, FRAMES10)
             if not matched3:
-                state.checkpoint()
-                # <Identifier>
-                matched3 = parse_filter_selector(state, children8)
-                # </Identifier>
-                if matched3:
-                    state.ok()
-                    children2.extend(children8)
-                else:
-                    state.restore()
-                    children8.clear()
-            # </Choice>
+                if 4 in attempt12:
+                    state.checkpoint()
+                    # <Identifier>
+                    matched3 = parse_filter_selector(state, children11)
+                    # </Identifier>
+                    if matched3:
+                        state.ok()
+                        children2.extend(children11)
+                    else:
+                        state.restore()
+                        children11.clear()
+                elif 4 in replay13:
+                    record_failures(state, LABELS18, FRAMES10)
+            # </DispatchChoice>
             if not matched3:
                 all_ok4 = False
             if all_ok4:
@@ -6969,162 +8027,181 @@ def _parse_bracketed_selection() -> Callable[[ParserState, list[Pair]], bool]:
         if all_ok4:
             matched3 = False
             # <Repeat>
-            trivia_pos10 = state.pos
-            children9: list[Pair] = []
+            trivia_pos20 = state.pos
+            children19: list[Pair] = []
             while True:
                 state.checkpoint()
                 # <Group>
                 # <Sequence n=4>
-                all_ok12 = True
-                if all_ok12:
-                    matched11 = False
+                all_ok22 = True
+                if all_ok22:
+                    matched21 = False
                     # <Repeat>
-                    trivia_pos14 = state.pos
-                    children13: list[Pair] = []
+                    trivia_pos24 = state.pos
+                    children23: list[Pair] = []
                     while True:
                         state.checkpoint()
                         # <ChoiceRegex>
-                        if match := RE15.match(state.input, state.pos):
+                        if match := RE25.match(state.input, state.pos):
                             state.pos = match.end()
-                            matched11 = True
+                            matched21 = True
                         else:
-                            matched11 = False
+                            matched21 = False
                         # </ChoiceRegex>
-                        if matched11:
+                        if matched21:
                             state.ok()
-                            children9.extend(children13)
-                            children13.clear()
-                            trivia_pos14 = state.pos
-                            parse_trivia(state, children13)
+                            children19.extend(children23)
+                            children23.clear()
+                            trivia_pos24 = state.pos
+                            parse_trivia(state, children23)
                         else:
                             state.restore()
-                            state.pos = trivia_pos14
-                            matched11 = True
+                            state.pos = trivia_pos24
+                            matched21 = True
                             break
                     # </Repeat>
-                    if not matched11:
-                        all_ok12 = False
-                    if all_ok12:
-                        parse_trivia(state, children9)
-                if all_ok12:
-                    matched11 = False
+                    if not matched21:
+                        all_ok22 = False
+                    if all_ok22:
+                        parse_trivia(state, children19)
+                if all_ok22:
+                    matched21 = False
                     # <String>
                     if state.input.startswith(',', state.pos):
                         state.pos += 1
-                        matched11 = True
+                        matched21 = True
                     else:
-                        matched11 = False
+                        matched21 = False
                         state.fail('","')
                     # </String>
-                    if not matched11:
-                        all_ok12 = False
-                    if all_ok12:
-                        parse_trivia(state, children9)
-                if all_ok12:
-                    matched11 = False
+                    if not matched21:
+                        all_ok22 = False
+                    if all_ok22:
+                        parse_trivia(state, children19)
+                if all_ok22:
+                    matched21 = False
                     # <Repeat>
-                    trivia_pos17 = state.pos
-                    children16: list[Pair] = []
+                    trivia_pos27 = state.pos
+                    children26: list[Pair] = []
                     while True:
                         state.checkpoint()
                         # <ChoiceRegex>
-                        if match := RE18.match(state.input, state.pos):
+                        if match := RE28.match(state.input, state.pos):
                             state.pos = match.end()
-                            matched11 = True
+                            matched21 = True
                         else:
-                            matched11 = False
+                            matched21 = False
                         # </ChoiceRegex>
-                        if matched11:
+                        if matched21:
                             state.ok()
-                            children9.extend(children16)
-                            children16.clear()
-                            trivia_pos17 = state.pos
-                            parse_trivia(state, children16)
+                            children19.extend(children26)
+                            children26.clear()
+                            trivia_pos27 = state.pos
+                            parse_trivia(state, children26)
                         else:
                             state.restore()
-                            state.pos = trivia_pos17
-                            matched11 = True
+                            state.pos = trivia_pos27
+                            matched21 = True
                             break
                     # </Repeat>
-                    if not matched11:
-                        all_ok12 = False
-                    if all_ok12:
-                        parse_trivia(state, children9)
-                if all_ok12:
-                    matched11 = False
-                    # <Choice>
-                    children19: list[Pair] = []
-                    matched11 = False
-                    if not matched11:
-                        state.checkpoint()
-                        # <Identifier>
-                        matched11 = parse_string_literal(state, children19)
-                        # </Identifier>
-                        if matched11:
-                            state.ok()
-                            children9.extend(children19)
-                        else:
-                            state.restore()
-                            children19.clear()
-                    if not matched11:
-                        state.checkpoint()
-                        # <Identifier>
-                        matched11 = parse_wildcard_selector(state, children19)
-                        # </Identifier>
-                        if matched11:
-                            state.ok()
-                            children9.extend(children19)
-                        else:
-                            state.restore()
-                            children19.clear()
-                    if not matched11:
-                        state.checkpoint()
-                        # <Identifier>
-                        matched11 = parse_slice_selector(state, children19)
-                        # </Identifier>
-                        if matched11:
-                            state.ok()
-                            children9.extend(children19)
-                        else:
-                            state.restore()
-                            children19.clear()
-                    if not matched11:
-                        state.checkpoint()
-                        # <Identifier>
-                        matched11 = parse_index_selector(state, children19)
-                        # </Identifier>
-                        if matched11:
-                            state.ok()
-                            children9.extend(children19)
-                        else:
-                            state.restore()
-                            children19.clear()
-                    if not matched11:
-                        state.checkpoint()
-                        # <Identifier>
-                        matched11 = parse_filter_selector(state, children19)
-                        # </Identifier>
-                        if matched11:
-                            state.ok()
-                            children9.extend(children19)
-                        else:
-                            state.restore()
-                            children19.clear()
-                    # </Choice>
-                    if not matched11:
-                        all_ok12 = False
-                matched3 = all_ok12
+                    if not matched21:
+                        all_ok22 = False
+                    if all_ok22:
+                        parse_trivia(state, children19)
+                if all_ok22:
+                    matched21 = False
+                    # <DispatchChoice>
+                    children32: list[Pair] = []
+                    matched21 = False
+                    if state.pos < len(state.input):
+                        attempt33, replay34 = dispatch_alternatives(state, DISPATCH29.get(state.input[state.pos], DISPATCH30))
+                    else:
+                        attempt33, replay34 = dispatch_alternatives(state, DISPATCH30)
+                    if not matched21:
+                        if 0 in attempt33:
+                            state.checkpoint()
+                            # <Identifier>
+                            matched21 = parse_string_literal(state, children32)
+                            # </Identifier>
+                            if matched21:
+                                state.ok()
+                                children19.extend(children32)
+                            else:
+                                state.restore()
+                                children32.clear()
+                        elif 0 in replay34:
+                            record_failures(state, LABELS35, FRAMES31)
+                    if not matched21:
+                        if 1 in attempt33:
+                            state.checkpoint()
+                            # <Identifier>
+                            matched21 = parse_wildcard_selector(state, children32)
+                            # </Identifier>
+                            if matched21:
+                                state.ok()
+                                children19.extend(children32)
+                            else:
+                                state.restore()
+                                children32.clear()
+                        elif 1 in replay34:
+                            record_failures(state, LABELS36, FRAMES31)
+                    if not matched21:
+                        if 2 in attempt33:
+                            state.checkpoint()
+                            # <Identifier>
+                            matched21 = parse_slice_selector(state, children32)
+                            # </Identifier>
+                            if matched21:
+                                state.ok()
+                                children19.extend(children32)
+                            else:
+                                state.restore()
+                                children32.clear()
+                        elif 2 in replay34:
+                            record_failures(state, LABELS37, FRAMES31)
+                    if not matched21:
+                        if 3 in attempt33:
+                            state.checkpoint()
+                            # <Identifier>
+                            matched21 = parse_index_selector(state, children32)
+                            # </Identifier>
+                            if matched21:
+                                state.ok()
+                                children19.extend(children32)
+                            else:
+                                state.restore()
+                                children32.clear()
+                        elif 3 in replay34:
+                            record_failures(state, LABELS38, FRAMES31)
+                    if not matched21:
+                        if 4 in attempt33:
+                            state.checkpoint()
+                            # <Identifier>
+                            matched21 = parse_filter_selector(state, children32)
+                            # </Identifier>
+                            if matched21:
+                                state.ok()
+                                children19.extend(children32)
+                            else:
+                                state.restore()
+                                children32.clear()
+                        elif 4 in replay34:
+                            record_failures(state, LABELS39, FRAMES31)
+                    # </DispatchChoice>
+                    if not matched21:
+                        all_ok22 = False
+                matched3 = all_ok22
                 # </Sequence>
                 # </Group>
                 if matched3:
                     state.ok()
-                    children2.extend(children9)
-                    children9.clear()
-                    trivia_pos10 = state.pos
-                    parse_trivia(state, children9)
+                    children2.extend(children19)
+                    children19.clear()
+                    trivia_pos20 = state.pos
+                    parse_trivia(state, children19)
                 else:
                     state.restore()
-                    state.pos = trivia_pos10
+                    state.pos = trivia_pos20
                     matched3 = True
                     break
             # </Repeat>
@@ -7135,12 +8212,12 @@ def _parse_bracketed_selection() -> Callable[[ParserState, list[Pair]], bool]:
         if all_ok4:
             matched3 = False
             # <Repeat>
-            trivia_pos21 = state.pos
-            children20: list[Pair] = []
+            trivia_pos41 = state.pos
+            children40: list[Pair] = []
             while True:
                 state.checkpoint()
                 # <ChoiceRegex>
-                if match := RE22.match(state.input, state.pos):
+                if match := RE42.match(state.input, state.pos):
                     state.pos = match.end()
                     matched3 = True
                 else:
@@ -7148,13 +8225,13 @@ def _parse_bracketed_selection() -> Callable[[ParserState, list[Pair]], bool]:
                 # </ChoiceRegex>
                 if matched3:
                     state.ok()
-                    children2.extend(children20)
-                    children20.clear()
-                    trivia_pos21 = state.pos
-                    parse_trivia(state, children20)
+                    children2.extend(children40)
+                    children40.clear()
+                    trivia_pos41 = state.pos
+                    parse_trivia(state, children40)
                 else:
                     state.restore()
-                    state.pos = trivia_pos21
+                    state.pos = trivia_pos41
                     matched3 = True
                     break
             # </Repeat>
@@ -7178,11 +8255,14 @@ def _parse_bracketed_selection() -> Callable[[ParserState, list[Pair]], bool]:
         # </Sequence>
         state.rule_stack.pop()
         if state.tag_stack:
-            tag23: str | None = state.tag_stack.pop()
+            tag43: str | None = state.tag_stack.pop()
         else:
-            tag23 = None
+            tag43 = None
         if matched:
-            pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag23,))
+            if state.arena is None:
+                pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag43, state.line_index))
+            else:
+                pairs.append(state.arena.add(rule_frame, pos1, state.pos, children2, tag43))
         return matched
     
     return inner
@@ -7191,7 +8271,10 @@ parse_bracketed_selection = _parse_bracketed_selection()
 
 def _parse_member_name_shorthand() -> Callable[[ParserState, list[Pair]], bool]:
     RE5 = re.compile('[_A-Za-z\x80-\ud7ff\ue000-\U0010ffff]', re.VERSION1)
-    RE9 = re.compile('[0-9]', re.I)
+    DISPATCH8 = {'0': (frozenset([0, 1]), frozenset([0, 1]), frozenset([]), frozenset([0, 1])), '1': (frozenset([0, 1]), frozenset([0, 1]), frozenset([]), frozenset([0, 1])), '2': (frozenset([0, 1]), frozenset([0, 1]), frozenset([]), frozenset([0, 1])), '3': (frozenset([0, 1]), frozenset([0, 1]), frozenset([]), frozenset([0, 1])), '4': (frozenset([0, 1]), frozenset([0, 1]), frozenset([]), frozenset([0, 1])), '5': (frozenset([0, 1]), frozenset([0, 1]), frozenset([]), frozenset([0, 1])), '6': (frozenset([0, 1]), frozenset([0, 1]), frozenset([]), frozenset([0, 1])), '7': (frozenset([0, 1]), frozenset([0, 1]), frozenset([]), frozenset([0, 1])), '8': (frozenset([0, 1]), frozenset([0, 1]), frozenset([]), frozenset([0, 1])), '9': (frozenset([0, 1]), frozenset([0, 1]), frozenset([]), frozenset([0, 1]))}
+    DISPATCH9 = (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1]))
+    RE13 = re.compile('[0-9]')
+    LABELS14 = (((), "''0''..''9''"),)
     
     rule_frame = RuleFrame('member_name_shorthand', 0)
     
@@ -7222,37 +8305,44 @@ def _parse_member_name_shorthand() -> Callable[[ParserState, list[Pair]], bool]:
             children6: list[Pair] = []
             while True:
                 state.checkpoint()
-                # <Choice>
-                children8: list[Pair] = []
+                # <DispatchChoice>
+                children10: list[Pair] = []
                 matched3 = False
+                if state.pos < len(state.input):
+                    attempt11, replay12 = dispatch_alternatives(state, DISPATCH8.get(state.input[state.pos], DISPATCH9))
+                else:
+                    attempt11, replay12 = dispatch_alternatives(state, DISPATCH9)
                 if not matched3:
                     state.checkpoint()
                     # <Identifier>
-                    matched3 = parse_name_first(state, children8)
+                    matched3 = parse_name_first(state, children10)
                     # </Identifier>
                     if matched3:
                         state.ok()
-                        children6.extend(children8)
+                        children6.extend(children10)
                     else:
                         state.restore()
-                        children8.clear()
+                        children10.clear()
                 if not matched3:
-                    state.checkpoint()
-                    # <Range>
-                    if match := RE9.match(state.input, state.pos):
-                        state.pos = match.end()
-                        matched3 = True
-                    else:
-                        matched3 = False
-                        state.fail("''0''..''9''")
-                    # </Range>
-                    if matched3:
-                        state.ok()
-                        children6.extend(children8)
-                    else:
-                        state.restore()
-                        children8.clear()
-                # </Choice>
+                    if 1 in attempt11:
+                        state.checkpoint()
+                        # <Range>
+                        if match := RE13.match(state.input, state.pos):
+                            state.pos = match.end()
+                            matched3 = True
+                        else:
+                            matched3 = False
+                            state.fail("''0''..''9''")
+                        # </Range>
+                        if matched3:
+                            state.ok()
+                            children6.extend(children10)
+                        else:
+                            state.restore()
+                            children10.clear()
+                    elif 1 in replay12:
+                        record_failures(state, LABELS14)
+                # </DispatchChoice>
                 if matched3:
                     state.ok()
                     children2.extend(children6)
@@ -7271,11 +8361,14 @@ def _parse_member_name_shorthand() -> Callable[[ParserState, list[Pair]], bool]:
         # </Sequence>
         state.rule_stack.pop()
         if state.tag_stack:
-            tag10: str | None = state.tag_stack.pop()
+            tag15: str | None = state.tag_stack.pop()
         else:
-            tag10 = None
+            tag15 = None
         if matched:
-            pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag10,))
+            if state.arena is None:
+                pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag15, state.line_index))
+            else:
+                pairs.append(state.arena.add(rule_frame, pos1, state.pos, children2, tag15))
         return matched
     
     return inner
@@ -7308,8 +8401,11 @@ def _parse_name_first() -> Callable[[ParserState, list[Pair]], bool]:
 parse_name_first = _parse_name_first()
 
 def _parse_name_char() -> Callable[[ParserState, list[Pair]], bool]:
-    RE4 = re.compile('[_A-Za-z\x80-\ud7ff\ue000-\U0010ffff]', re.VERSION1)
-    RE5 = re.compile('[0-9]', re.I)
+    DISPATCH3 = {'0': (frozenset([0, 1]), frozenset([0, 1]), frozenset([]), frozenset([0, 1])), '1': (frozenset([0, 1]), frozenset([0, 1]), frozenset([]), frozenset([0, 1])), '2': (frozenset([0, 1]), frozenset([0, 1]), frozenset([]), frozenset([0, 1])), '3': (frozenset([0, 1]), frozenset([0, 1]), frozenset([]), frozenset([0, 1])), '4': (frozenset([0, 1]), frozenset([0, 1]), frozenset([]), frozenset([0, 1])), '5': (frozenset([0, 1]), frozenset([0, 1]), frozenset([]), frozenset([0, 1])), '6': (frozenset([0, 1]), frozenset([0, 1]), frozenset([]), frozenset([0, 1])), '7': (frozenset([0, 1]), frozenset([0, 1]), frozenset([]), frozenset([0, 1])), '8': (frozenset([0, 1]), frozenset([0, 1]), frozenset([]), frozenset([0, 1])), '9': (frozenset([0, 1]), frozenset([0, 1]), frozenset([]), frozenset([0, 1]))}
+    DISPATCH4 = (frozenset([0]), frozenset([0]), frozenset([1]), frozenset([0, 1]))
+    RE8 = re.compile('[_A-Za-z\x80-\ud7ff\ue000-\U0010ffff]', re.VERSION1)
+    RE9 = re.compile('[0-9]')
+    LABELS10 = (((), "''0''..''9''"),)
     
     rule_frame = RuleFrame('name_char', 2)
     
@@ -7317,13 +8413,17 @@ def _parse_name_char() -> Callable[[ParserState, list[Pair]], bool]:
         """Parse name_char."""
         state.rule_stack.push(rule_frame)
         children2: list[Pair] = []
-        # <Choice>
-        children3: list[Pair] = []
+        # <DispatchChoice>
+        children5: list[Pair] = []
         matched = False
+        if state.pos < len(state.input):
+            attempt6, replay7 = dispatch_alternatives(state, DISPATCH3.get(state.input[state.pos], DISPATCH4))
+        else:
+            attempt6, replay7 = dispatch_alternatives(state, DISPATCH4)
         if not matched:
             state.checkpoint()
             # <ChoiceRegex>
-            if match := RE4.match(state.input, state.pos):
+            if match := RE8.match(state.input, state.pos):
                 state.pos = match.end()
                 matched = True
             else:
@@ -7331,27 +8431,30 @@ def _parse_name_char() -> Callable[[ParserState, list[Pair]], bool]:
             # </ChoiceRegex>
             if matched:
                 state.ok()
-                children2.extend(children3)
+                children2.extend(children5)
             else:
                 state.restore()
-                children3.clear()
+                children5.clear()
         if not matched:
-            state.checkpoint()
-            # <Range>
-            if match := RE5.match(state.input, state.pos):
-                state.pos = match.end()
-                matched = True
-            else:
-                matched = False
-                state.fail("''0''..''9''")
-            # </Range>
-            if matched:
-                state.ok()
-                children2.extend(children3)
-            else:
-                state.restore()
-                children3.clear()
-        # </Choice>
+            if 1 in attempt6:
+                state.checkpoint()
+                # <Range>
+                if match := RE9.match(state.input, state.pos):
+                    state.pos = match.end()
+                    matched = True
+                else:
+                    matched = False
+                    state.fail("''0''..''9''")
+                # </Range>
+                if matched:
+                    state.ok()
+                    children2.extend(children5)
+                else:
+                    state.restore()
+                    children5.clear()
+            elif 1 in replay7:
+                record_failures(state, LABELS10)
+        # </DispatchChoice>
         state.rule_stack.pop()
         # Silent rule 'name_char'
         pairs.extend(children2)
@@ -7362,6 +8465,12 @@ def _parse_name_char() -> Callable[[ParserState, list[Pair]], bool]:
 parse_name_char = _parse_name_char()
 
 def _parse_descendant_segment() -> Callable[[ParserState, list[Pair]], bool]:
+    DISPATCH5 = {'*': (frozenset([1, 2]), frozenset([1, 2]), frozenset([0]), frozenset([0, 1, 2])), '[': (frozenset([0, 2]), frozenset([0, 2]), frozenset([1]), frozenset([0, 1, 2]))}
+    DISPATCH6 = (frozenset([2]), frozenset([2]), frozenset([0, 1]), frozenset([0, 1, 2]))
+    FRAMES7 = {'bracketed_selection': RuleFrame('bracketed_selection', 0), 'wildcard_selector': RuleFrame('wildcard_selector', 0)}
+    LABELS11 = ((('bracketed_selection',), '"["'),)
+    LABELS12 = ((('wildcard_selector',), '"*"'),)
+    
     rule_frame = RuleFrame('descendant_segment', 0)
     
     def inner(state: ParserState, pairs: list[Pair]) -> bool:
@@ -7388,43 +8497,53 @@ def _parse_descendant_segment() -> Callable[[ParserState, list[Pair]], bool]:
         if all_ok4:
             matched3 = False
             # <Group>
-            # <Choice>
-            children5: list[Pair] = []
+            # <DispatchChoice>
+            children8: list[Pair] = []
             matched3 = False
+            if state.pos < len(state.input):
+                attempt9, replay10 = dispatch_alternatives(state, DISPATCH5.get(state.input[state.pos], DISPATCH6))
+            else:
+                attempt9, replay10 = dispatch_alternatives(state, DISPATCH6)
             if not matched3:
-                state.checkpoint()
-                # <Identifier>
-                matched3 = parse_bracketed_selection(state, children5)
-                # </Identifier>
-                if matched3:
-                    state.ok()
-                    children2.extend(children5)
-                else:
-                    state.restore()
-                    children5.clear()
+                if 0 in attempt9:
+                    state.checkpoint()
+                    # <Identifier>
+                    matched3 = parse_bracketed_selection(state, children8)
+                    # </Identifier>
+                    if matched3:
+                        state.ok()
+                        children2.extend(children8)
+                    else:
+                        state.restore()
+                        children8.clear()
+                elif 0 in replay10:
+                    record_failures(state, LABELS11, FRAMES7)
             if not matched3:
-                state.checkpoint()
-                # <Identifier>
-                matched3 = parse_wildcard_selector(state, children5)
-                # </Identifier>
-                if matched3:
-                    state.ok()
-                    children2.extend(children5)
-                else:
-                    state.restore()
-                    children5.clear()
+                if 1 in attempt9:
+                    state.checkpoint()
+                    # <Identifier>
+                    matched3 = parse_wildcard_selector(state, children8)
+                    # </Identifier>
+                    if matched3:
+                        state.ok()
+                        children2.extend(children8)
+                    else:
+                        state.restore()
+                        children8.clear()
+                elif 1 in replay10:
+                    record_failures(state, LABELS12, FRAMES7)
             if not matched3:
                 state.checkpoint()
                 # <Identifier>
-                matched3 = parse_member_name_shorthand(state, children5)
+                matched3 = parse_member_name_shorthand(state, children8)
                 # </Identifier>
                 if matched3:
                     state.ok()
-                    children2.extend(children5)
+                    children2.extend(children8)
                 else:
                     state.restore()
-                    children5.clear()
-            # </Choice>
+                    children8.clear()
+            # </DispatchChoice>
             # </Group>
             if not matched3:
                 all_ok4 = False
@@ -7432,11 +8551,14 @@ def _parse_descendant_segment() -> Callable[[ParserState, list[Pair]], bool]:
         # </Sequence>
         state.rule_stack.pop()
         if state.tag_stack:
-            tag6: str | None = state.tag_stack.pop()
+            tag13: str | None = state.tag_stack.pop()
         else:
-            tag6 = None
+            tag13 = None
         if matched:
-            pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag6,))
+            if state.arena is None:
+                pairs.append(Pair(state.input, pos1, state.pos, rule_frame, children2, tag13, state.line_index))
+            else:
+                pairs.append(state.arena.add(rule_frame, pos1, state.pos, children2, tag13))
         return matched
     
     return inner
@@ -7517,13 +8639,14 @@ _RULE_MAP: dict[str, Callable[[ParserState, list[Pair]], bool]] = {
     'descendant_segment': parse_descendant_segment,
 }
 
-def parse(start_rule: str, text: str, *, start_pos: int = 0) -> Pairs:
+def parse(start_rule: str, text: str, *, start_pos: int = 0, arena: bool = False) -> Pairs:
     """Parse the given `text` starting from the specified `start_rule`.
 
     Args:
         start_rule: The name of the rule to start parsing from.
         text: The input string to parse.
         start_pos: The position in the input string to start parsing from (default: 0).
+        arena: If True, record the parse tree in compact parallel arrays.
 
     Returns:
         Pairs: The parse tree as a `Pairs` object.
@@ -7532,18 +8655,22 @@ def parse(start_rule: str, text: str, *, start_pos: int = 0) -> Pairs:
         KeyError: If `start_rule` is not a valid rule name.
         PestParsingError: If the input `text` cannot be parsed according to the grammar.
     """
-    state = ParserState(text, start_pos)
+    state = StacklessParserState(text, start_pos)
+    if arena:
+        state.arena = Arena(text)
     pairs: list[Pair] = []
     matched = _RULE_MAP[start_rule](state, pairs)
     if matched:
+        if state.arena is not None:
+            return state.arena.pairs(pairs)
         return Pairs(pairs)
     raise PestParsingError(state)
 
 class Parser:
     """A class wrapping `parse()` in `Parser.parse()`."""
-    def parse(self, start_rule: str, text: str, *, start_pos: int = 0) -> Pairs:
+    def parse(self, start_rule: str, text: str, *, start_pos: int = 0, arena: bool = False) -> Pairs:
         """Parse the given `text` starting from the specified `start_rule`."""
-        return parse(start_rule, text, start_pos=start_pos)
+        return parse(start_rule, text, start_pos=start_pos, arena=arena)
 
 def main() -> None:
     parser = argparse.ArgumentParser(
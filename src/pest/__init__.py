@@ -1,12 +1,22 @@
 from importlib.metadata import version
 
+from .adversarial import AdversarialSearch
+from .adversarial import Finding
+from .adversarial import WorkCounter
 from .exceptions import PestParsingError
+from .grammar.analysis import Hazard
 from .grammar.exceptions import PestGrammarError
 from .grammar.exceptions import PestGrammarSyntaxError
 from .grammar.optimizer import DEFAULT_OPTIMIZER
 from .grammar.optimizer import DEFAULT_OPTIMIZER_PASSES
 from .grammar.optimizer import Optimizer
 from .grammar.rule import Rule
+from .heatmap import BacktrackHeatmap
+from .heatmap import LineHeat
+from .incremental import Document
+from .loader import CompiledParser
+from .loader import load_parser
+from .memo import MemoStats
 from .pairs import End
 from .pairs import Pair
 from .pairs import Pairs
@@ -17,15 +27,31 @@ from .pairs import Stream
 from .pairs import Token
 from .parser import Parser
 from .pratt import PrattParser
+from .precedence import Operators
+from .profile import ProfileStats
+from .profile import RuleProfile
 from .state import ParserState
 from .state import RuleFrame
+from .synth import InputGenerator
+from .trace import TraceLog
+from .trace import Tracer
 
 __version__ = version("python-pest")
 
 __all__ = (
+    "AdversarialSearch",
+    "BacktrackHeatmap",
+    "CompiledParser",
     "DEFAULT_OPTIMIZER_PASSES",
     "DEFAULT_OPTIMIZER",
+    "Document",
     "End",
+    "Finding",
+    "Hazard",
+    "InputGenerator",
+    "LineHeat",
+    "MemoStats",
+    "Operators",
     "Optimizer",
     "Pair",
     "Pairs",
@@ -36,10 +62,16 @@ __all__ = (
     "PestParsingError",
     "Position",
     "PrattParser",
+    "ProfileStats",
     "Rule",
+    "RuleProfile",
     "RuleFrame",
     "Span",
     "Start",
     "Stream",
     "Token",
+    "TraceLog",
+    "Tracer",
+    "WorkCounter",
+    "load_parser",
 )
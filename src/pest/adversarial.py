@@ -0,0 +1,523 @@
+"""Search for inputs that make a parser do the most work per byte.
+
+An `AdversarialSearch` starts from seed inputs and mutates them, keeping the
+inputs that cause the most work per byte of input. Work is rule attempts,
+backtracking restores and characters backtracked over, counted by a
+`WorkCounter` tracer. Mutations delete, duplicate, repeat
+and insert slices of input, insert literals from the grammar, and splice
+inputs together. Mutated inputs don't need to be valid. Work done before a
+parser rejects an input counts too.
+
+The best inputs found are then pumped, by repeating a slice of each input more
+and more times, to estimate how work grows with input size. Work that grows
+faster than linearly with the number of repetitions, like `count ** 2`, is
+reported along with the rules that did the most work. So are inputs that
+exceed Python's recursion limit.
+
+    search = AdversarialSearch(parser, "request", seed=1)
+    findings = search.search(seeds, iterations=2000)
+    print(search.report(findings))
+
+Each parse stops once it has done `max_work` work, so inputs that take
+exponential time don't stall the search. They score as if they had done about
+`max_work` work.
+
+Work is counted with tracing, so rules that the optimizer has inlined, and
+results answered from the memo table, are not counted. Search a parser created
+with `optimizer=None` to count every rule in the grammar.
+"""
+
+from __future__ import annotations
+
+import random
+from collections import Counter
+from time import perf_counter
+from typing import TYPE_CHECKING
+from typing import NamedTuple
+
+from .exceptions import PestParsingError
+from .grammar.expressions import CIString
+from .grammar.expressions import Range
+from .grammar.expressions import String
+from .synth import fit_exponent
+from .trace import Tracer
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from .grammar.expression import Expression
+    from .parser import Parser
+
+PUMP_SIZES = (64, 256, 1024, 4096)
+"""Approximate lengths, in characters, of repeated slices when estimating work
+growth."""
+
+PUMP_LENGTHS = (1, 2, 4, 8, 16)
+"""Lengths of slices to try repeating when estimating work growth."""
+
+MAX_PUMP_WORK = 50_000
+"""Don't repeat a slice more times if the input is expected to do more work
+than this."""
+
+MAX_WORK = 200_000
+"""The default limit on the work done parsing one input during a search."""
+
+
+class _WorkLimitError(Exception):
+    """Raised by a `WorkCounter` when it reaches its work limit."""
+
+
+class WorkCounter(Tracer):
+    """A tracer that counts rule attempts and backtracking by rule.
+
+    Work is the number of rule attempts, plus the number of backtracking
+    restores, plus the number of characters backtracked over. Matching the
+    same input again after backtracking over it is wasted work, and input that
+    is backtracked over many times is the usual cause of super-linear parsing.
+
+    Restores are counted against the innermost rule being parsed, or against
+    an empty rule name if no rule is being parsed.
+
+    Args:
+        limit: An optional limit on work. Once it is reached, the counter
+            stops the parse by raising an exception, which
+            `AdversarialSearch.work()` handles.
+
+    Attributes:
+        attempts: A counter of rule attempts keyed by rule name.
+        restores: A counter of backtracking restores keyed by rule name.
+        backtracked: A counter of characters, or bytes for bytes-like input,
+            backtracked over keyed by rule name.
+    """
+
+    __slots__ = ("_stack", "_work", "attempts", "backtracked", "limit", "restores")
+
+    def __init__(self, limit: int | None = None) -> None:
+        self.limit = limit
+        self.attempts: Counter[str] = Counter()
+        self.restores: Counter[str] = Counter()
+        self.backtracked: Counter[str] = Counter()
+        self._stack: list[str] = []
+        self._work = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"WorkCounter(attempts={self.attempts.total()}, "
+            f"restores={self.restores.total()}, "
+            f"backtracked={self.backtracked.total()})"
+        )
+
+    @property
+    def total(self) -> int:
+        """Rule attempts plus restores plus characters backtracked over."""
+        return self.attempts.total() + self.restores.total() + self.backtracked.total()
+
+    def by_rule(self) -> dict[str, int]:
+        """Return the work done by each rule, most work first."""
+        return dict((self.attempts + self.restores + self.backtracked).most_common())
+
+    def reset(self) -> None:
+        """Clear all counts."""
+        self.attempts.clear()
+        self.restores.clear()
+        self.backtracked.clear()
+        self._stack.clear()
+        self._work = 0
+
+    @property
+    def limited(self) -> bool:
+        """True if the work limit has been reached."""
+        return self.limit is not None and self._work >= self.limit
+
+    def enter(self, rule_name: str, pos: int) -> None:  # noqa: ARG002, D102
+        self.attempts[rule_name] += 1
+        self._stack.append(rule_name)
+        self._add_work(1)
+
+    def exit(self, rule_name: str, matched: bool, start: int, end: int) -> None:  # noqa: ARG002, D102, FBT001
+        self._stack.pop()
+
+    def restore(self, from_pos: int, to_pos: int) -> None:  # noqa: D102
+        rule_name = self._stack[-1] if self._stack else ""
+        self.restores[rule_name] += 1
+        work = 1
+        if from_pos > to_pos:
+            self.backtracked[rule_name] += from_pos - to_pos
+            work += from_pos - to_pos
+        self._add_work(work)
+
+    def _add_work(self, work: int) -> None:
+        self._work += work
+        if self.limit is not None and self._work >= self.limit:
+            raise _WorkLimitError
+
+
+class Finding(NamedTuple):
+    """An input found by `AdversarialSearch`, and how much work it causes."""
+
+    text: str
+    """The input."""
+
+    work: int
+    """Work done parsing `text`, see `WorkCounter`, up to the search's
+    `max_work`."""
+
+    work_per_byte: float
+    """`work`, less the work done for an empty input, divided by the length
+    of `text` in UTF-8 encoded bytes."""
+
+    rules: dict[str, int]
+    """Work by rule, most work first."""
+
+    exponent: float | None
+    """How work grows with the number of times `pump` is repeated, or None if
+    the input was not pumped. About 1 for linear growth and 2 for quadratic
+    growth."""
+
+    pump: str | None
+    """The slice of `text` whose repetition grows work the fastest."""
+
+    recursion_error: bool
+    """True if parsing `text`, or a pumped copy of it, exceeded Python's
+    recursion limit."""
+
+
+class AdversarialSearch:
+    """Search for inputs that maximize parser work per byte.
+
+    Args:
+        parser: The parser to search. Use a parser created with
+            `optimizer=None` to count work for every rule.
+        start_rule: The name of the rule to parse inputs with.
+        seed: A seed for the random number generator, for reproducible
+            searches.
+        max_length: The maximum length of mutated inputs, in characters.
+        population: The number of best inputs to keep and mutate.
+        threshold: Findings whose work grows faster than `size ** (1 +
+            threshold)` are super-linear.
+        max_work: The most work to do parsing any one input. Parsing stops
+            once this much work has been done.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        parser: Parser,
+        start_rule: str,
+        *,
+        seed: int | None = None,
+        max_length: int = 512,
+        population: int = 16,
+        threshold: float = 0.2,
+        max_work: int = MAX_WORK,
+    ):
+        self.parser = parser
+        self.start_rule = start_rule
+        self.random = random.Random(seed)  # noqa: S311
+        self.max_length = max_length
+        self.population = population
+        self.threshold = threshold
+        self.max_work = max_work
+        self.tokens = _grammar_tokens(parser)
+        self.recursion_errors: set[str] = set()
+
+        # Work done for every input, like parsing `SOI`, is not work per byte.
+        self.base_work = self.work("").total
+
+    def work(self, text: str, limit: int | None = None) -> WorkCounter:
+        """Parse `text` and return the work done, whether or not it parsed.
+
+        Parsing stops once `limit` work has been done, or `max_work` if
+        `limit` is not given. Check `WorkCounter.limited` to see if it did.
+
+        Inputs that exceed Python's recursion limit, like deeply nested
+        brackets, are added to `recursion_errors`.
+        """
+        counter = WorkCounter(self.max_work if limit is None else limit)
+        try:
+            self.parser.parse(self.start_rule, text, tracer=counter)
+        except (PestParsingError, _WorkLimitError):
+            pass
+        except RecursionError:
+            self.recursion_errors.add(text)
+        return counter
+
+    def search(
+        self,
+        seeds: Iterable[str],
+        *,
+        iterations: int = 1000,
+        max_seconds: float | None = None,
+        pump: int = 5,
+    ) -> list[Finding]:
+        """Mutate `seeds`, returning the inputs with the most work per byte.
+
+        Args:
+            seeds: Inputs to start from. Seeds longer than `max_length` are
+                truncated.
+            iterations: The number of mutated inputs to try.
+            max_seconds: Stop after about this many seconds, even if fewer
+                than `iterations` inputs have been tried. Mutation stops
+                after half of this time, leaving the rest for pumping.
+                Findings that weren't pumped in time have no exponent.
+            pump: The number of best inputs to pump, to estimate how their
+                work grows with input size.
+
+        Returns:
+            Up to `population` findings, most work per byte first.
+
+        Raises:
+            ValueError: If there are no seeds.
+        """
+        scored: dict[str, float] = {}
+        counters: dict[str, WorkCounter] = {}
+        for text in seeds:
+            text = text[: self.max_length]  # noqa: PLW2901
+            if text not in scored:
+                counters[text] = self.work(text)
+                scored[text] = self._score(text, counters[text])
+
+        if not scored:
+            raise ValueError("expected at least one seed input")
+
+        population = sorted(scored, key=scored.__getitem__, reverse=True)
+        population = population[: self.population]
+        start = perf_counter()
+        deadline = None if max_seconds is None else start + max_seconds / 2
+
+        for _ in range(iterations):
+            if deadline is not None and perf_counter() > deadline:
+                break
+
+            text = self._mutate(population)
+            if text in scored:
+                continue
+
+            counter = self.work(text)
+            score = scored[text] = self._score(text, counter)
+            if len(population) < self.population or score > scored[population[-1]]:
+                counters[text] = counter
+                population.append(text)
+                population.sort(key=scored.__getitem__, reverse=True)
+                for evicted in population[self.population :]:
+                    del counters[evicted]
+                del population[self.population :]
+
+        deadline = None if max_seconds is None else start + max_seconds
+        findings = []
+        for i, text in enumerate(population):
+            counter = counters[text]
+            errors = len(self.recursion_errors)
+            exponent, slice_ = (
+                self.growth(text, deadline=deadline) if i < pump else (None, None)
+            )
+            findings.append(
+                Finding(
+                    text,
+                    counter.total,
+                    scored[text],
+                    counter.by_rule(),
+                    exponent,
+                    slice_,
+                    len(self.recursion_errors) > errors
+                    or text in self.recursion_errors,
+                )
+            )
+
+        return findings
+
+    def growth(
+        self, text: str, *, deadline: float | None = None
+    ) -> tuple[float | None, str | None]:
+        """Estimate how work grows when a slice of `text` is repeated.
+
+        Slices of several lengths, starting at several positions, are
+        repeated to fill about `PUMP_SIZES` characters, while the work done
+        is expected to stay under `MAX_PUMP_WORK`. A straight line is fitted
+        to log(extra work) against log(count) for each slice, where extra
+        work is the work done beyond that for `text` without the slice. So
+        the rest of `text`, and how much work each byte of the slice costs,
+        don't affect the slope.
+
+        If `text` itself does too much work to measure growth, slices of its
+        longest prefix that doesn't are repeated instead.
+
+        Args:
+            text: The input to pump.
+            deadline: An optional `time.perf_counter()` time after which no
+                more slices are tried.
+
+        Returns:
+            The largest slope and the slice that produced it, or (None, None)
+            if `text` is empty or the deadline passed before any slice was
+            tried.
+        """
+        while text and self.work(text, MAX_PUMP_WORK).limited:
+            text = text[: len(text) // 2]
+
+        if not text:
+            return None, None
+
+        starts = sorted(
+            {0, len(text) - 1, *(self.random.randrange(len(text)) for _ in range(4))}
+        )
+
+        best: tuple[float | None, str | None] = (None, None)
+        for start in starts:
+            for length in PUMP_LENGTHS:
+                if start + length > len(text):
+                    break
+
+                if deadline is not None and perf_counter() > deadline:
+                    return best
+
+                slice_ = text[start : start + length]
+                exponent = self._pump(text[:start], slice_, text[start + length :])
+                if best[0] is None or exponent > best[0]:
+                    best = (exponent, slice_)
+
+        return best
+
+    def _pump(self, before: str, slice_: str, after: str) -> float:
+        """Return the slope of log(extra work) against log(count) for `slice_`.
+
+        A count that reaches the work limit is recorded as doing exactly that
+        much work, which underestimates its slope. If the first count reaches
+        the limit, smaller counts are tried too.
+        """
+        limit = MAX_PUMP_WORK * 2
+        base = self.work(before + after, limit).total
+        counts: list[int] = []
+        extra: list[int] = []
+
+        for size in PUMP_SIZES:
+            count = max(size // len(slice_), 1)
+            if len(counts) > 1:
+                # Extrapolate from the last two counts.
+                slope = fit_exponent(counts[-2:], extra[-2:])
+                expected = base + extra[-1] * (count / counts[-1]) ** slope
+                if expected > MAX_PUMP_WORK:
+                    break
+
+            counter = self.work(before + slice_ * count + after, limit)
+
+            if counter.limited and not counts:
+                # Halve the count down to one, so there are points below the
+                # limit to fit from, and keep the smallest count that still
+                # reaches the limit, which underestimates its slope the least.
+                smaller = count // 2
+                while smaller:
+                    small = self.work(before + slice_ * smaller + after, limit)
+                    if small.limited:
+                        count, counter = smaller, small
+                    else:
+                        counts.insert(0, smaller)
+                        extra.insert(0, max(small.total - base, 1))
+                    smaller //= 2
+
+            counts.append(count)
+            extra.append(max(counter.total - base, 1))
+            if counter.limited:
+                break
+
+        return fit_exponent(counts, extra)
+
+    def super_linear(self, findings: Iterable[Finding]) -> list[Finding]:
+        """Return findings whose work grows faster than `size ** (1 + threshold)`."""
+        return [finding for finding in findings if self._super_linear(finding)]
+
+    def report(self, findings: list[Finding], n: int = 10) -> str:
+        """Return a table of the first `n` findings and their busiest rules.
+
+        Super-linear findings are marked with an asterisk, and findings that
+        exceeded Python's recursion limit are marked with an exclamation mark.
+        """
+        header = (
+            f"   {'bytes':>6}  {'work':>8}  {'per byte':>8}  {'exponent':>8}  "
+            f"{'rules':<40}  text"
+        )
+        lines = [header]
+
+        for finding in findings[:n]:
+            rules = ", ".join(
+                f"{name or '-'}={count}"
+                for name, count in list(finding.rules.items())[:3]
+            )
+            exponent = "" if finding.exponent is None else f"{finding.exponent:.2f}"
+            lines.append(
+                f"{'*' if self._super_linear(finding) else ' '}"
+                f"{'!' if finding.recursion_error else ' '}"
+                f"{len(finding.text.encode()):>6}  {finding.work:>8}  "
+                f"{finding.work_per_byte:>8.1f}  {exponent:>8}  {rules:<40}  "
+                f"{finding.text[:40]!r}"
+            )
+
+        return "\n".join(lines)
+
+    def _super_linear(self, finding: Finding) -> bool:
+        return finding.exponent is not None and finding.exponent > 1 + self.threshold
+
+    def _score(self, text: str, counter: WorkCounter) -> float:
+        return (counter.total - self.base_work) / max(len(text.encode()), 1)
+
+    def _mutate(self, population: list[str]) -> str:
+        rand = self.random
+        text = rand.choice(population)
+
+        for _ in range(rand.randint(1, 3)):
+            text = self._mutate_once(text, rand.choice(population))
+
+        return text[: self.max_length]
+
+    def _mutate_once(self, text: str, other: str) -> str:  # noqa: PLR0911
+        rand = self.random
+        i = rand.randint(0, len(text))
+        j = min(len(text), i + rand.randint(1, 16))
+        chunk = text[i:j]
+        op = rand.randrange(7)
+
+        if op == 0 and chunk:
+            # Delete a slice.
+            return text[:i] + text[j:]
+        if op == 1 and chunk:
+            # Duplicate a slice in place.
+            return text[:j] + chunk + text[j:]
+        if op == 2 and chunk:  # noqa: PLR2004
+            # Repeat a slice several times.
+            return text[:j] + chunk * rand.randint(2, 16) + text[j:]
+        if op == 3 and self.tokens:  # noqa: PLR2004
+            # Insert a grammar literal.
+            return text[:i] + rand.choice(self.tokens) + text[i:]
+        if op == 4 and self.tokens and chunk:  # noqa: PLR2004
+            # Replace a slice with a grammar literal.
+            return text[:i] + rand.choice(self.tokens) + text[j:]
+        if op == 5 and other:  # noqa: PLR2004
+            # Splice the start of this input with the end of another.
+            return text[:i] + other[rand.randint(0, len(other)) :]
+        if op == 6 and other:  # noqa: PLR2004
+            # Insert a slice of another input.
+            k = rand.randint(0, len(other))
+            return text[:i] + other[k : k + rand.randint(1, 16)] + text[i:]
+
+        return text + (rand.choice(self.tokens) if self.tokens else chunk)
+
+
+def _grammar_tokens(parser: Parser) -> list[str]:
+    """Return literal strings and range endpoints from `parser`'s rules."""
+    tokens: set[str] = set()
+    seen: set[int] = set()
+    stack: list[Expression] = list(parser.rules.values())
+
+    while stack:
+        expr = stack.pop()
+        if id(expr) in seen:
+            continue
+        seen.add(id(expr))
+
+        if isinstance(expr, (String, CIString)) and expr.value:
+            tokens.add(expr.value)
+        elif isinstance(expr, Range):
+            tokens.update((expr.start, expr.stop))
+
+        stack.extend(expr.children())
+
+    return sorted(tokens)
@@ -0,0 +1,242 @@
+"""A compact, array-backed parse tree.
+
+By default, every node in a parse tree is a `Pair` instance with its own list of
+children. For large inputs that's millions of small objects. When parsing with
+`arena=True`, matched rules are instead recorded as rows in a set of parallel
+arrays, one integer per field per node, and `Pair` objects are created lazily,
+as lightweight views over those arrays, when the tree is traversed.
+
+While parsing, node ids take the place of `Pair` instances in the lists of pairs
+passed between expressions. Nodes from branches that are backtracked over are
+left in the arena, unreachable from the root.
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import TYPE_CHECKING
+
+from .lines import line_index
+from .pairs import Pair
+from .pairs import Pairs
+
+if TYPE_CHECKING:
+    from .grammar.rule import Rule
+    from .lines import LineIndex
+    from .state import RuleFrame
+
+NIL = -1
+"""The absence of a parent, sibling, child or tag."""
+
+
+class Arena:
+    """Parallel arrays of parse tree nodes.
+
+    Args:
+        text: The input string being parsed.
+
+    Attributes:
+        input: The input string being parsed.
+        rules: Rules or rule frames, indexed by rule id.
+        tags: Node tags, indexed by tag id.
+        rule: Rule id, per node.
+        start: Start position in the input, per node.
+        end: End position in the input, per node.
+        parent: Parent node id, per node.
+        first_child: First child node id, per node.
+        next_sibling: Next sibling node id, per node.
+        tag: Tag id, per node.
+    """
+
+    __slots__ = (
+        "_line_index",
+        "_rule_ids",
+        "_tag_ids",
+        "end",
+        "first_child",
+        "input",
+        "next_sibling",
+        "parent",
+        "rule",
+        "rules",
+        "start",
+        "tag",
+        "tags",
+    )
+
+    def __init__(self, text: str) -> None:
+        self.input = text
+        self.rules: list[Rule | RuleFrame] = []
+        self.tags: list[str] = []
+        self._rule_ids: dict[str, int] = {}
+        self._tag_ids: dict[str, int] = {}
+        self._line_index: LineIndex | None = None
+
+        self.rule = array("i")
+        # Positions in large `mmap` inputs can exceed 32 bits.
+        self.start = array("q")
+        self.end = array("q")
+        self.parent = array("i")
+        self.first_child = array("i")
+        self.next_sibling = array("i")
+        self.tag = array("i")
+
+    def __len__(self) -> int:
+        return len(self.rule)
+
+    def add(
+        self,
+        rule: Rule | RuleFrame,
+        start: int,
+        end: int,
+        children: list[int],
+        tag: str | None,
+    ) -> int:
+        """Append a node to the arena and return its id.
+
+        `children` is a list of node ids, as collected while parsing the rule.
+        """
+        rule_id = self._rule_ids.get(rule.name)
+        if rule_id is None:
+            rule_id = self._rule_ids[rule.name] = len(self.rules)
+            self.rules.append(rule)
+
+        if tag is None:
+            tag_id = NIL
+        else:
+            tag_id = self._tag_ids.get(tag, NIL)
+            if tag_id == NIL:
+                tag_id = self._tag_ids[tag] = len(self.tags)
+                self.tags.append(tag)
+
+        node = len(self.rule)
+        self.rule.append(rule_id)
+        self.start.append(start)
+        self.end.append(end)
+        self.parent.append(NIL)
+        self.first_child.append(NIL)
+        self.next_sibling.append(NIL)
+        self.tag.append(tag_id)
+
+        if children:
+            self.first_child[node] = self._link(node, children)
+
+        return node
+
+    def _link(self, parent: int, children: list[int]) -> int:
+        """Link `children` as siblings under `parent` and return the first child."""
+        parents = self.parent
+        siblings = self.next_sibling
+        first = prev = NIL
+
+        for child in children:
+            if parents[child] != NIL:
+                # Already linked, so it was replayed from the memo table.
+                child = self._copy(child)  # noqa: PLW2901
+
+            parents[child] = parent
+            if prev == NIL:
+                first = child
+            else:
+                siblings[prev] = child
+            prev = child
+
+        siblings[prev] = NIL
+        return first
+
+    def _copy(self, node: int) -> int:
+        """Append a shallow copy of `node`, sharing its children.
+
+        The children's `parent` still refers to the original node.
+        """
+        copy = len(self.rule)
+        self.rule.append(self.rule[node])
+        self.start.append(self.start[node])
+        self.end.append(self.end[node])
+        self.parent.append(NIL)
+        self.first_child.append(self.first_child[node])
+        self.next_sibling.append(NIL)
+        self.tag.append(self.tag[node])
+        return copy
+
+    @property
+    def line_index(self) -> LineIndex:
+        """An index of line start positions in the input, shared by all views."""
+        index = self._line_index
+        if index is None or index.text is not self.input:
+            index = self._line_index = line_index(self.input)
+        return index
+
+    def pairs(self, roots: list[int]) -> Pairs:
+        """Return a `Pairs` view of the nodes in `roots`."""
+        return Pairs([ArenaPair(self, node) for node in roots])
+
+    def children(self, node: int) -> list[int]:
+        """Return a list of child node ids for `node`."""
+        siblings = self.next_sibling
+        child = self.first_child[node]
+        children: list[int] = []
+        while child != NIL:
+            children.append(child)
+            child = siblings[child]
+        return children
+
+
+class ArenaPair(Pair):
+    """A `Pair` view of a node in an `Arena`.
+
+    `ArenaPair` instances are created on demand. Each access to `children`
+    returns a new list of new views.
+
+    Args:
+        arena: The arena containing the node.
+        node: The node's id.
+    """
+
+    __slots__ = ("arena", "node")
+
+    def __init__(self, arena: Arena, node: int):  # noqa: PLW0231
+        self.arena = arena
+        self.node = node
+
+    @property
+    def input(self) -> str:  # type: ignore[override]
+        """The input string."""
+        return self.arena.input
+
+    @property
+    def line_index(self) -> LineIndex:  # type: ignore[override]
+        """An index of line start positions in the input."""
+        return self.arena.line_index
+
+    @property
+    def rule(self) -> Rule | RuleFrame:  # type: ignore[override]
+        """The rule or rule frame this pair represents."""
+        return self.arena.rules[self.arena.rule[self.node]]
+
+    @property
+    def name(self) -> str:  # type: ignore[override]
+        """The name of the rule this pair represents."""
+        return self.rule.name
+
+    @property
+    def start(self) -> int:  # type: ignore[override]
+        """Start position in the input."""
+        return self.arena.start[self.node]
+
+    @property
+    def end(self) -> int:  # type: ignore[override]
+        """End position in the input."""
+        return self.arena.end[self.node]
+
+    @property
+    def tag(self) -> str | None:  # type: ignore[override]
+        """Optional tag for this node."""
+        tag_id = self.arena.tag[self.node]
+        return None if tag_id == NIL else self.arena.tags[tag_id]
+
+    @property
+    def children(self) -> list[Pair]:  # type: ignore[override]
+        """Child pairs (subrules)."""
+        arena = self.arena
+        return [ArenaPair(arena, child) for child in arena.children(self.node)]
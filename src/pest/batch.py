@@ -0,0 +1,205 @@
+"""Parse many small inputs in parallel, with a pool of worker processes.
+
+Each worker is initialized once with the source code of a parser module
+generated from the grammar, so neither the `Parser` nor its rules are pickled
+per input. Workers parse with `arena=True` and send back only the reachable
+nodes of the arena, as parallel arrays of integers, without the input text. The
+parent process already has the text, and wraps the arrays in an `Arena` that
+refers to it.
+
+Parsing errors are captured per input. A worker sends back the furthest
+position, expected and unexpected labels and rule stack from the failed parse,
+and the parent rebuilds an equivalent `PestParsingError`.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+from itertools import islice
+from typing import TYPE_CHECKING
+from typing import TypeAlias
+from typing import cast
+
+from .arena import NIL
+from .arena import Arena
+from .arena import ArenaPair
+from .exceptions import PestParsingError
+from .loader import CompiledParser
+from .state import RuleFrame
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+
+    from .grammar.rule import Rule
+    from .pairs import Pairs
+    from .parser import Parser
+
+DEFAULT_BATCH_CHUNK_SIZE = 64
+"""The default number of inputs sent to a worker process at a time."""
+
+_Tree: TypeAlias = tuple[Arena, list[int]]
+"""An arena holding reachable nodes only, and its root node ids."""
+
+_Failure: TypeAlias = tuple[
+    int, list[tuple[str, int]], dict[str, list[str]], dict[str, list[str]]
+]
+"""Furthest position, rule stack, expected and unexpected labels."""
+
+_Result: TypeAlias = tuple[int, _Tree | _Failure]
+
+# The generated parser for this worker process.
+_worker_parser: CompiledParser | None = None
+_worker_start_rule = ""
+
+
+def parse_many(
+    parser: Parser,
+    start_rule: str,
+    texts: Iterable[str],
+    *,
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_BATCH_CHUNK_SIZE,
+    ordered: bool = True,
+) -> Iterator[tuple[int, Pairs | PestParsingError]]:
+    """Parse each of `texts` in a pool of worker processes.
+
+    See `Parser.parse_many()`.
+    """
+    parser.rules[start_rule]  # Raise a KeyError early.
+    return _parse_many(
+        parser,
+        start_rule,
+        texts,
+        workers=workers,
+        chunk_size=chunk_size,
+        ordered=ordered,
+    )
+
+
+def _parse_many(
+    parser: Parser,
+    start_rule: str,
+    texts: Iterable[str],
+    *,
+    workers: int | None,
+    chunk_size: int,
+    ordered: bool,
+) -> Iterator[tuple[int, Pairs | PestParsingError]]:
+    # A pool reads all of its tasks up front, so inputs are submitted a window
+    # at a time. At most two windows of input text are held while waiting for
+    # results, and the next window is queued before the current one drains.
+    window = chunk_size * (workers or os.cpu_count() or 1) * 2
+    tasks = enumerate(texts)
+    pending: dict[int, str] = {}
+
+    with multiprocessing.Pool(
+        workers, initializer=_init_worker, initargs=(parser.generate(), start_rule)
+    ) as pool:
+        imap = pool.imap if ordered else pool.imap_unordered
+
+        def submit() -> Iterator[_Result] | None:
+            batch = list(islice(tasks, window))
+            if not batch:
+                return None
+            pending.update(batch)
+            return imap(_parse_one, batch, chunk_size)
+
+        results = submit()
+        while results is not None:
+            next_results = submit()
+            for index, result in results:
+                text = pending.pop(index)
+                if isinstance(result[0], Arena):
+                    yield index, _pairs(parser, text, result)
+                else:
+                    yield index, _error(parser, text, result)
+            results = next_results
+
+
+def _init_worker(source: str, start_rule: str) -> None:
+    global _worker_parser, _worker_start_rule  # noqa: PLW0603
+    _worker_parser = CompiledParser.from_source(source)
+    _worker_start_rule = start_rule
+
+
+def _parse_one(task: tuple[int, str]) -> _Result:
+    """Parse one input in a worker process."""
+    assert _worker_parser is not None
+    index, text = task
+
+    try:
+        pairs = _worker_parser.parse(_worker_start_rule, text, arena=True)
+    except PestParsingError as err:
+        state = err.state
+        return index, (
+            state.furthest_pos,
+            [(frame.name, frame.modifier) for frame in state.furthest_stack],
+            state.furthest_expected,
+            state.furthest_unexpected,
+        )
+
+    if not pairs:
+        return index, (Arena(""), [])
+
+    roots = cast("list[ArenaPair]", list(pairs))
+    return index, _compact(roots[0].arena, [pair.node for pair in roots])
+
+
+def _compact(arena: Arena, roots: list[int]) -> _Tree:
+    """Copy the nodes reachable from `roots` into a new arena without input."""
+    compact = Arena("")
+    new_roots: list[int] = []
+
+    # Iterative post-order traversal, so children are added before parents.
+    stack = [(root, False) for root in reversed(roots)]
+    results: list[list[int]] = [new_roots]
+
+    while stack:
+        node, visited = stack.pop()
+        if not visited:
+            stack.append((node, True))
+            results.append([])
+            stack.extend((child, False) for child in reversed(arena.children(node)))
+            continue
+
+        child_ids = results.pop()
+        tag = arena.tag[node]
+        results[-1].append(
+            compact.add(
+                arena.rules[arena.rule[node]],
+                arena.start[node],
+                arena.end[node],
+                child_ids,
+                None if tag == NIL else arena.tags[tag],
+            )
+        )
+
+    return compact, new_roots
+
+
+def _pairs(parser: Parser, text: str, tree: _Tree) -> Pairs:
+    """Return pairs for a tree sent from a worker process, with input `text`."""
+    arena, roots = tree
+    arena.input = text
+    arena.rules = [_rule(parser, frame) for frame in arena.rules]
+    return arena.pairs(roots)
+
+
+def _error(parser: Parser, text: str, failure: _Failure) -> PestParsingError:
+    """Return a parsing error for a failure sent from a worker process."""
+    furthest_pos, furthest_stack, expected, unexpected = failure
+    state = parser._new_state(text, 0)  # noqa: SLF001
+    state.furthest_pos = furthest_pos
+    state.furthest_stack = [
+        _rule(parser, RuleFrame(name, modifier)) for name, modifier in furthest_stack
+    ]
+    state.furthest_expected = expected
+    state.furthest_unexpected = unexpected
+    return PestParsingError(state)
+
+
+def _rule(parser: Parser, frame: Rule | RuleFrame) -> Rule | RuleFrame:
+    """Return the parser's rule for `frame`, or `frame` if it has none."""
+    return parser.rules.get(frame.name, frame)
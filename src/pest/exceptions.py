@@ -4,8 +4,13 @@ from __future__ import annotations
 
 from itertools import chain
 from typing import TYPE_CHECKING
+from typing import cast
+
+from .lines import line_index
 
 if TYPE_CHECKING:
+    from pest.grammar.encode import BytesLike
+    from pest.lines import LineIndex
     from pest.state import ParserState
 
 
@@ -25,7 +30,9 @@ class PestParsingError(Exception):
 
     def detailed_message(self) -> str:
         """Return an error message formatted with extra context info."""
-        line, lineno, col = error_context(self.state.input, self.state.furthest_pos)
+        line, lineno, col = error_context(
+            self.state.input, self.state.furthest_pos, self.state.line_index
+        )
 
         msg = self.args[0]
         pad = " " * len(str(lineno))
@@ -195,25 +202,32 @@ def join_with_limit(  # noqa: PLR0911
     return summary if len(summary) <= limit else ""
 
 
-def error_context(text: str, index: int) -> tuple[str, int, int]:
-    """Return a (line, lineno, col) tuple for position `index` in `text`."""
+def error_context(
+    text: str | BytesLike, index: int, lines: LineIndex | None = None
+) -> tuple[str, int, int]:
+    """Return a (line, lineno, col) tuple for position `index` in `text`.
+
+    For bytes-like input, `index` is a byte offset and `col` counts decoded
+    characters. `lines` is an existing index of line start positions in `text`.
+    """
     if not text:
         return ("", 1, 0)
 
-    lines = text.splitlines(keepends=True)
-    cumulative_length = 0
-    target_line_index = len(lines) - 1
+    if lines is None:
+        lines = line_index(text)
 
-    for i, line in enumerate(lines):
-        cumulative_length += len(line)
-        if index < cumulative_length:
-            target_line_index = i
-            break
+    line = lines.line_index(index)
+    start = lines.starts[line]
+    lineno = lines.first_line + line + 1
 
-    # Line number (1-based)
-    line_number = target_line_index + 1
-    # Column number within the line
-    column_number = index - (cumulative_length - len(lines[target_line_index])) + 1
-    current_line = lines[target_line_index].rstrip()
+    if isinstance(text, str):
+        return (lines.line(line).rstrip(), lineno, index - start + 1)
 
-    return (current_line, line_number, column_number)
+    # Bytes-like input, parsed without decoding.
+    column = len(bytes(text[start:index]).decode(errors="replace")) + 1
+    data = cast("BytesLike", lines.line(line))
+    return (
+        bytes(data).decode(errors="replace").rstrip(),
+        lineno,
+        column,
+    )
@@ -0,0 +1,474 @@
+"""Static analysis of grammar rules.
+
+`GrammarAnalysis` computes which rules can match without consuming input
+(nullability) and which expressions can be parsed first at a given position
+(leading items, a FIRST set of expressions rather than characters). It uses
+them to find:
+
+- Repetitions of expressions that can succeed without consuming input, like
+  `("a"?)*`, which repeat forever.
+- Left-recursive rules, like `a = { a ~ "b" }`, which recurse forever.
+- Backtracking hazards. Choices whose alternatives start with the same rule, or
+  with the same repetition, parse it again every time an earlier alternative
+  fails. A repetition followed by something its item starts with, like
+  `(a ~ ",")* ~ a`, parses `a` again when the repetition ends. And an
+  alternative following one that never fails is never tried.
+
+The first two are errors, raised by `validate()`. Hazards are reported by
+`hazards()` and don't stop a grammar from loading.
+
+Validation is linear in the size of the grammar, apart from finding a fixed
+point for nullable rules, so it runs every time a grammar is loaded with
+`Parser.from_grammar()`. Finding hazards compares the leading items of every
+pair of alternatives in every choice, which can cost more than the rest of
+loading a grammar, so `Parser.hazards` only finds them when first accessed.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from typing import NamedTuple
+
+from .exceptions import PestGrammarError
+from .expression import RegexExpression
+from .expressions import Choice
+from .expressions import CIString
+from .expressions import Group
+from .expressions import Identifier
+from .expressions import NegativePredicate
+from .expressions import Optional
+from .expressions import PositivePredicate
+from .expressions import Precedence
+from .expressions import Push
+from .expressions import PushLiteral
+from .expressions import Repeat
+from .expressions import RepeatExact
+from .expressions import RepeatMax
+from .expressions import RepeatMin
+from .expressions import RepeatMinMax
+from .expressions import RepeatOnce
+from .expressions import Sequence
+from .expressions import SkipUntil
+from .expressions import String
+from .rule import BuiltInRule
+from .rule import Rule
+from .rules.special import EOI
+from .rules.special import SOI
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from collections.abc import Mapping
+
+    from .expression import Expression
+
+_UNBOUNDED = (Repeat, RepeatOnce, RepeatMin)
+"""Repetitions that repeat for as long as their item matches."""
+
+
+class Hazard(NamedTuple):
+    """A part of a grammar that is likely to backtrack heavily."""
+
+    rule: str
+    """The name of the rule containing the hazard."""
+
+    kind: str
+    """One of `"prefix"`, `"follow"` or `"unreachable"`."""
+
+    message: str
+    """A description of the hazard."""
+
+    def __str__(self) -> str:
+        return f"{self.rule}: {self.message}"
+
+
+class _Item(NamedTuple):
+    """An expression that might be parsed first by another expression."""
+
+    expr: Expression
+    repeated: bool
+
+
+class GrammarAnalysis:
+    """Nullability and leading item analysis of a grammar's rules.
+
+    Args:
+        rules: A mapping of rule names to rules, including built-in rules.
+    """
+
+    def __init__(self, rules: Mapping[str, Rule]):
+        self.rules = rules
+        self.nullable: set[str] = set()
+
+        # Add nullable grammar rules until nothing changes. A rule can only
+        # become nullable when a rule it refers to does.
+        changed = True
+        while changed:
+            changed = False
+            for name, rule in self._grammar_rules():
+                if name not in self.nullable and self.is_nullable(rule.expression):
+                    self.nullable.add(name)
+                    changed = True
+
+        self._recursive: set[str] | None = None
+        self._nodes: dict[str, list[Expression]] = {}
+        self._left_calls_cache: dict[str, list[str]] = {}
+
+    def is_nullable(self, expr: Expression) -> bool:  # noqa: PLR0911
+        """Return True if `expr` can succeed without consuming input.
+
+        Stack operations other than `PUSH` are assumed to consume input.
+        """
+        if isinstance(expr, Identifier):
+            rule = self.rules.get(expr.value)
+            if isinstance(rule, BuiltInRule):
+                # Built-in rules don't refer to other rules.
+                return self.is_nullable(rule)
+            return expr.value in self.nullable
+
+        if isinstance(expr, (SOI, EOI)):
+            return True
+
+        if isinstance(expr, Rule):
+            return self.is_nullable(expr.expression)
+
+        if isinstance(expr, (String, CIString)):
+            return not expr.value
+
+        if isinstance(expr, Sequence):
+            return all(self.is_nullable(e) for e in expr.expressions)
+
+        if isinstance(expr, Choice):
+            return any(self.is_nullable(e) for e in expr.expressions)
+
+        if isinstance(expr, (Group, Precedence, Push, RepeatOnce)):
+            return self.is_nullable(expr.expression)
+
+        if isinstance(expr, (RepeatExact, RepeatMin)):
+            return expr.number == 0 or self.is_nullable(expr.expression)
+
+        if isinstance(expr, RepeatMinMax):
+            return expr.min == 0 or self.is_nullable(expr.expression)
+
+        if isinstance(expr, RegexExpression):
+            return expr.regex.match("") is not None
+
+        return isinstance(
+            expr,
+            (
+                Optional,
+                Repeat,
+                RepeatMax,
+                PositivePredicate,
+                NegativePredicate,
+                PushLiteral,
+                SkipUntil,
+            ),
+        )
+
+    def never_fails(self, expr: Expression, seen: frozenset[str] = frozenset()) -> bool:  # noqa: PLR0911
+        """Return True if `expr` succeeds whatever the input."""
+        if isinstance(expr, Identifier):
+            rule = self.rules.get(expr.value)
+            return (
+                rule is not None
+                and expr.value not in seen
+                and self.never_fails(rule.expression, seen | {expr.value})
+            )
+
+        if isinstance(expr, (SOI, EOI)):
+            return False
+
+        if isinstance(expr, Rule):
+            return self.never_fails(expr.expression, seen)
+
+        if isinstance(expr, (String, CIString)):
+            return not expr.value
+
+        if isinstance(expr, Sequence):
+            return all(self.never_fails(e, seen) for e in expr.expressions)
+
+        if isinstance(expr, Choice):
+            return any(self.never_fails(e, seen) for e in expr.expressions)
+
+        if isinstance(expr, (Group, Precedence, Push, RepeatOnce)):
+            return self.never_fails(expr.expression, seen)
+
+        if isinstance(expr, (RepeatExact, RepeatMin)):
+            return expr.number == 0 or self.never_fails(expr.expression, seen)
+
+        if isinstance(expr, RepeatMinMax):
+            return expr.min == 0 or self.never_fails(expr.expression, seen)
+
+        return isinstance(expr, (Optional, Repeat, RepeatMax, PushLiteral, SkipUntil))
+
+    def _leading_items(self, expr: Expression) -> list[_Item]:
+        """Return expressions that might be parsed first when parsing `expr`.
+
+        Rule references are not followed. Predicates are skipped.
+        """
+        items: list[_Item] = []
+        self._leading(expr, items, repeated=False)
+        return items
+
+    def validate(self) -> None:
+        """Check rules for expressions that would never stop parsing.
+
+        Raises:
+            PestGrammarError: If a rule repeats an expression that can succeed
+                without consuming input, or if a rule is left-recursive.
+        """
+        for name, _ in self._grammar_rules():
+            for expr in self._walk(name):
+                if isinstance(expr, _UNBOUNDED) and self.is_nullable(expr.expression):
+                    raise PestGrammarError(
+                        f"expression inside repetition in rule {name!r} can match "
+                        f"without consuming input and will repeat infinitely: {expr}"
+                    )
+
+        for name, _ in self._grammar_rules():
+            if path := self._left_recursion(name, [name]):
+                raise PestGrammarError(
+                    f"rule {name!r} is left-recursive ({' -> '.join(path)})"
+                )
+
+    def hazards(self) -> list[Hazard]:
+        """Return parts of the grammar that are likely to backtrack heavily."""
+        hazards: list[Hazard] = []
+
+        for name, _ in self._grammar_rules():
+            for expr in self._walk(name):
+                if isinstance(expr, Choice):
+                    hazards.extend(self._choice_hazards(name, expr))
+                elif isinstance(expr, Sequence):
+                    hazards.extend(self._follow_hazards(name, expr))
+
+        return hazards
+
+    def _leading(  # noqa: PLR0911
+        self,
+        expr: Expression,
+        items: list[_Item],
+        *,
+        repeated: bool,
+        lookahead: bool = False,
+    ) -> bool:
+        """Add leading items of `expr` to `items` and return `is_nullable(expr)`.
+
+        If `lookahead` is True, items parsed first by predicates are added too.
+        """
+        if isinstance(expr, Sequence):
+            for child in expr.expressions:
+                if not self._leading(
+                    child, items, repeated=repeated, lookahead=lookahead
+                ):
+                    return False
+            return True
+
+        if isinstance(expr, Choice):
+            nullable = False
+            for child in expr.expressions:
+                nullable = (
+                    self._leading(child, items, repeated=repeated, lookahead=lookahead)
+                    or nullable
+                )
+            return nullable
+
+        if isinstance(expr, (Group, Precedence, Push)):
+            return self._leading(
+                expr.expression, items, repeated=repeated, lookahead=lookahead
+            )
+
+        if isinstance(expr, (Optional, RepeatMax, RepeatExact, RepeatMinMax)):
+            self._leading(
+                expr.expression, items, repeated=repeated, lookahead=lookahead
+            )
+            return self.is_nullable(expr)
+
+        if isinstance(expr, _UNBOUNDED):
+            self._leading(expr.expression, items, repeated=True, lookahead=lookahead)
+            return self.is_nullable(expr)
+
+        if isinstance(expr, (PositivePredicate, NegativePredicate)):
+            if lookahead:
+                self._leading(expr.expression, items, repeated=repeated, lookahead=True)
+        else:
+            items.append(_Item(expr, repeated))
+
+        return self.is_nullable(expr)
+
+    def _significant(self, item: _Item) -> bool:
+        """Return True if parsing `item` again could be expensive.
+
+        Built-in rules and terminals match a few characters at most, unless
+        they are repeated.
+        """
+        return item.repeated or (
+            isinstance(item.expr, Identifier)
+            and not isinstance(self.rules.get(item.expr.value), BuiltInRule)
+        )
+
+    def _choice_hazards(self, name: str, expr: Choice) -> Iterator[Hazard]:
+        alternatives = expr.expressions
+        leading = [
+            {str(item.expr): item for item in self._leading_items(alt)}
+            for alt in alternatives
+        ]
+
+        for i, alt in enumerate(alternatives):
+            if self.never_fails(alt):
+                for j in range(i + 1, len(alternatives)):
+                    yield Hazard(
+                        name,
+                        "unreachable",
+                        f"alternative {alternatives[j]} is never tried, because "
+                        f"{alt} always succeeds",
+                    )
+                return
+
+            for j in range(i + 1, len(alternatives)):
+                shared = [
+                    item
+                    for key, item in leading[i].items()
+                    if key in leading[j] and self._significant(item)
+                ]
+                if shared:
+                    yield Hazard(
+                        name,
+                        "prefix",
+                        f"alternatives {alt} and {alternatives[j]} can both start "
+                        f"with {_describe(shared)}, which is parsed again when the "
+                        f"first alternative fails{self._exponential(shared)}",
+                    )
+
+    def _follow_hazards(self, name: str, expr: Sequence) -> Iterator[Hazard]:
+        expressions = expr.expressions
+
+        for i, child in enumerate(expressions[:-1]):
+            if not isinstance(child, (Optional, *_UNBOUNDED)):
+                continue
+
+            # What might follow `child` in this sequence.
+            follow: dict[str, _Item] = {}
+            for after in expressions[i + 1 :]:
+                items: list[_Item] = []
+                nullable = self._leading(after, items, repeated=False)
+                follow.update((str(item.expr), item) for item in items)
+                if not nullable:
+                    break
+
+            shared = [
+                item
+                for item in self._leading_items(child.expression)
+                if str(item.expr) in follow and self._significant(item)
+            ]
+
+            if shared:
+                yield Hazard(
+                    name,
+                    "follow",
+                    f"{child} can start with {_describe(shared)}, which can also "
+                    f"follow it, and is parsed again when {child} stops "
+                    f"matching{self._exponential(shared)}",
+                )
+
+    def _exponential(self, items: list[_Item]) -> str:
+        recursive = [
+            item.expr.value
+            for item in items
+            if isinstance(item.expr, Identifier) and item.expr.value in self.recursive()
+        ]
+        if recursive:
+            return (
+                f", and {', '.join(recursive)} is recursive, so parsing time can "
+                "grow exponentially with nesting depth"
+            )
+        return ""
+
+    def _grammar_rules(self) -> Iterator[tuple[str, Rule]]:
+        for name, rule in self.rules.items():
+            if not isinstance(rule, BuiltInRule):
+                yield name, rule
+
+    def _walk(self, name: str) -> list[Expression]:
+        """Return the expressions in rule `name`, not following references."""
+        nodes = self._nodes.get(name)
+        if nodes is None:
+            nodes = self._nodes[name] = list(_walk(self.rules[name].expression))
+        return nodes
+
+    def _left_calls(self, name: str) -> list[str]:
+        """Return names of rules that `name` might call before consuming input."""
+        calls = self._left_calls_cache.get(name)
+        if calls is not None:
+            return calls
+
+        rule = self.rules.get(name)
+        items: list[_Item] = []
+        if rule is not None and not isinstance(rule, BuiltInRule):
+            # Predicates parse their expression at the same position too.
+            self._leading(rule.expression, items, repeated=False, lookahead=True)
+
+        calls = self._left_calls_cache[name] = [
+            item.expr.value for item in items if isinstance(item.expr, Identifier)
+        ]
+        return calls
+
+    def _left_recursion(
+        self, target: str, path: list[str], seen: set[str] | None = None
+    ) -> list[str] | None:
+        """Return a path of left calls from `path[-1]` back to `target`."""
+        if seen is None:
+            seen = set()
+
+        for callee in self._left_calls(path[-1]):
+            if callee == target:
+                return [*path, callee]
+            if callee not in seen:
+                seen.add(callee)
+                if found := self._left_recursion(target, [*path, callee], seen):
+                    return found
+
+        return None
+
+    def recursive(self) -> set[str]:
+        """Return names of rules that can refer back to themselves."""
+        if self._recursive is not None:
+            return self._recursive
+
+        references = {
+            name: {
+                expr.value for expr in self._walk(name) if isinstance(expr, Identifier)
+            }
+            for name, _ in self._grammar_rules()
+        }
+
+        recursive: set[str] = set()
+        for name, refs in references.items():
+            stack = list(refs)
+            seen: set[str] = set()
+            while stack:
+                ref = stack.pop()
+                if ref == name:
+                    recursive.add(name)
+                    break
+                if ref not in seen:
+                    seen.add(ref)
+                    stack.extend(references.get(ref, ()))
+
+        self._recursive = recursive
+        return recursive
+
+
+def _walk(expr: Expression) -> Iterator[Expression]:
+    """Yield `expr` and its descendants, not following rule references."""
+    yield expr
+    if not isinstance(expr, BuiltInRule):
+        for child in expr.children():
+            yield from _walk(child)
+
+
+def _describe(items: list[_Item]) -> str:
+    names = list(dict.fromkeys(str(item.expr) for item in items))
+    if len(names) == 1:
+        return names[0]
+    return ", ".join(names[:-1]) + " or " + names[-1]
@@ -19,14 +19,23 @@ class Builder:
     rendering the final code as a string.
     """
 
-    def __init__(self, rules: dict[str, Rule] | None = None) -> None:
-        """Initialize a new Builder with empty code and zero indentation."""
+    def __init__(
+        self, rules: dict[str, Rule] | None = None, *, lazy_errors: bool = False
+    ) -> None:
+        """Initialize a new Builder with empty code and zero indentation.
+
+        Args:
+            rules: The grammar's rules, for expressions that refer to them.
+            lazy_errors: If True, code is being generated for a parser that
+                doesn't track failures unless parsing fails.
+        """
         self.lines: list[str] = []
         self.indent = 0
         self.counter = 0
         self.module_constants: list[tuple[str, str]] = []
         self.rule_constants: list[tuple[str, str]] = []
         self.rules = rules
+        self.lazy_errors = lazy_errors
 
     def writeln(self, line: str = "") -> None:
         """Append a line to the code, respecting the current indentation level.
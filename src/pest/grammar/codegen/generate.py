@@ -5,14 +5,30 @@ from a set of grammar rules. It emits parser functions, rule closures, and
 trivia parsing logic for whitespace and comments.
 """
 
+from __future__ import annotations
+
 from importlib.metadata import version
+from typing import TYPE_CHECKING
 
 from pest.grammar.codegen.builder import Builder
+from pest.grammar.expressions.precedence import Precedence
+from pest.grammar.rule import SILENT
 from pest.grammar.rule import BuiltInRule
-from pest.grammar.rule import Rule
+from pest.memo import DEFAULT_MEMO_CAPACITY
+from pest.state import state_class
+
+if TYPE_CHECKING:
+    from collections.abc import Collection
+
+    from pest.grammar.rule import Rule
 
 VERSION = version("python-pest")
 
+FORMAT_VERSION = 3
+"""The version of the code generated for a grammar. Increment it whenever
+generated code changes, so that `load_parser()` doesn't load modules cached
+by an earlier version of the code generator."""
+
 PRELUDE = f"""\
 \"\"\"This file was generated by Python Pest version {VERSION}.
 
@@ -36,6 +52,7 @@ from typing import TYPE_CHECKING
 
 import regex as re
 
+from pest.arena import Arena
 from pest.exceptions import PestParsingError
 from pest.pairs import Pair
 from pest.pairs import Pairs
@@ -48,41 +65,212 @@ if TYPE_CHECKING:
 # ruff: noqa: D103 N802 N816 N806 PLR0912 PLR0915 PLR2004
 """
 
+_MEMO_IMPORTS = """\
+from pest.memo import Memo
+from pest.memo import MemoStats
+from pest.memo import memoize_rule
+"""
+
+_MEMO_IMPORTS_BEFORE = "from pest.pairs import Pair\n"
+
+_STATE_IMPORT = "from pest.state import RuleFrame\n"
+
+_PRECEDENCE_IMPORT = "from pest.precedence import fold_operators\n"
+
+_PRECEDENCE_IMPORT_BEFORE = "from pest.state import ParserState\n"
+
+_UNSUPPORTED_IMPORT = "from pest.grammar.exceptions import PestGrammarError\n"
+
+_UNSUPPORTED_IMPORT_AFTER = "from pest.exceptions import PestParsingError\n"
+
+_DISPATCH_IMPORTS = """\
+from pest.grammar.expressions.choice import dispatch_alternatives
+from pest.grammar.expressions.choice import record_failures
+"""
+
+_DISPATCH_IMPORTS_BEFORE = "from pest.pairs import Pair\n"
+
+_PROFILE_IMPORTS = """\
+from pest.profile import ProfileStats
+from pest.profile import profile_rule
+from pest.profile import profiling_state_class
+"""
 
-def generate_module(rules: dict[str, Rule]) -> str:
+_TRACE_IMPORTS = """\
+from pest.trace import Tracer
+from pest.trace import trace_rule
+from pest.trace import tracing_state_class
+"""
+
+
+def generate_module(
+    rules: dict[str, Rule],
+    *,
+    memo_rules: Collection[str] = (),
+    memo_capacity: int | None = DEFAULT_MEMO_CAPACITY,
+    lazy_errors: bool = False,
+    profile: bool = False,
+    trace: bool = False,
+) -> str:
     """Generate the complete Python source code for a parser module.
 
     Args:
         rules: A dictionary mapping rule names to Rule objects.
+        memo_rules: Names of rules to memoize. It is the caller's responsibility
+            to ensure these rules are safe to memoize. See
+            `pest.memo.memoizable_rules()`.
+        memo_capacity: The maximum number of memo entries to keep per parse, or
+            `None` for an unbounded memo table.
+        lazy_errors: If True, only track failures when building an error
+            report, in a second parse of invalid input.
+        profile: If True, wrap every rule with a profiler that records counts
+            and timings in the module-level `profile_stats`. Modules generated
+            without profiling contain no profiling code at all.
+        trace: If True, report rule enter and exit events, terminal failures
+            and restores to a `pest.trace.Tracer` passed to `parse()`. Modules
+            generated without tracing contain no tracing code at all.
 
     Returns:
         The generated Python source code as a string, including all parser
         functions and trivia parsing logic.
     """
     generated_rules = "\n\n".join(
-        generate_rule(name, rules)
+        generate_rule(
+            name,
+            rules,
+            memoize=name in memo_rules,
+            lazy_errors=lazy_errors,
+            profile=profile,
+            trace=trace,
+        )
         for name, rule in rules.items()
         if not isinstance(rule, BuiltInRule) or name == "EOI"
     )
-    return "\n\n".join(
+
+    # A `ParserState` class with checkpoints specialized for this grammar.
+    state_class_name = state_class(rules).__name__
+    prelude = PRELUDE.replace(
+        _STATE_IMPORT, f"{_STATE_IMPORT}from pest.state import {state_class_name}\n"
+    )
+
+    if any(isinstance(rule.expression, Precedence) for rule in rules.values()):
+        prelude = prelude.replace(
+            _PRECEDENCE_IMPORT_BEFORE, _PRECEDENCE_IMPORT + _PRECEDENCE_IMPORT_BEFORE
+        )
+
+    if "raise PestGrammarError(" in generated_rules:
+        prelude = prelude.replace(
+            _UNSUPPORTED_IMPORT_AFTER, _UNSUPPORTED_IMPORT_AFTER + _UNSUPPORTED_IMPORT
+        )
+
+    if "dispatch_alternatives(" in generated_rules:
+        prelude = prelude.replace(
+            _DISPATCH_IMPORTS_BEFORE, _DISPATCH_IMPORTS + _DISPATCH_IMPORTS_BEFORE
+        )
+
+    if profile:
+        prelude = prelude.replace(
+            _PRECEDENCE_IMPORT_BEFORE, _PROFILE_IMPORTS + _PRECEDENCE_IMPORT_BEFORE
+        )
+
+    if trace:
+        prelude = prelude.replace(
+            _PRECEDENCE_IMPORT_BEFORE, _TRACE_IMPORTS + _PRECEDENCE_IMPORT_BEFORE
+        )
+
+    if memo_rules:
+        parts = [
+            prelude.replace(_MEMO_IMPORTS_BEFORE, _MEMO_IMPORTS + _MEMO_IMPORTS_BEFORE),
+            generate_memo_table(memo_rules, memo_capacity),
+        ]
+    else:
+        parts = [prelude]
+
+    # Error reports are built from a parse that isn't profiled or traced.
+    report_state_class_name = state_class_name
+
+    if profile:
+        parts.append(generate_profile_table(state_class_name))
+        state_class_name = f"Profiling{state_class_name}"
+
+    if trace:
+        parts.append(generate_trace_table(state_class_name))
+        state_class_name = f"Tracing{state_class_name}"
+
+    parts.extend(
         [
-            PRELUDE,
             generate_rule_enum(rules),
             generated_rules,
             generate_parse_trivia(rules),
             generate_rule_map(rules),
-            generate_parse_entry_point(),
+            generate_parse_entry_point(
+                memoize=bool(memo_rules),
+                state_class_name=state_class_name,
+                report_state_class_name=report_state_class_name,
+                lazy_errors=lazy_errors,
+                profile=profile,
+                trace=trace,
+            ),
             generate_cli(),
         ]
     )
 
+    return "\n\n".join(parts)
+
+
+def generate_memo_table(memo_rules: Collection[str], capacity: int | None) -> str:
+    """Generate module-level memo table configuration."""
+    gen = Builder()
+    gen.writeln(f"MEMO_RULES = frozenset({sorted(memo_rules)!r})")
+    gen.writeln(f"MEMO_CAPACITY = {capacity!r}")
+    gen.writeln('"""The maximum number of memo entries to keep per parse."""')
+    gen.writeln("")
+    gen.writeln("memo_stats = MemoStats()")
+    gen.writeln('"""Memo hit and miss counts accumulated over all parses."""')
+    return gen.render()
+
+
+def generate_profile_table(state_class_name: str) -> str:
+    """Generate module-level profiling statistics and a profiling state class."""
+    gen = Builder()
+    gen.writeln("profile_stats = ProfileStats()")
+    gen.writeln('"""Per-rule counts and timings accumulated over all parses."""')
+    gen.writeln("")
+    gen.writeln(
+        f"Profiling{state_class_name} = profiling_state_class({state_class_name})"
+    )
+    return gen.render()
+
+
+def generate_trace_table(state_class_name: str) -> str:
+    """Generate a state class that reports failures and restores to its tracer."""
+    gen = Builder()
+    gen.writeln(f"Tracing{state_class_name} = tracing_state_class({state_class_name})")
+    return gen.render()
+
 
-def generate_rule(name: str, rules: dict[str, Rule]) -> str:
+def generate_rule(
+    name: str,
+    rules: dict[str, Rule],
+    *,
+    memoize: bool = False,
+    lazy_errors: bool = False,
+    profile: bool = False,
+    trace: bool = False,
+) -> str:
     """Generate the full parser function for a single grammar rule.
 
     Returns the source of a top-level assignment:
         parse_<rule> = _parse_<rule>()
 
+    Or, if `memoize` is True:
+        parse_<rule> = memoize_rule("<rule>", _parse_<rule>())
+
+    If `profile` is True, `_parse_<rule>()` is wrapped with
+    `profile_rule("<rule>", _parse_<rule>(), profile_stats)` too, inside any
+    memo table lookups. If `trace` is True, it is wrapped with
+    `trace_rule("<rule>", ...)`, outside any profiler.
+
     The generated closure includes:
       - rule-local constants (regexes, tables, etc.)
       - a RuleFrame instance for the rule
@@ -91,12 +279,17 @@ def generate_rule(name: str, rules: dict[str, Rule]) -> str:
     Args:
         name: The name of the rule to generate.
         rules: A dictionary mapping rule names to Rule objects.
+        memoize: If True, wrap the rule's parse function with memo table lookups.
+        lazy_errors: If True, the rule is part of a parser that only tracks
+            failures when building an error report.
+        profile: If True, wrap the rule's parse function with a profiler.
+        trace: If True, wrap the rule's parse function with tracer events.
 
     Returns:
         The generated Python source code for the rule as a string.
     """
     rule = rules[name]
-    inner_gen = Builder(rules)
+    inner_gen = Builder(rules, lazy_errors=lazy_errors)
     pairs_var = "pairs"
     rule.generate(inner_gen, "matched", pairs_var)
 
@@ -125,7 +318,18 @@ def generate_rule(name: str, rules: dict[str, Rule]) -> str:
         gen.writeln("")
 
     # At module scope, instantiate the closure
-    gen.writeln(f"{func_name} = _{func_name}()")
+    func = f"_{func_name}()"
+    if profile:
+        silent = ", silent=True" if rule.modifier & SILENT else ""
+        func = f"profile_rule({rule.name!r}, {func}, profile_stats{silent})"
+
+    if trace:
+        func = f"trace_rule({rule.name!r}, {func})"
+
+    if memoize:
+        gen.writeln(f"{func_name} = memoize_rule({rule.name!r}, {func})")
+    else:
+        gen.writeln(f"{func_name} = {func}")
 
     return gen.render()
 
@@ -229,6 +433,7 @@ _PARSE_DOC = '''\
         start_rule: The name of the rule to start parsing from.
         text: The input string to parse.
         start_pos: The position in the input string to start parsing from (default: 0).
+        arena: If True, record the parse tree in compact parallel arrays.
 
     Returns:
         Pairs: The parse tree as a `Pairs` object.
@@ -239,24 +444,76 @@ _PARSE_DOC = '''\
     """'''
 
 
-def generate_parse_entry_point() -> str:
-    """Generate a `parse` function."""
+def generate_parse_entry_point(
+    *,
+    memoize: bool = False,
+    state_class_name: str = "ParserState",
+    report_state_class_name: str | None = None,
+    lazy_errors: bool = False,
+    profile: bool = False,
+    trace: bool = False,
+) -> str:
+    """Generate a `parse` function.
+
+    Args:
+        memoize: If True, give each parse a new memo table.
+        state_class_name: The name of the `ParserState` class to instantiate.
+        report_state_class_name: The name of the `ParserState` class to
+            instantiate when parsing again to build an error report. Defaults
+            to `state_class_name`.
+        lazy_errors: If True, don't track failures unless parsing fails, in
+            which case the input is parsed again to build an error report.
+        profile: If True, record backtracking in the module-level
+            `profile_stats`.
+        trace: If True, accept a `tracer` argument and report events to it.
+    """
+    tracer_param = ", tracer: Tracer | None = None" if trace else ""
+    tracer_arg = ", tracer=tracer" if trace else ""
+
     gen = Builder()
     gen.writeln(
-        "def parse(start_rule: str, text: str, *, start_pos: int = 0) -> Pairs:"
+        "def parse("
+        "start_rule: str, text: str, *, start_pos: int = 0, arena: bool = False"
+        f"{tracer_param}) -> Pairs:"
     )
 
     gen.writeln(_PARSE_DOC)
 
     with gen.block():
-        gen.writeln("state = ParserState(text, start_pos)")
+        gen.writeln(f"state = {state_class_name}(text, start_pos)")
+        if profile:
+            gen.writeln("state.profile_stats = profile_stats")
+        if trace:
+            gen.writeln("state.tracer = tracer")
+        if memoize:
+            gen.writeln("state.memo = Memo(MEMO_RULES, MEMO_CAPACITY, memo_stats)")
+        if lazy_errors:
+            gen.writeln("state.track_failures = False")
+        gen.writeln("if arena:")
+        with gen.block():
+            gen.writeln("state.arena = Arena(text)")
         gen.writeln("pairs: list[Pair] = []")
         gen.writeln("matched = _RULE_MAP[start_rule](state, pairs)")
 
         gen.writeln("if matched:")
         with gen.block():
+            gen.writeln("if state.arena is not None:")
+            with gen.block():
+                gen.writeln("return state.arena.pairs(pairs)")
             gen.writeln("return Pairs(pairs)")
 
+        if lazy_errors:
+            gen.writeln(
+                "# Parse again, this time tracking failures for the error report."
+            )
+            gen.writeln(
+                f"state = {report_state_class_name or state_class_name}"
+                "(text, start_pos)"
+            )
+            if memoize:
+                gen.writeln("state.memo = Memo(MEMO_RULES, MEMO_CAPACITY, memo_stats)")
+            gen.writeln("_RULE_MAP[start_rule](state, [])")
+
         gen.writeln("raise PestParsingError(state)")
 
     gen.writeln("\nclass Parser:")
@@ -264,14 +521,18 @@ def generate_parse_entry_point() -> str:
         gen.writeln('"""A class wrapping `parse()` in `Parser.parse()`."""')
         gen.writeln(
             "def parse("
-            "self, start_rule: str, text: str, *, start_pos: int = 0"
+            "self, start_rule: str, text: str, *, start_pos: int = 0, "
+            f"arena: bool = False{tracer_param}"
             ") -> Pairs:"
         )
         with gen.block():
             gen.writeln(
                 '"""Parse the given `text` starting from the specified `start_rule`."""'
             )
-            gen.writeln("return parse(start_rule, text, start_pos=start_pos)")
+            gen.writeln(
+                "return parse("
+                f"start_rule, text, start_pos=start_pos, arena=arena{tracer_arg})"
+            )
 
     return gen.render()
 
@@ -0,0 +1,207 @@
+"""Compile grammar expressions into nested Python closures.
+
+This is a third parsing backend, sitting between the tree-walking interpreter
+(`Expression.parse`) and generated source code (`Expression.generate`).
+
+Each expression's `compile` method returns a plain function with the same
+signature as `Expression.parse`. Composite expressions capture the compiled
+functions of their children, rule references are linked directly to the
+function of the rule they reference, and rule modifiers are resolved once at
+compile time rather than on every call.
+
+Expressions that don't override `compile` fall back to their `parse` method, so
+every grammar can be compiled, even if only partially.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from pest.grammar.rule import SILENT
+from pest.memo import memoize_rule
+from pest.profile import profile_rule
+from pest.trace import trace_rule
+
+if TYPE_CHECKING:
+    from collections.abc import Collection
+
+    from pest.memo import ParseFunc
+    from pest.pairs import Pair
+    from pest.profile import ProfileStats
+    from pest.state import ParserState
+
+    from .expression import Expression
+    from .rule import Rule
+
+
+class Compiler:
+    """Compile rules to closures, linking rule references as we go.
+
+    Args:
+        rules: A mapping of rule names to rules, including built-in rules.
+        memo_rules: Names of rules to wrap with memo table lookups.
+        profile_stats: If given, wrap every rule with a profiler that records
+            counts and timings in `profile_stats`.
+        trace: If True, wrap every rule with `enter` and `exit` events for
+            `ParserState.tracer`.
+    """
+
+    __slots__ = (
+        "rules",
+        "memo_rules",
+        "profile_stats",
+        "trace",
+        "_compiled",
+        "_pending",
+        "_trivia",
+    )
+
+    def __init__(
+        self,
+        rules: dict[str, Rule],
+        memo_rules: Collection[str] = (),
+        profile_stats: ProfileStats | None = None,
+        *,
+        trace: bool = False,
+    ):
+        self.rules = rules
+        self.memo_rules = memo_rules
+        self.profile_stats = profile_stats
+        self.trace = trace
+        self._compiled: dict[str, ParseFunc] = {}
+
+        # Forward references for rules that are currently being compiled.
+        self._pending: dict[str, list[ParseFunc]] = {}
+
+        self._trivia: list[ParseFunc] | None = None
+
+    def compile(self, expression: Expression) -> ParseFunc:
+        """Return a function that parses `expression`."""
+        return expression.compile(self)
+
+    def compile_rules(self) -> dict[str, ParseFunc]:
+        """Compile all rules and return a mapping of rule names to functions."""
+        return {name: self.rule(name) for name in self.rules}
+
+    def rule(self, name: str) -> ParseFunc:
+        """Return a function that parses the rule called `name`.
+
+        Recursive references, where a rule refers to itself before it has been
+        compiled, are resolved through a one-item forward reference.
+
+        Raises:
+            KeyError: If `name` is not a rule name.
+        """
+        if func := self._compiled.get(name):
+            return func
+
+        if name in self._pending:
+            forward = self._pending[name]
+
+            def parse_forward(state: ParserState, pairs: list[Pair]) -> bool:
+                return forward[0](state, pairs)
+
+            return parse_forward
+
+        slot: list[ParseFunc] = []
+        self._pending[name] = slot
+        rule = self.rules[name]
+        func = rule.compile(self)
+
+        if self.profile_stats is not None:
+            # Inside memo lookups, so only rules that are actually parsed count.
+            func = profile_rule(
+                name, func, self.profile_stats, silent=bool(rule.modifier & SILENT)
+            )
+
+        if self.trace:
+            func = trace_rule(name, func)
+
+        if name in self.memo_rules:
+            func = memoize_rule(name, func)
+
+        slot.append(func)
+        del self._pending[name]
+        self._compiled[name] = func
+        return func
+
+    def trivia(self) -> ParseFunc:
+        """Return a function that parses implicit whitespace and comments.
+
+        The returned function is equivalent to `ParserState.parse_trivia`.
+        """
+        if self._trivia is not None:
+            if self._trivia:
+                return self._trivia[0]
+
+            # Trivia rules that contain sequences or repetitions need trivia.
+            slot = self._trivia
+
+            def parse_forward(state: ParserState, pairs: list[Pair]) -> bool:
+                return slot[0](state, pairs)
+
+            return parse_forward
+
+        self._trivia = []
+        func = self._compile_trivia()
+        self._trivia.append(func)
+        return func
+
+    def _compile_trivia(self) -> ParseFunc:
+        if "SKIP" in self.rules:
+            parse_skip = self.rule("SKIP")
+
+            def parse_trivia_skip(state: ParserState, pairs: list[Pair]) -> bool:
+                if state.atomic_depth > 0:
+                    return False
+                return parse_skip(state, pairs)
+
+            return parse_trivia_skip
+
+        parse_whitespace = (
+            self.rule("WHITESPACE") if "WHITESPACE" in self.rules else None
+        )
+        parse_comment = self.rule("COMMENT") if "COMMENT" in self.rules else None
+
+        if not parse_whitespace and not parse_comment:
+
+            def parse_no_trivia(state: ParserState, pairs: list[Pair]) -> bool:  # noqa: ARG001
+                return False
+
+            return parse_no_trivia
+
+        def parse_trivia(state: ParserState, pairs: list[Pair]) -> bool:
+            if state.atomic_depth > 0:
+                return False
+
+            children: list[Pair] = []
+            some = False
+
+            with state.suppress_failures():
+                while True:
+                    matched = False
+
+                    if parse_whitespace:
+                        matched = parse_whitespace(state, children)
+                        if matched:
+                            some = True
+                            pairs.extend(children)
+                        children.clear()
+
+                    if parse_comment:
+                        state.checkpoint()
+                        matched = parse_comment(state, children) or matched
+                        if matched:
+                            some = True
+                            pairs.extend(children)
+                            state.ok()
+                        else:
+                            state.restore()
+                        children.clear()
+
+                    if not matched:
+                        break
+
+            return some
+
+        return parse_trivia
@@ -0,0 +1,257 @@
+"""Encode grammar rules to match UTF-8 encoded bytes.
+
+`encode_rules()` returns a copy of a grammar's rules in which every terminal that
+matches characters in a `str` is replaced with a terminal that matches the UTF-8
+encoding of those characters in a `bytes`, `bytearray`, `memoryview` or `mmap`.
+Parsing bytes-like input with encoded rules avoids decoding it into a Python
+string first, and pair spans are byte offsets into the original buffer.
+
+Terminals are matched with bytes regexes, which accept any object supporting the
+buffer protocol. Character ranges and `ANY` match whole UTF-8 sequences, but
+case insensitive literals only fold ASCII letters, and Unicode property rules
+and stack operations (`PUSH`, `PEEK`, `POP`, `DROP`, etc.) are not supported.
+Rules that use them raise a `PestGrammarError` when they are parsed, so other
+rules of the same grammar can still parse bytes.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from typing import TypeAlias
+
+import regex as re
+
+from .exceptions import PestGrammarError
+from .expression import RegexExpression
+from .expressions import AtomicRegex
+from .expressions import ByteRegex
+from .expressions import ByteSkipUntil
+from .expressions import ByteUnsupported
+from .expressions import Choice
+from .expressions import CIString
+from .expressions import DispatchChoice
+from .expressions import Drop
+from .expressions import OptimizedChoice
+from .expressions import OptimizedChoiceRepeat
+from .expressions import Peek
+from .expressions import PeekAll
+from .expressions import PeekSlice
+from .expressions import Pop
+from .expressions import PopAll
+from .expressions import Push
+from .expressions import PushLiteral
+from .expressions import Range
+from .expressions import SkipUntil
+from .expressions import String
+from .expressions.choice import ChoiceCase
+from .expressions.choice import ChoiceLiteral
+from .expressions.choice import ChoiceRange
+from .rule import BuiltInRule
+from .rule import Rule
+from .rules.special import EOI
+from .rules.special import SOI
+from .rules.special import _Any
+from .rules.unicode import UnicodePropertyRule
+
+if TYPE_CHECKING:
+    import mmap
+    from collections.abc import Iterator
+    from collections.abc import Mapping
+
+    from .expression import Expression
+    from .expressions.choice import ChoiceChoice
+
+BytesLike: TypeAlias = "bytes | bytearray | memoryview | mmap.mmap"
+"""Input types accepted by parsers with encoded rules."""
+
+UTF8_CHAR = rb"[\x00-\xff][\x80-\xbf]{0,3}"
+"""A bytes regex pattern matching one UTF-8 encoded character."""
+
+_STACK_EXPRESSIONS = (Drop, Peek, PeekAll, PeekSlice, Pop, PopAll, Push, PushLiteral)
+
+
+def encode_rules(rules: Mapping[str, Rule]) -> dict[str, Rule]:
+    """Return a copy of `rules` that matches UTF-8 encoded bytes-like input.
+
+    Rules that use an expression that can't be encoded are encoded with a
+    `ByteUnsupported` expression, which raises a `PestGrammarError` if the
+    rule is parsed.
+    """
+    encoder = _Encoder()
+    return {name: encoder.rule(rule) for name, rule in rules.items()}
+
+
+class _Encoder:
+    """Encode expressions, sharing encoded built-in rules between rules."""
+
+    def __init__(self) -> None:
+        self.builtins: dict[str, Rule] = {}
+
+    def rule(self, rule: Rule) -> Rule:
+        if isinstance(rule, (SOI, EOI)):
+            # These only compare positions with the length of the input.
+            return rule
+
+        if isinstance(rule, BuiltInRule):
+            if rule.name not in self.builtins:
+                self.builtins[rule.name] = BuiltInRule(
+                    rule.name,
+                    self._rule_expression(rule),
+                    rule.modifier,
+                    rule.doc,
+                )
+            return self.builtins[rule.name]
+
+        return rule.with_children([self._rule_expression(rule)])
+
+    def _rule_expression(self, rule: Rule) -> Expression:
+        try:
+            return self.expression(rule.expression)
+        except PestGrammarError as err:
+            return ByteUnsupported(f"rule {rule.name!r}: {err.message}")
+
+    def expression(self, expr: Expression) -> Expression:  # noqa: PLR0911
+        if isinstance(expr, (UnicodePropertyRule, RegexExpression)):
+            # Regex expressions only come from inlined Unicode property rules.
+            raise PestGrammarError(
+                f"Unicode property rule {expr} is not supported for bytes input"
+            )
+
+        if isinstance(expr, _STACK_EXPRESSIONS):
+            raise PestGrammarError(
+                f"stack operation {expr} is not supported for bytes input"
+            )
+
+        if isinstance(expr, Rule):
+            return self.rule(expr)
+
+        if isinstance(expr, String):
+            return ByteRegex(re.escape(expr.value.encode()), str(expr))
+
+        if isinstance(expr, CIString):
+            return ByteRegex(re.escape(expr.value.encode()), str(expr), re.I)
+
+        if isinstance(expr, Range):
+            return ByteRegex(
+                utf8_range_pattern(expr.start, expr.stop), str(expr), tag=expr.tag
+            )
+
+        if isinstance(expr, OptimizedChoiceRepeat):
+            # Repetitions never fail, so there's nothing to label.
+            return ByteRegex(_choice_pattern(expr.choices, b"*"))
+
+        if isinstance(expr, OptimizedChoice):
+            # Label failures like the alternatives the choice was squashed from.
+            return ByteRegex(
+                _choice_pattern(expr.choices, b""),
+                tuple(_choice_label(choice) for choice in expr.choices),
+            )
+
+        if isinstance(expr, SkipUntil):
+            return ByteSkipUntil([sub.encode() for sub in expr.subs])
+
+        if isinstance(expr, _Any):
+            return ByteRegex(UTF8_CHAR)
+
+        if isinstance(expr, AtomicRegex):
+            # Encode the expression the regex was compiled from.
+            return self.expression(expr.expression)
+
+        if isinstance(expr, DispatchChoice):
+            # Dispatch tables are keyed by characters, not bytes.
+            return Choice(*(self.expression(c) for c in expr.expressions))
+
+        return expr.with_children([self.expression(c) for c in expr.children()])
+
+
+def _choice_pattern(choices: list[ChoiceChoice], repeat: bytes) -> bytes:
+    """Return a bytes regex pattern matching any of `choices`."""
+    parts: list[bytes] = []
+
+    for choice in choices:
+        match choice:
+            case ChoiceLiteral(value=value, case=ChoiceCase.INSENSITIVE):
+                parts.append(b"(?i:" + re.escape(value.encode()) + b")")
+            case ChoiceLiteral(value=value):
+                parts.append(re.escape(value.encode()))
+            case ChoiceRange(start, end):
+                parts.append(utf8_range_pattern(start, end))
+            case _:
+                raise PestGrammarError(
+                    f"Unicode property rule {choice} is not supported for bytes input"
+                )
+
+    return b"(?:" + b"|".join(parts) + b")" + repeat
+
+
+def _choice_label(choice: ChoiceChoice) -> str:
+    """Return the failure label of the expression `choice` was squashed from."""
+    match choice:
+        case ChoiceLiteral(value=value, case=ChoiceCase.INSENSITIVE):
+            return str(CIString(value))
+        case ChoiceLiteral(value=value):
+            return str(String(value))
+        case ChoiceRange(start, end):
+            return str(Range(start, end))
+        case _:
+            return str(choice)
+
+
+def utf8_range_pattern(start: str, stop: str) -> bytes:
+    """Return a bytes regex pattern matching UTF-8 characters `start` to `stop`."""
+    lo, hi = sorted((ord(start), ord(stop)))
+    alternatives = [
+        b"".join(
+            _byte_range(a, b)
+            for a, b in zip(chr(first).encode(), chr(last).encode(), strict=True)
+        )
+        for first, last in _utf8_sequences(lo, hi)
+    ]
+
+    if len(alternatives) == 1:
+        return alternatives[0]
+    return b"(?:" + b"|".join(alternatives) + b")"
+
+
+def _byte_range(a: int, b: int) -> bytes:
+    if a == b:
+        return b"\\x%02x" % a
+    return b"[\\x%02x-\\x%02x]" % (a, b)
+
+
+def _utf8_sequences(lo: int, hi: int) -> Iterator[tuple[int, int]]:
+    """Split code points `lo` to `hi` into ranges with byte-wise UTF-8 ranges.
+
+    The UTF-8 encodings of the code points in each range are exactly the byte
+    sequences with each byte between the corresponding bytes of the encodings
+    of the range's first and last code point.
+    """
+    # Surrogates have no UTF-8 encoding.
+    if lo <= 0xDFFF and hi >= 0xD800:  # noqa: PLR2004
+        if lo < 0xD800:  # noqa: PLR2004
+            yield from _utf8_sequences(lo, 0xD7FF)
+        if hi > 0xDFFF:  # noqa: PLR2004
+            yield from _utf8_sequences(0xE000, hi)
+        return
+
+    # Split at encoded length boundaries.
+    for max_code_point in (0x7F, 0x7FF, 0xFFFF):
+        if lo <= max_code_point < hi:
+            yield from _utf8_sequences(lo, max_code_point)
+            yield from _utf8_sequences(max_code_point + 1, hi)
+            return
+
+    # Split until each trailing byte either varies fully or not at all.
+    for i in range(1, 4):
+        mask = (1 << (6 * i)) - 1
+        if lo & ~mask != hi & ~mask:
+            if lo & mask:
+                yield from _utf8_sequences(lo, lo | mask)
+                yield from _utf8_sequences((lo | mask) + 1, hi)
+                return
+            if hi & mask != mask:
+                yield from _utf8_sequences(lo, (hi & ~mask) - 1)
+                yield from _utf8_sequences(hi & ~mask, hi)
+                return
+
+    yield lo, hi
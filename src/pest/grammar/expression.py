@@ -13,10 +13,12 @@ import regex as re
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+    from pest.memo import ParseFunc
     from pest.pairs import Pair
     from pest.state import ParserState
 
     from .codegen.builder import Builder
+    from .compiler import Compiler
     from .rule import Rule
 
 
@@ -80,6 +82,21 @@ class Expression(ABC):
             expression fails to match.
         """
 
+    def compile(self, compiler: Compiler) -> ParseFunc:  # noqa: ARG002
+        """Return a function that parses this expression.
+
+        This method is the *closure backend* for the expression tree. The
+        returned function has the same signature and semantics as `parse`.
+
+        The default implementation returns the bound `parse` method, which is
+        appropriate for terminals. Expressions with children should override
+        this method and compile their children with `compiler`.
+
+        Args:
+            compiler: Compiles child expressions and resolves rule references.
+        """
+        return self.parse
+
     @abstractmethod
     def children(self) -> list[Expression]:
         """Return this expressions children."""
@@ -1,4 +1,5 @@
 from .choice import Choice
+from .choice import DispatchChoice
 from .choice import OptimizedChoice
 from .choice import OptimizedChoiceRepeat
 from .group import Group
@@ -9,9 +10,14 @@ from .postfix import RepeatMax
 from .postfix import RepeatMin
 from .postfix import RepeatMinMax
 from .postfix import RepeatOnce
+from .precedence import Precedence
 from .prefix import NegativePredicate
 from .prefix import PositivePredicate
 from .sequence import Sequence
+from .terminals import AtomicRegex
+from .terminals import ByteRegex
+from .terminals import ByteSkipUntil
+from .terminals import ByteUnsupported
 from .terminals import CIString
 from .terminals import Drop
 from .terminals import Identifier
@@ -28,9 +34,14 @@ from .terminals import String
 
 __all__ = (
     "Choice",
+    "DispatchChoice",
     "Drop",
     "Group",
     "Sequence",
+    "AtomicRegex",
+    "ByteRegex",
+    "ByteSkipUntil",
+    "ByteUnsupported",
     "CIString",
     "Identifier",
     "Peek",
@@ -44,6 +55,7 @@ __all__ = (
     "SkipUntil",
     "String",
     "PositivePredicate",
+    "Precedence",
     "NegativePredicate",
     "Optional",
     "Repeat",
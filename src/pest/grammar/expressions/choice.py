@@ -16,9 +16,15 @@ from pest.grammar.expression import RegexExpression
 from pest.grammar.rules.unicode import UnicodePropertyRule
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from pest.grammar.codegen.builder import Builder
+    from pest.grammar.compiler import Compiler
+    from pest.grammar.rule import Rule
+    from pest.memo import ParseFunc
     from pest.pairs import Pair
     from pest.state import ParserState
+    from pest.state import RuleFrame
 
 
 class Choice(Expression):
@@ -94,6 +100,25 @@ class Choice(Expression):
 
         gen.writeln("# </Choice>")
 
+    def compile(self, compiler: Compiler) -> ParseFunc:
+        """Return a function that parses this choice."""
+        funcs = [compiler.compile(expr) for expr in self.expressions]
+
+        def parse_choice(state: ParserState, pairs: list[Pair]) -> bool:
+            for func in funcs:
+                state.checkpoint()
+                children: list[Pair] = []
+
+                if func(state, children):
+                    state.ok()
+                    pairs.extend(children)
+                    return True
+
+                state.restore()
+            return False
+
+        return parse_choice
+
     def children(self) -> list[Expression]:
         """Return this expression's children."""
         return self.expressions
@@ -103,6 +128,298 @@ class Choice(Expression):
         return self.__class__(*expressions)
 
 
+FailureLabels: TypeAlias = tuple[tuple[tuple[str, ...], str], ...]
+"""(rule path, label) pairs recorded by an expression that fails immediately.
+
+Rule paths are the names of rules entered, from the current rule, before the
+label was recorded.
+"""
+
+DispatchEntry: TypeAlias = tuple[
+    frozenset[int], frozenset[int], frozenset[int], frozenset[int]
+]
+"""Alternatives to try without tracking failures, to try while tracking failures,
+to record failures for, and all alternatives. Used by generated parsers."""
+
+
+class DispatchChoice(Choice):
+    """A choice that only tries alternatives that can start with the next character.
+
+    Dispatch choices are created by the `dispatch_choice` optimizer pass. `table`
+    maps characters to the indices of alternatives that could match input starting
+    with that character, in order. The end of input and characters missing from
+    `table` use `default`, the alternatives that could match anything.
+
+    Skipped alternatives would fail without consuming input. When failures are
+    being tracked, the labels those alternatives would have recorded are recorded
+    instead, so error messages are the same as for an ordinary choice. Skipped
+    alternatives with unknown labels (`None`) are tried anyway, as are all
+    alternatives while memoizing, because memoized rules don't record failures.
+
+    `with_children()` keeps the dispatch table, so replacement children must match
+    the same input as the originals.
+    """
+
+    __slots__ = ("table", "default", "labels", "_plans", "_default_plan", "_all")
+
+    def __init__(
+        self,
+        *expressions: Expression,
+        table: dict[str, tuple[int, ...]],
+        default: tuple[int, ...],
+        labels: list[FailureLabels | None],
+    ):
+        super().__init__(*expressions)
+        self.table = table
+        self.default = default
+        self.labels = labels
+        self._all = tuple(range(len(expressions)))
+
+        # Alternatives to try, or `~index` of alternatives to record failures for.
+        plans: dict[tuple[int, ...], tuple[int, ...]] = {}
+        self._plans = {
+            key: self._plan(indices, plans) for key, indices in table.items()
+        }
+        self._default_plan = self._plan(default, plans)
+
+    def _plan(
+        self, indices: tuple[int, ...], plans: dict[tuple[int, ...], tuple[int, ...]]
+    ) -> tuple[int, ...]:
+        if indices not in plans:
+            candidates = set(indices)
+            plans[indices] = tuple(
+                i if i in candidates or self.labels[i] is None else ~i
+                for i in self._all
+            )
+        return plans[indices]
+
+    def parse(self, state: ParserState, pairs: list[Pair]) -> bool:
+        """Attempt to match this expression against the input at `start`."""
+        pos = state.pos
+        key = state.input[pos] if pos < len(state.input) else ""
+
+        if not state.track_failures:
+            order = self.table.get(key, self.default)
+        elif state.memo is None:
+            order = self._plans.get(key, self._default_plan)
+        else:
+            order = self._all
+
+        expressions = self.expressions
+        for i in order:
+            if i < 0:
+                record_failures(state, self.labels[~i] or ())
+                continue
+
+            state.checkpoint()
+            children: list[Pair] = []
+
+            if expressions[i].parse(state, children):
+                state.ok()
+                pairs.extend(children)
+                return True
+
+            state.restore()
+        return False
+
+    def generate(self, gen: Builder, matched_var: str, pairs_var: str) -> None:
+        """Emit Python code for a choice that dispatches on the next character.
+
+        Each branch is guarded by a membership test against the alternatives
+        selected for the next character by `dispatch_alternatives()`. Skipped
+        branches record their failure labels if failures are being tracked.
+        """
+        gen.writeln("# <DispatchChoice>")
+
+        table = ", ".join(
+            f"{key!r}: {self._entry(indices)}" for key, indices in self.table.items()
+        )
+        table_var = gen.constant("DISPATCH", f"{{{table}}}")
+        default_var = gen.constant("DISPATCH", self._entry(self.default))
+
+        names = sorted({name for path, _ in self._known_labels() for name in path})
+        frames_var = ""
+        if names:
+            assert gen.rules is not None
+            frames = ", ".join(
+                f"{name!r}: RuleFrame({name!r}, {gen.rules[name].modifier})"
+                for name in names
+            )
+            frames_var = gen.constant("FRAMES", f"{{{frames}}}")
+
+        tmp_pairs = gen.new_temp("children")
+        attempt = gen.new_temp("attempt")
+        replay = gen.new_temp("replay")
+
+        gen.writeln(f"{tmp_pairs}: list[Pair] = []")
+        gen.writeln(f"{matched_var} = False")
+        gen.writeln("if state.pos < len(state.input):")
+        with gen.block():
+            gen.writeln(
+                f"{attempt}, {replay} = dispatch_alternatives(state, "
+                f"{table_var}.get(state.input[state.pos], {default_var}))"
+            )
+        gen.writeln("else:")
+        with gen.block():
+            gen.writeln(
+                f"{attempt}, {replay} = dispatch_alternatives(state, {default_var})"
+            )
+
+        for i, branch in enumerate(self.expressions):
+            gen.writeln(f"if not {matched_var}:")
+            with gen.block():
+                if i in self.default:
+                    # Always tried.
+                    self._generate_branch(
+                        gen, branch, matched_var, pairs_var, tmp_pairs
+                    )
+                    continue
+
+                gen.writeln(f"if {i} in {attempt}:")
+                with gen.block():
+                    self._generate_branch(
+                        gen, branch, matched_var, pairs_var, tmp_pairs
+                    )
+
+                if self.labels[i]:
+                    labels = gen.constant("LABELS", repr(self.labels[i]))
+                    gen.writeln(f"elif {i} in {replay}:")
+                    with gen.block():
+                        frames = f", {frames_var}" if frames_var else ""
+                        gen.writeln(f"record_failures(state, {labels}{frames})")
+
+        gen.writeln("# </DispatchChoice>")
+
+    def _entry(self, indices: tuple[int, ...]) -> str:
+        unknown = [i for i in self._all if self.labels[i] is None]
+        replay = [i for i in self._all if i not in indices and self.labels[i]]
+        return (
+            f"(frozenset({list(indices)!r}), "
+            f"frozenset({sorted({*indices, *unknown})!r}), "
+            f"frozenset({replay!r}), "
+            f"frozenset({list(self._all)!r}))"
+        )
+
+    def _known_labels(self) -> FailureLabels:
+        return tuple(label for labels in self.labels if labels for label in labels)
+
+    def _generate_branch(
+        self,
+        gen: Builder,
+        branch: Expression,
+        matched_var: str,
+        pairs_var: str,
+        tmp_pairs: str,
+    ) -> None:
+        gen.writeln("state.checkpoint()")
+        branch.generate(gen, matched_var, tmp_pairs)
+        gen.writeln(f"if {matched_var}:")
+        with gen.block():
+            gen.writeln("state.ok()")
+            gen.writeln(f"{pairs_var}.extend({tmp_pairs})")
+        gen.writeln("else:")
+        with gen.block():
+            gen.writeln("state.restore()")
+            gen.writeln(f"{tmp_pairs}.clear()")
+
+    def compile(self, compiler: Compiler) -> ParseFunc:
+        """Return a function that parses this choice."""
+        funcs = [compiler.compile(expr) for expr in self.expressions]
+        table = self.table
+        default = self.default
+        plans = self._plans
+        default_plan = self._default_plan
+        every = self._all
+        labels = self.labels
+
+        def parse_dispatch_choice(state: ParserState, pairs: list[Pair]) -> bool:
+            pos = state.pos
+            key = state.input[pos] if pos < len(state.input) else ""
+
+            if not state.track_failures:
+                order = table.get(key, default)
+            elif state.memo is None:
+                order = plans.get(key, default_plan)
+            else:
+                order = every
+
+            for i in order:
+                if i < 0:
+                    record_failures(state, labels[~i] or ())
+                    continue
+
+                state.checkpoint()
+                children: list[Pair] = []
+
+                if funcs[i](state, children):
+                    state.ok()
+                    pairs.extend(children)
+                    return True
+
+                state.restore()
+            return False
+
+        return parse_dispatch_choice
+
+    def with_children(self, expressions: list[Expression]) -> Self:
+        """Return a new instance of this expression with child expressions replaced."""
+        return self.__class__(
+            *expressions, table=self.table, default=self.default, labels=self.labels
+        )
+
+
+_NO_ALTERNATIVES: frozenset[int] = frozenset()
+
+
+def dispatch_alternatives(
+    state: ParserState, entry: DispatchEntry
+) -> tuple[frozenset[int], frozenset[int]]:
+    """Return the alternatives to try and to record failures for.
+
+    Generated parsers call this for each `DispatchChoice` they parse.
+    """
+    quiet, tracked, replay, every = entry
+    if not state.track_failures:
+        return quiet, _NO_ALTERNATIVES
+    if state.memo is not None:
+        return every, _NO_ALTERNATIVES
+    return tracked, replay
+
+
+def record_failures(
+    state: ParserState,
+    labels: FailureLabels,
+    frames: Mapping[str, Rule | RuleFrame] | None = None,
+) -> None:
+    """Record failure `labels` at the current position, as if they were parsed.
+
+    Args:
+        state: The current parser state.
+        labels: Failures recorded by a skipped expression.
+        frames: Rule stack frames for rule names in `labels`. Defaults to the
+            parser's rules.
+    """
+    if state.pos < state.furthest_pos:
+        # Nothing would be recorded.
+        return
+
+    for path, label in labels:
+        if not path:
+            state.fail(label)
+        elif state.pos > state.furthest_pos:
+            # A new furthest failure records the rule stack too.
+            if frames is None:
+                assert state.parser
+                frames = state.parser.rules
+            for name in path:
+                state.rule_stack.push(frames[name])
+            state.fail(label)
+            for _ in path:
+                state.rule_stack.pop()
+        else:
+            state.fail(label, rule_name=path[-1])
+
+
 class ChoiceCase(Enum):
     """Lazy choice regex item case."""
 
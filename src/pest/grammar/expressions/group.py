@@ -9,6 +9,8 @@ from pest.grammar import Expression
 
 if TYPE_CHECKING:
     from pest.grammar.codegen.builder import Builder
+    from pest.grammar.compiler import Compiler
+    from pest.memo import ParseFunc
     from pest.pairs import Pair
     from pest.state import ParserState
 
@@ -61,6 +63,22 @@ class Group(Expression):
 
         gen.writeln("# </Group>")
 
+    def compile(self, compiler: Compiler) -> ParseFunc:
+        """Return a function that parses this group."""
+        func = compiler.compile(self.expression)
+
+        if not self.tag:
+            # An untagged group is just its expression.
+            return func
+
+        tag = self.tag
+
+        def parse_tagged_group(state: ParserState, pairs: list[Pair]) -> bool:
+            with state.tag(tag):
+                return func(state, pairs)
+
+        return parse_tagged_group
+
     def children(self) -> list[Expression]:
         """Return this expression's children."""
         return [self.expression]
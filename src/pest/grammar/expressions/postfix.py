@@ -9,6 +9,8 @@ from pest.grammar import Expression
 
 if TYPE_CHECKING:
     from pest.grammar.codegen.builder import Builder
+    from pest.grammar.compiler import Compiler
+    from pest.memo import ParseFunc
     from pest.pairs import Pair
     from pest.state import ParserState
 
@@ -64,6 +66,22 @@ class Optional(Expression):
         gen.writeln(f"{matched_var} = True")
         gen.writeln("# </Optional>")
 
+    def compile(self, compiler: Compiler) -> ParseFunc:
+        """Return a function that parses this optional expression."""
+        func = compiler.compile(self.expression)
+
+        def parse_optional(state: ParserState, pairs: list[Pair]) -> bool:
+            children: list[Pair] = []
+            state.checkpoint()
+            if func(state, children):
+                state.ok()
+                pairs.extend(children)
+                return True
+            state.restore()
+            return True
+
+        return parse_optional
+
     def children(self) -> list[Expression]:
         """Return this expression's children."""
         return [self.expression]
@@ -147,6 +165,31 @@ class Repeat(Expression):
 
         gen.writeln("# </Repeat>")
 
+    def compile(self, compiler: Compiler) -> ParseFunc:
+        """Return a function that parses this repetition."""
+        func = compiler.compile(self.expression)
+        parse_trivia = compiler.trivia()
+
+        def parse_repeat(state: ParserState, pairs: list[Pair]) -> bool:
+            children: list[Pair] = []
+
+            while True:
+                state.checkpoint()
+
+                if not func(state, children):
+                    state.restore()
+                    break
+
+                state.ok()
+                pairs.extend(children)
+                children.clear()
+                parse_trivia(state, children)
+
+            # Always succeed.
+            return True
+
+        return parse_repeat
+
     def children(self) -> list[Expression]:
         """Return this expression's children."""
         return [self.expression]
@@ -252,6 +295,38 @@ class RepeatOnce(Expression):
 
         gen.writeln("# </RepeatOnce>")
 
+    def compile(self, compiler: Compiler) -> ParseFunc:
+        """Return a function that parses this repetition."""
+        func = compiler.compile(self.expression)
+        parse_trivia = compiler.trivia()
+
+        def parse_repeat_once(state: ParserState, pairs: list[Pair]) -> bool:
+            state.checkpoint()
+            children: list[Pair] = []
+
+            if not func(state, children):
+                state.restore()
+                return False
+
+            state.ok()
+            pairs.extend(children)
+            children.clear()
+
+            while True:
+                state.checkpoint()
+                parse_trivia(state, children)
+                if not func(state, children):
+                    state.restore()
+                    break
+
+                state.ok()
+                pairs.extend(children)
+                children.clear()
+
+            return True
+
+        return parse_repeat_once
+
     def children(self) -> list[Expression]:
         """Return this expression's children."""
         return [self.expression]
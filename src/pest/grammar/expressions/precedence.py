@@ -0,0 +1,93 @@
+"""An expression with operator precedence applied to its children."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from typing import Self
+
+from pest.grammar import Expression
+from pest.precedence import fold_operators
+
+if TYPE_CHECKING:
+    from pest.grammar.codegen.builder import Builder
+    from pest.grammar.compiler import Compiler
+    from pest.memo import ParseFunc
+    from pest.pairs import Pair
+    from pest.precedence import Operators
+    from pest.state import ParserState
+
+
+class Precedence(Expression):
+    """Fold a rule's flat list of operands and operators into nested pairs.
+
+    There's no pest syntax for this expression. It wraps the expression of a
+    rule given an operator table with `Parser(..., operators=...)`. See
+    `pest.precedence`.
+    """
+
+    __slots__ = ("expression", "operators")
+
+    def __init__(self, expression: Expression, operators: Operators):
+        super().__init__(None)
+        self.expression = expression
+        self.operators = operators
+
+    def __str__(self) -> str:
+        return str(self.expression)
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, Precedence)
+            and self.expression == other.expression
+            and self.operators == other.operators
+        )
+
+    def parse(self, state: ParserState, pairs: list[Pair]) -> bool:
+        """Try to parse the expression, then fold its children by precedence."""
+        children: list[Pair] = []
+
+        if not self.expression.parse(state, children):
+            return False
+
+        # The enclosing rule is on top of the rule stack.
+        return fold_operators(
+            state, state.rule_stack[-1], self.operators.ops, children, pairs
+        )
+
+    def generate(self, gen: Builder, matched_var: str, pairs_var: str) -> None:
+        """Emit Python source code that implements this grammar expression."""
+        gen.writeln("# <Precedence>")
+        ops = gen.constant("ops", repr(self.operators.ops))
+        children = gen.new_temp("children")
+        gen.writeln(f"{children}: list[Pair] = []")
+        self.expression.generate(gen, matched_var, children)
+
+        # `rule_frame` is defined in the closure by `generate_rule`.
+        gen.writeln(f"if {matched_var}:")
+        with gen.block():
+            gen.writeln(
+                f"{matched_var} = fold_operators("
+                f"state, rule_frame, {ops}, {children}, {pairs_var})"
+            )
+        gen.writeln("# </Precedence>")
+
+    def compile(self, compiler: Compiler) -> ParseFunc:
+        """Return a function that parses this expression."""
+        func = compiler.compile(self.expression)
+        ops = self.operators.ops
+
+        def parse_precedence(state: ParserState, pairs: list[Pair]) -> bool:
+            children: list[Pair] = []
+            if not func(state, children):
+                return False
+            return fold_operators(state, state.rule_stack[-1], ops, children, pairs)
+
+        return parse_precedence
+
+    def children(self) -> list[Expression]:
+        """Return this expression's children."""
+        return [self.expression]
+
+    def with_children(self, expressions: list[Expression]) -> Self:
+        """Return a new instance of this expression with child expressions replaced."""
+        return self.__class__(expressions[0], self.operators)
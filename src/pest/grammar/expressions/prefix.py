@@ -11,6 +11,8 @@ from pest.grammar.rule import Rule
 
 if TYPE_CHECKING:
     from pest.grammar.codegen.builder import Builder
+    from pest.grammar.compiler import Compiler
+    from pest.memo import ParseFunc
     from pest.pairs import Pair
     from pest.state import ParserState
 
@@ -63,6 +65,18 @@ class PositivePredicate(Expression):
 
         gen.writeln("# </PositivePredicate>")
 
+    def compile(self, compiler: Compiler) -> ParseFunc:
+        """Return a function that parses this positive predicate."""
+        func = compiler.compile(self.expression)
+
+        def parse_positive_predicate(state: ParserState, pairs: list[Pair]) -> bool:  # noqa: ARG001
+            state.checkpoint()
+            matched = func(state, [])
+            state.restore()
+            return matched
+
+        return parse_positive_predicate
+
     def children(self) -> list[Expression]:
         """Return this expression's children."""
         return [self.expression]
@@ -99,7 +113,7 @@ class NegativePredicate(Expression):
         matched = self.expression.parse(state, [])
         state.restore()
 
-        if matched:
+        if matched and state.track_failures:
             # If self.expression is a rule, by now it has been popped off the stack.
             if isinstance(self.expression, Identifier):
                 failed_rule_name = self.expression.value
@@ -153,6 +167,37 @@ class NegativePredicate(Expression):
         gen.writeln("state.neg_pred_depth -= 1")
         gen.writeln("# </NegativePredicate>")
 
+    def compile(self, compiler: Compiler) -> ParseFunc:
+        """Return a function that parses this negative predicate."""
+        # Resolve the failure label once, rather than every time we fail.
+        if isinstance(self.expression, Identifier):
+            if self.expression.value not in compiler.rules:
+                return self.parse
+            failed_rule_name: str | None = self.expression.value
+            label = str(compiler.rules[self.expression.value].expression)
+        elif isinstance(self.expression, Rule):
+            failed_rule_name = self.expression.name
+            label = str(self.expression.expression)
+        else:
+            failed_rule_name = None
+            label = str(self.expression)
+
+        func = compiler.compile(self.expression)
+
+        def parse_negative_predicate(state: ParserState, pairs: list[Pair]) -> bool:  # noqa: ARG001
+            state.checkpoint()
+            state.neg_pred_depth += 1
+            matched = func(state, [])
+            state.restore()
+
+            if matched:
+                state.fail(label, rule_name=failed_rule_name, force=True)
+
+            state.neg_pred_depth -= 1
+            return not matched
+
+        return parse_negative_predicate
+
     def children(self) -> list[Expression]:
         """Return this expression's children."""
         return [self.expression]
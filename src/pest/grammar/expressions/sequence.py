@@ -9,6 +9,8 @@ from pest.grammar import Expression
 
 if TYPE_CHECKING:
     from pest.grammar.codegen.builder import Builder
+    from pest.grammar.compiler import Compiler
+    from pest.memo import ParseFunc
     from pest.pairs import Pair
     from pest.state import ParserState
 
@@ -84,6 +86,30 @@ class Sequence(Expression):
         gen.writeln(f"{matched_var} = {all_ok}")
         gen.writeln("# </Sequence>")
 
+    def compile(self, compiler: Compiler) -> ParseFunc:
+        """Return a function that parses this sequence."""
+        if not self.expressions:
+            return self.parse
+
+        first, *rest = [compiler.compile(expr) for expr in self.expressions]
+        parse_trivia = compiler.trivia()
+
+        def parse_sequence(state: ParserState, pairs: list[Pair]) -> bool:
+            children: list[Pair] = []
+
+            if not first(state, children):
+                return False
+
+            for func in rest:
+                parse_trivia(state, children)
+                if not func(state, children):
+                    return False
+
+            pairs.extend(children)
+            return True
+
+        return parse_sequence
+
     def children(self) -> list[Expression]:
         """Return this expression's children."""
         return self.expressions
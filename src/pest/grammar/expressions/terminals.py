@@ -8,12 +8,15 @@ from typing import Self
 
 import regex as re
 
+from pest.grammar.exceptions import PestGrammarError
 from pest.grammar.expression import Expression
 from pest.grammar.expression import Terminal
 
 if TYPE_CHECKING:
     from pest.grammar.codegen.builder import Builder
+    from pest.grammar.compiler import Compiler
     from pest.grammar.rule import Rule
+    from pest.memo import ParseFunc
     from pest.pairs import Pair
     from pest.state import ParserState
 
@@ -453,6 +456,25 @@ class Identifier(Expression):
 
         gen.writeln("# </Identifier>")
 
+    def compile(self, compiler: Compiler) -> ParseFunc:
+        """Return the compiled function of the rule this identifier refers to."""
+        if self.value not in compiler.rules:
+            # Fail at parse time, like the interpreter.
+            return self.parse
+
+        func = compiler.rule(self.value)
+
+        if not self.tag:
+            return func
+
+        tag = self.tag
+
+        def parse_tagged_identifier(state: ParserState, pairs: list[Pair]) -> bool:
+            with state.tag(tag):
+                return func(state, pairs)
+
+        return parse_tagged_identifier
+
     def children(self) -> list[Expression]:
         """Return this expression's children."""
         return []
@@ -588,7 +610,7 @@ class Range(Terminal):
         gen.writeln("# <Range>")
 
         pattern = rf"[{re.escape(self.start)}-{re.escape(self.stop)}]"
-        re_var = gen.constant("RE", f"re.compile({pattern!r}, re.I)")
+        re_var = gen.constant("RE", f"re.compile({pattern!r})")
 
         gen.writeln(f"if match := {re_var}.match(state.input, state.pos):")
         with gen.block():
@@ -681,3 +703,228 @@ class SkipUntil(Terminal):
 
         gen.writeln(f"{matched_var} = True")
         gen.writeln("# </SkipUntil>")
+
+
+class AtomicRegex(Expression):
+    """A regular expression compiled from an expression in an atomic rule.
+
+    The regex is always tried first. If it doesn't match and failures are being
+    tracked, `expression` is parsed instead, to record the failures the regex
+    can't report. A successful match records no failures, so errors at or
+    after a token matched by the regex are reported at the rule level, not
+    from inside the token.
+
+    See `pest.grammar.optimizers.atomic_regex`.
+
+    Attributes:
+        pattern: A regex pattern matching the same input as `expression`.
+        expression: The expression this terminal replaces.
+    """
+
+    __slots__ = ("pattern", "expression", "_re")
+
+    def __init__(self, pattern: str, expression: Expression):
+        super().__init__(None)
+        self.pattern = pattern
+        self.expression = expression
+        self._re = re.compile(pattern, re.VERSION1)
+
+    def __str__(self) -> str:
+        # Failure labels for predicates use the original expression.
+        return str(self.expression)
+
+    def parse(self, state: ParserState, pairs: list[Pair]) -> bool:  # noqa: D102
+        if match := self._re.match(state.input, state.pos):
+            state.pos = match.end()
+            return True
+        if state.track_failures:
+            return self.expression.parse(state, pairs)
+        return False
+
+    def generate(self, gen: Builder, matched_var: str, pairs_var: str) -> None:
+        """Emit Python code for a compiled atomic expression."""
+        gen.writeln("# <AtomicRegex>")
+
+        re_var = gen.constant("RE", f"re.compile({self.pattern!r}, re.VERSION1)")
+
+        gen.writeln(f"if match := {re_var}.match(state.input, state.pos):")
+        with gen.block():
+            gen.writeln("state.pos = match.end()")
+            gen.writeln(f"{matched_var} = True")
+        gen.writeln("elif state.track_failures:")
+        with gen.block():
+            self.expression.generate(gen, matched_var, pairs_var)
+        gen.writeln("else:")
+        with gen.block():
+            gen.writeln(f"{matched_var} = False")
+
+        gen.writeln("# </AtomicRegex>")
+
+    def compile(self, compiler: Compiler) -> ParseFunc:
+        """Return a function that parses this expression."""
+        match = self._re.match
+        parse_expression = compiler.compile(self.expression)
+
+        def parse_atomic_regex(state: ParserState, pairs: list[Pair]) -> bool:
+            if m := match(state.input, state.pos):
+                state.pos = m.end()
+                return True
+            if state.track_failures:
+                return parse_expression(state, pairs)
+            return False
+
+        return parse_atomic_regex
+
+    def children(self) -> list[Expression]:
+        """Return this expression's children."""
+        return [self.expression]
+
+    def with_children(self, expressions: list[Expression]) -> Self:
+        """Return a new instance of this expression with child expressions replaced."""
+        return self.__class__(self.pattern, expressions[0])
+
+
+class ByteRegex(Terminal):
+    """A terminal matching a bytes regex against bytes-like input.
+
+    Byte terminals replace string terminals when a grammar is encoded to parse
+    UTF-8 encoded `bytes`, `bytearray`, `memoryview` or `mmap` input. See
+    `pest.grammar.encode`.
+
+    Args:
+        pattern: A bytes regex pattern.
+        label: The string representation of the expression this terminal
+            replaces, or a tuple of them for each alternative of a choice it
+            replaces, used when recording failures. If `None`, failures are
+            not recorded, like the expression being replaced.
+        flags: Regex flags.
+        tag: Optional tag for this node.
+    """
+
+    __slots__ = ("pattern", "label", "labels", "flags", "_re")
+
+    def __init__(
+        self,
+        pattern: bytes,
+        label: str | tuple[str, ...] | None = None,
+        flags: int = 0,
+        tag: str | None = None,
+    ):
+        super().__init__(tag)
+        self.pattern = pattern
+        self.label = label
+        self.labels = (label,) if isinstance(label, str) else label or ()
+        self.flags = flags
+        self._re = re.compile(pattern, flags)
+
+    def __str__(self) -> str:
+        return " | ".join(self.labels) or f"{self.tag_str()}/{self.pattern!r}/"
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, ByteRegex)
+            and self.pattern == other.pattern
+            and self.flags == other.flags
+        )
+
+    def parse(self, state: ParserState, pairs: list[Pair]) -> bool:  # noqa: D102
+        # The input is bytes-like when parsing with encoded rules.
+        if match := self._re.match(state.input, state.pos):  # type: ignore[arg-type]
+            state.pos = match.end()
+            return True
+        for label in self.labels:
+            state.fail(label)
+        return False
+
+    def generate(self, gen: Builder, matched_var: str, pairs_var: str) -> None:
+        """Emit Python code for a bytes regex."""
+        gen.writeln("# <ByteRegex>")
+
+        re_var = gen.constant("RE", f"re.compile({self.pattern!r}, {self.flags})")
+
+        gen.writeln(f"if match := {re_var}.match(state.input, state.pos):")
+        with gen.block():
+            gen.writeln("state.pos = match.end()")
+            gen.writeln(f"{matched_var} = True")
+        gen.writeln("else:")
+        with gen.block():
+            gen.writeln(f"{matched_var} = False")
+            for label in self.labels:
+                gen.writeln(f"state.fail({label!r})")
+
+        gen.writeln("# </ByteRegex>")
+
+
+class ByteSkipUntil(Terminal):
+    """A `SkipUntil` for bytes-like input.
+
+    Attributes:
+        subs: The list of byte strings that terminate the match.
+    """
+
+    __slots__ = ("subs", "_re")
+
+    def __init__(self, subs: list[bytes]):
+        super().__init__(tag=None)
+        self.subs = subs
+        self._re = re.compile(b"|".join(re.escape(sub) for sub in subs))
+
+    def __str__(self) -> str:
+        _subs = [repr(s.decode())[1:-1] for s in self.subs]
+        strings = " | ".join(f'"{s}"' for s in _subs)
+        return f"(!({strings}) ~ ANY)*"
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, ByteSkipUntil) and other.subs == self.subs
+
+    def parse(self, state: ParserState, pairs: list[Pair]) -> bool:  # noqa: D102
+        if match := self._re.search(state.input, state.pos):  # type: ignore[arg-type]
+            state.pos = match.start()
+        else:
+            state.pos = len(state.input)
+        return True
+
+    def generate(self, gen: Builder, matched_var: str, pairs_var: str) -> None:
+        """Emit Python code for an optimized rep/neg-pred/any expression."""
+        gen.writeln("# <ByteSkipUntil>")
+
+        re_var = gen.constant("RE", f"re.compile({self._re.pattern!r})")
+
+        gen.writeln(f"if match := {re_var}.search(state.input, state.pos):")
+        with gen.block():
+            gen.writeln("state.pos = match.start()")
+        gen.writeln("else:")
+        with gen.block():
+            gen.writeln("state.pos = len(state.input)")
+
+        gen.writeln(f"{matched_var} = True")
+        gen.writeln("# </ByteSkipUntil>")
+
+
+class ByteUnsupported(Terminal):
+    """A placeholder for an expression that can't be encoded to match bytes.
+
+    Encoded rules that use stack operations or Unicode property rules match
+    this terminal instead, which raises a `PestGrammarError` when parsed. So
+    bytes-like input can be parsed with any start rule that doesn't reach
+    them. See `pest.grammar.encode`.
+
+    Attributes:
+        message: The error message.
+    """
+
+    __slots__ = ("message",)
+
+    def __init__(self, message: str):
+        super().__init__(tag=None)
+        self.message = message
+
+    def __str__(self) -> str:
+        return f"<{self.message}>"
+
+    def parse(self, state: ParserState, pairs: list[Pair]) -> bool:  # noqa: D102
+        raise PestGrammarError(self.message)
+
+    def generate(self, gen: Builder, matched_var: str, pairs_var: str) -> None:
+        """Emit Python code that raises a `PestGrammarError`."""
+        gen.writeln(f"raise PestGrammarError({self.message!r})")
@@ -16,8 +16,14 @@ from pest.grammar import Rule
 from pest.grammar.expressions import OptimizedChoiceRepeat
 from pest.grammar.rule import SILENT
 from pest.grammar.rule import SILENT_ATOMIC
+from pest.grammar.rule import BuiltInRule
 
 from .expression import Expression
+from .optimizers.atomic_regex import atomic_regex
+from .optimizers.atomic_regex import compound_regex
+from .optimizers.atomic_regex import is_atomic_rule
+from .optimizers.atomic_regex import is_compound_rule
+from .optimizers.dispatch import dispatch_choice
 from .optimizers.inliners import inline_builtin
 from .optimizers.inliners import inline_silent_rules
 from .optimizers.skippers import skip
@@ -27,6 +33,7 @@ from .optimizers.unroller import unroll
 
 OptimizerPass: TypeAlias = Callable[[Expression, Mapping[str, Rule]], Expression]
 OptimizerPassPredicate: TypeAlias = Callable[[Mapping[str, Rule]], bool]
+OptimizerRuleFilter: TypeAlias = Callable[[Rule], bool]
 
 
 class PassDirection(Enum):
@@ -50,6 +57,8 @@ class OptimizerStep:
         predicate: If not `None`, the predicate is called with the rules to
             be optimized as its only argument. The step will be skipped if the
             predicate returns `False`.
+        rule_filter: If not `None`, the step is only applied to rules for which
+            `rule_filter` returns `True`.
 
     """
 
@@ -58,6 +67,7 @@ class OptimizerStep:
     direction: PassDirection
     fixed_point: bool = False
     predicate: OptimizerPassPredicate | None = None
+    rule_filter: OptimizerRuleFilter | None = None
 
 
 DEFAULT_OPTIMIZER_PASSES = [
@@ -66,6 +76,19 @@ DEFAULT_OPTIMIZER_PASSES = [
     OptimizerStep("inline built-in", inline_builtin, PassDirection.PREORDER),
     OptimizerStep("squash_choice", squash_choice, PassDirection.POSTORDER),
     OptimizerStep("inline silent", inline_silent_rules, PassDirection.POSTORDER),
+    OptimizerStep(
+        "atomic regex",
+        atomic_regex,
+        PassDirection.POSTORDER,
+        rule_filter=is_atomic_rule,
+    ),
+    OptimizerStep(
+        "compound regex",
+        compound_regex,
+        PassDirection.POSTORDER,
+        rule_filter=is_compound_rule,
+    ),
+    OptimizerStep("dispatch choice", dispatch_choice, PassDirection.POSTORDER),
 ]
 
 
@@ -95,7 +118,13 @@ class Optimizer:
                 continue
 
             for name, rule in rules.items():
-                # TODO: some passes should only be applied to atomic rules
+                if isinstance(rule, BuiltInRule):
+                    # Built-in rules are shared by all parsers.
+                    continue
+
+                if step.rule_filter and not step.rule_filter(rule):
+                    continue
+
                 expr = rule.expression
 
                 if step.fixed_point:
@@ -0,0 +1,246 @@
+"""Compile regular expressions in atomic rules to a single regex.
+
+Atomic rules don't skip implicit whitespace or comments, so a sequence of
+terminals, choices, options and repetitions inside an atomic rule describes a
+regular language. The `atomic_regex` and `compound_regex` passes translate such
+expressions to one compiled regex, so a token like
+
+```
+number = @{ ASCII_DIGIT+ ~ ("." ~ ASCII_DIGIT+)? ~ (^"e" ~ ASCII_DIGIT+)? }
+```
+
+is matched with a single call to `match()` instead of one call to `parse()` per
+expression and character.
+
+PEG choices never backtrack into an alternative that has matched, and PEG
+repetitions always match as many times as possible. So choices become atomic
+groups and repetitions become possessive quantifiers.
+
+Inside `@` rules, identifiers are inlined because their pairs are discarded
+anyway. Inside `$` rules, only expressions without identifiers are compiled.
+
+A regex can't report the failures its expression would have recorded, so when
+the regex doesn't match and failures are being tracked, the original
+expression is parsed to record them. See `AtomicRegex`.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import regex as re
+
+from pest.grammar import Choice
+from pest.grammar import CIString
+from pest.grammar import Group
+from pest.grammar import Identifier
+from pest.grammar import Optional
+from pest.grammar import Range
+from pest.grammar import Repeat
+from pest.grammar import RepeatOnce
+from pest.grammar import Rule
+from pest.grammar import Sequence
+from pest.grammar import SkipUntil
+from pest.grammar import String
+from pest.grammar.expression import RegexExpression
+from pest.grammar.expressions import AtomicRegex
+from pest.grammar.expressions import NegativePredicate
+from pest.grammar.expressions import PositivePredicate
+from pest.grammar.expressions.choice import OptimizedChoice
+from pest.grammar.rule import ATOMIC
+from pest.grammar.rule import COMPOUND
+from pest.grammar.rule import NONATOMIC
+from pest.grammar.rules.special import _EOI
+from pest.grammar.rules.special import _SOI
+from pest.grammar.rules.special import _Any
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from pest.grammar import Expression
+
+# Expressions worth replacing with a regex. Terminals are already matched with
+# a single call, and groups are compiled as part of their parent.
+_COMPOSITE = (
+    Choice,
+    NegativePredicate,
+    Optional,
+    PositivePredicate,
+    Repeat,
+    RepeatOnce,
+    Sequence,
+)
+
+
+def is_atomic_rule(rule: Rule) -> bool:
+    """Return `True` if `rule` has the `@` modifier."""
+    return bool(rule.modifier & ATOMIC)
+
+
+def is_compound_rule(rule: Rule) -> bool:
+    """Return `True` if `rule` is atomic but keeps its children.
+
+    That is rules with the `$` modifier, and `COMMENT` and `WHITESPACE`, which
+    are always atomic.
+    """
+    return not rule.modifier & ATOMIC and (
+        bool(rule.modifier & COMPOUND) or rule.name in ("COMMENT", "WHITESPACE")
+    )
+
+
+def atomic_regex(expr: Expression, rules: Mapping[str, Rule]) -> Expression:
+    """Replace a regular expression in an `@` rule with a single regex.
+
+    Identifiers are inlined. Only apply this pass to rules where
+    `is_atomic_rule` is `True`.
+    """
+    return _compile(expr, rules, inline=True)
+
+
+def compound_regex(expr: Expression, rules: Mapping[str, Rule]) -> Expression:
+    """Replace a regular expression without identifiers with a single regex.
+
+    Only apply this pass to rules where `is_compound_rule` is `True`.
+    """
+    return _compile(expr, rules, inline=False)
+
+
+def _compile(
+    expr: Expression, rules: Mapping[str, Rule], *, inline: bool
+) -> Expression:
+    if not isinstance(expr, _COMPOSITE):
+        return expr
+
+    pattern = _Translator(rules, inline=inline).pattern(expr)
+    if pattern is None:
+        return expr
+
+    # Keep one regex for the outermost expression only, so parsing the original
+    # expression doesn't go through a regex terminal at every level.
+    return AtomicRegex(pattern, expr.map_bottom_up(_original))
+
+
+def _original(expr: Expression) -> Expression:
+    if isinstance(expr, AtomicRegex):
+        return expr.expression
+    return expr
+
+
+class _Translator:
+    """Translate expressions to regex patterns with PEG semantics.
+
+    Every pattern returned by `pattern()` matches in at most one way, so it is
+    never backtracked into.
+    """
+
+    def __init__(self, rules: Mapping[str, Rule], *, inline: bool):
+        self.rules = rules
+        self.inline = inline
+        self._stack: list[str] = []
+
+    def pattern(self, expr: Expression) -> str | None:  # noqa: PLR0911, PLR0912
+        """Return a regex pattern for `expr`, or `None` if it is not regular."""
+        if expr.tag:
+            return None
+
+        if isinstance(expr, String):
+            return re.escape(expr.value)
+
+        if isinstance(expr, CIString):
+            # Simple case folding, like `CIString`.
+            return f"(?i-f:{re.escape(expr.value)})"
+
+        if isinstance(expr, Range):
+            return f"[{re.escape(expr.start)}-{re.escape(expr.stop)}]"
+
+        if isinstance(expr, _Any):
+            return "(?s:.)"
+
+        if isinstance(expr, _SOI):
+            return r"\A"
+
+        if isinstance(expr, _EOI):
+            return r"\Z"
+
+        if isinstance(expr, AtomicRegex):
+            return expr.pattern
+
+        if isinstance(expr, OptimizedChoice):
+            return f"(?>{expr.pattern.pattern})"
+
+        if isinstance(expr, RegexExpression):
+            return f"(?>{expr.pattern})"
+
+        if isinstance(expr, SkipUntil):
+            return _skip_until(expr.subs)
+
+        if isinstance(expr, Identifier):
+            return self._rule(expr.value)
+
+        if isinstance(expr, Rule):
+            if self.rules.get(expr.name) is not expr:
+                return None
+            return self._rule(expr.name)
+
+        if isinstance(expr, Sequence):
+            items = [self.pattern(item) for item in expr.expressions]
+            if any(item is None for item in items):
+                return None
+            return "".join(items)  # type: ignore[arg-type]
+
+        if isinstance(expr, Choice):
+            alternatives = [self.pattern(alt) for alt in expr.expressions]
+            if any(alt is None for alt in alternatives):
+                return None
+            return f"(?>{'|'.join(alternatives)})"  # type: ignore[arg-type]
+
+        if isinstance(expr, Group):
+            return self.pattern(expr.expression)
+
+        inner = self.pattern(expr.children()[0]) if expr.children() else None
+        if inner is None:
+            return None
+
+        if isinstance(expr, Optional):
+            return f"(?:{inner})?+"
+
+        if isinstance(expr, Repeat):
+            return f"(?:{inner})*+"
+
+        if isinstance(expr, RepeatOnce):
+            return f"(?:{inner})++"
+
+        if isinstance(expr, PositivePredicate):
+            return f"(?={inner})"
+
+        if isinstance(expr, NegativePredicate):
+            return f"(?!{inner})"
+
+        return None
+
+    def _rule(self, name: str) -> str | None:
+        rule = self.rules.get(name)
+        if (
+            not self.inline
+            or rule is None
+            or rule.modifier & NONATOMIC
+            or name in self._stack
+        ):
+            return None
+
+        self._stack.append(name)
+        try:
+            return self.pattern(rule.expression)
+        finally:
+            self._stack.pop()
+
+
+def _skip_until(subs: list[str]) -> str:
+    if "" in subs:
+        return ""
+    if all(len(sub) == 1 for sub in subs):
+        if not subs:
+            return "(?s:.)*+"
+        return f"[^{''.join(re.escape(sub) for sub in subs)}]*+"
+    alternatives = "|".join(re.escape(sub) for sub in subs)
+    return f"(?:(?!{alternatives})(?s:.))*+"
@@ -0,0 +1,348 @@
+"""Dispatch choices on the next character of input.
+
+An ordinary choice tries each of its alternatives in turn. For a choice between
+many keywords, most of those alternatives fail on the first character. The
+`dispatch_choice` pass computes the set of characters each alternative can
+start with, following identifiers into the rules they refer to, and replaces
+the choice with a `DispatchChoice` that only tries alternatives that could
+match the next character, still in their original order.
+
+```
+keyword = { select | from | where | ... }
+select  = { ^"select" ~ !ASCII_ALPHA }
+```
+
+Alternatives that can match without consuming input, or that start with
+something we can't analyze (`ANY`, `PEEK`, Unicode property rules, etc.), are
+always tried.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from typing import NamedTuple
+
+from pest.grammar import Choice
+from pest.grammar import CIString
+from pest.grammar import Group
+from pest.grammar import Identifier
+from pest.grammar import Optional
+from pest.grammar import Range
+from pest.grammar import Repeat
+from pest.grammar import RepeatExact
+from pest.grammar import RepeatMax
+from pest.grammar import RepeatMin
+from pest.grammar import RepeatMinMax
+from pest.grammar import RepeatOnce
+from pest.grammar import Rule
+from pest.grammar import Sequence
+from pest.grammar import String
+from pest.grammar.expressions import AtomicRegex
+from pest.grammar.expressions import Drop
+from pest.grammar.expressions import NegativePredicate
+from pest.grammar.expressions import PositivePredicate
+from pest.grammar.expressions import Precedence
+from pest.grammar.expressions import Push
+from pest.grammar.expressions import PushLiteral
+from pest.grammar.expressions.choice import ChoiceCase
+from pest.grammar.expressions.choice import ChoiceLiteral
+from pest.grammar.expressions.choice import ChoiceRange
+from pest.grammar.expressions.choice import DispatchChoice
+from pest.grammar.expressions.choice import OptimizedChoice
+from pest.grammar.expressions.choice import OptimizedChoiceRepeat
+from pest.grammar.rules.special import _EOI
+from pest.grammar.rules.special import _SOI
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from collections.abc import Mapping
+
+    from pest.grammar import Expression
+    from pest.grammar.expressions.choice import ChoiceChoice
+    from pest.grammar.expressions.choice import FailureLabels
+
+MAX_RANGE = 256
+"""The largest character range to expand into a dispatch table."""
+
+# Characters, other than upper and lower case, that match ASCII letters with
+# `re.I`. All other ASCII letters only match their upper and lower case.
+_CASE_FOLDS = {"i": "İ", "k": "K", "s": "ſ"}
+
+
+class First(NamedTuple):
+    """The characters an expression can start with.
+
+    `chars` is `None` if an expression can start with any character.
+    """
+
+    chars: frozenset[str] | None
+    nullable: bool
+
+
+_ANY = First(None, nullable=True)
+_EMPTY = First(frozenset(), nullable=True)
+
+
+def dispatch_choice(expr: Expression, rules: Mapping[str, Rule]) -> Expression:
+    """Replace a choice with a choice that dispatches on the next character."""
+    if (
+        not isinstance(expr, Choice)
+        or isinstance(expr, DispatchChoice)
+        or len(expr.expressions) < 2  # noqa: PLR2004
+    ):
+        return expr
+
+    alternatives = expr.expressions
+    first_sets = _first_sets(rules)
+    firsts = [first_sets.first(alt) for alt in alternatives]
+    always = [f.chars is None or f.nullable for f in firsts]
+
+    if all(always):
+        return expr
+
+    keys = sorted(set().union(*(f.chars or () for f in firsts)))
+    table = {
+        key: tuple(
+            i
+            for i, f in enumerate(firsts)
+            if always[i] or (f.chars is not None and key in f.chars)
+        )
+        for key in keys
+    }
+    default = tuple(i for i, a in enumerate(always) if a)
+    labels = [
+        None if a else first_sets.labels(alt)
+        for alt, a in zip(alternatives, always, strict=True)
+    ]
+
+    return DispatchChoice(*alternatives, table=table, default=default, labels=labels)
+
+
+_FIRST_SETS: FirstSets | None = None
+"""The first sets of the rules most recently dispatched on."""
+
+
+def _first_sets(rules: Mapping[str, Rule]) -> FirstSets:
+    """Return first sets for `rules`, shared by every choice in an optimizer run.
+
+    Building `FirstSets` afresh for every choice would recompute the first
+    characters of every rule each choice refers to. Optimizer passes don't
+    change what a rule matches, so first sets stay valid while the same rules
+    are being optimized.
+    """
+    global _FIRST_SETS  # noqa: PLW0603
+    first_sets = _FIRST_SETS
+    if first_sets is None or first_sets.rules is not rules:
+        first_sets = _FIRST_SETS = FirstSets(rules)
+    return first_sets
+
+
+class FirstSets:
+    """Compute the first characters and immediate failure labels of expressions."""
+
+    def __init__(self, rules: Mapping[str, Rule]):
+        self.rules = rules
+        self._rule_firsts: dict[str, First] = {}
+
+        names = ("SKIP",) if "SKIP" in rules else ("WHITESPACE", "COMMENT")
+        self._trivia_rules = [name for name in names if name in rules]
+        self.has_trivia = bool(self._trivia_rules)
+        self._trivia: frozenset[str] | None = frozenset()
+        self._trivia_done = False
+
+    def trivia(self) -> frozenset[str] | None:
+        """Return the characters implicit whitespace and comments can start with."""
+        if not self._trivia_done:
+            self._trivia_done = True
+            self._trivia = _union(
+                self.rule_first(name).chars for name in self._trivia_rules
+            )
+        return self._trivia
+
+    def rule_first(self, name: str) -> First:
+        """Return the first characters of the rule called `name`."""
+        if name not in self._rule_firsts:
+            if name not in self.rules:
+                return _ANY
+            # Recursive references are assumed to match anything.
+            self._rule_firsts[name] = _ANY
+            self._rule_firsts[name] = self.first(self.rules[name].expression)
+        return self._rule_firsts[name]
+
+    def first(self, expr: Expression) -> First:  # noqa: PLR0911, PLR0912
+        """Return the characters `expr` can start with."""
+        if isinstance(expr, String):
+            if not expr.value:
+                return _EMPTY
+            return First(frozenset(expr.value[0]), nullable=False)
+
+        if isinstance(expr, CIString):
+            if not expr.value:
+                return _EMPTY
+            return First(_case_variants(expr.value[0]), nullable=False)
+
+        if isinstance(expr, Range):
+            return First(_range(expr.start, expr.stop), nullable=False)
+
+        if isinstance(expr, OptimizedChoice):
+            if isinstance(expr, OptimizedChoiceRepeat):
+                return _ANY if _choices_first(expr.choices).chars is None else _EMPTY
+            return _choices_first(expr.choices)
+
+        if isinstance(expr, Identifier):
+            return self.rule_first(expr.value)
+
+        if isinstance(expr, Rule):
+            if self.rules.get(expr.name) is expr:
+                return self.rule_first(expr.name)
+            return self.first(expr.expression)
+
+        if isinstance(expr, Sequence):
+            return self._sequence_first(expr.expressions)
+
+        if isinstance(expr, Choice):
+            firsts = [self.first(alt) for alt in expr.expressions]
+            return First(
+                _union(f.chars for f in firsts), any(f.nullable for f in firsts)
+            )
+
+        if isinstance(expr, (Group, Precedence, Push, RepeatOnce)):
+            return self.first(expr.children()[0])
+
+        if isinstance(expr, AtomicRegex):
+            return self.first(expr.expression)
+
+        if isinstance(expr, (Optional, Repeat, RepeatMax)):
+            return First(self.first(expr.children()[0]).chars, nullable=True)
+
+        if isinstance(expr, (RepeatExact, RepeatMin, RepeatMinMax)):
+            inner = self.first(expr.expression)
+            return First(inner.chars, inner.nullable or _min_count(expr) == 0)
+
+        if isinstance(
+            expr,
+            (PositivePredicate, NegativePredicate, PushLiteral, Drop, _SOI, _EOI),
+        ):
+            return _EMPTY
+
+        return _ANY
+
+    def _sequence_first(self, items: list[Expression]) -> First:
+        chars: frozenset[str] | None = frozenset()
+        for i, item in enumerate(items):
+            first = self.first(item)
+            chars = _union((chars, first.chars))
+            if not first.nullable:
+                return First(chars, nullable=False)
+            if i < len(items) - 1:
+                chars = _union((chars, self.trivia()))
+        return First(chars, nullable=True)
+
+    def labels(  # noqa: PLR0911, PLR0912
+        self, expr: Expression, path: tuple[str, ...] = ()
+    ) -> FailureLabels | None:
+        """Return the failures `expr` records when the next character can't start it.
+
+        Returns `None` if we don't know.
+        """
+        if isinstance(expr, (String, CIString)) and not expr.value:
+            # Empty strings always match.
+            return ()
+
+        if isinstance(expr, (String, CIString, Range)):
+            return ((path, str(expr)),)
+
+        if isinstance(expr, OptimizedChoice):
+            return ()
+
+        if isinstance(expr, Identifier):
+            if expr.value in path or expr.value not in self.rules:
+                return None
+            return self.labels(self.rules[expr.value].expression, (*path, expr.value))
+
+        if isinstance(expr, Rule):
+            if expr.name in path or self.rules.get(expr.name) is not expr:
+                return None
+            return self.labels(expr.expression, (*path, expr.name))
+
+        if isinstance(expr, Sequence):
+            labels: FailureLabels = ()
+            for item in expr.expressions:
+                item_labels = self.labels(item, path)
+                if item_labels is None:
+                    return None
+                labels += item_labels
+                if not self.first(item).nullable:
+                    return labels
+                if self.has_trivia:
+                    # Implicit rules might record failures too.
+                    return None
+            return labels
+
+        if isinstance(expr, Choice):
+            labels = ()
+            for alt in expr.expressions:
+                alt_labels = self.labels(alt, path)
+                if alt_labels is None:
+                    return None
+                labels += alt_labels
+            return labels
+
+        if isinstance(expr, (Group, RepeatOnce, Optional, Repeat)):
+            return self.labels(expr.children()[0], path)
+
+        if isinstance(expr, AtomicRegex):
+            # The original expression records failures when the regex doesn't match.
+            return self.labels(expr.expression, path)
+
+        return None
+
+
+def _choices_first(choices: Iterable[ChoiceChoice]) -> First:
+    chars: set[str] = set()
+    for choice in choices:
+        match choice:
+            case ChoiceLiteral(value=""):
+                return _ANY
+            case ChoiceLiteral(value=value, case=ChoiceCase.SENSITIVE):
+                chars.add(value[0])
+            case ChoiceLiteral(value=value) if len(value) == 1:
+                chars.update(value.upper(), value.lower())
+            case ChoiceRange(start, end):
+                range_chars = _range(start, end)
+                if range_chars is None:
+                    return _ANY
+                chars.update(range_chars)
+            case _:
+                # Multi-character case insensitive literals use full case folding,
+                # and Unicode properties are too big.
+                return _ANY
+    return First(frozenset(chars), nullable=False)
+
+
+def _case_variants(char: str) -> frozenset[str] | None:
+    if not char.isascii():
+        return None
+    return frozenset((char.upper(), char.lower(), *_CASE_FOLDS.get(char.lower(), "")))
+
+
+def _range(start: str, stop: str) -> frozenset[str] | None:
+    lo, hi = sorted((ord(start), ord(stop)))
+    if hi - lo >= MAX_RANGE:
+        return None
+    return frozenset(chr(c) for c in range(lo, hi + 1))
+
+
+def _union(sets: Iterable[frozenset[str] | None]) -> frozenset[str] | None:
+    chars: frozenset[str] = frozenset()
+    for s in sets:
+        if s is None:
+            return None
+        chars |= s
+    return chars
+
+
+def _min_count(expr: RepeatExact | RepeatMin | RepeatMinMax) -> int:
+    if isinstance(expr, RepeatMinMax):
+        return expr.min
+    return expr.number
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 from typing import Self
+from typing import cast
 
 from pest.grammar import Expression
 from pest.grammar.expressions.terminals import Identifier
@@ -13,6 +14,8 @@ if TYPE_CHECKING:
     from collections.abc import Iterable
 
     from pest.grammar.codegen.builder import Builder
+    from pest.grammar.compiler import Compiler
+    from pest.memo import ParseFunc
     from pest.state import ParserState
 
 SILENT = 1 << 1  # _
@@ -65,9 +68,25 @@ class Rule(Expression):
     def __hash__(self) -> int:
         return hash((self.name, self.__class__.__name__))
 
-    def parse(self, state: ParserState, pairs: list[Pair]) -> bool:
+    def parse(self, state: ParserState, pairs: list[Pair]) -> bool:  # noqa: PLR0912, PLR0915
         """Attempt to match this expression against the input at `start`."""
         start = state.pos
+        memo = state.memo
+        memo_key = None
+
+        if memo is not None:
+            memo_key = memo.key(self.name, state)
+            if memo_key is None:
+                memo = None
+            else:
+                cached = memo.lookup(memo_key, state, pairs)
+                if cached is not None:
+                    return cached
+
+        tracer = state.tracer
+        if tracer is not None:
+            tracer.enter(self.name, start)
+
         state.rule_stack.push(self)
         children: list[Pair] = []
 
@@ -87,12 +106,19 @@ class Rule(Expression):
 
         state.rule_stack.pop()
 
+        if tracer is not None:
+            tracer.exit(self.name, matched, start, state.pos)
+
         if not matched:
+            if memo is not None and memo_key is not None:
+                memo.store(memo_key, start, None)
             return False
 
         if self.modifier & SILENT:
             # Children without an enclosing Pair.
             pairs.extend(children)
+            if memo is not None and memo_key is not None:
+                memo.store(memo_key, state.pos, children)
             return True
 
         tag: str | None = state.tag_stack.pop() if state.tag_stack else None
@@ -110,16 +136,29 @@ class Rule(Expression):
                 # Atomic rule silences children
                 children = []
 
-        pairs.append(
-            Pair(
+        if state.arena is None:
+            pair = Pair(
                 input_=state.input,
                 rule=self,
                 start=start,
                 end=state.pos,
                 children=children,
                 tag=tag,
+                line_index=state.line_index,
+            )
+        else:
+            # Arena node ids stand in for pairs while parsing.
+            pair = cast(
+                "Pair",
+                state.arena.add(
+                    self, start, state.pos, cast("list[int]", children), tag
+                ),
             )
-        )
+
+        pairs.append(pair)
+
+        if memo is not None and memo_key is not None:
+            memo.store(memo_key, state.pos, (pair,))
 
         return True
 
@@ -189,15 +228,114 @@ class Rule(Expression):
                 pair = (
                     f"Pair("
                     f"state.input, {start_pos}, state.pos, "
-                    f"rule_frame, {children}, {tag_var},"
+                    f"rule_frame, {children}, {tag_var}, state.line_index"
+                    ")"
+                )
+
+                node = (
+                    f"state.arena.add("
+                    f"rule_frame, {start_pos}, state.pos, {children}, {tag_var}"
                     ")"
                 )
 
                 gen.writeln(f"if {matched_var}:")
                 with gen.block():
-                    gen.writeln(f"{pairs_var}.append({pair})")
+                    gen.writeln("if state.arena is None:")
+                    with gen.block():
+                        gen.writeln(f"{pairs_var}.append({pair})")
+                    gen.writeln("else:")
+                    with gen.block():
+                        gen.writeln(f"{pairs_var}.append({node})")
                 gen.writeln(f"return {matched_var}")
 
+    def compile(self, compiler: Compiler) -> ParseFunc:
+        """Return a function that parses this rule.
+
+        Unlike `parse`, rule modifiers and atomic child handling are resolved
+        once, here, rather than every time the rule is parsed. Memoization is
+        handled by `Compiler.rule`.
+        """
+        func = compiler.compile(self.expression)
+
+        if self.modifier & (ATOMIC | COMPOUND) or self.name in (
+            "COMMENT",
+            "WHITESPACE",
+        ):
+            body = _atomic(func)
+        elif self.modifier & NONATOMIC:
+            body = _non_atomic(func)
+        else:
+            body = func
+
+        rule = self
+
+        if self.modifier & SILENT:
+
+            def parse_silent_rule(state: ParserState, pairs: list[Pair]) -> bool:
+                state.rule_stack.push(rule)
+                children: list[Pair] = []
+                matched = body(state, children)
+                state.rule_stack.pop()
+
+                if matched:
+                    # Children without an enclosing Pair.
+                    pairs.extend(children)
+                return matched
+
+            return parse_silent_rule
+
+        discard_children = False
+
+        if self.modifier & ATOMIC:
+            if isinstance(self.expression, Rule):
+                inner_rule: Rule | None = self.expression
+            elif isinstance(self.expression, Identifier):
+                inner_rule = compiler.rules.get(self.expression.value)
+            else:
+                inner_rule = None
+
+            # Atomic rule silences children
+            discard_children = not inner_rule or not inner_rule.modifier & (
+                NONATOMIC | COMPOUND
+            )
+
+        def parse_rule(state: ParserState, pairs: list[Pair]) -> bool:
+            start = state.pos
+            state.rule_stack.push(rule)
+            children: list[Pair] = []
+            matched = body(state, children)
+            state.rule_stack.pop()
+
+            if not matched:
+                return False
+
+            tag: str | None = state.tag_stack.pop() if state.tag_stack else None
+
+            if discard_children:
+                children = []
+
+            if state.arena is None:
+                pairs.append(
+                    Pair(
+                        state.input,
+                        start,
+                        state.pos,
+                        rule,
+                        children,
+                        tag,
+                        state.line_index,
+                    )
+                )
+            else:
+                # Arena node ids stand in for pairs while parsing.
+                node = state.arena.add(
+                    rule, start, state.pos, cast("list[int]", children), tag
+                )
+                pairs.append(cast("Pair", node))
+            return True
+
+        return parse_rule
+
     def children(self) -> list[Expression]:
         """Return this expression's children."""
         return [self.expression]
@@ -207,6 +345,34 @@ class Rule(Expression):
         return self.__class__(self.name, expressions[0], self.modifier, self.doc)
 
 
+def _atomic(func: ParseFunc) -> ParseFunc:
+    """Wrap `func` so it is parsed in an atomic context."""
+
+    def parse_atomic(state: ParserState, pairs: list[Pair]) -> bool:
+        depth = state.atomic_depth
+        depth.snapshot()
+        depth += 1
+        matched = func(state, pairs)
+        depth.restore()
+        return matched
+
+    return parse_atomic
+
+
+def _non_atomic(func: ParseFunc) -> ParseFunc:
+    """Wrap `func` so it is parsed in a non-atomic context."""
+
+    def parse_non_atomic(state: ParserState, pairs: list[Pair]) -> bool:
+        depth = state.atomic_depth
+        depth.snapshot()
+        depth.zero()
+        matched = func(state, pairs)
+        depth.restore()
+        return matched
+
+    return parse_non_atomic
+
+
 class GrammarRule(Rule):
     """A named grammar rule."""
 
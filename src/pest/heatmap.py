@@ -0,0 +1,170 @@
+"""Count rule attempts and discarded matches by input position.
+
+A `BacktrackHeatmap` is a `pest.trace.Tracer` that counts how many times each
+rule was attempted at each input position, and how many of those attempts
+were discarded, either because the rule failed or because the parser later
+backtracked over its match. Input regions that are parsed over and over again
+show up as lines with many discarded attempts.
+
+    heatmap = BacktrackHeatmap()
+    parser.parse("request", text, tracer=heatmap)
+    print(heatmap.report(text))
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from typing import TYPE_CHECKING
+from typing import NamedTuple
+from typing import cast
+
+from .lines import LineIndex
+from .trace import Tracer
+
+if TYPE_CHECKING:
+    from .grammar.encode import BytesLike
+
+
+class LineHeat(NamedTuple):
+    """Rule attempts and discarded attempts for one line of input."""
+
+    line: int
+    """The one-based line number."""
+
+    attempts: int
+    """The number of rule attempts starting on this line."""
+
+    discarded: int
+    """The number of those attempts that failed or were backtracked over."""
+
+    rules: dict[str, int]
+    """Discarded attempts per rule, most discarded first."""
+
+
+class BacktrackHeatmap(Tracer):
+    """A tracer that counts rule attempts and discarded attempts by position.
+
+    A rule attempt is discarded if the rule fails to match, or if it matches
+    and the parser then backtracks to a position before the end of the match.
+    Zero-length matches are only discarded if they fail.
+
+    Counts accumulate over every parse this tracer is given to. Built-in rules
+    and memoized results are not counted, see `pest.trace.Tracer`.
+
+    Attributes:
+        attempts: A counter of rule attempts keyed by (position, rule name).
+        discards: A counter of discarded attempts keyed by (position, rule
+            name).
+    """
+
+    __slots__ = ("_depth", "_matches", "attempts", "discards")
+
+    def __init__(self) -> None:
+        self.attempts: Counter[tuple[int, str]] = Counter()
+        self.discards: Counter[tuple[int, str]] = Counter()
+
+        # Successful matches that might yet be backtracked over, as
+        # (end, start, rule name) tuples. Ends never decrease, because
+        # backtracking removes every match ending after the restored position.
+        self._matches: list[tuple[int, int, str]] = []
+
+        # The number of rules being parsed. Matches can't be backtracked over
+        # once the outermost rule exits.
+        self._depth = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"BacktrackHeatmap(attempts={self.attempts.total()}, "
+            f"discarded={self.discards.total()})"
+        )
+
+    def reset(self) -> None:
+        """Clear all counts."""
+        self.attempts.clear()
+        self.discards.clear()
+        self._matches.clear()
+        self._depth = 0
+
+    def enter(self, rule_name: str, pos: int) -> None:  # noqa: D102
+        self.attempts[(pos, rule_name)] += 1
+        self._depth += 1
+
+    def exit(self, rule_name: str, matched: bool, start: int, end: int) -> None:  # noqa: D102, FBT001
+        if matched:
+            self._matches.append((end, start, rule_name))
+        else:
+            self.discards[(start, rule_name)] += 1
+            self._discard(start)
+
+        self._depth -= 1
+        if not self._depth:
+            self._matches.clear()
+
+    def restore(self, from_pos: int, to_pos: int) -> None:  # noqa: ARG002, D102
+        self._discard(to_pos)
+
+    def _discard(self, pos: int) -> None:
+        """Discard matches ending after `pos`."""
+        matches = self._matches
+        discards = self.discards
+        while matches and matches[-1][0] > pos:
+            _, start, rule_name = matches.pop()
+            discards[(start, rule_name)] += 1
+
+    def by_line(self, text: str | BytesLike) -> list[LineHeat]:
+        """Return counts for every line of `text`, indexed by zero-based line.
+
+        Args:
+            text: The input that was parsed with this tracer.
+        """
+        index = LineIndex(text)
+        attempts = [0] * max(index.line_count, 1)
+        discarded = [0] * len(attempts)
+        rules: list[Counter[str]] = [Counter() for _ in attempts]
+
+        for (pos, _), count in self.attempts.items():
+            attempts[index.line_index(pos)] += count
+
+        for (pos, rule_name), count in self.discards.items():
+            line = index.line_index(pos)
+            discarded[line] += count
+            rules[line][rule_name] += count
+
+        return [
+            LineHeat(i + 1, attempts[i], discarded[i], dict(rules[i].most_common()))
+            for i in range(len(attempts))
+        ]
+
+    def hottest(self, text: str | BytesLike, n: int = 10) -> list[LineHeat]:
+        """Return the `n` lines of `text` with the most discarded attempts."""
+        lines = [line for line in self.by_line(text) if line.discarded]
+        lines.sort(key=lambda line: (-line.discarded, -line.attempts, line.line))
+        return lines[:n]
+
+    def report(self, text: str | BytesLike, n: int = 10) -> str:
+        """Return a table of the `n` hottest lines of `text` and their rules.
+
+        Each row shows a line number, the number of rule attempts and discarded
+        attempts on that line, the three rules with the most discarded attempts
+        and the start of the line.
+        """
+        index = LineIndex(text)
+        header = (
+            f"{'line':>8}  {'attempts':>10}  {'discarded':>10}  {'rules':<40}  text"
+        )
+        lines = [header]
+
+        for heat in self.hottest(text, n):
+            rules = ", ".join(
+                f"{name}={count}" for name, count in list(heat.rules.items())[:3]
+            )
+            line = index.line(heat.line - 1)
+            if not isinstance(text, str):
+                # Lines of bytes-like input are slices of the input.
+                line = bytes(cast("bytes", line)).decode("utf-8", errors="replace")
+            lines.append(
+                f"{heat.line:>8}  {heat.attempts:>10}  {heat.discarded:>10}  "
+                f"{rules:<40}  {line.rstrip()[:40]!r}"
+            )
+
+        return "\n".join(lines)
@@ -0,0 +1,325 @@
+"""Incremental re-parsing of edited documents.
+
+A `Document` keeps the packrat memo table from its last parse. When the
+document's text is edited, memo entries that could not have been affected by
+the edit are kept, and the document is parsed again. Rules that were unaffected
+by the edit are replayed from the memo table instead of being parsed again, so
+re-parsing after a small edit does a small fraction of the work of a full parse.
+
+An entry that starts at or after the end of an edit only depends on text that
+the edit didn't change, so it is always kept. An entry for a successful match
+before an edit is kept if the edit starts more than `lookahead` characters after
+the end of the match. Failed entries before an edit are never kept, as we don't
+know how far the parser looked before giving up.
+
+Edits don't visit memo entries. Entries are stored in a list with one slot per
+input position, so replacing a slice of that list moves every entry after an
+edit at once. Each entry remembers how many edits it has been checked against,
+and is checked against later edits, and shifted, when it is next looked up.
+Pairs from earlier parses are never changed. Replayed pairs are views that
+shift them to their new position in the edited text.
+
+Only rules without side effects are memoized. See `pest.memo`.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from typing import TypeAlias
+
+from .exceptions import PestParsingError
+from .iterparse import DEFAULT_LOOKAHEAD
+from .memo import Memo
+from .memo import memoizable_rules
+from .pairs import Pair
+from .pairs import Pairs
+
+if TYPE_CHECKING:
+    from collections.abc import Collection
+    from collections.abc import Iterable
+
+    from .grammar.rule import Rule
+    from .lines import LineIndex
+    from .memo import MemoKey
+    from .memo import MemoStats
+    from .parser import Parser
+    from .state import ParserState
+    from .state import RuleFrame
+
+Edit: TypeAlias = tuple[int, int, str]
+"""A `(start, old_end, new_text)` tuple replacing `text[start:old_end]`."""
+
+DocumentEntry: TypeAlias = tuple[bool, int, int, int, tuple[Pair, ...]]
+"""A `(matched, length, edit_count, pos, pairs)` document memo entry.
+
+`pos` and `pairs` are positioned in the text as it was after the first
+`edit_count` edits.
+"""
+
+
+class Document:
+    """A parse tree that can be updated incrementally after text edits.
+
+    Create a `Document` with `Parser.parse_document()` and update it with
+    `Parser.reparse()`.
+
+    Attributes:
+        start_rule: The name of the rule the document is parsed from.
+        text: The current document text.
+        pairs: The parse tree for the current text, or `None` if the text could
+            not be parsed.
+    """
+
+    __slots__ = ("start_rule", "text", "pairs", "memo")
+
+    def __init__(self, start_rule: str, text: str, memo: DocumentMemo):
+        self.start_rule = start_rule
+        self.text = text
+        self.pairs: Pairs | None = None
+        self.memo = memo
+
+    def __repr__(self) -> str:
+        return (
+            f"<Document start_rule={self.start_rule!r} length={len(self.text)} "
+            f"memo_entries={len(self.memo)}>"
+        )
+
+
+class DocumentMemo(Memo):
+    """An unbounded memo table that keeps its entries across text edits.
+
+    Args:
+        rules: Names of rules that are safe to memoize.
+        size: The length of the input.
+        stats: Optional `MemoStats` to accumulate hits and misses into.
+
+    Attributes:
+        columns: Memo entries for each input position, by rule name and atomic
+            context, or `None` for positions without entries.
+        edits: `(start, old_end, delta, lookahead)` for each edit, in order.
+    """
+
+    __slots__ = ("columns", "edits")
+
+    def __init__(
+        self, rules: Collection[str], size: int, stats: MemoStats | None = None
+    ) -> None:
+        super().__init__(rules, None, stats)
+        # Rules can be memoized at the end of the input, too.
+        self.columns: list[dict[tuple[str, bool], DocumentEntry] | None] = [None] * (
+            size + 1
+        )
+        self.edits: list[tuple[int, int, int, int]] = []
+
+    def __len__(self) -> int:
+        return sum(len(column) for column in self.columns if column)
+
+    def lookup(
+        self, key: MemoKey, state: ParserState, pairs: list[Pair]
+    ) -> bool | None:
+        """Replay a cached outcome for `key`. See `Memo.lookup()`."""
+        name, pos, atomic = key
+        column = self.columns[pos]
+        entry = column.get((name, atomic)) if column else None
+
+        if entry is not None and entry[2] != len(self.edits):
+            assert column is not None
+            entry = self._revalidate(column, (name, atomic), entry, state)
+
+        if entry is None:
+            self.stats.misses[name] += 1
+            return None
+
+        self.stats.hits[name] += 1
+        matched, length, _, _, cached_pairs = entry
+        if matched:
+            state.pos = pos + length
+            pairs.extend(cached_pairs)
+        return matched
+
+    def store(self, key: MemoKey, end: int, pairs: Iterable[Pair] | None) -> None:
+        """Add the outcome of parsing the rule and position in `key` to the table.
+
+        See `Memo.store()`.
+        """
+        name, pos, atomic = key
+        column = self.columns[pos]
+        if column is None:
+            column = self.columns[pos] = {}
+
+        if pairs is None:
+            column[(name, atomic)] = (False, 0, len(self.edits), pos, ())
+        else:
+            column[(name, atomic)] = (
+                True,
+                end - pos,
+                len(self.edits),
+                pos,
+                tuple(pairs),
+            )
+
+    def edit(self, start: int, old_end: int, length: int, lookahead: int) -> None:
+        """Record that `text[start:old_end]` has been replaced with `length` chars.
+
+        Entries between `start` and `old_end` are discarded. Entries after
+        `old_end` move with the text after the edit.
+        """
+        self.columns[start:old_end] = [None] * length
+        self.edits.append((start, old_end, length - (old_end - start), lookahead))
+
+    def _revalidate(
+        self,
+        column: dict[tuple[str, bool], DocumentEntry],
+        key: tuple[str, bool],
+        entry: DocumentEntry,
+        state: ParserState,
+    ) -> DocumentEntry | None:
+        """Check `entry` against edits made since it was stored or last checked.
+
+        Returns a copy of `entry` with its pairs moved to their position in the
+        current text, or `None` if an edit could have affected it.
+        """
+        matched, length, generation, pos, cached_pairs = entry
+        origin = pos
+
+        for start, old_end, delta, lookahead in self.edits[generation:]:
+            if pos >= old_end:
+                # SOI matches at zero only, so entries can't move to or from zero.
+                if (pos == 0) != (pos + delta == 0):
+                    break
+                pos += delta
+            elif not matched or pos + length + lookahead >= start:
+                break
+        else:
+            lines = state.line_index
+            shifted = (
+                matched,
+                length,
+                len(self.edits),
+                pos,
+                tuple(shift_pair(pair, pos - origin, lines) for pair in cached_pairs),
+            )
+            column[key] = shifted
+            return shifted
+
+        del column[key]
+        return None
+
+
+class ShiftedPair(Pair):
+    """A view of a `Pair` from an earlier version of a document.
+
+    Children are views too, created on demand, so moving a pair to its position
+    in the edited text doesn't visit its descendants.
+
+    Args:
+        pair: The pair from the earlier parse.
+        delta: The distance `pair` has moved.
+        lines: The line index, and text, of the current version of the document.
+    """
+
+    __slots__ = ("delta", "lines", "pair")
+
+    def __init__(self, pair: Pair, delta: int, lines: LineIndex):  # noqa: PLW0231
+        self.pair = pair
+        self.delta = delta
+        self.lines = lines
+
+    @property
+    def input(self) -> str:  # type: ignore[override]
+        """The input string."""
+        return self.lines.text  # type: ignore[return-value]
+
+    @property
+    def line_index(self) -> LineIndex:  # type: ignore[override]
+        """An index of line start positions in the input."""
+        return self.lines
+
+    @property
+    def rule(self) -> Rule | RuleFrame:  # type: ignore[override]
+        """The rule or rule frame this pair represents."""
+        return self.pair.rule
+
+    @property
+    def name(self) -> str:  # type: ignore[override]
+        """The name of the rule this pair represents."""
+        return self.pair.name
+
+    @property
+    def start(self) -> int:  # type: ignore[override]
+        """Start position in the input."""
+        return self.pair.start + self.delta
+
+    @property
+    def end(self) -> int:  # type: ignore[override]
+        """End position in the input."""
+        return self.pair.end + self.delta
+
+    @property
+    def tag(self) -> str | None:  # type: ignore[override]
+        """Optional tag for this node."""
+        return self.pair.tag
+
+    @property
+    def children(self) -> list[Pair]:  # type: ignore[override]
+        """Child pairs (subrules)."""
+        delta = self.delta
+        lines = self.lines
+        return [shift_pair(child, delta, lines) for child in self.pair.children]
+
+
+def shift_pair(pair: Pair, delta: int, lines: LineIndex) -> Pair:
+    """Return a view of `pair` moved by `delta` in the text of `lines`."""
+    if isinstance(pair, ShiftedPair):
+        delta += pair.delta
+        pair = pair.pair
+    if not delta and pair.input is lines.text:
+        return pair
+    return ShiftedPair(pair, delta, lines)
+
+
+def parse_document(parser: Parser, start_rule: str, text: str) -> Document:
+    """Parse `text` and return a new `Document`. See `Parser.parse_document()`."""
+    memo = DocumentMemo(memoizable_rules(parser.rules), len(text), parser.memo_stats)
+    document = Document(start_rule, text, memo)
+    _parse(parser, document)
+    return document
+
+
+def reparse(
+    parser: Parser,
+    document: Document,
+    edits: Iterable[Edit],
+    *,
+    lookahead: int = DEFAULT_LOOKAHEAD,
+) -> Document:
+    """Apply `edits` to `document` and parse it again. See `Parser.reparse()`."""
+    for start, old_end, new_text in edits:
+        text = document.text
+        if not 0 <= start <= old_end <= len(text):
+            raise ValueError(f"edit {start}..{old_end} is out of range")
+        document.text = text[:start] + new_text + text[old_end:]
+        document.memo.edit(start, old_end, len(new_text), lookahead)
+    _parse(parser, document)
+    return document
+
+
+def _parse(parser: Parser, document: Document) -> None:
+    """Parse `document.text`, replaying entries from `document.memo`."""
+    rule = parser.rules[document.start_rule]
+    state = parser.state_class(document.text, 0, parser)
+    state.memo = document.memo
+
+    # Replayed entries don't record failures, so errors are reported from a
+    # second parse, like with lazy errors.
+    state.track_failures = False
+
+    pairs: list[Pair] = []
+    if rule.parse(state, pairs):
+        document.pairs = Pairs(pairs)
+        return
+
+    document.pairs = None
+    state = parser.state_class(document.text, 0, parser)
+    rule.parse(state, [])
+    raise PestParsingError(state)
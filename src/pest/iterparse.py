@@ -0,0 +1,353 @@
+"""Incrementally parse the top-level repetition of a rule.
+
+`iterparse()` reads input in chunks and yields the pairs produced by each item
+of a start rule's outer repetition, as soon as that item is complete. Only the
+unparsed tail of the input is kept in memory.
+
+The start rule must be a repetition, like `record*`, or a sequence containing a
+repetition, like `SOI ~ header ~ record* ~ EOI`. Expressions before the
+repetition are parsed once, at the start of the input, and expressions after
+the repetition are parsed once the input is exhausted.
+
+An item is only yielded once the parser has seen at least `lookahead`
+characters past the end of the item and past any position at which it failed to
+match a terminal. If in doubt, more input is read and the item is parsed again.
+When an item fails to match, the rest of the input is read before deciding if
+the repetition has ended or the input is invalid.
+
+The furthest failure from each item is kept, with a reference to the buffer it
+was found in, so a parsing error reports the same position, line and column, and
+expected labels as `Parser.parse()` would for the whole input.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from typing import NamedTuple
+from typing import Protocol
+
+from .exceptions import PestParsingError
+from .grammar import Repeat
+from .grammar import RepeatOnce
+from .grammar import Sequence
+from .grammar.exceptions import PestGrammarError
+from .grammar.rule import ATOMIC
+from .grammar.rule import COMPOUND
+from .lines import RE_LINE_BREAK
+from .lines import LineIndex
+from .lines import line_index
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+
+    from .grammar.expression import Expression
+    from .grammar.rule import Rule
+    from .pairs import Pair
+    from .parser import Parser
+    from .state import ParserState
+    from .state import RuleFrame
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+"""The default number of characters to read from a file at a time."""
+
+DEFAULT_LOOKAHEAD = 1024
+"""The default number of characters the parser must see past the end of an item."""
+
+
+class Readable(Protocol):
+    """A text file-like object."""
+
+    def read(self, size: int = -1, /) -> str:
+        """Read and return at most `size` characters."""
+        ...
+
+
+def iterparse(
+    parser: Parser,
+    start_rule: str,
+    source: str | Readable | Iterable[str],
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    lookahead: int = DEFAULT_LOOKAHEAD,
+) -> Iterator[Pair]:
+    """Yield pairs from each item of `start_rule`'s top-level repetition.
+
+    See `Parser.iterparse()`.
+    """
+    rule = parser.rules[start_rule]
+    before, repetition, after = _split(rule)
+    return _Stream(parser, rule, source, chunk_size, lookahead).parse(
+        before, repetition, after
+    )
+
+
+def _split(rule: Rule) -> tuple[list[Expression], Expression, list[Expression]]:
+    """Split `rule` into expressions before, in and after its outer repetition."""
+    expr = rule.expression
+
+    if isinstance(expr, (Repeat, RepeatOnce)):
+        return [], expr, []
+
+    if isinstance(expr, Sequence):
+        # The optimizer might have nested sequences, like `a ~ a*` for `a+`.
+        items = _flatten(expr)
+        for i, item in enumerate(items):
+            if isinstance(item, (Repeat, RepeatOnce)):
+                return items[:i], item, items[i + 1 :]
+
+    raise PestGrammarError(f"rule {rule.name!r} has no top-level repetition")
+
+
+def _flatten(expr: Sequence) -> list[Expression]:
+    items: list[Expression] = []
+    for item in expr.expressions:
+        if isinstance(item, Sequence):
+            items.extend(_flatten(item))
+        else:
+            items.append(item)
+    return items
+
+
+class _Stream:
+    """A buffer over chunked input and the state needed to parse it."""
+
+    def __init__(
+        self,
+        parser: Parser,
+        rule: Rule,
+        source: str | Readable | Iterable[str],
+        chunk_size: int,
+        lookahead: int,
+    ):
+        self.parser = parser
+        self.rule = rule
+        self.lookahead = lookahead
+        self.buffer = ""
+        self.pos = 0
+        self.exhausted = False
+
+        # The position of the start of the buffer in the whole input, the number
+        # of lines before it, and any text between the start of its first line
+        # and the start of the buffer.
+        self.offset = 0
+        self.line = 0
+        self.prefix = ""
+
+        # The furthest failure so far, as an absolute position and the state's
+        # failure records, and the buffer it was found in.
+        self.failure: _Failure | None = None
+
+        if isinstance(source, str):
+            self.chunks: Iterator[str] = iter((source,))
+        elif hasattr(source, "read"):
+            self.chunks = iter(lambda: source.read(chunk_size), "")
+        else:
+            self.chunks = iter(source)
+
+    def parse(
+        self,
+        before: list[Expression],
+        repetition: Expression,
+        after: list[Expression],
+    ) -> Iterator[Pair]:
+        """Yield pairs from `before`, each item of `repetition`, then `after`."""
+        assert isinstance(repetition, (Repeat, RepeatOnce))
+        item = repetition.expression
+        count = 0
+
+        # Expressions preceding the repetition, parsed as one sequence.
+        if before:
+            yield from self._parse_required(before, trivia_before=False)
+
+        while True:
+            pairs = self._parse_optional(item, trivia_before=bool(before) or count > 0)
+            if pairs is None:
+                break
+            count += 1
+            yield from pairs
+
+        # The rest of the sequence needs the rest of the input. The repetition
+        # is included, matching nothing, so a parsing error reports failing to
+        # match another item too.
+        self._read_all()
+        rest = repetition if not count else Repeat(item)
+        yield from self._parse_required(
+            [rest, *after], trivia_before=bool(before) or count > 0
+        )
+
+    def _parse_optional(
+        self, expr: Expression, *, trivia_before: bool
+    ) -> list[Pair] | None:
+        """Parse `expr` at the current position, or return `None` if it fails."""
+        while True:
+            state, pairs, matched = self._attempt([expr], trivia_before=trivia_before)
+            if self._certain(state, matched=matched):
+                # A failed item is attempted again by `_parse_required()`, so
+                # its failures are recorded then.
+                if not matched:
+                    return None
+                self._record_failures(state)
+                return self._commit(state, pairs)
+            self._read_more()
+
+    def _parse_required(
+        self, exprs: list[Expression], *, trivia_before: bool
+    ) -> list[Pair]:
+        """Parse `exprs` at the current position, or raise a `PestParsingError`."""
+        while True:
+            state, pairs, matched = self._attempt(exprs, trivia_before=trivia_before)
+            if self._certain(state, matched=matched):
+                self._record_failures(state)
+                if not matched:
+                    raise PestParsingError(self._error_state())
+                return self._commit(state, pairs)
+            self._read_more()
+
+    def _attempt(
+        self, exprs: list[Expression], *, trivia_before: bool
+    ) -> tuple[ParserState, list[Pair], bool]:
+        """Parse `exprs` as a sequence from the current position in the buffer."""
+        state = self.parser._new_state(self.buffer, self.pos)  # noqa: SLF001
+        state.rule_stack.push(self.rule)
+
+        if self.rule.modifier & (ATOMIC | COMPOUND):
+            state.atomic_depth += 1
+
+        pairs: list[Pair] = []
+
+        for i, expr in enumerate(exprs):
+            if i or trivia_before:
+                state.parse_trivia(pairs)
+            if not expr.parse(state, pairs):
+                return state, pairs, False
+
+        return state, pairs, True
+
+    def _certain(self, state: ParserState, *, matched: bool) -> bool:
+        """Return True if more input could not change the outcome of `state`."""
+        if self.exhausted:
+            return True
+
+        # Optimized terminals don't always record how far they looked, so we
+        # can't tell if a failure was due to the end of the buffer. A failure
+        # ends the repetition, after which the rest of the input is needed
+        # anyway.
+        if not matched:
+            return False
+
+        furthest = max(state.pos, state.furthest_pos)
+        return furthest + self.lookahead < len(self.buffer)
+
+    def _record_failures(self, state: ParserState) -> None:
+        """Merge the furthest failure recorded by `state` into `self.failure`."""
+        if state.furthest_pos < 0:
+            return
+
+        pos = self.offset + state.furthest_pos
+        failure = self.failure
+        if failure is None or pos > failure.pos:
+            self.failure = _Failure(
+                pos,
+                state.furthest_stack,
+                state.furthest_expected,
+                state.furthest_unexpected,
+                self.buffer,
+                self.offset,
+                self.line,
+                self.prefix,
+            )
+        elif pos == failure.pos:
+            for records, new in (
+                (failure.expected, state.furthest_expected),
+                (failure.unexpected, state.furthest_unexpected),
+            ):
+                for rule_name, labels in new.items():
+                    records.setdefault(rule_name, []).extend(labels)
+
+    def _error_state(self) -> ParserState:
+        """Return a parser state for reporting the furthest failure."""
+        failure = self.failure
+        if failure is None:
+            # Nothing recorded a failure, like `Parser.parse()` without context.
+            state = self.parser._new_state(self.prefix + self.buffer, 0)  # noqa: SLF001
+            state.line_index = LineIndex(state.input, self.line)
+            return state
+
+        # The failure's buffer from the start of its first line.
+        text = failure.prefix + failure.buffer
+        state = self.parser._new_state(text, 0)  # noqa: SLF001
+        state.line_index = LineIndex(text, failure.line)
+        state.furthest_pos = failure.pos - failure.offset + len(failure.prefix)
+        state.furthest_stack = failure.stack
+        state.furthest_expected = failure.expected
+        state.furthest_unexpected = failure.unexpected
+        return state
+
+    def _commit(self, state: ParserState, pairs: list[Pair]) -> list[Pair]:
+        """Advance past `state` and rebase `pairs` onto their own text."""
+        start = self.pos
+        end = state.pos
+        text = self.buffer[start:end]
+        lines = line_index(text)
+        self.pos = end
+
+        # Pairs replayed from the memo table can appear more than once.
+        seen: set[int] = set()
+        stack = list(pairs)
+        while stack:
+            pair = stack.pop()
+            if id(pair) in seen:
+                continue
+            seen.add(id(pair))
+            pair.input = text
+            pair.line_index = lines
+            pair.start -= start
+            pair.end -= start
+            stack.extend(pair.children)
+
+        return pairs
+
+    def _read_more(self) -> None:
+        """Drop consumed input and read at least as much again as is left."""
+        dropped = self.buffer[: self.pos]
+        breaks = list(RE_LINE_BREAK.finditer(dropped))
+        if breaks:
+            self.line += len(breaks)
+            self.prefix = dropped[breaks[-1].end() :]
+        else:
+            self.prefix += dropped
+        self.offset += self.pos
+
+        tail = self.buffer[self.pos :]
+        chunks = [tail]
+        size = 0
+
+        for chunk in self.chunks:
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= max(len(tail), self.lookahead):
+                break
+        else:
+            self.exhausted = True
+
+        self.buffer = "".join(chunks)
+        self.pos = 0
+
+    def _read_all(self) -> None:
+        """Read the rest of the input."""
+        while not self.exhausted:
+            self._read_more()
+
+
+class _Failure(NamedTuple):
+    """The furthest failure recorded while parsing an item."""
+
+    pos: int
+    stack: list[Rule | RuleFrame]
+    expected: dict[str, list[str]]
+    unexpected: dict[str, list[str]]
+    buffer: str
+    offset: int
+    line: int
+    prefix: str
@@ -0,0 +1,142 @@
+"""Line and column numbers from an index of line start positions.
+
+Finding the line containing a position by splitting the input into lines is
+linear in the size of the input. A `LineIndex` records where each line starts,
+once per input, so line and column numbers can be found with a binary search.
+
+Each parse result and parsing error holds the index for its input. The index is
+built on first use, then shared by every `Pair`, `Span` and `Position` from the
+same parse, without a global cache keeping inputs alive.
+
+Line boundaries are the same as those recognized by `str.splitlines()`, or by
+`bytes.splitlines()` for bytes-like input.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from typing import TYPE_CHECKING
+from weakref import WeakValueDictionary
+
+import regex as re
+
+if TYPE_CHECKING:
+    from .grammar.encode import BytesLike
+
+RE_LINE_BREAK = re.compile(r"\r\n|[\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029]")
+RE_BYTES_LINE_BREAK = re.compile(rb"\r\n|[\n\r]")
+
+
+class LineIndex:
+    """The start position of each line in a string.
+
+    Line start positions are found the first time they are needed.
+
+    Args:
+        text: The input string, or a bytes-like object.
+        first_line: The number of lines before `text`, if `text` is the end of a
+            longer document. One-based line numbers are offset by this much.
+
+    Attributes:
+        text: The input string.
+        first_line: The number of lines before `text`.
+    """
+
+    __slots__ = ("__weakref__", "_line_count", "_starts", "first_line", "text")
+
+    def __init__(self, text: str | BytesLike, first_line: int = 0):
+        self.text = text
+        self.first_line = first_line
+        self._starts: list[int] | None = None
+        self._line_count = 0
+        if not first_line:
+            _INDEXES[id(text)] = self
+
+    def __reduce__(self) -> tuple[object, ...]:
+        # Line starts are cheap to find again. `mmap` and `memoryview` inputs
+        # can't be pickled, so they are copied to `bytes`.
+        text = self.text
+        if not isinstance(text, (str, bytes)):
+            text = bytes(text)
+        if self.first_line:
+            return (LineIndex, (text, self.first_line))
+        return (line_index, (text,))
+
+    @property
+    def starts(self) -> list[int]:
+        """The position of the first character of each line, in order."""
+        if self._starts is None:
+            return self._build()
+        return self._starts
+
+    @property
+    def line_count(self) -> int:
+        """The number of lines, as counted by `splitlines()`."""
+        if self._starts is None:
+            self._build()
+        return self._line_count
+
+    def _build(self) -> list[int]:
+        text = self.text
+        breaks = (
+            RE_LINE_BREAK.finditer(text)
+            if isinstance(text, str)
+            else RE_BYTES_LINE_BREAK.finditer(text)
+        )
+        starts = [0, *(m.end() for m in breaks)]
+
+        # `splitlines()` doesn't count an empty line after a trailing line break.
+        self._line_count = len(starts) - 1 if starts[-1] == len(text) else len(starts)
+        self._starts = starts
+        return starts
+
+    def line_index(self, pos: int) -> int:
+        """Return the zero-based index of the line containing `pos`.
+
+        Positions at or after the end of the input are on the last line.
+        """
+        return max(min(bisect_right(self.starts, pos), self.line_count) - 1, 0)
+
+    def line_col(self, pos: int) -> tuple[int, int]:
+        """Return the one-based line and column numbers of `pos`.
+
+        Positions at or after the end of the input are at column one of the line
+        after the last line.
+        """
+        if pos >= len(self.text) or not self.line_count:
+            return self.first_line + self.line_count + 1, 1
+        starts = self.starts
+        index = max(bisect_right(starts, pos) - 1, 0)
+        return self.first_line + index + 1, pos - starts[index] + 1
+
+    def line(self, index: int) -> str:
+        """Return the line at zero-based `index`, including its line break."""
+        starts = self.starts
+        end = starts[index + 1] if index + 1 < len(starts) else len(self.text)
+        return self.text[starts[index] : end]  # type: ignore[return-value]
+
+    def lines(self, start: int, stop: int) -> list[str]:
+        """Return lines from zero-based `start` up to, but not including, `stop`."""
+        return [
+            self.line(index)
+            for index in range(max(start, 0), min(stop, self.line_count))
+        ]
+
+
+# Indexes that are still in use, by the identity of their text. An index refers
+# to its text, so an id can't be reused by another input while its entry exists.
+_INDEXES: WeakValueDictionary[int, LineIndex] = WeakValueDictionary()
+
+
+def line_index(text: str | BytesLike) -> LineIndex:
+    """Return a `LineIndex` for `text`.
+
+    If a parse result or parsing error for `text` is still alive, its index is
+    returned, so a `Span` or `Position` built from a `Pair` shares the index of
+    the parse it came from. Otherwise a new index is returned. Indexes with a
+    `first_line` are never shared.
+    """
+    index = _INDEXES.get(id(text))
+    if index is not None and index.text is text:
+        return index
+    return LineIndex(text)
@@ -0,0 +1,332 @@
+"""Load generated parsers, caching generated modules on disk.
+
+Creating a `Parser` from a grammar means parsing and optimizing the grammar,
+and running a generated parser means generating and compiling Python source
+code too. `load_parser()` does all of that once, then writes the generated
+module to a cache directory. Subsequent calls with the same grammar and options,
+in this process or any other, import the cached module instead, along with its
+cached bytecode.
+
+Cache entries are content-addressed. Each file name includes a hash of the
+grammar text, the optimizer passes, memoization options, operator-precedence
+tables, the Python pest version and the version of the generated code, so
+stale entries are never loaded and there's nothing to invalidate.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib.util
+import os
+import sys
+import tempfile
+import types
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .grammar.codegen.generate import FORMAT_VERSION
+from .grammar.codegen.generate import VERSION
+from .grammar.optimizer import DEFAULT_OPTIMIZER
+from .memo import DEFAULT_MEMO_CAPACITY
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+    from collections.abc import Mapping
+
+    from .grammar.encode import BytesLike
+    from .grammar.optimizer import Optimizer
+    from .memo import MemoStats
+    from .pairs import Pairs
+    from .precedence import Operators
+    from .profile import ProfileStats
+    from .trace import Tracer
+
+CACHE_DIR_ENV = "PEST_CACHE_DIR"
+"""An environment variable that sets the default cache directory."""
+
+
+class CompiledParser:
+    """A parser backed by a generated parser module.
+
+    `CompiledParser` has the same `parse()` API as `Parser`. Create one with
+    `Parser.compile()` or `load_parser()`.
+
+    Args:
+        module: A generated parser module.
+
+    Attributes:
+        module: The generated parser module.
+        path: The path to the cached module's source file, or `None` if the
+            module was not loaded from disk.
+    """
+
+    __slots__ = ("module", "path", "_parse")
+
+    def __init__(self, module: types.ModuleType, path: Path | None = None):
+        self.module = module
+        self.path = path
+        self._parse: Callable[..., Pairs] = module.parse
+
+    def __repr__(self) -> str:
+        return f"<CompiledParser {self.module.__name__!r}>"
+
+    @classmethod
+    def from_source(
+        cls, source: str, *, module_name: str = "generated_parser"
+    ) -> CompiledParser:
+        """Compile and execute generated parser source code in a new module."""
+        module = types.ModuleType(module_name)
+        code = compile(source, filename=f"{module_name}.py", mode="exec")
+        exec(code, module.__dict__)  # noqa: S102
+        return cls(module)
+
+    @property
+    def memo_stats(self) -> MemoStats | None:
+        """Memo hit and miss counts, or `None` if memoization is not enabled."""
+        return getattr(self.module, "memo_stats", None)
+
+    @property
+    def profile_stats(self) -> ProfileStats | None:
+        """Per-rule counts and timings, or `None` if profiling is not enabled."""
+        return getattr(self.module, "profile_stats", None)
+
+    def parse(
+        self,
+        start_rule: str,
+        text: str | BytesLike,
+        *,
+        start_pos: int = 0,
+        arena: bool = False,
+        tracer: Tracer | None = None,
+    ) -> Pairs:
+        """Parse `text` starting from the specified `start_rule`.
+
+        Args:
+            start_rule: The name of the rule to start parsing from.
+            text: The input string to parse, or a UTF-8 encoded bytes-like
+                object if the module was generated with `bytes_input=True`.
+            start_pos: The position in the input string to start parsing from
+                (default: 0).
+            arena: If True, record the parse tree in compact parallel arrays
+                and return lazy `Pair` views over them.
+            tracer: A `pest.trace.Tracer` to receive parser events. The module
+                must have been generated with `trace=True`.
+
+        Returns:
+            Pairs: The parse tree as a `Pairs` object.
+
+        Raises:
+            KeyError: If `start_rule` is not a valid rule name.
+            PestParsingError: If the input `text` cannot be parsed according to the
+                grammar.
+            TypeError: If `tracer` is given and the module was generated
+                without tracing.
+        """
+        if tracer is not None:
+            return self._parse(
+                start_rule, text, start_pos=start_pos, arena=arena, tracer=tracer
+            )
+        return self._parse(start_rule, text, start_pos=start_pos, arena=arena)
+
+
+def default_cache_dir() -> Path:
+    """Return the default directory for cached parser modules.
+
+    This is `$PEST_CACHE_DIR` if it is set, or `python-pest` in the user's
+    cache directory (`$XDG_CACHE_HOME` or `~/.cache`) otherwise.
+    """
+    if cache_dir := os.environ.get(CACHE_DIR_ENV):
+        return Path(cache_dir)
+
+    if xdg_cache_home := os.environ.get("XDG_CACHE_HOME"):
+        return Path(xdg_cache_home) / "python-pest"
+
+    return Path.home() / ".cache" / "python-pest"
+
+
+def cache_key(
+    grammar: str,
+    *,
+    optimizer: Optimizer | None = DEFAULT_OPTIMIZER,
+    memoize: bool | Iterable[str] = False,
+    memo_exclude: Iterable[str] = (),
+    memo_capacity: int | None = DEFAULT_MEMO_CAPACITY,
+    lazy_errors: bool = False,
+    operators: Mapping[str, Operators] | None = None,
+) -> str:
+    """Return a hex digest identifying the parser module generated from `grammar`.
+
+    Arguments are the same as those for `load_parser()`.
+    """
+    passes = (
+        [
+            f"{step.name}:{_callable_key(step.func)}"
+            f":{step.direction.name}:{step.fixed_point}"
+            f":{_callable_key(step.predicate)}:{_callable_key(step.rule_filter)}"
+            for step in optimizer.passes
+        ]
+        if optimizer
+        else []
+    )
+
+    memo = memoize if isinstance(memoize, bool) else sorted(memoize)
+
+    tables = sorted(
+        (
+            name,
+            sorted(table.prefix.items()),
+            sorted(table.postfix.items()),
+            sorted(table.infix.items()),
+        )
+        for name, table in (operators or {}).items()
+    )
+
+    parts = [
+        VERSION,
+        str(FORMAT_VERSION),
+        repr(passes),
+        repr(memo),
+        repr(sorted(memo_exclude)),
+        repr(memo_capacity),
+        repr(lazy_errors),
+        repr(tables),
+        grammar,
+    ]
+
+    return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+
+def _callable_key(func: Callable[..., object] | None) -> str:
+    """Return a string identifying `func`, the same in every process.
+
+    Functions are identified by their qualified name and a hash of their code,
+    so lambdas, and functions that have been edited, don't share cache entries.
+    """
+    if func is None:
+        return "None"
+
+    name = getattr(func, "__qualname__", type(func).__qualname__)
+    key = f"{getattr(func, '__module__', None)}.{name}"
+    if (code := getattr(func, "__code__", None)) is not None:
+        digest = hashlib.sha256(b"\0".join(_code_parts(code)))
+        key += f"#{digest.hexdigest()[:16]}"
+    return key
+
+
+def _code_parts(code: types.CodeType) -> Iterator[bytes]:
+    """Yield the bytecode, names and constants of `code` and its nested code."""
+    yield code.co_code
+    yield repr(code.co_names).encode()
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            yield from _code_parts(const)
+        else:
+            yield repr(const).encode()
+
+
+def load_parser(
+    grammar: str,
+    *,
+    optimizer: Optimizer | None = DEFAULT_OPTIMIZER,
+    memoize: bool | Iterable[str] = False,
+    memo_exclude: Iterable[str] = (),
+    memo_capacity: int | None = DEFAULT_MEMO_CAPACITY,
+    lazy_errors: bool = False,
+    operators: Mapping[str, Operators] | None = None,
+    cache_dir: str | os.PathLike[str] | None = None,
+    use_cache: bool = True,
+) -> CompiledParser:
+    """Return a generated parser for `grammar`, using a cached module if possible.
+
+    On a cache hit, the grammar is not parsed or optimized and no code is
+    generated. Python's import system reuses cached bytecode too, if any.
+
+    Args:
+        grammar: The grammar definition as a string.
+        optimizer: Optional optimizer to apply to the rules.
+        memoize: If True, enable packrat memoization for all rules that are
+            safe to memoize, or only those rules named in an iterable of rule
+            names.
+        memo_exclude: Names of rules that should never be memoized.
+        memo_capacity: The maximum number of memo entries to keep per parse, or
+            `None` for an unbounded memo table.
+        lazy_errors: If True, only track failures when building an error
+            report, in a second parse of invalid input.
+        operators: A mapping of rule names to operator-precedence tables.
+        cache_dir: The directory to read and write generated modules. Defaults
+            to `default_cache_dir()`.
+        use_cache: If False, don't read from or write to the cache directory.
+
+    Returns:
+        CompiledParser: A parser backed by a generated module.
+
+    Raises:
+        PestGrammarSyntaxError: If `grammar` is invalid.
+    """
+    # Imported here to avoid a circular import.
+    from .parser import Parser  # noqa: PLC0415
+
+    memo_exclude = tuple(memo_exclude)
+    if not isinstance(memoize, bool):
+        memoize = tuple(memoize)
+
+    def generate() -> str:
+        return Parser.from_grammar(
+            grammar,
+            optimizer=optimizer,
+            memoize=memoize,
+            memo_exclude=memo_exclude,
+            memo_capacity=memo_capacity,
+            lazy_errors=lazy_errors,
+            operators=operators,
+        ).generate()
+
+    if not use_cache:
+        return CompiledParser.from_source(generate())
+
+    key = cache_key(
+        grammar,
+        optimizer=optimizer,
+        memoize=memoize,
+        memo_exclude=memo_exclude,
+        memo_capacity=memo_capacity,
+        lazy_errors=lazy_errors,
+        operators=operators,
+    )
+
+    module_name = f"pest_parser_{key[:32]}"
+    path = Path(cache_dir or default_cache_dir()) / f"{module_name}.py"
+
+    if not path.exists():
+        _write_atomic(path, generate())
+
+    return CompiledParser(_import_path(module_name, path), path)
+
+
+def _write_atomic(path: Path, source: str) -> None:
+    """Write `source` to `path` so that concurrent readers never see a partial file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-", suffix=".py")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(source)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def _import_path(module_name: str, path: Path) -> types.ModuleType:
+    """Import the module at `path`, reusing an already imported module."""
+    if (module := sys.modules.get(module_name)) is not None:
+        return module
+
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    sys.modules[module_name] = module
+    return module
@@ -0,0 +1,323 @@
+"""Packrat memoization for pure grammar rules.
+
+A memo table maps a rule, an input position and the atomic context to the
+outcome of parsing that rule at that position. When a `Choice` (or any other
+backtracking expression) re-enters the same rule at the same position, the
+cached outcome is replayed instead of parsing the rule again.
+
+Only rules without side effects are memoized. A rule is impure if it, or any
+rule it references, touches the user stack (`PUSH`, `POP`, `PEEK`, `DROP`, etc.).
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+from typing import TypeAlias
+
+from .grammar.expression import Expression
+from .grammar.expressions.terminals import Identifier
+from .grammar.rule import BuiltInRule
+from .grammar.rule import Rule
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Collection
+    from collections.abc import Iterable
+
+    from .pairs import Pair
+    from .state import ParserState
+
+
+DEFAULT_MEMO_CAPACITY = 1 << 16
+"""The default maximum number of entries in a memo table."""
+
+TRIVIA_RULES = frozenset(["WHITESPACE", "COMMENT", "SKIP"])
+"""Implicit rules that are never memoized."""
+
+MemoKey: TypeAlias = tuple[str, int, bool]
+MemoEntry: TypeAlias = tuple[bool, int, tuple["Pair", ...]]
+ParseFunc: TypeAlias = "Callable[[ParserState, list[Pair]], bool]"
+
+
+class MemoStats:
+    """Memo table hit and miss counts, per rule.
+
+    A single `MemoStats` instance accumulates counts over many parses.
+    """
+
+    __slots__ = ("hits", "misses", "evictions")
+
+    def __init__(self) -> None:
+        self.hits: Counter[str] = Counter()
+        self.misses: Counter[str] = Counter()
+        self.evictions = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"MemoStats(hits={self.total_hits}, misses={self.total_misses}, "
+            f"evictions={self.evictions})"
+        )
+
+    @property
+    def total_hits(self) -> int:
+        """The number of memo hits over all rules."""
+        return self.hits.total()
+
+    @property
+    def total_misses(self) -> int:
+        """The number of memo misses over all rules."""
+        return self.misses.total()
+
+    @property
+    def hit_rate(self) -> float:
+        """The ratio of hits to lookups over all rules."""
+        lookups = self.total_hits + self.total_misses
+        return self.total_hits / lookups if lookups else 0.0
+
+    def rule_hit_rate(self, rule_name: str) -> float:
+        """Return the ratio of hits to lookups for the rule named `rule_name`."""
+        hits = self.hits[rule_name]
+        lookups = hits + self.misses[rule_name]
+        return hits / lookups if lookups else 0.0
+
+    def reset(self) -> None:
+        """Clear all counts."""
+        self.hits.clear()
+        self.misses.clear()
+        self.evictions = 0
+
+    def as_dict(self) -> dict[str, object]:
+        """Return memo statistics as a JSON-like dictionary."""
+        return {
+            "hits": self.total_hits,
+            "misses": self.total_misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hit_rate,
+            "rules": {
+                name: {
+                    "hits": self.hits[name],
+                    "misses": self.misses[name],
+                    "hit_rate": self.rule_hit_rate(name),
+                }
+                for name in sorted(self.hits.keys() | self.misses.keys())
+            },
+        }
+
+    def report(self) -> str:
+        """Return a table of memo hit rates, most hits first."""
+        names = sorted(
+            self.hits.keys() | self.misses.keys(),
+            key=lambda name: (-self.hits[name], name),
+        )
+
+        width = max(len("total"), *(len(name) for name in names))
+        lines = [f"{'rule':<{width}}  {'hits':>10}  {'misses':>10}  {'hit rate':>8}"]
+
+        for name in names:
+            lines.append(
+                f"{name:<{width}}  {self.hits[name]:>10}  {self.misses[name]:>10}  "
+                f"{self.rule_hit_rate(name):>8.1%}"
+            )
+
+        lines.append(
+            f"{'total':<{width}}  {self.total_hits:>10}  {self.total_misses:>10}  "
+            f"{self.hit_rate:>8.1%}"
+        )
+        lines.append(f"evictions: {self.evictions}")
+        return "\n".join(lines)
+
+
+class Memo:
+    """A per-parse packrat memo table with optional FIFO eviction.
+
+    Args:
+        rules: Names of rules that are safe to memoize.
+        capacity: The maximum number of entries to keep. When the table is full,
+            the oldest entry is evicted. As entries are added roughly in input
+            order, this behaves like a sliding window over the input. If
+            `capacity` is `None`, the table is unbounded and parsing is
+            guaranteed to be linear in the length of the input for grammars in
+            which every rule is memoized.
+        stats: Optional `MemoStats` to accumulate hits and misses into.
+    """
+
+    __slots__ = ("rules", "capacity", "stats", "entries")
+
+    def __init__(
+        self,
+        rules: Collection[str],
+        capacity: int | None = DEFAULT_MEMO_CAPACITY,
+        stats: MemoStats | None = None,
+    ) -> None:
+        self.rules = rules
+        self.capacity = capacity
+        self.stats = stats or MemoStats()
+        self.entries: OrderedDict[MemoKey, MemoEntry] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def key(self, rule_name: str, state: ParserState) -> MemoKey | None:
+        """Return a memo key for `rule_name` at the current position.
+
+        Returns `None` if the rule can't be memoized in the current context.
+        Rules called with a pending tag, inside a negative predicate or while
+        failures are suppressed are never memoized, as the same rule at the same
+        position could produce different pairs or different failure reports.
+        """
+        if (
+            rule_name not in self.rules
+            or state.tag_stack
+            or state.neg_pred_depth
+            or state._suppress_failures  # noqa: SLF001
+        ):
+            return None
+        return (rule_name, state.pos, state.atomic_depth > 0)
+
+    def lookup(
+        self, key: MemoKey, state: ParserState, pairs: list[Pair]
+    ) -> bool | None:
+        """Replay a cached outcome for `key`.
+
+        Returns:
+            `True` or `False` if `key` was found in the memo table, in which case
+            the parser state and `pairs` have been updated as if the rule had been
+            parsed, or `None` if `key` is not in the table.
+        """
+        entry = self.entries.get(key)
+        if entry is None:
+            self.stats.misses[key[0]] += 1
+            return None
+
+        self.stats.hits[key[0]] += 1
+        matched, end, cached_pairs = entry
+        if matched:
+            state.pos = end
+            pairs.extend(cached_pairs)
+        return matched
+
+    def store(self, key: MemoKey, end: int, pairs: Iterable[Pair] | None) -> None:
+        """Add the outcome of parsing the rule and position in `key` to the table.
+
+        Args:
+            key: A memo key, as returned from `Memo.key()`.
+            end: The position in the input after parsing the rule.
+            pairs: Pairs produced by the rule, or `None` if the rule failed.
+        """
+        if pairs is None:
+            self.entries[key] = (False, end, ())
+        else:
+            self.entries[key] = (True, end, tuple(pairs))
+        if self.capacity is not None and len(self.entries) > self.capacity:
+            self.entries.popitem(last=False)
+            self.stats.evictions += 1
+
+
+def memoize_rule(rule_name: str, func: ParseFunc) -> ParseFunc:
+    """Wrap a generated `parse_<rule>` function with memo table lookups.
+
+    The returned function consults `state.memo`, if one is set, before calling
+    `func`. It is used by generated parsers, where rules are plain functions
+    rather than `Rule` instances.
+    """
+
+    def memoized(state: ParserState, pairs: list[Pair]) -> bool:
+        memo = state.memo
+        if memo is None:
+            return func(state, pairs)
+
+        key = memo.key(rule_name, state)
+        if key is None:
+            return func(state, pairs)
+
+        cached = memo.lookup(key, state, pairs)
+        if cached is not None:
+            return cached
+
+        start = state.pos
+        children: list[Pair] = []
+
+        if func(state, children):
+            pairs.extend(children)
+            memo.store(key, state.pos, children)
+            return True
+
+        memo.store(key, start, None)
+        return False
+
+    memoized.__doc__ = func.__doc__
+    return memoized
+
+
+def memoizable_rules(
+    rules: dict[str, Rule],
+    include: Iterable[str] | None = None,
+    exclude: Iterable[str] = (),
+) -> frozenset[str]:
+    """Return the names of rules in `rules` that are safe to memoize.
+
+    A rule is safe to memoize if neither it, nor any rule it references,
+    has side effects according to `Expression.is_pure()`. Built-in rules and
+    implicit whitespace and comment rules are never memoized.
+
+    If the implicit `WHITESPACE`, `COMMENT` or `SKIP` rules are impure, no rules
+    are memoized, as trivia can be parsed between any two items in a sequence or
+    repetition.
+
+    Args:
+        rules: A mapping of rule names to rules.
+        include: An optional collection of rule names to limit memoization to.
+            Impure rules are excluded even if they are in `include`.
+        exclude: Names of rules that should not be memoized.
+    """
+    references: dict[str, set[str]] = {}
+    impure: set[str] = set()
+
+    for name, rule in rules.items():
+        refs: set[str] = set()
+        if _has_side_effects(rule.expression, rules, refs):
+            impure.add(name)
+        references[name] = refs
+
+    # Propagate impurity through rule references until nothing changes.
+    changed = True
+    while changed:
+        changed = False
+        for name, refs in references.items():
+            if name not in impure and not refs.isdisjoint(impure):
+                impure.add(name)
+                changed = True
+
+    if not impure.isdisjoint(TRIVIA_RULES):
+        return frozenset()
+
+    candidates = set(rules) if include is None else set(include) & set(rules)
+    return frozenset(
+        name
+        for name in candidates - impure - set(exclude) - TRIVIA_RULES
+        if not isinstance(rules[name], BuiltInRule)
+    )
+
+
+def _has_side_effects(expr: Expression, rules: dict[str, Rule], refs: set[str]) -> bool:
+    """Return True if `expr` has side effects, not counting referenced rules.
+
+    The names of rules referenced from `expr` are added to `refs`.
+    """
+    if isinstance(expr, Identifier):
+        refs.add(expr.value)
+        return False
+
+    # Expressions that override `is_pure` are the ones that can have side
+    # effects. The default implementation delegates to child expressions, which
+    # we visit explicitly to handle recursive rules.
+    if (
+        not isinstance(expr, Rule)
+        and type(expr).is_pure is not Expression.is_pure
+        and not expr.is_pure(rules)
+    ):
+        return True
+
+    return any(_has_side_effects(child, rules, refs) for child in expr.children())
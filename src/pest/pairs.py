@@ -8,14 +8,25 @@ from __future__ import annotations
 
 import json
 from collections.abc import Sequence
+from copy import deepcopy
 from typing import TYPE_CHECKING
+from typing import Any
 from typing import NamedTuple
+from typing import Self
+from typing import TypeVar
 from typing import overload
 
+from .lines import line_index
+
+T = TypeVar("T")
+
 if TYPE_CHECKING:
     from collections.abc import Iterator
+    from collections.abc import Mapping
 
+    from .grammar.encode import BytesLike
     from .grammar.rule import Rule
+    from .lines import LineIndex
     from .state import RuleFrame
 
 
@@ -63,7 +74,7 @@ class Span(NamedTuple):
     end: int
 
     def __str__(self) -> str:
-        return self.text[self.start : self.end]
+        return _decode(self.text[self.start : self.end])
 
     def as_str(self) -> str:
         """Return the slice of the source corresponding to this span."""
@@ -86,10 +97,10 @@ class Span(NamedTuple):
 
         Includes lines that are partially covered.
         """
-        lines = self.text.splitlines(keepends=True)
-        start_line_number, _ = self.start_pos().line_col()
-        end_line_number, _ = self.end_pos().line_col()
-        return lines[start_line_number - 1 : end_line_number]
+        index = line_index(self.text)
+        start_line_number, _ = index.line_col(self.start)
+        end_line_number, _ = index.line_col(self.end)
+        return index.lines(start_line_number - 1, end_line_number)
 
 
 class Position(NamedTuple):
@@ -107,30 +118,15 @@ class Position(NamedTuple):
         Returns:
             A tuple (line_number, column_number), both 1-based.
         """
-        lines = self.text.splitlines(keepends=True)
-        cumulative_length = 0
-        target_line_index = -1
-
-        for i, line in enumerate(lines):
-            cumulative_length += len(line)
-            if self.pos < cumulative_length:
-                target_line_index = i
-                break
-
-        if target_line_index == -1:
-            return len(lines) + 1, 1
-
-        # 1-based
-        line_number = target_line_index + 1
-        column_number = (
-            self.pos - (cumulative_length - len(lines[target_line_index])) + 1
-        )
-        return line_number, column_number
+        return line_index(self.text).line_col(self.pos)
 
     def line_of(self) -> str:
         """Return the line of text that contains this position."""
-        line_number, _ = self.line_col()
-        return self.text[line_number - 1]
+        index = line_index(self.text)
+        line_number, _ = index.line_col(self.pos)
+        if line_number > index.line_count:
+            return ""
+        return index.line(line_number - 1)
 
 
 class Pair:
@@ -146,9 +142,21 @@ class Pair:
         rule: The rule or rule frame this pair represents.
         children: List of child pairs (subrules).
         tag: Optional tag for this node.
+        line_index: An index of line start positions in the input, shared by
+            all pairs from the same parse. If not given, one is found or built
+            when line numbers are needed.
     """
 
-    __slots__ = ("children", "end", "input", "name", "rule", "start", "tag")
+    __slots__ = (
+        "children",
+        "end",
+        "input",
+        "line_index",
+        "name",
+        "rule",
+        "start",
+        "tag",
+    )
     __match_args__ = ("name", "children", "start", "end")
 
     def __init__(
@@ -159,6 +167,7 @@ class Pair:
         rule: Rule | RuleFrame,
         children: list[Pair] | None = None,
         tag: str | None = None,
+        line_index: LineIndex | None = None,
     ):
         self.input = input_
         self.rule = rule
@@ -167,13 +176,29 @@ class Pair:
         self.children = children or []
         self.tag = tag
         self.name = rule.name
+        self.line_index = line_index
 
     def __str__(self) -> str:
-        return self.input[self.start : self.end]
+        return _decode(self.input[self.start : self.end])
 
     def __repr__(self) -> str:
         return f"Pair(rule={self.name!r}, text={str(self)!r}, tag={self.tag!r})"
 
+    def __reduce__(self) -> tuple[object, ...]:
+        # Pickle this pair and its descendants with the compact binary encoding.
+        # The input and rules are pickled by reference, so pickling many pairs
+        # from the same parse stores them once.
+        from .serialize import reduce_pairs  # noqa: PLC0415
+
+        lines, data, rules = reduce_pairs(Pairs([self]))
+        return (_load_pair, (data, lines, rules))
+
+    def __copy__(self) -> Self:
+        return _copy_slots(self, None)
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> Self:
+        return _copy_slots(self, memo)
+
     def as_str(self) -> str:
         """Return the substring pointed to by this token pair."""
         return str(self)
@@ -205,7 +230,7 @@ class Pair:
         d: dict[str, object] = {
             "rule": self.rule.name,
             "span": {
-                "str": self.input[self.start : self.end],
+                "str": self.text,
                 "start": self.start,
                 "end": self.end,
             },
@@ -245,12 +270,15 @@ class Pair:
 
     def line_col(self) -> tuple[int, int]:
         """Return the line and column number of this pair's start position."""
-        return self.span().start_pos().line_col()
+        index = self.line_index
+        if index is None:
+            index = self.line_index = line_index(self.input)
+        return index.line_col(self.start)
 
     @property
     def text(self) -> str:
         """The substring pointed to by this token pair."""
-        return self.input[self.start : self.end]
+        return _decode(self.input[self.start : self.end])
 
     @property
     def inner_texts(self) -> list[str]:
@@ -287,6 +315,75 @@ class Pairs(Sequence[Pair]):
     def __getitem__(self, index: int | slice) -> Pair | Sequence[Pair]:
         return self._pairs[index]
 
+    def __reduce__(self) -> tuple[object, ...]:
+        from .serialize import reduce_pairs  # noqa: PLC0415
+
+        lines, data, rules = reduce_pairs(self)
+        return (_load_pairs, (data, lines, rules))
+
+    def __copy__(self) -> Self:
+        return _copy_slots(self, None)
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> Self:
+        return _copy_slots(self, memo)
+
+    def to_bytes(self, *, include_input: bool = False) -> bytes:
+        """Return a compact binary encoding of these pairs and their descendants.
+
+        Rule names and tags are written once, in lookup tables, and each pair
+        is written as a handful of variable length integers. Rule objects are
+        not included, so pairs loaded with `from_bytes()` refer to a `RuleFrame`
+        unless a mapping of rules is given.
+
+        Pickling a `Pairs` or `Pair` uses this encoding, with the input text
+        and rules pickled separately, so they are shared by all pairs from the
+        same parse in one pickle.
+
+        Args:
+            include_input: If True, include the input text in the encoding.
+                By default, the input text must be passed to `from_bytes()`.
+
+        Returns:
+            bytes: The encoded pairs.
+
+        Raises:
+            ValueError: If pairs do not all share the same input.
+        """
+        # Imported here to avoid a circular import.
+        from .serialize import dump_pairs  # noqa: PLC0415
+
+        return dump_pairs(self, include_input=include_input)
+
+    @classmethod
+    def from_bytes(
+        cls,
+        data: bytes,
+        input_: str | BytesLike | None = None,
+        *,
+        rules: Mapping[str, Rule] | None = None,
+    ) -> Pairs:
+        """Load pairs encoded with `to_bytes()`.
+
+        Args:
+            data: The encoded pairs.
+            input_: The input text the pairs were parsed from. Required if
+                `data` does not include input text, and used in place of it
+                otherwise.
+            rules: An optional mapping of rule names to rules, like
+                `Parser.rules`. Pairs for rules found in the mapping refer to
+                those rules. Other pairs refer to a `RuleFrame`.
+
+        Returns:
+            Pairs: The decoded pairs.
+
+        Raises:
+            ValueError: If `data` is not an encoded parse tree, or if `data`
+                does not include input text and `input_` is not given.
+        """
+        from .serialize import load_pairs  # noqa: PLC0415
+
+        return load_pairs(data, input_, rules=rules)
+
     def tokens(self) -> Iterator[Token]:
         """Yield start and end tokens for each pair in the sequence."""
         for pair in self._pairs:
@@ -396,3 +493,54 @@ class Stream:
         if self.pos < len(self.pairs):
             return self.pairs[self.pos]
         return None
+
+
+def _load_pairs(
+    data: bytes,
+    lines: LineIndex | None = None,
+    rules: Mapping[str, Rule] | None = None,
+) -> Pairs:
+    return Pairs.from_bytes(data, None if lines is None else lines.text, rules=rules)
+
+
+def _load_pair(
+    data: bytes,
+    lines: LineIndex | None = None,
+    rules: Mapping[str, Rule] | None = None,
+) -> Pair:
+    return _load_pairs(data, lines, rules)[0]
+
+
+def _copy_slots(obj: T, memo: dict[int, Any] | None) -> T:
+    """Copy `obj` slot by slot, deep copying slot values if `memo` is given.
+
+    This is what `copy` does for objects that don't define `__reduce__`, so
+    copying pairs doesn't go through the binary encoding used for pickling.
+    """
+    cls = type(obj)
+    new = cls.__new__(cls)
+    if memo is not None:
+        memo[id(obj)] = new
+
+    for klass in cls.__mro__:
+        for name in klass.__dict__.get("__slots__", ()):
+            # Read the slot itself, not a property of the same name defined
+            # by a subclass.
+            slot = klass.__dict__[name]
+            try:
+                value = slot.__get__(obj, cls)
+            except AttributeError:
+                continue
+            slot.__set__(new, value if memo is None else deepcopy(value, memo))
+
+    return new
+
+
+def _decode(text: str | bytes | bytearray | memoryview) -> str:
+    """Return a slice of the input as a string.
+
+    Slices are bytes-like if the input was parsed as bytes.
+    """
+    if isinstance(text, str):
+        return text
+    return str(text, "utf-8")
@@ -6,27 +6,65 @@ as well as utilities for generating parser source code and inspecting grammar ru
 
 from __future__ import annotations
 
+import pickle
+from copy import copy
+from pathlib import Path
 from typing import TYPE_CHECKING
+from typing import cast
 
+from .arena import Arena
+from .batch import DEFAULT_BATCH_CHUNK_SIZE
+from .batch import parse_many
 from .exceptions import PestParsingError
 from .grammar import parse
+from .grammar.analysis import GrammarAnalysis
+from .grammar.codegen.generate import VERSION
 from .grammar.codegen.generate import generate_module
+from .grammar.compiler import Compiler
+from .grammar.encode import encode_rules
+from .grammar.expressions import Precedence
 from .grammar.optimizer import DEFAULT_OPTIMIZER
+from .grammar.rule import SILENT
 from .grammar.rule import BuiltInRule
 from .grammar.rules.ascii import ASCII_RULES
 from .grammar.rules.special import EOI
 from .grammar.rules.special import SOI
 from .grammar.rules.special import Any
 from .grammar.rules.unicode import UNICODE_RULES
+from .incremental import parse_document
+from .incremental import reparse
+from .iterparse import DEFAULT_CHUNK_SIZE
+from .iterparse import DEFAULT_LOOKAHEAD
+from .iterparse import iterparse
+from .loader import CompiledParser
+from .memo import DEFAULT_MEMO_CAPACITY
+from .memo import Memo
+from .memo import MemoStats
+from .memo import memoizable_rules
 from .pairs import Pairs
-from .state import ParserState
+from .profile import ProfileStats
+from .profile import profiling_state_class
+from .state import state_class
+from .trace import tracing_state_class
 
 if TYPE_CHECKING:
+    import os
+    from collections.abc import Iterable
+    from collections.abc import Iterator
     from collections.abc import Mapping
 
+    from .grammar.analysis import Hazard
+    from .grammar.encode import BytesLike
     from .grammar.optimizer import Optimizer
     from .grammar.rule import Rule
+    from .incremental import Document
+    from .incremental import Edit
+    from .iterparse import Readable
+    from .memo import ParseFunc
     from .pairs import Pair
+    from .precedence import Operators
+    from .state import ParserState
+    from .trace import Tracer
 
 
 class Parser:
@@ -40,10 +78,38 @@ class Parser:
         doc: Optional list of grammar documentation lines.
         optimizer: Optional optimizer to apply to the rules.
         debug: If True, enables debug output during optimization.
+        memoize: If True, enable packrat memoization for all rules that are safe
+            to memoize. If an iterable of rule names is given, only those rules
+            are memoized, excluding any that are unsafe to memoize.
+        memo_exclude: Names of rules that should never be memoized.
+        memo_capacity: The maximum number of memo entries to keep per parse, or
+            `None` for an unbounded memo table.
+        closures: If True, compile rules into nested Python closures when the
+            parser is created, and parse using those instead of walking the
+            grammar tree.
+        lazy_errors: If True, don't track expected and unexpected labels while
+            parsing. If parsing fails, the input is parsed again with failure
+            tracking enabled to build a `PestParsingError`. This makes parsing
+            valid input faster at the expense of parsing invalid input twice.
+        operators: A mapping of rule names to operator-precedence tables. Each
+            named rule's children are folded into nested pairs, by operator
+            precedence, as the rule is parsed. See `pest.precedence`.
 
     Attributes:
         rules: A mapping of rule names to `Rule` instances, including built-ins.
         doc: An optional list of grammar documentation lines.
+        memo_rules: Names of rules that are memoized when parsing.
+        memo_stats: Memo hit and miss counts accumulated over all parses.
+        profile_stats: Per-rule counts and timings accumulated over all parses
+            with `profile=True`.
+        state_class: The `ParserState` subclass used when parsing, chosen
+            according to the features used by the grammar.
+        compiled_rules: A mapping of rule names to compiled parse functions, or
+            `None` if `closures` is False.
+        lazy_errors: True if errors are reported from a second parse.
+        hazards: Parts of the grammar that are likely to backtrack heavily,
+            found in the rules passed to `from_grammar()` the first time
+            `hazards` is accessed. See `pest.grammar.analysis`.
     """
 
     BUILTIN: dict[str, Rule] = {
@@ -61,6 +127,12 @@ class Parser:
         *,
         optimizer: Optimizer | None = None,
         debug: bool = False,
+        memoize: bool | Iterable[str] = False,
+        memo_exclude: Iterable[str] = (),
+        memo_capacity: int | None = DEFAULT_MEMO_CAPACITY,
+        closures: bool = False,
+        lazy_errors: bool = False,
+        operators: Mapping[str, Operators] | None = None,
     ):
         # Built-in rules overwrite grammar defined rules.
         self.rules: dict[str, Rule] = {**self.BUILTIN, **rules}
@@ -68,6 +140,43 @@ class Parser:
         if optimizer:
             optimizer.optimize(self.rules, debug=debug)
 
+        if operators:
+            self._apply_operators(operators)
+
+        if memoize is False:
+            self.memo_rules: frozenset[str] = frozenset()
+        else:
+            self.memo_rules = memoizable_rules(
+                self.rules,
+                include=None if memoize is True else memoize,
+                exclude=memo_exclude,
+            )
+
+        self.memo_capacity = memo_capacity
+        self.memo_stats = MemoStats()
+
+        # A `ParserState` class with checkpoints specialized for this grammar.
+        self.state_class = state_class(self.rules)
+        self.lazy_errors = lazy_errors
+
+        self.compiled_rules: dict[str, ParseFunc] | None = (
+            Compiler(self.rules, self.memo_rules).compile_rules() if closures else None
+        )
+
+        self.profile_stats = ProfileStats()
+
+        # Profiled and/or traced closures, compiled on demand and keyed by
+        # (profile, trace).
+        self._instrumented_rules: dict[tuple[bool, bool], dict[str, ParseFunc]] = {}
+
+        # A parser for bytes-like input, created on demand.
+        self._bytes_parser: Parser | None = None
+
+        # Set by `from_grammar()`, which analyzes rules before they are
+        # optimized. Hazards are found on demand.
+        self._analysis: GrammarAnalysis | None = None
+        self._hazards: list[Hazard] | None = None
+
     @classmethod
     def from_grammar(
         cls,
@@ -75,6 +184,12 @@ class Parser:
         *,
         optimizer: Optimizer | None = DEFAULT_OPTIMIZER,
         debug: bool = False,
+        memoize: bool | Iterable[str] = False,
+        memo_exclude: Iterable[str] = (),
+        memo_capacity: int | None = DEFAULT_MEMO_CAPACITY,
+        closures: bool = False,
+        lazy_errors: bool = False,
+        operators: Mapping[str, Operators] | None = None,
     ) -> Parser:
         """Parse a grammar definition and return a new `Parser` for it.
 
@@ -82,61 +197,533 @@ class Parser:
             grammar: The grammar definition as a string.
             optimizer: Optional optimizer to apply to the rules.
             debug: If True, enables debug output during optimization.
+            memoize: If True, enable packrat memoization for all rules that are
+                safe to memoize, or only those rules named in an iterable of
+                rule names.
+            memo_exclude: Names of rules that should never be memoized.
+            memo_capacity: The maximum number of memo entries to keep per
+                parse, or `None` for an unbounded memo table.
+            closures: If True, compile rules into nested Python closures.
+            lazy_errors: If True, only track failures when building an error
+                report, in a second parse of invalid input.
+            operators: A mapping of rule names to operator-precedence tables.
 
         Returns:
             Parser: A new parser instance for the given grammar.
 
         Raises:
             PestGrammarSyntaxError: If `grammar` is invalid.
+            PestGrammarError: If a rule repeats an expression that can match
+                without consuming input, or if a rule is left-recursive.
         """
         rules, doc = parse(grammar, cls.BUILTIN)
 
+        # The optimizer replaces rule expressions in place, so the analysis
+        # keeps its own copies of grammar rules for finding hazards later.
+        analysis = GrammarAnalysis(
+            {**cls.BUILTIN, **{name: copy(rule) for name, rule in rules.items()}}
+        )
+        analysis.validate()
+
         # TODO: validate rules
-        # - validate_repetition
-        # - validate_choices
         # - validate_whitespace_comment
         # - validate_tag_silent_rules
 
-        return cls(rules, doc, optimizer=optimizer, debug=debug)
+        parser = cls(
+            rules,
+            doc,
+            optimizer=optimizer,
+            debug=debug,
+            memoize=memoize,
+            memo_exclude=memo_exclude,
+            memo_capacity=memo_capacity,
+            closures=closures,
+            lazy_errors=lazy_errors,
+            operators=operators,
+        )
+        parser._analysis = analysis  # noqa: SLF001
+        return parser
+
+    @property
+    def hazards(self) -> list[Hazard]:
+        """Parts of the grammar that are likely to backtrack heavily."""
+        if self._hazards is None:
+            self._hazards = self._analysis.hazards() if self._analysis else []
+            self._analysis = None
+        return self._hazards
+
+    def _apply_operators(self, operators: Mapping[str, Operators]) -> None:
+        """Wrap the expression of each rule in `operators` with its table."""
+        for name, table in operators.items():
+            rule = self.rules[name]
+
+            if isinstance(rule, BuiltInRule) or rule.modifier & SILENT:
+                raise ValueError(
+                    f"can't apply operator precedence to rule {name!r}, "
+                    "it is built-in or silent"
+                )
+
+            expr = rule.expression
+            if isinstance(expr, Precedence):
+                expr = expr.expression
+            rule.expression = Precedence(expr, table)
+
+    def save(self, path: str | os.PathLike[str]) -> None:
+        """Write this parser's rules, after optimization, to a file.
+
+        Load the parser again with `Parser.load()`, which skips parsing and
+        optimizing the grammar. Operator-precedence tables are saved with the
+        rules. Memoization, closure and error reporting options are not saved.
+
+        Args:
+            path: The file to write.
+        """
+        rules = {
+            name: rule
+            for name, rule in self.rules.items()
+            if self.BUILTIN.get(name) is not rule
+        }
+
+        Path(path).write_bytes(
+            pickle.dumps((VERSION, rules, self.doc), protocol=pickle.HIGHEST_PROTOCOL)
+        )
+
+    @classmethod
+    def load(
+        cls,
+        path: str | os.PathLike[str],
+        *,
+        memoize: bool | Iterable[str] = False,
+        memo_exclude: Iterable[str] = (),
+        memo_capacity: int | None = DEFAULT_MEMO_CAPACITY,
+        closures: bool = False,
+        lazy_errors: bool = False,
+    ) -> Parser:
+        """Return a new `Parser` with rules read from a file written by `save()`.
+
+        Saved files are pickles, so only load files you trust.
+
+        Args:
+            path: The file to read.
+            memoize: If True, enable packrat memoization for all rules that are
+                safe to memoize, or only those rules named in an iterable of
+                rule names.
+            memo_exclude: Names of rules that should never be memoized.
+            memo_capacity: The maximum number of memo entries to keep per
+                parse, or `None` for an unbounded memo table.
+            closures: If True, compile rules into nested Python closures.
+            lazy_errors: If True, only track failures when building an error
+                report, in a second parse of invalid input.
+
+        Returns:
+            Parser: A new parser instance with the saved rules.
+
+        Raises:
+            ValueError: If the file was saved by a different version of Python
+                pest.
+        """
+        version, rules, doc = pickle.loads(Path(path).read_bytes())  # noqa: S301
+
+        if version != VERSION:
+            raise ValueError(
+                f"parser was saved by Python pest version {version}, not {VERSION}"
+            )
+
+        return cls(
+            rules,
+            doc,
+            memoize=memoize,
+            memo_exclude=memo_exclude,
+            memo_capacity=memo_capacity,
+            closures=closures,
+            lazy_errors=lazy_errors,
+        )
 
     def __str__(self) -> str:
         doc = "".join(f"//!{line}\n" for line in self.doc) + "\n" if self.doc else ""
         return doc + "\n\n".join(str(rule) for rule in self.rules.values())
 
-    def parse(self, start_rule: str, text: str, *, start_pos: int = 0) -> Pairs:
+    def parse(
+        self,
+        start_rule: str,
+        text: str | BytesLike,
+        *,
+        start_pos: int = 0,
+        arena: bool = False,
+        profile: bool = False,
+        tracer: Tracer | None = None,
+    ) -> Pairs:
         """Parse `text` starting from the specified `start_rule`.
 
+        If `text` is a `bytes`, `bytearray`, `memoryview` or `mmap` object, it
+        is parsed as UTF-8 without decoding it first, and pair positions are
+        byte offsets. See `bytes_parser()`.
+
         Args:
             start_rule: The name of the rule to start parsing from.
-            text: The input string to parse.
+            text: The input string or UTF-8 encoded bytes-like object to parse.
             start_pos: The position in the input string to start parsing from
                 (default: 0).
+            arena: If True, record the parse tree in compact parallel arrays
+                and return lazy `Pair` views over them, instead of building a
+                `Pair` instance for every node. This uses much less memory for
+                large inputs.
+            profile: If True, parse with rules compiled to closures that record
+                per-rule counts and timings in `profile_stats`. See
+                `pest.profile`.
+            tracer: A `pest.trace.Tracer` to receive rule enter and exit
+                events, terminal failures and backtracking restores while
+                parsing.
 
         Returns:
             Pairs: The parse tree as a `Pairs` object.
 
         Raises:
             KeyError: If `start_rule` is not a valid rule name.
+            PestGrammarError: If `text` is bytes-like and parsing reaches a
+                rule that can't be encoded. See `bytes_parser()`.
             PestParsingError: If the input `text` cannot be parsed according to the
                 grammar.
         """
-        rule = self.rules[start_rule]
-        state = ParserState(text, start_pos, self)
+        if isinstance(text, str):
+            return self._parse(
+                start_rule,
+                text,
+                start_pos,
+                arena=arena,
+                profile=profile,
+                tracer=tracer,
+            )
+
+        # Encoded rules match bytes-like input with bytes regexes. Everything
+        # else only slices the input and compares positions with its length.
+        return self.bytes_parser()._parse(  # noqa: SLF001
+            start_rule,
+            cast("str", text),
+            start_pos,
+            arena=arena,
+            profile=profile,
+            tracer=tracer,
+        )
+
+    def _parse(
+        self,
+        start_rule: str,
+        text: str,
+        start_pos: int,
+        *,
+        arena: bool,
+        profile: bool = False,
+        tracer: Tracer | None = None,
+    ) -> Pairs:
+        # The interpreter checks for a tracer itself. Closures are only traced
+        # if they are compiled with tracing enabled.
+        trace = tracer is not None and (profile or self.compiled_rules is not None)
+
+        if profile or trace:
+            key = (profile, trace)
+            rules = self._instrumented_rules.get(key)
+            if rules is None:
+                rules = self._instrumented_rules[key] = Compiler(
+                    self.rules,
+                    self.memo_rules,
+                    self.profile_stats if profile else None,
+                    trace=trace,
+                ).compile_rules()
+            parse_rule = rules[start_rule]
+        else:
+            parse_rule = self._parse_func(start_rule)
+
+        state = self._new_state(text, start_pos, profile=profile, tracer=tracer)
+        state.track_failures = not self.lazy_errors
+
+        if arena:
+            state.arena = Arena(text)
+
         pairs: list[Pair] = []
-        matched = rule.parse(state, pairs)
+        matched = parse_rule(state, pairs)
 
         if matched:
+            if state.arena is not None:
+                return state.arena.pairs(cast("list[int]", pairs))
             return Pairs(pairs)
 
+        if not state.track_failures:
+            # Parse again, this time tracking failures for the error report.
+            # The tracer and profiler have already seen this parse.
+            state = self._new_state(text, start_pos)
+            self._parse_func(start_rule)(state, [])
+
         raise PestParsingError(state)
 
-    def generate(self) -> str:
+    def _parse_func(self, start_rule: str) -> ParseFunc:
+        """Return the uninstrumented parse function for `start_rule`."""
+        if self.compiled_rules is not None:
+            return self.compiled_rules[start_rule]
+        return self.rules[start_rule].parse
+
+    def bytes_parser(self) -> Parser:
+        """Return a parser for UTF-8 encoded bytes-like input.
+
+        The returned parser has the same options as this one, but its rules
+        match bytes instead of characters. Case insensitive literals only fold
+        ASCII letters. Unicode property rules and stack operations are not
+        supported. Rules that use them raise a `PestGrammarError` when they
+        are parsed.
+
+        Returns:
+            Parser: A parser with encoded rules, created on first use.
+        """
+        if self._bytes_parser is None:
+            self._bytes_parser = Parser(
+                encode_rules(self.rules),
+                self.doc,
+                memoize=self.memo_rules or False,
+                memo_capacity=self.memo_capacity,
+                closures=self.compiled_rules is not None,
+                lazy_errors=self.lazy_errors,
+            )
+            self._bytes_parser.memo_stats = self.memo_stats
+            self._bytes_parser.profile_stats = self.profile_stats
+        return self._bytes_parser
+
+    def iterparse(
+        self,
+        start_rule: str,
+        source: str | Readable | Iterable[str],
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        lookahead: int = DEFAULT_LOOKAHEAD,
+    ) -> Iterator[Pair]:
+        """Parse `source` incrementally, yielding top-level pairs as they complete.
+
+        `start_rule` must be a repetition, or a sequence containing a
+        repetition, like `{ SOI ~ header ~ record* ~ EOI }`. Pairs produced by
+        expressions before the repetition, by each item of the repetition and
+        by expressions after it are yielded in order. The start rule itself
+        does not produce a pair.
+
+        Consumed input is discarded as parsing progresses, so each yielded
+        pair's `input` is the text of the item it came from, not the whole
+        input, and positions are relative to the start of that item.
+
+        Args:
+            start_rule: The name of the rule to start parsing from.
+            source: The input string, a text file object or an iterable of
+                strings.
+            chunk_size: The number of characters to read from a file object
+                at a time.
+            lookahead: The number of characters that must have been read past
+                the end of an item, and past the furthest position the parser
+                tried to match, before the item is yielded. It should be at
+                least as long as the longest lookahead in the grammar.
+
+        Returns:
+            Iterator[Pair]: Pairs from each item, in input order.
+
+        Raises:
+            KeyError: If `start_rule` is not a valid rule name.
+            PestGrammarError: If `start_rule` has no top-level repetition.
+            PestParsingError: If the input can not be parsed according to the
+                grammar. Pairs from items before the error will have been
+                yielded already.
+        """
+        return iterparse(
+            self,
+            start_rule,
+            source,
+            chunk_size=chunk_size,
+            lookahead=lookahead,
+        )
+
+    def parse_many(
+        self,
+        start_rule: str,
+        texts: Iterable[str],
+        *,
+        workers: int | None = None,
+        chunk_size: int = DEFAULT_BATCH_CHUNK_SIZE,
+        ordered: bool = True,
+    ) -> Iterator[tuple[int, Pairs | PestParsingError]]:
+        """Parse each of `texts` in parallel, using a pool of worker processes.
+
+        Each worker process is initialized once with a parser module generated
+        from this parser's (optimized) rules. Parse trees are sent back to this
+        process as compact arrays, without a copy of their input text, and
+        returned as array-backed pairs, as if parsed with `arena=True`.
+
+        A parsing error for one input does not stop the batch. The error is
+        yielded in place of that input's pairs.
+
+        `texts` is read lazily, two windows of `chunk_size` inputs per worker
+        ahead of the results being consumed, so a long or unbounded iterable
+        of inputs is not held in memory all at once.
+
+        Args:
+            start_rule: The name of the rule to start parsing from.
+            texts: The input strings to parse.
+            workers: The number of worker processes. Defaults to the number of
+                CPUs.
+            chunk_size: The number of inputs sent to a worker at a time.
+            ordered: If True, results are yielded in the same order as `texts`.
+                If False, results are yielded as soon as they are ready.
+
+        Returns:
+            Iterator[tuple[int, Pairs | PestParsingError]]: `(index, result)`
+                tuples, where `index` is the position of the input in `texts`
+                and `result` is its parse tree or a `PestParsingError`.
+
+        Raises:
+            KeyError: If `start_rule` is not a valid rule name.
+        """
+        return parse_many(
+            self,
+            start_rule,
+            texts,
+            workers=workers,
+            chunk_size=chunk_size,
+            ordered=ordered,
+        )
+
+    def parse_document(self, start_rule: str, text: str) -> Document:
+        """Parse `text` into a `Document` that can be re-parsed after edits.
+
+        The document keeps a memo table for every rule that is safe to memoize,
+        regardless of this parser's memoization options, so it uses more memory
+        than the `Pairs` returned from `parse()`.
+
+        Args:
+            start_rule: The name of the rule to start parsing from.
+            text: The input string to parse.
+
+        Returns:
+            Document: The parsed document. Its parse tree is `document.pairs`.
+
+        Raises:
+            KeyError: If `start_rule` is not a valid rule name.
+            PestParsingError: If the input `text` cannot be parsed according to the
+                grammar.
+        """
+        return parse_document(self, start_rule, text)
+
+    def reparse(
+        self,
+        document: Document,
+        edits: Iterable[Edit],
+        *,
+        lookahead: int = DEFAULT_LOOKAHEAD,
+    ) -> Document:
+        """Apply text edits to `document` and parse it again, incrementally.
+
+        Rules that matched away from the edits are replayed from the
+        document's memo table instead of being parsed again. `document` is
+        updated in place and returned. Pairs from earlier parses are not
+        changed. Reused pairs are views of them, at their new positions.
+
+        If the edited text can't be parsed, `document.text` is still updated
+        and `document.pairs` is set to `None`, so the document can be re-parsed
+        again after further edits.
+
+        Args:
+            document: A document returned from `parse_document()`.
+            edits: `(start, old_end, new_text)` tuples, each replacing
+                `document.text[start:old_end]` with `new_text`. Edits are
+                applied in order, so each edit's positions refer to the text
+                after the edits before it.
+            lookahead: The number of characters past the end of a match that
+                the grammar might look at. A rule that matched before an edit is
+                only reused if the edit starts more than `lookahead` characters
+                after the end of the match.
+
+        Returns:
+            Document: `document`, with a new parse tree.
+
+        Raises:
+            ValueError: If an edit is out of range.
+            PestParsingError: If the edited text cannot be parsed according to
+                the grammar.
+        """
+        return reparse(self, document, edits, lookahead=lookahead)
+
+    def _new_state(
+        self,
+        text: str,
+        start_pos: int,
+        *,
+        profile: bool = False,
+        tracer: Tracer | None = None,
+    ) -> ParserState:
+        cls = self.state_class
+        if profile:
+            cls = profiling_state_class(cls)
+        if tracer is not None:
+            cls = tracing_state_class(cls)
+
+        state = cls(text, start_pos, self)
+        if profile:
+            state.profile_stats = self.profile_stats  # type: ignore[attr-defined]
+        state.tracer = tracer
+
+        if self.memo_rules:
+            state.memo = Memo(self.memo_rules, self.memo_capacity, self.memo_stats)
+        return state
+
+    def generate(
+        self, *, bytes_input: bool = False, profile: bool = False, trace: bool = False
+    ) -> str:
         """Return a generated parser as Python module source code.
 
+        If this parser was created with memoization enabled, the generated
+        parser memoizes the same rules, with the same memo capacity. Likewise,
+        generated parsers honour `lazy_errors`.
+
+        Args:
+            bytes_input: If True, generate a parser for UTF-8 encoded
+                bytes-like input instead of strings. See `bytes_parser()`.
+            profile: If True, generate a parser that records per-rule counts
+                and timings in its module-level `profile_stats`, for every
+                parse.
+            trace: If True, generate a parser whose `parse()` function accepts
+                a `tracer` argument. See `pest.trace`.
+
         Returns:
             str: The generated Python source code for the parser.
         """
-        return generate_module(self.rules)
+        if bytes_input:
+            return self.bytes_parser().generate(profile=profile, trace=trace)
+
+        return generate_module(
+            self.rules,
+            memo_rules=self.memo_rules,
+            memo_capacity=self.memo_capacity,
+            lazy_errors=self.lazy_errors,
+            profile=profile,
+            trace=trace,
+        )
+
+    def compile(
+        self, *, bytes_input: bool = False, profile: bool = False, trace: bool = False
+    ) -> CompiledParser:
+        """Generate, compile and load a parser module for this grammar.
+
+        The returned parser has the same `parse()` API as this parser. To
+        cache generated modules on disk between processes, use
+        `pest.load_parser()` instead.
+
+        Args:
+            bytes_input: If True, compile a parser for UTF-8 encoded
+                bytes-like input instead of strings.
+            profile: If True, compile a parser that records per-rule counts and
+                timings in `CompiledParser.profile_stats`.
+            trace: If True, compile a parser that accepts a `tracer` argument
+                to `CompiledParser.parse()`.
+
+        Returns:
+            CompiledParser: A parser backed by generated code.
+        """
+        return CompiledParser.from_source(
+            self.generate(bytes_input=bytes_input, profile=profile, trace=trace)
+        )
 
     def tree_view(self) -> str:
         """Return a tree view for each non-built-in rule in this grammar.
@@ -9,18 +9,28 @@ from typing import ClassVar
 from typing import Generic
 from typing import TypeVar
 
+from .precedence import Op
+from .precedence import compile_ops
+
 if TYPE_CHECKING:
     from pest import Pair
     from pest import Stream
 
 ExprT = TypeVar("ExprT")
 
+_Tables = tuple[dict[str, int], dict[str, int], dict[str, tuple[int, bool]]]
+
 
 class PrattParser(ABC, Generic[ExprT]):
     """Generic Pratt parser base class operating on a pest `Stream` of `Pair`s.
 
     Subclasses define how to construct AST nodes by overriding the four
     abstract parse_* methods and providing operator-precedence tables.
+
+    Operator-precedence tables are combined into a single lookup table the
+    first time an instance parses an expression, and again whenever the tables
+    change. Expressions are parsed with an explicit stack rather than
+    recursion, so long expressions don't hit Python's recursion limit.
     """
 
     PREFIX_OPS: ClassVar[dict[str, int]] = {}
@@ -46,6 +56,28 @@ class PrattParser(ABC, Generic[ExprT]):
     improved readability.
     """
 
+    _ops_cache: tuple[_Tables, dict[str, Op]] | None = None
+    """Copies of the tables `_ops()` was last compiled from, and the result."""
+
+    def compile_ops(self) -> dict[str, Op]:
+        """Combine operator-precedence tables into one lookup table.
+
+        Each rule name maps to a tuple of (prefix precedence, is postfix,
+        infix precedence, minimum precedence of the infix operator's right hand
+        side). Precedences are `None` if the rule is not that kind of operator.
+        """
+        return compile_ops(self.PREFIX_OPS, self.POSTFIX_OPS, self.INFIX_OPS)
+
+    def _ops(self) -> dict[str, Op]:
+        """Return the combined lookup table, compiling it if the tables changed."""
+        tables = (self.PREFIX_OPS, self.POSTFIX_OPS, self.INFIX_OPS)
+        cache = self._ops_cache
+        if cache is None or cache[0] != tables:
+            # Copy the tables so changes made in place are noticed too.
+            copies = (dict(tables[0]), dict(tables[1]), dict(tables[2]))
+            cache = self._ops_cache = (copies, self.compile_ops())
+        return cache[1]
+
     @abstractmethod
     def parse_primary(self, pair: Pair) -> ExprT:
         """Parse a primary expression: literal, variable, or parenthesized."""
@@ -63,41 +95,62 @@ class PrattParser(ABC, Generic[ExprT]):
         """Build a node for an infix operator expression."""
 
     def parse_expr(self, stream: Stream, min_prec: int = 0) -> ExprT:
-        """Parse an expression from a pest `Stream` using Pratt precedence rules."""
-        token: Pair | None = stream.next()
-        if token is None:
-            raise SyntaxError("Unexpected end of expression")
-
-        # Handle prefix operators or primary expression
-        if token.name in self.PREFIX_OPS:
-            prec = self.PREFIX_OPS[token.name]
-            rhs = self.parse_expr(stream, prec)
-            left: ExprT = self.parse_prefix(token, rhs)
-        else:
-            left = self.parse_primary(token)
+        """Parse an expression from a pest `Stream` using Pratt precedence rules.
+
+        The stream's position is updated when the expression is complete, not
+        after each token.
+        """
+        # An explicit stack of operators waiting for their right hand side,
+        # instead of recursing for each operator. Each frame is a tuple of
+        # (op, lhs, min_prec to restore, is_prefix).
+        stack: list[tuple[Pair, ExprT | None, int, bool]] = []
+        table = self._ops()
+        pairs = stream.pairs
+        pos = stream.pos
+        end = len(pairs)
 
-        # Handle infix and postfix operators
         while True:
-            next_token: Pair | None = stream.peek()
-            if next_token is None:
-                break
-
-            # Postfix operator
-            if next_token.name in self.POSTFIX_OPS:
-                stream.next()
-                left = self.parse_postfix(left, next_token)
+            # Prefix operators or primary expression.
+            if pos >= end:
+                stream.pos = pos
+                raise SyntaxError("Unexpected end of expression")
+
+            token = pairs[pos]
+            pos += 1
+            op = table.get(token.name)
+
+            if op is not None and op[0] is not None:
+                stack.append((token, None, min_prec, True))
+                min_prec = op[0]
                 continue
 
-            # Infix operator
-            if next_token.name in self.INFIX_OPS:
-                prec, right_assoc = self.INFIX_OPS[next_token.name]
-                if prec < min_prec:
-                    break
-                stream.next()
-                rhs = self.parse_expr(stream, prec + (0 if right_assoc else 1))
-                left = self.parse_infix(left, next_token, rhs)
-                continue
-
-            break
+            left = self.parse_primary(token)
 
-        return left
+            # Infix and postfix operators.
+            while True:
+                if pos < end:
+                    token = pairs[pos]
+                    op = table.get(token.name)
+
+                    if op is not None:
+                        if op[1]:
+                            pos += 1
+                            left = self.parse_postfix(left, token)
+                            continue
+
+                        if op[2] is not None and op[2] >= min_prec:
+                            pos += 1
+                            stack.append((token, left, min_prec, False))
+                            min_prec = op[3]
+                            break
+
+                # This operand is complete.
+                if not stack:
+                    stream.pos = pos
+                    return left
+
+                token, lhs, min_prec, is_prefix = stack.pop()
+                if is_prefix:
+                    left = self.parse_prefix(token, left)
+                else:
+                    left = self.parse_infix(lhs, token, left)  # type: ignore[arg-type]
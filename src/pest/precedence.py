@@ -0,0 +1,204 @@
+"""Operator precedence for grammar rules, applied while parsing.
+
+A rule written as a flat list of operands and operators, like
+
+    expr = { prefix* ~ primary ~ postfix* ~ (infix ~ prefix* ~ primary ~ postfix*)* }
+
+is parsed in a single loop, without one rule per precedence level. When the
+rule is given an operator table with `Parser(..., operators={"expr": ...})`, its
+flat children are folded into nested pairs before the rule's own pair is
+created. Every nested pair is another pair for the same rule, with children
+`[lhs, op, rhs]` for infix operators, `[op, operand]` for prefix operators and
+`[operand, op]` for postfix operators.
+
+Folding uses the same precedence and associativity rules as `PrattParser`.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from typing import TypeAlias
+from typing import cast
+
+from .pairs import Pair
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from .grammar.rule import Rule
+    from .state import ParserState
+    from .state import RuleFrame
+
+Op: TypeAlias = tuple[int | None, bool, int | None, int]
+"""Prefix precedence, is postfix, infix precedence and right hand side minimum
+precedence for one operator rule."""
+
+
+def compile_ops(
+    prefix: Mapping[str, int],
+    postfix: Mapping[str, int],
+    infix: Mapping[str, tuple[int, bool]],
+) -> dict[str, Op]:
+    """Combine operator-precedence tables into one lookup table.
+
+    Each rule name maps to a tuple of (prefix precedence, is postfix, infix
+    precedence, minimum precedence of the infix operator's right hand side).
+    Precedences are `None` if the rule is not that kind of operator.
+    """
+    ops: dict[str, Op] = {}
+    for name in (*prefix, *postfix, *infix):
+        infix_op = infix.get(name)
+        ops[name] = (
+            prefix.get(name),
+            name in postfix,
+            infix_op[0] if infix_op else None,
+            infix_op[0] + (0 if infix_op[1] else 1) if infix_op else 0,
+        )
+    return ops
+
+
+class Operators:
+    """An operator-precedence table for a grammar rule.
+
+    Operators are named by rule. Higher precedence binds tighter.
+
+    Args:
+        prefix: Mapping of prefix operator rule names to precedence levels.
+        postfix: Mapping of postfix operator rule names to precedence levels.
+        infix: Mapping of infix operator rule names to (precedence,
+            right_associative).
+
+    Attributes:
+        ops: The combined lookup table used when parsing.
+    """
+
+    __slots__ = ("infix", "ops", "postfix", "prefix")
+
+    LEFT_ASSOC = False
+    """An alias for `False`, for use as right_associative in `infix` values."""
+
+    RIGHT_ASSOC = True
+    """An alias for `True`, for use as right_associative in `infix` values."""
+
+    def __init__(
+        self,
+        *,
+        prefix: Mapping[str, int] | None = None,
+        postfix: Mapping[str, int] | None = None,
+        infix: Mapping[str, tuple[int, bool]] | None = None,
+    ):
+        # Rule names might be `StrEnum` members from a generated parser.
+        self.prefix = {str(k): v for k, v in (prefix or {}).items()}
+        self.postfix = {str(k): v for k, v in (postfix or {}).items()}
+        self.infix = {str(k): v for k, v in (infix or {}).items()}
+        self.ops = compile_ops(self.prefix, self.postfix, self.infix)
+
+    def __repr__(self) -> str:
+        return (
+            f"Operators(prefix={self.prefix!r}, postfix={self.postfix!r}, "
+            f"infix={self.infix!r})"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Operators) and self.ops == other.ops
+
+    def __hash__(self) -> int:
+        return hash(tuple(self.ops.items()))
+
+
+def fold_operators(  # noqa: PLR0912
+    state: ParserState,
+    rule: Rule | RuleFrame,
+    ops: Mapping[str, Op],
+    children: list[Pair],
+    pairs: list[Pair],
+) -> bool:
+    """Fold a flat list of operand and operator pairs into nested pairs.
+
+    The children of the outermost operator, or the only operand, are appended
+    to `pairs`. Nested operator expressions become pairs for `rule`.
+
+    Returns:
+        False if `children` is not a complete expression according to `ops`.
+    """
+    arena = state.arena
+
+    if arena is None:
+        names = [pair.name for pair in children]
+    else:
+        # Arena node ids stand in for pairs while parsing.
+        rules = arena.rules
+        rule_ids = arena.rule
+        names = [rules[rule_ids[cast("int", node)]].name for node in children]
+
+    def node(parts: list[Pair]) -> Pair:
+        """Return a pair for an operand, creating one for operator expressions."""
+        if len(parts) == 1:
+            return parts[0]
+        if arena is None:
+            return Pair(
+                state.input,
+                parts[0].start,
+                parts[-1].end,
+                rule,
+                parts,
+                line_index=state.line_index,
+            )
+        nodes = cast("list[int]", parts)
+        return cast(
+            "Pair",
+            arena.add(rule, arena.start[nodes[0]], arena.end[nodes[-1]], nodes, None),
+        )
+
+    # Operators waiting for their right hand side. Each frame is a tuple of
+    # (op, lhs, min_prec to restore, is_prefix).
+    stack: list[tuple[Pair, list[Pair] | None, int, bool]] = []
+    min_prec = 0
+    pos = 0
+    end = len(children)
+
+    while True:
+        # Prefix operators or an operand.
+        if pos >= end:
+            return False
+
+        op = ops.get(names[pos])
+        if op is not None and op[0] is not None:
+            stack.append((children[pos], None, min_prec, True))
+            min_prec = op[0]
+            pos += 1
+            continue
+
+        left = [children[pos]]
+        pos += 1
+
+        # Infix and postfix operators.
+        while True:
+            if pos < end:
+                op = ops.get(names[pos])
+
+                if op is not None:
+                    if op[1]:
+                        left = [node(left), children[pos]]
+                        pos += 1
+                        continue
+
+                    if op[2] is not None and op[2] >= min_prec:
+                        stack.append((children[pos], left, min_prec, False))
+                        min_prec = op[3]
+                        pos += 1
+                        break
+
+            # This operand is complete.
+            if not stack:
+                if pos < end:
+                    return False
+                pairs.extend(left)
+                return True
+
+            token, lhs, min_prec, is_prefix = stack.pop()
+            if is_prefix:
+                left = [token, node(left)]
+            else:
+                assert lhs is not None
+                left = [node(lhs), token, node(left)]
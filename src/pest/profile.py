@@ -0,0 +1,269 @@
+"""Per-rule profiling for parsers.
+
+Profiling is chosen when rules are compiled, not checked while parsing. A
+profiled parser wraps each rule's parse function with `profile_rule()`, which
+records call counts, outcomes, time spent, input consumed and pairs created
+for the rule, and parses with a state class from `profiling_state_class()`,
+which counts backtracking `restore()` calls against the innermost rule being
+parsed. Parsers that aren't profiled contain none of this code.
+
+`Parser.parse(..., profile=True)` profiles rules compiled to closures, like a
+parser created with `closures=True`. Generated parsers are profiled when they
+are generated with `profile=True`.
+"""
+
+from __future__ import annotations
+
+from time import perf_counter_ns
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .memo import ParseFunc
+    from .pairs import Pair
+    from .state import ParserState
+
+
+class RuleProfile:
+    """Counts and timings for one rule.
+
+    Times are in nanoseconds. Inclusive time is the time spent in a rule and
+    every rule it calls, counting recursive calls once. Exclusive time is the
+    time spent in a rule, excluding time spent in other profiled rules.
+
+    Attributes:
+        calls: The number of times the rule was parsed.
+        successes: The number of times the rule matched.
+        failures: The number of times the rule failed to match.
+        inclusive_ns: Time spent in the rule, including the rules it calls.
+        exclusive_ns: Time spent in the rule, excluding the rules it calls.
+        backtracks: The number of backtracking `restore()` calls made while
+            this was the innermost rule being parsed.
+        consumed: Characters, or bytes for bytes-like input, consumed by
+            successful matches.
+        pairs: Pairs created for the rule, including pairs that were later
+            discarded by backtracking. Silent rules don't create pairs.
+    """
+
+    __slots__ = (
+        "backtracks",
+        "calls",
+        "consumed",
+        "depth",
+        "exclusive_ns",
+        "failures",
+        "inclusive_ns",
+        "pairs",
+        "successes",
+    )
+
+    FIELDS = (
+        "calls",
+        "successes",
+        "failures",
+        "inclusive_ns",
+        "exclusive_ns",
+        "backtracks",
+        "consumed",
+        "pairs",
+    )
+    """The names of reported fields, in report order."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.successes = 0
+        self.failures = 0
+        self.inclusive_ns = 0
+        self.exclusive_ns = 0
+        self.backtracks = 0
+        self.consumed = 0
+        self.pairs = 0
+        self.depth = 0  # The number of active calls, for recursive rules.
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)}" for name in self.FIELDS)
+        return f"RuleProfile({fields})"
+
+    def reset(self) -> None:
+        """Clear all counts and timings."""
+        for name in self.FIELDS:
+            setattr(self, name, 0)
+        self.depth = 0
+
+    def as_dict(self) -> dict[str, int]:
+        """Return counts and timings as a dictionary."""
+        return {name: getattr(self, name) for name in self.FIELDS}
+
+
+class ProfileStats:
+    """Per-rule counts and timings, accumulated over many parses.
+
+    Attributes:
+        rules: A mapping of rule names to `RuleProfile` instances, for every
+            profiled rule, including rules that have not been called.
+    """
+
+    __slots__ = ("rules", "stack", "child_ns")
+
+    def __init__(self) -> None:
+        self.rules: dict[str, RuleProfile] = {}
+
+        # Profiles of rules currently being parsed, innermost last, and time
+        # spent in the rules they have called so far.
+        self.stack: list[RuleProfile] = []
+        self.child_ns: list[int] = []
+
+    def __repr__(self) -> str:
+        calls = sum(profile.calls for profile in self.rules.values())
+        return f"ProfileStats(rules={len(self.rules)}, calls={calls})"
+
+    def rule(self, rule_name: str) -> RuleProfile:
+        """Return the profile for the rule named `rule_name`, creating it if needed."""
+        profile = self.rules.get(rule_name)
+        if profile is None:
+            profile = self.rules[rule_name] = RuleProfile()
+        return profile
+
+    def reset(self) -> None:
+        """Clear all counts and timings.
+
+        Profiles are reset in place, so profiled rules keep recording into
+        them.
+        """
+        for profile in self.rules.values():
+            profile.reset()
+        self.stack.clear()
+        self.child_ns.clear()
+
+    def as_dict(self) -> dict[str, dict[str, int]]:
+        """Return a JSON-like dictionary mapping called rule names to their counts."""
+        return {
+            name: profile.as_dict()
+            for name, profile in sorted(self.rules.items())
+            if profile.calls
+        }
+
+    def report(self, sort_by: str = "exclusive_ns") -> str:
+        """Return a table of called rules, sorted by `sort_by`, largest first.
+
+        Args:
+            sort_by: One of the field names in `RuleProfile.FIELDS`.
+
+        Raises:
+            ValueError: If `sort_by` is not a field name.
+        """
+        if sort_by not in RuleProfile.FIELDS:
+            raise ValueError(
+                f"can't sort by {sort_by!r}, "
+                f"expected one of {', '.join(RuleProfile.FIELDS)}"
+            )
+
+        rows = sorted(
+            ((name, profile) for name, profile in self.rules.items() if profile.calls),
+            key=lambda row: (-getattr(row[1], sort_by), row[0]),
+        )
+
+        width = max(len("rule"), *(len(name) for name, _ in rows))
+        header = (
+            f"{'rule':<{width}}  {'calls':>10}  {'ok':>10}  {'fail':>10}  "
+            f"{'incl ms':>10}  {'excl ms':>10}  {'backtracks':>10}  "
+            f"{'consumed':>10}  {'pairs':>10}"
+        )
+        lines = [header]
+
+        for name, profile in rows:
+            lines.append(
+                f"{name:<{width}}  {profile.calls:>10}  {profile.successes:>10}  "
+                f"{profile.failures:>10}  {profile.inclusive_ns / 1e6:>10.3f}  "
+                f"{profile.exclusive_ns / 1e6:>10.3f}  {profile.backtracks:>10}  "
+                f"{profile.consumed:>10}  {profile.pairs:>10}"
+            )
+
+        return "\n".join(lines)
+
+
+def profile_rule(
+    rule_name: str, func: ParseFunc, stats: ProfileStats, *, silent: bool = False
+) -> ParseFunc:
+    """Wrap a rule's parse function, recording its counts and timings in `stats`.
+
+    The returned function only records parses with a profiling state, see
+    `profiling_state_class()`.
+
+    Args:
+        rule_name: The name of the rule parsed by `func`.
+        func: The rule's parse function.
+        stats: Where to record counts and timings.
+        silent: True if the rule is silent, so doesn't create pairs.
+    """
+    profile = stats.rule(rule_name)
+    stack = stats.stack
+    child_ns = stats.child_ns
+
+    def profiled(state: ParserState, pairs: list[Pair]) -> bool:
+        if getattr(state, "profile_stats", None) is None:
+            return func(state, pairs)
+
+        start = state.pos
+        pairs_before = len(pairs)
+        stack.append(profile)
+        child_ns.append(0)
+        profile.depth += 1
+        t0 = perf_counter_ns()
+
+        try:
+            matched = func(state, pairs)
+        finally:
+            elapsed = perf_counter_ns() - t0
+            profile.depth -= 1
+            stack.pop()
+            children = child_ns.pop()
+            if child_ns:
+                child_ns[-1] += elapsed
+
+        profile.calls += 1
+        profile.exclusive_ns += elapsed - children
+        if not profile.depth:
+            profile.inclusive_ns += elapsed
+
+        if matched:
+            profile.successes += 1
+            profile.consumed += state.pos - start
+            if not silent:
+                profile.pairs += len(pairs) - pairs_before
+        else:
+            profile.failures += 1
+
+        return matched
+
+    profiled.__doc__ = func.__doc__
+    return profiled
+
+
+_profiling_state_classes: dict[type[ParserState], type[ParserState]] = {}
+
+
+def profiling_state_class(cls: type[ParserState]) -> type[ParserState]:
+    """Return a subclass of `cls` that counts backtracking in `profile_stats`.
+
+    Instances must have their `profile_stats` attribute set before parsing.
+    Subclasses are created once per state class.
+    """
+    if subclass := _profiling_state_classes.get(cls):
+        return subclass
+
+    def restore(self: ParserState) -> None:
+        stack = self.profile_stats.stack  # type: ignore[attr-defined]
+        if stack:
+            stack[-1].backtracks += 1
+        cls.restore(self)
+
+    subclass = _profiling_state_classes[cls] = type(
+        f"Profiling{cls.__name__}",
+        (cls,),
+        {
+            "__slots__": ("profile_stats",),
+            "__doc__": f"A `{cls.__name__}` that counts backtracking.",
+            "restore": restore,
+        },
+    )
+    return subclass
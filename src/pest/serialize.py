@@ -0,0 +1,280 @@
+"""A compact binary encoding for parse trees.
+
+Pickling `Pair` objects attribute by attribute would store a reference to the
+input, the rule and the tag, name and children of every node. `dump_pairs()` instead
+writes a table of rule names and tags, followed by one row of variable length
+integers per node, in preorder:
+
+- the index of the node's rule in the rule table
+- the index of the node's tag in the tag table, plus one, or zero for no tag
+- the node's start position, relative to the end of its previous sibling or the
+  start of its parent, zigzag encoded
+- the length of the node's span
+- the number of children
+
+Input text is only included if asked for. `load_pairs()` needs the input text
+from the caller otherwise.
+
+Pickled pairs use this encoding too, with the input text and rules pickled
+alongside it by reference, so pairs from the same parse share them.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from .grammar.rule import Rule
+from .lines import line_index
+from .pairs import Pair
+from .pairs import Pairs
+from .state import RuleFrame
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from collections.abc import Mapping
+
+    from .grammar.encode import BytesLike
+    from .lines import LineIndex
+
+MAGIC = b"PEST"
+VERSION = 1
+
+_HAS_INPUT = 1
+_BYTES_INPUT = 2
+
+
+def dump_pairs(pairs: Pairs, *, include_input: bool = False) -> bytes:
+    """Return a compact binary encoding of `pairs`. See `Pairs.to_bytes()`."""
+    return _dump(_encode(pairs), include_input=include_input)
+
+
+def reduce_pairs(pairs: Pairs) -> tuple[LineIndex, bytes, dict[str, Rule]]:
+    """Return arguments for `load_pairs()` that pickle well.
+
+    The input text is carried by the pairs' shared line index, and rules by
+    reference, so pickling many pairs from one parse, in one pickle, stores
+    the input and each rule once.
+    """
+    encoder = _encode(pairs)
+    rules = {rule.name: rule for rule in encoder.rules if isinstance(rule, Rule)}
+    pair = pairs[0] if pairs else None
+    lines = pair.line_index if pair is not None else None
+    if lines is None or lines.text is not encoder.text:
+        lines = line_index(encoder.text)
+    return lines, _dump(encoder, include_input=False), rules
+
+
+def _encode(pairs: Pairs) -> _Encoder:
+    roots = list(pairs)
+    # Input is bytes-like if it was parsed as bytes.
+    text: str | BytesLike = roots[0].input if roots else ""
+    encoder = _Encoder(text)
+    encoder.encode(roots)
+    return encoder
+
+
+def _dump(encoder: _Encoder, *, include_input: bool) -> bytes:
+    text = encoder.text
+    flags = 0
+    encoded = b""
+    if include_input:
+        if isinstance(text, str):
+            flags = _HAS_INPUT
+            encoded = text.encode()
+        else:
+            flags = _HAS_INPUT | _BYTES_INPUT
+            encoded = bytes(text)
+
+    out = bytearray(MAGIC)
+    out.append(VERSION)
+    out.append(flags)
+
+    _write_varint(out, len(encoder.rules))
+    for rule in encoder.rules:
+        _write_bytes(out, rule.name.encode())
+        _write_varint(out, rule.modifier)
+
+    _write_varint(out, len(encoder.tag_ids))
+    for tag in encoder.tag_ids:
+        _write_bytes(out, tag.encode())
+
+    if flags & _HAS_INPUT:
+        _write_bytes(out, encoded)
+
+    out += encoder.body
+    return bytes(out)
+
+
+class _Encoder:
+    """Encode pairs, collecting their rules and tags."""
+
+    __slots__ = ("body", "rule_ids", "rules", "tag_ids", "text")
+
+    def __init__(self, text: str | BytesLike):
+        self.text = text
+        self.rule_ids: dict[str, int] = {}
+        self.rules: list[Rule | RuleFrame] = []
+        self.tag_ids: dict[str, int] = {}
+        self.body = bytearray()
+
+    def encode(self, roots: list[Pair]) -> None:
+        body = self.body
+        text = self.text
+        _write_varint(body, len(roots))
+        stack: list[tuple[Iterator[Pair], int]] = [(iter(roots), 0)]
+
+        while stack:
+            children, cursor = stack[-1]
+            pair = next(children, None)
+            if pair is None:
+                stack.pop()
+                continue
+
+            if pair.input is not text and pair.input != text:
+                raise ValueError("can't encode pairs with different inputs")
+
+            delta = pair.start - cursor
+            _write_varint(body, self.rule_id(pair))
+            _write_varint(body, self.tag_id(pair.tag))
+            _write_varint(body, delta << 1 if delta >= 0 else (~delta << 1) | 1)
+            _write_varint(body, pair.end - pair.start)
+            _write_varint(body, len(pair.children))
+
+            stack[-1] = (children, pair.end)
+            if pair.children:
+                stack.append((iter(pair.children), pair.start))
+
+    def rule_id(self, pair: Pair) -> int:
+        rule_id = self.rule_ids.get(pair.name)
+        if rule_id is None:
+            rule_id = self.rule_ids[pair.name] = len(self.rules)
+            self.rules.append(pair.rule)
+        return rule_id
+
+    def tag_id(self, tag: str | None) -> int:
+        """Return the tag's index in the tag table plus one, or zero for no tag."""
+        if tag is None:
+            return 0
+        tag_id = self.tag_ids.get(tag)
+        if tag_id is None:
+            tag_id = self.tag_ids[tag] = len(self.tag_ids) + 1
+        return tag_id
+
+
+def load_pairs(
+    data: bytes,
+    input_: str | BytesLike | None = None,
+    *,
+    rules: Mapping[str, Rule] | None = None,
+) -> Pairs:
+    """Decode pairs encoded with `dump_pairs()`. See `Pairs.from_bytes()`."""
+    if data[:4] != MAGIC:
+        raise ValueError("not an encoded parse tree")
+
+    if data[4] != VERSION:
+        raise ValueError(f"unsupported parse tree encoding version {data[4]}")
+
+    flags = data[5]
+    reader = _Reader(data, 6)
+
+    frames: list[Rule | RuleFrame] = []
+    for _ in range(reader.varint()):
+        name = reader.bytes().decode()
+        modifier = reader.varint()
+        rule = rules.get(name) if rules is not None else None
+        frames.append(rule or RuleFrame(name, modifier))
+
+    tags = [reader.bytes().decode() for _ in range(reader.varint())]
+
+    text: str | BytesLike
+    if flags & _HAS_INPUT:
+        encoded = reader.bytes()
+        text = encoded if flags & _BYTES_INPUT else encoded.decode()
+        if input_ is not None:
+            text = input_
+    elif input_ is None:
+        raise ValueError("encoded parse tree has no input, so input_ is required")
+    else:
+        text = input_
+
+    lines = line_index(text)
+    varint = reader.varint
+    roots: list[Pair] = []
+    stack: list[tuple[list[Pair], int, int]] = [(roots, varint(), 0)]
+
+    while stack:
+        siblings, remaining, cursor = stack[-1]
+        if not remaining:
+            stack.pop()
+            continue
+
+        frame = frames[varint()]
+        tag_id = varint()
+        delta = varint()
+        start = cursor + (~(delta >> 1) if delta & 1 else delta >> 1)
+        end = start + varint()
+        n_children = varint()
+
+        pair = Pair(
+            text,  # type: ignore[arg-type]
+            start,
+            end,
+            frame,
+            None,
+            tags[tag_id - 1] if tag_id else None,
+            lines,
+        )
+        siblings.append(pair)
+
+        stack[-1] = (siblings, remaining - 1, end)
+        if n_children:
+            stack.append((pair.children, n_children, start))
+
+    return Pairs(roots)
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    """Append `value` to `out` as an unsigned LEB128 integer."""
+    while value > 0x7F:  # noqa: PLR2004
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _write_bytes(out: bytearray, value: bytes) -> None:
+    """Append `value` to `out`, prefixed with its length."""
+    _write_varint(out, len(value))
+    out += value
+
+
+class _Reader:
+    """Read variable length integers and byte strings from encoded data."""
+
+    __slots__ = ("data", "pos")
+
+    def __init__(self, data: bytes, pos: int):
+        self.data = data
+        self.pos = pos
+
+    def varint(self) -> int:
+        data = self.data
+        pos = self.pos
+        byte = data[pos]
+        pos += 1
+        value = byte & 0x7F
+        shift = 7
+
+        while byte & 0x80:
+            byte = data[pos]
+            pos += 1
+            value |= (byte & 0x7F) << shift
+            shift += 7
+
+        self.pos = pos
+        return value
+
+    def bytes(self) -> bytes:
+        length = self.varint()
+        value = self.data[self.pos : self.pos + length]
+        self.pos += length
+        return value
@@ -6,15 +6,21 @@ from contextlib import contextmanager
 from typing import TYPE_CHECKING
 
 from .checkpoint_int import SnapshottingInt
+from .grammar.expression import Expression
+from .grammar.expressions.terminals import Identifier
 from .grammar.rule import Rule
+from .lines import line_index
 from .stack import Stack
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
     from collections.abc import Sequence
 
+    from .arena import Arena
+    from .memo import Memo
     from .pairs import Pair
     from .parser import Parser
+    from .trace import Tracer
 
 
 class ParserState:
@@ -33,17 +39,22 @@ class ParserState:
     __slots__ = (
         "_pos_history",
         "_suppress_failures",
+        "arena",
         "atomic_depth",
         "furthest_expected",
         "furthest_pos",
         "furthest_stack",
         "furthest_unexpected",
         "input",
+        "line_index",
+        "memo",
         "neg_pred_depth",
         "parser",
         "pos",
         "rule_stack",
         "tag_stack",
+        "tracer",
+        "track_failures",
         "user_stack",
     )
 
@@ -53,11 +64,16 @@ class ParserState:
         self.input = text
         self.pos = start_pos
         self.parser = parser  # Always None in generated code.
+        self.line_index = line_index(text)  # Shared by pairs and errors.
+        self.memo: Memo | None = None  # Packrat memo table, if memoization is enabled.
+        self.arena: Arena | None = None  # Array-backed parse tree, if enabled.
+        self.tracer: Tracer | None = None  # Event hooks, if tracing.
 
         # Negative predicate depth
         self.neg_pred_depth = 0
 
         # Failure tracking
+        self.track_failures = True  # False on the fast path with lazy errors.
         self.furthest_pos = -1
         self.furthest_expected: dict[str, list[str]] = {}
         self.furthest_unexpected: dict[str, list[str]] = {}
@@ -221,7 +237,11 @@ class ParserState:
         force: bool = False,
     ) -> None:
         """Record a failure, inferring expected vs. unexpected context."""
-        if (self.neg_pred_depth > 0 and not force) or self._suppress_failures:
+        if (
+            not self.track_failures
+            or (self.neg_pred_depth > 0 and not force)
+            or self._suppress_failures
+        ):
             return
 
         is_neg_context = self.neg_pred_depth % 2 == 1
@@ -248,6 +268,81 @@ class ParserState:
                 target[rule_name] = [label]
 
 
+class UserStackParserState(ParserState):
+    """Parser state for grammars that use the stack.
+
+    `rule_stack` and `atomic_depth` are always restored by the rule that
+    changed them, before any enclosing expression backtracks, so checkpoints
+    only need to save the current position and the user stack.
+    """
+
+    __slots__ = ()
+
+    def checkpoint(self) -> None:
+        """Take a snapshot of the current position and user stack."""
+        self.user_stack.snapshot()
+        self._pos_history.append(self.pos)
+
+    def ok(self) -> None:
+        """Discard the last checkpoint."""
+        self.user_stack.drop_snapshot()
+        self._pos_history.pop()
+
+    def restore(self) -> None:
+        """Restore the position and user stack from the last checkpoint."""
+        self.user_stack.restore()
+        self.pos = self._pos_history.pop()
+
+
+class StacklessParserState(ParserState):
+    """Parser state for grammars that don't use the stack.
+
+    Checkpoints only need to save the current position.
+    """
+
+    __slots__ = ()
+
+    def checkpoint(self) -> None:
+        """Save the current position."""
+        self._pos_history.append(self.pos)
+
+    def ok(self) -> None:
+        """Discard the last saved position."""
+        self._pos_history.pop()
+
+    def restore(self) -> None:
+        """Restore the last saved position."""
+        self.pos = self._pos_history.pop()
+
+
+def state_class(rules: dict[str, Rule]) -> type[ParserState]:
+    """Return the cheapest `ParserState` class that can parse `rules`.
+
+    Grammars that never touch the user stack (`PUSH`, `POP`, `PEEK`, `DROP`,
+    etc.) get a state class that only checkpoints the current position.
+    """
+    if any(_uses_stack(rule.expression, rules) for rule in rules.values()):
+        return UserStackParserState
+    return StacklessParserState
+
+
+def _uses_stack(expr: Expression, rules: dict[str, Rule]) -> bool:
+    """Return True if `expr` touches the user stack, not counting referenced rules."""
+    if isinstance(expr, Identifier):
+        # Every rule is checked by `state_class`.
+        return False
+
+    # Expressions that override `is_pure` are the ones that can have side
+    # effects. See `pest.memo._has_side_effects`.
+    if (
+        not isinstance(expr, Rule)
+        and type(expr).is_pure is not Expression.is_pure
+        and not expr.is_pure(rules)
+    ):
+        return True
+    return any(_uses_stack(child, rules) for child in expr.children())
+
+
 class RuleFrame:
     """Rule meta data for the generated rule stack.
 
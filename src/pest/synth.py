@@ -0,0 +1,720 @@
+"""Generate random input text from a grammar.
+
+An `InputGenerator` walks a parser's rule tree and produces random text that
+the grammar accepts, of roughly a target size. Generated inputs are useful for
+benchmarking how parse time grows with input size, and as seeds for searching
+for slow inputs.
+
+Generation follows the structure of the grammar:
+
+- Choices pick a random alternative. Outside of repetitions, alternatives
+  that are expected to generate more text are more likely, so the input can
+  grow.
+- Repetitions repeat a random number of times. The outermost repetitions of
+  items that are expected to be longer than one character are repeated until
+  the input reaches the target size. Once a repetition like that has
+  generated enough distinct items, further items are drawn from those.
+- Implicit whitespace is inserted between items of non-atomic rules, always
+  between repeated items, and sometimes between parts of a sequence. Comments
+  are only generated where a rule refers to `COMMENT` explicitly.
+- Predicates don't generate anything. Instead, rules that produce short text
+  are parsed after they are generated, as are repeated items following the
+  item before them, and generated again if the parser disagrees. So
+  predicates like `(!"'" ~ ANY)*` are honoured.
+
+Past `max_depth` nested rules, and once a nested repetition has used up the
+size budget, generation falls back to the shortest derivation of each rule, so
+recursive grammars always terminate.
+
+Generate from a parser created with `optimizer=None`. Optimized rules replace
+grammar expressions with regular expressions that can't be walked.
+"""
+
+from __future__ import annotations
+
+import random
+from math import inf
+from math import log
+from typing import TYPE_CHECKING
+
+from .grammar.compiler import Compiler
+from .grammar.expression import RegexExpression
+from .grammar.expressions import Choice
+from .grammar.expressions import CIString
+from .grammar.expressions import Drop
+from .grammar.expressions import Group
+from .grammar.expressions import Identifier
+from .grammar.expressions import NegativePredicate
+from .grammar.expressions import Optional
+from .grammar.expressions import Peek
+from .grammar.expressions import PeekAll
+from .grammar.expressions import PeekSlice
+from .grammar.expressions import Pop
+from .grammar.expressions import PopAll
+from .grammar.expressions import PositivePredicate
+from .grammar.expressions import Precedence
+from .grammar.expressions import Push
+from .grammar.expressions import PushLiteral
+from .grammar.expressions import Range
+from .grammar.expressions import Repeat
+from .grammar.expressions import RepeatExact
+from .grammar.expressions import RepeatMax
+from .grammar.expressions import RepeatMin
+from .grammar.expressions import RepeatMinMax
+from .grammar.expressions import RepeatOnce
+from .grammar.expressions import Sequence
+from .grammar.expressions import String
+from .grammar.rule import ATOMIC
+from .grammar.rule import COMPOUND
+from .grammar.rule import NONATOMIC
+from .grammar.rule import BuiltInRule
+from .grammar.rule import Rule
+from .grammar.rules.special import EOI
+from .grammar.rules.special import SOI
+from .grammar.rules.special import Any
+
+if TYPE_CHECKING:
+    from collections.abc import Collection
+    from collections.abc import Set
+
+    from .grammar.expression import Expression
+    from .memo import ParseFunc
+    from .parser import Parser
+
+Cost = tuple[float, float]
+"""The length and rule depth of an expression's shortest derivation."""
+
+PRINTABLE = [chr(c) for c in range(0x20, 0x7F)]
+
+# Characters to try for Unicode property rules, which are matched with regular
+# expressions.
+CANDIDATES = PRINTABLE + [
+    chr(c) for c in (*range(0xA0, 0x250), *range(0x370, 0x400), *range(0x4E00, 0x4E40))
+]
+
+CHECK_MAX_LENGTH = 64
+"""Rules that generate text up to this length are checked by parsing it."""
+
+CHECK_ATTEMPTS = 20
+"""The number of times to generate a rule again if its text doesn't parse."""
+
+FILL_POOL_SIZE = 200
+"""The number of items generated for a repetition that fills the input.
+
+Further items are drawn from those already generated, so large inputs are
+generated quickly.
+"""
+
+MAX_EXPECTED_LENGTH = 1e6
+"""Expected lengths of recursive rules are capped at this length."""
+
+
+class InputGenerator:
+    """Generate random input text accepted by a parser's grammar.
+
+    Args:
+        parser: The parser whose rules to generate input for. Use a parser
+            created with `optimizer=None`.
+        seed: A seed for the random number generator, for reproducible input.
+        max_depth: The number of nested rules after which generation uses the
+            shortest derivation of each rule.
+        repeat_p: The probability of another item in nested repetitions.
+        trivia_p: The probability of implicit whitespace between parts of
+            sequences in non-atomic rules.
+    """
+
+    def __init__(
+        self,
+        parser: Parser,
+        *,
+        seed: int | None = None,
+        max_depth: int = 12,
+        repeat_p: float = 0.5,
+        trivia_p: float = 0.3,
+    ):
+        self.parser = parser
+        self.rules = parser.rules
+        self.random = random.Random(seed)  # noqa: S311
+        self.max_depth = max_depth
+        self.repeat_p = repeat_p
+        self.trivia_p = trivia_p
+
+        # Comments usually end at a line break, which might not follow.
+        self.whitespace = self.rules.get("WHITESPACE")
+
+        self._stack_rules = _stack_rules(self.rules)
+        self._costs = self._rule_costs()
+        self._expected = self._expected_lengths()
+        self._regex_candidates: dict[str, list[str]] = {}
+        self._checked: dict[tuple[str, str, bool], bool] = {}
+
+        # Checks parse with rules compiled to closures, which is faster than
+        # walking the rule tree.
+        self._compiler = Compiler(self.rules)
+        self._parse_funcs: dict[int, ParseFunc] = {}
+
+        # Per-input generation state.
+        self._target = 0
+        self._size = 0
+        self._depth = 0
+        self._repeat_depth = 0
+        self._stack: list[str] = []
+
+    def generate(self, start_rule: str, size: int = 1000, *, attempts: int = 10) -> str:
+        """Return random input of about `size` characters for `start_rule`.
+
+        Generated input is parsed with `parser` before it is returned. Valid
+        inputs shorter than half of `size`, which happen when a random choice
+        near the start rule leads away from repetition, are generated again,
+        keeping the longest.
+
+        Args:
+            start_rule: The name of the rule to generate input for.
+            size: The target size of the input, in characters. Inputs can be
+                shorter if the grammar doesn't allow repetition, or longer by
+                up to the size of one repeated item.
+            attempts: The number of inputs to generate before returning the
+                longest valid input, or giving up.
+
+        Raises:
+            KeyError: If `start_rule` is not a rule name.
+            TypeError: If the rule uses an expression that can't be generated,
+                like an optimized regular expression.
+            ValueError: If none of the generated inputs are accepted by the
+                grammar.
+        """
+        rule = self.rules[start_rule]
+        if self._costs[rule.name][0] == inf:
+            raise ValueError(f"rule {start_rule!r} can't match any input")
+
+        longest: str | None = None
+
+        for _ in range(attempts):
+            self._target = size
+            self._size = 0
+            self._depth = 0
+            self._repeat_depth = 0
+            self._stack = []
+
+            text = self._rule(rule, atomic=False)
+            if longest is not None and len(text) <= len(longest):
+                continue
+
+            if not self._matches(rule, text, atomic=False):
+                continue
+
+            if len(text) * 2 >= size:
+                return text
+            longest = text
+
+        if longest is not None:
+            return longest
+
+        raise ValueError(
+            f"failed to generate valid input for {start_rule!r} in {attempts} attempts"
+        )
+
+    def _rule(self, rule: Rule, *, atomic: bool) -> str:
+        if isinstance(rule, Any):
+            return self._emit(self.random.choice(PRINTABLE))
+        if isinstance(rule, (SOI, EOI)):
+            return ""
+
+        if rule.modifier & (ATOMIC | COMPOUND) or rule.name in (
+            "COMMENT",
+            "WHITESPACE",
+        ):
+            inner_atomic = True
+        elif rule.modifier & NONATOMIC:
+            inner_atomic = False
+        else:
+            inner_atomic = atomic
+
+        self._depth += 1
+        size = self._size
+        stack = self._stack[:]
+
+        try:
+            for _ in range(CHECK_ATTEMPTS):
+                text = self._expr(rule.expression, atomic=inner_atomic)
+                if (
+                    len(text) > CHECK_MAX_LENGTH
+                    or isinstance(rule, BuiltInRule)
+                    or rule.name in self._stack_rules
+                    or self._check(rule, text, atomic=atomic)
+                ):
+                    break
+
+                self._size = size
+                self._stack = stack[:]
+        finally:
+            self._depth -= 1
+
+        return text
+
+    def _check(self, rule: Rule, text: str, *, atomic: bool) -> bool:
+        """Return True if `rule` matches all of `text`, caching the result."""
+        key = (rule.name, text, atomic)
+        matched = self._checked.get(key)
+        if matched is None:
+            matched = self._checked[key] = self._matches(rule, text, atomic=atomic)
+        return matched
+
+    def _matches(self, expr: Expression, text: str, *, atomic: bool) -> bool:
+        """Return True if `expr` matches all of `text`."""
+        state = self.parser._new_state(text, 0)  # noqa: SLF001
+        state.track_failures = False
+        if atomic:
+            state.atomic_depth += 1
+        return self._parse_func(expr)(state, []) and state.pos == len(text)
+
+    def _check_items(self, expr: Expression, text: str, *, atomic: bool) -> bool:
+        """Return True if `text` is one or more repetitions of `expr`.
+
+        Implicit whitespace is parsed before each repetition, unless `atomic`
+        is True.
+        """
+        state = self.parser._new_state(text, 0)  # noqa: SLF001
+        state.track_failures = False
+        if atomic:
+            state.atomic_depth += 1
+
+        parse = self._parse_func(expr)
+        while True:
+            if not atomic:
+                state.parse_trivia([])
+            pos = state.pos
+            if not parse(state, []) or state.pos == pos:
+                return False
+            if state.pos == len(text):
+                return True
+
+    def _parse_func(self, expr: Expression) -> ParseFunc:
+        # Expressions are keyed by identity. They live as long as the rules.
+        func = self._parse_funcs.get(id(expr))
+        if func is None:
+            func = self._parse_funcs[id(expr)] = self._compiler.compile(expr)
+        return func
+
+    def _emit(self, text: str) -> str:
+        self._size += len(text)
+        return text
+
+    @property
+    def _minimal(self) -> bool:
+        """True if generation should use the shortest derivations."""
+        return self._depth > self.max_depth
+
+    def _trivia(self, *, atomic: bool, always: bool = False) -> str:
+        if (
+            atomic
+            or not self.whitespace
+            or (not always and self.random.random() >= self.trivia_p)
+        ):
+            return ""
+        return self._rule(self.whitespace, atomic=True)
+
+    def _expr(self, expr: Expression, *, atomic: bool) -> str:  # noqa: PLR0911, PLR0912
+        rand = self.random
+
+        if isinstance(expr, Rule):
+            return self._rule(expr, atomic=atomic)
+
+        if isinstance(expr, Identifier):
+            return self._rule(self.rules[expr.value], atomic=atomic)
+
+        if isinstance(expr, String):
+            return self._emit(expr.value)
+
+        if isinstance(expr, CIString):
+            return self._emit(
+                "".join(
+                    c.upper() if rand.random() < 0.5 else c.lower()  # noqa: PLR2004
+                    for c in expr.value
+                )
+            )
+
+        if isinstance(expr, Range):
+            return self._emit(self._range(expr.start, expr.stop))
+
+        if isinstance(expr, RegexExpression):
+            candidates = self._candidates(expr)
+            if not candidates:
+                raise TypeError(f"can't generate input for {expr}")
+            return self._emit(rand.choice(candidates))
+
+        if isinstance(expr, Sequence):
+            parts: list[str] = []
+            for i, child in enumerate(expr.expressions):
+                if i:
+                    parts.append(self._trivia(atomic=atomic))
+                parts.append(self._expr(child, atomic=atomic))
+            return "".join(parts)
+
+        if isinstance(expr, Choice):
+            alternatives = [
+                child for child in expr.expressions if self._cost(child)[0] != inf
+            ]
+            if self._minimal:
+                child = min(alternatives, key=self._cost)
+            elif not self._repeat_depth:
+                # Outside of repetitions, prefer alternatives that can grow to
+                # fill the input.
+                child = rand.choices(
+                    alternatives,
+                    [
+                        _expected(alt, self._expected, self.repeat_p) + 1
+                        for alt in alternatives
+                    ],
+                )[0]
+            else:
+                child = rand.choice(alternatives)
+            return self._expr(child, atomic=atomic)
+
+        if isinstance(expr, (Group, Precedence)):
+            return self._expr(expr.expression, atomic=atomic)
+
+        if isinstance(expr, Optional):
+            if self._minimal or rand.random() >= self.repeat_p:
+                return ""
+            return self._expr(expr.expression, atomic=atomic)
+
+        if isinstance(expr, (PositivePredicate, NegativePredicate)):
+            return ""
+
+        if isinstance(
+            expr, (Repeat, RepeatOnce, RepeatExact, RepeatMin, RepeatMax, RepeatMinMax)
+        ):
+            return self._repeat(expr, atomic=atomic)
+
+        return self._stack_expr(expr, atomic=atomic)
+
+    def _repeat(  # noqa: PLR0912
+        self,
+        expr: Repeat | RepeatOnce | RepeatExact | RepeatMin | RepeatMax | RepeatMinMax,
+        *,
+        atomic: bool,
+    ) -> str:
+        if isinstance(expr, RepeatOnce):
+            low, high = 1, inf
+        elif isinstance(expr, RepeatExact):
+            low, high = expr.number, expr.number
+        elif isinstance(expr, RepeatMin):
+            low, high = expr.number, inf
+        elif isinstance(expr, RepeatMax):
+            low, high = 0, expr.number
+        elif isinstance(expr, RepeatMinMax):
+            low, high = expr.min, expr.max
+        else:
+            low, high = 0, inf
+
+        # The outermost repetitions of multi-character items fill the input.
+        fill = (
+            not self._repeat_depth
+            and high == inf
+            and not self._minimal
+            and _expected(expr.expression, self._expected, self.repeat_p) >= 2  # noqa: PLR2004
+        )
+
+        parts: list[str] = []
+        count = 0
+        self._repeat_depth += 1
+
+        # Items are checked, and items of repetitions that fill the input are
+        # kept for reuse, unless they use the stack.
+        check = not _uses_stack(expr.expression, self._stack_rules)
+        pool: list[str] | None = [] if fill and check else None
+
+        try:
+            while count < high:
+                if count >= low:
+                    if self._minimal:
+                        break
+                    if fill:
+                        if self._size >= self._target:
+                            break
+                    elif (
+                        self._size >= self._target
+                        or self.random.random() >= self.repeat_p
+                    ):
+                        break
+
+                previous = parts[-1] if parts else ""
+                item = self._item(
+                    expr.expression,
+                    previous,
+                    pool,
+                    atomic=atomic,
+                    check=check,
+                    attempts=CHECK_ATTEMPTS if fill or count < low else 1,
+                )
+                if item is None:
+                    if count >= low:
+                        break
+                    item = self._item(
+                        expr.expression,
+                        previous,
+                        pool,
+                        atomic=atomic,
+                        check=False,
+                    )
+                    assert item is not None
+
+                parts.append(item)
+                count += 1
+        finally:
+            self._repeat_depth -= 1
+
+        return "".join(parts)
+
+    def _item(  # noqa: PLR0913
+        self,
+        expr: Expression,
+        previous: str,
+        pool: list[str] | None,
+        *,
+        atomic: bool,
+        check: bool,
+        attempts: int = 1,
+    ) -> str | None:
+        """Generate an item of a repetition, following the `previous` item.
+
+        Items after the first start with implicit whitespace, unless `atomic`
+        is True. If `check` is True, items are parsed following the `previous`
+        item, and generated again up to `attempts` times if that fails, so one
+        bad item doesn't spoil the input. None is returned if every attempt
+        fails.
+
+        Good items are added to `pool`, if it is not None. Once `pool` is
+        full, items are drawn from it instead of being generated.
+        """
+        size = self._size
+        stack = self._stack[:]
+
+        for _ in range(attempts):
+            # Whitespace between items keeps their tokens apart.
+            trivia = self._trivia(atomic=atomic, always=True) if previous else ""
+            if pool is not None and len(pool) >= FILL_POOL_SIZE:
+                item = self._emit(self.random.choice(pool))
+            else:
+                item = self._expr(expr, atomic=atomic)
+
+            if not check:
+                return trivia + item
+
+            if self._check_items(expr, previous + trivia + item, atomic=atomic):
+                if pool is not None and len(pool) < FILL_POOL_SIZE:
+                    pool.append(item)
+                return trivia + item
+
+            self._size = size
+            self._stack = stack[:]
+
+        return None
+
+    def _stack_expr(self, expr: Expression, *, atomic: bool) -> str:  # noqa: PLR0911
+        stack = self._stack
+
+        if isinstance(expr, Push):
+            text = self._expr(expr.expression, atomic=atomic)
+            stack.append(text)
+            return text
+
+        if isinstance(expr, PushLiteral):
+            stack.append(expr.value)
+            return ""
+
+        if isinstance(expr, Peek):
+            return self._emit(stack[-1] if stack else "")
+
+        if isinstance(expr, Pop):
+            return self._emit(stack.pop() if stack else "")
+
+        if isinstance(expr, Drop):
+            if stack:
+                stack.pop()
+            return ""
+
+        if isinstance(expr, PeekAll):
+            return self._emit("".join(reversed(stack)))
+
+        if isinstance(expr, PopAll):
+            text = "".join(reversed(stack))
+            stack.clear()
+            return self._emit(text)
+
+        if isinstance(expr, PeekSlice):
+            return self._emit("".join(stack[slice(expr.start, expr.stop)]))
+
+        raise TypeError(f"can't generate input for {expr.__class__.__name__} {expr}")
+
+    def _range(self, start: str, stop: str) -> str:
+        lo, hi = ord(start), ord(stop)
+
+        # Prefer printable ASCII where the range allows it.
+        if lo <= 0x7E and hi >= 0x20 and self.random.random() < 0.9:  # noqa: PLR2004
+            lo, hi = max(lo, 0x20), min(hi, 0x7E)
+
+        while True:
+            c = self.random.randint(lo, hi)
+            if not 0xD800 <= c <= 0xDFFF:  # noqa: PLR2004
+                return chr(c)
+
+    def _candidates(self, expr: RegexExpression) -> list[str]:
+        candidates = self._regex_candidates.get(expr.pattern)
+        if candidates is None:
+            candidates = self._regex_candidates[expr.pattern] = [
+                c for c in CANDIDATES if expr.regex.fullmatch(c)
+            ]
+        return candidates
+
+    def _cost(self, expr: Expression) -> Cost:
+        """Return the length and depth of the shortest derivation of `expr`."""
+        return _cost(expr, self._costs)
+
+    def _rule_costs(self) -> dict[str, Cost]:
+        """Find the shortest derivation of every rule, until nothing changes."""
+        costs: dict[str, Cost] = dict.fromkeys(self.rules, (inf, inf))
+
+        for _ in range(len(self.rules) + 1):
+            changed = False
+            for name, rule in self.rules.items():
+                if isinstance(rule, Any):
+                    cost: Cost = (1, 1)
+                else:
+                    length, depth = _cost(rule.expression, costs)
+                    cost = (length, depth + 1)
+                if cost < costs[name]:
+                    costs[name] = cost
+                    changed = True
+            if not changed:
+                break
+
+        return costs
+
+    def _expected_lengths(self) -> dict[str, float]:
+        """Estimate the average length of text generated for every rule."""
+        lengths: dict[str, float] = dict.fromkeys(self.rules, 0)
+
+        # Recursive rules converge slowly, if at all. A rough estimate will do.
+        for _ in range(20):
+            for name, rule in self.rules.items():
+                if isinstance(rule, Any):
+                    lengths[name] = 1
+                else:
+                    lengths[name] = min(
+                        _expected(rule.expression, lengths, self.repeat_p),
+                        MAX_EXPECTED_LENGTH,
+                    )
+
+        return lengths
+
+
+def fit_exponent(sizes: Collection[float], values: Collection[float]) -> float:
+    """Return the least squares slope of log(values) against log(sizes).
+
+    The slope is the exponent of the curve `values = c * sizes ** k`, about 1
+    if values grow linearly with size and 2 if they grow quadratically.
+    Returns 0 if all sizes are the same.
+    """
+    xs = [log(size) for size in sizes]
+    ys = [log(value) for value in values]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    covariance = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys, strict=True))
+    variance = sum((x - mean_x) ** 2 for x in xs)
+    return covariance / variance if variance else 0.0
+
+
+STACK_EXPRESSIONS = (Push, PushLiteral, Peek, Pop, Drop, PeekAll, PopAll, PeekSlice)
+
+
+def _stack_rules(rules: dict[str, Rule]) -> frozenset[str]:
+    """Return the names of rules that use the stack, directly or indirectly.
+
+    Rules that use the stack can't be checked in isolation, because their
+    text depends on what was pushed before them.
+    """
+    names: set[str] = set()
+    changed = True
+    while changed:
+        changed = False
+        for name, rule in rules.items():
+            if name not in names and _uses_stack(rule.expression, names):
+                names.add(name)
+                changed = True
+    return frozenset(names)
+
+
+def _uses_stack(expr: Expression, stack_rules: Set[str]) -> bool:
+    if isinstance(expr, STACK_EXPRESSIONS):
+        return True
+    if isinstance(expr, Identifier):
+        return expr.value in stack_rules
+    if isinstance(expr, Rule):
+        return expr.name in stack_rules
+    return any(_uses_stack(child, stack_rules) for child in expr.children())
+
+
+def _cost(expr: Expression, costs: dict[str, Cost]) -> Cost:  # noqa: PLR0911
+    if isinstance(expr, Identifier):
+        return costs[expr.value]
+    if isinstance(expr, Rule):
+        return costs[expr.name]
+    if isinstance(expr, (String, CIString)):
+        return len(expr.value), 0
+    if isinstance(expr, (Range, RegexExpression)):
+        return 1, 0
+    if isinstance(expr, Sequence):
+        children = [_cost(child, costs) for child in expr.expressions]
+        return sum(c[0] for c in children), max((c[1] for c in children), default=0)
+    if isinstance(expr, Choice):
+        return min(_cost(child, costs) for child in expr.expressions)
+    if isinstance(expr, (RepeatOnce, Group, Precedence, Push)):
+        return _cost(expr.expression, costs)
+    if isinstance(expr, (RepeatExact, RepeatMin)):
+        length, depth = _cost(expr.expression, costs)
+        return length * expr.number if expr.number else 0, depth if expr.number else 0
+    if isinstance(expr, RepeatMinMax):
+        length, depth = _cost(expr.expression, costs)
+        return length * expr.min if expr.min else 0, depth if expr.min else 0
+    return 0, 0
+
+
+def _expected(  # noqa: PLR0911, PLR0912
+    expr: Expression, lengths: dict[str, float], repeat_p: float
+) -> float:
+    """Estimate the average length of text generated for `expr`."""
+    more = repeat_p / (1 - repeat_p)  # The mean number of optional repeats.
+
+    if isinstance(expr, Identifier):
+        return lengths[expr.value]
+    if isinstance(expr, Rule):
+        return lengths[expr.name]
+    if isinstance(expr, (String, CIString)):
+        return len(expr.value)
+    if isinstance(expr, (Range, RegexExpression)):
+        return 1
+    if isinstance(expr, Sequence):
+        return sum(_expected(child, lengths, repeat_p) for child in expr.expressions)
+    if isinstance(expr, Choice):
+        return sum(
+            _expected(child, lengths, repeat_p) for child in expr.expressions
+        ) / len(expr.expressions)
+    if isinstance(expr, (Group, Precedence, Push)):
+        return _expected(expr.expression, lengths, repeat_p)
+    if isinstance(expr, Optional):
+        return repeat_p * _expected(expr.expression, lengths, repeat_p)
+    if isinstance(expr, Repeat):
+        return more * _expected(expr.expression, lengths, repeat_p)
+    if isinstance(expr, RepeatOnce):
+        return (1 + more) * _expected(expr.expression, lengths, repeat_p)
+    if isinstance(expr, RepeatExact):
+        return expr.number * _expected(expr.expression, lengths, repeat_p)
+    if isinstance(expr, RepeatMin):
+        return (expr.number + more) * _expected(expr.expression, lengths, repeat_p)
+    if isinstance(expr, RepeatMax):
+        return min(expr.number, more) * _expected(expr.expression, lengths, repeat_p)
+    if isinstance(expr, RepeatMinMax):
+        return (expr.min + expr.max) / 2 * _expected(expr.expression, lengths, repeat_p)
+    return 0
@@ -0,0 +1,141 @@
+"""Tracing hooks for parsers.
+
+A `Tracer` receives an event when a rule is entered, when it exits, when a
+terminal fails to match and when the parser backtracks to a checkpoint.
+Subclass `Tracer` and override the events you need, then pass an instance to
+`Parser.parse(..., tracer=...)`.
+
+The tree-walking interpreter checks `ParserState.tracer` once per rule, and
+rule exits reuse that check. Rules compiled to closures, and generated
+parsers, only include tracing code if they are compiled or generated with
+tracing enabled. Terminal failures and restores are reported by a subclass of
+the parser's state class, from `tracing_state_class()`, which is only used
+when tracing.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .memo import ParseFunc
+    from .pairs import Pair
+    from .state import ParserState
+
+
+class Tracer:
+    """Base class for parser event hooks. Every event does nothing by default.
+
+    Built-in rules, like `ASCII_DIGIT`, might not be reported, depending on how
+    the parser inlines them. With memoization enabled, rules answered from the
+    memo table are not reported.
+    """
+
+    __slots__ = ()
+
+    def enter(self, rule_name: str, pos: int) -> None:
+        """Called before parsing the rule named `rule_name` at `pos`."""
+
+    def exit(self, rule_name: str, matched: bool, start: int, end: int) -> None:  # noqa: FBT001
+        """Called after parsing the rule named `rule_name`.
+
+        `start` is the position the rule started from. `end` is the position
+        after the rule, which is meaningless if the rule did not match.
+        """
+
+    def fail(self, label: str, pos: int) -> None:
+        """Called when a terminal, described by `label`, fails to match at `pos`."""
+
+    def restore(self, from_pos: int, to_pos: int) -> None:
+        """Called when the parser backtracks from `from_pos` to a checkpoint."""
+
+
+class TraceLog(Tracer):
+    """A tracer that records every event as a tuple, in order.
+
+    Events are `("enter", rule_name, pos)`, `("exit", rule_name, matched, start,
+    end)`, `("fail", label, pos)` and `("restore", from_pos, to_pos)`.
+
+    Attributes:
+        events: Recorded events.
+    """
+
+    __slots__ = ("events",)
+
+    def __init__(self) -> None:
+        self.events: list[tuple[object, ...]] = []
+
+    def enter(self, rule_name: str, pos: int) -> None:  # noqa: D102
+        self.events.append(("enter", rule_name, pos))
+
+    def exit(self, rule_name: str, matched: bool, start: int, end: int) -> None:  # noqa: D102, FBT001
+        self.events.append(("exit", rule_name, matched, start, end))
+
+    def fail(self, label: str, pos: int) -> None:  # noqa: D102
+        self.events.append(("fail", label, pos))
+
+    def restore(self, from_pos: int, to_pos: int) -> None:  # noqa: D102
+        self.events.append(("restore", from_pos, to_pos))
+
+
+def trace_rule(rule_name: str, func: ParseFunc) -> ParseFunc:
+    """Wrap a rule's parse function with `enter` and `exit` events.
+
+    The returned function reports events to `state.tracer`, if one is set.
+    """
+
+    def traced(state: ParserState, pairs: list[Pair]) -> bool:
+        tracer = state.tracer
+        if tracer is None:
+            return func(state, pairs)
+
+        start = state.pos
+        tracer.enter(rule_name, start)
+        matched = func(state, pairs)
+        tracer.exit(rule_name, matched, start, state.pos)
+        return matched
+
+    traced.__doc__ = func.__doc__
+    return traced
+
+
+_tracing_state_classes: dict[type[ParserState], type[ParserState]] = {}
+
+
+def tracing_state_class(cls: type[ParserState]) -> type[ParserState]:
+    """Return a subclass of `cls` that reports failures and restores to its tracer.
+
+    Subclasses are created once per state class.
+    """
+    if subclass := _tracing_state_classes.get(cls):
+        return subclass
+
+    def restore(self: ParserState) -> None:
+        from_pos = self.pos
+        cls.restore(self)
+        if self.tracer is not None:
+            self.tracer.restore(from_pos, self.pos)
+
+    def fail(
+        self: ParserState,
+        label: str,
+        *,
+        pos: int | None = None,
+        rule_name: str | None = None,
+        force: bool = False,
+    ) -> None:
+        if self.tracer is not None:
+            self.tracer.fail(label, pos or self.pos)
+        cls.fail(self, label, pos=pos, rule_name=rule_name, force=force)
+
+    subclass = _tracing_state_classes[cls] = type(
+        f"Tracing{cls.__name__}",
+        (cls,),
+        {
+            "__slots__": (),
+            "__doc__": f"A `{cls.__name__}` that reports to its tracer.",
+            "restore": restore,
+            "fail": fail,
+        },
+    )
+    return subclass
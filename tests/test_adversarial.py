@@ -0,0 +1,166 @@
+from time import perf_counter
+
+import pytest
+
+from pest import AdversarialSearch
+from pest import Parser
+from pest import WorkCounter
+
+# `a` scans every remaining "x" before failing to match "y", at every position.
+QUADRATIC = """
+s = { SOI ~ item* ~ EOI }
+item = { a | b | "," }
+a = { "x"* ~ "y" }
+b = { "x" }
+"""
+
+LINEAR = """
+s = { SOI ~ item* ~ EOI }
+item = { "x" ~ "y" | "," }
+"""
+
+# Linear, but a "y" costs much more work than an "x".
+UNEVEN = """
+s = { SOI ~ item* ~ EOI }
+item = { x | y }
+x = { "x" }
+y = { a | b | c | d | e | f | g | h | "y" }
+a = { "a" }
+b = { "b" }
+c = { "c" }
+d = { "d" }
+e = { "e" }
+f = { "f" }
+g = { "g" }
+h = { "h" }
+"""
+
+# Every unclosed "(" tries `t` three times, so work triples with each one.
+EXPONENTIAL = """
+e = { t ~ "+" ~ e | t ~ "-" ~ e | t }
+t = { "(" ~ e ~ ")" | ASCII_DIGIT+ }
+"""
+
+
+def test_work_counter() -> None:
+    parser = Parser.from_grammar(QUADRATIC, optimizer=None)
+    counter = WorkCounter()
+    parser.parse("s", "xxx", tracer=counter)
+
+    # At each "x" and at the end of input.
+    assert counter.attempts["a"] == 4  # noqa: PLR2004
+    assert counter.attempts["b"] == 4  # noqa: PLR2004
+    # `item` backtracks over 3, 2, 1 and then 0 "x" when `a` fails.
+    assert counter.backtracked["item"] == 6  # noqa: PLR2004
+    assert counter.total == sum(counter.by_rule().values())
+    assert next(iter(counter.by_rule())) == "item"
+
+    counter.reset()
+    assert counter.total == 0
+
+
+def test_work_grows_quadratically() -> None:
+    search = AdversarialSearch(Parser.from_grammar(QUADRATIC, optimizer=None), "s")
+    small = search.work("x" * 100).total
+    large = search.work("x" * 200).total
+    assert large > small * 3.5  # noqa: PLR2004
+
+
+def test_search_finds_super_linear_input() -> None:
+    search = AdversarialSearch(
+        Parser.from_grammar(QUADRATIC, optimizer=None),
+        "s",
+        seed=1,
+        max_length=64,
+    )
+    findings = search.search(["xy,x", "x,xy"], iterations=300, pump=2)
+
+    assert len(findings) == search.population
+    assert findings == sorted(findings, key=lambda f: f.work_per_byte, reverse=True)
+
+    found = search.super_linear(findings)
+    assert found
+    assert "x" in (found[0].pump or "")
+    assert next(iter(found[0].rules)) == "item"
+    assert "*" in search.report(findings)
+
+
+def test_work_limit() -> None:
+    search = AdversarialSearch(
+        Parser.from_grammar(EXPONENTIAL, optimizer=None), "e", max_work=10_000
+    )
+    start = perf_counter()
+    counter = search.work("(" * 30)
+    assert perf_counter() - start < 5  # noqa: PLR2004
+    assert counter.limited
+    assert 10_000 <= counter.total <= 10_000 + 30  # noqa: PLR2004
+
+    assert not search.work("(((1)))").limited
+    assert search.work("(" * 30, limit=100).total <= 100 + 30  # noqa: PLR2004
+
+
+def test_search_exponential_grammar() -> None:
+    search = AdversarialSearch(
+        Parser.from_grammar(EXPONENTIAL, optimizer=None),
+        "e",
+        seed=1,
+        max_length=64,
+        max_work=10_000,
+    )
+
+    start = perf_counter()
+    findings = search.search(["1+2", "(1)"], iterations=100_000, max_seconds=2)
+    assert perf_counter() - start < 10  # noqa: PLR2004
+    # A restore can overshoot the limit by the characters it backtracks over.
+    assert max(finding.work for finding in findings) <= 10_000 + 64  # noqa: PLR2004
+    found = search.super_linear(findings)
+    assert found
+    assert "(" in (found[0].pump or "")
+
+
+def test_search_linear_grammar() -> None:
+    search = AdversarialSearch(
+        Parser.from_grammar(LINEAR, optimizer=None),
+        "s",
+        seed=1,
+        max_length=64,
+    )
+    findings = search.search(["xy,xy"], iterations=300)
+    assert findings
+    assert not search.super_linear(findings)
+
+
+def test_uneven_work_per_byte_is_linear() -> None:
+    search = AdversarialSearch(Parser.from_grammar(UNEVEN, optimizer=None), "s")
+    text = "x" * 400 + "y"
+    assert search.work(text + "y").total - search.work(text).total == 20  # noqa: PLR2004
+
+    exponent, _ = search.growth(text)
+    assert exponent == pytest.approx(1, abs=0.05)
+
+    findings = search.search([text], iterations=0)
+    assert not search.super_linear(findings)
+
+
+def test_seeded_search_is_reproducible() -> None:
+    parser = Parser.from_grammar(QUADRATIC, optimizer=None)
+    first = AdversarialSearch(parser, "s", seed=3).search(["xy"], iterations=100)
+    second = AdversarialSearch(parser, "s", seed=3).search(["xy"], iterations=100)
+    assert [f.text for f in first] == [f.text for f in second]
+
+
+def test_recursion_error() -> None:
+    parser = Parser.from_grammar('a = { "[" ~ a? ~ "]" }', optimizer=None)
+    search = AdversarialSearch(parser, "a", seed=1, max_length=10_000)
+    findings = search.search(["[" * 10_000, "[]"], iterations=0, pump=0)
+    assert {f.text: f.recursion_error for f in findings} == {
+        "[" * 10_000: True,
+        "[]": False,
+    }
+    assert search.recursion_errors == {"[" * 10_000}
+
+
+def test_no_seeds() -> None:
+    search = AdversarialSearch(Parser.from_grammar(LINEAR, optimizer=None), "s")
+    with pytest.raises(ValueError, match="at least one seed"):
+        search.search([])
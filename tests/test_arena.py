@@ -0,0 +1,74 @@
+import pytest
+
+from pest import Pair
+from pest import Parser
+from pest.arena import Arena
+from pest.arena import ArenaPair
+
+from .conftest import ParserLike
+
+
+@pytest.fixture(scope="module")
+def grammar() -> str:
+    with open("tests/grammars/toml.pest", encoding="utf-8") as fd:
+        return fd.read()
+
+
+@pytest.fixture(scope="module")
+def data() -> str:
+    with open("tests/examples/example.toml", encoding="utf-8") as fd:
+        return fd.read()
+
+
+def test_arena_parse_tree(parser: ParserLike, data: str) -> None:
+    pairs = parser.parse("toml", data, arena=True)
+    assert isinstance(pairs.first(), ArenaPair)
+    assert pairs.dump() == parser.parse("toml", data).dump()
+
+
+def test_arena_pair_api(parser: ParserLike) -> None:
+    pairs = parser.parse("array", "[1, true]", arena=True)
+    pair = pairs.first()
+
+    assert pair.name == "array"
+    assert pair.text == "[1, true]"
+    assert pair.start == 0
+    assert pair.end == 9
+    assert pair.tag is None
+    assert pair.inner_texts == ["1", "true"]
+    assert [p.name for p in pair.inner()] == ["float", "boolean"]
+    assert [p.name for p in pairs.flatten()] == ["array", "float", "boolean"]
+    assert pair.dumps() == parser.parse("array", "[1, true]").first().dumps()
+
+    match pair:
+        case Pair("array", [Pair("float"), Pair("boolean", [])]):
+            pass
+        case _:
+            pytest.fail("unexpected parse tree")
+
+
+def test_arena_tags() -> None:
+    parser = Parser.from_grammar('expr = { #left=x ~ #right=x }\nx = { "x" }')
+    pairs = parser.parse("expr", "xx", arena=True)
+    assert [p.tag for p in pairs.first().inner()] == ["left", "right"]
+    assert pairs.find_first_tagged("right") is not None
+
+
+def test_arena_memo_replay() -> None:
+    # `empty` matches twice at the same position, the second time from the memo
+    # table.
+    parser = Parser.from_grammar(
+        'expr = { empty ~ empty ~ "x" }\nempty = { "" }', memoize=True
+    )
+    pairs = parser.parse("expr", "x", arena=True)
+    assert [p.name for p in pairs.first().inner()] == ["empty", "empty"]
+    assert pairs.dumps() == parser.parse("expr", "x").dumps()
+
+
+def test_arena_positions_past_32_bits() -> None:
+    parser = Parser.from_grammar('x = { "x" }')
+    arena = Arena("")
+    start = 2**31 + 5
+    node = arena.add(parser.rules["x"], start, start + 1, [], None)
+    pair = ArenaPair(arena, node)
+    assert (pair.start, pair.end) == (start, start + 1)
@@ -0,0 +1,213 @@
+from collections.abc import Callable
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from pest import DEFAULT_OPTIMIZER
+from pest import Optimizer
+from pest import Pairs
+from pest import Parser
+from pest import PestParsingError
+from pest.grammar import Expression
+from pest.grammar.expressions import AtomicRegex
+from pest.grammar.expressions import DispatchChoice
+
+GRAMMAR = r"""
+list = { SOI ~ item ~ ("," ~ item)* ~ EOI }
+item = { number | ident | string | keyword }
+number = @{ "-"? ~ int ~ ("." ~ ASCII_DIGIT+)? ~ (^"e" ~ ("+" | "-")? ~ ASCII_DIGIT+)? }
+int = @{ "0" | ASCII_NONZERO_DIGIT ~ ASCII_DIGIT* }
+ident = @{ !keyword ~ (ASCII_ALPHA | "_") ~ (ASCII_ALPHANUMERIC | "_")* }
+keyword = @{ (^"true" | ^"false" | ^"strasse") ~ !ASCII_ALPHANUMERIC }
+string = ${ "\"" ~ inner ~ "\"" }
+inner = @{ (!("\"" | "\\") ~ ANY)* ~ ("\\" ~ ANY ~ (!("\"" | "\\") ~ ANY)*)* }
+WHITESPACE = _{ " " }
+"""
+
+NO_REGEX = Optimizer(
+    [
+        step
+        for step in DEFAULT_OPTIMIZER.passes
+        if step.name not in ("atomic regex", "compound regex")
+    ]
+)
+
+
+def walk(expr: Expression) -> Iterator[Expression]:
+    yield expr
+    for child in expr.children():
+        yield from walk(child)
+
+
+def regexes(parser: Parser, rule: str) -> list[AtomicRegex]:
+    return [
+        expr
+        for expr in walk(parser.rules[rule].expression)
+        if isinstance(expr, AtomicRegex)
+    ]
+
+
+def outcome(parse: Callable[[str, str], Pairs], text: str) -> str:
+    try:
+        return parse("list", text).dumps()
+    except PestParsingError as err:
+        stack = " > ".join(frame.name for frame in err.state.furthest_stack)
+        return f"{err}\n{stack}"
+
+
+def test_atomic_rule_is_compiled_to_one_regex() -> None:
+    parser = Parser.from_grammar(GRAMMAR)
+    expr = parser.rules["number"].expression
+    assert isinstance(expr, AtomicRegex)
+    assert regexes(parser, "number") == [expr]
+    assert str(expr) == str(
+        Parser.from_grammar(GRAMMAR, optimizer=NO_REGEX).rules["number"].expression
+    )
+
+
+def test_identifiers_in_atomic_rules_are_inlined() -> None:
+    parser = Parser.from_grammar(GRAMMAR)
+    assert isinstance(parser.rules["ident"].expression, AtomicRegex)
+    assert "strasse" in parser.rules["ident"].expression.pattern
+
+
+def test_compound_rules_keep_identifiers() -> None:
+    parser = Parser.from_grammar(GRAMMAR)
+    assert not isinstance(parser.rules["string"].expression, AtomicRegex)
+    assert isinstance(parser.rules["inner"].expression, AtomicRegex)
+
+
+def test_non_atomic_rules_are_not_compiled() -> None:
+    parser = Parser.from_grammar('a = { "x" ~ "y"? }\nWHITESPACE = _{ " " }')
+    assert regexes(parser, "a") == []
+
+
+def test_sub_expressions_are_compiled() -> None:
+    parser = Parser.from_grammar('a = ${ ("x" ~ "y"?)* ~ b }\nb = { "z" }')
+    (expr,) = regexes(parser, "a")
+    assert expr.pattern == "(?:x(?:y)?+)*+"
+
+
+@pytest.mark.parametrize(
+    "grammar",
+    [
+        'a = @{ "x" ~ b }\nb = !{ "y" ~ "z" }',
+        'a = @{ "x" ~ a? }',
+        'a = @{ "x" ~ PUSH("y") ~ POP }',
+        'a = @{ #tag=("x") ~ "y" }',
+    ],
+)
+def test_expressions_that_are_not_compiled(grammar: str) -> None:
+    assert regexes(Parser.from_grammar(grammar), "a") == []
+
+
+@pytest.mark.parametrize(
+    ("grammar", "text", "end"),
+    [
+        ('a = @{ ("x" | "x" ~ "y") ~ "z" }', "xyz", None),
+        ('a = @{ "x"* ~ "x" }', "xxx", None),
+        ('a = @{ "x"? ~ "x" }', "x", None),
+        ('a = @{ ^"ss" ~ "!" }', "ß!", None),
+        ('a = @{ ^"ss" ~ "!" }', "sS!", 3),
+        ('a = @{ (!"y" ~ ANY)* ~ "y" }', "x\ny", 3),
+        ('a = @{ "x" ~ &"y" ~ ANY }', "xy", 2),
+        ('a = @{ "x" ~ EOI }', "x", 1),
+    ],
+)
+def test_peg_semantics(grammar: str, text: str, end: int | None) -> None:
+    optimized = Parser.from_grammar(grammar, lazy_errors=True)
+    assert regexes(optimized, "a")
+
+    for parser in (
+        optimized,
+        Parser.from_grammar(grammar, optimizer=NO_REGEX, lazy_errors=True),
+    ):
+        if end is None:
+            with pytest.raises(PestParsingError):
+                parser.parse("a", text)
+        else:
+            assert parser.parse("a", text).first().end == end
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "1, -0.5, 2e10, 3.25E-2, foo, _bar9",
+        '"hello", "a\\"b", true, Strasse, trueish',
+        "",
+        "-",
+        "true false",
+        "foo, ",
+        "?",
+    ],
+)
+@pytest.mark.parametrize(
+    ("lazy_errors", "memoize"), [(False, False), (True, False), (True, True)]
+)
+def test_same_result_as_without_regex(
+    text: str, *, lazy_errors: bool, memoize: bool
+) -> None:
+    parser = Parser.from_grammar(GRAMMAR, lazy_errors=lazy_errors, memoize=memoize)
+    closures = Parser.from_grammar(
+        GRAMMAR, lazy_errors=lazy_errors, memoize=memoize, closures=True
+    )
+    baseline = Parser.from_grammar(
+        GRAMMAR, optimizer=NO_REGEX, lazy_errors=lazy_errors, memoize=memoize
+    )
+
+    want = outcome(baseline.parse, text)
+    assert outcome(parser.parse, text) == want
+    assert outcome(closures.parse, text) == want
+    assert outcome(parser.compile().parse, text) == outcome(
+        baseline.compile().parse, text
+    )
+
+
+# Errors after a token the regex matched, which the original expression would
+# have reported from inside the token.
+@pytest.mark.parametrize(
+    ("text", "want"),
+    [
+        ("01", "expected list\n  -> list 1:2"),
+        ("1.", "expected list\n  -> list 1:2"),
+        ("1.5e", "expected list\n  -> list 1:4"),
+        ("1.5x", "expected list\n  -> list 1:4"),
+        ('"abc', "expected string\n  -> list > item > string 1:5"),
+    ],
+)
+@pytest.mark.parametrize("lazy_errors", [False, True])
+def test_errors_after_matched_tokens(
+    text: str, want: str, *, lazy_errors: bool
+) -> None:
+    parser = Parser.from_grammar(GRAMMAR, lazy_errors=lazy_errors)
+    closures = Parser.from_grammar(GRAMMAR, lazy_errors=lazy_errors, closures=True)
+
+    got = outcome(parser.parse, text)
+    assert got.startswith(want)
+    assert outcome(closures.parse, text) == got
+    assert outcome(parser.compile().parse, text) == got
+
+
+def test_choices_in_the_original_expression_dispatch() -> None:
+    parser = Parser.from_grammar('a = @{ "x" ~ "y" | "z" ~ "w" }')
+    (expr,) = regexes(parser, "a")
+    assert any(isinstance(e, DispatchChoice) for e in walk(expr.expression))
+
+
+def test_generated_parser_uses_regex() -> None:
+    assert "AtomicRegex" in Parser.from_grammar(GRAMMAR).generate()
+    assert "AtomicRegex" in Parser.from_grammar(GRAMMAR, lazy_errors=True).generate()
+
+
+def test_bytes_input() -> None:
+    parser = Parser.from_grammar(GRAMMAR, lazy_errors=True)
+    assert parser.parse("list", b"1.5, foo").first().end == 8  # noqa: PLR2004
+
+
+def test_save_and_load(tmp_path: Path) -> None:
+    path = tmp_path / "parser.pickle"
+    Parser.from_grammar(GRAMMAR).save(path)
+    parser = Parser.load(path, lazy_errors=True)
+    assert regexes(parser, "number")
+    assert parser.parse("list", "1.5e3").first().end == 5  # noqa: PLR2004
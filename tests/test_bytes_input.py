@@ -0,0 +1,146 @@
+import mmap
+from pathlib import Path
+
+import pytest
+
+from pest import DEFAULT_OPTIMIZER
+from pest import Optimizer
+from pest import Pair
+from pest import Parser
+from pest import PestParsingError
+from pest.grammar.encode import utf8_range_pattern
+from pest.grammar.exceptions import PestGrammarError
+
+EXAMPLE = '{"name": "Dragoș", "tags": ["π", "∑", "😀"], "n": -1.5e3, "ok": true}'
+
+
+class BytesParser:
+    """Parse bytes with one of the supported backends."""
+
+    def __init__(self, parser: Parser, *, generated: bool):
+        self.parser = parser
+        self.compiled = parser.compile(bytes_input=True) if generated else None
+
+    def parse(self, start_rule: str, data: bytes | memoryview | mmap.mmap) -> Pair:
+        if self.compiled:
+            return self.compiled.parse(start_rule, data).first()
+        return self.parser.parse(start_rule, data).first()
+
+
+@pytest.fixture(
+    scope="module",
+    params=[
+        "not optimized",
+        "optimized",
+        "optimized memoized",
+        "optimized closures",
+        "generated",
+        "optimized generated",
+    ],
+)
+def json_parser(request: pytest.FixtureRequest) -> BytesParser:
+    assert isinstance(request.param, str)
+    with open("tests/grammars/json.pest", encoding="utf-8") as fd:
+        grammar = fd.read()
+
+    parser = Parser.from_grammar(
+        grammar,
+        optimizer=DEFAULT_OPTIMIZER if "optimized" in request.param else None,
+        memoize="memoized" in request.param,
+        closures="closures" in request.param,
+    )
+    return BytesParser(parser, generated="generated" in request.param)
+
+
+def test_bytes_match_str(json_parser: BytesParser) -> None:
+    expected = json_parser.parser.parse("json", EXAMPLE).first()
+    pair = json_parser.parse("json", EXAMPLE.encode())
+    assert pair.dumps() == expected.dumps()
+    assert pair.inner_texts == expected.inner_texts
+
+
+def test_spans_are_byte_offsets(json_parser: BytesParser) -> None:
+    data = '["ș", "π"]'.encode()
+    values = json_parser.parse("array", data).children
+    assert [(v.start, v.end) for v in values] == [(1, 5), (7, 11)]
+    assert [str(v) for v in values] == ['"ș"', '"π"']
+    assert data[values[1].start : values[1].end] == '"π"'.encode()
+
+
+def test_memoryview_and_mmap(json_parser: BytesParser, tmp_path: Path) -> None:
+    data = EXAMPLE.encode()
+    expected = json_parser.parse("json", data).dumps()
+    assert json_parser.parse("json", memoryview(data)).dumps() == expected
+
+    path = tmp_path / "example.json"
+    path.write_bytes(data)
+
+    with path.open("rb") as fd, mmap.mmap(fd.fileno(), 0, access=mmap.ACCESS_READ) as m:
+        pair = json_parser.parse("json", m)
+        assert pair.dumps() == expected
+        del pair
+
+
+def test_parsing_error(json_parser: BytesParser) -> None:
+    with pytest.raises(PestParsingError) as exc:
+        json_parser.parse("json", '{\n  "π": tru\n}'.encode())
+
+    assert '2 |   "π": tru' in str(exc.value)
+
+
+def test_non_ascii_range() -> None:
+    parser = Parser.from_grammar("greek = { SOI ~ ('α'..'ω')+ ~ EOI }")
+    assert parser.parse("greek", "αβω".encode())
+    assert parser.parse("greek", "αβω")
+
+    with pytest.raises(PestParsingError):
+        parser.parse("greek", "αbω".encode())
+
+
+def test_utf8_range_pattern() -> None:
+    assert utf8_range_pattern("a", "z") == rb"[\x61-\x7a]"
+    assert utf8_range_pattern("\u0080", "߿") == rb"[\xc2-\xdf][\x80-\xbf]"
+
+
+def test_unsupported_grammar() -> None:
+    parser = Parser.from_grammar('quoted = { PUSH("\'") ~ ASCII_ALPHA* ~ POP }')
+    assert parser.parse("quoted", "'a'")
+
+    with pytest.raises(PestGrammarError):
+        parser.parse("quoted", b"'a'")
+
+    parser = Parser.from_grammar("word = { LETTER+ }")
+    with pytest.raises(PestGrammarError):
+        parser.parse("word", b"a")
+
+
+@pytest.mark.parametrize("optimizer", [None, DEFAULT_OPTIMIZER])
+@pytest.mark.parametrize("generated", [False, True])
+def test_unsupported_rules_are_only_an_error_when_reached(
+    optimizer: Optimizer | None, *, generated: bool
+) -> None:
+    grammar = """
+    pair = { SOI ~ key ~ "=" ~ value ~ EOI }
+    key = { ASCII_ALPHA+ }
+    value = { ASCII_DIGIT+ | quoted }
+    quoted = { PUSH("'") ~ word ~ POP }
+    word = { LETTER+ }
+    """
+    parser = BytesParser(
+        Parser.from_grammar(grammar, optimizer=optimizer), generated=generated
+    )
+    assert parser.parse("pair", b"a=1").end == 3  # noqa: PLR2004
+
+    with pytest.raises(PestGrammarError, match="quoted"):
+        parser.parse("pair", b"a='b'")
+
+    with pytest.raises(PestGrammarError):
+        parser.parse("word", b"b")
+
+
+def test_squashed_choice_failure_labels() -> None:
+    parser = Parser.from_grammar("""a = { SOI ~ ("x" | ^"yy" | '0'..'9') ~ EOI }""")
+    with pytest.raises(PestParsingError) as exc:
+        parser.parse("a", b"q")
+
+    assert """("x", ^"yy" or ''0''..''9'')""" in str(exc.value)
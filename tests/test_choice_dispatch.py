@@ -0,0 +1,162 @@
+from collections.abc import Callable
+from collections.abc import Iterator
+from collections.abc import Mapping
+from pathlib import Path
+
+import pytest
+
+from pest import DEFAULT_OPTIMIZER
+from pest import Optimizer
+from pest import Pairs
+from pest import Parser
+from pest import PestParsingError
+from pest.grammar import Expression
+from pest.grammar import Rule
+from pest.grammar.expressions import DispatchChoice
+from pest.grammar.optimizers import dispatch
+
+GRAMMAR = r"""
+stmt = { SOI ~ (select | insert | keep | call | ident) ~ EOI }
+select = { ^"select" ~ ident }
+insert = { ^"insert" ~ ^"into" ~ ident }
+keep = { ^"keep" }
+call = { ident ~ "(" ~ ")" }
+ident = @{ ('a'..'z' | "_")+ }
+WHITESPACE = _{ " " }
+"""
+
+NO_DISPATCH = Optimizer(
+    [step for step in DEFAULT_OPTIMIZER.passes if step.name != "dispatch choice"]
+)
+
+
+def walk(expr: Expression) -> Iterator[Expression]:
+    yield expr
+    for child in expr.children():
+        yield from walk(child)
+
+
+def dispatch_choices(parser: Parser, rule: str) -> list[DispatchChoice]:
+    return [
+        expr
+        for expr in walk(parser.rules[rule].expression)
+        if isinstance(expr, DispatchChoice)
+    ]
+
+
+def outcome(parse: Callable[[str, str], Pairs], text: str) -> str:
+    try:
+        return parse("stmt", text).dumps()
+    except PestParsingError as err:
+        stack = " > ".join(frame.name for frame in err.state.furthest_stack)
+        return f"{err}\n{stack}"
+
+
+def test_choice_dispatches_on_first_character() -> None:
+    choices = dispatch_choices(Parser.from_grammar(GRAMMAR), "stmt")
+    assert len(choices) == 1
+
+    choice = choices[0]
+    assert choice.table["s"] == (0, 3, 4)
+    assert choice.table["I"] == (1,)
+    assert choice.table["ſ"] == (0,)
+    assert choice.table["K"] == (2,)
+    assert choice.default == ()
+
+
+def test_first_sets_are_shared_by_every_choice(monkeypatch: pytest.MonkeyPatch) -> None:
+    built: list[dispatch.FirstSets] = []
+
+    class CountingFirstSets(dispatch.FirstSets):
+        def __init__(self, rules: Mapping[str, Rule]):
+            super().__init__(rules)
+            built.append(self)
+
+    monkeypatch.setattr(dispatch, "FirstSets", CountingFirstSets)
+    parser = Parser.from_grammar(GRAMMAR + "other = { select | keep }")
+    assert dispatch_choices(parser, "stmt")
+    assert dispatch_choices(parser, "other")
+    assert len(built) == 1
+
+
+def test_nullable_and_unknown_alternatives_are_always_tried() -> None:
+    parser = Parser.from_grammar('a = { "x" ~ "y" | "z"? | ANY ~ "x" | "w" }')
+    (choice,) = dispatch_choices(parser, "a")
+    assert choice.default == (1, 2)
+    assert choice.table["x"] == (0, 1, 2)
+
+
+def test_choice_without_dispatch() -> None:
+    parser = Parser.from_grammar('a = { ANY ~ "x" | "y"? }')
+    assert dispatch_choices(parser, "a") == []
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "select foo",
+        "SELECT foo",
+        "ſelect foo",
+        "insert into bar",
+        "keep",
+        "foo()",
+        "selectfoo",
+        "keeper",
+        "inserted",
+        "",
+        "select",
+        "insert foo",
+        "?",
+        "foo(",
+        "Foo",
+    ],
+)
+@pytest.mark.parametrize(
+    ("lazy_errors", "memoize"), [(False, False), (True, False), (False, True)]
+)
+def test_same_result_as_without_dispatch(
+    text: str, *, lazy_errors: bool, memoize: bool
+) -> None:
+    parser = Parser.from_grammar(GRAMMAR, lazy_errors=lazy_errors, memoize=memoize)
+    closures = Parser.from_grammar(
+        GRAMMAR, lazy_errors=lazy_errors, memoize=memoize, closures=True
+    )
+    baseline = Parser.from_grammar(
+        GRAMMAR, optimizer=NO_DISPATCH, lazy_errors=lazy_errors, memoize=memoize
+    )
+
+    want = outcome(baseline.parse, text)
+    assert outcome(parser.parse, text) == want
+    assert outcome(closures.parse, text) == want
+    assert outcome(parser.compile().parse, text) == outcome(
+        baseline.compile().parse, text
+    )
+
+
+def test_empty_strings_are_not_expected() -> None:
+    grammar = 'a = { ("" ~ "x" | "y") ~ "z" }'
+    (choice,) = dispatch_choices(Parser.from_grammar(grammar), "a")
+    assert choice.labels[0] == (((), '"x"'),)
+
+    with pytest.raises(PestParsingError) as err:
+        Parser.from_grammar(grammar).parse("a", "w")
+    assert '("x" or "y")' in str(err.value)
+
+
+def test_bytes_input() -> None:
+    parser = Parser.from_grammar(GRAMMAR)
+    assert parser.parse("stmt", b"insert into bar").first().end == 15  # noqa: PLR2004
+
+
+def test_save_and_load(tmp_path: Path) -> None:
+    path = tmp_path / "parser.pickle"
+    Parser.from_grammar(GRAMMAR).save(path)
+    parser = Parser.load(path)
+    assert dispatch_choices(parser, "stmt")
+    assert parser.parse("stmt", "select foo").first().end == 10  # noqa: PLR2004
+
+
+def test_generated_range_is_case_sensitive() -> None:
+    parser = Parser.from_grammar("a = { ('a'..'z')+ }").compile()
+    with pytest.raises(PestParsingError):
+        parser.parse("a", "A")
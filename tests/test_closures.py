@@ -0,0 +1,68 @@
+import pytest
+
+from pest import Parser
+from pest import PestParsingError
+from pest.grammar.compiler import Compiler
+
+GRAMMAR = r"""
+program = { SOI ~ expr ~ EOI }
+expr = { term ~ (op ~ term)* }
+term = _{ number | "(" ~ expr ~ ")" }
+op = { "+" | "-" }
+number = @{ ASCII_DIGIT+ }
+WHITESPACE = _{ " " }
+"""
+
+
+def test_closures_are_off_by_default() -> None:
+    parser = Parser.from_grammar(GRAMMAR)
+    assert parser.compiled_rules is None
+
+
+def test_compile_all_rules() -> None:
+    parser = Parser.from_grammar(GRAMMAR, closures=True)
+    assert parser.compiled_rules is not None
+    assert set(parser.compiled_rules) == set(parser.rules)
+
+
+def test_recursive_rules() -> None:
+    interpreted = Parser.from_grammar(GRAMMAR)
+    compiled = Parser.from_grammar(GRAMMAR, closures=True)
+    text = "1 + (2 - (3 + 4)) - 5"
+    assert (
+        compiled.parse("expr", text).dumps() == interpreted.parse("expr", text).dumps()
+    )
+
+
+def test_compiled_parse_error() -> None:
+    interpreted = Parser.from_grammar(GRAMMAR)
+    compiled = Parser.from_grammar(GRAMMAR, closures=True)
+    text = "1 + (2 - "
+
+    with pytest.raises(PestParsingError) as compiled_error:
+        compiled.parse("program", text)
+
+    with pytest.raises(PestParsingError) as interpreted_error:
+        interpreted.parse("program", text)
+
+    assert str(compiled_error.value) == str(interpreted_error.value)
+
+
+def test_compiled_rules_are_linked_once() -> None:
+    parser = Parser.from_grammar(GRAMMAR)
+    compiler = Compiler(parser.rules)
+    assert compiler.rule("expr") is compiler.rule("expr")
+
+
+def test_closures_with_memoization() -> None:
+    parser = Parser.from_grammar(GRAMMAR, closures=True, memoize=True)
+    text = "1 + (2 - (3 + 4)) - 5"
+    want = Parser.from_grammar(GRAMMAR).parse("expr", text).dumps()
+    assert parser.parse("expr", text).dumps() == want
+    assert parser.memo_stats.total_misses > 0
+
+
+def test_unknown_start_rule() -> None:
+    parser = Parser.from_grammar(GRAMMAR, closures=True)
+    with pytest.raises(KeyError):
+        parser.parse("nosuchthing", "1")
@@ -0,0 +1,158 @@
+import pytest
+
+from pest import Parser
+from pest import PestGrammarError
+from pest.grammar import parse
+from pest.grammar.analysis import GrammarAnalysis
+from pest.grammar.analysis import Hazard
+
+
+def analyze(grammar: str) -> GrammarAnalysis:
+    rules, _ = parse(grammar, Parser.BUILTIN)
+    return GrammarAnalysis({**Parser.BUILTIN, **rules})
+
+
+def test_nullable_rules() -> None:
+    analysis = analyze(
+        """
+        a = { "x"? }
+        b = { a ~ "" }
+        c = { b | "y" }
+        d = { "y" ~ a }
+        e = { SOI ~ &"x" ~ EOI }
+        f = { ASCII_DIGIT }
+        g = { "x"{0, 2} ~ "y"{0} }
+        """
+    )
+    assert analysis.nullable == {"a", "b", "c", "e", "g"}
+
+
+@pytest.mark.parametrize(
+    "grammar",
+    [
+        'a = { ("x"?)* }',
+        'a = { ("x"*)+ }',
+        'a = { (!"x")* ~ "y" }',
+        'a = { b{2,} }\nb = { "x" | c }\nc = { "y"? }',
+        'a = { (SOI ~ "x"?)* }',
+        'a = { PUSH("")* }',
+    ],
+)
+def test_reject_non_progressing_repetition(grammar: str) -> None:
+    with pytest.raises(PestGrammarError, match="repeat infinitely"):
+        Parser.from_grammar(grammar)
+
+
+@pytest.mark.parametrize(
+    "grammar",
+    [
+        'a = { ("x" ~ "y"?)* }',
+        'a = { ("x"?){3} }',
+        'a = { ("x"?){, 3} }',
+        'a = { (PUSH("x") ~ POP)* }',
+    ],
+)
+def test_progressing_repetition(grammar: str) -> None:
+    Parser.from_grammar(grammar)
+
+
+@pytest.mark.parametrize(
+    ("grammar", "path"),
+    [
+        ('a = { a ~ "x" | "y" }', "a -> a"),
+        ('a = { b ~ "x" }\nb = { "y"? ~ c }\nc = { a }', "a -> b -> c -> a"),
+        ('a = { !a ~ "x" }', "a -> a"),
+    ],
+)
+def test_reject_left_recursion(grammar: str, path: str) -> None:
+    with pytest.raises(PestGrammarError, match=f"left-recursive \\({path}\\)"):
+        Parser.from_grammar(grammar)
+
+
+def test_right_recursion() -> None:
+    parser = Parser.from_grammar('a = { "x" ~ a | "y" }')
+    assert parser.parse("a", "xxy").first().end == 3  # noqa: PLR2004
+
+
+def test_choice_prefix_hazard() -> None:
+    parser = Parser.from_grammar(
+        """
+        expr = { term ~ "+" ~ expr | term }
+        term = { "(" ~ expr ~ ")" | ASCII_DIGIT+ }
+        """
+    )
+    assert [(h.rule, h.kind) for h in parser.hazards] == [("expr", "prefix")]
+    assert "term" in parser.hazards[0].message
+    assert "exponentially" in parser.hazards[0].message
+
+
+def test_hazards_are_found_on_demand(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[GrammarAnalysis] = []
+    hazards = GrammarAnalysis.hazards
+
+    def counting_hazards(self: GrammarAnalysis) -> list[Hazard]:
+        calls.append(self)
+        return hazards(self)
+
+    monkeypatch.setattr(GrammarAnalysis, "hazards", counting_hazards)
+    parser = Parser.from_grammar('a = { b ~ "x" | b }\nb = _{ "y" }')
+    assert not calls
+
+    # Hazards are found in the rules as written, not the optimized rules.
+    assert [(h.rule, h.kind) for h in parser.hazards] == [("a", "prefix")]
+    assert parser.hazards is parser.hazards
+    assert len(calls) == 1
+
+
+def test_choice_repeated_terminal_hazard() -> None:
+    analysis = analyze(
+        """
+        number = { ASCII_DIGIT+ ~ "." ~ ASCII_DIGIT+ | ASCII_DIGIT+ }
+        keyword = { "a" ~ "b" | "a" ~ "c" }
+        """
+    )
+    assert [(h.rule, h.kind) for h in analysis.hazards()] == [("number", "prefix")]
+
+
+def test_follow_hazard() -> None:
+    analysis = analyze(
+        """
+        list = { (item ~ ",")* ~ item }
+        item = { ASCII_ALPHA+ }
+        ok = { (item ~ ",")* ~ "." }
+        """
+    )
+    hazards = analysis.hazards()
+    assert [(h.rule, h.kind) for h in hazards] == [("list", "follow")]
+    assert "exponentially" not in hazards[0].message
+
+
+def test_unreachable_alternative() -> None:
+    analysis = analyze(
+        """
+        a = { b | "x" | "y" }
+        b = { "z"* }
+        """
+    )
+    hazards = analysis.hazards()
+    assert [(h.rule, h.kind) for h in hazards] == [
+        ("a", "unreachable"),
+        ("a", "unreachable"),
+    ]
+    assert str(hazards[0]).startswith('a: alternative "x" is never tried')
+
+
+def test_no_hazards() -> None:
+    parser = Parser.from_grammar(
+        """
+        list = { item ~ ("," ~ item)* }
+        item = { ASCII_ALPHA+ | "(" ~ list ~ ")" }
+        """
+    )
+    assert parser.hazards == []
+
+
+def test_hazards_are_not_set_by_init() -> None:
+    rules, _ = parse('a = { b ~ "x" | b }\nb = { "y" }', Parser.BUILTIN)
+    assert Parser(rules).hazards == []
+    assert len(Parser.from_grammar('a = { b ~ "x" | b }\nb = { "y" }').hazards) == 1
@@ -0,0 +1,75 @@
+import pytest
+
+from pest import BacktrackHeatmap
+from pest import LineHeat
+from pest import Parser
+from pest import PestParsingError
+
+GRAMMAR = r"""
+a = { b ~ "!" | b ~ "?" }
+b = { c ~ c }
+c = { "x" }
+lines = { a ~ ("\n" ~ a)* }
+"""
+
+
+@pytest.fixture(scope="module", params=["interpreted", "closures", "generated"])
+def parser(request: pytest.FixtureRequest) -> object:
+    if request.param == "generated":
+        return Parser.from_grammar(GRAMMAR, optimizer=None).compile(trace=True)
+    return Parser.from_grammar(
+        GRAMMAR, optimizer=None, closures=request.param == "closures"
+    )
+
+
+def test_backtracked_matches_are_discarded(parser: object) -> None:
+    heatmap = BacktrackHeatmap()
+    parser.parse("a", "xx?", tracer=heatmap)  # type: ignore[attr-defined]
+    assert heatmap.attempts == {(0, "a"): 1, (0, "b"): 2, (0, "c"): 2, (1, "c"): 2}
+    assert heatmap.discards == {(0, "b"): 1, (0, "c"): 1, (1, "c"): 1}
+
+
+def test_failed_attempts_are_discarded(parser: object) -> None:
+    heatmap = BacktrackHeatmap()
+    with pytest.raises(PestParsingError):
+        parser.parse("a", "xy", tracer=heatmap)  # type: ignore[attr-defined]
+    assert heatmap.discards == {(0, "a"): 1, (0, "b"): 2, (0, "c"): 2, (1, "c"): 2}
+
+
+def test_by_line() -> None:
+    parser = Parser.from_grammar(GRAMMAR, optimizer=None)
+    text = "xx!\nxx?\nxx?"
+    heatmap = BacktrackHeatmap()
+    parser.parse("lines", text, tracer=heatmap)
+
+    assert heatmap.by_line(text) == [
+        LineHeat(1, 5, 0, {}),
+        LineHeat(2, 7, 3, {"c": 2, "b": 1}),
+        LineHeat(3, 7, 3, {"c": 2, "b": 1}),
+    ]
+    assert heatmap.by_line(text.encode()) == heatmap.by_line(text)
+    assert [line.line for line in heatmap.hottest(text, 1)] == [2]
+
+
+def test_report() -> None:
+    parser = Parser.from_grammar(GRAMMAR, optimizer=None)
+    text = "xx!\nxx?"
+    heatmap = BacktrackHeatmap()
+    parser.parse("lines", text.encode(), tracer=heatmap)
+
+    lines = heatmap.report(text.encode()).splitlines()
+    assert lines[0].split() == ["line", "attempts", "discarded", "rules", "text"]
+    assert lines[1].split() == ["2", "7", "3", "c=2,", "b=1", "'xx?'"]
+    assert len(lines) == 2  # noqa: PLR2004
+
+
+def test_counts_accumulate_and_reset() -> None:
+    parser = Parser.from_grammar(GRAMMAR, optimizer=None)
+    heatmap = BacktrackHeatmap()
+    parser.parse("a", "xx?", tracer=heatmap)
+    parser.parse("a", "xx?", tracer=heatmap)
+    assert heatmap.discards[(0, "b")] == 2  # noqa: PLR2004
+
+    heatmap.reset()
+    assert not heatmap.attempts
+    assert not heatmap.discards
@@ -0,0 +1,194 @@
+import random
+
+import pytest
+
+from pest import DEFAULT_OPTIMIZER
+from pest import Document
+from pest import Parser
+from pest import PestParsingError
+
+
+@pytest.fixture(scope="module", params=["not optimized", "optimized"])
+def toml_parser(request: pytest.FixtureRequest) -> Parser:
+    with open("tests/grammars/toml.pest", encoding="utf-8") as fd:
+        grammar = fd.read()
+
+    return Parser.from_grammar(
+        grammar,
+        optimizer=None if request.param == "not optimized" else DEFAULT_OPTIMIZER,
+    )
+
+
+@pytest.fixture(scope="module", params=["not optimized", "optimized"])
+def sql_parser(request: pytest.FixtureRequest) -> Parser:
+    with open("tests/grammars/sql.pest", encoding="utf-8") as fd:
+        grammar = fd.read()
+
+    return Parser.from_grammar(
+        grammar,
+        optimizer=None if request.param == "not optimized" else DEFAULT_OPTIMIZER,
+    )
+
+
+@pytest.fixture(scope="module")
+def example() -> str:
+    with open("tests/examples/example.toml", encoding="utf-8") as fd:
+        return fd.read()
+
+
+def parse(parser: Parser, start_rule: str, text: str) -> str:
+    try:
+        return parser.parse(start_rule, text).dumps()
+    except PestParsingError as err:
+        return str(err)
+
+
+def reparse(
+    parser: Parser,
+    document: Document,
+    edits: list[tuple[int, int, str]],
+    lookahead: int = 1024,
+) -> str:
+    try:
+        pairs = parser.reparse(document, edits, lookahead=lookahead).pairs
+    except PestParsingError as err:
+        assert document.pairs is None
+        return str(err)
+
+    assert pairs is not None
+    return pairs.dumps()
+
+
+def test_parse_document(toml_parser: Parser, example: str) -> None:
+    document = toml_parser.parse_document("toml", example)
+    assert document.text == example
+    assert document.pairs is not None
+    assert document.pairs.dumps() == toml_parser.parse("toml", example).dumps()
+
+
+@pytest.mark.parametrize(
+    "edit",
+    [
+        (0, 0, "# comment\n"),
+        (0, 1, ""),
+        (10, 10, "x"),
+        (10, 15, ""),
+        (200, 200, "\n\nkey = 1\n"),
+        (-1, -1, "\nkey = 1\n"),
+        (-10, -1, ""),
+    ],
+    ids=[
+        "insert at start",
+        "delete at start",
+        "insert",
+        "delete",
+        "insert line",
+        "append line",
+        "delete at end",
+    ],
+)
+def test_reparse_matches_parse(
+    toml_parser: Parser, example: str, edit: tuple[int, int, str]
+) -> None:
+    start, old_end, new_text = edit
+    if start < 0:
+        start += len(example)
+        old_end += len(example)
+
+    document = toml_parser.parse_document("toml", example)
+    text = example[:start] + new_text + example[old_end:]
+    assert reparse(toml_parser, document, [(start, old_end, new_text)]) == parse(
+        toml_parser, "toml", text
+    )
+    assert document.text == text
+
+
+def test_multiple_edits_apply_in_order(toml_parser: Parser) -> None:
+    document = toml_parser.parse_document("toml", "a = 1\nb = 2\n")
+    toml_parser.reparse(document, [(4, 5, "10"), (11, 12, "20"), (0, 0, "c = 3\n")])
+    assert document.text == "c = 3\na = 10\nb = 20\n"
+    assert reparse(toml_parser, document, []) == parse(
+        toml_parser, "toml", document.text
+    )
+
+
+def test_reused_pairs_are_updated(toml_parser: Parser) -> None:
+    document = toml_parser.parse_document("toml", "a = 1\nb = 2\n")
+    toml_parser.reparse(document, [(0, 0, "\n\n")])
+    assert document.pairs is not None
+    pairs = list(document.pairs.first().inner())
+    assert [str(pair) for pair in pairs] == ["a = 1", "b = 2", ""]
+    assert pairs[1].start == 8  # noqa: PLR2004
+    assert pairs[1].input == document.text
+
+
+def test_returned_pairs_are_not_changed(toml_parser: Parser) -> None:
+    text = "a = 1\nb = 2\n"
+    document = toml_parser.parse_document("toml", text)
+    assert document.pairs is not None
+    before = document.pairs
+    dumped = before.dumps()
+
+    toml_parser.reparse(document, [(0, 0, "\n\n"), (0, 0, "c = 3\n")])
+    assert before.dumps() == dumped
+    assert all(pair.input is text for pair in before.flatten())
+    assert [pair.start for pair in before.first().inner()] == [0, 6, 12]
+
+    assert document.pairs is not None
+    assert [pair.start for pair in document.pairs.first().inner()] == [0, 8, 14, 20]
+
+
+def test_recover_after_failed_reparse(toml_parser: Parser, example: str) -> None:
+    document = toml_parser.parse_document("toml", example)
+
+    with pytest.raises(PestParsingError):
+        toml_parser.reparse(document, [(0, 0, "= =")])
+
+    assert document.pairs is None
+    assert document.text.startswith("= =")
+    assert reparse(toml_parser, document, [(0, 3, "")]) == parse(
+        toml_parser, "toml", example
+    )
+
+
+def test_parse_document_error(toml_parser: Parser) -> None:
+    with pytest.raises(PestParsingError):
+        toml_parser.parse_document("toml", "a = ")
+
+
+def test_edit_out_of_range(toml_parser: Parser) -> None:
+    document = toml_parser.parse_document("toml", "a = 1\n")
+
+    with pytest.raises(ValueError, match="out of range"):
+        toml_parser.reparse(document, [(5, 10, "")])
+
+    with pytest.raises(ValueError, match="out of range"):
+        toml_parser.reparse(document, [(3, 2, "")])
+
+
+def test_random_toml_edits(toml_parser: Parser, example: str) -> None:
+    rng = random.Random(1)  # noqa: S311
+    document = toml_parser.parse_document("toml", example)
+
+    for _ in range(100):
+        start = rng.randrange(len(document.text) + 1)
+        old_end = min(len(document.text), start + rng.randrange(3))
+        new_text = rng.choice(["", "1", "a", " ", "\n", "x = 1\n", '"', "["])
+        assert reparse(
+            toml_parser, document, [(start, old_end, new_text)], lookahead=8
+        ) == parse(toml_parser, "toml", document.text)
+
+
+def test_random_sql_edits(sql_parser: Parser) -> None:
+    rng = random.Random(2)  # noqa: S311
+    document = sql_parser.parse_document(
+        "Command", 'select "a", "b" from "t" where "a" > 1 and "b" = \'x\''
+    )
+
+    for _ in range(100):
+        start = rng.randrange(len(document.text) + 1)
+        old_end = min(len(document.text), start + rng.randrange(3))
+        new_text = rng.choice(["", "1", "a", " ", '"', "'", "(", ","])
+        assert reparse(
+            sql_parser, document, [(start, old_end, new_text)], lookahead=4
+        ) == parse(sql_parser, "Command", document.text)
@@ -0,0 +1,128 @@
+import io
+
+import pytest
+
+from pest import DEFAULT_OPTIMIZER
+from pest import Parser
+from pest import PestParsingError
+from pest.grammar.exceptions import PestGrammarError
+
+
+@pytest.fixture(scope="module", params=["not optimized", "optimized", "memoized"])
+def http_parser(request: pytest.FixtureRequest) -> Parser:
+    with open("tests/grammars/http.pest", encoding="utf-8") as fd:
+        grammar = fd.read()
+
+    return Parser.from_grammar(
+        grammar,
+        optimizer=None if request.param == "not optimized" else DEFAULT_OPTIMIZER,
+        memoize=request.param == "memoized",
+    )
+
+
+@pytest.fixture(scope="module")
+def example() -> str:
+    with open("benchmarks/requests.http", encoding="ascii") as fd:
+        return fd.read()
+
+
+def chunks(text: str, size: int) -> list[str]:
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+def test_iterparse_matches_parse(http_parser: Parser, example: str) -> None:
+    expected = [
+        (pair.name, str(pair), pair.inner().dumps())
+        for pair in http_parser.parse("http", example).first().children
+    ]
+
+    for source in (example, io.StringIO(example), chunks(example, 7)):
+        pairs = http_parser.iterparse("http", source, chunk_size=100, lookahead=16)
+        assert [
+            (pair.name, str(pair), pair.inner().dumps()) for pair in pairs
+        ] == expected
+
+
+def test_pairs_are_rebased(http_parser: Parser) -> None:
+    text = "GET / HTTP/1.1\n\n\nPOST /a HTTP/1.1\nA: b\n\n"
+    pairs = list(http_parser.iterparse("http", chunks(text, 3), lookahead=4))
+    assert [pair.name for pair in pairs] == ["request", "delimiter", "request", "EOI"]
+    assert pairs[2].input == "POST /a HTTP/1.1\nA: b\n\n"
+    assert pairs[2].start == 0
+    assert pairs[2].end == len(pairs[2].input)
+    assert str(pairs[2].children[1]) == "/a"
+
+
+def test_rebased_line_numbers() -> None:
+    parser = Parser.from_grammar(
+        """
+        items = { item* }
+        item = { "x"+ ~ "\n" ~ inner ~ ";" }
+        inner = { "y" }
+        """
+    )
+    text = "xxxx\ny;x\ny;xx\ny;"
+    pairs = list(parser.iterparse("items", chunks(text, 2), lookahead=2))
+    assert [str(pair) for pair in pairs] == ["xxxx\ny;", "x\ny;", "xx\ny;"]
+    assert [pair.children[0].line_col() for pair in pairs] == [(2, 1)] * 3
+    assert [pair.line_col() for pair in pairs] == [(1, 1)] * 3
+
+
+def test_error_after_complete_items(http_parser: Parser) -> None:
+    text = "GET / HTTP/1.1\n\nBAD / HTTP/1.1\n\n"
+    pairs = http_parser.iterparse("http", chunks(text, 4), lookahead=4)
+    assert str(next(pairs)) == "GET / HTTP/1.1\n\n"
+
+    with pytest.raises(PestParsingError) as iterparse_error:
+        next(pairs)
+
+    with pytest.raises(PestParsingError) as parse_error:
+        http_parser.parse("http", text)
+
+    assert str(iterparse_error.value) == str(parse_error.value)
+
+
+def test_repeat_once() -> None:
+    parser = Parser.from_grammar(
+        "list = { SOI ~ header ~ item+ ~ EOI }\n"
+        'header = @{ "#" ~ ASCII_DIGIT+ ~ NEWLINE }\n'
+        'item = { ASCII_ALPHA+ ~ ";" }\n'
+        'WHITESPACE = _{ " " | NEWLINE }'
+    )
+
+    pairs = parser.iterparse("list", chunks("#1\na; bc; def;", 2), lookahead=2)
+    assert [(pair.name, str(pair)) for pair in pairs] == [
+        ("header", "#1\n"),
+        ("item", "a;"),
+        ("item", "bc;"),
+        ("item", "def;"),
+        ("EOI", ""),
+    ]
+
+    with pytest.raises(PestParsingError):
+        list(parser.iterparse("list", "#1\n"))
+
+
+def test_start_rule_without_repetition(http_parser: Parser) -> None:
+    with pytest.raises(PestGrammarError):
+        http_parser.iterparse("header", "")
+
+
+@pytest.mark.parametrize(
+    "optimizer", [None, DEFAULT_OPTIMIZER], ids=["none", "default"]
+)
+@pytest.mark.parametrize(
+    "text",
+    ["1,2\n3,x\n", "1,2\n3,4\n5,6\n7,,8\n", "1,2\n\n3,4\n-", "1\r\n2\r\n3,,\r\n"],
+)
+def test_errors_match_parse(optimizer: object, text: str) -> None:
+    with open("examples/csv/csv.pest", encoding="utf-8") as fd:
+        parser = Parser.from_grammar(fd.read(), optimizer=optimizer)  # type: ignore[arg-type]
+
+    with pytest.raises(PestParsingError) as parse_error:
+        parser.parse("file", text)
+
+    for source in (text, chunks(text, 1), chunks(text, 3)):
+        with pytest.raises(PestParsingError) as iterparse_error:
+            list(parser.iterparse("file", source, lookahead=2))
+        assert str(iterparse_error.value) == str(parse_error.value)
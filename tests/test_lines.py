@@ -0,0 +1,127 @@
+import gc
+import weakref
+
+import pytest
+
+from pest import Parser
+from pest import PestParsingError
+from pest import Position
+from pest import Span
+from pest.exceptions import error_context
+from pest.lines import LineIndex
+from pest.lines import line_index
+
+TEXTS = [
+    "",
+    "a",
+    "a\n",
+    "ab\ncd",
+    "ab\r\ncd\r\n\r\n",
+    "a\rb\x0bc\x0cd\x85e f g",
+    "\n\n\n",
+]
+
+
+@pytest.mark.parametrize("text", TEXTS)
+def test_lines_match_splitlines(text: str) -> None:
+    index = LineIndex(text)
+    lines = text.splitlines(keepends=True)
+    assert index.line_count == len(lines)
+    assert [index.line(i) for i in range(index.line_count)] == lines
+    assert index.lines(0, index.line_count + 1) == lines
+
+
+@pytest.mark.parametrize("text", [b"ab\r\ncd\rx\x0by\n", bytearray(b"a\nb")])
+def test_bytes_lines_match_splitlines(text: bytes) -> None:
+    index = LineIndex(text)
+    lines = text.splitlines(keepends=True)
+    assert index.line_count == len(lines)
+    assert [index.line(i) for i in range(index.line_count)] == lines
+
+
+def test_line_col() -> None:
+    text = "ab\r\ncd\n"
+    assert [Position(text, pos).line_col() for pos in range(len(text) + 1)] == [
+        (1, 1),
+        (1, 2),
+        (1, 3),
+        (1, 4),
+        (2, 1),
+        (2, 2),
+        (2, 3),
+        (3, 1),
+    ]
+
+
+def test_line_of() -> None:
+    text = "ab\ncd"
+    assert Position(text, 0).line_of() == "ab\n"
+    assert Position(text, 2).line_of() == "ab\n"
+    assert Position(text, 4).line_of() == "cd"
+    assert Position(text, 5).line_of() == ""
+
+
+def test_span_lines() -> None:
+    text = "one\ntwo\nthree\nfour"
+    start = text.index("wo")
+    end = text.index("ee")
+    assert Span(text, start, end).lines() == ["two\n", "three\n"]
+    assert Span(text, 0, 0).lines() == ["one\n"]
+    assert Span(text, len(text), len(text)).lines() == []
+
+
+def test_error_context() -> None:
+    text = "ab\ncd  \n"
+    assert error_context(text, 0) == ("ab", 1, 1)
+    assert error_context(text, 4) == ("cd", 2, 2)
+    assert error_context(text, len(text)) == ("cd", 2, 6)
+
+
+def test_bytes_error_context() -> None:
+    text = "ab\ncé  \n".encode()
+    for data in (text, bytearray(text), memoryview(text)):
+        assert error_context(data, 0) == ("ab", 1, 1)
+        assert error_context(data, 6) == ("cé", 2, 3)
+
+
+PARSER = Parser.from_grammar(
+    """
+    lines = { SOI ~ (line ~ NEWLINE)* ~ EOI }
+    line = { ASCII_ALPHA+ }
+    doc = { "ab" ~ NEWLINE ~ "cd" ~ NEWLINE ~ "ef" }
+    """
+)
+
+
+def test_line_index_is_shared_by_a_parse() -> None:
+    text = "".join(["a\n"] * 10)
+    pairs = PARSER.parse("lines", text)
+    lines = list(pairs.first().inner())
+    assert lines[0].line_index is lines[-1].line_index
+    assert line_index(text) is lines[0].line_index
+    assert lines[3].line_col() == (4, 1)
+    assert lines[3].span().start_pos().line_col() == (4, 1)
+
+
+def test_line_index_is_not_kept_alive() -> None:
+    text = "".join(["a\n"] * 10)
+    index = weakref.ref(PARSER.parse("lines", text).first().line_index)  # type: ignore[arg-type]
+    gc.collect()
+    assert index() is None
+
+
+def test_bytes_line_index_is_shared() -> None:
+    data = memoryview(b"ab\ncd\n")
+    pairs = PARSER.parse("lines", data)  # type: ignore[arg-type]
+    lines = list(pairs.first().inner())
+    assert lines[1].line_col() == (2, 1)
+    assert lines[0].line_index is lines[1].line_index
+
+
+def test_error_uses_the_parse_line_index() -> None:
+    text = "ab\ncd\n1\n"
+    with pytest.raises(PestParsingError) as exc_info:
+        PARSER.parse("doc", text)
+    err = exc_info.value
+    assert err.state.line_index.text is text
+    assert "-> doc 3:1" in str(err)
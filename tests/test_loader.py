@@ -0,0 +1,127 @@
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from pest import DEFAULT_OPTIMIZER
+from pest import CompiledParser
+from pest import Operators
+from pest import Optimizer
+from pest import Parser
+from pest import PestParsingError
+from pest import load_parser
+from pest import loader
+from pest.grammar.optimizer import OptimizerStep
+from pest.grammar.optimizer import PassDirection
+from pest.loader import cache_key
+
+GRAMMAR = r"""
+program = { SOI ~ number ~ ("," ~ number)* ~ EOI }
+number = @{ ASCII_DIGIT+ }
+WHITESPACE = _{ " " }
+"""
+
+
+def test_parser_compile() -> None:
+    parser = Parser.from_grammar(GRAMMAR)
+    compiled = parser.compile()
+    assert isinstance(compiled, CompiledParser)
+    assert compiled.path is None
+    assert (
+        compiled.parse("program", "1, 2, 3").dumps()
+        == parser.parse("program", "1, 2, 3").dumps()
+    )
+
+
+def test_load_parser_writes_cache(tmp_path: Path) -> None:
+    parser = load_parser(GRAMMAR, cache_dir=tmp_path)
+    assert parser.path is not None
+    assert parser.path.parent == tmp_path
+    assert parser.path.exists()
+    assert list(tmp_path.glob("*.py")) == [parser.path]
+    assert (
+        parser.parse("program", "1, 22").dumps()
+        == Parser.from_grammar(GRAMMAR).parse("program", "1, 22").dumps()
+    )
+
+
+def test_load_parser_reads_cache(tmp_path: Path) -> None:
+    first = load_parser(GRAMMAR, cache_dir=tmp_path)
+    assert first.path is not None
+    mtime = first.path.stat().st_mtime_ns
+
+    second = load_parser(GRAMMAR, cache_dir=tmp_path)
+    assert second.path == first.path
+    assert second.path.stat().st_mtime_ns == mtime
+
+
+def test_cache_key_depends_on_options() -> None:
+    key = cache_key(GRAMMAR)
+    assert key == cache_key(GRAMMAR)
+    assert key != cache_key(GRAMMAR + "\n")
+    assert key != cache_key(GRAMMAR, optimizer=None)
+    assert key != cache_key(GRAMMAR, memoize=True)
+    assert key != cache_key(GRAMMAR, memo_capacity=None)
+    assert key != cache_key(GRAMMAR, operators={"program": Operators()})
+    assert cache_key(
+        GRAMMAR, operators={"program": Operators(infix={"a": (1, False)})}
+    ) != cache_key(GRAMMAR, operators={"program": Operators(infix={"a": (2, False)})})
+
+
+def test_cache_key_depends_on_optimizer_steps() -> None:
+    def with_step(**kwargs: Any) -> Optimizer:
+        return Optimizer([*DEFAULT_OPTIMIZER.passes, OptimizerStep(**kwargs)])
+
+    step = {"name": "noop", "func": lambda e, _: e, "direction": PassDirection.PREORDER}
+    key = cache_key(GRAMMAR, optimizer=with_step(**step))
+    assert key == cache_key(GRAMMAR, optimizer=with_step(**step))
+    assert key != cache_key(
+        GRAMMAR, optimizer=with_step(**step, predicate=lambda _: False)
+    )
+    assert cache_key(
+        GRAMMAR, optimizer=with_step(**step, rule_filter=lambda _: True)
+    ) != cache_key(GRAMMAR, optimizer=with_step(**step, rule_filter=lambda _: False))
+
+
+def test_cache_key_depends_on_generated_code_version(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    key = cache_key(GRAMMAR)
+    monkeypatch.setattr(loader, "FORMAT_VERSION", loader.FORMAT_VERSION + 1)
+    assert key != cache_key(GRAMMAR)
+
+
+def test_load_parser_without_cache(tmp_path: Path) -> None:
+    parser = load_parser(GRAMMAR, cache_dir=tmp_path, use_cache=False)
+    assert parser.path is None
+    assert not list(tmp_path.iterdir())
+
+    with pytest.raises(PestParsingError):
+        parser.parse("program", "1,")
+
+
+def test_load_memoized_parser(tmp_path: Path) -> None:
+    parser = load_parser(GRAMMAR, cache_dir=tmp_path, memoize=True)
+    assert parser.memo_stats is not None
+    parser.parse("program", "1, 2")
+    assert parser.memo_stats.total_misses > 0
+    assert load_parser(GRAMMAR, cache_dir=tmp_path).memo_stats is None
+
+
+def test_load_parser_with_operators(tmp_path: Path) -> None:
+    grammar = r"""
+    program = { SOI ~ expr ~ EOI }
+    expr = { number ~ (op ~ number)* }
+    op = _{ add | mul }
+    add = { "+" }
+    mul = { "*" }
+    number = @{ ASCII_DIGIT+ }
+    """
+    operators = {"expr": Operators(infix={"add": (1, False), "mul": (2, False)})}
+    parser = Parser.from_grammar(grammar, operators=operators)
+    compiled = load_parser(grammar, cache_dir=tmp_path, operators=operators)
+    assert (
+        compiled.parse("program", "1+2*3").dumps()
+        == parser.parse("program", "1+2*3").dumps()
+    )
+    assert load_parser(grammar, cache_dir=tmp_path).path != compiled.path
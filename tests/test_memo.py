@@ -0,0 +1,150 @@
+import types
+
+import pytest
+
+from pest import Parser
+from pest import PestParsingError
+from pest.memo import Memo
+from pest.memo import MemoStats
+
+GRAMMAR = r"""
+expr = { item ~ "x" | item ~ "y" | item }
+item = { "(" ~ expr ~ ")" | ident }
+ident = @{ ASCII_ALPHA+ }
+WHITESPACE = _{ " " }
+"""
+
+
+def test_memoized_parse_matches_plain_parse() -> None:
+    plain = Parser.from_grammar(GRAMMAR)
+    memoized = Parser.from_grammar(GRAMMAR, memoize=True)
+    text = "((a x) y)"
+    assert memoized.parse("expr", text).dumps() == plain.parse("expr", text).dumps()
+
+
+def test_memo_hits_when_backtracking() -> None:
+    parser = Parser.from_grammar(GRAMMAR, memoize=True)
+    parser.parse("expr", "(((a)))")
+    assert parser.memo_stats.total_hits > 0
+    assert parser.memo_stats.hits["item"] > 0
+    assert 0.0 < parser.memo_stats.hit_rate < 1.0
+
+
+def test_memoized_rules() -> None:
+    parser = Parser.from_grammar(GRAMMAR, memoize=True)
+    assert parser.memo_rules == {"expr", "item", "ident"}
+
+
+def test_memoize_is_off_by_default() -> None:
+    parser = Parser.from_grammar(GRAMMAR)
+    assert parser.memo_rules == frozenset()
+    parser.parse("expr", "(((a)))")
+    assert parser.memo_stats.total_hits == 0
+    assert parser.memo_stats.total_misses == 0
+
+
+def test_memoize_selected_rules() -> None:
+    parser = Parser.from_grammar(GRAMMAR, memoize=["item", "nosuchthing"])
+    assert parser.memo_rules == {"item"}
+
+
+def test_stack_rules_are_not_memoized() -> None:
+    grammar = r"""
+    raw = { open ~ body ~ close }
+    open = { "r" ~ PUSH("#"*) ~ "\"" }
+    body = { (!close ~ ANY)* }
+    close = { "\"" ~ POP }
+    word = { ASCII_ALPHA+ }
+    """
+    parser = Parser.from_grammar(grammar, memoize=True)
+    assert parser.memo_rules == {"word"}
+
+
+def test_impure_trivia_disables_memoization() -> None:
+    grammar = r"""
+    rule = { "a" ~ "b" }
+    WHITESPACE = _{ PEEK }
+    """
+    parser = Parser.from_grammar(grammar, memoize=True)
+    assert parser.memo_rules == frozenset()
+
+
+def test_memo_capacity() -> None:
+    parser = Parser.from_grammar(GRAMMAR, memoize=True, memo_capacity=2)
+    text = "((((a x) y) x) y)"
+    want = Parser.from_grammar(GRAMMAR).parse("expr", text).dumps()
+    assert parser.parse("expr", text).dumps() == want
+    assert parser.memo_stats.evictions > 0
+
+
+def test_memo_store_evicts_oldest_entry() -> None:
+    memo = Memo({"a"}, capacity=2)
+    memo.store(("a", 0, False), 1, ())
+    memo.store(("a", 1, False), 2, ())
+    memo.store(("a", 2, False), 2, None)
+    assert len(memo) == 2  # noqa: PLR2004
+    assert list(memo.entries) == [("a", 1, False), ("a", 2, False)]
+    assert memo.stats.evictions == 1
+
+
+def test_memoized_parse_error() -> None:
+    parser = Parser.from_grammar(GRAMMAR, memoize=True)
+    with pytest.raises(PestParsingError):
+        parser.parse("expr", "((a x)")
+
+
+def test_memo_stats_report() -> None:
+    stats = MemoStats()
+    stats.hits["item"] += 3
+    stats.misses["item"] += 1
+    stats.misses["expr"] += 4
+
+    assert stats.rule_hit_rate("item") == 0.75  # noqa: PLR2004
+    assert stats.as_dict() == {
+        "hits": 3,
+        "misses": 5,
+        "evictions": 0,
+        "hit_rate": 0.375,
+        "rules": {
+            "expr": {"hits": 0, "misses": 4, "hit_rate": 0.0},
+            "item": {"hits": 3, "misses": 1, "hit_rate": 0.75},
+        },
+    }
+
+    report = stats.report().splitlines()
+    assert report[1].startswith("item")
+    assert report[2].startswith("expr")
+
+    stats.reset()
+    assert stats.total_hits == 0
+    assert stats.total_misses == 0
+
+
+def test_memo_exclude() -> None:
+    parser = Parser.from_grammar(GRAMMAR, memoize=True, memo_exclude=["ident"])
+    assert parser.memo_rules == {"expr", "item"}
+
+
+def test_generated_memoized_parser() -> None:
+    parser = Parser.from_grammar(
+        GRAMMAR, memoize=True, memo_exclude=["ident"], memo_capacity=128
+    )
+    source = parser.generate()
+    assert "parse_item = memoize_rule('item', _parse_item())" in source
+    assert "parse_ident = _parse_ident()" in source
+    assert "MEMO_CAPACITY = 128" in source
+
+    module = types.ModuleType("generated_memo_parser")
+    code = compile(source, filename="generated_memo_parser.py", mode="exec")
+    exec(code, module.__dict__)  # noqa: S102
+
+    text = "((a x) y)"
+    want = Parser.from_grammar(GRAMMAR).parse("expr", text).dumps()
+    assert module.parse("expr", text).dumps() == want
+    assert module.memo_stats.hits["item"] > 0
+
+
+def test_generated_parser_without_memoization() -> None:
+    source = Parser.from_grammar(GRAMMAR).generate()
+    assert "memoize_rule" not in source
+    assert "state.memo" not in source
@@ -0,0 +1,9 @@
+from pest import Parser
+
+
+def test_built_in_rules_are_not_optimized_in_place() -> None:
+    before = {name: rule.expression for name, rule in Parser.BUILTIN.items()}
+    Parser.from_grammar("a = { ASCII_ALPHANUMERIC+ ~ NEWLINE }")
+    after = {name: rule.expression for name, rule in Parser.BUILTIN.items()}
+    assert after == before
+    assert all(after[name] is expr for name, expr in before.items())
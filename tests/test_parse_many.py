@@ -0,0 +1,101 @@
+from collections.abc import Iterator
+
+import pytest
+
+from pest import DEFAULT_OPTIMIZER
+from pest import Parser
+from pest import PestParsingError
+
+
+@pytest.fixture(scope="module", params=["not optimized", "optimized"])
+def json_parser(request: pytest.FixtureRequest) -> Parser:
+    with open("tests/grammars/json.pest", encoding="utf-8") as fd:
+        grammar = fd.read()
+
+    return Parser.from_grammar(
+        grammar,
+        optimizer=None if request.param == "not optimized" else DEFAULT_OPTIMIZER,
+    )
+
+
+TEXTS = [
+    '{"a": [1, 2.5, true], "b": {"c": null}}',
+    "[1, 2",
+    '"hello"',
+    "",
+    "[[[[]]]]",
+    "{,}",
+]
+
+
+def parse(parser: Parser, text: str) -> str:
+    # Workers use a generated parser, which can label errors differently.
+    try:
+        return parser.compile().parse("json", text).dumps()
+    except PestParsingError as err:
+        return str(err)
+
+
+def dumps(result: object) -> str:
+    if isinstance(result, PestParsingError):
+        return str(result)
+    assert not isinstance(result, Exception)
+    return result.dumps()  # type: ignore
+
+
+def test_parse_many_matches_parse(json_parser: Parser) -> None:
+    results = list(json_parser.parse_many("json", TEXTS, workers=2, chunk_size=2))
+    assert [index for index, _ in results] == list(range(len(TEXTS)))
+    assert [dumps(result) for _, result in results] == [
+        parse(json_parser, text) for text in TEXTS
+    ]
+
+
+def test_parse_many_unordered(json_parser: Parser) -> None:
+    texts = TEXTS * 5
+    results = dict(
+        json_parser.parse_many(
+            "json", iter(texts), workers=2, chunk_size=1, ordered=False
+        )
+    )
+    assert sorted(results) == list(range(len(texts)))
+    assert {index: dumps(result) for index, result in results.items()} == {
+        index: parse(json_parser, text) for index, text in enumerate(texts)
+    }
+
+
+def test_parse_many_pairs_refer_to_parser_rules(json_parser: Parser) -> None:
+    [(_, pairs)] = json_parser.parse_many("json", ['{"a": 1}'], workers=1)
+    assert not isinstance(pairs, PestParsingError)
+    pair = pairs.first()
+    assert pair.rule is json_parser.rules[pair.name]
+    assert pair.input == '{"a": 1}'
+
+
+def test_parse_many_error_position(json_parser: Parser) -> None:
+    [(_, error)] = json_parser.parse_many("json", ["[1, 2"], workers=1)
+    assert isinstance(error, PestParsingError)
+    assert error.state.input == "[1, 2"
+    assert error.state.furthest_pos == 5  # noqa: PLR2004
+
+
+def test_parse_many_unknown_rule(json_parser: Parser) -> None:
+    with pytest.raises(KeyError):
+        json_parser.parse_many("nosuchthing", TEXTS)
+
+
+def test_parse_many_reads_input_a_window_at_a_time(json_parser: Parser) -> None:
+    read = 0
+
+    def texts() -> Iterator[str]:
+        nonlocal read
+        for _ in range(10_000):
+            read += 1
+            yield "[1, 2]"
+
+    results = json_parser.parse_many("json", texts(), workers=1, chunk_size=4)
+    assert next(results)[0] == 0
+    # Two windows of `chunk_size * workers * 2` inputs.
+    assert read == 16  # noqa: PLR2004
+    assert sum(1 for _ in results) == 9_999  # noqa: PLR2004
+    assert read == 10_000  # noqa: PLR2004
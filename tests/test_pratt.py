@@ -0,0 +1,141 @@
+from typing import ClassVar
+
+import pytest
+
+from pest import Pair
+from pest import Parser
+from pest import PrattParser
+from pest import Stream
+
+GRAMMAR = r"""
+WHITESPACE = _{ " " }
+expr = { prefix* ~ primary ~ postfix* ~ (infix ~ prefix* ~ primary ~ postfix*)* }
+infix = _{ add | mul | pow | eq }
+add = { "+" }
+mul = { "*" }
+pow = { "^" }
+eq = { "==" }
+prefix = _{ neg }
+neg = { "-" }
+postfix = _{ fac }
+fac = { "!" }
+primary = _{ ident }
+ident = @{ ASCII_ALPHA+ }
+"""
+
+
+class ExprParser(PrattParser[str]):
+    PREFIX_OPS: ClassVar[dict[str, int]] = {"neg": 6}
+    POSTFIX_OPS: ClassVar[dict[str, int]] = {"fac": 7}
+    INFIX_OPS: ClassVar[dict[str, tuple[int, bool]]] = {
+        "eq": (1, PrattParser.LEFT_ASSOC),
+        "add": (3, PrattParser.LEFT_ASSOC),
+        "mul": (4, PrattParser.LEFT_ASSOC),
+        "pow": (5, PrattParser.RIGHT_ASSOC),
+    }
+
+    def parse_primary(self, pair: Pair) -> str:
+        return pair.text
+
+    def parse_prefix(self, op: Pair, rhs: str) -> str:
+        return f"({op.text}{rhs})"
+
+    def parse_postfix(self, lhs: str, op: Pair) -> str:
+        return f"({lhs}{op.text})"
+
+    def parse_infix(self, lhs: str, op: Pair, rhs: str) -> str:
+        return f"({lhs} {op.text} {rhs})"
+
+
+@pytest.fixture(scope="module")
+def parser() -> Parser:
+    return Parser.from_grammar(GRAMMAR)
+
+
+def stream(parser: Parser, text: str) -> Stream:
+    return parser.parse("expr", text).first().stream()
+
+
+@pytest.mark.parametrize(
+    ("text", "want"),
+    [
+        ("a", "a"),
+        ("a + b * c", "(a + (b * c))"),
+        ("a * b + c", "((a * b) + c)"),
+        ("a + b + c", "((a + b) + c)"),
+        ("a ^ b ^ c", "(a ^ (b ^ c))"),
+        ("-a ^ b", "((-a) ^ b)"),
+        ("-a * b", "((-a) * b)"),
+        ("-a!", "(-(a!))"),
+        ("a! ^ b!", "((a!) ^ (b!))"),
+        ("a + b == c * d", "((a + b) == (c * d))"),
+        ("- - a + b", "((-(-a)) + b)"),
+    ],
+)
+def test_precedence(parser: Parser, text: str, want: str) -> None:
+    assert ExprParser().parse_expr(stream(parser, text)) == want
+
+
+def test_min_prec_leaves_rest_of_stream(parser: Parser) -> None:
+    s = stream(parser, "a * b + c")
+    assert ExprParser().parse_expr(s, 4) == "(a * b)"
+    op = s.next()
+    assert op is not None
+    assert op.name == "add"
+
+
+def test_unexpected_end_of_expression(parser: Parser) -> None:
+    with pytest.raises(SyntaxError, match="Unexpected end of expression"):
+        ExprParser().parse_expr(Stream([]))
+
+    with pytest.raises(SyntaxError, match="Unexpected end of expression"):
+        ExprParser().parse_expr(Stream(stream(parser, "-a").pairs[:1]))
+
+
+def test_long_expressions_do_not_recurse(parser: Parser) -> None:
+    n = 5000
+    text = " ^ ".join(["a"] * n)
+    assert ExprParser().parse_expr(stream(parser, text)).count("^") == n - 1
+
+    text = " ".join(["-"] * n) + " a"
+    assert ExprParser().parse_expr(stream(parser, text)).count("-") == n
+
+
+def test_operator_tables_are_compiled_per_subclass() -> None:
+    class OtherParser(ExprParser):
+        INFIX_OPS: ClassVar[dict[str, tuple[int, bool]]] = {
+            "add": (4, PrattParser.LEFT_ASSOC),
+            "mul": (3, PrattParser.LEFT_ASSOC),
+        }
+
+    assert ExprParser().compile_ops()["add"] == (None, False, 3, 4)
+    other = OtherParser().compile_ops()
+    assert other["add"] == (None, False, 4, 5)
+    assert other["neg"] == (6, False, None, 0)
+    assert "pow" not in other
+
+
+def test_operator_tables_on_instances(parser: Parser) -> None:
+    expr_parser = ExprParser()
+    assert expr_parser.parse_expr(stream(parser, "a + b * c")) == "(a + (b * c))"
+
+    expr_parser.INFIX_OPS = {  # type: ignore[misc]
+        "add": (4, PrattParser.LEFT_ASSOC),
+        "mul": (3, PrattParser.LEFT_ASSOC),
+    }
+    assert expr_parser.parse_expr(stream(parser, "a + b * c")) == "((a + b) * c)"
+    assert ExprParser().parse_expr(stream(parser, "a + b * c")) == "(a + (b * c))"
+
+
+def test_operator_tables_changed_in_place(parser: Parser) -> None:
+    class OtherParser(ExprParser):
+        INFIX_OPS: ClassVar[dict[str, tuple[int, bool]]] = {
+            "add": (3, PrattParser.LEFT_ASSOC),
+            "mul": (4, PrattParser.LEFT_ASSOC),
+        }
+
+    expr_parser = OtherParser()
+    assert expr_parser.parse_expr(stream(parser, "a + b * c")) == "(a + (b * c))"
+
+    OtherParser.INFIX_OPS["add"] = (5, PrattParser.LEFT_ASSOC)
+    assert expr_parser.parse_expr(stream(parser, "a + b * c")) == "((a + b) * c)"
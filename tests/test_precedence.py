@@ -0,0 +1,203 @@
+import random
+from enum import StrEnum
+from pathlib import Path
+from typing import ClassVar
+
+import pytest
+
+from pest import Operators
+from pest import Pair
+from pest import Parser
+from pest import PestParsingError
+from pest import PrattParser
+
+GRAMMAR = r"""
+WHITESPACE = _{ " " }
+program = { SOI ~ expr ~ EOI }
+expr = { prefix* ~ primary ~ postfix* ~ (infix ~ prefix* ~ primary ~ postfix*)* }
+infix = _{ add | mul | pow | eq }
+add = { "+" }
+mul = { "*" }
+pow = { "^" }
+eq = { "==" }
+prefix = _{ neg }
+neg = { "-" }
+postfix = _{ fac }
+fac = { "!" }
+primary = _{ ident | "(" ~ expr ~ ")" }
+ident = @{ ASCII_ALPHA+ }
+"""
+
+OPERATORS = Operators(
+    prefix={"neg": 6},
+    postfix={"fac": 7},
+    infix={
+        "eq": (1, Operators.LEFT_ASSOC),
+        "add": (3, Operators.LEFT_ASSOC),
+        "mul": (4, Operators.LEFT_ASSOC),
+        "pow": (5, Operators.RIGHT_ASSOC),
+    },
+)
+
+
+class ExprParser(PrattParser[str]):
+    PREFIX_OPS: ClassVar[dict[str, int]] = OPERATORS.prefix
+    POSTFIX_OPS: ClassVar[dict[str, int]] = OPERATORS.postfix
+    INFIX_OPS: ClassVar[dict[str, tuple[int, bool]]] = OPERATORS.infix
+
+    def parse_primary(self, pair: Pair) -> str:
+        if pair.name == "expr":
+            return self.parse_expr(pair.stream())
+        return pair.text
+
+    def parse_prefix(self, op: Pair, rhs: str) -> str:
+        return f"({op.text}{rhs})"
+
+    def parse_postfix(self, lhs: str, op: Pair) -> str:
+        return f"({lhs}{op.text})"
+
+    def parse_infix(self, lhs: str, op: Pair, rhs: str) -> str:
+        return f"({lhs} {op.text} {rhs})"
+
+
+def nested(pair: Pair) -> str:
+    """Render a pair folded by operator precedence like `ExprParser`."""
+    children = list(pair.inner())
+    if pair.name != "expr":
+        return pair.text
+    if len(children) == 1:
+        return nested(children[0])
+    if len(children) == 2:  # noqa: PLR2004
+        if children[0].name == "neg":
+            return f"({children[0].text}{nested(children[1])})"
+        return f"({nested(children[0])}{children[1].text})"
+    lhs, op, rhs = children
+    return f"({nested(lhs)} {op.text} {nested(rhs)})"
+
+
+@pytest.fixture(scope="module")
+def flat_parser() -> Parser:
+    return Parser.from_grammar(GRAMMAR)
+
+
+@pytest.fixture(scope="module", params=["interpreted", "closures", "generated"])
+def parse(request: pytest.FixtureRequest) -> object:
+    if request.param == "generated":
+        return Parser.from_grammar(GRAMMAR, operators={"expr": OPERATORS}).compile()
+    return Parser.from_grammar(
+        GRAMMAR,
+        operators={"expr": OPERATORS},
+        closures=request.param == "closures",
+    )
+
+
+def expr(parser: object, text: str, *, arena: bool = False) -> Pair:
+    return parser.parse("program", text, arena=arena).first().inner().first()  # type: ignore[attr-defined]
+
+
+@pytest.mark.parametrize(
+    ("text", "want"),
+    [
+        ("a", "a"),
+        ("a + b", "(a + b)"),
+        ("a + b + c", "((a + b) + c)"),
+        ("a ^ b ^ c", "(a ^ (b ^ c))"),
+        ("a + b * c", "(a + (b * c))"),
+        ("a * b + c", "((a * b) + c)"),
+        ("-a", "(-a)"),
+        ("--a", "(-(-a))"),
+        ("a!", "(a!)"),
+        ("a!!", "((a!)!)"),
+        ("-a!", "(-(a!))"),
+        ("-a ^ b", "((-a) ^ b)"),
+        ("a == b + c", "(a == (b + c))"),
+        ("(a + b) * c", "((a + b) * c)"),
+    ],
+)
+def test_precedence(parse: object, text: str, want: str) -> None:
+    assert nested(expr(parse, text)) == want
+
+
+def test_nested_pairs(parse: object) -> None:
+    pair = expr(parse, "a + b * c")
+    assert [child.name for child in pair.inner()] == ["ident", "add", "expr"]
+    inner = list(pair.inner())[2]
+    assert inner.text == "b * c"
+    assert [child.name for child in inner.inner()] == ["ident", "mul", "ident"]
+    assert inner.tag is None
+
+
+def test_arena(parse: object) -> None:
+    text = "-a + b * c! ^ (d == e)"
+    assert expr(parse, text, arena=True).dumps() == expr(parse, text).dumps()
+
+
+def test_same_as_pratt_parser(parse: object, flat_parser: Parser) -> None:
+    rng = random.Random(3)  # noqa: S311
+    pratt = ExprParser()
+
+    def operand(depth: int) -> str:
+        text = "-" * rng.randrange(3)
+        if depth and rng.random() < 0.2:  # noqa: PLR2004
+            text += f"({expression(depth - 1)})"
+        else:
+            text += rng.choice("abc")
+        return text + "!" * rng.randrange(3)
+
+    def expression(depth: int) -> str:
+        parts = [operand(depth)]
+        for _ in range(rng.randrange(6)):
+            parts.append(rng.choice(["+", "*", "^", "=="]))
+            parts.append(operand(depth))
+        return " ".join(parts)
+
+    for _ in range(300):
+        text = expression(2)
+        want = pratt.parse_expr(expr(flat_parser, text).stream())
+        assert nested(expr(parse, text)) == want
+
+
+def test_incomplete_expression() -> None:
+    # The table disagrees with the grammar, which allows infix operators only.
+    parser = Parser.from_grammar(
+        GRAMMAR, operators={"expr": Operators(prefix={"add": 1})}
+    )
+    assert parser.parse("expr", "a").first().text == "a"
+    with pytest.raises(PestParsingError):
+        parser.parse("expr", "a + b")
+
+
+def test_grammar_is_unchanged() -> None:
+    with_operators = Parser.from_grammar(GRAMMAR, operators={"expr": OPERATORS})
+    assert str(with_operators) == str(Parser.from_grammar(GRAMMAR))
+
+
+def test_unknown_rule() -> None:
+    with pytest.raises(KeyError):
+        Parser.from_grammar(GRAMMAR, operators={"nosuchthing": OPERATORS})
+
+
+def test_silent_rule() -> None:
+    with pytest.raises(ValueError, match="silent"):
+        Parser.from_grammar(GRAMMAR, operators={"infix": OPERATORS})
+
+
+def test_generated_module_imports() -> None:
+    source = Parser.from_grammar(GRAMMAR, operators={"expr": OPERATORS}).generate()
+    assert "from pest.precedence import fold_operators" in source
+    assert "fold_operators" not in Parser.from_grammar(GRAMMAR).generate()
+
+
+def test_save_and_load(tmp_path: Path) -> None:
+    path = tmp_path / "expr.pest.pickle"
+    Parser.from_grammar(GRAMMAR, operators={"expr": OPERATORS}).save(path)
+    parser = Parser.load(path)
+    assert nested(expr(parser, "a + b * c")) == "(a + (b * c))"
+
+
+def test_enum_rule_names() -> None:
+    class Rule(StrEnum):
+        ADD = "add"
+
+    operators = Operators(infix={Rule.ADD: (1, Operators.LEFT_ASSOC)})
+    assert repr(operators.ops) == "{'add': (None, False, 1, 2)}"
@@ -0,0 +1,218 @@
+import pytest
+
+from pest import Parser
+from pest import PestParsingError
+from pest import ProfileStats
+
+GRAMMAR = r"""
+a = { "x" ~ b | "x" ~ c }
+b = { "y" }
+c = { "z" ~ d? }
+d = _{ e }
+e = { "!" }
+"""
+
+COUNTS = ("calls", "successes", "failures", "backtracks", "consumed", "pairs")
+
+
+def counts(stats: ProfileStats | None) -> dict[str, dict[str, int]]:
+    assert stats is not None
+    return {
+        name: {field: profile[field] for field in COUNTS}
+        for name, profile in stats.as_dict().items()
+    }
+
+
+@pytest.fixture(scope="module")
+def json_grammar() -> str:
+    with open("tests/grammars/json.pest", encoding="utf-8") as fd:
+        return fd.read()
+
+
+@pytest.fixture(scope="module")
+def example() -> str:
+    with open("tests/examples/example.json", encoding="utf-8") as fd:
+        return fd.read()
+
+
+WANT = {
+    "a": {
+        "calls": 1,
+        "successes": 1,
+        "failures": 0,
+        "backtracks": 1,
+        "consumed": 3,
+        "pairs": 1,
+    },
+    "b": {
+        "calls": 1,
+        "successes": 0,
+        "failures": 1,
+        "backtracks": 0,
+        "consumed": 0,
+        "pairs": 0,
+    },
+    "c": {
+        "calls": 1,
+        "successes": 1,
+        "failures": 0,
+        "backtracks": 0,
+        "consumed": 2,
+        "pairs": 1,
+    },
+    "d": {
+        "calls": 1,
+        "successes": 1,
+        "failures": 0,
+        "backtracks": 0,
+        "consumed": 1,
+        "pairs": 0,
+    },
+    "e": {
+        "calls": 1,
+        "successes": 1,
+        "failures": 0,
+        "backtracks": 0,
+        "consumed": 1,
+        "pairs": 1,
+    },
+}
+
+
+def test_profile_parse() -> None:
+    parser = Parser.from_grammar(GRAMMAR, optimizer=None)
+    parser.parse("a", "xz!", profile=True)
+    assert counts(parser.profile_stats) == WANT
+
+
+def test_profile_generated_parser() -> None:
+    parser = Parser.from_grammar(GRAMMAR, optimizer=None).compile(profile=True)
+    parser.parse("a", "xz!")
+    assert counts(parser.profile_stats) == WANT
+
+
+def test_profile_bytes_input() -> None:
+    parser = Parser.from_grammar(GRAMMAR, optimizer=None)
+    parser.parse("a", b"xz!", profile=True)
+    assert counts(parser.profile_stats) == WANT
+
+
+def test_not_profiled_by_default() -> None:
+    parser = Parser.from_grammar(GRAMMAR)
+    parser.parse("a", "xz!")
+    assert parser.profile_stats.as_dict() == {}
+    assert parser.compile().profile_stats is None
+
+
+def test_no_profiling_code_unless_enabled() -> None:
+    parser = Parser.from_grammar(GRAMMAR)
+    assert "profil" not in parser.generate()
+    assert "profile_rule('a', _parse_a(), profile_stats)" in parser.generate(
+        profile=True
+    )
+
+
+def test_profile_accumulates_and_resets() -> None:
+    parser = Parser.from_grammar(GRAMMAR, optimizer=None)
+    parser.parse("a", "xz!", profile=True)
+    parser.parse("a", "xz!", profile=True)
+    assert parser.profile_stats.rules["a"].calls == 2  # noqa: PLR2004
+
+    parser.profile_stats.reset()
+    assert parser.profile_stats.as_dict() == {}
+
+    parser.parse("a", "xz!", profile=True)
+    assert counts(parser.profile_stats) == WANT
+
+
+def test_profile_failed_parse() -> None:
+    parser = Parser.from_grammar(GRAMMAR)
+    with pytest.raises(PestParsingError):
+        parser.parse("a", "xx", profile=True)
+    assert parser.profile_stats.rules["a"].failures == 1
+
+
+@pytest.mark.parametrize("closures", [False, True])
+def test_profile_failed_parse_with_lazy_errors(*, closures: bool) -> None:
+    parser = Parser.from_grammar(
+        GRAMMAR, optimizer=None, lazy_errors=True, closures=closures
+    )
+    with pytest.raises(PestParsingError):
+        parser.parse("a", "xx", profile=True)
+    assert parser.profile_stats.rules["a"].calls == 1
+    assert parser.profile_stats.rules["b"].calls == 1
+
+
+def test_profile_generated_failed_parse_with_lazy_errors() -> None:
+    parser = Parser.from_grammar(GRAMMAR, optimizer=None, lazy_errors=True)
+    compiled = parser.compile(profile=True)
+    with pytest.raises(PestParsingError):
+        compiled.parse("a", "xx")
+    assert compiled.profile_stats is not None
+    assert compiled.profile_stats.rules["a"].calls == 1
+    assert compiled.profile_stats.rules["b"].calls == 1
+
+
+def test_exclusive_times_add_up(json_grammar: str, example: str) -> None:
+    parser = Parser.from_grammar(json_grammar)
+    parser.parse("json", example, profile=True)
+    rules = parser.profile_stats.rules
+
+    # `value` is recursive, but its inclusive time is only counted once.
+    assert rules["json"].inclusive_ns >= rules["value"].inclusive_ns
+    assert rules["json"].inclusive_ns == sum(
+        profile.exclusive_ns for profile in rules.values()
+    )
+
+
+def test_generated_and_interpreted_call_counts_match(
+    json_grammar: str, example: str
+) -> None:
+    parser = Parser.from_grammar(json_grammar)
+    parser.parse("json", example, profile=True)
+    compiled = parser.compile(profile=True)
+    compiled.parse("json", example)
+
+    assert compiled.profile_stats is not None
+    for name, profile in parser.profile_stats.as_dict().items():
+        other = compiled.profile_stats.as_dict()[name]
+        assert (profile["calls"], profile["successes"], profile["pairs"]) == (
+            other["calls"],
+            other["successes"],
+            other["pairs"],
+        )
+
+
+def test_memoized_calls_are_not_counted() -> None:
+    grammar = 'a = { x ~ "y" | x ~ "z" }\nx = { "x" }'
+    parser = Parser.from_grammar(grammar, memoize=True)
+    parser.parse("a", "xz", profile=True)
+    assert parser.memo_stats.hits["x"] == 1
+    assert parser.profile_stats.rules["x"].calls == 1
+
+
+def test_report(json_grammar: str, example: str) -> None:
+    parser = Parser.from_grammar(json_grammar)
+    parser.parse("json", example, profile=True)
+
+    lines = parser.profile_stats.report(sort_by="calls").splitlines()
+    assert lines[0].split() == [
+        "rule",
+        "calls",
+        "ok",
+        "fail",
+        "incl",
+        "ms",
+        "excl",
+        "ms",
+        "backtracks",
+        "consumed",
+        "pairs",
+    ]
+
+    calls = [int(line.split()[1]) for line in lines[1:]]
+    assert calls == sorted(calls, reverse=True)
+    assert len(lines) == len(parser.profile_stats.as_dict()) + 1
+
+    with pytest.raises(ValueError, match="can't sort by"):
+        parser.profile_stats.report(sort_by="nosuchthing")
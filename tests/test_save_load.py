@@ -0,0 +1,78 @@
+import pickle
+from pathlib import Path
+
+import pytest
+
+from pest import DEFAULT_OPTIMIZER
+from pest import Optimizer
+from pest import Parser
+from pest import PestParsingError
+
+EXAMPLES = [
+    ("json", "json", "tests/examples/example.json"),
+    ("toml", "toml", "tests/examples/example.toml"),
+    ("http", "http", "tests/examples/example.http"),
+]
+
+
+@pytest.mark.parametrize("optimizer", [None, DEFAULT_OPTIMIZER], ids=["raw", "opt"])
+@pytest.mark.parametrize(("grammar", "start_rule", "example"), EXAMPLES)
+def test_save_and_load(
+    tmp_path: Path,
+    optimizer: Optimizer | None,
+    grammar: str,
+    start_rule: str,
+    example: str,
+) -> None:
+    with open(f"tests/grammars/{grammar}.pest", encoding="utf-8") as fd:
+        parser = Parser.from_grammar(fd.read(), optimizer=optimizer)
+
+    with open(example, encoding="utf-8") as fd:
+        text = fd.read()
+
+    path = tmp_path / "parser.pest.pickle"
+    parser.save(path)
+    loaded = Parser.load(path)
+
+    assert str(loaded) == str(parser)
+    assert (
+        loaded.parse(start_rule, text).dumps() == parser.parse(start_rule, text).dumps()
+    )
+    assert loaded.generate() == parser.generate()
+
+
+def test_load_options(tmp_path: Path) -> None:
+    with open("tests/grammars/json.pest", encoding="utf-8") as fd:
+        parser = Parser.from_grammar(fd.read())
+
+    path = tmp_path / "parser.pest.pickle"
+    parser.save(path)
+    loaded = Parser.load(path, memoize=True, closures=True, lazy_errors=True)
+
+    assert loaded.memo_rules
+    assert loaded.compiled_rules is not None
+    assert loaded.lazy_errors
+    assert (
+        loaded.parse("json", "[1, 2]").dumps() == parser.parse("json", "[1, 2]").dumps()
+    )
+
+    with pytest.raises(PestParsingError):
+        loaded.parse("json", "[1, 2")
+
+
+def test_builtin_rules_are_not_saved(tmp_path: Path) -> None:
+    parser = Parser.from_grammar("a = { ASCII_DIGIT+ }")
+    path = tmp_path / "parser.pest.pickle"
+    parser.save(path)
+
+    _, rules, _ = pickle.loads(path.read_bytes())  # noqa: S301
+    assert list(rules) == ["a"]
+    assert Parser.load(path).rules["ASCII_DIGIT"] is Parser.BUILTIN["ASCII_DIGIT"]
+
+
+def test_load_from_different_version(tmp_path: Path) -> None:
+    path = tmp_path / "parser.pest.pickle"
+    path.write_bytes(pickle.dumps(("0.0.0", {}, None)))
+
+    with pytest.raises(ValueError, match="version 0.0.0"):
+        Parser.load(path)
@@ -0,0 +1,194 @@
+import copy
+import pickle
+
+import pytest
+
+from pest import Pair
+from pest import Pairs
+from pest import Parser
+from pest import RuleFrame
+from pest.grammar.rule import Rule
+
+from .conftest import ParserLike
+
+
+@pytest.fixture(scope="module")
+def grammar() -> str:
+    with open("tests/grammars/toml.pest", encoding="utf-8") as fd:
+        return fd.read()
+
+
+@pytest.fixture(scope="module")
+def data() -> str:
+    with open("tests/examples/example.toml", encoding="utf-8") as fd:
+        return fd.read()
+
+
+def test_round_trip(parser: ParserLike, data: str) -> None:
+    pairs = parser.parse("toml", data)
+    encoded = pairs.to_bytes()
+    assert data.encode() not in encoded
+    assert Pairs.from_bytes(encoded, data).dump() == pairs.dump()
+
+
+def test_round_trip_arena(parser: ParserLike, data: str) -> None:
+    pairs = parser.parse("toml", data, arena=True)
+    loaded = Pairs.from_bytes(pairs.to_bytes(), data)
+    assert loaded.dump() == parser.parse("toml", data).dump()
+
+
+def test_include_input(grammar: str, data: str) -> None:
+    pairs = Parser.from_grammar(grammar).parse("toml", data)
+    loaded = Pairs.from_bytes(pairs.to_bytes(include_input=True))
+    assert loaded.first().input == data
+    assert loaded.dump() == pairs.dump()
+
+
+def test_rules_and_rule_frames() -> None:
+    parser = Parser.from_grammar('list = { item ~ ("," ~ item)* }\nitem = @{ "a" }')
+    pairs = parser.parse("list", "a,a")
+    data = pairs.to_bytes()
+
+    loaded = Pairs.from_bytes(data, "a,a")
+    pair = loaded.first()
+    assert isinstance(pair.rule, RuleFrame)
+    assert pair.rule.name == "list"
+    assert pair.children[0].rule.modifier == parser.rules["item"].modifier
+    assert pair.children[0].rule is pair.children[1].rule
+
+    loaded = Pairs.from_bytes(data, "a,a", rules=parser.rules)
+    assert loaded.first().rule is parser.rules["list"]
+
+
+def test_tags() -> None:
+    parser = Parser.from_grammar(
+        'expr = { #left=x ~ "+" ~ #right=x ~ ("+" ~ #right=x)* }\nx = { "x" }'
+    )
+    pairs = parser.parse("expr", "x+x+x")
+    loaded = Pairs.from_bytes(pairs.to_bytes(), "x+x+x")
+    assert [pair.tag for pair in loaded.first().children] == ["left", "right", "right"]
+    assert loaded.dumps() == pairs.dumps()
+
+
+def test_bytes_input() -> None:
+    parser = Parser.from_grammar(
+        'words = { word ~ (" " ~ word)* }\nword = { ASCII_ALPHA+ }'
+    )
+    pairs = parser.parse("words", b"hello world")
+    loaded = Pairs.from_bytes(pairs.to_bytes(include_input=True))
+    assert loaded.first().input == b"hello world"
+    assert loaded.first().inner_texts == ["hello", "world"]
+
+
+def test_empty_pairs() -> None:
+    assert list(Pairs.from_bytes(Pairs([]).to_bytes(include_input=True))) == []
+
+
+def test_missing_input() -> None:
+    pairs = Parser.from_grammar('a = { "a" }').parse("a", "a")
+
+    with pytest.raises(ValueError, match="input_ is required"):
+        Pairs.from_bytes(pairs.to_bytes())
+
+
+def test_not_an_encoded_tree() -> None:
+    with pytest.raises(ValueError, match="not an encoded parse tree"):
+        Pairs.from_bytes(b"hello", "hello")
+
+
+def test_different_inputs() -> None:
+    parser = Parser.from_grammar('a = { "a" }')
+    pairs = Pairs([parser.parse("a", "a").first(), parser.parse("a", "ab").first()])
+
+    with pytest.raises(ValueError, match="different inputs"):
+        pairs.to_bytes()
+
+
+def test_pickle(parser: ParserLike, data: str) -> None:
+    pairs = parser.parse("toml", data)
+    loaded = pickle.loads(pickle.dumps(pairs))  # noqa: S301
+    assert isinstance(loaded, Pairs)
+    assert loaded.dump() == pairs.dump()
+
+    pair = pairs.first().children[0]
+    loaded_pair = pickle.loads(pickle.dumps(pair))  # noqa: S301
+    assert isinstance(loaded_pair, Pair)
+    assert loaded_pair.dump() == pair.dump()
+
+
+def test_pickled_pairs_share_input(grammar: str, data: str) -> None:
+    parser = Parser.from_grammar(grammar)
+    pairs = list(parser.parse("toml", data).flatten())
+    assert len(pairs) > 100  # noqa: PLR2004
+
+    pickled = pickle.dumps(pairs)
+    assert pickled.count(data.encode()) == 1
+
+    loaded = pickle.loads(pickled)  # noqa: S301
+    assert [pair.dump() for pair in loaded] == [pair.dump() for pair in pairs]
+    assert all(pair.input is loaded[0].input for pair in loaded)
+
+
+def test_pickled_pairs_keep_rules(grammar: str, data: str) -> None:
+    parser = Parser.from_grammar(grammar)
+    pairs = parser.parse("toml", data)
+
+    loaded = pickle.loads(pickle.dumps(pairs))  # noqa: S301
+    assert isinstance(loaded.first().rule, Rule)
+    assert loaded.first().rule.name == "toml"
+
+    pair = pairs.first().children[0]
+    loaded_pair = pickle.loads(pickle.dumps(pair))  # noqa: S301
+    assert type(loaded_pair.rule) is type(pair.rule)
+    assert loaded_pair.name == pair.name
+
+
+def test_copy(grammar: str, data: str) -> None:
+    parser = Parser.from_grammar(grammar)
+    pairs = parser.parse("toml", data)
+    pair = pairs.first()
+
+    shallow = copy.copy(pair)
+    assert shallow is not pair
+    assert shallow.children is pair.children
+    assert shallow.rule is pair.rule
+    assert shallow.line_index is pair.line_index
+
+    deep = copy.deepcopy(pair)
+    assert deep.dump() == pair.dump()
+    assert deep.children[0] is not pair.children[0]
+    assert deep.input is pair.input
+
+    assert copy.copy(pairs)._pairs is pairs._pairs  # noqa: SLF001
+    copied = copy.deepcopy(pairs)
+    assert copied.dump() == pairs.dump()
+    assert copied[0] is not pairs[0]
+
+    arena_pair = parser.parse("toml", data, arena=True).first()
+    assert copy.copy(arena_pair).arena is arena_pair.arena
+    assert copy.deepcopy(arena_pair).dump() == arena_pair.dump()
+
+
+def test_copy_does_not_pickle(
+    grammar: str, data: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    pairs = Parser.from_grammar(grammar).parse("toml", data)
+
+    def reduce(_: object) -> tuple[object, ...]:
+        raise AssertionError("copied through __reduce__")
+
+    monkeypatch.setattr(Pair, "__reduce__", reduce)
+    monkeypatch.setattr(Pairs, "__reduce__", reduce)
+    copy.copy(pairs.first())
+    copy.deepcopy(pairs)
+
+
+def test_pickle_bytes_like_input() -> None:
+    parser = Parser.from_grammar('a = { "x" ~ b* } b = { "y" }')
+    pairs = parser.parse("a", memoryview(b"xyyy"))  # type: ignore[arg-type]
+    pickled = pickle.dumps(list(pairs.flatten()))
+    assert pickled.count(b"xyyy") == 1
+
+    loaded = pickle.loads(pickled)  # noqa: S301
+    assert [pair.text for pair in loaded] == ["xyyy", "y", "y", "y"]
+    assert all(pair.input is loaded[0].input for pair in loaded)
@@ -0,0 +1,36 @@
+from pest import Parser
+from pest.state import StacklessParserState
+from pest.state import UserStackParserState
+
+STACKLESS_GRAMMAR = r"""
+list = { SOI ~ item ~ ("," ~ item)* ~ EOI }
+item = @{ ASCII_ALPHA+ }
+"""
+
+STACK_GRAMMAR = r"""
+quoted = { SOI ~ PUSH(quote) ~ inner ~ POP ~ EOI }
+inner = { (!PEEK ~ ANY)* }
+quote = _{ "'" | "\"" }
+"""
+
+
+def test_stackless_grammar() -> None:
+    parser = Parser.from_grammar(STACKLESS_GRAMMAR)
+    assert parser.state_class is StacklessParserState
+    assert "StacklessParserState(text, start_pos)" in parser.generate()
+
+
+def test_stack_grammar() -> None:
+    parser = Parser.from_grammar(STACK_GRAMMAR)
+    assert parser.state_class is UserStackParserState
+    assert "UserStackParserState(text, start_pos)" in parser.generate()
+
+
+def test_stack_is_restored_on_backtrack() -> None:
+    parser = Parser.from_grammar(STACK_GRAMMAR)
+    pairs = parser.parse("quoted", "'a\"b'")
+    assert pairs.first().inner_texts == ['a"b', ""]
+    assert (
+        parser.compile().parse("quoted", '"a\'b"').dumps()
+        == parser.parse("quoted", '"a\'b"').dumps()
+    )
@@ -0,0 +1,110 @@
+import pytest
+
+from pest import InputGenerator
+from pest import Parser
+from pest.synth import fit_exponent
+
+GRAMMARS = [
+    ("tests/grammars/json.pest", "json"),
+    ("tests/grammars/toml.pest", "toml"),
+    ("tests/grammars/http.pest", "http"),
+    ("examples/csv/csv.pest", "file"),
+    ("examples/ini/ini.pest", "file"),
+    ("examples/calculator/calculator.pest", "program"),
+]
+
+
+def read(path: str) -> str:
+    with open(path, encoding="utf-8") as fd:
+        return fd.read()
+
+
+@pytest.mark.parametrize(("path", "start_rule"), GRAMMARS)
+@pytest.mark.parametrize("size", [100, 5000])
+def test_generated_input_parses(path: str, start_rule: str, size: int) -> None:
+    grammar = read(path)
+    generator = InputGenerator(Parser.from_grammar(grammar, optimizer=None), seed=1)
+    text = generator.generate(start_rule, size)
+
+    assert size / 2 <= len(text) <= size * 2
+    # Generated input is valid for optimized parsers too.
+    Parser.from_grammar(grammar).parse(start_rule, text)
+
+
+def test_seeded_input_is_reproducible() -> None:
+    parser = Parser.from_grammar(read("tests/grammars/json.pest"), optimizer=None)
+    first = InputGenerator(parser, seed=7).generate("json", 1000)
+    second = InputGenerator(parser, seed=7).generate("json", 1000)
+    assert first == second
+    assert InputGenerator(parser, seed=8).generate("json", 1000) != first
+
+
+def test_predicates_are_honoured() -> None:
+    grammar = r"""
+    file = { SOI ~ (string ~ ",")* ~ EOI }
+    string = @{ "\"" ~ (!"\"" ~ ANY)* ~ "\"" }
+    """
+    parser = Parser.from_grammar(grammar, optimizer=None)
+    text = InputGenerator(parser, seed=1).generate("file", 2000)
+    assert len(text) >= 1000  # noqa: PLR2004
+    parser.parse("file", text)
+
+
+def test_stack_operations() -> None:
+    grammar = r"""
+    file = { SOI ~ (raw ~ NEWLINE)* ~ EOI }
+    raw = ${ PUSH("#"*) ~ "\"" ~ inner ~ "\"" ~ POP }
+    inner = @{ ASCII_ALPHA* }
+    """
+    parser = Parser.from_grammar(grammar, optimizer=None)
+    text = InputGenerator(parser, seed=1).generate("file", 500)
+    parser.parse("file", text)
+
+
+def test_unicode_properties() -> None:
+    grammar = "word = @{ LETTER ~ (LETTER | NUMBER)* }"
+    parser = Parser.from_grammar(grammar, optimizer=None)
+    generator = InputGenerator(parser, seed=1)
+    for _ in range(20):
+        parser.parse("word", generator.generate("word", 10))
+
+
+def test_recursive_rules_terminate() -> None:
+    grammar = """
+    expr = { term ~ ("+" ~ term)* }
+    term = { "(" ~ expr ~ ")" | "x" }
+    """
+    parser = Parser.from_grammar(grammar, optimizer=None)
+    text = InputGenerator(parser, seed=3, max_depth=4).generate("expr", 300)
+    parser.parse("expr", text)
+
+
+def test_unknown_rule() -> None:
+    parser = Parser.from_grammar('a = { "a" }', optimizer=None)
+    with pytest.raises(KeyError):
+        InputGenerator(parser).generate("nosuchthing")
+
+
+def test_rule_that_cant_match() -> None:
+    parser = Parser.from_grammar('a = { "a" ~ a }', optimizer=None)
+    with pytest.raises(ValueError, match="can't match any input"):
+        InputGenerator(parser).generate("a")
+
+
+def test_no_valid_input() -> None:
+    parser = Parser.from_grammar('a = { "a" ~ !"b" ~ "b" }', optimizer=None)
+    with pytest.raises(ValueError, match="failed to generate valid input"):
+        InputGenerator(parser).generate("a", attempts=3)
+
+
+def test_optimized_rules() -> None:
+    parser = Parser.from_grammar(read("tests/grammars/json.pest"))
+    with pytest.raises(TypeError, match="can't generate input"):
+        InputGenerator(parser).generate("json")
+
+
+def test_fit_exponent() -> None:
+    sizes = [10, 100, 1000]
+    assert fit_exponent(sizes, [3 * size for size in sizes]) == pytest.approx(1)
+    assert fit_exponent(sizes, [size**2 for size in sizes]) == pytest.approx(2)
+    assert fit_exponent([100, 100], [1.0, 2.0]) == 0
@@ -0,0 +1,107 @@
+import pytest
+
+from pest import Parser
+from pest import PestParsingError
+from pest import TraceLog
+from pest import Tracer
+
+GRAMMAR = r"""
+a = { "x" ~ b | "x" ~ c }
+b = { "y" }
+c = { "z" }
+"""
+
+WANT = [
+    ("enter", "a", 0),
+    ("enter", "b", 1),
+    ("fail", '"y"', 1),
+    ("exit", "b", False, 1, 1),
+    ("restore", 1, 0),
+    ("enter", "c", 1),
+    ("exit", "c", True, 1, 2),
+    ("exit", "a", True, 0, 2),
+]
+
+
+@pytest.fixture(scope="module", params=["interpreted", "closures", "generated"])
+def parser(request: pytest.FixtureRequest) -> object:
+    if request.param == "generated":
+        return Parser.from_grammar(GRAMMAR, optimizer=None).compile(trace=True)
+    return Parser.from_grammar(
+        GRAMMAR, optimizer=None, closures=request.param == "closures"
+    )
+
+
+def test_trace_events(parser: object) -> None:
+    tracer = TraceLog()
+    parser.parse("a", "xz", tracer=tracer)  # type: ignore[attr-defined]
+    assert tracer.events == WANT
+
+
+def test_trace_failed_parse(parser: object) -> None:
+    tracer = TraceLog()
+    with pytest.raises(PestParsingError):
+        parser.parse("c", "x", tracer=tracer)  # type: ignore[attr-defined]
+    assert tracer.events == [
+        ("enter", "c", 0),
+        ("fail", '"z"', 0),
+        ("exit", "c", False, 0, 0),
+    ]
+
+
+def test_untraced_parse(parser: object) -> None:
+    assert parser.parse("a", "xz").first().text == "xz"  # type: ignore[attr-defined]
+
+
+def test_trace_bytes_input() -> None:
+    parser = Parser.from_grammar(GRAMMAR, optimizer=None)
+    tracer = TraceLog()
+    parser.parse("a", b"xz", tracer=tracer)
+    assert tracer.events == WANT
+
+
+def test_trace_with_profile() -> None:
+    parser = Parser.from_grammar(GRAMMAR, optimizer=None)
+    tracer = TraceLog()
+    parser.parse("a", "xz", tracer=tracer, profile=True)
+    assert tracer.events == WANT
+    assert parser.profile_stats.rules["a"].backtracks == 1
+
+
+def test_lazy_errors_are_traced_once() -> None:
+    parser = Parser.from_grammar(GRAMMAR, lazy_errors=True)
+    tracer = TraceLog()
+    with pytest.raises(PestParsingError):
+        parser.parse("c", "x", tracer=tracer)
+    assert [event[0] for event in tracer.events] == ["enter", "fail", "exit"]
+
+
+def test_custom_tracer() -> None:
+    class Depth(Tracer):
+        def __init__(self) -> None:
+            self.depth = 0
+            self.max_depth = 0
+
+        def enter(self, rule_name: str, pos: int) -> None:  # noqa: ARG002
+            self.depth += 1
+            self.max_depth = max(self.max_depth, self.depth)
+
+        def exit(self, rule_name: str, matched: bool, start: int, end: int) -> None:  # noqa: ARG002, FBT001
+            self.depth -= 1
+
+    tracer = Depth()
+    Parser.from_grammar(GRAMMAR).parse("a", "xz", tracer=tracer)
+    assert tracer.depth == 0
+    assert tracer.max_depth == 2  # noqa: PLR2004
+
+
+def test_no_tracing_code_unless_enabled() -> None:
+    parser = Parser.from_grammar(GRAMMAR)
+    assert "trac" not in parser.generate()
+    assert "parse_a = trace_rule('a', _parse_a())" in parser.generate(trace=True)
+
+
+def test_compiled_parser_without_tracing() -> None:
+    parser = Parser.from_grammar(GRAMMAR).compile()
+    with pytest.raises(TypeError):
+        parser.parse("a", "xz", tracer=TraceLog())